@@ -0,0 +1,1252 @@
+/* Generated from ubus IDL - admission_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <pthread.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/eventfd.h>
+#include <time.h>
+#include <unistd.h>
+#include "admission_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+static uint64_t admission_test_now_us(clockid_t clock)
+{
+    struct timespec ts;
+
+    clock_gettime(clock, &ts);
+    return (uint64_t)ts.tv_sec * 1000000 + ts.tv_nsec / 1000;
+}
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+/* Copy a blob to the cursor of a *_dup() allocation, blobs go first after the struct to stay aligned */
+static struct blob_attr *ubus_idl_dup_blob(char **p, const struct blob_attr *attr)
+{
+    struct blob_attr *copy = (struct blob_attr *)*p;
+
+    memcpy(copy, attr, blob_pad_len(attr));
+    *p += blob_pad_len(attr);
+    return copy;
+}
+
+static const struct blobmsg_policy admission_test_get_route_policy[] = {
+    [ADMISSION_TEST_GET_ROUTE_DST] = { .name = "dst", .type = BLOBMSG_TYPE_STRING }
+};
+
+int admission_test_get_route_deserialize(struct blob_attr *msg, struct admission_test_get_route_params *params)
+{
+    struct blob_attr *tb_admission_test_get_route[__ADMISSION_TEST_GET_ROUTE_MAX];
+    if (blobmsg_parse(admission_test_get_route_policy, ARRAY_SIZE(admission_test_get_route_policy), tb_admission_test_get_route, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_admission_test_get_route[ADMISSION_TEST_GET_ROUTE_DST]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->dst = blobmsg_get_string(tb_admission_test_get_route[ADMISSION_TEST_GET_ROUTE_DST]);
+    return UBUS_STATUS_OK;
+}
+
+int admission_test_get_route_serialize(struct blob_buf *b, const struct admission_test_get_route_params *params)
+{
+    UBUS_IDL_ADD(string, b, "dst", params->dst);
+    return UBUS_STATUS_OK;
+}
+
+struct admission_test_get_route_params *admission_test_get_route_dup(const struct admission_test_get_route_params *params)
+{
+    size_t len = sizeof(*params);
+    struct admission_test_get_route_params *copy;
+    char *p;
+
+    if (params->dst) {
+        len += strlen(params->dst) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->dst = params->dst ? ubus_idl_dup_string(&p, params->dst) : NULL;
+    return copy;
+}
+
+void admission_test_get_route_free(struct admission_test_get_route_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy admission_test_set_routes_policy[] = {
+    [ADMISSION_TEST_SET_ROUTES_ROUTES] = { .name = "routes", .type = BLOBMSG_TYPE_ARRAY }
+};
+
+int admission_test_set_routes_deserialize(struct blob_attr *msg, struct admission_test_set_routes_params *params)
+{
+    struct blob_attr *tb_admission_test_set_routes[__ADMISSION_TEST_SET_ROUTES_MAX];
+    if (blobmsg_parse(admission_test_set_routes_policy, ARRAY_SIZE(admission_test_set_routes_policy), tb_admission_test_set_routes, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_admission_test_set_routes[ADMISSION_TEST_SET_ROUTES_ROUTES]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->routes = tb_admission_test_set_routes[ADMISSION_TEST_SET_ROUTES_ROUTES];
+    return UBUS_STATUS_OK;
+}
+
+int admission_test_set_routes_serialize(struct blob_buf *b, const struct admission_test_set_routes_params *params)
+{
+    int ret;
+    if (params->routes) {
+        ret = blobmsg_add_field(b, BLOBMSG_TYPE_ARRAY, "routes", blob_data(params->routes), blob_len(params->routes));
+    } else {
+        ret = -1;  // Required field missing
+    }
+    if (ret < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    return UBUS_STATUS_OK;
+}
+
+struct admission_test_set_routes_params *admission_test_set_routes_dup(const struct admission_test_set_routes_params *params)
+{
+    size_t len = sizeof(*params);
+    struct admission_test_set_routes_params *copy;
+    char *p;
+
+    if (params->routes) {
+        len += blob_pad_len(params->routes);
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->routes = params->routes ? ubus_idl_dup_blob(&p, params->routes) : NULL;
+    return copy;
+}
+
+void admission_test_set_routes_free(struct admission_test_set_routes_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy admission_test_dump_policy[] = {
+    [ADMISSION_TEST_DUMP_TABLE] = { .name = "table", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int admission_test_dump_deserialize(struct blob_attr *msg, struct admission_test_dump_params *params)
+{
+    struct blob_attr *tb_admission_test_dump[__ADMISSION_TEST_DUMP_MAX];
+    if (blobmsg_parse(admission_test_dump_policy, ARRAY_SIZE(admission_test_dump_policy), tb_admission_test_dump, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    UBUS_IDL_GET_OPTIONAL(u32, tb_admission_test_dump, ADMISSION_TEST_DUMP_TABLE, params->table, params, FIELD, ADMISSION_TEST_DUMP_HAS_TABLE);
+    return UBUS_STATUS_OK;
+}
+
+int admission_test_dump_serialize(struct blob_buf *b, const struct admission_test_dump_params *params)
+{
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "table", params->table, params, FIELD, ADMISSION_TEST_DUMP_HAS_TABLE);
+    return UBUS_STATUS_OK;
+}
+
+struct admission_test_dump_params *admission_test_dump_dup(const struct admission_test_dump_params *params)
+{
+    size_t len = sizeof(*params);
+    struct admission_test_dump_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void admission_test_dump_free(struct admission_test_dump_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy admission_test_lookup_policy[] = {
+    [ADMISSION_TEST_LOOKUP_DST] = { .name = "dst", .type = BLOBMSG_TYPE_STRING }
+};
+
+int admission_test_lookup_deserialize(struct blob_attr *msg, struct admission_test_lookup_params *params)
+{
+    struct blob_attr *tb_admission_test_lookup[__ADMISSION_TEST_LOOKUP_MAX];
+    if (blobmsg_parse(admission_test_lookup_policy, ARRAY_SIZE(admission_test_lookup_policy), tb_admission_test_lookup, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_admission_test_lookup[ADMISSION_TEST_LOOKUP_DST]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->dst = blobmsg_get_string(tb_admission_test_lookup[ADMISSION_TEST_LOOKUP_DST]);
+    return UBUS_STATUS_OK;
+}
+
+int admission_test_lookup_serialize(struct blob_buf *b, const struct admission_test_lookup_params *params)
+{
+    UBUS_IDL_ADD(string, b, "dst", params->dst);
+    return UBUS_STATUS_OK;
+}
+
+struct admission_test_lookup_params *admission_test_lookup_dup(const struct admission_test_lookup_params *params)
+{
+    size_t len = sizeof(*params);
+    struct admission_test_lookup_params *copy;
+    char *p;
+
+    if (params->dst) {
+        len += strlen(params->dst) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->dst = params->dst ? ubus_idl_dup_string(&p, params->dst) : NULL;
+    return copy;
+}
+
+void admission_test_lookup_free(struct admission_test_lookup_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy admission_test_route_table_policy[] = {
+    [ADMISSION_TEST_ROUTE_TABLE_COUNT] = { .name = "count", .type = BLOBMSG_TYPE_INT32 },
+    [ADMISSION_TEST_ROUTE_TABLE_ROUTES] = { .name = "routes", .type = BLOBMSG_TYPE_ARRAY }
+};
+
+int admission_test_route_table_deserialize(struct blob_attr *msg, struct admission_test_route_table *params)
+{
+    struct blob_attr *tb_admission_test_route_table[__ADMISSION_TEST_ROUTE_TABLE_MAX];
+    if (blobmsg_parse(admission_test_route_table_policy, ARRAY_SIZE(admission_test_route_table_policy), tb_admission_test_route_table, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_admission_test_route_table[ADMISSION_TEST_ROUTE_TABLE_COUNT]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->count = blobmsg_get_u32(tb_admission_test_route_table[ADMISSION_TEST_ROUTE_TABLE_COUNT]);
+
+    if (tb_admission_test_route_table[ADMISSION_TEST_ROUTE_TABLE_ROUTES]) {
+        params->routes = tb_admission_test_route_table[ADMISSION_TEST_ROUTE_TABLE_ROUTES];
+        UBUS_IDL_SET_FIELD(params, ADMISSION_TEST_ROUTE_TABLE_HAS_ROUTES);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int admission_test_route_table_serialize(struct blob_buf *b, const struct admission_test_route_table *params)
+{
+    int ret;
+    UBUS_IDL_ADD(u32, b, "count", params->count);
+    if (UBUS_IDL_HAS_FIELD(params, ADMISSION_TEST_ROUTE_TABLE_HAS_ROUTES)) {
+        blobmsg_add_field(b, BLOBMSG_TYPE_ARRAY, "routes", blob_data(params->routes), blob_len(params->routes));
+    }
+    return UBUS_STATUS_OK;
+}
+
+struct admission_test_route_table *admission_test_route_table_dup(const struct admission_test_route_table *params)
+{
+    size_t len = sizeof(*params);
+    struct admission_test_route_table *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, ADMISSION_TEST_ROUTE_TABLE_HAS_ROUTES) && params->routes) {
+        len += blob_pad_len(params->routes);
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->routes = UBUS_IDL_HAS_FIELD(params, ADMISSION_TEST_ROUTE_TABLE_HAS_ROUTES) && params->routes ? ubus_idl_dup_blob(&p, params->routes) : NULL;
+    return copy;
+}
+
+void admission_test_route_table_free(struct admission_test_route_table *params)
+{
+    free(params);
+}
+
+/* Request waiting for the reply of an identical request in progress */
+struct admission_test_cache_waiter {
+    struct list_head list;
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+};
+
+/* Stored reply, keyed by a copy of the raw request blob */
+struct admission_test_cache_entry {
+    struct list_head list;
+    struct list_head waiters;
+    struct admission_test_cache *cache;
+    struct blob_attr *key;
+    struct blob_attr *reply;
+    uint64_t expires_us;
+    uint32_t hash;
+    bool pending;
+    bool stale;
+};
+
+/* Reply cache of one method, entries are kept most recently used first */
+struct admission_test_cache {
+    struct list_head entries;
+    unsigned int count;
+    unsigned int size;
+    uint64_t ttl_us;
+};
+
+#ifndef ADMISSION_TEST_LOOKUP_CACHE_TTL_MS
+#define ADMISSION_TEST_LOOKUP_CACHE_TTL_MS 1000
+#endif
+
+#ifndef ADMISSION_TEST_LOOKUP_CACHE_SIZE
+#define ADMISSION_TEST_LOOKUP_CACHE_SIZE 16
+#endif
+
+static struct admission_test_cache admission_test_lookup_cache = {
+    .entries = LIST_HEAD_INIT(admission_test_lookup_cache.entries),
+    .size = ADMISSION_TEST_LOOKUP_CACHE_SIZE,
+    .ttl_us = (uint64_t)ADMISSION_TEST_LOOKUP_CACHE_TTL_MS * 1000,
+};
+
+/* Set while a cached method runs, its reply helper then keeps a copy of the reply */
+static struct blob_attr **admission_test_cache_capture;
+
+/* Entry of the deferred request being dispatched, taken over by its context */
+static struct admission_test_cache_entry *admission_test_cache_pending;
+
+static uint32_t admission_test_cache_hash(const struct blob_attr *msg)
+{
+    const uint8_t *p = (const uint8_t *)msg;
+    size_t len = blob_raw_len(msg);
+    uint32_t hash = 2166136261u;
+
+    while (len--) {
+        hash = (hash ^ *p++) * 16777619u;
+    }
+
+    return hash;
+}
+
+static void admission_test_cache_drop(struct admission_test_cache_entry *entry)
+{
+    list_del(&entry->list);
+    entry->cache->count--;
+    free(entry->key);
+    free(entry->reply);
+    free(entry);
+}
+
+/* Find the entry of a request, an expired reply is dropped */
+static struct admission_test_cache_entry *admission_test_cache_find(struct admission_test_cache *cache, struct blob_attr *msg, uint32_t hash)
+{
+    struct admission_test_cache_entry *entry;
+
+    list_for_each_entry(entry, &cache->entries, list) {
+        if (entry->hash != hash || entry->stale || blob_raw_len(entry->key) != blob_raw_len(msg) ||
+            memcmp(entry->key, msg, blob_raw_len(msg)) != 0) {
+            continue;
+        }
+
+        if (!entry->pending && entry->expires_us <= admission_test_now_us(CLOCK_MONOTONIC)) {
+            admission_test_cache_drop(entry);
+            return NULL;
+        }
+
+        list_move(&entry->list, &cache->entries);
+        return entry;
+    }
+
+    return NULL;
+}
+
+/* Add a pending entry, evicting the least recently used reply when full */
+static struct admission_test_cache_entry *admission_test_cache_insert(struct admission_test_cache *cache, struct blob_attr *msg, uint32_t hash)
+{
+    struct admission_test_cache_entry *entry;
+
+    if (cache->count >= cache->size) {
+        list_for_each_entry_reverse(entry, &cache->entries, list) {
+            if (!entry->pending) {
+                break;
+            }
+        }
+
+        // Every entry still waits for its reply, leave this request uncached
+        if (&entry->list == &cache->entries) {
+            return NULL;
+        }
+
+        admission_test_cache_drop(entry);
+    }
+
+    entry = calloc(1, sizeof(*entry));
+    if (!entry) {
+        return NULL;
+    }
+
+    entry->key = blob_memdup(msg);
+    if (!entry->key) {
+        free(entry);
+        return NULL;
+    }
+
+    INIT_LIST_HEAD(&entry->waiters);
+    entry->cache = cache;
+    entry->hash = hash;
+    entry->pending = true;
+    list_add(&entry->list, &cache->entries);
+    cache->count++;
+
+    return entry;
+}
+
+/* Answer the coalesced requests, then keep the reply until its TTL expires */
+static void admission_test_cache_resolve(struct admission_test_cache_entry *entry, int status, struct blob_attr *reply)
+{
+    struct admission_test_cache_waiter *waiter, *tmp;
+
+    list_for_each_entry_safe(waiter, tmp, &entry->waiters, list) {
+        if (status == UBUS_STATUS_OK && reply) {
+            ubus_send_reply(waiter->ctx, &waiter->req, reply);
+        }
+        ubus_complete_deferred_request(waiter->ctx, &waiter->req, status);
+        list_del(&waiter->list);
+        free(waiter);
+    }
+
+    // Failures are not cached, neither are replies invalidated while computed
+    if (status != UBUS_STATUS_OK || !reply || entry->stale) {
+        free(reply);
+        admission_test_cache_drop(entry);
+        return;
+    }
+
+    entry->reply = reply;
+    entry->pending = false;
+    entry->expires_us = admission_test_now_us(CLOCK_MONOTONIC) + entry->cache->ttl_us;
+}
+
+/* Drop the stored replies, replies being computed are still sent but not kept */
+static void admission_test_cache_flush(struct admission_test_cache *cache)
+{
+    struct admission_test_cache_entry *entry, *tmp;
+
+    list_for_each_entry_safe(entry, tmp, &cache->entries, list) {
+        if (entry->pending) {
+            entry->stale = true;
+        } else {
+            admission_test_cache_drop(entry);
+        }
+    }
+}
+
+void admission_test_lookup_cache_invalidate(void)
+{
+    admission_test_cache_flush(&admission_test_lookup_cache);
+}
+
+void admission_test_cache_invalidate(void)
+{
+    admission_test_cache_flush(&admission_test_lookup_cache);
+}
+
+/* Deferred request waiting for a free slot of its method */
+struct admission_test_admission_entry {
+    struct list_head list;
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct blob_attr *msg;
+    struct admission_test_cache_entry *cache;
+};
+
+/* Concurrency limit of one deferred method, excess requests wait in a bounded FIFO */
+struct admission_test_admission {
+    struct list_head queue;
+    unsigned int inflight;
+    unsigned int queued;
+    unsigned int max_inflight;
+    unsigned int queue_depth;
+    const char *method;
+    ubus_handler_t dispatch;
+};
+
+#ifndef ADMISSION_TEST_DUMP_MAX_INFLIGHT
+#define ADMISSION_TEST_DUMP_MAX_INFLIGHT 2
+#endif
+
+#ifndef ADMISSION_TEST_DUMP_INFLIGHT_QUEUE
+#define ADMISSION_TEST_DUMP_INFLIGHT_QUEUE 8
+#endif
+
+static int admission_test_dump_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+static struct admission_test_admission admission_test_dump_admission = {
+    .queue = LIST_HEAD_INIT(admission_test_dump_admission.queue),
+    .max_inflight = ADMISSION_TEST_DUMP_MAX_INFLIGHT,
+    .queue_depth = ADMISSION_TEST_DUMP_INFLIGHT_QUEUE,
+    .method = "dump",
+    .dispatch = admission_test_dump_async_dispatch,
+};
+
+#ifndef ADMISSION_TEST_LOOKUP_MAX_INFLIGHT
+#define ADMISSION_TEST_LOOKUP_MAX_INFLIGHT 1
+#endif
+
+#ifndef ADMISSION_TEST_LOOKUP_INFLIGHT_QUEUE
+#define ADMISSION_TEST_LOOKUP_INFLIGHT_QUEUE 4
+#endif
+
+static int admission_test_lookup_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+static struct admission_test_admission admission_test_lookup_admission = {
+    .queue = LIST_HEAD_INIT(admission_test_lookup_admission.queue),
+    .max_inflight = ADMISSION_TEST_LOOKUP_MAX_INFLIGHT,
+    .queue_depth = ADMISSION_TEST_LOOKUP_INFLIGHT_QUEUE,
+    .method = "lookup",
+    .dispatch = admission_test_lookup_async_dispatch,
+};
+
+#ifndef ADMISSION_TEST_FLUSH_MAX_INFLIGHT
+#define ADMISSION_TEST_FLUSH_MAX_INFLIGHT 1
+#endif
+
+#ifndef ADMISSION_TEST_FLUSH_INFLIGHT_QUEUE
+#define ADMISSION_TEST_FLUSH_INFLIGHT_QUEUE 0
+#endif
+
+static int admission_test_flush_blocking_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+static struct admission_test_admission admission_test_flush_admission = {
+    .queue = LIST_HEAD_INIT(admission_test_flush_admission.queue),
+    .max_inflight = ADMISSION_TEST_FLUSH_MAX_INFLIGHT,
+    .queue_depth = ADMISSION_TEST_FLUSH_INFLIGHT_QUEUE,
+    .method = "flush",
+    .dispatch = admission_test_flush_blocking_dispatch,
+};
+
+/* Park a request over the limit until a slot is released, or refuse it when the FIFO is full */
+static int admission_test_admission_enqueue(struct admission_test_admission *gate, struct ubus_context *ctx, struct ubus_request_data *req, struct blob_attr *msg)
+{
+    struct admission_test_admission_entry *entry;
+
+    if (gate->queued >= gate->queue_depth) {
+        return UBUS_STATUS_NO_MEMORY;
+    }
+
+    entry = calloc(1, sizeof(*entry));
+    if (!entry) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    entry->msg = blob_memdup(msg);
+    if (!entry->msg) {
+        free(entry);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    entry->ctx = ctx;
+    entry->cache = admission_test_cache_pending;
+    ubus_defer_request(ctx, req, &entry->req);
+    list_add_tail(&entry->list, &gate->queue);
+    gate->queued++;
+
+    return UBUS_STATUS_OK;
+}
+
+/* Called when a deferred request of the method completes, starts the oldest waiting ones */
+static void admission_test_admission_release(struct admission_test_admission *gate)
+{
+    struct admission_test_admission_entry *entry;
+    int ret;
+
+    gate->inflight--;
+    while (gate->inflight < gate->max_inflight && !list_empty(&gate->queue)) {
+        entry = list_first_entry(&gate->queue, struct admission_test_admission_entry, list);
+        list_del(&entry->list);
+        gate->queued--;
+
+        admission_test_cache_pending = entry->cache;
+        ret = gate->dispatch(entry->ctx, &admission_test_object, &entry->req, gate->method, entry->msg);
+        admission_test_cache_pending = NULL;
+        // The dispatcher did not take the request, answer it here
+        if (ret != UBUS_STATUS_OK) {
+            ubus_complete_deferred_request(entry->ctx, &entry->req, ret);
+            if (entry->cache) {
+                admission_test_cache_resolve(entry->cache, ret, NULL);
+            }
+        }
+
+        free(entry->msg);
+        free(entry);
+    }
+}
+
+/* Fail the requests still waiting, on cleanup */
+static void admission_test_admission_flush(struct admission_test_admission *gate)
+{
+    struct admission_test_admission_entry *entry, *tmp;
+
+    list_for_each_entry_safe(entry, tmp, &gate->queue, list) {
+        list_del(&entry->list);
+        ubus_complete_deferred_request(entry->ctx, &entry->req, UBUS_STATUS_UNKNOWN_ERROR);
+        if (entry->cache) {
+            admission_test_cache_resolve(entry->cache, UBUS_STATUS_UNKNOWN_ERROR, NULL);
+        }
+        free(entry->msg);
+        free(entry);
+    }
+    gate->queued = 0;
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf admission_test_reply_buf;
+
+int admission_test_get_route_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct admission_test_route_table *reply)
+{
+    int ret;
+
+    blob_buf_init(&admission_test_reply_buf, 0);
+    ret = admission_test_route_table_serialize(&admission_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, admission_test_reply_buf.head);
+}
+
+int admission_test_dump_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct admission_test_route_table *reply)
+{
+    int ret;
+
+    blob_buf_init(&admission_test_reply_buf, 0);
+    ret = admission_test_route_table_serialize(&admission_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, admission_test_reply_buf.head);
+}
+
+int admission_test_lookup_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct admission_test_route_table *reply)
+{
+    int ret;
+
+    blob_buf_init(&admission_test_reply_buf, 0);
+    ret = admission_test_route_table_serialize(&admission_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    if (admission_test_cache_capture) {
+        *admission_test_cache_capture = blob_memdup(admission_test_reply_buf.head);
+    }
+
+    return ubus_send_reply(ctx, req, admission_test_reply_buf.head);
+}
+
+#ifndef ADMISSION_TEST_DUMP_TIMEOUT_MS
+#define ADMISSION_TEST_DUMP_TIMEOUT_MS 5000
+#endif
+
+static void admission_test_dump_async_timeout(struct uloop_timeout *t)
+{
+    struct admission_test_dump_async_ctx *actx = container_of(t, struct admission_test_dump_async_ctx, timeout);
+
+    actx->timed_out = true;
+    ubus_complete_deferred_request(actx->ctx, &actx->req, UBUS_STATUS_TIMEOUT);
+}
+
+void admission_test_dump_complete(struct admission_test_dump_async_ctx *actx, int status, const struct admission_test_route_table *reply)
+{
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        if (status == UBUS_STATUS_OK && reply) {
+            status = admission_test_dump_reply(actx->ctx, &actx->req, reply);
+        }
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+    }
+
+    free(actx->msg);
+    free(actx);
+
+    admission_test_admission_release(&admission_test_dump_admission);
+}
+
+static int admission_test_dump_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct admission_test_dump_async_ctx *actx;
+    int ret;
+
+    // Over the limit the request waits or is refused, before any decoding
+    if (admission_test_dump_admission.inflight >= admission_test_dump_admission.max_inflight) {
+        return admission_test_admission_enqueue(&admission_test_dump_admission, ctx, req, msg);
+    }
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy beyond the handler call
+    actx->msg = blob_memdup(msg);
+    if (!actx->msg) {
+        free(actx);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    if (admission_test_dump_deserialize(actx->msg, &actx->params) != UBUS_STATUS_OK) {
+        free(actx->msg);
+        free(actx);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    actx->ctx = ctx;
+    ubus_defer_request(ctx, req, &actx->req);
+    admission_test_dump_admission.inflight++;
+    actx->timeout.cb = admission_test_dump_async_timeout;
+    uloop_timeout_set(&actx->timeout, ADMISSION_TEST_DUMP_TIMEOUT_MS);
+
+    // The handler owns the context on success and must call admission_test_dump_complete()
+    ret = admission_test_dump_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        admission_test_dump_complete(actx, ret, NULL);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+void admission_test_lookup_complete(struct admission_test_lookup_async_ctx *actx, int status, const struct admission_test_route_table *reply)
+{
+    struct blob_attr *cached = NULL;
+
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        if (status == UBUS_STATUS_OK && reply) {
+            admission_test_cache_capture = actx->cache ? &cached : NULL;
+            status = admission_test_lookup_reply(actx->ctx, &actx->req, reply);
+            admission_test_cache_capture = NULL;
+        }
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+    }
+
+    // Identical requests that arrived meanwhile get the same answer
+    if (actx->cache) {
+        admission_test_cache_resolve(actx->cache, status, cached);
+    }
+
+    free(actx->msg);
+    free(actx);
+
+    admission_test_admission_release(&admission_test_lookup_admission);
+}
+
+static int admission_test_lookup_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct admission_test_lookup_async_ctx *actx;
+    int ret;
+
+    // Over the limit the request waits or is refused, before any decoding
+    if (admission_test_lookup_admission.inflight >= admission_test_lookup_admission.max_inflight) {
+        return admission_test_admission_enqueue(&admission_test_lookup_admission, ctx, req, msg);
+    }
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy beyond the handler call
+    actx->msg = blob_memdup(msg);
+    if (!actx->msg) {
+        free(actx);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    if (admission_test_lookup_deserialize(actx->msg, &actx->params) != UBUS_STATUS_OK) {
+        free(actx->msg);
+        free(actx);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    actx->ctx = ctx;
+    actx->cache = admission_test_cache_pending;
+    ubus_defer_request(ctx, req, &actx->req);
+    admission_test_lookup_admission.inflight++;
+
+    // The handler owns the context on success and must call admission_test_lookup_complete()
+    ret = admission_test_lookup_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        admission_test_lookup_complete(actx, ret, NULL);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+#ifndef ADMISSION_TEST_POOL_SIZE
+#define ADMISSION_TEST_POOL_SIZE 4
+#endif
+
+#ifndef ADMISSION_TEST_QUEUE_DEPTH
+#define ADMISSION_TEST_QUEUE_DEPTH 64
+#endif
+
+/* Job handed to the worker pool, the reply is serialized by the worker */
+struct admission_test_job {
+    struct admission_test_job *next;
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct blob_attr *msg;
+    int (*run)(struct admission_test_job *job);
+    int status;
+    struct blob_buf reply;
+    struct admission_test_admission *gate;
+};
+
+/* Worker pool state, ubus is only touched from the uloop thread */
+static struct {
+    pthread_mutex_t lock;
+    pthread_cond_t cond;
+    pthread_t threads[ADMISSION_TEST_POOL_SIZE];
+    int n_threads;
+    struct admission_test_job *pending;
+    struct admission_test_job *pending_tail;
+    struct admission_test_job *done;
+    struct admission_test_job *done_tail;
+    int queued;
+    struct uloop_fd efd;
+    bool started;
+    bool stopping;
+} admission_test_pool = {
+    .lock = PTHREAD_MUTEX_INITIALIZER,
+    .cond = PTHREAD_COND_INITIALIZER,
+    .efd = { .fd = -1 },
+};
+
+static void admission_test_job_append(struct admission_test_job **head, struct admission_test_job **tail, struct admission_test_job *job)
+{
+    job->next = NULL;
+    if (*tail) {
+        (*tail)->next = job;
+    } else {
+        *head = job;
+    }
+    *tail = job;
+}
+
+static void admission_test_job_free(struct admission_test_job *job)
+{
+    blob_buf_free(&job->reply);
+    free(job->msg);
+    free(job);
+}
+
+static void *admission_test_pool_worker(void *arg)
+{
+    struct admission_test_job *job;
+    uint64_t one = 1;
+    ssize_t n;
+
+    (void)arg;
+
+    for (;;) {
+        pthread_mutex_lock(&admission_test_pool.lock);
+        while (!admission_test_pool.pending && !admission_test_pool.stopping) {
+            pthread_cond_wait(&admission_test_pool.cond, &admission_test_pool.lock);
+        }
+        if (admission_test_pool.stopping) {
+            pthread_mutex_unlock(&admission_test_pool.lock);
+            break;
+        }
+        job = admission_test_pool.pending;
+        admission_test_pool.pending = job->next;
+        if (!admission_test_pool.pending) {
+            admission_test_pool.pending_tail = NULL;
+        }
+        pthread_mutex_unlock(&admission_test_pool.lock);
+
+        job->status = job->run(job);
+
+        pthread_mutex_lock(&admission_test_pool.lock);
+        admission_test_job_append(&admission_test_pool.done, &admission_test_pool.done_tail, job);
+        pthread_mutex_unlock(&admission_test_pool.lock);
+
+        // Wake the uloop thread to send the reply
+        n = write(admission_test_pool.efd.fd, &one, sizeof(one));
+        (void)n;
+    }
+
+    return NULL;
+}
+
+static void admission_test_pool_done_cb(struct uloop_fd *fd, unsigned int events)
+{
+    struct admission_test_job *job;
+    struct admission_test_job *next;
+    struct admission_test_admission *gate;
+    uint64_t count;
+    ssize_t n;
+
+    (void)events;
+
+    n = read(fd->fd, &count, sizeof(count));
+    (void)n;
+
+    pthread_mutex_lock(&admission_test_pool.lock);
+    job = admission_test_pool.done;
+    admission_test_pool.done = NULL;
+    admission_test_pool.done_tail = NULL;
+    pthread_mutex_unlock(&admission_test_pool.lock);
+
+    for (; job; job = next) {
+        next = job->next;
+        if (job->status == UBUS_STATUS_OK && job->reply.head) {
+            ubus_send_reply(job->ctx, &job->req, job->reply.head);
+        }
+        ubus_complete_deferred_request(job->ctx, &job->req, job->status);
+        admission_test_pool.queued--;
+        gate = job->gate;
+        admission_test_job_free(job);
+        if (gate) {
+            admission_test_admission_release(gate);
+        }
+    }
+}
+
+static void admission_test_pool_stop(void)
+{
+    struct admission_test_job *job;
+    struct admission_test_job *next;
+    int i;
+
+    if (!admission_test_pool.started) {
+        return;
+    }
+
+    pthread_mutex_lock(&admission_test_pool.lock);
+    admission_test_pool.stopping = true;
+    pthread_cond_broadcast(&admission_test_pool.cond);
+    pthread_mutex_unlock(&admission_test_pool.lock);
+
+    for (i = 0; i < admission_test_pool.n_threads; i++) {
+        pthread_join(admission_test_pool.threads[i], NULL);
+    }
+    admission_test_pool.n_threads = 0;
+
+    uloop_fd_delete(&admission_test_pool.efd);
+    close(admission_test_pool.efd.fd);
+    admission_test_pool.efd.fd = -1;
+
+    // Finished jobs still get their result, the callers of jobs that never ran
+    // get an error instead of waiting for their timeout
+    for (job = admission_test_pool.done; job; job = next) {
+        next = job->next;
+        if (job->status == UBUS_STATUS_OK && job->reply.head) {
+            ubus_send_reply(job->ctx, &job->req, job->reply.head);
+        }
+        ubus_complete_deferred_request(job->ctx, &job->req, job->status);
+        admission_test_job_free(job);
+    }
+    for (job = admission_test_pool.pending; job; job = next) {
+        next = job->next;
+        ubus_complete_deferred_request(job->ctx, &job->req, UBUS_STATUS_UNKNOWN_ERROR);
+        admission_test_job_free(job);
+    }
+    admission_test_pool.pending = NULL;
+    admission_test_pool.pending_tail = NULL;
+    admission_test_pool.done = NULL;
+    admission_test_pool.done_tail = NULL;
+    admission_test_pool.queued = 0;
+    admission_test_pool.started = false;
+}
+
+static int admission_test_pool_start(void)
+{
+    int fd;
+    int i;
+
+    if (admission_test_pool.started) {
+        return 0;
+    }
+
+    fd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    if (fd < 0) {
+        return -1;
+    }
+
+    admission_test_pool.efd.fd = fd;
+    admission_test_pool.efd.cb = admission_test_pool_done_cb;
+    uloop_fd_add(&admission_test_pool.efd, ULOOP_READ);
+    admission_test_pool.stopping = false;
+    admission_test_pool.started = true;
+
+    for (i = 0; i < ADMISSION_TEST_POOL_SIZE; i++) {
+        if (pthread_create(&admission_test_pool.threads[i], NULL, admission_test_pool_worker, NULL) != 0) {
+            break;
+        }
+        admission_test_pool.n_threads++;
+    }
+
+    // Run with fewer workers if some failed to start, but not with none
+    if (admission_test_pool.n_threads == 0) {
+        admission_test_pool_stop();
+        return -1;
+    }
+
+    return 0;
+}
+
+static void admission_test_pool_submit(struct admission_test_job *job)
+{
+    admission_test_pool.queued++;
+
+    pthread_mutex_lock(&admission_test_pool.lock);
+    admission_test_job_append(&admission_test_pool.pending, &admission_test_pool.pending_tail, job);
+    pthread_cond_signal(&admission_test_pool.cond);
+    pthread_mutex_unlock(&admission_test_pool.lock);
+}
+
+struct admission_test_flush_job {
+    struct admission_test_job base;
+};
+
+/* Runs on a worker thread */
+static int admission_test_flush_job_run(struct admission_test_job *job)
+{
+    (void)job;
+
+    return admission_test_flush_handler();
+}
+
+static int admission_test_flush_blocking_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct admission_test_flush_job *mjob;
+
+    // Over the limit the request waits or is refused, before any decoding
+    if (admission_test_flush_admission.inflight >= admission_test_flush_admission.max_inflight) {
+        return admission_test_admission_enqueue(&admission_test_flush_admission, ctx, req, msg);
+    }
+
+    if (admission_test_pool_start() != 0) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Refuse new work instead of queueing without bound
+    if (admission_test_pool.queued >= ADMISSION_TEST_QUEUE_DEPTH) {
+        return UBUS_STATUS_NO_MEMORY;
+    }
+
+    mjob = calloc(1, sizeof(*mjob));
+    if (!mjob) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    mjob->base.ctx = ctx;
+    mjob->base.run = admission_test_flush_job_run;
+    ubus_defer_request(ctx, req, &mjob->base.req);
+    mjob->base.gate = &admission_test_flush_admission;
+    admission_test_flush_admission.inflight++;
+    admission_test_pool_submit(&mjob->base);
+
+    return UBUS_STATUS_OK;
+}
+
+static int admission_test_lookup_cache_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct admission_test_cache_entry *entry;
+    struct admission_test_cache_waiter *waiter;
+    uint32_t hash;
+    int ret;
+
+    hash = admission_test_cache_hash(msg);
+    entry = admission_test_cache_find(&admission_test_lookup_cache, msg, hash);
+    if (entry && !entry->pending) {
+        return ubus_send_reply(ctx, req, entry->reply);
+    }
+
+    if (entry) {
+        // The same request is in progress, wait for its reply instead of running it again
+        waiter = calloc(1, sizeof(*waiter));
+        if (!waiter) {
+            return UBUS_STATUS_UNKNOWN_ERROR;
+        }
+
+        waiter->ctx = ctx;
+        ubus_defer_request(ctx, req, &waiter->req);
+        list_add_tail(&waiter->list, &entry->waiters);
+        return UBUS_STATUS_OK;
+    }
+
+    entry = admission_test_cache_insert(&admission_test_lookup_cache, msg, hash);
+    // Once deferred, the request owns the entry and resolves it on completion
+    admission_test_cache_pending = entry;
+    ret = admission_test_lookup_async_dispatch(ctx, obj, req, method, msg);
+    admission_test_cache_pending = NULL;
+    if (ret != UBUS_STATUS_OK && entry) {
+        admission_test_cache_drop(entry);
+    }
+
+    return ret;
+}
+
+#ifndef ADMISSION_TEST_GET_ROUTE_MAX_SIZE
+#define ADMISSION_TEST_GET_ROUTE_MAX_SIZE 4096
+#endif
+
+static int admission_test_get_route_guard(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    // Refuse oversized payloads before parsing them
+    if (blob_len(msg) > ADMISSION_TEST_GET_ROUTE_MAX_SIZE) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return admission_test_get_route_handler(ctx, obj, req, method, msg);
+}
+
+#ifndef ADMISSION_TEST_SET_ROUTES_MAX_SIZE
+#define ADMISSION_TEST_SET_ROUTES_MAX_SIZE 65536
+#endif
+
+static int admission_test_set_routes_guard(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    // Refuse oversized payloads before parsing them
+    if (blob_len(msg) > ADMISSION_TEST_SET_ROUTES_MAX_SIZE) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return admission_test_set_routes_handler(ctx, obj, req, method, msg);
+}
+
+#ifndef ADMISSION_TEST_DUMP_MAX_SIZE
+#define ADMISSION_TEST_DUMP_MAX_SIZE 4096
+#endif
+
+static int admission_test_dump_guard(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    // Refuse oversized payloads before parsing them
+    if (blob_len(msg) > ADMISSION_TEST_DUMP_MAX_SIZE) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return admission_test_dump_async_dispatch(ctx, obj, req, method, msg);
+}
+
+#ifndef ADMISSION_TEST_LOOKUP_MAX_SIZE
+#define ADMISSION_TEST_LOOKUP_MAX_SIZE 4096
+#endif
+
+static int admission_test_lookup_guard(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    // Refuse oversized payloads before parsing them
+    if (blob_len(msg) > ADMISSION_TEST_LOOKUP_MAX_SIZE) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return admission_test_lookup_cache_dispatch(ctx, obj, req, method, msg);
+}
+
+#ifndef ADMISSION_TEST_FLUSH_MAX_SIZE
+#define ADMISSION_TEST_FLUSH_MAX_SIZE 4096
+#endif
+
+static int admission_test_flush_guard(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    // Refuse oversized payloads before parsing them
+    if (blob_len(msg) > ADMISSION_TEST_FLUSH_MAX_SIZE) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return admission_test_flush_blocking_dispatch(ctx, obj, req, method, msg);
+}
+
+static const struct ubus_method admission_test_methods[] = {
+    UBUS_METHOD("get_route", admission_test_get_route_guard, admission_test_get_route_policy),
+    UBUS_METHOD("set_routes", admission_test_set_routes_guard, admission_test_set_routes_policy),
+    UBUS_METHOD("dump", admission_test_dump_guard, admission_test_dump_policy),
+    UBUS_METHOD("lookup", admission_test_lookup_guard, admission_test_lookup_policy),
+    UBUS_METHOD_NOARG("flush", admission_test_flush_guard)
+};
+
+static struct ubus_object_type admission_test_object_type =
+    UBUS_OBJECT_TYPE("admission_test", admission_test_methods);
+
+struct ubus_object admission_test_object = {
+    .name = "admission_test",
+    .type = &admission_test_object_type,
+    .methods = admission_test_methods,
+    .n_methods = ARRAY_SIZE(admission_test_methods),
+};
+
+void admission_test_object_cleanup(void)
+{
+    blob_buf_free(&admission_test_reply_buf);
+    admission_test_cache_invalidate();
+    admission_test_admission_flush(&admission_test_dump_admission);
+    admission_test_admission_flush(&admission_test_lookup_admission);
+    admission_test_admission_flush(&admission_test_flush_admission);
+    admission_test_pool_stop();
+}
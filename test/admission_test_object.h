@@ -0,0 +1,153 @@
+/* Generated from ubus IDL - admission_test */
+
+#ifndef __ADMISSION_TEST_OBJECT_H__
+#define __ADMISSION_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct admission_test_route_table {
+    struct blob_attr * routes;
+    int32_t count;
+    uint8_t has_fields;
+};
+#define ADMISSION_TEST_ROUTE_TABLE_HAS_ROUTES 0
+_Static_assert(sizeof(struct admission_test_route_table) == UBUS_IDL_PACKED_SIZE(struct admission_test_route_table, sizeof(struct blob_attr *) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct admission_test_route_table has padding between members");
+
+struct admission_test_get_route_params {
+    const char * dst;
+};
+_Static_assert(sizeof(struct admission_test_get_route_params) == UBUS_IDL_PACKED_SIZE(struct admission_test_get_route_params, sizeof(const char *)),
+               "struct admission_test_get_route_params has padding between members");
+
+struct admission_test_set_routes_params {
+    struct blob_attr * routes;
+};
+_Static_assert(sizeof(struct admission_test_set_routes_params) == UBUS_IDL_PACKED_SIZE(struct admission_test_set_routes_params, sizeof(struct blob_attr *)),
+               "struct admission_test_set_routes_params has padding between members");
+
+struct admission_test_dump_params {
+    int32_t table;
+    uint8_t has_fields;
+};
+#define ADMISSION_TEST_DUMP_HAS_TABLE 0
+_Static_assert(sizeof(struct admission_test_dump_params) == UBUS_IDL_PACKED_SIZE(struct admission_test_dump_params, sizeof(int32_t) + sizeof(uint8_t)),
+               "struct admission_test_dump_params has padding between members");
+
+struct admission_test_lookup_params {
+    const char * dst;
+};
+_Static_assert(sizeof(struct admission_test_lookup_params) == UBUS_IDL_PACKED_SIZE(struct admission_test_lookup_params, sizeof(const char *)),
+               "struct admission_test_lookup_params has padding between members");
+
+enum {
+    ADMISSION_TEST_GET_ROUTE_DST,
+    __ADMISSION_TEST_GET_ROUTE_MAX
+};
+
+enum {
+    ADMISSION_TEST_SET_ROUTES_ROUTES,
+    __ADMISSION_TEST_SET_ROUTES_MAX
+};
+
+enum {
+    ADMISSION_TEST_DUMP_TABLE,
+    __ADMISSION_TEST_DUMP_MAX
+};
+
+enum {
+    ADMISSION_TEST_LOOKUP_DST,
+    __ADMISSION_TEST_LOOKUP_MAX
+};
+
+enum {
+    ADMISSION_TEST_ROUTE_TABLE_COUNT,
+    ADMISSION_TEST_ROUTE_TABLE_ROUTES,
+    __ADMISSION_TEST_ROUTE_TABLE_MAX
+};
+
+struct admission_test_dump_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    struct admission_test_dump_params params;
+    bool timed_out;
+    void *priv;
+};
+
+struct admission_test_lookup_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    struct admission_test_lookup_params params;
+    struct admission_test_cache_entry *cache;
+    bool timed_out;
+    void *priv;
+};
+
+int admission_test_get_route_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int admission_test_set_routes_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int admission_test_dump_handler(struct admission_test_dump_async_ctx *actx);
+int admission_test_lookup_handler(struct admission_test_lookup_async_ctx *actx);
+int admission_test_flush_handler(void);
+
+int admission_test_get_route_deserialize(struct blob_attr *msg, struct admission_test_get_route_params *params);
+int admission_test_get_route_serialize(struct blob_buf *b, const struct admission_test_get_route_params *params);
+int admission_test_set_routes_deserialize(struct blob_attr *msg, struct admission_test_set_routes_params *params);
+int admission_test_set_routes_serialize(struct blob_buf *b, const struct admission_test_set_routes_params *params);
+int admission_test_dump_deserialize(struct blob_attr *msg, struct admission_test_dump_params *params);
+int admission_test_dump_serialize(struct blob_buf *b, const struct admission_test_dump_params *params);
+int admission_test_lookup_deserialize(struct blob_attr *msg, struct admission_test_lookup_params *params);
+int admission_test_lookup_serialize(struct blob_buf *b, const struct admission_test_lookup_params *params);
+int admission_test_route_table_deserialize(struct blob_attr *msg, struct admission_test_route_table *params);
+int admission_test_route_table_serialize(struct blob_buf *b, const struct admission_test_route_table *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct admission_test_get_route_params *admission_test_get_route_dup(const struct admission_test_get_route_params *params);
+void admission_test_get_route_free(struct admission_test_get_route_params *params);
+struct admission_test_set_routes_params *admission_test_set_routes_dup(const struct admission_test_set_routes_params *params);
+void admission_test_set_routes_free(struct admission_test_set_routes_params *params);
+struct admission_test_dump_params *admission_test_dump_dup(const struct admission_test_dump_params *params);
+void admission_test_dump_free(struct admission_test_dump_params *params);
+struct admission_test_lookup_params *admission_test_lookup_dup(const struct admission_test_lookup_params *params);
+void admission_test_lookup_free(struct admission_test_lookup_params *params);
+struct admission_test_route_table *admission_test_route_table_dup(const struct admission_test_route_table *params);
+void admission_test_route_table_free(struct admission_test_route_table *params);
+
+int admission_test_get_route_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct admission_test_route_table *reply);
+int admission_test_dump_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct admission_test_route_table *reply);
+int admission_test_lookup_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct admission_test_route_table *reply);
+
+void admission_test_dump_complete(struct admission_test_dump_async_ctx *actx, int status, const struct admission_test_route_table *reply);
+void admission_test_lookup_complete(struct admission_test_lookup_async_ctx *actx, int status, const struct admission_test_route_table *reply);
+
+extern struct ubus_object admission_test_object;
+
+void admission_test_lookup_cache_invalidate(void);
+void admission_test_cache_invalidate(void);
+
+void admission_test_object_cleanup(void);
+
+#endif /* __ADMISSION_TEST_OBJECT_H__ */
@@ -2,21 +2,23 @@
 
 #include <libubox/blobmsg_json.h>
 #include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
 #include "annotation_test_object.h"
 
 /* Helper macros for optional field deserialization */
-#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, mask) \
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
     do { \
         if ((tb)[(enum)]) { \
             (field) = blobmsg_get_##type((tb)[(enum)]); \
-            UBUS_IDL_SET_FIELD((params), (mask)); \
+            UBUS_IDL_SET_##kind((params), (index)); \
         } \
     } while (0)
 
 /* Helper macros for optional field serialization */
-#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, mask) \
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
     do { \
-        if (UBUS_IDL_HAS_FIELD((params), (mask))) { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
             blobmsg_add_##type((b), (name), (field)); \
         } \
     } while (0)
@@ -30,6 +32,17 @@
         } \
     } while (0)
 
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
 static const struct blobmsg_policy annotation_test_hello_policy[] = {
     [ANNOTATION_TEST_HELLO_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 },
     [ANNOTATION_TEST_HELLO_MSG] = { .name = "msg", .type = BLOBMSG_TYPE_STRING }
@@ -58,6 +71,32 @@ int annotation_test_hello_serialize(struct blob_buf *b, const struct annotation_
     return UBUS_STATUS_OK;
 }
 
+struct annotation_test_hello_params *annotation_test_hello_dup(const struct annotation_test_hello_params *params)
+{
+    size_t len = sizeof(*params);
+    struct annotation_test_hello_params *copy;
+    char *p;
+
+    if (params->msg) {
+        len += strlen(params->msg) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->msg = params->msg ? ubus_idl_dup_string(&p, params->msg) : NULL;
+    return copy;
+}
+
+void annotation_test_hello_free(struct annotation_test_hello_params *params)
+{
+    free(params);
+}
+
 static const struct blobmsg_policy annotation_test_hello1_policy[] = {
     [ANNOTATION_TEST_HELLO1_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 }
 };
@@ -83,6 +122,25 @@ int annotation_test_hello1_serialize(struct blob_buf *b, const struct annotation
     return UBUS_STATUS_OK;
 }
 
+struct annotation_test_hello1_params *annotation_test_hello1_dup(const struct annotation_test_hello1_params *params)
+{
+    size_t len = sizeof(*params);
+    struct annotation_test_hello1_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void annotation_test_hello1_free(struct annotation_test_hello1_params *params)
+{
+    free(params);
+}
+
 static const struct blobmsg_policy annotation_test_hello2_policy[] = {
     [ANNOTATION_TEST_HELLO2_MSG] = { .name = "msg", .type = BLOBMSG_TYPE_STRING }
 };
@@ -108,6 +166,32 @@ int annotation_test_hello2_serialize(struct blob_buf *b, const struct annotation
     return UBUS_STATUS_OK;
 }
 
+struct annotation_test_hello2_params *annotation_test_hello2_dup(const struct annotation_test_hello2_params *params)
+{
+    size_t len = sizeof(*params);
+    struct annotation_test_hello2_params *copy;
+    char *p;
+
+    if (params->msg) {
+        len += strlen(params->msg) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->msg = params->msg ? ubus_idl_dup_string(&p, params->msg) : NULL;
+    return copy;
+}
+
+void annotation_test_hello2_free(struct annotation_test_hello2_params *params)
+{
+    free(params);
+}
+
 static const struct ubus_method annotation_test_methods[] = {
     { __UBUS_METHOD("hello", annotation_test_hello_handler, 1, annotation_test_hello_policy, 5) },
     UBUS_METHOD_MASK("hello1", annotation_test_hello1_handler, annotation_test_hello1_policy, 2),
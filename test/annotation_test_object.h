@@ -6,24 +6,43 @@
 #include <libubus.h>
 #include <stdint.h>
 
-/* Helper macros for optional field operations */
-#define UBUS_IDL_HAS_FIELD(params, index) ((params)->has_fields & (1U << index))
-#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (1U << index))
-#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~(1U << index))
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
 
 
 struct annotation_test_hello_params {
-    int32_t id;
     const char * msg;
+    int32_t id;
 };
+_Static_assert(sizeof(struct annotation_test_hello_params) == UBUS_IDL_PACKED_SIZE(struct annotation_test_hello_params, sizeof(const char *) + sizeof(int32_t)),
+               "struct annotation_test_hello_params has padding between members");
 
 struct annotation_test_hello1_params {
     int32_t id;
 };
+_Static_assert(sizeof(struct annotation_test_hello1_params) == UBUS_IDL_PACKED_SIZE(struct annotation_test_hello1_params, sizeof(int32_t)),
+               "struct annotation_test_hello1_params has padding between members");
 
 struct annotation_test_hello2_params {
     const char * msg;
 };
+_Static_assert(sizeof(struct annotation_test_hello2_params) == UBUS_IDL_PACKED_SIZE(struct annotation_test_hello2_params, sizeof(const char *)),
+               "struct annotation_test_hello2_params has padding between members");
 
 enum {
     ANNOTATION_TEST_HELLO_ID,
@@ -55,6 +74,14 @@ int annotation_test_hello1_serialize(struct blob_buf *b, const struct annotation
 int annotation_test_hello2_deserialize(struct blob_attr *msg, struct annotation_test_hello2_params *params);
 int annotation_test_hello2_serialize(struct blob_buf *b, const struct annotation_test_hello2_params *params);
 
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct annotation_test_hello_params *annotation_test_hello_dup(const struct annotation_test_hello_params *params);
+void annotation_test_hello_free(struct annotation_test_hello_params *params);
+struct annotation_test_hello1_params *annotation_test_hello1_dup(const struct annotation_test_hello1_params *params);
+void annotation_test_hello1_free(struct annotation_test_hello1_params *params);
+struct annotation_test_hello2_params *annotation_test_hello2_dup(const struct annotation_test_hello2_params *params);
+void annotation_test_hello2_free(struct annotation_test_hello2_params *params);
+
 extern struct ubus_object annotation_test_object;
 
 #endif /* __ANNOTATION_TEST_OBJECT_H__ */
@@ -0,0 +1,476 @@
+/* Generated from ubus IDL - async_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "async_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy async_test_query_policy[] = {
+    [ASYNC_TEST_QUERY_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING }
+};
+
+int async_test_query_deserialize(struct blob_attr *msg, struct async_test_query_params *params)
+{
+    struct blob_attr *tb_async_test_query[__ASYNC_TEST_QUERY_MAX];
+    if (blobmsg_parse(async_test_query_policy, ARRAY_SIZE(async_test_query_policy), tb_async_test_query, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_async_test_query[ASYNC_TEST_QUERY_IFNAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->ifname = blobmsg_get_string(tb_async_test_query[ASYNC_TEST_QUERY_IFNAME]);
+    return UBUS_STATUS_OK;
+}
+
+int async_test_query_serialize(struct blob_buf *b, const struct async_test_query_params *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    return UBUS_STATUS_OK;
+}
+
+struct async_test_query_params *async_test_query_dup(const struct async_test_query_params *params)
+{
+    size_t len = sizeof(*params);
+    struct async_test_query_params *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void async_test_query_free(struct async_test_query_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy async_test_flush_policy[] = {
+    [ASYNC_TEST_FLUSH_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING }
+};
+
+int async_test_flush_deserialize(struct blob_attr *msg, struct async_test_flush_params *params)
+{
+    struct blob_attr *tb_async_test_flush[__ASYNC_TEST_FLUSH_MAX];
+    if (blobmsg_parse(async_test_flush_policy, ARRAY_SIZE(async_test_flush_policy), tb_async_test_flush, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    UBUS_IDL_GET_OPTIONAL(string, tb_async_test_flush, ASYNC_TEST_FLUSH_IFNAME, params->ifname, params, FIELD, ASYNC_TEST_FLUSH_HAS_IFNAME);
+    return UBUS_STATUS_OK;
+}
+
+int async_test_flush_serialize(struct blob_buf *b, const struct async_test_flush_params *params)
+{
+    UBUS_IDL_ADD_OPTIONAL(string, b, "ifname", params->ifname, params, FIELD, ASYNC_TEST_FLUSH_HAS_IFNAME);
+    return UBUS_STATUS_OK;
+}
+
+struct async_test_flush_params *async_test_flush_dup(const struct async_test_flush_params *params)
+{
+    size_t len = sizeof(*params);
+    struct async_test_flush_params *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, ASYNC_TEST_FLUSH_HAS_IFNAME) && params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = UBUS_IDL_HAS_FIELD(params, ASYNC_TEST_FLUSH_HAS_IFNAME) && params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void async_test_flush_free(struct async_test_flush_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy async_test_link_info_policy[] = {
+    [ASYNC_TEST_LINK_INFO_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [ASYNC_TEST_LINK_INFO_UP] = { .name = "up", .type = BLOBMSG_TYPE_BOOL },
+    [ASYNC_TEST_LINK_INFO_MTU] = { .name = "mtu", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int async_test_link_info_deserialize(struct blob_attr *msg, struct async_test_link_info *params)
+{
+    struct blob_attr *tb_async_test_link_info[__ASYNC_TEST_LINK_INFO_MAX];
+    if (blobmsg_parse(async_test_link_info_policy, ARRAY_SIZE(async_test_link_info_policy), tb_async_test_link_info, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_async_test_link_info[ASYNC_TEST_LINK_INFO_IFNAME] || !tb_async_test_link_info[ASYNC_TEST_LINK_INFO_UP]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->ifname = blobmsg_get_string(tb_async_test_link_info[ASYNC_TEST_LINK_INFO_IFNAME]);
+    params->up = blobmsg_get_u8(tb_async_test_link_info[ASYNC_TEST_LINK_INFO_UP]) != 0;
+
+    UBUS_IDL_GET_OPTIONAL(u32, tb_async_test_link_info, ASYNC_TEST_LINK_INFO_MTU, params->mtu, params, FIELD, ASYNC_TEST_LINK_INFO_HAS_MTU);
+    return UBUS_STATUS_OK;
+}
+
+int async_test_link_info_serialize(struct blob_buf *b, const struct async_test_link_info *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    UBUS_IDL_ADD(u8, b, "up", params->up ? 1 : 0);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "mtu", params->mtu, params, FIELD, ASYNC_TEST_LINK_INFO_HAS_MTU);
+    return UBUS_STATUS_OK;
+}
+
+struct async_test_link_info *async_test_link_info_dup(const struct async_test_link_info *params)
+{
+    size_t len = sizeof(*params);
+    struct async_test_link_info *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void async_test_link_info_free(struct async_test_link_info *params)
+{
+    free(params);
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf async_test_reply_buf;
+
+int async_test_query_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct async_test_link_info *reply)
+{
+    int ret;
+
+    blob_buf_init(&async_test_reply_buf, 0);
+    ret = async_test_link_info_serialize(&async_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, async_test_reply_buf.head);
+}
+
+int async_test_dump_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct async_test_link_info *reply)
+{
+    int ret;
+
+    blob_buf_init(&async_test_reply_buf, 0);
+    ret = async_test_link_info_serialize(&async_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, async_test_reply_buf.head);
+}
+
+int async_test_status_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct async_test_link_info *reply)
+{
+    int ret;
+
+    blob_buf_init(&async_test_reply_buf, 0);
+    ret = async_test_link_info_serialize(&async_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, async_test_reply_buf.head);
+}
+
+#ifndef ASYNC_TEST_QUERY_TIMEOUT_MS
+#define ASYNC_TEST_QUERY_TIMEOUT_MS 5000
+#endif
+
+static void async_test_query_async_timeout(struct uloop_timeout *t)
+{
+    struct async_test_query_async_ctx *actx = container_of(t, struct async_test_query_async_ctx, timeout);
+
+    actx->timed_out = true;
+    ubus_complete_deferred_request(actx->ctx, &actx->req, UBUS_STATUS_TIMEOUT);
+}
+
+void async_test_query_complete(struct async_test_query_async_ctx *actx, int status, const struct async_test_link_info *reply)
+{
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        if (status == UBUS_STATUS_OK && reply) {
+            status = async_test_query_reply(actx->ctx, &actx->req, reply);
+        }
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+    }
+
+    free(actx->msg);
+    free(actx);
+}
+
+static int async_test_query_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct async_test_query_async_ctx *actx;
+    int ret;
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy beyond the handler call
+    actx->msg = blob_memdup(msg);
+    if (!actx->msg) {
+        free(actx);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    if (async_test_query_deserialize(actx->msg, &actx->params) != UBUS_STATUS_OK) {
+        free(actx->msg);
+        free(actx);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    actx->ctx = ctx;
+    ubus_defer_request(ctx, req, &actx->req);
+    actx->timeout.cb = async_test_query_async_timeout;
+    uloop_timeout_set(&actx->timeout, ASYNC_TEST_QUERY_TIMEOUT_MS);
+
+    // The handler owns the context on success and must call async_test_query_complete()
+    ret = async_test_query_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        async_test_query_complete(actx, ret, NULL);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+void async_test_flush_complete(struct async_test_flush_async_ctx *actx, int status)
+{
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+    }
+
+    free(actx->msg);
+    free(actx);
+}
+
+static int async_test_flush_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct async_test_flush_async_ctx *actx;
+    int ret;
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy beyond the handler call
+    actx->msg = blob_memdup(msg);
+    if (!actx->msg) {
+        free(actx);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    if (async_test_flush_deserialize(actx->msg, &actx->params) != UBUS_STATUS_OK) {
+        free(actx->msg);
+        free(actx);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    actx->ctx = ctx;
+    ubus_defer_request(ctx, req, &actx->req);
+
+    // The handler owns the context on success and must call async_test_flush_complete()
+    ret = async_test_flush_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        async_test_flush_complete(actx, ret);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+#ifndef ASYNC_TEST_DUMP_TIMEOUT_MS
+#define ASYNC_TEST_DUMP_TIMEOUT_MS 1000
+#endif
+
+static void async_test_dump_async_timeout(struct uloop_timeout *t)
+{
+    struct async_test_dump_async_ctx *actx = container_of(t, struct async_test_dump_async_ctx, timeout);
+
+    actx->timed_out = true;
+    ubus_complete_deferred_request(actx->ctx, &actx->req, UBUS_STATUS_TIMEOUT);
+}
+
+void async_test_dump_complete(struct async_test_dump_async_ctx *actx, int status, const struct async_test_link_info *reply)
+{
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        if (status == UBUS_STATUS_OK && reply) {
+            status = async_test_dump_reply(actx->ctx, &actx->req, reply);
+        }
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+    }
+
+    free(actx->msg);
+    free(actx);
+}
+
+static int async_test_dump_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct async_test_dump_async_ctx *actx;
+    int ret;
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    actx->ctx = ctx;
+    ubus_defer_request(ctx, req, &actx->req);
+    actx->timeout.cb = async_test_dump_async_timeout;
+    uloop_timeout_set(&actx->timeout, ASYNC_TEST_DUMP_TIMEOUT_MS);
+
+    // The handler owns the context on success and must call async_test_dump_complete()
+    ret = async_test_dump_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        async_test_dump_complete(actx, ret, NULL);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+void async_test_probe_complete(struct async_test_probe_async_ctx *actx, int status)
+{
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+    }
+
+    free(actx->msg);
+    free(actx);
+}
+
+static int async_test_probe_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct async_test_probe_async_ctx *actx;
+    int ret;
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy beyond the handler call
+    actx->msg = blob_memdup(msg);
+    if (!actx->msg) {
+        free(actx);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    if (async_test_link_info_deserialize(actx->msg, &actx->params) != UBUS_STATUS_OK) {
+        free(actx->msg);
+        free(actx);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    actx->ctx = ctx;
+    ubus_defer_request(ctx, req, &actx->req);
+
+    // The handler owns the context on success and must call async_test_probe_complete()
+    ret = probe_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        async_test_probe_complete(actx, ret);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static const struct ubus_method async_test_methods[] = {
+    UBUS_METHOD("query", async_test_query_async_dispatch, async_test_query_policy),
+    UBUS_METHOD("flush", async_test_flush_async_dispatch, async_test_flush_policy),
+    UBUS_METHOD_NOARG("dump", async_test_dump_async_dispatch),
+    UBUS_METHOD("probe", async_test_probe_async_dispatch, async_test_link_info_policy),
+    UBUS_METHOD_NOARG("status", async_test_status_handler)
+};
+
+static struct ubus_object_type async_test_object_type =
+    UBUS_OBJECT_TYPE("async_test", async_test_methods);
+
+struct ubus_object async_test_object = {
+    .name = "async_test",
+    .type = &async_test_object_type,
+    .methods = async_test_methods,
+    .n_methods = ARRAY_SIZE(async_test_methods),
+};
+
+void async_test_object_cleanup(void)
+{
+    blob_buf_free(&async_test_reply_buf);
+}
@@ -0,0 +1,142 @@
+/* Generated from ubus IDL - async_test */
+
+#ifndef __ASYNC_TEST_OBJECT_H__
+#define __ASYNC_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct async_test_link_info {
+    const char * ifname;
+    int32_t mtu;
+    bool up;
+    uint8_t has_fields;
+};
+#define ASYNC_TEST_LINK_INFO_HAS_MTU 0
+_Static_assert(sizeof(struct async_test_link_info) == UBUS_IDL_PACKED_SIZE(struct async_test_link_info, sizeof(const char *) + sizeof(int32_t) + sizeof(bool) + sizeof(uint8_t)),
+               "struct async_test_link_info has padding between members");
+
+struct async_test_query_params {
+    const char * ifname;
+};
+_Static_assert(sizeof(struct async_test_query_params) == UBUS_IDL_PACKED_SIZE(struct async_test_query_params, sizeof(const char *)),
+               "struct async_test_query_params has padding between members");
+
+struct async_test_flush_params {
+    const char * ifname;
+    uint8_t has_fields;
+};
+#define ASYNC_TEST_FLUSH_HAS_IFNAME 0
+_Static_assert(sizeof(struct async_test_flush_params) == UBUS_IDL_PACKED_SIZE(struct async_test_flush_params, sizeof(const char *) + sizeof(uint8_t)),
+               "struct async_test_flush_params has padding between members");
+
+enum {
+    ASYNC_TEST_QUERY_IFNAME,
+    __ASYNC_TEST_QUERY_MAX
+};
+
+enum {
+    ASYNC_TEST_FLUSH_IFNAME,
+    __ASYNC_TEST_FLUSH_MAX
+};
+
+enum {
+    ASYNC_TEST_LINK_INFO_IFNAME,
+    ASYNC_TEST_LINK_INFO_UP,
+    ASYNC_TEST_LINK_INFO_MTU,
+    __ASYNC_TEST_LINK_INFO_MAX
+};
+
+struct async_test_query_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    struct async_test_query_params params;
+    bool timed_out;
+    void *priv;
+};
+
+struct async_test_flush_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    struct async_test_flush_params params;
+    bool timed_out;
+    void *priv;
+};
+
+struct async_test_dump_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    bool timed_out;
+    void *priv;
+};
+
+struct async_test_probe_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    struct async_test_link_info params;
+    bool timed_out;
+    void *priv;
+};
+
+int async_test_query_handler(struct async_test_query_async_ctx *actx);
+int async_test_flush_handler(struct async_test_flush_async_ctx *actx);
+int async_test_dump_handler(struct async_test_dump_async_ctx *actx);
+int probe_handler(struct async_test_probe_async_ctx *actx);
+int async_test_status_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+int async_test_query_deserialize(struct blob_attr *msg, struct async_test_query_params *params);
+int async_test_query_serialize(struct blob_buf *b, const struct async_test_query_params *params);
+int async_test_flush_deserialize(struct blob_attr *msg, struct async_test_flush_params *params);
+int async_test_flush_serialize(struct blob_buf *b, const struct async_test_flush_params *params);
+int async_test_link_info_deserialize(struct blob_attr *msg, struct async_test_link_info *params);
+int async_test_link_info_serialize(struct blob_buf *b, const struct async_test_link_info *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct async_test_query_params *async_test_query_dup(const struct async_test_query_params *params);
+void async_test_query_free(struct async_test_query_params *params);
+struct async_test_flush_params *async_test_flush_dup(const struct async_test_flush_params *params);
+void async_test_flush_free(struct async_test_flush_params *params);
+struct async_test_link_info *async_test_link_info_dup(const struct async_test_link_info *params);
+void async_test_link_info_free(struct async_test_link_info *params);
+
+int async_test_query_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct async_test_link_info *reply);
+int async_test_dump_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct async_test_link_info *reply);
+int async_test_status_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct async_test_link_info *reply);
+
+void async_test_query_complete(struct async_test_query_async_ctx *actx, int status, const struct async_test_link_info *reply);
+void async_test_flush_complete(struct async_test_flush_async_ctx *actx, int status);
+void async_test_dump_complete(struct async_test_dump_async_ctx *actx, int status, const struct async_test_link_info *reply);
+void async_test_probe_complete(struct async_test_probe_async_ctx *actx, int status);
+
+extern struct ubus_object async_test_object;
+
+void async_test_object_cleanup(void);
+
+#endif /* __ASYNC_TEST_OBJECT_H__ */
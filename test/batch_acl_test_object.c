@@ -0,0 +1,279 @@
+/* Generated from ubus IDL - batch_acl_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "batch_acl_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy batch_acl_test_status_policy[] = {
+    [BATCH_ACL_TEST_STATUS_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING }
+};
+
+int batch_acl_test_status_deserialize(struct blob_attr *msg, struct batch_acl_test_status_params *params)
+{
+    struct blob_attr *tb_batch_acl_test_status[__BATCH_ACL_TEST_STATUS_MAX];
+    if (blobmsg_parse(batch_acl_test_status_policy, ARRAY_SIZE(batch_acl_test_status_policy), tb_batch_acl_test_status, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_batch_acl_test_status[BATCH_ACL_TEST_STATUS_NAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->name = blobmsg_get_string(tb_batch_acl_test_status[BATCH_ACL_TEST_STATUS_NAME]);
+    return UBUS_STATUS_OK;
+}
+
+int batch_acl_test_status_serialize(struct blob_buf *b, const struct batch_acl_test_status_params *params)
+{
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    return UBUS_STATUS_OK;
+}
+
+struct batch_acl_test_status_params *batch_acl_test_status_dup(const struct batch_acl_test_status_params *params)
+{
+    size_t len = sizeof(*params);
+    struct batch_acl_test_status_params *copy;
+    char *p;
+
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void batch_acl_test_status_free(struct batch_acl_test_status_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy batch_acl_test_reset_policy[] = {
+    [BATCH_ACL_TEST_RESET_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING }
+};
+
+int batch_acl_test_reset_deserialize(struct blob_attr *msg, struct batch_acl_test_reset_params *params)
+{
+    struct blob_attr *tb_batch_acl_test_reset[__BATCH_ACL_TEST_RESET_MAX];
+    if (blobmsg_parse(batch_acl_test_reset_policy, ARRAY_SIZE(batch_acl_test_reset_policy), tb_batch_acl_test_reset, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_batch_acl_test_reset[BATCH_ACL_TEST_RESET_NAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->name = blobmsg_get_string(tb_batch_acl_test_reset[BATCH_ACL_TEST_RESET_NAME]);
+    return UBUS_STATUS_OK;
+}
+
+int batch_acl_test_reset_serialize(struct blob_buf *b, const struct batch_acl_test_reset_params *params)
+{
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    return UBUS_STATUS_OK;
+}
+
+struct batch_acl_test_reset_params *batch_acl_test_reset_dup(const struct batch_acl_test_reset_params *params)
+{
+    size_t len = sizeof(*params);
+    struct batch_acl_test_reset_params *copy;
+    char *p;
+
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void batch_acl_test_reset_free(struct batch_acl_test_reset_params *params)
+{
+    free(params);
+}
+
+/* Set while a batch runs its calls, reply helpers then append to the batch response */
+static struct blob_buf *batch_acl_test_batch_capture;
+
+enum {
+    BATCH_ACL_TEST_BATCH_CALLS,
+    __BATCH_ACL_TEST_BATCH_MAX
+};
+
+static const struct blobmsg_policy batch_acl_test_batch_policy[] = {
+    [BATCH_ACL_TEST_BATCH_CALLS] = { .name = "calls", .type = BLOBMSG_TYPE_ARRAY }
+};
+
+enum {
+    BATCH_ACL_TEST_BATCH_CALL_METHOD,
+    BATCH_ACL_TEST_BATCH_CALL_PARAMS,
+    __BATCH_ACL_TEST_BATCH_CALL_MAX
+};
+
+static const struct blobmsg_policy batch_acl_test_batch_call_policy[] = {
+    [BATCH_ACL_TEST_BATCH_CALL_METHOD] = { .name = "method", .type = BLOBMSG_TYPE_STRING },
+    [BATCH_ACL_TEST_BATCH_CALL_PARAMS] = { .name = "params", .type = BLOBMSG_TYPE_TABLE }
+};
+
+static int batch_acl_test_batch_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+static const struct ubus_method batch_acl_test_methods[] = {
+    UBUS_METHOD("status", batch_acl_test_status_handler, batch_acl_test_status_policy),
+    UBUS_METHOD("reset", batch_acl_test_reset_handler, batch_acl_test_reset_policy),
+    UBUS_METHOD("batch", batch_acl_test_batch_handler, batch_acl_test_batch_policy)
+};
+
+static struct ubus_object_type batch_acl_test_object_type =
+    UBUS_OBJECT_TYPE("batch_acl_test", batch_acl_test_methods);
+
+struct ubus_object batch_acl_test_object = {
+    .name = "batch_acl_test",
+    .type = &batch_acl_test_object_type,
+    .methods = batch_acl_test_methods,
+    .n_methods = ARRAY_SIZE(batch_acl_test_methods),
+};
+
+/* Methods allowed inside a batch, ubusd only checks the ACL of the batch call */
+static const char *const batch_acl_test_batch_allowed[] = {
+    "status",
+};
+
+static struct blob_buf batch_acl_test_batch_buf;
+static struct blob_buf batch_acl_test_batch_args;
+
+static const struct ubus_method *batch_acl_test_batch_find(const char *name)
+{
+    size_t i;
+
+    for (i = 0; i < ARRAY_SIZE(batch_acl_test_batch_allowed); i++) {
+        if (!strcmp(batch_acl_test_batch_allowed[i], name)) {
+            break;
+        }
+    }
+    if (i == ARRAY_SIZE(batch_acl_test_batch_allowed)) {
+        return NULL;
+    }
+
+    for (i = 0; i < ARRAY_SIZE(batch_acl_test_methods); i++) {
+        if (!strcmp(batch_acl_test_methods[i].name, name)) {
+            return &batch_acl_test_methods[i];
+        }
+    }
+
+    return NULL;
+}
+
+static int batch_acl_test_batch_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct blob_attr *tb[__BATCH_ACL_TEST_BATCH_MAX];
+    struct blob_attr *call_tb[__BATCH_ACL_TEST_BATCH_CALL_MAX];
+    struct ubus_request_data call_req;
+    const struct ubus_method *m;
+    struct blob_attr *cur;
+    void *results;
+    void *entry;
+    size_t rem;
+    int ret;
+
+    if (blobmsg_parse(batch_acl_test_batch_policy, ARRAY_SIZE(batch_acl_test_batch_policy), tb, blob_data(msg), blob_len(msg)) < 0 || !tb[BATCH_ACL_TEST_BATCH_CALLS]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    blob_buf_init(&batch_acl_test_batch_buf, 0);
+    results = blobmsg_open_array(&batch_acl_test_batch_buf, "results");
+
+    blobmsg_for_each_attr(cur, tb[BATCH_ACL_TEST_BATCH_CALLS], rem) {
+        entry = blobmsg_open_table(&batch_acl_test_batch_buf, NULL);
+
+        if (blobmsg_type(cur) != BLOBMSG_TYPE_TABLE ||
+            blobmsg_parse(batch_acl_test_batch_call_policy, ARRAY_SIZE(batch_acl_test_batch_call_policy), call_tb, blobmsg_data(cur), blobmsg_data_len(cur)) < 0 ||
+            !call_tb[BATCH_ACL_TEST_BATCH_CALL_METHOD]) {
+            ret = UBUS_STATUS_INVALID_ARGUMENT;
+        } else if (!(m = batch_acl_test_batch_find(blobmsg_get_string(call_tb[BATCH_ACL_TEST_BATCH_CALL_METHOD])))) {
+            ret = UBUS_STATUS_METHOD_NOT_FOUND;
+        } else {
+            // Handlers expect the bare params payload, as in a direct call
+            blob_buf_init(&batch_acl_test_batch_args, 0);
+            if (call_tb[BATCH_ACL_TEST_BATCH_CALL_PARAMS]) {
+                blob_put_raw(&batch_acl_test_batch_args, blobmsg_data(call_tb[BATCH_ACL_TEST_BATCH_CALL_PARAMS]),
+                             blobmsg_data_len(call_tb[BATCH_ACL_TEST_BATCH_CALL_PARAMS]));
+            }
+
+            // Inner calls get a request without peer, ubusd drops a reply sent on it
+            // instead of delivering it to the caller before the batch response
+            memset(&call_req, 0, sizeof(call_req));
+            call_req.fd = -1;
+            call_req.req_fd = -1;
+
+            batch_acl_test_batch_capture = &batch_acl_test_batch_buf;
+            ret = m->handler(ctx, obj, &call_req, m->name, batch_acl_test_batch_args.head);
+            batch_acl_test_batch_capture = NULL;
+        }
+
+        blobmsg_add_u32(&batch_acl_test_batch_buf, "status", ret);
+        blobmsg_close_table(&batch_acl_test_batch_buf, entry);
+    }
+
+    blobmsg_close_array(&batch_acl_test_batch_buf, results);
+
+    return ubus_send_reply(ctx, req, batch_acl_test_batch_buf.head);
+}
+
+void batch_acl_test_object_cleanup(void)
+{
+    blob_buf_free(&batch_acl_test_batch_buf);
+    blob_buf_free(&batch_acl_test_batch_args);
+}
@@ -0,0 +1,68 @@
+/* Generated from ubus IDL - batch_acl_test */
+
+#ifndef __BATCH_ACL_TEST_OBJECT_H__
+#define __BATCH_ACL_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct batch_acl_test_status_params {
+    const char * name;
+};
+_Static_assert(sizeof(struct batch_acl_test_status_params) == UBUS_IDL_PACKED_SIZE(struct batch_acl_test_status_params, sizeof(const char *)),
+               "struct batch_acl_test_status_params has padding between members");
+
+struct batch_acl_test_reset_params {
+    const char * name;
+};
+_Static_assert(sizeof(struct batch_acl_test_reset_params) == UBUS_IDL_PACKED_SIZE(struct batch_acl_test_reset_params, sizeof(const char *)),
+               "struct batch_acl_test_reset_params has padding between members");
+
+enum {
+    BATCH_ACL_TEST_STATUS_NAME,
+    __BATCH_ACL_TEST_STATUS_MAX
+};
+
+enum {
+    BATCH_ACL_TEST_RESET_NAME,
+    __BATCH_ACL_TEST_RESET_MAX
+};
+
+int batch_acl_test_status_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int batch_acl_test_reset_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+int batch_acl_test_status_deserialize(struct blob_attr *msg, struct batch_acl_test_status_params *params);
+int batch_acl_test_status_serialize(struct blob_buf *b, const struct batch_acl_test_status_params *params);
+int batch_acl_test_reset_deserialize(struct blob_attr *msg, struct batch_acl_test_reset_params *params);
+int batch_acl_test_reset_serialize(struct blob_buf *b, const struct batch_acl_test_reset_params *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct batch_acl_test_status_params *batch_acl_test_status_dup(const struct batch_acl_test_status_params *params);
+void batch_acl_test_status_free(struct batch_acl_test_status_params *params);
+struct batch_acl_test_reset_params *batch_acl_test_reset_dup(const struct batch_acl_test_reset_params *params);
+void batch_acl_test_reset_free(struct batch_acl_test_reset_params *params);
+
+extern struct ubus_object batch_acl_test_object;
+
+void batch_acl_test_object_cleanup(void);
+
+#endif /* __BATCH_ACL_TEST_OBJECT_H__ */
@@ -0,0 +1,414 @@
+/* Generated from ubus IDL - batch_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "batch_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy batch_test_get_policy[] = {
+    [BATCH_TEST_GET_KEY] = { .name = "key", .type = BLOBMSG_TYPE_STRING }
+};
+
+int batch_test_get_deserialize(struct blob_attr *msg, struct batch_test_get_params *params)
+{
+    struct blob_attr *tb_batch_test_get[__BATCH_TEST_GET_MAX];
+    if (blobmsg_parse(batch_test_get_policy, ARRAY_SIZE(batch_test_get_policy), tb_batch_test_get, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_batch_test_get[BATCH_TEST_GET_KEY]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->key = blobmsg_get_string(tb_batch_test_get[BATCH_TEST_GET_KEY]);
+    return UBUS_STATUS_OK;
+}
+
+int batch_test_get_serialize(struct blob_buf *b, const struct batch_test_get_params *params)
+{
+    UBUS_IDL_ADD(string, b, "key", params->key);
+    return UBUS_STATUS_OK;
+}
+
+struct batch_test_get_params *batch_test_get_dup(const struct batch_test_get_params *params)
+{
+    size_t len = sizeof(*params);
+    struct batch_test_get_params *copy;
+    char *p;
+
+    if (params->key) {
+        len += strlen(params->key) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->key = params->key ? ubus_idl_dup_string(&p, params->key) : NULL;
+    return copy;
+}
+
+void batch_test_get_free(struct batch_test_get_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy batch_test_entry_policy[] = {
+    [BATCH_TEST_ENTRY_KEY] = { .name = "key", .type = BLOBMSG_TYPE_STRING },
+    [BATCH_TEST_ENTRY_VALUE] = { .name = "value", .type = BLOBMSG_TYPE_STRING }
+};
+
+int batch_test_entry_deserialize(struct blob_attr *msg, struct batch_test_entry *params)
+{
+    struct blob_attr *tb_batch_test_entry[__BATCH_TEST_ENTRY_MAX];
+    if (blobmsg_parse(batch_test_entry_policy, ARRAY_SIZE(batch_test_entry_policy), tb_batch_test_entry, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_batch_test_entry[BATCH_TEST_ENTRY_KEY]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->key = blobmsg_get_string(tb_batch_test_entry[BATCH_TEST_ENTRY_KEY]);
+
+    UBUS_IDL_GET_OPTIONAL(string, tb_batch_test_entry, BATCH_TEST_ENTRY_VALUE, params->value, params, FIELD, BATCH_TEST_ENTRY_HAS_VALUE);
+    return UBUS_STATUS_OK;
+}
+
+int batch_test_entry_serialize(struct blob_buf *b, const struct batch_test_entry *params)
+{
+    UBUS_IDL_ADD(string, b, "key", params->key);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "value", params->value, params, FIELD, BATCH_TEST_ENTRY_HAS_VALUE);
+    return UBUS_STATUS_OK;
+}
+
+struct batch_test_entry *batch_test_entry_dup(const struct batch_test_entry *params)
+{
+    size_t len = sizeof(*params);
+    struct batch_test_entry *copy;
+    char *p;
+
+    if (params->key) {
+        len += strlen(params->key) + 1;
+    }
+    if (UBUS_IDL_HAS_FIELD(params, BATCH_TEST_ENTRY_HAS_VALUE) && params->value) {
+        len += strlen(params->value) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->key = params->key ? ubus_idl_dup_string(&p, params->key) : NULL;
+    copy->value = UBUS_IDL_HAS_FIELD(params, BATCH_TEST_ENTRY_HAS_VALUE) && params->value ? ubus_idl_dup_string(&p, params->value) : NULL;
+    return copy;
+}
+
+void batch_test_entry_free(struct batch_test_entry *params)
+{
+    free(params);
+}
+
+/* Set while a batch runs its calls, reply helpers then append to the batch response */
+static struct blob_buf *batch_test_batch_capture;
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf batch_test_reply_buf;
+
+int batch_test_get_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct batch_test_entry *reply)
+{
+    void *tbl;
+    int ret;
+
+    if (batch_test_batch_capture) {
+        tbl = blobmsg_open_table(batch_test_batch_capture, "reply");
+        ret = batch_test_entry_serialize(batch_test_batch_capture, reply);
+        blobmsg_close_table(batch_test_batch_capture, tbl);
+        return ret;
+    }
+
+    blob_buf_init(&batch_test_reply_buf, 0);
+    ret = batch_test_entry_serialize(&batch_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, batch_test_reply_buf.head);
+}
+
+int batch_test_commit_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct batch_test_entry *reply)
+{
+    void *tbl;
+    int ret;
+
+    if (batch_test_batch_capture) {
+        tbl = blobmsg_open_table(batch_test_batch_capture, "reply");
+        ret = batch_test_entry_serialize(batch_test_batch_capture, reply);
+        blobmsg_close_table(batch_test_batch_capture, tbl);
+        return ret;
+    }
+
+    blob_buf_init(&batch_test_reply_buf, 0);
+    ret = batch_test_entry_serialize(&batch_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, batch_test_reply_buf.head);
+}
+
+#ifndef BATCH_TEST_COMMIT_TIMEOUT_MS
+#define BATCH_TEST_COMMIT_TIMEOUT_MS 2000
+#endif
+
+static void batch_test_commit_async_timeout(struct uloop_timeout *t)
+{
+    struct batch_test_commit_async_ctx *actx = container_of(t, struct batch_test_commit_async_ctx, timeout);
+
+    actx->timed_out = true;
+    ubus_complete_deferred_request(actx->ctx, &actx->req, UBUS_STATUS_TIMEOUT);
+}
+
+void batch_test_commit_complete(struct batch_test_commit_async_ctx *actx, int status, const struct batch_test_entry *reply)
+{
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        if (status == UBUS_STATUS_OK && reply) {
+            status = batch_test_commit_reply(actx->ctx, &actx->req, reply);
+        }
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+    }
+
+    free(actx->msg);
+    free(actx);
+}
+
+static int batch_test_commit_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct batch_test_commit_async_ctx *actx;
+    int ret;
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    actx->ctx = ctx;
+    ubus_defer_request(ctx, req, &actx->req);
+    actx->timeout.cb = batch_test_commit_async_timeout;
+    uloop_timeout_set(&actx->timeout, BATCH_TEST_COMMIT_TIMEOUT_MS);
+
+    // The handler owns the context on success and must call batch_test_commit_complete()
+    ret = batch_test_commit_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        batch_test_commit_complete(actx, ret, NULL);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static int batch_test_rename_thunk(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct batch_test_entry params;
+
+    if (batch_test_entry_deserialize(msg, &params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return entry_handler(ctx, obj, req, BATCH_TEST_METHOD_RENAME, &params);
+}
+
+static int batch_test_touch_thunk(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct batch_test_entry params;
+
+    if (batch_test_entry_deserialize(msg, &params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return entry_handler(ctx, obj, req, BATCH_TEST_METHOD_TOUCH, &params);
+}
+
+enum {
+    BATCH_TEST_BATCH_CALLS,
+    __BATCH_TEST_BATCH_MAX
+};
+
+static const struct blobmsg_policy batch_test_batch_policy[] = {
+    [BATCH_TEST_BATCH_CALLS] = { .name = "calls", .type = BLOBMSG_TYPE_ARRAY }
+};
+
+enum {
+    BATCH_TEST_BATCH_CALL_METHOD,
+    BATCH_TEST_BATCH_CALL_PARAMS,
+    __BATCH_TEST_BATCH_CALL_MAX
+};
+
+static const struct blobmsg_policy batch_test_batch_call_policy[] = {
+    [BATCH_TEST_BATCH_CALL_METHOD] = { .name = "method", .type = BLOBMSG_TYPE_STRING },
+    [BATCH_TEST_BATCH_CALL_PARAMS] = { .name = "params", .type = BLOBMSG_TYPE_TABLE }
+};
+
+static int batch_test_batch_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+static const struct ubus_method batch_test_methods[] = {
+    UBUS_METHOD("get", batch_test_get_handler, batch_test_get_policy),
+    UBUS_METHOD("set", batch_test_set_handler, batch_test_entry_policy),
+    UBUS_METHOD_NOARG("clear", batch_test_clear_handler),
+    UBUS_METHOD_NOARG("commit", batch_test_commit_async_dispatch),
+    UBUS_METHOD("rename", batch_test_rename_thunk, batch_test_entry_policy),
+    UBUS_METHOD("touch", batch_test_touch_thunk, batch_test_entry_policy),
+    UBUS_METHOD("batch", batch_test_batch_handler, batch_test_batch_policy)
+};
+
+static struct ubus_object_type batch_test_object_type =
+    UBUS_OBJECT_TYPE("batch_test", batch_test_methods);
+
+struct ubus_object batch_test_object = {
+    .name = "batch_test",
+    .type = &batch_test_object_type,
+    .methods = batch_test_methods,
+    .n_methods = ARRAY_SIZE(batch_test_methods),
+};
+
+/* Methods allowed inside a batch, ubusd only checks the ACL of the batch call */
+static const char *const batch_test_batch_allowed[] = {
+    "get",
+    "set",
+    "clear",
+    "rename",
+};
+
+static struct blob_buf batch_test_batch_buf;
+static struct blob_buf batch_test_batch_args;
+
+static const struct ubus_method *batch_test_batch_find(const char *name)
+{
+    size_t i;
+
+    for (i = 0; i < ARRAY_SIZE(batch_test_batch_allowed); i++) {
+        if (!strcmp(batch_test_batch_allowed[i], name)) {
+            break;
+        }
+    }
+    if (i == ARRAY_SIZE(batch_test_batch_allowed)) {
+        return NULL;
+    }
+
+    for (i = 0; i < ARRAY_SIZE(batch_test_methods); i++) {
+        if (!strcmp(batch_test_methods[i].name, name)) {
+            return &batch_test_methods[i];
+        }
+    }
+
+    return NULL;
+}
+
+static int batch_test_batch_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct blob_attr *tb[__BATCH_TEST_BATCH_MAX];
+    struct blob_attr *call_tb[__BATCH_TEST_BATCH_CALL_MAX];
+    struct ubus_request_data call_req;
+    const struct ubus_method *m;
+    struct blob_attr *cur;
+    void *results;
+    void *entry;
+    size_t rem;
+    int ret;
+
+    if (blobmsg_parse(batch_test_batch_policy, ARRAY_SIZE(batch_test_batch_policy), tb, blob_data(msg), blob_len(msg)) < 0 || !tb[BATCH_TEST_BATCH_CALLS]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    blob_buf_init(&batch_test_batch_buf, 0);
+    results = blobmsg_open_array(&batch_test_batch_buf, "results");
+
+    blobmsg_for_each_attr(cur, tb[BATCH_TEST_BATCH_CALLS], rem) {
+        entry = blobmsg_open_table(&batch_test_batch_buf, NULL);
+
+        if (blobmsg_type(cur) != BLOBMSG_TYPE_TABLE ||
+            blobmsg_parse(batch_test_batch_call_policy, ARRAY_SIZE(batch_test_batch_call_policy), call_tb, blobmsg_data(cur), blobmsg_data_len(cur)) < 0 ||
+            !call_tb[BATCH_TEST_BATCH_CALL_METHOD]) {
+            ret = UBUS_STATUS_INVALID_ARGUMENT;
+        } else if (!(m = batch_test_batch_find(blobmsg_get_string(call_tb[BATCH_TEST_BATCH_CALL_METHOD])))) {
+            ret = UBUS_STATUS_METHOD_NOT_FOUND;
+        } else {
+            // Handlers expect the bare params payload, as in a direct call
+            blob_buf_init(&batch_test_batch_args, 0);
+            if (call_tb[BATCH_TEST_BATCH_CALL_PARAMS]) {
+                blob_put_raw(&batch_test_batch_args, blobmsg_data(call_tb[BATCH_TEST_BATCH_CALL_PARAMS]),
+                             blobmsg_data_len(call_tb[BATCH_TEST_BATCH_CALL_PARAMS]));
+            }
+
+            // Inner calls get a request without peer, ubusd drops a reply sent on it
+            // instead of delivering it to the caller before the batch response
+            memset(&call_req, 0, sizeof(call_req));
+            call_req.fd = -1;
+            call_req.req_fd = -1;
+
+            batch_test_batch_capture = &batch_test_batch_buf;
+            ret = m->handler(ctx, obj, &call_req, m->name, batch_test_batch_args.head);
+            batch_test_batch_capture = NULL;
+        }
+
+        blobmsg_add_u32(&batch_test_batch_buf, "status", ret);
+        blobmsg_close_table(&batch_test_batch_buf, entry);
+    }
+
+    blobmsg_close_array(&batch_test_batch_buf, results);
+
+    return ubus_send_reply(ctx, req, batch_test_batch_buf.head);
+}
+
+void batch_test_object_cleanup(void)
+{
+    blob_buf_free(&batch_test_reply_buf);
+    blob_buf_free(&batch_test_batch_buf);
+    blob_buf_free(&batch_test_batch_args);
+}
@@ -0,0 +1,100 @@
+/* Generated from ubus IDL - batch_test */
+
+#ifndef __BATCH_TEST_OBJECT_H__
+#define __BATCH_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct batch_test_entry {
+    const char * key;
+    const char * value;
+    uint8_t has_fields;
+};
+#define BATCH_TEST_ENTRY_HAS_VALUE 0
+_Static_assert(sizeof(struct batch_test_entry) == UBUS_IDL_PACKED_SIZE(struct batch_test_entry, 2 * sizeof(const char *) + sizeof(uint8_t)),
+               "struct batch_test_entry has padding between members");
+
+struct batch_test_get_params {
+    const char * key;
+};
+_Static_assert(sizeof(struct batch_test_get_params) == UBUS_IDL_PACKED_SIZE(struct batch_test_get_params, sizeof(const char *)),
+               "struct batch_test_get_params has padding between members");
+
+enum {
+    BATCH_TEST_GET_KEY,
+    __BATCH_TEST_GET_MAX
+};
+
+enum {
+    BATCH_TEST_ENTRY_KEY,
+    BATCH_TEST_ENTRY_VALUE,
+    __BATCH_TEST_ENTRY_MAX
+};
+
+struct batch_test_commit_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    bool timed_out;
+    void *priv;
+};
+
+enum batch_test_method {
+    BATCH_TEST_METHOD_GET,
+    BATCH_TEST_METHOD_SET,
+    BATCH_TEST_METHOD_CLEAR,
+    BATCH_TEST_METHOD_COMMIT,
+    BATCH_TEST_METHOD_RENAME,
+    BATCH_TEST_METHOD_TOUCH,
+    __BATCH_TEST_METHOD_MAX
+};
+
+int batch_test_get_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int batch_test_set_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int batch_test_clear_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int batch_test_commit_handler(struct batch_test_commit_async_ctx *actx);
+/* Custom handlers, called by a generated thunk with the method and its decoded params */
+int entry_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, enum batch_test_method method, const struct batch_test_entry *params);
+
+int batch_test_get_deserialize(struct blob_attr *msg, struct batch_test_get_params *params);
+int batch_test_get_serialize(struct blob_buf *b, const struct batch_test_get_params *params);
+int batch_test_entry_deserialize(struct blob_attr *msg, struct batch_test_entry *params);
+int batch_test_entry_serialize(struct blob_buf *b, const struct batch_test_entry *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct batch_test_get_params *batch_test_get_dup(const struct batch_test_get_params *params);
+void batch_test_get_free(struct batch_test_get_params *params);
+struct batch_test_entry *batch_test_entry_dup(const struct batch_test_entry *params);
+void batch_test_entry_free(struct batch_test_entry *params);
+
+int batch_test_get_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct batch_test_entry *reply);
+int batch_test_commit_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct batch_test_entry *reply);
+
+void batch_test_commit_complete(struct batch_test_commit_async_ctx *actx, int status, const struct batch_test_entry *reply);
+
+extern struct ubus_object batch_test_object;
+
+void batch_test_object_cleanup(void);
+
+#endif /* __BATCH_TEST_OBJECT_H__ */
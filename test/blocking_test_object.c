@@ -0,0 +1,544 @@
+/* Generated from ubus IDL - blocking_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <pthread.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/eventfd.h>
+#include <unistd.h>
+#include "blocking_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+static const struct blobmsg_policy blocking_test_sleep_policy[] = {
+    [BLOCKING_TEST_SLEEP_MS] = { .name = "ms", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int blocking_test_sleep_deserialize(struct blob_attr *msg, struct blocking_test_sleep_params *params)
+{
+    struct blob_attr *tb_blocking_test_sleep[__BLOCKING_TEST_SLEEP_MAX];
+    if (blobmsg_parse(blocking_test_sleep_policy, ARRAY_SIZE(blocking_test_sleep_policy), tb_blocking_test_sleep, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_blocking_test_sleep[BLOCKING_TEST_SLEEP_MS]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->ms = blobmsg_get_u32(tb_blocking_test_sleep[BLOCKING_TEST_SLEEP_MS]);
+    return UBUS_STATUS_OK;
+}
+
+int blocking_test_sleep_serialize(struct blob_buf *b, const struct blocking_test_sleep_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "ms", params->ms);
+    return UBUS_STATUS_OK;
+}
+
+struct blocking_test_sleep_params *blocking_test_sleep_dup(const struct blocking_test_sleep_params *params)
+{
+    size_t len = sizeof(*params);
+    struct blocking_test_sleep_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void blocking_test_sleep_free(struct blocking_test_sleep_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy blocking_test_result_policy[] = {
+    [BLOCKING_TEST_RESULT_ELAPSED_MS] = { .name = "elapsed_ms", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int blocking_test_result_deserialize(struct blob_attr *msg, struct blocking_test_result *params)
+{
+    struct blob_attr *tb_blocking_test_result[__BLOCKING_TEST_RESULT_MAX];
+    if (blobmsg_parse(blocking_test_result_policy, ARRAY_SIZE(blocking_test_result_policy), tb_blocking_test_result, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_blocking_test_result[BLOCKING_TEST_RESULT_ELAPSED_MS]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->elapsed_ms = blobmsg_get_u32(tb_blocking_test_result[BLOCKING_TEST_RESULT_ELAPSED_MS]);
+    return UBUS_STATUS_OK;
+}
+
+int blocking_test_result_serialize(struct blob_buf *b, const struct blocking_test_result *params)
+{
+    UBUS_IDL_ADD(u32, b, "elapsed_ms", params->elapsed_ms);
+    return UBUS_STATUS_OK;
+}
+
+struct blocking_test_result *blocking_test_result_dup(const struct blocking_test_result *params)
+{
+    size_t len = sizeof(*params);
+    struct blocking_test_result *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void blocking_test_result_free(struct blocking_test_result *params)
+{
+    free(params);
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf blocking_test_reply_buf;
+
+int blocking_test_sleep_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct blocking_test_result *reply)
+{
+    int ret;
+
+    blob_buf_init(&blocking_test_reply_buf, 0);
+    ret = blocking_test_result_serialize(&blocking_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, blocking_test_reply_buf.head);
+}
+
+int blocking_test_ping_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct blocking_test_result *reply)
+{
+    int ret;
+
+    blob_buf_init(&blocking_test_reply_buf, 0);
+    ret = blocking_test_result_serialize(&blocking_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, blocking_test_reply_buf.head);
+}
+
+#ifndef BLOCKING_TEST_POOL_SIZE
+#define BLOCKING_TEST_POOL_SIZE 4
+#endif
+
+#ifndef BLOCKING_TEST_QUEUE_DEPTH
+#define BLOCKING_TEST_QUEUE_DEPTH 32
+#endif
+
+/* Job handed to the worker pool, the reply is serialized by the worker */
+struct blocking_test_job {
+    struct blocking_test_job *next;
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct blob_attr *msg;
+    int (*run)(struct blocking_test_job *job);
+    int status;
+    struct blob_buf reply;
+};
+
+/* Worker pool state, ubus is only touched from the uloop thread */
+static struct {
+    pthread_mutex_t lock;
+    pthread_cond_t cond;
+    pthread_t threads[BLOCKING_TEST_POOL_SIZE];
+    int n_threads;
+    struct blocking_test_job *pending;
+    struct blocking_test_job *pending_tail;
+    struct blocking_test_job *done;
+    struct blocking_test_job *done_tail;
+    int queued;
+    struct uloop_fd efd;
+    bool started;
+    bool stopping;
+} blocking_test_pool = {
+    .lock = PTHREAD_MUTEX_INITIALIZER,
+    .cond = PTHREAD_COND_INITIALIZER,
+    .efd = { .fd = -1 },
+};
+
+static void blocking_test_job_append(struct blocking_test_job **head, struct blocking_test_job **tail, struct blocking_test_job *job)
+{
+    job->next = NULL;
+    if (*tail) {
+        (*tail)->next = job;
+    } else {
+        *head = job;
+    }
+    *tail = job;
+}
+
+static void blocking_test_job_free(struct blocking_test_job *job)
+{
+    blob_buf_free(&job->reply);
+    free(job->msg);
+    free(job);
+}
+
+static void *blocking_test_pool_worker(void *arg)
+{
+    struct blocking_test_job *job;
+    uint64_t one = 1;
+    ssize_t n;
+
+    (void)arg;
+
+    for (;;) {
+        pthread_mutex_lock(&blocking_test_pool.lock);
+        while (!blocking_test_pool.pending && !blocking_test_pool.stopping) {
+            pthread_cond_wait(&blocking_test_pool.cond, &blocking_test_pool.lock);
+        }
+        if (blocking_test_pool.stopping) {
+            pthread_mutex_unlock(&blocking_test_pool.lock);
+            break;
+        }
+        job = blocking_test_pool.pending;
+        blocking_test_pool.pending = job->next;
+        if (!blocking_test_pool.pending) {
+            blocking_test_pool.pending_tail = NULL;
+        }
+        pthread_mutex_unlock(&blocking_test_pool.lock);
+
+        job->status = job->run(job);
+
+        pthread_mutex_lock(&blocking_test_pool.lock);
+        blocking_test_job_append(&blocking_test_pool.done, &blocking_test_pool.done_tail, job);
+        pthread_mutex_unlock(&blocking_test_pool.lock);
+
+        // Wake the uloop thread to send the reply
+        n = write(blocking_test_pool.efd.fd, &one, sizeof(one));
+        (void)n;
+    }
+
+    return NULL;
+}
+
+static void blocking_test_pool_done_cb(struct uloop_fd *fd, unsigned int events)
+{
+    struct blocking_test_job *job;
+    struct blocking_test_job *next;
+    uint64_t count;
+    ssize_t n;
+
+    (void)events;
+
+    n = read(fd->fd, &count, sizeof(count));
+    (void)n;
+
+    pthread_mutex_lock(&blocking_test_pool.lock);
+    job = blocking_test_pool.done;
+    blocking_test_pool.done = NULL;
+    blocking_test_pool.done_tail = NULL;
+    pthread_mutex_unlock(&blocking_test_pool.lock);
+
+    for (; job; job = next) {
+        next = job->next;
+        if (job->status == UBUS_STATUS_OK && job->reply.head) {
+            ubus_send_reply(job->ctx, &job->req, job->reply.head);
+        }
+        ubus_complete_deferred_request(job->ctx, &job->req, job->status);
+        blocking_test_pool.queued--;
+        blocking_test_job_free(job);
+    }
+}
+
+static void blocking_test_pool_stop(void)
+{
+    struct blocking_test_job *job;
+    struct blocking_test_job *next;
+    int i;
+
+    if (!blocking_test_pool.started) {
+        return;
+    }
+
+    pthread_mutex_lock(&blocking_test_pool.lock);
+    blocking_test_pool.stopping = true;
+    pthread_cond_broadcast(&blocking_test_pool.cond);
+    pthread_mutex_unlock(&blocking_test_pool.lock);
+
+    for (i = 0; i < blocking_test_pool.n_threads; i++) {
+        pthread_join(blocking_test_pool.threads[i], NULL);
+    }
+    blocking_test_pool.n_threads = 0;
+
+    uloop_fd_delete(&blocking_test_pool.efd);
+    close(blocking_test_pool.efd.fd);
+    blocking_test_pool.efd.fd = -1;
+
+    // Finished jobs still get their result, the callers of jobs that never ran
+    // get an error instead of waiting for their timeout
+    for (job = blocking_test_pool.done; job; job = next) {
+        next = job->next;
+        if (job->status == UBUS_STATUS_OK && job->reply.head) {
+            ubus_send_reply(job->ctx, &job->req, job->reply.head);
+        }
+        ubus_complete_deferred_request(job->ctx, &job->req, job->status);
+        blocking_test_job_free(job);
+    }
+    for (job = blocking_test_pool.pending; job; job = next) {
+        next = job->next;
+        ubus_complete_deferred_request(job->ctx, &job->req, UBUS_STATUS_UNKNOWN_ERROR);
+        blocking_test_job_free(job);
+    }
+    blocking_test_pool.pending = NULL;
+    blocking_test_pool.pending_tail = NULL;
+    blocking_test_pool.done = NULL;
+    blocking_test_pool.done_tail = NULL;
+    blocking_test_pool.queued = 0;
+    blocking_test_pool.started = false;
+}
+
+static int blocking_test_pool_start(void)
+{
+    int fd;
+    int i;
+
+    if (blocking_test_pool.started) {
+        return 0;
+    }
+
+    fd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    if (fd < 0) {
+        return -1;
+    }
+
+    blocking_test_pool.efd.fd = fd;
+    blocking_test_pool.efd.cb = blocking_test_pool_done_cb;
+    uloop_fd_add(&blocking_test_pool.efd, ULOOP_READ);
+    blocking_test_pool.stopping = false;
+    blocking_test_pool.started = true;
+
+    for (i = 0; i < BLOCKING_TEST_POOL_SIZE; i++) {
+        if (pthread_create(&blocking_test_pool.threads[i], NULL, blocking_test_pool_worker, NULL) != 0) {
+            break;
+        }
+        blocking_test_pool.n_threads++;
+    }
+
+    // Run with fewer workers if some failed to start, but not with none
+    if (blocking_test_pool.n_threads == 0) {
+        blocking_test_pool_stop();
+        return -1;
+    }
+
+    return 0;
+}
+
+static void blocking_test_pool_submit(struct blocking_test_job *job)
+{
+    blocking_test_pool.queued++;
+
+    pthread_mutex_lock(&blocking_test_pool.lock);
+    blocking_test_job_append(&blocking_test_pool.pending, &blocking_test_pool.pending_tail, job);
+    pthread_cond_signal(&blocking_test_pool.cond);
+    pthread_mutex_unlock(&blocking_test_pool.lock);
+}
+
+struct blocking_test_sleep_job {
+    struct blocking_test_job base;
+    struct blocking_test_sleep_params params;
+};
+
+/* Runs on a worker thread */
+static int blocking_test_sleep_job_run(struct blocking_test_job *job)
+{
+    struct blocking_test_sleep_job *mjob = container_of(job, struct blocking_test_sleep_job, base);
+    struct blocking_test_result reply;
+    int ret;
+
+    memset(&reply, 0, sizeof(reply));
+    ret = blocking_test_sleep_handler(&mjob->params, &reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    blob_buf_init(&job->reply, 0);
+    return blocking_test_result_serialize(&job->reply, &reply);
+}
+
+static int blocking_test_sleep_blocking_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct blocking_test_sleep_job *mjob;
+
+    if (blocking_test_pool_start() != 0) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Refuse new work instead of queueing without bound
+    if (blocking_test_pool.queued >= BLOCKING_TEST_QUEUE_DEPTH) {
+        return UBUS_STATUS_NO_MEMORY;
+    }
+
+    mjob = calloc(1, sizeof(*mjob));
+    if (!mjob) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy for the worker
+    mjob->base.msg = blob_memdup(msg);
+    if (!mjob->base.msg) {
+        free(mjob);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    if (blocking_test_sleep_deserialize(mjob->base.msg, &mjob->params) != UBUS_STATUS_OK) {
+        free(mjob->base.msg);
+        free(mjob);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    mjob->base.ctx = ctx;
+    mjob->base.run = blocking_test_sleep_job_run;
+    ubus_defer_request(ctx, req, &mjob->base.req);
+    blocking_test_pool_submit(&mjob->base);
+
+    return UBUS_STATUS_OK;
+}
+
+struct blocking_test_sync_flash_job {
+    struct blocking_test_job base;
+};
+
+/* Runs on a worker thread */
+static int blocking_test_sync_flash_job_run(struct blocking_test_job *job)
+{
+    (void)job;
+
+    return blocking_test_sync_flash_handler();
+}
+
+static int blocking_test_sync_flash_blocking_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct blocking_test_sync_flash_job *mjob;
+
+    if (blocking_test_pool_start() != 0) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Refuse new work instead of queueing without bound
+    if (blocking_test_pool.queued >= BLOCKING_TEST_QUEUE_DEPTH) {
+        return UBUS_STATUS_NO_MEMORY;
+    }
+
+    mjob = calloc(1, sizeof(*mjob));
+    if (!mjob) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    mjob->base.ctx = ctx;
+    mjob->base.run = blocking_test_sync_flash_job_run;
+    ubus_defer_request(ctx, req, &mjob->base.req);
+    blocking_test_pool_submit(&mjob->base);
+
+    return UBUS_STATUS_OK;
+}
+
+struct blocking_test_replay_job {
+    struct blocking_test_job base;
+    struct blocking_test_result params;
+};
+
+/* Runs on a worker thread */
+static int blocking_test_replay_job_run(struct blocking_test_job *job)
+{
+    struct blocking_test_replay_job *mjob = container_of(job, struct blocking_test_replay_job, base);
+
+    return replay_handler(&mjob->params);
+}
+
+static int blocking_test_replay_blocking_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct blocking_test_replay_job *mjob;
+
+    if (blocking_test_pool_start() != 0) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Refuse new work instead of queueing without bound
+    if (blocking_test_pool.queued >= BLOCKING_TEST_QUEUE_DEPTH) {
+        return UBUS_STATUS_NO_MEMORY;
+    }
+
+    mjob = calloc(1, sizeof(*mjob));
+    if (!mjob) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy for the worker
+    mjob->base.msg = blob_memdup(msg);
+    if (!mjob->base.msg) {
+        free(mjob);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    if (blocking_test_result_deserialize(mjob->base.msg, &mjob->params) != UBUS_STATUS_OK) {
+        free(mjob->base.msg);
+        free(mjob);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    mjob->base.ctx = ctx;
+    mjob->base.run = blocking_test_replay_job_run;
+    ubus_defer_request(ctx, req, &mjob->base.req);
+    blocking_test_pool_submit(&mjob->base);
+
+    return UBUS_STATUS_OK;
+}
+
+static const struct ubus_method blocking_test_methods[] = {
+    UBUS_METHOD("sleep", blocking_test_sleep_blocking_dispatch, blocking_test_sleep_policy),
+    UBUS_METHOD_NOARG("sync_flash", blocking_test_sync_flash_blocking_dispatch),
+    UBUS_METHOD("replay", blocking_test_replay_blocking_dispatch, blocking_test_result_policy),
+    UBUS_METHOD_NOARG("ping", blocking_test_ping_handler)
+};
+
+static struct ubus_object_type blocking_test_object_type =
+    UBUS_OBJECT_TYPE("blocking_test", blocking_test_methods);
+
+struct ubus_object blocking_test_object = {
+    .name = "blocking_test",
+    .type = &blocking_test_object_type,
+    .methods = blocking_test_methods,
+    .n_methods = ARRAY_SIZE(blocking_test_methods),
+};
+
+void blocking_test_object_cleanup(void)
+{
+    blob_buf_free(&blocking_test_reply_buf);
+    blocking_test_pool_stop();
+}
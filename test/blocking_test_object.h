@@ -0,0 +1,73 @@
+/* Generated from ubus IDL - blocking_test */
+
+#ifndef __BLOCKING_TEST_OBJECT_H__
+#define __BLOCKING_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct blocking_test_result {
+    int32_t elapsed_ms;
+};
+_Static_assert(sizeof(struct blocking_test_result) == UBUS_IDL_PACKED_SIZE(struct blocking_test_result, sizeof(int32_t)),
+               "struct blocking_test_result has padding between members");
+
+struct blocking_test_sleep_params {
+    int32_t ms;
+};
+_Static_assert(sizeof(struct blocking_test_sleep_params) == UBUS_IDL_PACKED_SIZE(struct blocking_test_sleep_params, sizeof(int32_t)),
+               "struct blocking_test_sleep_params has padding between members");
+
+enum {
+    BLOCKING_TEST_SLEEP_MS,
+    __BLOCKING_TEST_SLEEP_MAX
+};
+
+enum {
+    BLOCKING_TEST_RESULT_ELAPSED_MS,
+    __BLOCKING_TEST_RESULT_MAX
+};
+
+int blocking_test_sleep_handler(const struct blocking_test_sleep_params *params, struct blocking_test_result *reply);
+int blocking_test_sync_flash_handler(void);
+int replay_handler(const struct blocking_test_result *params);
+int blocking_test_ping_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+int blocking_test_sleep_deserialize(struct blob_attr *msg, struct blocking_test_sleep_params *params);
+int blocking_test_sleep_serialize(struct blob_buf *b, const struct blocking_test_sleep_params *params);
+int blocking_test_result_deserialize(struct blob_attr *msg, struct blocking_test_result *params);
+int blocking_test_result_serialize(struct blob_buf *b, const struct blocking_test_result *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct blocking_test_sleep_params *blocking_test_sleep_dup(const struct blocking_test_sleep_params *params);
+void blocking_test_sleep_free(struct blocking_test_sleep_params *params);
+struct blocking_test_result *blocking_test_result_dup(const struct blocking_test_result *params);
+void blocking_test_result_free(struct blocking_test_result *params);
+
+int blocking_test_sleep_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct blocking_test_result *reply);
+int blocking_test_ping_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct blocking_test_result *reply);
+
+extern struct ubus_object blocking_test_object;
+
+void blocking_test_object_cleanup(void);
+
+#endif /* __BLOCKING_TEST_OBJECT_H__ */
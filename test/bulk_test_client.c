@@ -0,0 +1,630 @@
+/* Generated from ubus IDL - bulk_test client */
+
+#include <libubox/blobmsg.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+#include "bulk_test_client.h"
+
+static const struct blobmsg_policy bulk_test_client_remove_policy[] = {
+    { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+};
+
+/* Drop the cached object id, the next call looks the object up again */
+static void bulk_test_client_forget(struct bulk_test_client *client)
+{
+    client->id = 0;
+}
+
+static int bulk_test_client_resolve(struct bulk_test_client *client)
+{
+    int ret;
+
+    if (client->id) {
+        return UBUS_STATUS_OK;
+    }
+
+    ret = ubus_lookup_id(client->ctx, "bulk_test", &client->id);
+    if (ret != UBUS_STATUS_OK) {
+        client->id = 0;
+        return ret;
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static void bulk_test_client_remove_cb(struct ubus_context *ctx, struct ubus_event_handler *ev, const char *type, struct blob_attr *msg)
+{
+    struct bulk_test_client *client = container_of(ev, struct bulk_test_client, remove_ev);
+    struct blob_attr *tb[ARRAY_SIZE(bulk_test_client_remove_policy)];
+
+    blobmsg_parse(bulk_test_client_remove_policy, ARRAY_SIZE(bulk_test_client_remove_policy), tb, blob_data(msg), blob_len(msg));
+
+    if (tb[0] && blobmsg_get_u32(tb[0]) == client->id) {
+        bulk_test_client_forget(client);
+    }
+}
+
+static void bulk_test_client_data_cb(struct ubus_request *req, int type, struct blob_attr *msg)
+{
+    struct bulk_test_client *client = req->priv;
+
+    // The reply is only valid during the callback, keep a copy for the deserializer
+    free(client->reply_msg);
+    client->reply_msg = msg ? blob_memdup(msg) : NULL;
+}
+
+static void bulk_test_client_fd_cb(struct ubus_request *req, int fd)
+{
+    struct bulk_test_client *client = req->priv;
+
+    // fd of a @bulk reply field, mapped by the call stub after decoding the reply
+    if (client->reply_fd >= 0) {
+        close(client->reply_fd);
+    }
+    client->reply_fd = fd;
+}
+
+/* Send the request with fd (closed here, -1 for none) and keep the reply fd */
+static int bulk_test_client_invoke(struct bulk_test_client *client, const char *method, int fd, int timeout)
+{
+    struct ubus_request req;
+    int req_fd;
+    int retry;
+    int ret;
+
+    free(client->reply_msg);
+    client->reply_msg = NULL;
+    if (client->reply_fd >= 0) {
+        close(client->reply_fd);
+        client->reply_fd = -1;
+    }
+
+    for (retry = 0; retry < 2; retry++) {
+        ret = bulk_test_client_resolve(client);
+        if (ret != UBUS_STATUS_OK) {
+            break;
+        }
+
+        // libubus closes the fd it sends, every attempt passes its own copy
+        req_fd = fd >= 0 ? dup(fd) : -1;
+        if (fd >= 0 && req_fd < 0) {
+            ret = UBUS_STATUS_SYSTEM_ERROR;
+            break;
+        }
+
+        ret = ubus_invoke_async_fd(client->ctx, client->id, method, client->buf.head, &req, req_fd);
+        if (ret == UBUS_STATUS_OK) {
+            req.data_cb = bulk_test_client_data_cb;
+            req.fd_cb = bulk_test_client_fd_cb;
+            req.priv = client;
+            ret = ubus_complete_request(client->ctx, &req, timeout);
+        }
+
+        // The object was re-registered before the remove event arrived, look it up again
+        if (ret != UBUS_STATUS_NOT_FOUND) {
+            break;
+        }
+        bulk_test_client_forget(client);
+    }
+
+    if (fd >= 0) {
+        close(fd);
+    }
+
+    return ret;
+}
+
+/* Pipelined request, queued until the in-flight cap allows sending it */
+struct bulk_test_client_async {
+    struct list_head list;
+    struct bulk_test_client *client;
+    struct ubus_request req;
+    struct uloop_timeout timeout;
+    const char *method;
+    struct blob_attr *msg;
+    struct blob_attr *reply_msg;
+    int fd;
+    int reply_fd;
+    int timeout_ms;
+    void (*complete)(struct bulk_test_client_async *areq, int status);
+    void (*cb)(void);
+    void *priv;
+};
+
+static void bulk_test_client_async_free(struct bulk_test_client_async *areq)
+{
+    if (areq->fd >= 0) {
+        close(areq->fd);
+    }
+    if (areq->reply_fd >= 0) {
+        close(areq->reply_fd);
+    }
+    free(areq->msg);
+    free(areq->reply_msg);
+    free(areq);
+}
+
+static void bulk_test_client_async_finish(struct bulk_test_client_async *areq, int status)
+{
+    if (status == UBUS_STATUS_NOT_FOUND) {
+        bulk_test_client_forget(areq->client);
+    }
+
+    areq->complete(areq, status);
+    bulk_test_client_async_free(areq);
+}
+
+static void bulk_test_client_async_kick(struct bulk_test_client *client);
+
+static void bulk_test_client_async_data_cb(struct ubus_request *req, int type, struct blob_attr *msg)
+{
+    struct bulk_test_client_async *areq = req->priv;
+
+    free(areq->reply_msg);
+    areq->reply_msg = msg ? blob_memdup(msg) : NULL;
+}
+
+static void bulk_test_client_async_fd_cb(struct ubus_request *req, int fd)
+{
+    struct bulk_test_client_async *areq = req->priv;
+
+    if (areq->reply_fd >= 0) {
+        close(areq->reply_fd);
+    }
+    areq->reply_fd = fd;
+}
+
+static void bulk_test_client_async_complete_cb(struct ubus_request *req, int ret)
+{
+    struct bulk_test_client_async *areq = req->priv;
+    struct bulk_test_client *client = areq->client;
+
+    uloop_timeout_cancel(&areq->timeout);
+    list_del(&areq->list);
+    client->n_active--;
+
+    bulk_test_client_async_finish(areq, ret);
+    bulk_test_client_async_kick(client);
+}
+
+static void bulk_test_client_async_timeout_cb(struct uloop_timeout *t)
+{
+    struct bulk_test_client_async *areq = container_of(t, struct bulk_test_client_async, timeout);
+    struct bulk_test_client *client = areq->client;
+
+    // Aborting does not run the complete callback, finish the request here
+    ubus_abort_request(client->ctx, &areq->req);
+    list_del(&areq->list);
+    client->n_active--;
+
+    bulk_test_client_async_finish(areq, UBUS_STATUS_TIMEOUT);
+    bulk_test_client_async_kick(client);
+}
+
+static int bulk_test_client_async_start(struct bulk_test_client *client, struct bulk_test_client_async *areq)
+{
+    int ret;
+
+    ret = bulk_test_client_resolve(client);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    // Sending consumes the fd, whatever the outcome
+    ret = ubus_invoke_async_fd(client->ctx, client->id, areq->method, areq->msg, &areq->req, areq->fd);
+    areq->fd = -1;
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    areq->req.data_cb = bulk_test_client_async_data_cb;
+    areq->req.fd_cb = bulk_test_client_async_fd_cb;
+    areq->req.complete_cb = bulk_test_client_async_complete_cb;
+    areq->req.priv = areq;
+    ubus_complete_request_async(client->ctx, &areq->req);
+
+    if (areq->timeout_ms > 0) {
+        areq->timeout.cb = bulk_test_client_async_timeout_cb;
+        uloop_timeout_set(&areq->timeout, areq->timeout_ms);
+    }
+
+    list_add_tail(&areq->list, &client->active);
+    client->n_active++;
+
+    return UBUS_STATUS_OK;
+}
+
+/* Send queued requests while the in-flight cap allows it */
+static void bulk_test_client_async_kick(struct bulk_test_client *client)
+{
+    struct bulk_test_client_async *areq;
+    int ret;
+
+    while (client->n_active < client->max_inflight && !list_empty(&client->queued)) {
+        areq = list_first_entry(&client->queued, struct bulk_test_client_async, list);
+        list_del(&areq->list);
+
+        ret = bulk_test_client_async_start(client, areq);
+        if (ret != UBUS_STATUS_OK) {
+            bulk_test_client_async_finish(areq, ret);
+        }
+    }
+}
+
+static int bulk_test_client_async_submit(struct bulk_test_client *client, const char *method, int fd, int cache_method, void (*complete)(struct bulk_test_client_async *areq, int status), void (*cb)(void), void *priv, int timeout)
+{
+    struct bulk_test_client_async *areq;
+
+    (void)cache_method;
+
+    areq = calloc(1, sizeof(*areq));
+    if (!areq) {
+        if (fd >= 0) {
+            close(fd);
+        }
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    areq->client = client;
+    areq->method = method;
+    areq->fd = fd;
+    areq->reply_fd = -1;
+    areq->timeout_ms = timeout;
+    areq->complete = complete;
+    areq->cb = cb;
+    areq->priv = priv;
+
+    // The request buffer is reused by the next call, keep a copy until it is sent
+    areq->msg = blob_memdup(client->buf.head);
+    if (!areq->msg) {
+        bulk_test_client_async_free(areq);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    list_add_tail(&areq->list, &client->queued);
+
+    bulk_test_client_async_kick(client);
+
+    return UBUS_STATUS_OK;
+}
+
+int bulk_test_client_init(struct bulk_test_client *client, struct ubus_context *ctx)
+{
+    memset(client, 0, sizeof(*client));
+    client->ctx = ctx;
+    client->reply_fd = -1;
+    client->remove_ev.cb = bulk_test_client_remove_cb;
+    INIT_LIST_HEAD(&client->queued);
+    INIT_LIST_HEAD(&client->active);
+    client->max_inflight = BULK_TEST_CLIENT_MAX_INFLIGHT;
+
+    return ubus_register_event_handler(ctx, &client->remove_ev, "ubus.object.remove");
+}
+
+void bulk_test_client_free(struct bulk_test_client *client)
+{
+    struct bulk_test_client_async *areq;
+    struct bulk_test_client_async *tmp;
+
+    // Pending requests are dropped without running their callbacks
+    list_for_each_entry_safe(areq, tmp, &client->active, list) {
+        uloop_timeout_cancel(&areq->timeout);
+        ubus_abort_request(client->ctx, &areq->req);
+        list_del(&areq->list);
+        bulk_test_client_async_free(areq);
+    }
+    list_for_each_entry_safe(areq, tmp, &client->queued, list) {
+        list_del(&areq->list);
+        bulk_test_client_async_free(areq);
+    }
+    client->n_active = 0;
+
+    ubus_unregister_event_handler(client->ctx, &client->remove_ev);
+    blob_buf_free(&client->buf);
+    free(client->reply_msg);
+    client->reply_msg = NULL;
+    if (client->reply_fd >= 0) {
+        close(client->reply_fd);
+        client->reply_fd = -1;
+    }
+    client->id = 0;
+}
+
+int bulk_test_call_put(struct bulk_test_client *client, const struct bulk_test_put_params *params, struct bulk_test_image_info *reply, int timeout)
+{
+    int fd;
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = bulk_test_put_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    ret = bulk_test_put_bulk_fd(params, &fd);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = bulk_test_client_invoke(client, "put", fd, timeout);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    if (!client->reply_msg) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    // Strings in the reply point into the client and stay valid until its next call
+    return bulk_test_image_info_deserialize(client->reply_msg, reply);
+}
+
+int bulk_test_call_get(struct bulk_test_client *client, const struct bulk_test_get_params *params, struct bulk_test_image *reply, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = bulk_test_get_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = bulk_test_client_invoke(client, "get", -1, timeout);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    if (!client->reply_msg) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    // Strings in the reply point into the client and stay valid until its next call
+    ret = bulk_test_image_deserialize(client->reply_msg, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    // The @bulk data stays mapped until bulk_test_image_bulk_unmap(reply)
+    ret = bulk_test_image_bulk_map(reply, client->reply_fd);
+    client->reply_fd = -1;
+    return ret;
+}
+
+int bulk_test_call_capture(struct bulk_test_client *client, const struct bulk_test_capture_params *params, struct bulk_test_trace *reply, int timeout)
+{
+    int fd;
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = bulk_test_capture_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    ret = bulk_test_capture_bulk_fd(params, &fd);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = bulk_test_client_invoke(client, "capture", fd, timeout);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    if (!client->reply_msg) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    // Strings in the reply point into the client and stay valid until its next call
+    ret = bulk_test_trace_deserialize(client->reply_msg, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    // The @bulk data stays mapped until bulk_test_trace_bulk_unmap(reply)
+    ret = bulk_test_trace_bulk_map(reply, client->reply_fd);
+    client->reply_fd = -1;
+    return ret;
+}
+
+int bulk_test_call_store(struct bulk_test_client *client, const struct bulk_test_image *params, int timeout)
+{
+    int fd;
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = bulk_test_image_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    ret = bulk_test_image_bulk_fd(params, &fd);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return bulk_test_client_invoke(client, "store", fd, timeout);
+}
+
+int bulk_test_call_info(struct bulk_test_client *client, const struct bulk_test_info_params *params, struct bulk_test_image_info *reply, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = bulk_test_info_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = bulk_test_client_invoke(client, "info", -1, timeout);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    if (!client->reply_msg) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    // Strings in the reply point into the client and stay valid until its next call
+    return bulk_test_image_info_deserialize(client->reply_msg, reply);
+}
+
+static void bulk_test_call_put_async_complete(struct bulk_test_client_async *areq, int status)
+{
+    bulk_test_call_put_cb cb = (bulk_test_call_put_cb)areq->cb;
+    struct bulk_test_image_info reply;
+
+    memset(&reply, 0, sizeof(reply));
+    if (status == UBUS_STATUS_OK && !areq->reply_msg) {
+        status = UBUS_STATUS_NO_DATA;
+    }
+    if (status == UBUS_STATUS_OK) {
+        status = bulk_test_image_info_deserialize(areq->reply_msg, &reply);
+    }
+
+    // The reply is only valid during the callback
+    cb(areq->client, status, status == UBUS_STATUS_OK ? &reply : NULL, areq->priv);
+}
+
+int bulk_test_call_put_async(struct bulk_test_client *client, const struct bulk_test_put_params *params, bulk_test_call_put_cb cb, void *priv, int timeout)
+{
+    int fd;
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = bulk_test_put_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    ret = bulk_test_put_bulk_fd(params, &fd);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return bulk_test_client_async_submit(client, "put", fd, -1, bulk_test_call_put_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static void bulk_test_call_get_async_complete(struct bulk_test_client_async *areq, int status)
+{
+    bulk_test_call_get_cb cb = (bulk_test_call_get_cb)areq->cb;
+    struct bulk_test_image reply;
+
+    memset(&reply, 0, sizeof(reply));
+    if (status == UBUS_STATUS_OK && !areq->reply_msg) {
+        status = UBUS_STATUS_NO_DATA;
+    }
+    if (status == UBUS_STATUS_OK) {
+        status = bulk_test_image_deserialize(areq->reply_msg, &reply);
+    }
+    if (status == UBUS_STATUS_OK) {
+        status = bulk_test_image_bulk_map(&reply, areq->reply_fd);
+        areq->reply_fd = -1;
+    }
+
+    // The reply is only valid during the callback
+    cb(areq->client, status, status == UBUS_STATUS_OK ? &reply : NULL, areq->priv);
+    bulk_test_image_bulk_unmap(&reply);
+}
+
+int bulk_test_call_get_async(struct bulk_test_client *client, const struct bulk_test_get_params *params, bulk_test_call_get_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = bulk_test_get_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return bulk_test_client_async_submit(client, "get", -1, -1, bulk_test_call_get_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static void bulk_test_call_capture_async_complete(struct bulk_test_client_async *areq, int status)
+{
+    bulk_test_call_capture_cb cb = (bulk_test_call_capture_cb)areq->cb;
+    struct bulk_test_trace reply;
+
+    memset(&reply, 0, sizeof(reply));
+    if (status == UBUS_STATUS_OK && !areq->reply_msg) {
+        status = UBUS_STATUS_NO_DATA;
+    }
+    if (status == UBUS_STATUS_OK) {
+        status = bulk_test_trace_deserialize(areq->reply_msg, &reply);
+    }
+    if (status == UBUS_STATUS_OK) {
+        status = bulk_test_trace_bulk_map(&reply, areq->reply_fd);
+        areq->reply_fd = -1;
+    }
+
+    // The reply is only valid during the callback
+    cb(areq->client, status, status == UBUS_STATUS_OK ? &reply : NULL, areq->priv);
+    bulk_test_trace_bulk_unmap(&reply);
+}
+
+int bulk_test_call_capture_async(struct bulk_test_client *client, const struct bulk_test_capture_params *params, bulk_test_call_capture_cb cb, void *priv, int timeout)
+{
+    int fd;
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = bulk_test_capture_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    ret = bulk_test_capture_bulk_fd(params, &fd);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return bulk_test_client_async_submit(client, "capture", fd, -1, bulk_test_call_capture_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static void bulk_test_call_store_async_complete(struct bulk_test_client_async *areq, int status)
+{
+    bulk_test_call_store_cb cb = (bulk_test_call_store_cb)areq->cb;
+
+    cb(areq->client, status, areq->priv);
+}
+
+int bulk_test_call_store_async(struct bulk_test_client *client, const struct bulk_test_image *params, bulk_test_call_store_cb cb, void *priv, int timeout)
+{
+    int fd;
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = bulk_test_image_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    ret = bulk_test_image_bulk_fd(params, &fd);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return bulk_test_client_async_submit(client, "store", fd, -1, bulk_test_call_store_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static void bulk_test_call_info_async_complete(struct bulk_test_client_async *areq, int status)
+{
+    bulk_test_call_info_cb cb = (bulk_test_call_info_cb)areq->cb;
+    struct bulk_test_image_info reply;
+
+    memset(&reply, 0, sizeof(reply));
+    if (status == UBUS_STATUS_OK && !areq->reply_msg) {
+        status = UBUS_STATUS_NO_DATA;
+    }
+    if (status == UBUS_STATUS_OK) {
+        status = bulk_test_image_info_deserialize(areq->reply_msg, &reply);
+    }
+
+    // The reply is only valid during the callback
+    cb(areq->client, status, status == UBUS_STATUS_OK ? &reply : NULL, areq->priv);
+}
+
+int bulk_test_call_info_async(struct bulk_test_client *client, const struct bulk_test_info_params *params, bulk_test_call_info_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = bulk_test_info_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return bulk_test_client_async_submit(client, "info", -1, -1, bulk_test_call_info_async_complete, (void (*)(void))cb, priv, timeout);
+}
@@ -0,0 +1,48 @@
+/* Generated from ubus IDL - bulk_test client */
+
+#ifndef __BULK_TEST_CLIENT_H__
+#define __BULK_TEST_CLIENT_H__
+
+#include <libubus.h>
+#include "bulk_test_object.h"
+
+/* Default cap of pipelined requests in flight per client */
+#ifndef BULK_TEST_CLIENT_MAX_INFLIGHT
+#define BULK_TEST_CLIENT_MAX_INFLIGHT 16
+#endif
+
+struct bulk_test_client {
+    struct ubus_context *ctx;
+    uint32_t id;
+    struct ubus_event_handler remove_ev;
+    struct blob_buf buf;
+    struct blob_attr *reply_msg;
+    int reply_fd;
+    struct list_head queued;
+    struct list_head active;
+    unsigned int n_active;
+    unsigned int max_inflight;
+};
+
+typedef void (*bulk_test_call_put_cb)(struct bulk_test_client *client, int status, const struct bulk_test_image_info *reply, void *priv);
+typedef void (*bulk_test_call_get_cb)(struct bulk_test_client *client, int status, const struct bulk_test_image *reply, void *priv);
+typedef void (*bulk_test_call_capture_cb)(struct bulk_test_client *client, int status, const struct bulk_test_trace *reply, void *priv);
+typedef void (*bulk_test_call_store_cb)(struct bulk_test_client *client, int status, void *priv);
+typedef void (*bulk_test_call_info_cb)(struct bulk_test_client *client, int status, const struct bulk_test_image_info *reply, void *priv);
+
+int bulk_test_client_init(struct bulk_test_client *client, struct ubus_context *ctx);
+void bulk_test_client_free(struct bulk_test_client *client);
+
+int bulk_test_call_put(struct bulk_test_client *client, const struct bulk_test_put_params *params, struct bulk_test_image_info *reply, int timeout);
+int bulk_test_call_get(struct bulk_test_client *client, const struct bulk_test_get_params *params, struct bulk_test_image *reply, int timeout);
+int bulk_test_call_capture(struct bulk_test_client *client, const struct bulk_test_capture_params *params, struct bulk_test_trace *reply, int timeout);
+int bulk_test_call_store(struct bulk_test_client *client, const struct bulk_test_image *params, int timeout);
+int bulk_test_call_info(struct bulk_test_client *client, const struct bulk_test_info_params *params, struct bulk_test_image_info *reply, int timeout);
+
+int bulk_test_call_put_async(struct bulk_test_client *client, const struct bulk_test_put_params *params, bulk_test_call_put_cb cb, void *priv, int timeout);
+int bulk_test_call_get_async(struct bulk_test_client *client, const struct bulk_test_get_params *params, bulk_test_call_get_cb cb, void *priv, int timeout);
+int bulk_test_call_capture_async(struct bulk_test_client *client, const struct bulk_test_capture_params *params, bulk_test_call_capture_cb cb, void *priv, int timeout);
+int bulk_test_call_store_async(struct bulk_test_client *client, const struct bulk_test_image *params, bulk_test_call_store_cb cb, void *priv, int timeout);
+int bulk_test_call_info_async(struct bulk_test_client *client, const struct bulk_test_info_params *params, bulk_test_call_info_cb cb, void *priv, int timeout);
+
+#endif /* __BULK_TEST_CLIENT_H__ */
@@ -0,0 +1,877 @@
+/* Generated from ubus IDL - bulk_test */
+
+/* memfd_create() and the file sealing constants */
+#ifndef _GNU_SOURCE
+#define _GNU_SOURCE
+#endif
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <errno.h>
+#include <fcntl.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#include "bulk_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy data into a sealed memfd, whose fd goes along with the message */
+static int ubus_idl_bulk_seal(const char *name, const void *data, size_t len, int *fd)
+{
+    const char *p = data;
+    ssize_t n;
+    int mfd;
+
+    mfd = memfd_create(name, MFD_CLOEXEC | MFD_ALLOW_SEALING);
+    if (mfd < 0) {
+        return UBUS_STATUS_SYSTEM_ERROR;
+    }
+
+    while (len > 0) {
+        n = write(mfd, p, len);
+        if (n < 0 && errno == EINTR) {
+            continue;
+        }
+        if (n <= 0) {
+            close(mfd);
+            return UBUS_STATUS_SYSTEM_ERROR;
+        }
+        p += n;
+        len -= n;
+    }
+
+    // Sealed, the sender can no longer change or truncate what the receiver maps
+    if (fcntl(mfd, F_ADD_SEALS, F_SEAL_SHRINK | F_SEAL_GROW | F_SEAL_WRITE | F_SEAL_SEAL) < 0) {
+        close(mfd);
+        return UBUS_STATUS_SYSTEM_ERROR;
+    }
+
+    *fd = mfd;
+    return UBUS_STATUS_OK;
+}
+
+/* Map len bytes of a received memfd read-only, the fd is closed in all cases */
+static int ubus_idl_bulk_mmap(int fd, size_t len, const void **data)
+{
+    struct stat st;
+    void *addr;
+    int seals;
+
+    *data = NULL;
+    if (!len) {
+        if (fd >= 0) {
+            close(fd);
+        }
+        return UBUS_STATUS_OK;
+    }
+    if (fd < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    // Only a file that cannot shrink or change is safe to read without copying
+    seals = fcntl(fd, F_GET_SEALS);
+    if (seals < 0 || (seals & (F_SEAL_SHRINK | F_SEAL_WRITE)) != (F_SEAL_SHRINK | F_SEAL_WRITE) ||
+        fstat(fd, &st) < 0 || (uint64_t)st.st_size < len) {
+        close(fd);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    addr = mmap(NULL, len, PROT_READ, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (addr == MAP_FAILED) {
+        return UBUS_STATUS_SYSTEM_ERROR;
+    }
+
+    *data = addr;
+    return UBUS_STATUS_OK;
+}
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+/* Copy the mapped data of a @bulk field to the cursor of a *_dup() allocation */
+static const void *ubus_idl_dup_data(char **p, const void *data, size_t len)
+{
+    char *copy = *p;
+
+    memcpy(copy, data, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy bulk_test_put_policy[] = {
+    [BULK_TEST_PUT_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING },
+    [BULK_TEST_PUT_DATA] = { .name = "data", .type = BLOBMSG_TYPE_INT64 }
+};
+
+int bulk_test_put_deserialize(struct blob_attr *msg, struct bulk_test_put_params *params)
+{
+    struct blob_attr *tb_bulk_test_put[__BULK_TEST_PUT_MAX];
+    if (blobmsg_parse(bulk_test_put_policy, ARRAY_SIZE(bulk_test_put_policy), tb_bulk_test_put, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_bulk_test_put[BULK_TEST_PUT_NAME] || !tb_bulk_test_put[BULK_TEST_PUT_DATA]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->name = blobmsg_get_string(tb_bulk_test_put[BULK_TEST_PUT_NAME]);
+    if (blobmsg_get_u64(tb_bulk_test_put[BULK_TEST_PUT_DATA]) > SIZE_MAX) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    params->data.data = NULL;
+    params->data.len = blobmsg_get_u64(tb_bulk_test_put[BULK_TEST_PUT_DATA]);
+    return UBUS_STATUS_OK;
+}
+
+int bulk_test_put_serialize(struct blob_buf *b, const struct bulk_test_put_params *params)
+{
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    UBUS_IDL_ADD(u64, b, "data", params->data.len);
+    return UBUS_STATUS_OK;
+}
+
+/* Seal the data field into a new memfd, *fd stays -1 when there is nothing to send */
+int bulk_test_put_bulk_fd(const struct bulk_test_put_params *params, int *fd)
+{
+    *fd = -1;
+    if (!params->data.len) {
+        return UBUS_STATUS_OK;
+    }
+
+    return ubus_idl_bulk_seal("bulk_test_put.data", params->data.data, params->data.len, fd);
+}
+
+/* Map the data field of decoded params, takes ownership of fd */
+int bulk_test_put_bulk_map(struct bulk_test_put_params *params, int fd)
+{
+    return ubus_idl_bulk_mmap(fd, params->data.len, &params->data.data);
+}
+
+void bulk_test_put_bulk_unmap(struct bulk_test_put_params *params)
+{
+    if (params->data.data) {
+        munmap((void *)params->data.data, params->data.len);
+        params->data.data = NULL;
+    }
+}
+
+struct bulk_test_put_params *bulk_test_put_dup(const struct bulk_test_put_params *params)
+{
+    size_t len = sizeof(*params);
+    struct bulk_test_put_params *copy;
+    char *p;
+
+    if (params->data.data) {
+        len += params->data.len;
+    }
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->data.data = params->data.data ? ubus_idl_dup_data(&p, params->data.data, params->data.len) : NULL;
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void bulk_test_put_free(struct bulk_test_put_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy bulk_test_get_policy[] = {
+    [BULK_TEST_GET_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING }
+};
+
+int bulk_test_get_deserialize(struct blob_attr *msg, struct bulk_test_get_params *params)
+{
+    struct blob_attr *tb_bulk_test_get[__BULK_TEST_GET_MAX];
+    if (blobmsg_parse(bulk_test_get_policy, ARRAY_SIZE(bulk_test_get_policy), tb_bulk_test_get, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_bulk_test_get[BULK_TEST_GET_NAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->name = blobmsg_get_string(tb_bulk_test_get[BULK_TEST_GET_NAME]);
+    return UBUS_STATUS_OK;
+}
+
+int bulk_test_get_serialize(struct blob_buf *b, const struct bulk_test_get_params *params)
+{
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    return UBUS_STATUS_OK;
+}
+
+struct bulk_test_get_params *bulk_test_get_dup(const struct bulk_test_get_params *params)
+{
+    size_t len = sizeof(*params);
+    struct bulk_test_get_params *copy;
+    char *p;
+
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void bulk_test_get_free(struct bulk_test_get_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy bulk_test_capture_policy[] = {
+    [BULK_TEST_CAPTURE_PACKETS] = { .name = "packets", .type = BLOBMSG_TYPE_INT32 },
+    [BULK_TEST_CAPTURE_FILTER] = { .name = "filter", .type = BLOBMSG_TYPE_INT64 }
+};
+
+int bulk_test_capture_deserialize(struct blob_attr *msg, struct bulk_test_capture_params *params)
+{
+    struct blob_attr *tb_bulk_test_capture[__BULK_TEST_CAPTURE_MAX];
+    if (blobmsg_parse(bulk_test_capture_policy, ARRAY_SIZE(bulk_test_capture_policy), tb_bulk_test_capture, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_bulk_test_capture[BULK_TEST_CAPTURE_PACKETS]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->packets = blobmsg_get_u32(tb_bulk_test_capture[BULK_TEST_CAPTURE_PACKETS]);
+
+    params->filter.data = NULL;
+    params->filter.len = 0;
+    if (tb_bulk_test_capture[BULK_TEST_CAPTURE_FILTER]) {
+        if (blobmsg_get_u64(tb_bulk_test_capture[BULK_TEST_CAPTURE_FILTER]) > SIZE_MAX) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        params->filter.len = blobmsg_get_u64(tb_bulk_test_capture[BULK_TEST_CAPTURE_FILTER]);
+        UBUS_IDL_SET_FIELD(params, BULK_TEST_CAPTURE_HAS_FILTER);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int bulk_test_capture_serialize(struct blob_buf *b, const struct bulk_test_capture_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "packets", params->packets);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "filter", params->filter.len, params, FIELD, BULK_TEST_CAPTURE_HAS_FILTER);
+    return UBUS_STATUS_OK;
+}
+
+/* Seal the filter field into a new memfd, *fd stays -1 when there is nothing to send */
+int bulk_test_capture_bulk_fd(const struct bulk_test_capture_params *params, int *fd)
+{
+    *fd = -1;
+    if (!UBUS_IDL_HAS_FIELD(params, BULK_TEST_CAPTURE_HAS_FILTER)) {
+        return UBUS_STATUS_OK;
+    }
+    if (!params->filter.len) {
+        return UBUS_STATUS_OK;
+    }
+
+    return ubus_idl_bulk_seal("bulk_test_capture.filter", params->filter.data, params->filter.len, fd);
+}
+
+/* Map the filter field of decoded params, takes ownership of fd */
+int bulk_test_capture_bulk_map(struct bulk_test_capture_params *params, int fd)
+{
+    if (!UBUS_IDL_HAS_FIELD(params, BULK_TEST_CAPTURE_HAS_FILTER)) {
+        if (fd >= 0) {
+            close(fd);
+        }
+        return UBUS_STATUS_OK;
+    }
+
+    return ubus_idl_bulk_mmap(fd, params->filter.len, &params->filter.data);
+}
+
+void bulk_test_capture_bulk_unmap(struct bulk_test_capture_params *params)
+{
+    if (params->filter.data) {
+        munmap((void *)params->filter.data, params->filter.len);
+        params->filter.data = NULL;
+    }
+}
+
+struct bulk_test_capture_params *bulk_test_capture_dup(const struct bulk_test_capture_params *params)
+{
+    size_t len = sizeof(*params);
+    struct bulk_test_capture_params *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, BULK_TEST_CAPTURE_HAS_FILTER) && params->filter.data) {
+        len += params->filter.len;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->filter.data = UBUS_IDL_HAS_FIELD(params, BULK_TEST_CAPTURE_HAS_FILTER) && params->filter.data ? ubus_idl_dup_data(&p, params->filter.data, params->filter.len) : NULL;
+    return copy;
+}
+
+void bulk_test_capture_free(struct bulk_test_capture_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy bulk_test_image_policy[] = {
+    [BULK_TEST_IMAGE_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING },
+    [BULK_TEST_IMAGE_DATA] = { .name = "data", .type = BLOBMSG_TYPE_INT64 }
+};
+
+int bulk_test_image_deserialize(struct blob_attr *msg, struct bulk_test_image *params)
+{
+    struct blob_attr *tb_bulk_test_image[__BULK_TEST_IMAGE_MAX];
+    if (blobmsg_parse(bulk_test_image_policy, ARRAY_SIZE(bulk_test_image_policy), tb_bulk_test_image, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_bulk_test_image[BULK_TEST_IMAGE_NAME] || !tb_bulk_test_image[BULK_TEST_IMAGE_DATA]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->name = blobmsg_get_string(tb_bulk_test_image[BULK_TEST_IMAGE_NAME]);
+    if (blobmsg_get_u64(tb_bulk_test_image[BULK_TEST_IMAGE_DATA]) > SIZE_MAX) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    params->data.data = NULL;
+    params->data.len = blobmsg_get_u64(tb_bulk_test_image[BULK_TEST_IMAGE_DATA]);
+    return UBUS_STATUS_OK;
+}
+
+int bulk_test_image_serialize(struct blob_buf *b, const struct bulk_test_image *params)
+{
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    UBUS_IDL_ADD(u64, b, "data", params->data.len);
+    return UBUS_STATUS_OK;
+}
+
+/* Seal the data field into a new memfd, *fd stays -1 when there is nothing to send */
+int bulk_test_image_bulk_fd(const struct bulk_test_image *params, int *fd)
+{
+    *fd = -1;
+    if (!params->data.len) {
+        return UBUS_STATUS_OK;
+    }
+
+    return ubus_idl_bulk_seal("bulk_test_image.data", params->data.data, params->data.len, fd);
+}
+
+/* Map the data field of decoded params, takes ownership of fd */
+int bulk_test_image_bulk_map(struct bulk_test_image *params, int fd)
+{
+    return ubus_idl_bulk_mmap(fd, params->data.len, &params->data.data);
+}
+
+void bulk_test_image_bulk_unmap(struct bulk_test_image *params)
+{
+    if (params->data.data) {
+        munmap((void *)params->data.data, params->data.len);
+        params->data.data = NULL;
+    }
+}
+
+struct bulk_test_image *bulk_test_image_dup(const struct bulk_test_image *params)
+{
+    size_t len = sizeof(*params);
+    struct bulk_test_image *copy;
+    char *p;
+
+    if (params->data.data) {
+        len += params->data.len;
+    }
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->data.data = params->data.data ? ubus_idl_dup_data(&p, params->data.data, params->data.len) : NULL;
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void bulk_test_image_free(struct bulk_test_image *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy bulk_test_info_policy[] = {
+    [BULK_TEST_INFO_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING }
+};
+
+int bulk_test_info_deserialize(struct blob_attr *msg, struct bulk_test_info_params *params)
+{
+    struct blob_attr *tb_bulk_test_info[__BULK_TEST_INFO_MAX];
+    if (blobmsg_parse(bulk_test_info_policy, ARRAY_SIZE(bulk_test_info_policy), tb_bulk_test_info, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_bulk_test_info[BULK_TEST_INFO_NAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->name = blobmsg_get_string(tb_bulk_test_info[BULK_TEST_INFO_NAME]);
+    return UBUS_STATUS_OK;
+}
+
+int bulk_test_info_serialize(struct blob_buf *b, const struct bulk_test_info_params *params)
+{
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    return UBUS_STATUS_OK;
+}
+
+struct bulk_test_info_params *bulk_test_info_dup(const struct bulk_test_info_params *params)
+{
+    size_t len = sizeof(*params);
+    struct bulk_test_info_params *copy;
+    char *p;
+
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void bulk_test_info_free(struct bulk_test_info_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy bulk_test_image_info_policy[] = {
+    [BULK_TEST_IMAGE_INFO_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING },
+    [BULK_TEST_IMAGE_INFO_SIZE] = { .name = "size", .type = BLOBMSG_TYPE_INT64 },
+    [BULK_TEST_IMAGE_INFO_CHECKSUM] = { .name = "checksum", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int bulk_test_image_info_deserialize(struct blob_attr *msg, struct bulk_test_image_info *params)
+{
+    struct blob_attr *tb_bulk_test_image_info[__BULK_TEST_IMAGE_INFO_MAX];
+    if (blobmsg_parse(bulk_test_image_info_policy, ARRAY_SIZE(bulk_test_image_info_policy), tb_bulk_test_image_info, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_bulk_test_image_info[BULK_TEST_IMAGE_INFO_NAME] || !tb_bulk_test_image_info[BULK_TEST_IMAGE_INFO_SIZE] || !tb_bulk_test_image_info[BULK_TEST_IMAGE_INFO_CHECKSUM]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->name = blobmsg_get_string(tb_bulk_test_image_info[BULK_TEST_IMAGE_INFO_NAME]);
+    params->size = blobmsg_get_u64(tb_bulk_test_image_info[BULK_TEST_IMAGE_INFO_SIZE]);
+    params->checksum = blobmsg_get_u32(tb_bulk_test_image_info[BULK_TEST_IMAGE_INFO_CHECKSUM]);
+    return UBUS_STATUS_OK;
+}
+
+int bulk_test_image_info_serialize(struct blob_buf *b, const struct bulk_test_image_info *params)
+{
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    UBUS_IDL_ADD(u64, b, "size", params->size);
+    UBUS_IDL_ADD(u32, b, "checksum", params->checksum);
+    return UBUS_STATUS_OK;
+}
+
+struct bulk_test_image_info *bulk_test_image_info_dup(const struct bulk_test_image_info *params)
+{
+    size_t len = sizeof(*params);
+    struct bulk_test_image_info *copy;
+    char *p;
+
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void bulk_test_image_info_free(struct bulk_test_image_info *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy bulk_test_trace_policy[] = {
+    [BULK_TEST_TRACE_PACKETS] = { .name = "packets", .type = BLOBMSG_TYPE_INT32 },
+    [BULK_TEST_TRACE_PCAP] = { .name = "pcap", .type = BLOBMSG_TYPE_INT64 }
+};
+
+int bulk_test_trace_deserialize(struct blob_attr *msg, struct bulk_test_trace *params)
+{
+    struct blob_attr *tb_bulk_test_trace[__BULK_TEST_TRACE_MAX];
+    if (blobmsg_parse(bulk_test_trace_policy, ARRAY_SIZE(bulk_test_trace_policy), tb_bulk_test_trace, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_bulk_test_trace[BULK_TEST_TRACE_PACKETS]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->packets = blobmsg_get_u32(tb_bulk_test_trace[BULK_TEST_TRACE_PACKETS]);
+
+    params->pcap.data = NULL;
+    params->pcap.len = 0;
+    if (tb_bulk_test_trace[BULK_TEST_TRACE_PCAP]) {
+        if (blobmsg_get_u64(tb_bulk_test_trace[BULK_TEST_TRACE_PCAP]) > SIZE_MAX) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        params->pcap.len = blobmsg_get_u64(tb_bulk_test_trace[BULK_TEST_TRACE_PCAP]);
+        UBUS_IDL_SET_FIELD(params, BULK_TEST_TRACE_HAS_PCAP);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int bulk_test_trace_serialize(struct blob_buf *b, const struct bulk_test_trace *params)
+{
+    UBUS_IDL_ADD(u32, b, "packets", params->packets);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "pcap", params->pcap.len, params, FIELD, BULK_TEST_TRACE_HAS_PCAP);
+    return UBUS_STATUS_OK;
+}
+
+/* Seal the pcap field into a new memfd, *fd stays -1 when there is nothing to send */
+int bulk_test_trace_bulk_fd(const struct bulk_test_trace *params, int *fd)
+{
+    *fd = -1;
+    if (!UBUS_IDL_HAS_FIELD(params, BULK_TEST_TRACE_HAS_PCAP)) {
+        return UBUS_STATUS_OK;
+    }
+    if (!params->pcap.len) {
+        return UBUS_STATUS_OK;
+    }
+
+    return ubus_idl_bulk_seal("bulk_test_trace.pcap", params->pcap.data, params->pcap.len, fd);
+}
+
+/* Map the pcap field of decoded params, takes ownership of fd */
+int bulk_test_trace_bulk_map(struct bulk_test_trace *params, int fd)
+{
+    if (!UBUS_IDL_HAS_FIELD(params, BULK_TEST_TRACE_HAS_PCAP)) {
+        if (fd >= 0) {
+            close(fd);
+        }
+        return UBUS_STATUS_OK;
+    }
+
+    return ubus_idl_bulk_mmap(fd, params->pcap.len, &params->pcap.data);
+}
+
+void bulk_test_trace_bulk_unmap(struct bulk_test_trace *params)
+{
+    if (params->pcap.data) {
+        munmap((void *)params->pcap.data, params->pcap.len);
+        params->pcap.data = NULL;
+    }
+}
+
+struct bulk_test_trace *bulk_test_trace_dup(const struct bulk_test_trace *params)
+{
+    size_t len = sizeof(*params);
+    struct bulk_test_trace *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, BULK_TEST_TRACE_HAS_PCAP) && params->pcap.data) {
+        len += params->pcap.len;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->pcap.data = UBUS_IDL_HAS_FIELD(params, BULK_TEST_TRACE_HAS_PCAP) && params->pcap.data ? ubus_idl_dup_data(&p, params->pcap.data, params->pcap.len) : NULL;
+    return copy;
+}
+
+void bulk_test_trace_free(struct bulk_test_trace *params)
+{
+    free(params);
+}
+
+/* Server side, left out when only the client and the codecs are linked */
+#ifndef UBUS_IDL_CLIENT_ONLY
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf bulk_test_reply_buf;
+
+int bulk_test_put_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct bulk_test_image_info *reply)
+{
+    int ret;
+
+    blob_buf_init(&bulk_test_reply_buf, 0);
+    ret = bulk_test_image_info_serialize(&bulk_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, bulk_test_reply_buf.head);
+}
+
+int bulk_test_get_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct bulk_test_image *reply)
+{
+    int fd;
+    int ret;
+
+    blob_buf_init(&bulk_test_reply_buf, 0);
+    ret = bulk_test_image_serialize(&bulk_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = bulk_test_image_bulk_fd(reply, &fd);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = ubus_send_reply(ctx, req, bulk_test_reply_buf.head);
+    if (ret != UBUS_STATUS_OK) {
+        if (fd >= 0) {
+            close(fd);
+        }
+        return ret;
+    }
+
+    // libubus passes the fd with the status message that completes the request
+    if (fd >= 0) {
+        ubus_request_set_fd(ctx, req, fd);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int bulk_test_capture_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct bulk_test_trace *reply)
+{
+    int fd;
+    int ret;
+
+    blob_buf_init(&bulk_test_reply_buf, 0);
+    ret = bulk_test_trace_serialize(&bulk_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = bulk_test_trace_bulk_fd(reply, &fd);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = ubus_send_reply(ctx, req, bulk_test_reply_buf.head);
+    if (ret != UBUS_STATUS_OK) {
+        if (fd >= 0) {
+            close(fd);
+        }
+        return ret;
+    }
+
+    // libubus passes the fd with the status message that completes the request
+    if (fd >= 0) {
+        ubus_request_set_fd(ctx, req, fd);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int bulk_test_info_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct bulk_test_image_info *reply)
+{
+    int ret;
+
+    blob_buf_init(&bulk_test_reply_buf, 0);
+    ret = bulk_test_image_info_serialize(&bulk_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, bulk_test_reply_buf.head);
+}
+
+#ifndef BULK_TEST_CAPTURE_TIMEOUT_MS
+#define BULK_TEST_CAPTURE_TIMEOUT_MS 10000
+#endif
+
+static void bulk_test_capture_async_timeout(struct uloop_timeout *t)
+{
+    struct bulk_test_capture_async_ctx *actx = container_of(t, struct bulk_test_capture_async_ctx, timeout);
+
+    actx->timed_out = true;
+    ubus_complete_deferred_request(actx->ctx, &actx->req, UBUS_STATUS_TIMEOUT);
+}
+
+void bulk_test_capture_complete(struct bulk_test_capture_async_ctx *actx, int status, const struct bulk_test_trace *reply)
+{
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        if (status == UBUS_STATUS_OK && reply) {
+            status = bulk_test_capture_reply(actx->ctx, &actx->req, reply);
+        }
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+    }
+
+    bulk_test_capture_bulk_unmap(&actx->params);
+    free(actx->msg);
+    free(actx);
+}
+
+static int bulk_test_capture_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct bulk_test_capture_async_ctx *actx;
+    int ret;
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy beyond the handler call
+    actx->msg = blob_memdup(msg);
+    if (!actx->msg) {
+        free(actx);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    if (bulk_test_capture_deserialize(actx->msg, &actx->params) != UBUS_STATUS_OK) {
+        free(actx->msg);
+        free(actx);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    // libubus closes the caller fd when this function returns, the mapping outlives it
+    ret = bulk_test_capture_bulk_map(&actx->params, ubus_request_get_caller_fd(req));
+    if (ret != UBUS_STATUS_OK) {
+        free(actx->msg);
+        free(actx);
+        return ret;
+    }
+
+    actx->ctx = ctx;
+    ubus_defer_request(ctx, req, &actx->req);
+    actx->timeout.cb = bulk_test_capture_async_timeout;
+    uloop_timeout_set(&actx->timeout, BULK_TEST_CAPTURE_TIMEOUT_MS);
+
+    // The handler owns the context on success and must call bulk_test_capture_complete()
+    ret = bulk_test_capture_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        bulk_test_capture_complete(actx, ret, NULL);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static int bulk_test_store_thunk(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct bulk_test_image params;
+    int ret;
+
+    if (bulk_test_image_deserialize(msg, &params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    // Map the @bulk data sent by the caller, read-only until the handler returns
+    if (bulk_test_image_bulk_map(&params, ubus_request_get_caller_fd(req)) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    ret = store_image(ctx, obj, req, BULK_TEST_METHOD_STORE, &params);
+    bulk_test_image_bulk_unmap(&params);
+    return ret;
+}
+
+static const struct ubus_method bulk_test_methods[] = {
+    UBUS_METHOD("put", bulk_test_put_handler, bulk_test_put_policy),
+    UBUS_METHOD("get", bulk_test_get_handler, bulk_test_get_policy),
+    UBUS_METHOD("capture", bulk_test_capture_async_dispatch, bulk_test_capture_policy),
+    UBUS_METHOD("store", bulk_test_store_thunk, bulk_test_image_policy),
+    UBUS_METHOD("info", bulk_test_info_handler, bulk_test_info_policy)
+};
+
+static struct ubus_object_type bulk_test_object_type =
+    UBUS_OBJECT_TYPE("bulk_test", bulk_test_methods);
+
+struct ubus_object bulk_test_object = {
+    .name = "bulk_test",
+    .type = &bulk_test_object_type,
+    .methods = bulk_test_methods,
+    .n_methods = ARRAY_SIZE(bulk_test_methods),
+};
+
+void bulk_test_object_cleanup(void)
+{
+    blob_buf_free(&bulk_test_reply_buf);
+}
+
+#endif /* UBUS_IDL_CLIENT_ONLY */
@@ -0,0 +1,211 @@
+/* Generated from ubus IDL - bulk_test */
+
+#ifndef __BULK_TEST_OBJECT_H__
+#define __BULK_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+#ifndef UBUS_IDL_BULK
+#define UBUS_IDL_BULK
+/* Data of a @bulk field, passed in a sealed memfd next to the message and mapped read-only */
+struct ubus_idl_bulk {
+    const void *data;
+    size_t len;
+};
+#endif
+
+
+struct bulk_test_image {
+    const char * name;
+    struct ubus_idl_bulk data;
+};
+_Static_assert(sizeof(struct bulk_test_image) == UBUS_IDL_PACKED_SIZE(struct bulk_test_image, sizeof(const char *) + sizeof(struct ubus_idl_bulk)),
+               "struct bulk_test_image has padding between members");
+
+struct bulk_test_image_info {
+    int64_t size;
+    const char * name;
+    int32_t checksum;
+};
+_Static_assert(sizeof(struct bulk_test_image_info) == UBUS_IDL_PACKED_SIZE(struct bulk_test_image_info, sizeof(int64_t) + sizeof(const char *) + sizeof(int32_t)),
+               "struct bulk_test_image_info has padding between members");
+
+struct bulk_test_trace {
+    struct ubus_idl_bulk pcap;
+    int32_t packets;
+    uint8_t has_fields;
+};
+#define BULK_TEST_TRACE_HAS_PCAP 0
+_Static_assert(sizeof(struct bulk_test_trace) == UBUS_IDL_PACKED_SIZE(struct bulk_test_trace, sizeof(struct ubus_idl_bulk) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct bulk_test_trace has padding between members");
+
+struct bulk_test_put_params {
+    const char * name;
+    struct ubus_idl_bulk data;
+};
+_Static_assert(sizeof(struct bulk_test_put_params) == UBUS_IDL_PACKED_SIZE(struct bulk_test_put_params, sizeof(const char *) + sizeof(struct ubus_idl_bulk)),
+               "struct bulk_test_put_params has padding between members");
+
+struct bulk_test_get_params {
+    const char * name;
+};
+_Static_assert(sizeof(struct bulk_test_get_params) == UBUS_IDL_PACKED_SIZE(struct bulk_test_get_params, sizeof(const char *)),
+               "struct bulk_test_get_params has padding between members");
+
+struct bulk_test_capture_params {
+    struct ubus_idl_bulk filter;
+    int32_t packets;
+    uint8_t has_fields;
+};
+#define BULK_TEST_CAPTURE_HAS_FILTER 0
+_Static_assert(sizeof(struct bulk_test_capture_params) == UBUS_IDL_PACKED_SIZE(struct bulk_test_capture_params, sizeof(struct ubus_idl_bulk) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct bulk_test_capture_params has padding between members");
+
+struct bulk_test_info_params {
+    const char * name;
+};
+_Static_assert(sizeof(struct bulk_test_info_params) == UBUS_IDL_PACKED_SIZE(struct bulk_test_info_params, sizeof(const char *)),
+               "struct bulk_test_info_params has padding between members");
+
+enum {
+    BULK_TEST_PUT_NAME,
+    BULK_TEST_PUT_DATA,
+    __BULK_TEST_PUT_MAX
+};
+
+enum {
+    BULK_TEST_GET_NAME,
+    __BULK_TEST_GET_MAX
+};
+
+enum {
+    BULK_TEST_CAPTURE_PACKETS,
+    BULK_TEST_CAPTURE_FILTER,
+    __BULK_TEST_CAPTURE_MAX
+};
+
+enum {
+    BULK_TEST_IMAGE_NAME,
+    BULK_TEST_IMAGE_DATA,
+    __BULK_TEST_IMAGE_MAX
+};
+
+enum {
+    BULK_TEST_INFO_NAME,
+    __BULK_TEST_INFO_MAX
+};
+
+enum {
+    BULK_TEST_IMAGE_INFO_NAME,
+    BULK_TEST_IMAGE_INFO_SIZE,
+    BULK_TEST_IMAGE_INFO_CHECKSUM,
+    __BULK_TEST_IMAGE_INFO_MAX
+};
+
+enum {
+    BULK_TEST_TRACE_PACKETS,
+    BULK_TEST_TRACE_PCAP,
+    __BULK_TEST_TRACE_MAX
+};
+
+struct bulk_test_capture_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    struct bulk_test_capture_params params;
+    bool timed_out;
+    void *priv;
+};
+
+enum bulk_test_method {
+    BULK_TEST_METHOD_PUT,
+    BULK_TEST_METHOD_GET,
+    BULK_TEST_METHOD_CAPTURE,
+    BULK_TEST_METHOD_STORE,
+    BULK_TEST_METHOD_INFO,
+    __BULK_TEST_METHOD_MAX
+};
+
+int bulk_test_put_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int bulk_test_get_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int bulk_test_capture_handler(struct bulk_test_capture_async_ctx *actx);
+int bulk_test_info_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+/* Custom handlers, called by a generated thunk with the method and its decoded params */
+int store_image(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, enum bulk_test_method method, const struct bulk_test_image *params);
+
+int bulk_test_put_deserialize(struct blob_attr *msg, struct bulk_test_put_params *params);
+int bulk_test_put_serialize(struct blob_buf *b, const struct bulk_test_put_params *params);
+int bulk_test_get_deserialize(struct blob_attr *msg, struct bulk_test_get_params *params);
+int bulk_test_get_serialize(struct blob_buf *b, const struct bulk_test_get_params *params);
+int bulk_test_capture_deserialize(struct blob_attr *msg, struct bulk_test_capture_params *params);
+int bulk_test_capture_serialize(struct blob_buf *b, const struct bulk_test_capture_params *params);
+int bulk_test_image_deserialize(struct blob_attr *msg, struct bulk_test_image *params);
+int bulk_test_image_serialize(struct blob_buf *b, const struct bulk_test_image *params);
+int bulk_test_info_deserialize(struct blob_attr *msg, struct bulk_test_info_params *params);
+int bulk_test_info_serialize(struct blob_buf *b, const struct bulk_test_info_params *params);
+int bulk_test_image_info_deserialize(struct blob_attr *msg, struct bulk_test_image_info *params);
+int bulk_test_image_info_serialize(struct blob_buf *b, const struct bulk_test_image_info *params);
+int bulk_test_trace_deserialize(struct blob_attr *msg, struct bulk_test_trace *params);
+int bulk_test_trace_serialize(struct blob_buf *b, const struct bulk_test_trace *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct bulk_test_put_params *bulk_test_put_dup(const struct bulk_test_put_params *params);
+void bulk_test_put_free(struct bulk_test_put_params *params);
+struct bulk_test_get_params *bulk_test_get_dup(const struct bulk_test_get_params *params);
+void bulk_test_get_free(struct bulk_test_get_params *params);
+struct bulk_test_capture_params *bulk_test_capture_dup(const struct bulk_test_capture_params *params);
+void bulk_test_capture_free(struct bulk_test_capture_params *params);
+struct bulk_test_image *bulk_test_image_dup(const struct bulk_test_image *params);
+void bulk_test_image_free(struct bulk_test_image *params);
+struct bulk_test_info_params *bulk_test_info_dup(const struct bulk_test_info_params *params);
+void bulk_test_info_free(struct bulk_test_info_params *params);
+struct bulk_test_image_info *bulk_test_image_info_dup(const struct bulk_test_image_info *params);
+void bulk_test_image_info_free(struct bulk_test_image_info *params);
+struct bulk_test_trace *bulk_test_trace_dup(const struct bulk_test_trace *params);
+void bulk_test_trace_free(struct bulk_test_trace *params);
+
+int bulk_test_put_bulk_fd(const struct bulk_test_put_params *params, int *fd);
+int bulk_test_put_bulk_map(struct bulk_test_put_params *params, int fd);
+void bulk_test_put_bulk_unmap(struct bulk_test_put_params *params);
+int bulk_test_capture_bulk_fd(const struct bulk_test_capture_params *params, int *fd);
+int bulk_test_capture_bulk_map(struct bulk_test_capture_params *params, int fd);
+void bulk_test_capture_bulk_unmap(struct bulk_test_capture_params *params);
+int bulk_test_image_bulk_fd(const struct bulk_test_image *params, int *fd);
+int bulk_test_image_bulk_map(struct bulk_test_image *params, int fd);
+void bulk_test_image_bulk_unmap(struct bulk_test_image *params);
+int bulk_test_trace_bulk_fd(const struct bulk_test_trace *params, int *fd);
+int bulk_test_trace_bulk_map(struct bulk_test_trace *params, int fd);
+void bulk_test_trace_bulk_unmap(struct bulk_test_trace *params);
+
+int bulk_test_put_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct bulk_test_image_info *reply);
+int bulk_test_get_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct bulk_test_image *reply);
+int bulk_test_capture_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct bulk_test_trace *reply);
+int bulk_test_info_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct bulk_test_image_info *reply);
+
+void bulk_test_capture_complete(struct bulk_test_capture_async_ctx *actx, int status, const struct bulk_test_trace *reply);
+
+extern struct ubus_object bulk_test_object;
+
+void bulk_test_object_cleanup(void);
+
+#endif /* __BULK_TEST_OBJECT_H__ */
@@ -0,0 +1,1167 @@
+/* Generated from ubus IDL - cache_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <time.h>
+#include "cache_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+static const char *const cache_test_method_names[] = {
+    [CACHE_TEST_METHOD_GET_LINK] = "get_link",
+    [CACHE_TEST_METHOD_LIST_PORTS] = "list_ports",
+    [CACHE_TEST_METHOD_SCAN] = "scan",
+    [CACHE_TEST_METHOD_SET_LINK] = "set_link",
+};
+
+static uint64_t cache_test_now_us(clockid_t clock)
+{
+    struct timespec ts;
+
+    clock_gettime(clock, &ts);
+    return (uint64_t)ts.tv_sec * 1000000 + ts.tv_nsec / 1000;
+}
+
+/* Latency histogram bucket upper bounds in microseconds, the last bucket is open */
+static const uint64_t cache_test_latency_bounds[] = { 10, 100, 1000, 10000, 100000, 1000000 };
+
+/* Per-method counters, only touched from the uloop thread */
+struct cache_test_method_stats {
+    uint64_t calls;
+    uint64_t decode_errors;
+    uint64_t total_us;
+    uint64_t max_us;
+    uint64_t status[__UBUS_STATUS_LAST + 1];
+    uint64_t latency[ARRAY_SIZE(cache_test_latency_bounds) + 1];
+};
+
+static struct cache_test_method_stats cache_test_stats[__CACHE_TEST_METHOD_MAX];
+static int cache_test_stats_current = -1;
+
+/* Called by the deserializers, charged to the method being dispatched */
+static int cache_test_metrics_decode_failed(void)
+{
+    if (cache_test_stats_current >= 0) {
+        cache_test_stats[cache_test_stats_current].decode_errors++;
+    }
+
+    return UBUS_STATUS_INVALID_ARGUMENT;
+}
+
+static void cache_test_metrics_record(int index, int status, uint64_t elapsed_us)
+{
+    struct cache_test_method_stats *st = &cache_test_stats[index];
+    size_t bucket = 0;
+
+    st->calls++;
+    st->total_us += elapsed_us;
+    if (elapsed_us > st->max_us) {
+        st->max_us = elapsed_us;
+    }
+
+    // Unknown status codes share the last slot
+    if (status >= 0 && status < __UBUS_STATUS_LAST) {
+        st->status[status]++;
+    } else {
+        st->status[__UBUS_STATUS_LAST]++;
+    }
+
+    while (bucket < ARRAY_SIZE(cache_test_latency_bounds) && elapsed_us > cache_test_latency_bounds[bucket]) {
+        bucket++;
+    }
+    st->latency[bucket]++;
+}
+
+/* Start of the call being dispatched, kept by a deferred call until it is answered */
+static uint64_t cache_test_dispatch_start;
+
+/* Record a deferred call once answered, with the status sent to the caller */
+static void cache_test_record_deferred(int index, int status, struct blob_attr *msg, uint64_t start_us)
+{
+    uint64_t elapsed = cache_test_now_us(CLOCK_MONOTONIC) - start_us;
+
+    cache_test_metrics_record(index, status, elapsed);
+    (void)msg;
+}
+
+/* Run a handler and record the call, a deferred call is recorded when it is answered instead */
+static int cache_test_dispatch_call(int index, ubus_handler_t handler, bool deferrable, uint64_t start,
+                             struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req,
+                             const char *method, struct blob_attr *msg)
+{
+    uint64_t elapsed;
+    int ret;
+
+    cache_test_stats_current = index;
+    cache_test_dispatch_start = start;
+    ret = handler(ctx, obj, req, method, msg);
+    cache_test_stats_current = -1;
+    elapsed = cache_test_now_us(CLOCK_MONOTONIC) - start;
+
+    if (deferrable && req->deferred) {
+        return ret;
+    }
+
+    cache_test_metrics_record(index, ret, elapsed);
+
+    return ret;
+}
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+/* Copy a blob to the cursor of a *_dup() allocation, blobs go first after the struct to stay aligned */
+static struct blob_attr *ubus_idl_dup_blob(char **p, const struct blob_attr *attr)
+{
+    struct blob_attr *copy = (struct blob_attr *)*p;
+
+    memcpy(copy, attr, blob_pad_len(attr));
+    *p += blob_pad_len(attr);
+    return copy;
+}
+
+static const struct blobmsg_policy cache_test_get_link_policy[] = {
+    [CACHE_TEST_GET_LINK_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING }
+};
+
+int cache_test_get_link_deserialize(struct blob_attr *msg, struct cache_test_get_link_params *params)
+{
+    struct blob_attr *tb_cache_test_get_link[__CACHE_TEST_GET_LINK_MAX];
+    if (blobmsg_parse(cache_test_get_link_policy, ARRAY_SIZE(cache_test_get_link_policy), tb_cache_test_get_link, blob_data(msg), blob_len(msg)) < 0) {
+        return cache_test_metrics_decode_failed();
+    }
+
+    if (!tb_cache_test_get_link[CACHE_TEST_GET_LINK_IFNAME]) {
+        return cache_test_metrics_decode_failed();
+    }
+
+    params->ifname = blobmsg_get_string(tb_cache_test_get_link[CACHE_TEST_GET_LINK_IFNAME]);
+    return UBUS_STATUS_OK;
+}
+
+int cache_test_get_link_serialize(struct blob_buf *b, const struct cache_test_get_link_params *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    return UBUS_STATUS_OK;
+}
+
+struct cache_test_get_link_params *cache_test_get_link_dup(const struct cache_test_get_link_params *params)
+{
+    size_t len = sizeof(*params);
+    struct cache_test_get_link_params *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void cache_test_get_link_free(struct cache_test_get_link_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy cache_test_scan_policy[] = {
+    [CACHE_TEST_SCAN_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING }
+};
+
+int cache_test_scan_deserialize(struct blob_attr *msg, struct cache_test_scan_params *params)
+{
+    struct blob_attr *tb_cache_test_scan[__CACHE_TEST_SCAN_MAX];
+    if (blobmsg_parse(cache_test_scan_policy, ARRAY_SIZE(cache_test_scan_policy), tb_cache_test_scan, blob_data(msg), blob_len(msg)) < 0) {
+        return cache_test_metrics_decode_failed();
+    }
+
+    if (!tb_cache_test_scan[CACHE_TEST_SCAN_IFNAME]) {
+        return cache_test_metrics_decode_failed();
+    }
+
+    params->ifname = blobmsg_get_string(tb_cache_test_scan[CACHE_TEST_SCAN_IFNAME]);
+    return UBUS_STATUS_OK;
+}
+
+int cache_test_scan_serialize(struct blob_buf *b, const struct cache_test_scan_params *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    return UBUS_STATUS_OK;
+}
+
+struct cache_test_scan_params *cache_test_scan_dup(const struct cache_test_scan_params *params)
+{
+    size_t len = sizeof(*params);
+    struct cache_test_scan_params *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void cache_test_scan_free(struct cache_test_scan_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy cache_test_set_link_policy[] = {
+    [CACHE_TEST_SET_LINK_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [CACHE_TEST_SET_LINK_UP] = { .name = "up", .type = BLOBMSG_TYPE_BOOL }
+};
+
+int cache_test_set_link_deserialize(struct blob_attr *msg, struct cache_test_set_link_params *params)
+{
+    struct blob_attr *tb_cache_test_set_link[__CACHE_TEST_SET_LINK_MAX];
+    if (blobmsg_parse(cache_test_set_link_policy, ARRAY_SIZE(cache_test_set_link_policy), tb_cache_test_set_link, blob_data(msg), blob_len(msg)) < 0) {
+        return cache_test_metrics_decode_failed();
+    }
+
+    if (!tb_cache_test_set_link[CACHE_TEST_SET_LINK_IFNAME] || !tb_cache_test_set_link[CACHE_TEST_SET_LINK_UP]) {
+        return cache_test_metrics_decode_failed();
+    }
+
+    params->ifname = blobmsg_get_string(tb_cache_test_set_link[CACHE_TEST_SET_LINK_IFNAME]);
+    params->up = blobmsg_get_u8(tb_cache_test_set_link[CACHE_TEST_SET_LINK_UP]) != 0;
+    return UBUS_STATUS_OK;
+}
+
+int cache_test_set_link_serialize(struct blob_buf *b, const struct cache_test_set_link_params *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    UBUS_IDL_ADD(u8, b, "up", params->up ? 1 : 0);
+    return UBUS_STATUS_OK;
+}
+
+struct cache_test_set_link_params *cache_test_set_link_dup(const struct cache_test_set_link_params *params)
+{
+    size_t len = sizeof(*params);
+    struct cache_test_set_link_params *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void cache_test_set_link_free(struct cache_test_set_link_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy cache_test_link_info_policy[] = {
+    [CACHE_TEST_LINK_INFO_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [CACHE_TEST_LINK_INFO_CARRIER] = { .name = "carrier", .type = BLOBMSG_TYPE_BOOL },
+    [CACHE_TEST_LINK_INFO_SPEED] = { .name = "speed", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int cache_test_link_info_deserialize(struct blob_attr *msg, struct cache_test_link_info *params)
+{
+    struct blob_attr *tb_cache_test_link_info[__CACHE_TEST_LINK_INFO_MAX];
+    if (blobmsg_parse(cache_test_link_info_policy, ARRAY_SIZE(cache_test_link_info_policy), tb_cache_test_link_info, blob_data(msg), blob_len(msg)) < 0) {
+        return cache_test_metrics_decode_failed();
+    }
+
+    if (!tb_cache_test_link_info[CACHE_TEST_LINK_INFO_IFNAME] || !tb_cache_test_link_info[CACHE_TEST_LINK_INFO_CARRIER]) {
+        return cache_test_metrics_decode_failed();
+    }
+
+    params->has_fields = 0;
+    params->ifname = blobmsg_get_string(tb_cache_test_link_info[CACHE_TEST_LINK_INFO_IFNAME]);
+    params->carrier = blobmsg_get_u8(tb_cache_test_link_info[CACHE_TEST_LINK_INFO_CARRIER]) != 0;
+
+    UBUS_IDL_GET_OPTIONAL(u32, tb_cache_test_link_info, CACHE_TEST_LINK_INFO_SPEED, params->speed, params, FIELD, CACHE_TEST_LINK_INFO_HAS_SPEED);
+    return UBUS_STATUS_OK;
+}
+
+int cache_test_link_info_serialize(struct blob_buf *b, const struct cache_test_link_info *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    UBUS_IDL_ADD(u8, b, "carrier", params->carrier ? 1 : 0);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "speed", params->speed, params, FIELD, CACHE_TEST_LINK_INFO_HAS_SPEED);
+    return UBUS_STATUS_OK;
+}
+
+struct cache_test_link_info *cache_test_link_info_dup(const struct cache_test_link_info *params)
+{
+    size_t len = sizeof(*params);
+    struct cache_test_link_info *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void cache_test_link_info_free(struct cache_test_link_info *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy cache_test_port_list_policy[] = {
+    [CACHE_TEST_PORT_LIST_COUNT] = { .name = "count", .type = BLOBMSG_TYPE_INT32 },
+    [CACHE_TEST_PORT_LIST_NAMES] = { .name = "names", .type = BLOBMSG_TYPE_ARRAY }
+};
+
+int cache_test_port_list_deserialize(struct blob_attr *msg, struct cache_test_port_list *params)
+{
+    struct blob_attr *tb_cache_test_port_list[__CACHE_TEST_PORT_LIST_MAX];
+    if (blobmsg_parse(cache_test_port_list_policy, ARRAY_SIZE(cache_test_port_list_policy), tb_cache_test_port_list, blob_data(msg), blob_len(msg)) < 0) {
+        return cache_test_metrics_decode_failed();
+    }
+
+    if (!tb_cache_test_port_list[CACHE_TEST_PORT_LIST_COUNT]) {
+        return cache_test_metrics_decode_failed();
+    }
+
+    params->has_fields = 0;
+    params->count = blobmsg_get_u32(tb_cache_test_port_list[CACHE_TEST_PORT_LIST_COUNT]);
+
+    if (tb_cache_test_port_list[CACHE_TEST_PORT_LIST_NAMES]) {
+        params->names = tb_cache_test_port_list[CACHE_TEST_PORT_LIST_NAMES];
+        UBUS_IDL_SET_FIELD(params, CACHE_TEST_PORT_LIST_HAS_NAMES);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int cache_test_port_list_serialize(struct blob_buf *b, const struct cache_test_port_list *params)
+{
+    int ret;
+    UBUS_IDL_ADD(u32, b, "count", params->count);
+    if (UBUS_IDL_HAS_FIELD(params, CACHE_TEST_PORT_LIST_HAS_NAMES)) {
+        blobmsg_add_field(b, BLOBMSG_TYPE_ARRAY, "names", blob_data(params->names), blob_len(params->names));
+    }
+    return UBUS_STATUS_OK;
+}
+
+struct cache_test_port_list *cache_test_port_list_dup(const struct cache_test_port_list *params)
+{
+    size_t len = sizeof(*params);
+    struct cache_test_port_list *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, CACHE_TEST_PORT_LIST_HAS_NAMES) && params->names) {
+        len += blob_pad_len(params->names);
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->names = UBUS_IDL_HAS_FIELD(params, CACHE_TEST_PORT_LIST_HAS_NAMES) && params->names ? ubus_idl_dup_blob(&p, params->names) : NULL;
+    return copy;
+}
+
+void cache_test_port_list_free(struct cache_test_port_list *params)
+{
+    free(params);
+}
+
+/* Set while a batch runs its calls, reply helpers then append to the batch response */
+static struct blob_buf *cache_test_batch_capture;
+
+/* Request waiting for the reply of an identical request in progress */
+struct cache_test_cache_waiter {
+    struct list_head list;
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    uint64_t start_us;
+};
+
+/* Stored reply, keyed by a copy of the raw request blob */
+struct cache_test_cache_entry {
+    struct list_head list;
+    struct list_head waiters;
+    struct cache_test_cache *cache;
+    struct blob_attr *key;
+    struct blob_attr *reply;
+    uint64_t expires_us;
+    uint32_t hash;
+    bool pending;
+    bool stale;
+};
+
+/* Reply cache of one method, entries are kept most recently used first */
+struct cache_test_cache {
+    struct list_head entries;
+    unsigned int count;
+    unsigned int size;
+    uint64_t ttl_us;
+    int method;
+};
+
+#ifndef CACHE_TEST_GET_LINK_CACHE_TTL_MS
+#define CACHE_TEST_GET_LINK_CACHE_TTL_MS 500
+#endif
+
+#ifndef CACHE_TEST_GET_LINK_CACHE_SIZE
+#define CACHE_TEST_GET_LINK_CACHE_SIZE 16
+#endif
+
+static struct cache_test_cache cache_test_get_link_cache = {
+    .entries = LIST_HEAD_INIT(cache_test_get_link_cache.entries),
+    .size = CACHE_TEST_GET_LINK_CACHE_SIZE,
+    .ttl_us = (uint64_t)CACHE_TEST_GET_LINK_CACHE_TTL_MS * 1000,
+    .method = CACHE_TEST_METHOD_GET_LINK,
+};
+
+#ifndef CACHE_TEST_LIST_PORTS_CACHE_TTL_MS
+#define CACHE_TEST_LIST_PORTS_CACHE_TTL_MS 1000
+#endif
+
+#ifndef CACHE_TEST_LIST_PORTS_CACHE_SIZE
+#define CACHE_TEST_LIST_PORTS_CACHE_SIZE 4
+#endif
+
+static struct cache_test_cache cache_test_list_ports_cache = {
+    .entries = LIST_HEAD_INIT(cache_test_list_ports_cache.entries),
+    .size = CACHE_TEST_LIST_PORTS_CACHE_SIZE,
+    .ttl_us = (uint64_t)CACHE_TEST_LIST_PORTS_CACHE_TTL_MS * 1000,
+    .method = CACHE_TEST_METHOD_LIST_PORTS,
+};
+
+#ifndef CACHE_TEST_SCAN_CACHE_TTL_MS
+#define CACHE_TEST_SCAN_CACHE_TTL_MS 2000
+#endif
+
+#ifndef CACHE_TEST_SCAN_CACHE_SIZE
+#define CACHE_TEST_SCAN_CACHE_SIZE 16
+#endif
+
+static struct cache_test_cache cache_test_scan_cache = {
+    .entries = LIST_HEAD_INIT(cache_test_scan_cache.entries),
+    .size = CACHE_TEST_SCAN_CACHE_SIZE,
+    .ttl_us = (uint64_t)CACHE_TEST_SCAN_CACHE_TTL_MS * 1000,
+    .method = CACHE_TEST_METHOD_SCAN,
+};
+
+/* Set while a cached method runs, its reply helper then keeps a copy of the reply */
+static struct blob_attr **cache_test_cache_capture;
+
+/* Entry of the deferred request being dispatched, taken over by its context */
+static struct cache_test_cache_entry *cache_test_cache_pending;
+
+static uint32_t cache_test_cache_hash(const struct blob_attr *msg)
+{
+    const uint8_t *p = (const uint8_t *)msg;
+    size_t len = blob_raw_len(msg);
+    uint32_t hash = 2166136261u;
+
+    while (len--) {
+        hash = (hash ^ *p++) * 16777619u;
+    }
+
+    return hash;
+}
+
+static void cache_test_cache_drop(struct cache_test_cache_entry *entry)
+{
+    list_del(&entry->list);
+    entry->cache->count--;
+    free(entry->key);
+    free(entry->reply);
+    free(entry);
+}
+
+/* Find the entry of a request, an expired reply is dropped */
+static struct cache_test_cache_entry *cache_test_cache_find(struct cache_test_cache *cache, struct blob_attr *msg, uint32_t hash)
+{
+    struct cache_test_cache_entry *entry;
+
+    list_for_each_entry(entry, &cache->entries, list) {
+        if (entry->hash != hash || entry->stale || blob_raw_len(entry->key) != blob_raw_len(msg) ||
+            memcmp(entry->key, msg, blob_raw_len(msg)) != 0) {
+            continue;
+        }
+
+        if (!entry->pending && entry->expires_us <= cache_test_now_us(CLOCK_MONOTONIC)) {
+            cache_test_cache_drop(entry);
+            return NULL;
+        }
+
+        list_move(&entry->list, &cache->entries);
+        return entry;
+    }
+
+    return NULL;
+}
+
+/* Add a pending entry, evicting the least recently used reply when full */
+static struct cache_test_cache_entry *cache_test_cache_insert(struct cache_test_cache *cache, struct blob_attr *msg, uint32_t hash)
+{
+    struct cache_test_cache_entry *entry;
+
+    if (cache->count >= cache->size) {
+        list_for_each_entry_reverse(entry, &cache->entries, list) {
+            if (!entry->pending) {
+                break;
+            }
+        }
+
+        // Every entry still waits for its reply, leave this request uncached
+        if (&entry->list == &cache->entries) {
+            return NULL;
+        }
+
+        cache_test_cache_drop(entry);
+    }
+
+    entry = calloc(1, sizeof(*entry));
+    if (!entry) {
+        return NULL;
+    }
+
+    entry->key = blob_memdup(msg);
+    if (!entry->key) {
+        free(entry);
+        return NULL;
+    }
+
+    INIT_LIST_HEAD(&entry->waiters);
+    entry->cache = cache;
+    entry->hash = hash;
+    entry->pending = true;
+    list_add(&entry->list, &cache->entries);
+    cache->count++;
+
+    return entry;
+}
+
+/* Answer the coalesced requests, then keep the reply until its TTL expires */
+static void cache_test_cache_resolve(struct cache_test_cache_entry *entry, int status, struct blob_attr *reply)
+{
+    struct cache_test_cache_waiter *waiter, *tmp;
+
+    list_for_each_entry_safe(waiter, tmp, &entry->waiters, list) {
+        if (status == UBUS_STATUS_OK && reply) {
+            ubus_send_reply(waiter->ctx, &waiter->req, reply);
+        }
+        ubus_complete_deferred_request(waiter->ctx, &waiter->req, status);
+        cache_test_record_deferred(entry->cache->method, status, entry->key, waiter->start_us);
+        list_del(&waiter->list);
+        free(waiter);
+    }
+
+    // Failures are not cached, neither are replies invalidated while computed
+    if (status != UBUS_STATUS_OK || !reply || entry->stale) {
+        free(reply);
+        cache_test_cache_drop(entry);
+        return;
+    }
+
+    entry->reply = reply;
+    entry->pending = false;
+    entry->expires_us = cache_test_now_us(CLOCK_MONOTONIC) + entry->cache->ttl_us;
+}
+
+/* Drop the stored replies, replies being computed are still sent but not kept */
+static void cache_test_cache_flush(struct cache_test_cache *cache)
+{
+    struct cache_test_cache_entry *entry, *tmp;
+
+    list_for_each_entry_safe(entry, tmp, &cache->entries, list) {
+        if (entry->pending) {
+            entry->stale = true;
+        } else {
+            cache_test_cache_drop(entry);
+        }
+    }
+}
+
+void cache_test_get_link_cache_invalidate(void)
+{
+    cache_test_cache_flush(&cache_test_get_link_cache);
+}
+
+void cache_test_list_ports_cache_invalidate(void)
+{
+    cache_test_cache_flush(&cache_test_list_ports_cache);
+}
+
+void cache_test_scan_cache_invalidate(void)
+{
+    cache_test_cache_flush(&cache_test_scan_cache);
+}
+
+void cache_test_cache_invalidate(void)
+{
+    cache_test_cache_flush(&cache_test_get_link_cache);
+    cache_test_cache_flush(&cache_test_list_ports_cache);
+    cache_test_cache_flush(&cache_test_scan_cache);
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf cache_test_reply_buf;
+
+int cache_test_get_link_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct cache_test_link_info *reply)
+{
+    void *tbl;
+    int ret;
+
+    if (cache_test_batch_capture) {
+        tbl = blobmsg_open_table(cache_test_batch_capture, "reply");
+        ret = cache_test_link_info_serialize(cache_test_batch_capture, reply);
+        blobmsg_close_table(cache_test_batch_capture, tbl);
+        return ret;
+    }
+
+    blob_buf_init(&cache_test_reply_buf, 0);
+    ret = cache_test_link_info_serialize(&cache_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    if (cache_test_cache_capture) {
+        *cache_test_cache_capture = blob_memdup(cache_test_reply_buf.head);
+    }
+
+    return ubus_send_reply(ctx, req, cache_test_reply_buf.head);
+}
+
+int cache_test_list_ports_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct cache_test_port_list *reply)
+{
+    void *tbl;
+    int ret;
+
+    if (cache_test_batch_capture) {
+        tbl = blobmsg_open_table(cache_test_batch_capture, "reply");
+        ret = cache_test_port_list_serialize(cache_test_batch_capture, reply);
+        blobmsg_close_table(cache_test_batch_capture, tbl);
+        return ret;
+    }
+
+    blob_buf_init(&cache_test_reply_buf, 0);
+    ret = cache_test_port_list_serialize(&cache_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    if (cache_test_cache_capture) {
+        *cache_test_cache_capture = blob_memdup(cache_test_reply_buf.head);
+    }
+
+    return ubus_send_reply(ctx, req, cache_test_reply_buf.head);
+}
+
+int cache_test_scan_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct cache_test_link_info *reply)
+{
+    void *tbl;
+    int ret;
+
+    if (cache_test_batch_capture) {
+        tbl = blobmsg_open_table(cache_test_batch_capture, "reply");
+        ret = cache_test_link_info_serialize(cache_test_batch_capture, reply);
+        blobmsg_close_table(cache_test_batch_capture, tbl);
+        return ret;
+    }
+
+    blob_buf_init(&cache_test_reply_buf, 0);
+    ret = cache_test_link_info_serialize(&cache_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    if (cache_test_cache_capture) {
+        *cache_test_cache_capture = blob_memdup(cache_test_reply_buf.head);
+    }
+
+    return ubus_send_reply(ctx, req, cache_test_reply_buf.head);
+}
+
+#ifndef CACHE_TEST_SCAN_TIMEOUT_MS
+#define CACHE_TEST_SCAN_TIMEOUT_MS 3000
+#endif
+
+static void cache_test_scan_async_timeout(struct uloop_timeout *t)
+{
+    struct cache_test_scan_async_ctx *actx = container_of(t, struct cache_test_scan_async_ctx, timeout);
+
+    actx->timed_out = true;
+    ubus_complete_deferred_request(actx->ctx, &actx->req, UBUS_STATUS_TIMEOUT);
+    cache_test_record_deferred(CACHE_TEST_METHOD_SCAN, UBUS_STATUS_TIMEOUT, actx->msg, actx->start_us);
+
+    // Coalesced requests time out with it, and the late reply is not kept
+    if (actx->cache) {
+        cache_test_cache_resolve(actx->cache, UBUS_STATUS_TIMEOUT, NULL);
+        actx->cache = NULL;
+    }
+}
+
+void cache_test_scan_complete(struct cache_test_scan_async_ctx *actx, int status, const struct cache_test_link_info *reply)
+{
+    struct blob_attr *cached = NULL;
+
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        if (status == UBUS_STATUS_OK && reply) {
+            cache_test_cache_capture = actx->cache ? &cached : NULL;
+            status = cache_test_scan_reply(actx->ctx, &actx->req, reply);
+            cache_test_cache_capture = NULL;
+        }
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+        cache_test_record_deferred(CACHE_TEST_METHOD_SCAN, status, actx->msg, actx->start_us);
+    }
+
+    // Identical requests that arrived meanwhile get the same answer
+    if (actx->cache) {
+        cache_test_cache_resolve(actx->cache, status, cached);
+    }
+
+    free(actx->msg);
+    free(actx);
+}
+
+static int cache_test_scan_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct cache_test_scan_async_ctx *actx;
+    int ret;
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy beyond the handler call
+    actx->msg = blob_memdup(msg);
+    if (!actx->msg) {
+        free(actx);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    if (cache_test_scan_deserialize(actx->msg, &actx->params) != UBUS_STATUS_OK) {
+        free(actx->msg);
+        free(actx);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    actx->ctx = ctx;
+    actx->start_us = cache_test_dispatch_start;
+    actx->cache = cache_test_cache_pending;
+    ubus_defer_request(ctx, req, &actx->req);
+    actx->timeout.cb = cache_test_scan_async_timeout;
+    uloop_timeout_set(&actx->timeout, CACHE_TEST_SCAN_TIMEOUT_MS);
+
+    // The handler owns the context on success and must call cache_test_scan_complete()
+    ret = cache_test_scan_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        cache_test_scan_complete(actx, ret, NULL);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static int cache_test_get_link_cache_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct cache_test_cache_entry *entry;
+    struct blob_attr *reply = NULL;
+    uint32_t hash;
+    int ret;
+
+    // Replies of batched calls go to the batch response
+    if (cache_test_batch_capture) {
+        return cache_test_get_link_handler(ctx, obj, req, method, msg);
+    }
+
+    hash = cache_test_cache_hash(msg);
+    entry = cache_test_cache_find(&cache_test_get_link_cache, msg, hash);
+    if (entry && !entry->pending) {
+        return ubus_send_reply(ctx, req, entry->reply);
+    }
+
+    entry = cache_test_cache_insert(&cache_test_get_link_cache, msg, hash);
+    cache_test_cache_capture = entry ? &reply : NULL;
+    ret = cache_test_get_link_handler(ctx, obj, req, method, msg);
+    cache_test_cache_capture = NULL;
+    if (entry) {
+        cache_test_cache_resolve(entry, ret, reply);
+    }
+
+    return ret;
+}
+
+static int cache_test_list_ports_cache_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct cache_test_cache_entry *entry;
+    struct blob_attr *reply = NULL;
+    uint32_t hash;
+    int ret;
+
+    // Replies of batched calls go to the batch response
+    if (cache_test_batch_capture) {
+        return cache_test_list_ports_handler(ctx, obj, req, method, msg);
+    }
+
+    hash = cache_test_cache_hash(msg);
+    entry = cache_test_cache_find(&cache_test_list_ports_cache, msg, hash);
+    if (entry && !entry->pending) {
+        return ubus_send_reply(ctx, req, entry->reply);
+    }
+
+    entry = cache_test_cache_insert(&cache_test_list_ports_cache, msg, hash);
+    cache_test_cache_capture = entry ? &reply : NULL;
+    ret = cache_test_list_ports_handler(ctx, obj, req, method, msg);
+    cache_test_cache_capture = NULL;
+    if (entry) {
+        cache_test_cache_resolve(entry, ret, reply);
+    }
+
+    return ret;
+}
+
+static int cache_test_scan_cache_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct cache_test_cache_entry *entry;
+    struct cache_test_cache_waiter *waiter;
+    uint32_t hash;
+    int ret;
+
+    hash = cache_test_cache_hash(msg);
+    entry = cache_test_cache_find(&cache_test_scan_cache, msg, hash);
+    if (entry && !entry->pending) {
+        return ubus_send_reply(ctx, req, entry->reply);
+    }
+
+    if (entry) {
+        // The same request is in progress, wait for its reply instead of running it again
+        waiter = calloc(1, sizeof(*waiter));
+        if (!waiter) {
+            return UBUS_STATUS_UNKNOWN_ERROR;
+        }
+
+        waiter->ctx = ctx;
+        waiter->start_us = cache_test_dispatch_start;
+        ubus_defer_request(ctx, req, &waiter->req);
+        list_add_tail(&waiter->list, &entry->waiters);
+        return UBUS_STATUS_OK;
+    }
+
+    entry = cache_test_cache_insert(&cache_test_scan_cache, msg, hash);
+    // Once deferred, the request owns the entry and resolves it on completion
+    cache_test_cache_pending = entry;
+    ret = cache_test_scan_async_dispatch(ctx, obj, req, method, msg);
+    cache_test_cache_pending = NULL;
+    if (ret != UBUS_STATUS_OK && entry) {
+        cache_test_cache_drop(entry);
+    }
+
+    return ret;
+}
+
+static int cache_test_get_link_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return cache_test_dispatch_call(CACHE_TEST_METHOD_GET_LINK, cache_test_get_link_cache_dispatch, false,
+                             cache_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+static int cache_test_list_ports_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return cache_test_dispatch_call(CACHE_TEST_METHOD_LIST_PORTS, cache_test_list_ports_cache_dispatch, false,
+                             cache_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+static int cache_test_scan_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return cache_test_dispatch_call(CACHE_TEST_METHOD_SCAN, cache_test_scan_cache_dispatch, true,
+                             cache_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+static int cache_test_set_link_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return cache_test_dispatch_call(CACHE_TEST_METHOD_SET_LINK, cache_test_set_link_handler, false,
+                             cache_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+enum {
+    CACHE_TEST_STATS_RESET,
+    __CACHE_TEST_STATS_MAX
+};
+
+static const struct blobmsg_policy cache_test_stats_policy[] = {
+    [CACHE_TEST_STATS_RESET] = { .name = "reset", .type = BLOBMSG_TYPE_BOOL }
+};
+
+static int cache_test_stats_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+enum {
+    CACHE_TEST_BATCH_CALLS,
+    __CACHE_TEST_BATCH_MAX
+};
+
+static const struct blobmsg_policy cache_test_batch_policy[] = {
+    [CACHE_TEST_BATCH_CALLS] = { .name = "calls", .type = BLOBMSG_TYPE_ARRAY }
+};
+
+enum {
+    CACHE_TEST_BATCH_CALL_METHOD,
+    CACHE_TEST_BATCH_CALL_PARAMS,
+    __CACHE_TEST_BATCH_CALL_MAX
+};
+
+static const struct blobmsg_policy cache_test_batch_call_policy[] = {
+    [CACHE_TEST_BATCH_CALL_METHOD] = { .name = "method", .type = BLOBMSG_TYPE_STRING },
+    [CACHE_TEST_BATCH_CALL_PARAMS] = { .name = "params", .type = BLOBMSG_TYPE_TABLE }
+};
+
+static int cache_test_batch_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+static const struct ubus_method cache_test_methods[] = {
+    UBUS_METHOD("get_link", cache_test_get_link_dispatch, cache_test_get_link_policy),
+    UBUS_METHOD_NOARG("list_ports", cache_test_list_ports_dispatch),
+    UBUS_METHOD("scan", cache_test_scan_dispatch, cache_test_scan_policy),
+    UBUS_METHOD("set_link", cache_test_set_link_dispatch, cache_test_set_link_policy),
+    UBUS_METHOD("batch", cache_test_batch_handler, cache_test_batch_policy),
+    UBUS_METHOD("stats", cache_test_stats_handler, cache_test_stats_policy)
+};
+
+static struct ubus_object_type cache_test_object_type =
+    UBUS_OBJECT_TYPE("cache_test", cache_test_methods);
+
+struct ubus_object cache_test_object = {
+    .name = "cache_test",
+    .type = &cache_test_object_type,
+    .methods = cache_test_methods,
+    .n_methods = ARRAY_SIZE(cache_test_methods),
+};
+
+/* Methods allowed inside a batch, ubusd only checks the ACL of the batch call */
+static const char *const cache_test_batch_allowed[] = {
+    "get_link",
+    "list_ports",
+    "set_link",
+};
+
+static struct blob_buf cache_test_batch_buf;
+static struct blob_buf cache_test_batch_args;
+
+static const struct ubus_method *cache_test_batch_find(const char *name)
+{
+    size_t i;
+
+    for (i = 0; i < ARRAY_SIZE(cache_test_batch_allowed); i++) {
+        if (!strcmp(cache_test_batch_allowed[i], name)) {
+            break;
+        }
+    }
+    if (i == ARRAY_SIZE(cache_test_batch_allowed)) {
+        return NULL;
+    }
+
+    for (i = 0; i < ARRAY_SIZE(cache_test_methods); i++) {
+        if (!strcmp(cache_test_methods[i].name, name)) {
+            return &cache_test_methods[i];
+        }
+    }
+
+    return NULL;
+}
+
+static int cache_test_batch_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct blob_attr *tb[__CACHE_TEST_BATCH_MAX];
+    struct blob_attr *call_tb[__CACHE_TEST_BATCH_CALL_MAX];
+    struct ubus_request_data call_req;
+    const struct ubus_method *m;
+    struct blob_attr *cur;
+    void *results;
+    void *entry;
+    size_t rem;
+    int ret;
+
+    if (blobmsg_parse(cache_test_batch_policy, ARRAY_SIZE(cache_test_batch_policy), tb, blob_data(msg), blob_len(msg)) < 0 || !tb[CACHE_TEST_BATCH_CALLS]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    blob_buf_init(&cache_test_batch_buf, 0);
+    results = blobmsg_open_array(&cache_test_batch_buf, "results");
+
+    blobmsg_for_each_attr(cur, tb[CACHE_TEST_BATCH_CALLS], rem) {
+        entry = blobmsg_open_table(&cache_test_batch_buf, NULL);
+
+        if (blobmsg_type(cur) != BLOBMSG_TYPE_TABLE ||
+            blobmsg_parse(cache_test_batch_call_policy, ARRAY_SIZE(cache_test_batch_call_policy), call_tb, blobmsg_data(cur), blobmsg_data_len(cur)) < 0 ||
+            !call_tb[CACHE_TEST_BATCH_CALL_METHOD]) {
+            ret = UBUS_STATUS_INVALID_ARGUMENT;
+        } else if (!(m = cache_test_batch_find(blobmsg_get_string(call_tb[CACHE_TEST_BATCH_CALL_METHOD])))) {
+            ret = UBUS_STATUS_METHOD_NOT_FOUND;
+        } else {
+            // Handlers expect the bare params payload, as in a direct call
+            blob_buf_init(&cache_test_batch_args, 0);
+            if (call_tb[CACHE_TEST_BATCH_CALL_PARAMS]) {
+                blob_put_raw(&cache_test_batch_args, blobmsg_data(call_tb[CACHE_TEST_BATCH_CALL_PARAMS]),
+                             blobmsg_data_len(call_tb[CACHE_TEST_BATCH_CALL_PARAMS]));
+            }
+
+            // Inner calls get a request without peer, ubusd drops a reply sent on it
+            // instead of delivering it to the caller before the batch response
+            memset(&call_req, 0, sizeof(call_req));
+            call_req.fd = -1;
+            call_req.req_fd = -1;
+
+            cache_test_batch_capture = &cache_test_batch_buf;
+            ret = m->handler(ctx, obj, &call_req, m->name, cache_test_batch_args.head);
+            cache_test_batch_capture = NULL;
+        }
+
+        blobmsg_add_u32(&cache_test_batch_buf, "status", ret);
+        blobmsg_close_table(&cache_test_batch_buf, entry);
+    }
+
+    blobmsg_close_array(&cache_test_batch_buf, results);
+
+    return ubus_send_reply(ctx, req, cache_test_batch_buf.head);
+}
+
+static struct blob_buf cache_test_stats_buf;
+
+static int cache_test_stats_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct blob_attr *tb[__CACHE_TEST_STATS_MAX];
+    struct cache_test_method_stats *st;
+    void *methods;
+    void *entry;
+    void *table;
+    char key[24];
+    size_t i;
+    size_t j;
+    int ret;
+
+    if (blobmsg_parse(cache_test_stats_policy, ARRAY_SIZE(cache_test_stats_policy), tb, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    blob_buf_init(&cache_test_stats_buf, 0);
+    methods = blobmsg_open_table(&cache_test_stats_buf, "methods");
+
+    for (i = 0; i < __CACHE_TEST_METHOD_MAX; i++) {
+        st = &cache_test_stats[i];
+        entry = blobmsg_open_table(&cache_test_stats_buf, cache_test_method_names[i]);
+        blobmsg_add_u64(&cache_test_stats_buf, "calls", st->calls);
+        blobmsg_add_u64(&cache_test_stats_buf, "decode_errors", st->decode_errors);
+        blobmsg_add_u64(&cache_test_stats_buf, "total_us", st->total_us);
+        blobmsg_add_u64(&cache_test_stats_buf, "max_us", st->max_us);
+
+        // Status codes that occurred, keyed by their numeric value
+        table = blobmsg_open_table(&cache_test_stats_buf, "status");
+        for (j = 0; j <= __UBUS_STATUS_LAST; j++) {
+            if (!st->status[j]) {
+                continue;
+            }
+            if (j == __UBUS_STATUS_LAST) {
+                snprintf(key, sizeof(key), "other");
+            } else {
+                snprintf(key, sizeof(key), "%zu", j);
+            }
+            blobmsg_add_u64(&cache_test_stats_buf, key, st->status[j]);
+        }
+        blobmsg_close_table(&cache_test_stats_buf, table);
+
+        // Histogram keyed by bucket upper bound in microseconds
+        table = blobmsg_open_table(&cache_test_stats_buf, "latency_us");
+        for (j = 0; j < ARRAY_SIZE(st->latency); j++) {
+            if (j < ARRAY_SIZE(cache_test_latency_bounds)) {
+                snprintf(key, sizeof(key), "%llu", (unsigned long long)cache_test_latency_bounds[j]);
+            } else {
+                snprintf(key, sizeof(key), "inf");
+            }
+            blobmsg_add_u64(&cache_test_stats_buf, key, st->latency[j]);
+        }
+        blobmsg_close_table(&cache_test_stats_buf, table);
+
+        blobmsg_close_table(&cache_test_stats_buf, entry);
+    }
+
+    blobmsg_close_table(&cache_test_stats_buf, methods);
+
+    ret = ubus_send_reply(ctx, req, cache_test_stats_buf.head);
+
+    if (tb[CACHE_TEST_STATS_RESET] && blobmsg_get_bool(tb[CACHE_TEST_STATS_RESET])) {
+        memset(cache_test_stats, 0, sizeof(cache_test_stats));
+    }
+
+    return ret;
+}
+
+void cache_test_object_cleanup(void)
+{
+    blob_buf_free(&cache_test_reply_buf);
+    blob_buf_free(&cache_test_batch_buf);
+    blob_buf_free(&cache_test_batch_args);
+    blob_buf_free(&cache_test_stats_buf);
+    cache_test_cache_invalidate();
+}
@@ -0,0 +1,158 @@
+/* Generated from ubus IDL - cache_test */
+
+#ifndef __CACHE_TEST_OBJECT_H__
+#define __CACHE_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct cache_test_link_info {
+    const char * ifname;
+    int32_t speed;
+    bool carrier;
+    uint8_t has_fields;
+};
+#define CACHE_TEST_LINK_INFO_HAS_SPEED 0
+_Static_assert(sizeof(struct cache_test_link_info) == UBUS_IDL_PACKED_SIZE(struct cache_test_link_info, sizeof(const char *) + sizeof(int32_t) + sizeof(bool) + sizeof(uint8_t)),
+               "struct cache_test_link_info has padding between members");
+
+struct cache_test_port_list {
+    struct blob_attr * names;
+    int32_t count;
+    uint8_t has_fields;
+};
+#define CACHE_TEST_PORT_LIST_HAS_NAMES 0
+_Static_assert(sizeof(struct cache_test_port_list) == UBUS_IDL_PACKED_SIZE(struct cache_test_port_list, sizeof(struct blob_attr *) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct cache_test_port_list has padding between members");
+
+struct cache_test_get_link_params {
+    const char * ifname;
+};
+_Static_assert(sizeof(struct cache_test_get_link_params) == UBUS_IDL_PACKED_SIZE(struct cache_test_get_link_params, sizeof(const char *)),
+               "struct cache_test_get_link_params has padding between members");
+
+struct cache_test_scan_params {
+    const char * ifname;
+};
+_Static_assert(sizeof(struct cache_test_scan_params) == UBUS_IDL_PACKED_SIZE(struct cache_test_scan_params, sizeof(const char *)),
+               "struct cache_test_scan_params has padding between members");
+
+struct cache_test_set_link_params {
+    const char * ifname;
+    bool up;
+};
+_Static_assert(sizeof(struct cache_test_set_link_params) == UBUS_IDL_PACKED_SIZE(struct cache_test_set_link_params, sizeof(const char *) + sizeof(bool)),
+               "struct cache_test_set_link_params has padding between members");
+
+enum {
+    CACHE_TEST_GET_LINK_IFNAME,
+    __CACHE_TEST_GET_LINK_MAX
+};
+
+enum {
+    CACHE_TEST_SCAN_IFNAME,
+    __CACHE_TEST_SCAN_MAX
+};
+
+enum {
+    CACHE_TEST_SET_LINK_IFNAME,
+    CACHE_TEST_SET_LINK_UP,
+    __CACHE_TEST_SET_LINK_MAX
+};
+
+enum {
+    CACHE_TEST_LINK_INFO_IFNAME,
+    CACHE_TEST_LINK_INFO_CARRIER,
+    CACHE_TEST_LINK_INFO_SPEED,
+    __CACHE_TEST_LINK_INFO_MAX
+};
+
+enum {
+    CACHE_TEST_PORT_LIST_COUNT,
+    CACHE_TEST_PORT_LIST_NAMES,
+    __CACHE_TEST_PORT_LIST_MAX
+};
+
+struct cache_test_scan_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    struct cache_test_scan_params params;
+    struct cache_test_cache_entry *cache;
+    bool timed_out;
+    uint64_t start_us;
+    void *priv;
+};
+
+enum cache_test_method {
+    CACHE_TEST_METHOD_GET_LINK,
+    CACHE_TEST_METHOD_LIST_PORTS,
+    CACHE_TEST_METHOD_SCAN,
+    CACHE_TEST_METHOD_SET_LINK,
+    __CACHE_TEST_METHOD_MAX
+};
+
+int cache_test_get_link_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int cache_test_list_ports_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int cache_test_scan_handler(struct cache_test_scan_async_ctx *actx);
+int cache_test_set_link_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+int cache_test_get_link_deserialize(struct blob_attr *msg, struct cache_test_get_link_params *params);
+int cache_test_get_link_serialize(struct blob_buf *b, const struct cache_test_get_link_params *params);
+int cache_test_scan_deserialize(struct blob_attr *msg, struct cache_test_scan_params *params);
+int cache_test_scan_serialize(struct blob_buf *b, const struct cache_test_scan_params *params);
+int cache_test_set_link_deserialize(struct blob_attr *msg, struct cache_test_set_link_params *params);
+int cache_test_set_link_serialize(struct blob_buf *b, const struct cache_test_set_link_params *params);
+int cache_test_link_info_deserialize(struct blob_attr *msg, struct cache_test_link_info *params);
+int cache_test_link_info_serialize(struct blob_buf *b, const struct cache_test_link_info *params);
+int cache_test_port_list_deserialize(struct blob_attr *msg, struct cache_test_port_list *params);
+int cache_test_port_list_serialize(struct blob_buf *b, const struct cache_test_port_list *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct cache_test_get_link_params *cache_test_get_link_dup(const struct cache_test_get_link_params *params);
+void cache_test_get_link_free(struct cache_test_get_link_params *params);
+struct cache_test_scan_params *cache_test_scan_dup(const struct cache_test_scan_params *params);
+void cache_test_scan_free(struct cache_test_scan_params *params);
+struct cache_test_set_link_params *cache_test_set_link_dup(const struct cache_test_set_link_params *params);
+void cache_test_set_link_free(struct cache_test_set_link_params *params);
+struct cache_test_link_info *cache_test_link_info_dup(const struct cache_test_link_info *params);
+void cache_test_link_info_free(struct cache_test_link_info *params);
+struct cache_test_port_list *cache_test_port_list_dup(const struct cache_test_port_list *params);
+void cache_test_port_list_free(struct cache_test_port_list *params);
+
+int cache_test_get_link_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct cache_test_link_info *reply);
+int cache_test_list_ports_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct cache_test_port_list *reply);
+int cache_test_scan_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct cache_test_link_info *reply);
+
+void cache_test_scan_complete(struct cache_test_scan_async_ctx *actx, int status, const struct cache_test_link_info *reply);
+
+extern struct ubus_object cache_test_object;
+
+void cache_test_get_link_cache_invalidate(void);
+void cache_test_list_ports_cache_invalidate(void);
+void cache_test_scan_cache_invalidate(void);
+void cache_test_cache_invalidate(void);
+
+void cache_test_object_cleanup(void);
+
+#endif /* __CACHE_TEST_OBJECT_H__ */
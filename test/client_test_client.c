@@ -0,0 +1,588 @@
+/* Generated from ubus IDL - client_test client */
+
+#include <libubox/blobmsg.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "client_test_client.h"
+
+static const struct blobmsg_policy client_test_client_remove_policy[] = {
+    { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+};
+
+#ifndef CLIENT_TEST_CLIENT_CACHE_SIZE
+#define CLIENT_TEST_CLIENT_CACHE_SIZE 32
+#endif
+
+/* Cached reply, keyed by method and the serialized params */
+struct client_test_client_cache_entry {
+    struct list_head list;
+    int method;
+    struct blob_attr *key;
+    struct blob_attr *reply;
+};
+
+/* Notification that invalidates each cacheable method */
+static const char *const client_test_client_cache_notify[] = {
+    "info_changed", /* get_info */
+    "changed", /* version */
+};
+
+static void client_test_client_cache_drop(struct client_test_client *client, struct client_test_client_cache_entry *entry)
+{
+    list_del(&entry->list);
+    client->n_cache--;
+    free(entry->key);
+    free(entry->reply);
+    free(entry);
+}
+
+static void client_test_client_cache_flush(struct client_test_client *client)
+{
+    struct client_test_client_cache_entry *entry;
+    struct client_test_client_cache_entry *tmp;
+
+    list_for_each_entry_safe(entry, tmp, &client->cache, list) {
+        client_test_client_cache_drop(client, entry);
+    }
+}
+
+/* Find a cached reply and mark it most recently used */
+static struct blob_attr *client_test_client_cache_lookup(struct client_test_client *client, int method, struct blob_attr *key)
+{
+    struct client_test_client_cache_entry *entry;
+
+    list_for_each_entry(entry, &client->cache, list) {
+        if (entry->method == method && blob_attr_equal(entry->key, key)) {
+            list_move(&entry->list, &client->cache);
+            return entry->reply;
+        }
+    }
+
+    return NULL;
+}
+
+static void client_test_client_cache_store(struct client_test_client *client, int method, struct blob_attr *key, struct blob_attr *reply)
+{
+    struct client_test_client_cache_entry *entry;
+
+    // Without a subscription nothing would invalidate the entry
+    if (!client->subscribed || !reply) {
+        return;
+    }
+
+    list_for_each_entry(entry, &client->cache, list) {
+        if (entry->method == method && blob_attr_equal(entry->key, key)) {
+            client_test_client_cache_drop(client, entry);
+            break;
+        }
+    }
+
+    if (client->n_cache >= CLIENT_TEST_CLIENT_CACHE_SIZE) {
+        client_test_client_cache_drop(client, list_last_entry(&client->cache, struct client_test_client_cache_entry, list));
+    }
+
+    entry = calloc(1, sizeof(*entry));
+    if (!entry) {
+        return;
+    }
+
+    entry->method = method;
+    entry->key = blob_memdup(key);
+    entry->reply = blob_memdup(reply);
+    if (!entry->key || !entry->reply) {
+        free(entry->key);
+        free(entry->reply);
+        free(entry);
+        return;
+    }
+
+    list_add(&entry->list, &client->cache);
+    client->n_cache++;
+}
+
+/* Drop the cached object id, the next call looks the object up again */
+static void client_test_client_forget(struct client_test_client *client)
+{
+    client->id = 0;
+    client->subscribed = false;
+    client_test_client_cache_flush(client);
+}
+
+static int client_test_client_resolve(struct client_test_client *client)
+{
+    int ret;
+
+    if (client->id) {
+        return UBUS_STATUS_OK;
+    }
+
+    ret = ubus_lookup_id(client->ctx, "client_test", &client->id);
+    if (ret != UBUS_STATUS_OK) {
+        client->id = 0;
+        return ret;
+    }
+
+    // Replies are only cached while notifications keep them coherent
+    client->subscribed = ubus_subscribe(client->ctx, &client->sub, client->id) == UBUS_STATUS_OK;
+
+    return UBUS_STATUS_OK;
+}
+
+static int client_test_client_notify_cb(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct client_test_client *client = container_of(obj, struct client_test_client, sub.obj);
+    struct client_test_client_cache_entry *entry;
+    struct client_test_client_cache_entry *tmp;
+
+    list_for_each_entry_safe(entry, tmp, &client->cache, list) {
+        if (!strcmp(client_test_client_cache_notify[entry->method], method)) {
+            client_test_client_cache_drop(client, entry);
+        }
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static void client_test_client_sub_remove_cb(struct ubus_context *ctx, struct ubus_subscriber *sub, uint32_t id)
+{
+    struct client_test_client *client = container_of(sub, struct client_test_client, sub);
+
+    if (id == client->id) {
+        client_test_client_forget(client);
+    }
+}
+
+static void client_test_client_remove_cb(struct ubus_context *ctx, struct ubus_event_handler *ev, const char *type, struct blob_attr *msg)
+{
+    struct client_test_client *client = container_of(ev, struct client_test_client, remove_ev);
+    struct blob_attr *tb[ARRAY_SIZE(client_test_client_remove_policy)];
+
+    blobmsg_parse(client_test_client_remove_policy, ARRAY_SIZE(client_test_client_remove_policy), tb, blob_data(msg), blob_len(msg));
+
+    if (tb[0] && blobmsg_get_u32(tb[0]) == client->id) {
+        client_test_client_forget(client);
+    }
+}
+
+static void client_test_client_data_cb(struct ubus_request *req, int type, struct blob_attr *msg)
+{
+    struct client_test_client *client = req->priv;
+
+    // The reply is only valid during the callback, keep a copy for the deserializer
+    free(client->reply_msg);
+    client->reply_msg = msg ? blob_memdup(msg) : NULL;
+}
+
+static int client_test_client_invoke(struct client_test_client *client, const char *method, int timeout)
+{
+    int retry;
+    int ret;
+
+    free(client->reply_msg);
+    client->reply_msg = NULL;
+
+    for (retry = 0; retry < 2; retry++) {
+        ret = client_test_client_resolve(client);
+        if (ret != UBUS_STATUS_OK) {
+            return ret;
+        }
+
+        ret = ubus_invoke(client->ctx, client->id, method, client->buf.head, client_test_client_data_cb, client, timeout);
+
+        // The object was re-registered before the remove event arrived, look it up again
+        if (ret != UBUS_STATUS_NOT_FOUND) {
+            break;
+        }
+        client_test_client_forget(client);
+    }
+
+    return ret;
+}
+
+/* Pipelined request, queued until the in-flight cap allows sending it */
+struct client_test_client_async {
+    struct list_head list;
+    struct client_test_client *client;
+    struct ubus_request req;
+    struct uloop_timeout timeout;
+    const char *method;
+    struct blob_attr *msg;
+    struct blob_attr *reply_msg;
+    int timeout_ms;
+    int cache_method;
+    void (*complete)(struct client_test_client_async *areq, int status);
+    void (*cb)(void);
+    void *priv;
+};
+
+static void client_test_client_async_free(struct client_test_client_async *areq)
+{
+    free(areq->msg);
+    free(areq->reply_msg);
+    free(areq);
+}
+
+static void client_test_client_async_finish(struct client_test_client_async *areq, int status)
+{
+    if (status == UBUS_STATUS_NOT_FOUND) {
+        client_test_client_forget(areq->client);
+    }
+
+    areq->complete(areq, status);
+    client_test_client_async_free(areq);
+}
+
+static void client_test_client_async_kick(struct client_test_client *client);
+
+static void client_test_client_async_data_cb(struct ubus_request *req, int type, struct blob_attr *msg)
+{
+    struct client_test_client_async *areq = req->priv;
+
+    free(areq->reply_msg);
+    areq->reply_msg = msg ? blob_memdup(msg) : NULL;
+}
+
+static void client_test_client_async_complete_cb(struct ubus_request *req, int ret)
+{
+    struct client_test_client_async *areq = req->priv;
+    struct client_test_client *client = areq->client;
+
+    uloop_timeout_cancel(&areq->timeout);
+    list_del(&areq->list);
+    client->n_active--;
+
+    if (ret == UBUS_STATUS_OK && areq->cache_method >= 0) {
+        client_test_client_cache_store(client, areq->cache_method, areq->msg, areq->reply_msg);
+    }
+
+    client_test_client_async_finish(areq, ret);
+    client_test_client_async_kick(client);
+}
+
+static void client_test_client_async_timeout_cb(struct uloop_timeout *t)
+{
+    struct client_test_client_async *areq = container_of(t, struct client_test_client_async, timeout);
+    struct client_test_client *client = areq->client;
+
+    // Aborting does not run the complete callback, finish the request here
+    ubus_abort_request(client->ctx, &areq->req);
+    list_del(&areq->list);
+    client->n_active--;
+
+    client_test_client_async_finish(areq, UBUS_STATUS_TIMEOUT);
+    client_test_client_async_kick(client);
+}
+
+static int client_test_client_async_start(struct client_test_client *client, struct client_test_client_async *areq)
+{
+    int ret;
+
+    ret = client_test_client_resolve(client);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = ubus_invoke_async(client->ctx, client->id, areq->method, areq->msg, &areq->req);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    areq->req.data_cb = client_test_client_async_data_cb;
+    areq->req.complete_cb = client_test_client_async_complete_cb;
+    areq->req.priv = areq;
+    ubus_complete_request_async(client->ctx, &areq->req);
+
+    if (areq->timeout_ms > 0) {
+        areq->timeout.cb = client_test_client_async_timeout_cb;
+        uloop_timeout_set(&areq->timeout, areq->timeout_ms);
+    }
+
+    list_add_tail(&areq->list, &client->active);
+    client->n_active++;
+
+    return UBUS_STATUS_OK;
+}
+
+/* Send queued requests while the in-flight cap allows it */
+static void client_test_client_async_kick(struct client_test_client *client)
+{
+    struct client_test_client_async *areq;
+    int ret;
+
+    while (client->n_active < client->max_inflight && !list_empty(&client->queued)) {
+        areq = list_first_entry(&client->queued, struct client_test_client_async, list);
+        list_del(&areq->list);
+
+        ret = client_test_client_async_start(client, areq);
+        if (ret != UBUS_STATUS_OK) {
+            client_test_client_async_finish(areq, ret);
+        }
+    }
+}
+
+static int client_test_client_async_submit(struct client_test_client *client, const char *method, int cache_method, void (*complete)(struct client_test_client_async *areq, int status), void (*cb)(void), void *priv, int timeout)
+{
+    struct client_test_client_async *areq;
+    struct blob_attr *cached = NULL;
+
+    if (cache_method >= 0) {
+        cached = client_test_client_cache_lookup(client, cache_method, client->buf.head);
+    }
+
+    areq = calloc(1, sizeof(*areq));
+    if (!areq) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    areq->client = client;
+    areq->method = method;
+    areq->timeout_ms = timeout;
+    areq->cache_method = cache_method;
+    areq->complete = complete;
+    areq->cb = cb;
+    areq->priv = priv;
+
+    // Served from the cache, complete right away without a round trip
+    if (cached) {
+        areq->reply_msg = blob_memdup(cached);
+        client_test_client_async_finish(areq, areq->reply_msg ? UBUS_STATUS_OK : UBUS_STATUS_UNKNOWN_ERROR);
+        return UBUS_STATUS_OK;
+    }
+
+    // The request buffer is reused by the next call, keep a copy until it is sent
+    areq->msg = blob_memdup(client->buf.head);
+    if (!areq->msg) {
+        free(areq);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    list_add_tail(&areq->list, &client->queued);
+
+    client_test_client_async_kick(client);
+
+    return UBUS_STATUS_OK;
+}
+
+int client_test_client_init(struct client_test_client *client, struct ubus_context *ctx)
+{
+    int ret;
+
+    memset(client, 0, sizeof(*client));
+    client->ctx = ctx;
+    client->remove_ev.cb = client_test_client_remove_cb;
+    INIT_LIST_HEAD(&client->queued);
+    INIT_LIST_HEAD(&client->active);
+    client->max_inflight = CLIENT_TEST_CLIENT_MAX_INFLIGHT;
+    INIT_LIST_HEAD(&client->cache);
+    client->sub.cb = client_test_client_notify_cb;
+    client->sub.remove_cb = client_test_client_sub_remove_cb;
+
+    ret = ubus_register_subscriber(ctx, &client->sub);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_register_event_handler(ctx, &client->remove_ev, "ubus.object.remove");
+}
+
+void client_test_client_free(struct client_test_client *client)
+{
+    struct client_test_client_async *areq;
+    struct client_test_client_async *tmp;
+
+    // Pending requests are dropped without running their callbacks
+    list_for_each_entry_safe(areq, tmp, &client->active, list) {
+        uloop_timeout_cancel(&areq->timeout);
+        ubus_abort_request(client->ctx, &areq->req);
+        list_del(&areq->list);
+        client_test_client_async_free(areq);
+    }
+    list_for_each_entry_safe(areq, tmp, &client->queued, list) {
+        list_del(&areq->list);
+        client_test_client_async_free(areq);
+    }
+    client->n_active = 0;
+
+    client_test_client_cache_flush(client);
+    client->subscribed = false;
+    ubus_unregister_subscriber(client->ctx, &client->sub);
+
+    ubus_unregister_event_handler(client->ctx, &client->remove_ev);
+    blob_buf_free(&client->buf);
+    free(client->reply_msg);
+    client->reply_msg = NULL;
+    client->id = 0;
+}
+
+int client_test_call_get_info(struct client_test_client *client, const struct client_test_get_info_params *params, struct client_test_info *reply, int timeout)
+{
+    struct blob_attr *cached;
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = client_test_get_info_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    cached = client_test_client_cache_lookup(client, 0, client->buf.head);
+    if (cached) {
+        free(client->reply_msg);
+        client->reply_msg = blob_memdup(cached);
+        if (!client->reply_msg) {
+            return UBUS_STATUS_UNKNOWN_ERROR;
+        }
+        return client_test_info_deserialize(client->reply_msg, reply);
+    }
+
+    ret = client_test_client_invoke(client, "get_info", timeout);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    if (!client->reply_msg) {
+        return UBUS_STATUS_NO_DATA;
+    }
+    client_test_client_cache_store(client, 0, client->buf.head, client->reply_msg);
+
+    // Strings in the reply point into the client and stay valid until its next call
+    return client_test_info_deserialize(client->reply_msg, reply);
+}
+
+int client_test_call_set_info(struct client_test_client *client, const struct client_test_info *params, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = client_test_info_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return client_test_client_invoke(client, "set_info", timeout);
+}
+
+int client_test_call_version(struct client_test_client *client, struct client_version *reply, int timeout)
+{
+    struct blob_attr *cached;
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+
+    cached = client_test_client_cache_lookup(client, 1, client->buf.head);
+    if (cached) {
+        free(client->reply_msg);
+        client->reply_msg = blob_memdup(cached);
+        if (!client->reply_msg) {
+            return UBUS_STATUS_UNKNOWN_ERROR;
+        }
+        return client_version_deserialize(client->reply_msg, reply);
+    }
+
+    ret = client_test_client_invoke(client, "version", timeout);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    if (!client->reply_msg) {
+        return UBUS_STATUS_NO_DATA;
+    }
+    client_test_client_cache_store(client, 1, client->buf.head, client->reply_msg);
+
+    // Strings in the reply point into the client and stay valid until its next call
+    return client_version_deserialize(client->reply_msg, reply);
+}
+
+int client_test_call_restart(struct client_test_client *client, int timeout)
+{
+    blob_buf_init(&client->buf, 0);
+
+    return client_test_client_invoke(client, "restart", timeout);
+}
+
+static void client_test_call_get_info_async_complete(struct client_test_client_async *areq, int status)
+{
+    client_test_call_get_info_cb cb = (client_test_call_get_info_cb)areq->cb;
+    struct client_test_info reply;
+
+    memset(&reply, 0, sizeof(reply));
+    if (status == UBUS_STATUS_OK && !areq->reply_msg) {
+        status = UBUS_STATUS_NO_DATA;
+    }
+    if (status == UBUS_STATUS_OK) {
+        status = client_test_info_deserialize(areq->reply_msg, &reply);
+    }
+
+    // The reply is only valid during the callback
+    cb(areq->client, status, status == UBUS_STATUS_OK ? &reply : NULL, areq->priv);
+}
+
+int client_test_call_get_info_async(struct client_test_client *client, const struct client_test_get_info_params *params, client_test_call_get_info_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = client_test_get_info_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return client_test_client_async_submit(client, "get_info", 0, client_test_call_get_info_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static void client_test_call_set_info_async_complete(struct client_test_client_async *areq, int status)
+{
+    client_test_call_set_info_cb cb = (client_test_call_set_info_cb)areq->cb;
+
+    cb(areq->client, status, areq->priv);
+}
+
+int client_test_call_set_info_async(struct client_test_client *client, const struct client_test_info *params, client_test_call_set_info_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = client_test_info_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return client_test_client_async_submit(client, "set_info", -1, client_test_call_set_info_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static void client_test_call_version_async_complete(struct client_test_client_async *areq, int status)
+{
+    client_test_call_version_cb cb = (client_test_call_version_cb)areq->cb;
+    struct client_version reply;
+
+    memset(&reply, 0, sizeof(reply));
+    if (status == UBUS_STATUS_OK && !areq->reply_msg) {
+        status = UBUS_STATUS_NO_DATA;
+    }
+    if (status == UBUS_STATUS_OK) {
+        status = client_version_deserialize(areq->reply_msg, &reply);
+    }
+
+    // The reply is only valid during the callback
+    cb(areq->client, status, status == UBUS_STATUS_OK ? &reply : NULL, areq->priv);
+}
+
+int client_test_call_version_async(struct client_test_client *client, client_test_call_version_cb cb, void *priv, int timeout)
+{
+    blob_buf_init(&client->buf, 0);
+
+    return client_test_client_async_submit(client, "version", 1, client_test_call_version_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static void client_test_call_restart_async_complete(struct client_test_client_async *areq, int status)
+{
+    client_test_call_restart_cb cb = (client_test_call_restart_cb)areq->cb;
+
+    cb(areq->client, status, areq->priv);
+}
+
+int client_test_call_restart_async(struct client_test_client *client, client_test_call_restart_cb cb, void *priv, int timeout)
+{
+    blob_buf_init(&client->buf, 0);
+
+    return client_test_client_async_submit(client, "restart", -1, client_test_call_restart_async_complete, (void (*)(void))cb, priv, timeout);
+}
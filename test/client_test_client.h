@@ -0,0 +1,48 @@
+/* Generated from ubus IDL - client_test client */
+
+#ifndef __CLIENT_TEST_CLIENT_H__
+#define __CLIENT_TEST_CLIENT_H__
+
+#include <libubus.h>
+#include "client_test_object.h"
+
+/* Default cap of pipelined requests in flight per client */
+#ifndef CLIENT_TEST_CLIENT_MAX_INFLIGHT
+#define CLIENT_TEST_CLIENT_MAX_INFLIGHT 16
+#endif
+
+struct client_test_client {
+    struct ubus_context *ctx;
+    uint32_t id;
+    struct ubus_event_handler remove_ev;
+    struct blob_buf buf;
+    struct blob_attr *reply_msg;
+    struct list_head queued;
+    struct list_head active;
+    unsigned int n_active;
+    unsigned int max_inflight;
+    struct ubus_subscriber sub;
+    bool subscribed;
+    struct list_head cache;
+    unsigned int n_cache;
+};
+
+typedef void (*client_test_call_get_info_cb)(struct client_test_client *client, int status, const struct client_test_info *reply, void *priv);
+typedef void (*client_test_call_set_info_cb)(struct client_test_client *client, int status, void *priv);
+typedef void (*client_test_call_version_cb)(struct client_test_client *client, int status, const struct client_version *reply, void *priv);
+typedef void (*client_test_call_restart_cb)(struct client_test_client *client, int status, void *priv);
+
+int client_test_client_init(struct client_test_client *client, struct ubus_context *ctx);
+void client_test_client_free(struct client_test_client *client);
+
+int client_test_call_get_info(struct client_test_client *client, const struct client_test_get_info_params *params, struct client_test_info *reply, int timeout);
+int client_test_call_set_info(struct client_test_client *client, const struct client_test_info *params, int timeout);
+int client_test_call_version(struct client_test_client *client, struct client_version *reply, int timeout);
+int client_test_call_restart(struct client_test_client *client, int timeout);
+
+int client_test_call_get_info_async(struct client_test_client *client, const struct client_test_get_info_params *params, client_test_call_get_info_cb cb, void *priv, int timeout);
+int client_test_call_set_info_async(struct client_test_client *client, const struct client_test_info *params, client_test_call_set_info_cb cb, void *priv, int timeout);
+int client_test_call_version_async(struct client_test_client *client, client_test_call_version_cb cb, void *priv, int timeout);
+int client_test_call_restart_async(struct client_test_client *client, client_test_call_restart_cb cb, void *priv, int timeout);
+
+#endif /* __CLIENT_TEST_CLIENT_H__ */
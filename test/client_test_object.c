@@ -0,0 +1,271 @@
+/* Generated from ubus IDL - client_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "client_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy client_test_get_info_policy[] = {
+    [CLIENT_TEST_GET_INFO_VERBOSE] = { .name = "verbose", .type = BLOBMSG_TYPE_BOOL }
+};
+
+int client_test_get_info_deserialize(struct blob_attr *msg, struct client_test_get_info_params *params)
+{
+    struct blob_attr *tb_client_test_get_info[__CLIENT_TEST_GET_INFO_MAX];
+    if (blobmsg_parse(client_test_get_info_policy, ARRAY_SIZE(client_test_get_info_policy), tb_client_test_get_info, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    UBUS_IDL_GET_OPTIONAL(u8, tb_client_test_get_info, CLIENT_TEST_GET_INFO_VERBOSE, params->verbose, params, FIELD, CLIENT_TEST_GET_INFO_HAS_VERBOSE);
+    return UBUS_STATUS_OK;
+}
+
+int client_test_get_info_serialize(struct blob_buf *b, const struct client_test_get_info_params *params)
+{
+    if (UBUS_IDL_HAS_FIELD(params, CLIENT_TEST_GET_INFO_HAS_VERBOSE)) {
+        blobmsg_add_u8(b, "verbose", params->verbose ? 1 : 0);
+    }
+    return UBUS_STATUS_OK;
+}
+
+struct client_test_get_info_params *client_test_get_info_dup(const struct client_test_get_info_params *params)
+{
+    size_t len = sizeof(*params);
+    struct client_test_get_info_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void client_test_get_info_free(struct client_test_get_info_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy client_test_info_policy[] = {
+    [CLIENT_TEST_INFO_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING },
+    [CLIENT_TEST_INFO_UPTIME] = { .name = "uptime", .type = BLOBMSG_TYPE_INT64 },
+    [CLIENT_TEST_INFO_LOAD] = { .name = "load", .type = BLOBMSG_TYPE_DOUBLE }
+};
+
+int client_test_info_deserialize(struct blob_attr *msg, struct client_test_info *params)
+{
+    struct blob_attr *tb_client_test_info[__CLIENT_TEST_INFO_MAX];
+    if (blobmsg_parse(client_test_info_policy, ARRAY_SIZE(client_test_info_policy), tb_client_test_info, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_client_test_info[CLIENT_TEST_INFO_NAME] || !tb_client_test_info[CLIENT_TEST_INFO_UPTIME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->name = blobmsg_get_string(tb_client_test_info[CLIENT_TEST_INFO_NAME]);
+    params->uptime = blobmsg_get_u64(tb_client_test_info[CLIENT_TEST_INFO_UPTIME]);
+
+    UBUS_IDL_GET_OPTIONAL(double, tb_client_test_info, CLIENT_TEST_INFO_LOAD, params->load, params, FIELD, CLIENT_TEST_INFO_HAS_LOAD);
+    return UBUS_STATUS_OK;
+}
+
+int client_test_info_serialize(struct blob_buf *b, const struct client_test_info *params)
+{
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    UBUS_IDL_ADD(u64, b, "uptime", params->uptime);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "load", params->load, params, FIELD, CLIENT_TEST_INFO_HAS_LOAD);
+    return UBUS_STATUS_OK;
+}
+
+struct client_test_info *client_test_info_dup(const struct client_test_info *params)
+{
+    size_t len = sizeof(*params);
+    struct client_test_info *copy;
+    char *p;
+
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void client_test_info_free(struct client_test_info *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy client_version_policy[] = {
+    [CLIENT_VERSION_MAJOR] = { .name = "major", .type = BLOBMSG_TYPE_INT32 },
+    [CLIENT_VERSION_MINOR] = { .name = "minor", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int client_version_deserialize(struct blob_attr *msg, struct client_version *params)
+{
+    struct blob_attr *tb_client_version[__CLIENT_VERSION_MAX];
+    if (blobmsg_parse(client_version_policy, ARRAY_SIZE(client_version_policy), tb_client_version, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_client_version[CLIENT_VERSION_MAJOR] || !tb_client_version[CLIENT_VERSION_MINOR]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->major = blobmsg_get_u32(tb_client_version[CLIENT_VERSION_MAJOR]);
+    params->minor = blobmsg_get_u32(tb_client_version[CLIENT_VERSION_MINOR]);
+    return UBUS_STATUS_OK;
+}
+
+int client_version_serialize(struct blob_buf *b, const struct client_version *params)
+{
+    UBUS_IDL_ADD(u32, b, "major", params->major);
+    UBUS_IDL_ADD(u32, b, "minor", params->minor);
+    return UBUS_STATUS_OK;
+}
+
+struct client_version *client_version_dup(const struct client_version *params)
+{
+    size_t len = sizeof(*params);
+    struct client_version *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void client_version_free(struct client_version *params)
+{
+    free(params);
+}
+
+/* Server side, left out when only the client and the codecs are linked */
+#ifndef UBUS_IDL_CLIENT_ONLY
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf client_test_reply_buf;
+
+int client_test_get_info_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct client_test_info *reply)
+{
+    int ret;
+
+    blob_buf_init(&client_test_reply_buf, 0);
+    ret = client_test_info_serialize(&client_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, client_test_reply_buf.head);
+}
+
+int client_test_version_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct client_version *reply)
+{
+    int ret;
+
+    blob_buf_init(&client_test_reply_buf, 0);
+    ret = client_version_serialize(&client_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, client_test_reply_buf.head);
+}
+
+static const struct ubus_method client_test_methods[] = {
+    UBUS_METHOD("get_info", client_test_get_info_handler, client_test_get_info_policy),
+    UBUS_METHOD("set_info", client_test_set_info_handler, client_test_info_policy),
+    UBUS_METHOD_NOARG("version", client_test_version_handler),
+    UBUS_METHOD_NOARG("restart", client_test_restart_handler)
+};
+
+static struct ubus_object_type client_test_object_type =
+    UBUS_OBJECT_TYPE("client_test", client_test_methods);
+
+struct ubus_object client_test_object = {
+    .name = "client_test",
+    .type = &client_test_object_type,
+    .methods = client_test_methods,
+    .n_methods = ARRAY_SIZE(client_test_methods),
+};
+
+int client_test_notify_info_changed(struct ubus_context *ctx)
+{
+    // Clients drop cached replies of the methods bound to this notification
+    if (!client_test_object.has_subscribers) {
+        return UBUS_STATUS_OK;
+    }
+
+    blob_buf_init(&client_test_reply_buf, 0);
+    return ubus_notify(ctx, &client_test_object, "info_changed", client_test_reply_buf.head, -1);
+}
+
+int client_test_notify_changed(struct ubus_context *ctx)
+{
+    // Clients drop cached replies of the methods bound to this notification
+    if (!client_test_object.has_subscribers) {
+        return UBUS_STATUS_OK;
+    }
+
+    blob_buf_init(&client_test_reply_buf, 0);
+    return ubus_notify(ctx, &client_test_object, "changed", client_test_reply_buf.head, -1);
+}
+
+void client_test_object_cleanup(void)
+{
+    blob_buf_free(&client_test_reply_buf);
+}
+
+#endif /* UBUS_IDL_CLIENT_ONLY */
@@ -0,0 +1,101 @@
+/* Generated from ubus IDL - client_test */
+
+#ifndef __CLIENT_TEST_OBJECT_H__
+#define __CLIENT_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct client_version {
+    int32_t major;
+    int32_t minor;
+};
+_Static_assert(sizeof(struct client_version) == UBUS_IDL_PACKED_SIZE(struct client_version, 2 * sizeof(int32_t)),
+               "struct client_version has padding between members");
+
+struct client_test_info {
+    int64_t uptime;
+    double load;
+    const char * name;
+    uint8_t has_fields;
+};
+#define CLIENT_TEST_INFO_HAS_LOAD 0
+_Static_assert(sizeof(struct client_test_info) == UBUS_IDL_PACKED_SIZE(struct client_test_info, sizeof(int64_t) + sizeof(double) + sizeof(const char *) + sizeof(uint8_t)),
+               "struct client_test_info has padding between members");
+
+struct client_test_get_info_params {
+    bool verbose;
+    uint8_t has_fields;
+};
+#define CLIENT_TEST_GET_INFO_HAS_VERBOSE 0
+_Static_assert(sizeof(struct client_test_get_info_params) == UBUS_IDL_PACKED_SIZE(struct client_test_get_info_params, sizeof(bool) + sizeof(uint8_t)),
+               "struct client_test_get_info_params has padding between members");
+
+enum {
+    CLIENT_TEST_GET_INFO_VERBOSE,
+    __CLIENT_TEST_GET_INFO_MAX
+};
+
+enum {
+    CLIENT_TEST_INFO_NAME,
+    CLIENT_TEST_INFO_UPTIME,
+    CLIENT_TEST_INFO_LOAD,
+    __CLIENT_TEST_INFO_MAX
+};
+
+enum {
+    CLIENT_VERSION_MAJOR,
+    CLIENT_VERSION_MINOR,
+    __CLIENT_VERSION_MAX
+};
+
+int client_test_get_info_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int client_test_set_info_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int client_test_version_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int client_test_restart_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+int client_test_get_info_deserialize(struct blob_attr *msg, struct client_test_get_info_params *params);
+int client_test_get_info_serialize(struct blob_buf *b, const struct client_test_get_info_params *params);
+int client_test_info_deserialize(struct blob_attr *msg, struct client_test_info *params);
+int client_test_info_serialize(struct blob_buf *b, const struct client_test_info *params);
+int client_version_deserialize(struct blob_attr *msg, struct client_version *params);
+int client_version_serialize(struct blob_buf *b, const struct client_version *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct client_test_get_info_params *client_test_get_info_dup(const struct client_test_get_info_params *params);
+void client_test_get_info_free(struct client_test_get_info_params *params);
+struct client_test_info *client_test_info_dup(const struct client_test_info *params);
+void client_test_info_free(struct client_test_info *params);
+struct client_version *client_version_dup(const struct client_version *params);
+void client_version_free(struct client_version *params);
+
+int client_test_get_info_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct client_test_info *reply);
+int client_test_version_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct client_version *reply);
+
+extern struct ubus_object client_test_object;
+
+int client_test_notify_info_changed(struct ubus_context *ctx);
+int client_test_notify_changed(struct ubus_context *ctx);
+
+void client_test_object_cleanup(void);
+
+#endif /* __CLIENT_TEST_OBJECT_H__ */
@@ -0,0 +1,775 @@
+/* Generated from ubus IDL - codec_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stddef.h>
+#include <stdlib.h>
+#include <string.h>
+#include "codec_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+#define UBUS_IDL_TABLE_MAX_FIELDS 10
+
+enum {
+    UBUS_IDL_T_STRING,
+    UBUS_IDL_T_INT8,
+    UBUS_IDL_T_INT16,
+    UBUS_IDL_T_INT32,
+    UBUS_IDL_T_INT64,
+    UBUS_IDL_T_BOOL,
+    UBUS_IDL_T_DOUBLE,
+    UBUS_IDL_T_BLOB,
+    UBUS_IDL_T_TABLE,
+    UBUS_IDL_T_ENUM,
+};
+
+/* Name table and perfect hash of an enum, C enum members have the size of an int */
+struct ubus_idl_enum_desc {
+    const char *const *names;
+    const void *slots;
+    uint32_t hash_basis;
+    uint32_t hash_mask;
+    uint16_t max;
+    uint8_t slot_size;
+    uint8_t wire_int;
+};
+
+/* One struct member: names and blobmsg types come from the policy at the same index */
+struct ubus_idl_field_desc {
+    const struct ubus_idl_type_desc *nested;
+    const struct ubus_idl_enum_desc *values;
+    uint16_t offset;
+    uint16_t bit;
+    uint8_t kind;
+    uint8_t optional;
+};
+
+struct ubus_idl_type_desc {
+    const struct blobmsg_policy *policy;
+    const struct ubus_idl_field_desc *fields;
+    uint16_t n_fields;
+    uint16_t presence_offset;
+    uint16_t presence_size;
+};
+
+/* Presence bitsets are one integer of 1 to 8 bytes, or an array of 64-bit words */
+static bool ubus_idl_table_has(const void *bits, unsigned int size, unsigned int bit)
+{
+    switch (size) {
+    case 1:
+        return (*(const uint8_t *)bits >> bit) & 1U;
+    case 2:
+        return (*(const uint16_t *)bits >> bit) & 1U;
+    case 4:
+        return (*(const uint32_t *)bits >> bit) & 1U;
+    default:
+        return (((const uint64_t *)bits)[bit / 64] >> (bit % 64)) & 1U;
+    }
+}
+
+static void ubus_idl_table_set(void *bits, unsigned int size, unsigned int bit)
+{
+    switch (size) {
+    case 1:
+        *(uint8_t *)bits |= (uint8_t)(1U << bit);
+        break;
+    case 2:
+        *(uint16_t *)bits |= (uint16_t)(1U << bit);
+        break;
+    case 4:
+        *(uint32_t *)bits |= 1U << bit;
+        break;
+    default:
+        ((uint64_t *)bits)[bit / 64] |= (uint64_t)1 << (bit % 64);
+        break;
+    }
+}
+
+/* Value of an enum attribute, by index or by name as the generated *_parse() functions do */
+static int ubus_idl_table_enum_get(const struct ubus_idl_enum_desc *values, struct blob_attr *attr, int *value)
+{
+    const char *name;
+    const char *p;
+    uint32_t hash;
+    unsigned int slot;
+
+    if (values->wire_int) {
+        if (blobmsg_get_u32(attr) >= values->max) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        *value = (int)blobmsg_get_u32(attr);
+        return UBUS_STATUS_OK;
+    }
+
+    name = blobmsg_get_string(attr);
+    hash = values->hash_basis;
+    for (p = name; *p; p++) {
+        hash = (hash ^ (uint8_t)*p) * 16777619u;
+    }
+
+    hash &= values->hash_mask;
+    slot = values->slot_size == 1 ? ((const uint8_t *)values->slots)[hash] : ((const uint16_t *)values->slots)[hash];
+    if (!slot || strcmp(values->names[slot - 1], name) != 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *value = (int)(slot - 1);
+    return UBUS_STATUS_OK;
+}
+
+static int ubus_idl_table_deserialize(const struct ubus_idl_type_desc *desc, struct blob_attr *msg, void *params)
+{
+    struct blob_attr *tb[UBUS_IDL_TABLE_MAX_FIELDS];
+    const struct ubus_idl_field_desc *field;
+    char *base = params;
+    unsigned int i;
+
+    if (blobmsg_parse(desc->policy, desc->n_fields, tb, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    // Like the unrolled decoder, params is untouched when a required field is missing
+    for (i = 0; i < desc->n_fields; i++) {
+        if (!tb[i] && !desc->fields[i].optional) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+    }
+
+    if (desc->presence_size) {
+        memset(base + desc->presence_offset, 0, desc->presence_size);
+    }
+
+    for (i = 0, field = desc->fields; i < desc->n_fields; i++, field++) {
+        void *member = base + field->offset;
+
+        if (!tb[i]) {
+            continue;
+        }
+
+        switch (field->kind) {
+        case UBUS_IDL_T_STRING:
+            *(const char **)member = blobmsg_get_string(tb[i]);
+            break;
+        case UBUS_IDL_T_INT8:
+            *(int8_t *)member = (int8_t)blobmsg_get_u8(tb[i]);
+            break;
+        case UBUS_IDL_T_INT16:
+            *(int16_t *)member = (int16_t)blobmsg_get_u16(tb[i]);
+            break;
+        case UBUS_IDL_T_INT32:
+            *(int32_t *)member = (int32_t)blobmsg_get_u32(tb[i]);
+            break;
+        case UBUS_IDL_T_INT64:
+            *(int64_t *)member = (int64_t)blobmsg_get_u64(tb[i]);
+            break;
+        case UBUS_IDL_T_BOOL:
+            *(bool *)member = blobmsg_get_u8(tb[i]) != 0;
+            break;
+        case UBUS_IDL_T_DOUBLE:
+            *(double *)member = blobmsg_get_double(tb[i]);
+            break;
+        case UBUS_IDL_T_BLOB:
+            *(struct blob_attr **)member = tb[i];
+            break;
+        case UBUS_IDL_T_ENUM:
+            if (ubus_idl_table_enum_get(field->values, tb[i], (int *)member) != UBUS_STATUS_OK) {
+                return UBUS_STATUS_INVALID_ARGUMENT;
+            }
+            break;
+        default:
+            // Nested tables need storage from the caller, they are left as is
+            continue;
+        }
+
+        if (field->optional) {
+            ubus_idl_table_set(base + desc->presence_offset, desc->presence_size, field->bit);
+        }
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static int ubus_idl_table_serialize(const struct ubus_idl_type_desc *desc, struct blob_buf *b, const void *params)
+{
+    const struct ubus_idl_field_desc *field;
+    const char *base = params;
+    unsigned int i;
+    void *cookie;
+    int ret;
+
+    for (i = 0, field = desc->fields; i < desc->n_fields; i++, field++) {
+        const void *member = base + field->offset;
+        const char *name = desc->policy[i].name;
+
+        if (field->optional && !ubus_idl_table_has(base + desc->presence_offset, desc->presence_size, field->bit)) {
+            continue;
+        }
+
+        switch (field->kind) {
+        case UBUS_IDL_T_STRING:
+            ret = *(const char *const *)member ? blobmsg_add_string(b, name, *(const char *const *)member) : -1;
+            break;
+        case UBUS_IDL_T_INT8:
+            ret = blobmsg_add_u8(b, name, (uint8_t)*(const int8_t *)member);
+            break;
+        case UBUS_IDL_T_INT16:
+            ret = blobmsg_add_u16(b, name, (uint16_t)*(const int16_t *)member);
+            break;
+        case UBUS_IDL_T_INT32:
+            ret = blobmsg_add_u32(b, name, (uint32_t)*(const int32_t *)member);
+            break;
+        case UBUS_IDL_T_INT64:
+            ret = blobmsg_add_u64(b, name, (uint64_t)*(const int64_t *)member);
+            break;
+        case UBUS_IDL_T_BOOL:
+            ret = blobmsg_add_u8(b, name, *(const bool *)member ? 1 : 0);
+            break;
+        case UBUS_IDL_T_DOUBLE:
+            ret = blobmsg_add_double(b, name, *(const double *)member);
+            break;
+        case UBUS_IDL_T_BLOB: {
+            const struct blob_attr *attr = *(struct blob_attr *const *)member;
+
+            ret = attr ? blobmsg_add_field(b, desc->policy[i].type, name, blob_data(attr), blob_len(attr)) : -1;
+            break;
+        }
+        case UBUS_IDL_T_ENUM: {
+            unsigned int value = (unsigned int)*(const int *)member;
+
+            if (value >= field->values->max) {
+                return UBUS_STATUS_INVALID_ARGUMENT;
+            }
+            if (field->values->wire_int) {
+                ret = blobmsg_add_u32(b, name, value);
+            } else {
+                ret = blobmsg_add_string(b, name, field->values->names[value]);
+            }
+            break;
+        }
+        default: {
+            const void *nested = *(const void *const *)member;
+
+            // Without a descriptor in this file, or a value, the table is skipped
+            if (!field->nested || !nested) {
+                continue;
+            }
+            cookie = blobmsg_open_table(b, name);
+            if (!cookie) {
+                return UBUS_STATUS_INVALID_ARGUMENT;
+            }
+            ret = ubus_idl_table_serialize(field->nested, b, nested);
+            blobmsg_close_table(b, cookie);
+            if (ret != UBUS_STATUS_OK) {
+                return ret;
+            }
+            continue;
+        }
+        }
+
+        if (ret < 0) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static const struct ubus_idl_type_desc address_desc;
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+/* Copy a blob to the cursor of a *_dup() allocation, blobs go first after the struct to stay aligned */
+static struct blob_attr *ubus_idl_dup_blob(char **p, const struct blob_attr *attr)
+{
+    struct blob_attr *copy = (struct blob_attr *)*p;
+
+    memcpy(copy, attr, blob_pad_len(attr));
+    *p += blob_pad_len(attr);
+    return copy;
+}
+
+/* String or blob held by a member, NULL when it is absent or of another kind */
+static const void *ubus_idl_table_pointer(const struct ubus_idl_type_desc *desc, const char *base, const struct ubus_idl_field_desc *field)
+{
+    if (field->kind != UBUS_IDL_T_STRING && field->kind != UBUS_IDL_T_BLOB) {
+        return NULL;
+    }
+    if (field->optional && !ubus_idl_table_has(base + desc->presence_offset, desc->presence_size, field->bit)) {
+        return NULL;
+    }
+
+    return *(const void *const *)(base + field->offset);
+}
+
+/* Copy a struct of size bytes to the start of an allocation, its strings and blobs go after the first head bytes */
+static void *ubus_idl_table_dup(const struct ubus_idl_type_desc *desc, const void *params, size_t size, size_t head)
+{
+    const struct ubus_idl_field_desc *field;
+    const char *base = params;
+    const void *member;
+    size_t len = head;
+    unsigned int i;
+    char *copy;
+    char *p;
+
+    for (i = 0, field = desc->fields; i < desc->n_fields; i++, field++) {
+        member = ubus_idl_table_pointer(desc, base, field);
+        if (member) {
+            len += field->kind == UBUS_IDL_T_STRING ? strlen(member) + 1 : blob_pad_len(member);
+        }
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, size);
+    p = copy + head;
+
+    // Blobs first, then strings, nested tables are never decoded and not kept
+    for (i = 0, field = desc->fields; i < desc->n_fields; i++, field++) {
+        member = ubus_idl_table_pointer(desc, base, field);
+        if (field->kind == UBUS_IDL_T_BLOB) {
+            *(struct blob_attr **)(copy + field->offset) = member ? ubus_idl_dup_blob(&p, member) : NULL;
+        } else if (field->kind == UBUS_IDL_T_TABLE) {
+            *(void **)(copy + field->offset) = NULL;
+        }
+    }
+    for (i = 0, field = desc->fields; i < desc->n_fields; i++, field++) {
+        member = ubus_idl_table_pointer(desc, base, field);
+        if (field->kind == UBUS_IDL_T_STRING) {
+            *(const char **)(copy + field->offset) = member ? ubus_idl_dup_string(&p, member) : NULL;
+        }
+    }
+
+    return copy;
+}
+
+static const char *const scope_names[] = {
+    [SCOPE_HOST] = "host",
+    [SCOPE_LINK] = "link",
+    [SCOPE_GLOBAL] = "global",
+};
+
+/* FNV-1a slots of the names, collision free for the basis below, 0 when empty or value + 1 */
+static const uint8_t scope_slots[8] = { 0, 2, 0, 0, 0, 0, 3, 1 };
+
+const char *scope_name(enum scope value)
+{
+    if ((unsigned int)value >= __SCOPE_MAX) {
+        return NULL;
+    }
+
+    return scope_names[value];
+}
+
+int scope_parse(const char *name, enum scope *value)
+{
+    uint32_t hash = 0x811c9dc5u;
+    unsigned int slot;
+    const char *p;
+
+    for (p = name; *p; p++) {
+        hash = (hash ^ (uint8_t)*p) * 16777619u;
+    }
+
+    // Any other name may share a slot with a value, a single compare tells them apart
+    slot = scope_slots[hash & 7];
+    if (!slot || strcmp(scope_names[slot - 1], name) != 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *value = (enum scope)(slot - 1);
+    return UBUS_STATUS_OK;
+}
+
+static const struct ubus_idl_enum_desc scope_enum_desc = {
+    .names = scope_names,
+    .slots = scope_slots,
+    .hash_basis = 0x811c9dc5u,
+    .hash_mask = 7,
+    .max = __SCOPE_MAX,
+    .slot_size = sizeof(scope_slots[0]),
+    .wire_int = 1,
+};
+
+static const char *const codec_test_state_names[] = {
+    [CODEC_TEST_STATE_DOWN] = "down",
+    [CODEC_TEST_STATE_UP] = "up",
+    [CODEC_TEST_STATE_DORMANT] = "dormant",
+};
+
+/* FNV-1a slots of the names, collision free for the basis below, 0 when empty or value + 1 */
+static const uint8_t codec_test_state_slots[8] = { 2, 0, 0, 0, 0, 1, 3, 0 };
+
+const char *codec_test_state_name(enum codec_test_state value)
+{
+    if ((unsigned int)value >= __CODEC_TEST_STATE_MAX) {
+        return NULL;
+    }
+
+    return codec_test_state_names[value];
+}
+
+int codec_test_state_parse(const char *name, enum codec_test_state *value)
+{
+    uint32_t hash = 0x811c9dc5u;
+    unsigned int slot;
+    const char *p;
+
+    for (p = name; *p; p++) {
+        hash = (hash ^ (uint8_t)*p) * 16777619u;
+    }
+
+    // Any other name may share a slot with a value, a single compare tells them apart
+    slot = codec_test_state_slots[hash & 7];
+    if (!slot || strcmp(codec_test_state_names[slot - 1], name) != 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *value = (enum codec_test_state)(slot - 1);
+    return UBUS_STATUS_OK;
+}
+
+static const struct ubus_idl_enum_desc codec_test_state_enum_desc = {
+    .names = codec_test_state_names,
+    .slots = codec_test_state_slots,
+    .hash_basis = 0x811c9dc5u,
+    .hash_mask = 7,
+    .max = __CODEC_TEST_STATE_MAX,
+    .slot_size = sizeof(codec_test_state_slots[0]),
+    .wire_int = 0,
+};
+
+static const struct blobmsg_policy codec_test_get_interface_policy[] = {
+    [CODEC_TEST_GET_INTERFACE_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING }
+};
+
+static const struct ubus_idl_field_desc codec_test_get_interface_desc_fields[] = {
+    [CODEC_TEST_GET_INTERFACE_IFNAME] = {
+        .offset = offsetof(struct codec_test_get_interface_params, ifname),
+        .kind = UBUS_IDL_T_STRING,
+    },
+};
+
+static const struct ubus_idl_type_desc codec_test_get_interface_desc = {
+    .policy = codec_test_get_interface_policy,
+    .fields = codec_test_get_interface_desc_fields,
+    .n_fields = ARRAY_SIZE(codec_test_get_interface_policy),
+};
+
+int codec_test_get_interface_deserialize(struct blob_attr *msg, struct codec_test_get_interface_params *params)
+{
+    if (ubus_idl_table_deserialize(&codec_test_get_interface_desc, msg, params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+int codec_test_get_interface_serialize(struct blob_buf *b, const struct codec_test_get_interface_params *params)
+{
+    return ubus_idl_table_serialize(&codec_test_get_interface_desc, b, params);
+}
+
+struct codec_test_get_interface_params *codec_test_get_interface_dup(const struct codec_test_get_interface_params *params)
+{
+    return ubus_idl_table_dup(&codec_test_get_interface_desc, params, sizeof(*params), sizeof(*params));
+}
+
+void codec_test_get_interface_free(struct codec_test_get_interface_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy codec_test_set_mtu_policy[] = {
+    [CODEC_TEST_SET_MTU_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [CODEC_TEST_SET_MTU_MTU] = { .name = "mtu", .type = BLOBMSG_TYPE_INT16 },
+    [CODEC_TEST_SET_MTU_PERSIST] = { .name = "persist", .type = BLOBMSG_TYPE_BOOL }
+};
+
+static const struct ubus_idl_field_desc codec_test_set_mtu_desc_fields[] = {
+    [CODEC_TEST_SET_MTU_IFNAME] = {
+        .offset = offsetof(struct codec_test_set_mtu_params, ifname),
+        .kind = UBUS_IDL_T_STRING,
+    },
+    [CODEC_TEST_SET_MTU_MTU] = {
+        .offset = offsetof(struct codec_test_set_mtu_params, mtu),
+        .kind = UBUS_IDL_T_INT16,
+    },
+    [CODEC_TEST_SET_MTU_PERSIST] = {
+        .offset = offsetof(struct codec_test_set_mtu_params, persist),
+        .kind = UBUS_IDL_T_BOOL,
+        .optional = 1,
+        .bit = CODEC_TEST_SET_MTU_HAS_PERSIST,
+    },
+};
+
+static const struct ubus_idl_type_desc codec_test_set_mtu_desc = {
+    .policy = codec_test_set_mtu_policy,
+    .fields = codec_test_set_mtu_desc_fields,
+    .n_fields = ARRAY_SIZE(codec_test_set_mtu_policy),
+    .presence_offset = offsetof(struct codec_test_set_mtu_params, has_fields),
+    .presence_size = sizeof(((struct codec_test_set_mtu_params *)0)->has_fields),
+};
+
+int codec_test_set_mtu_deserialize(struct blob_attr *msg, struct codec_test_set_mtu_params *params)
+{
+    if (ubus_idl_table_deserialize(&codec_test_set_mtu_desc, msg, params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+int codec_test_set_mtu_serialize(struct blob_buf *b, const struct codec_test_set_mtu_params *params)
+{
+    return ubus_idl_table_serialize(&codec_test_set_mtu_desc, b, params);
+}
+
+struct codec_test_set_mtu_params *codec_test_set_mtu_dup(const struct codec_test_set_mtu_params *params)
+{
+    return ubus_idl_table_dup(&codec_test_set_mtu_desc, params, sizeof(*params), sizeof(*params));
+}
+
+void codec_test_set_mtu_free(struct codec_test_set_mtu_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy address_policy[] = {
+    [ADDRESS_FAMILY] = { .name = "family", .type = BLOBMSG_TYPE_INT8 },
+    [ADDRESS_SCOPE] = { .name = "scope", .type = BLOBMSG_TYPE_INT32 },
+    [ADDRESS_ADDR] = { .name = "addr", .type = BLOBMSG_TYPE_STRING },
+    [ADDRESS_PREFIX] = { .name = "prefix", .type = BLOBMSG_TYPE_INT8 }
+};
+
+static const struct ubus_idl_field_desc address_desc_fields[] = {
+    [ADDRESS_FAMILY] = {
+        .offset = offsetof(struct address, family),
+        .kind = UBUS_IDL_T_INT8,
+    },
+    [ADDRESS_SCOPE] = {
+        .offset = offsetof(struct address, scope),
+        .kind = UBUS_IDL_T_ENUM,
+        .optional = 1,
+        .bit = ADDRESS_HAS_SCOPE,
+        .values = &scope_enum_desc,
+    },
+    [ADDRESS_ADDR] = {
+        .offset = offsetof(struct address, addr),
+        .kind = UBUS_IDL_T_STRING,
+    },
+    [ADDRESS_PREFIX] = {
+        .offset = offsetof(struct address, prefix),
+        .kind = UBUS_IDL_T_INT8,
+        .optional = 1,
+        .bit = ADDRESS_HAS_PREFIX,
+    },
+};
+
+static const struct ubus_idl_type_desc address_desc = {
+    .policy = address_policy,
+    .fields = address_desc_fields,
+    .n_fields = ARRAY_SIZE(address_policy),
+    .presence_offset = offsetof(struct address, has_fields),
+    .presence_size = sizeof(((struct address *)0)->has_fields),
+};
+
+int address_deserialize(struct blob_attr *msg, struct address *params)
+{
+    if (ubus_idl_table_deserialize(&address_desc, msg, params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+int address_serialize(struct blob_buf *b, const struct address *params)
+{
+    return ubus_idl_table_serialize(&address_desc, b, params);
+}
+
+struct address *address_dup(const struct address *params)
+{
+    return ubus_idl_table_dup(&address_desc, params, sizeof(*params), sizeof(*params));
+}
+
+void address_free(struct address *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy codec_test_interface_policy[] = {
+    [CODEC_TEST_INTERFACE_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [CODEC_TEST_INTERFACE_UP] = { .name = "up", .type = BLOBMSG_TYPE_BOOL },
+    [CODEC_TEST_INTERFACE_MTU] = { .name = "mtu", .type = BLOBMSG_TYPE_INT16 },
+    [CODEC_TEST_INTERFACE_IFINDEX] = { .name = "ifindex", .type = BLOBMSG_TYPE_INT32 },
+    [CODEC_TEST_INTERFACE_RX_BYTES] = { .name = "rx_bytes", .type = BLOBMSG_TYPE_INT64 },
+    [CODEC_TEST_INTERFACE_LOAD] = { .name = "load", .type = BLOBMSG_TYPE_DOUBLE },
+    [CODEC_TEST_INTERFACE_FLAGS] = { .name = "flags", .type = BLOBMSG_TYPE_ARRAY },
+    [CODEC_TEST_INTERFACE_EXTRA] = { .name = "extra", .type = BLOBMSG_TYPE_UNSPEC },
+    [CODEC_TEST_INTERFACE_PRIMARY] = { .name = "primary", .type = BLOBMSG_TYPE_TABLE },
+    [CODEC_TEST_INTERFACE_STATE] = { .name = "state", .type = BLOBMSG_TYPE_STRING }
+};
+
+static const struct ubus_idl_field_desc codec_test_interface_desc_fields[] = {
+    [CODEC_TEST_INTERFACE_IFNAME] = {
+        .offset = offsetof(struct codec_test_interface, ifname),
+        .kind = UBUS_IDL_T_STRING,
+    },
+    [CODEC_TEST_INTERFACE_UP] = {
+        .offset = offsetof(struct codec_test_interface, up),
+        .kind = UBUS_IDL_T_BOOL,
+    },
+    [CODEC_TEST_INTERFACE_MTU] = {
+        .offset = offsetof(struct codec_test_interface, mtu),
+        .kind = UBUS_IDL_T_INT16,
+        .optional = 1,
+        .bit = CODEC_TEST_INTERFACE_HAS_MTU,
+    },
+    [CODEC_TEST_INTERFACE_IFINDEX] = {
+        .offset = offsetof(struct codec_test_interface, ifindex),
+        .kind = UBUS_IDL_T_INT32,
+    },
+    [CODEC_TEST_INTERFACE_RX_BYTES] = {
+        .offset = offsetof(struct codec_test_interface, rx_bytes),
+        .kind = UBUS_IDL_T_INT64,
+        .optional = 1,
+        .bit = CODEC_TEST_INTERFACE_HAS_RX_BYTES,
+    },
+    [CODEC_TEST_INTERFACE_LOAD] = {
+        .offset = offsetof(struct codec_test_interface, load),
+        .kind = UBUS_IDL_T_DOUBLE,
+        .optional = 1,
+        .bit = CODEC_TEST_INTERFACE_HAS_LOAD,
+    },
+    [CODEC_TEST_INTERFACE_FLAGS] = {
+        .offset = offsetof(struct codec_test_interface, flags),
+        .kind = UBUS_IDL_T_BLOB,
+        .optional = 1,
+        .bit = CODEC_TEST_INTERFACE_HAS_FLAGS,
+    },
+    [CODEC_TEST_INTERFACE_EXTRA] = {
+        .offset = offsetof(struct codec_test_interface, extra),
+        .kind = UBUS_IDL_T_BLOB,
+        .optional = 1,
+        .bit = CODEC_TEST_INTERFACE_HAS_EXTRA,
+    },
+    [CODEC_TEST_INTERFACE_PRIMARY] = {
+        .offset = offsetof(struct codec_test_interface, primary),
+        .kind = UBUS_IDL_T_TABLE,
+        .optional = 1,
+        .bit = CODEC_TEST_INTERFACE_HAS_PRIMARY,
+        .nested = &address_desc,
+    },
+    [CODEC_TEST_INTERFACE_STATE] = {
+        .offset = offsetof(struct codec_test_interface, state),
+        .kind = UBUS_IDL_T_ENUM,
+        .values = &codec_test_state_enum_desc,
+    },
+};
+
+static const struct ubus_idl_type_desc codec_test_interface_desc = {
+    .policy = codec_test_interface_policy,
+    .fields = codec_test_interface_desc_fields,
+    .n_fields = ARRAY_SIZE(codec_test_interface_policy),
+    .presence_offset = offsetof(struct codec_test_interface, has_fields),
+    .presence_size = sizeof(((struct codec_test_interface *)0)->has_fields),
+};
+
+int codec_test_interface_deserialize(struct blob_attr *msg, struct codec_test_interface *params)
+{
+    if (ubus_idl_table_deserialize(&codec_test_interface_desc, msg, params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+int codec_test_interface_serialize(struct blob_buf *b, const struct codec_test_interface *params)
+{
+    return ubus_idl_table_serialize(&codec_test_interface_desc, b, params);
+}
+
+struct codec_test_interface *codec_test_interface_dup(const struct codec_test_interface *params)
+{
+    return ubus_idl_table_dup(&codec_test_interface_desc, params, sizeof(*params), sizeof(*params));
+}
+
+void codec_test_interface_free(struct codec_test_interface *params)
+{
+    free(params);
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf codec_test_reply_buf;
+
+int codec_test_get_interface_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct codec_test_interface *reply)
+{
+    int ret;
+
+    blob_buf_init(&codec_test_reply_buf, 0);
+    ret = codec_test_interface_serialize(&codec_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, codec_test_reply_buf.head);
+}
+
+static const struct ubus_method codec_test_methods[] = {
+    UBUS_METHOD("get_interface", codec_test_get_interface_handler, codec_test_get_interface_policy),
+    UBUS_METHOD("set_mtu", codec_test_set_mtu_handler, codec_test_set_mtu_policy),
+    UBUS_METHOD("add_address", codec_test_add_address_handler, address_policy)
+};
+
+static struct ubus_object_type codec_test_object_type =
+    UBUS_OBJECT_TYPE("codec_test", codec_test_methods);
+
+struct ubus_object codec_test_object = {
+    .name = "codec_test",
+    .type = &codec_test_object_type,
+    .methods = codec_test_methods,
+    .n_methods = ARRAY_SIZE(codec_test_methods),
+};
+
+void codec_test_object_cleanup(void)
+{
+    blob_buf_free(&codec_test_reply_buf);
+}
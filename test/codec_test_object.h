@@ -0,0 +1,161 @@
+/* Generated from ubus IDL - codec_test */
+
+#ifndef __CODEC_TEST_OBJECT_H__
+#define __CODEC_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+enum scope {
+    SCOPE_HOST,
+    SCOPE_LINK,
+    SCOPE_GLOBAL,
+    __SCOPE_MAX
+};
+
+enum codec_test_state {
+    CODEC_TEST_STATE_DOWN,
+    CODEC_TEST_STATE_UP,
+    CODEC_TEST_STATE_DORMANT,
+    __CODEC_TEST_STATE_MAX
+};
+
+struct address {
+    const char * addr;
+    enum scope scope;
+    int8_t family;
+    int8_t prefix;
+    uint8_t has_fields;
+};
+#define ADDRESS_HAS_SCOPE 0
+#define ADDRESS_HAS_PREFIX 1
+_Static_assert(sizeof(struct address) == UBUS_IDL_PACKED_SIZE(struct address, sizeof(const char *) + sizeof(enum scope) + 2 * sizeof(int8_t) + sizeof(uint8_t)),
+               "struct address has padding between members");
+
+struct codec_test_interface {
+    int64_t rx_bytes;
+    double load;
+    const char * ifname;
+    struct blob_attr * flags;
+    struct blob_attr * extra;
+    struct address * primary;
+    int32_t ifindex;
+    enum codec_test_state state;
+    int16_t mtu;
+    bool up;
+    uint8_t has_fields;
+};
+#define CODEC_TEST_INTERFACE_HAS_MTU 0
+#define CODEC_TEST_INTERFACE_HAS_RX_BYTES 1
+#define CODEC_TEST_INTERFACE_HAS_LOAD 2
+#define CODEC_TEST_INTERFACE_HAS_FLAGS 3
+#define CODEC_TEST_INTERFACE_HAS_EXTRA 4
+#define CODEC_TEST_INTERFACE_HAS_PRIMARY 5
+_Static_assert(sizeof(struct codec_test_interface) == UBUS_IDL_PACKED_SIZE(struct codec_test_interface, sizeof(int64_t) + sizeof(double) + sizeof(const char *) + 2 * sizeof(struct blob_attr *) + sizeof(struct address *) + sizeof(int32_t) + sizeof(enum codec_test_state) + sizeof(int16_t) + sizeof(bool) + sizeof(uint8_t)),
+               "struct codec_test_interface has padding between members");
+
+struct codec_test_get_interface_params {
+    const char * ifname;
+};
+_Static_assert(sizeof(struct codec_test_get_interface_params) == UBUS_IDL_PACKED_SIZE(struct codec_test_get_interface_params, sizeof(const char *)),
+               "struct codec_test_get_interface_params has padding between members");
+
+struct codec_test_set_mtu_params {
+    const char * ifname;
+    int16_t mtu;
+    bool persist;
+    uint8_t has_fields;
+};
+#define CODEC_TEST_SET_MTU_HAS_PERSIST 0
+_Static_assert(sizeof(struct codec_test_set_mtu_params) == UBUS_IDL_PACKED_SIZE(struct codec_test_set_mtu_params, sizeof(const char *) + sizeof(int16_t) + sizeof(bool) + sizeof(uint8_t)),
+               "struct codec_test_set_mtu_params has padding between members");
+
+enum {
+    CODEC_TEST_GET_INTERFACE_IFNAME,
+    __CODEC_TEST_GET_INTERFACE_MAX
+};
+
+enum {
+    CODEC_TEST_SET_MTU_IFNAME,
+    CODEC_TEST_SET_MTU_MTU,
+    CODEC_TEST_SET_MTU_PERSIST,
+    __CODEC_TEST_SET_MTU_MAX
+};
+
+enum {
+    ADDRESS_FAMILY,
+    ADDRESS_SCOPE,
+    ADDRESS_ADDR,
+    ADDRESS_PREFIX,
+    __ADDRESS_MAX
+};
+
+enum {
+    CODEC_TEST_INTERFACE_IFNAME,
+    CODEC_TEST_INTERFACE_UP,
+    CODEC_TEST_INTERFACE_MTU,
+    CODEC_TEST_INTERFACE_IFINDEX,
+    CODEC_TEST_INTERFACE_RX_BYTES,
+    CODEC_TEST_INTERFACE_LOAD,
+    CODEC_TEST_INTERFACE_FLAGS,
+    CODEC_TEST_INTERFACE_EXTRA,
+    CODEC_TEST_INTERFACE_PRIMARY,
+    CODEC_TEST_INTERFACE_STATE,
+    __CODEC_TEST_INTERFACE_MAX
+};
+
+int codec_test_get_interface_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int codec_test_set_mtu_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int codec_test_add_address_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+int codec_test_get_interface_deserialize(struct blob_attr *msg, struct codec_test_get_interface_params *params);
+int codec_test_get_interface_serialize(struct blob_buf *b, const struct codec_test_get_interface_params *params);
+int codec_test_set_mtu_deserialize(struct blob_attr *msg, struct codec_test_set_mtu_params *params);
+int codec_test_set_mtu_serialize(struct blob_buf *b, const struct codec_test_set_mtu_params *params);
+int address_deserialize(struct blob_attr *msg, struct address *params);
+int address_serialize(struct blob_buf *b, const struct address *params);
+int codec_test_interface_deserialize(struct blob_attr *msg, struct codec_test_interface *params);
+int codec_test_interface_serialize(struct blob_buf *b, const struct codec_test_interface *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct codec_test_get_interface_params *codec_test_get_interface_dup(const struct codec_test_get_interface_params *params);
+void codec_test_get_interface_free(struct codec_test_get_interface_params *params);
+struct codec_test_set_mtu_params *codec_test_set_mtu_dup(const struct codec_test_set_mtu_params *params);
+void codec_test_set_mtu_free(struct codec_test_set_mtu_params *params);
+struct address *address_dup(const struct address *params);
+void address_free(struct address *params);
+struct codec_test_interface *codec_test_interface_dup(const struct codec_test_interface *params);
+void codec_test_interface_free(struct codec_test_interface *params);
+
+/* Names of enum values, NULL for a value out of range, and the reverse lookup */
+const char *scope_name(enum scope value);
+int scope_parse(const char *name, enum scope *value);
+const char *codec_test_state_name(enum codec_test_state value);
+int codec_test_state_parse(const char *name, enum codec_test_state *value);
+
+int codec_test_get_interface_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct codec_test_interface *reply);
+
+extern struct ubus_object codec_test_object;
+
+void codec_test_object_cleanup(void);
+
+#endif /* __CODEC_TEST_OBJECT_H__ */
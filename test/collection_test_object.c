@@ -0,0 +1,767 @@
+/* Generated from ubus IDL - collection_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "collection_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+/* Copy a blob to the cursor of a *_dup() allocation, blobs go first after the struct to stay aligned */
+static struct blob_attr *ubus_idl_dup_blob(char **p, const struct blob_attr *attr)
+{
+    struct blob_attr *copy = (struct blob_attr *)*p;
+
+    memcpy(copy, attr, blob_pad_len(attr));
+    *p += blob_pad_len(attr);
+    return copy;
+}
+
+static const char *const neighbor_state_names[] = {
+    [NEIGHBOR_STATE_REACHABLE] = "reachable",
+    [NEIGHBOR_STATE_STALE] = "stale",
+    [NEIGHBOR_STATE_FAILED] = "failed",
+};
+
+/* FNV-1a slots of the names, collision free for the basis below, 0 when empty or value + 1 */
+static const uint8_t neighbor_state_slots[8] = { 1, 0, 0, 0, 3, 0, 2, 0 };
+
+const char *neighbor_state_name(enum neighbor_state value)
+{
+    if ((unsigned int)value >= __NEIGHBOR_STATE_MAX) {
+        return NULL;
+    }
+
+    return neighbor_state_names[value];
+}
+
+int neighbor_state_parse(const char *name, enum neighbor_state *value)
+{
+    uint32_t hash = 0x811c9dc5u;
+    unsigned int slot;
+    const char *p;
+
+    for (p = name; *p; p++) {
+        hash = (hash ^ (uint8_t)*p) * 16777619u;
+    }
+
+    // Any other name may share a slot with a value, a single compare tells them apart
+    slot = neighbor_state_slots[hash & 7];
+    if (!slot || strcmp(neighbor_state_names[slot - 1], name) != 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *value = (enum neighbor_state)(slot - 1);
+    return UBUS_STATUS_OK;
+}
+
+static const struct blobmsg_policy collection_test_get_session_policy[] = {
+    [COLLECTION_TEST_GET_SESSION_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int collection_test_get_session_deserialize(struct blob_attr *msg, struct collection_test_get_session_params *params)
+{
+    struct blob_attr *tb_collection_test_get_session[__COLLECTION_TEST_GET_SESSION_MAX];
+    if (blobmsg_parse(collection_test_get_session_policy, ARRAY_SIZE(collection_test_get_session_policy), tb_collection_test_get_session, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_collection_test_get_session[COLLECTION_TEST_GET_SESSION_ID]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->id = blobmsg_get_u32(tb_collection_test_get_session[COLLECTION_TEST_GET_SESSION_ID]);
+    return UBUS_STATUS_OK;
+}
+
+int collection_test_get_session_serialize(struct blob_buf *b, const struct collection_test_get_session_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    return UBUS_STATUS_OK;
+}
+
+struct collection_test_get_session_params *collection_test_get_session_dup(const struct collection_test_get_session_params *params)
+{
+    size_t len = sizeof(*params);
+    struct collection_test_get_session_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void collection_test_get_session_free(struct collection_test_get_session_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy collection_test_get_station_policy[] = {
+    [COLLECTION_TEST_GET_STATION_MAC] = { .name = "mac", .type = BLOBMSG_TYPE_STRING }
+};
+
+int collection_test_get_station_deserialize(struct blob_attr *msg, struct collection_test_get_station_params *params)
+{
+    struct blob_attr *tb_collection_test_get_station[__COLLECTION_TEST_GET_STATION_MAX];
+    if (blobmsg_parse(collection_test_get_station_policy, ARRAY_SIZE(collection_test_get_station_policy), tb_collection_test_get_station, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_collection_test_get_station[COLLECTION_TEST_GET_STATION_MAC]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->mac = blobmsg_get_string(tb_collection_test_get_station[COLLECTION_TEST_GET_STATION_MAC]);
+    return UBUS_STATUS_OK;
+}
+
+int collection_test_get_station_serialize(struct blob_buf *b, const struct collection_test_get_station_params *params)
+{
+    UBUS_IDL_ADD(string, b, "mac", params->mac);
+    return UBUS_STATUS_OK;
+}
+
+struct collection_test_get_station_params *collection_test_get_station_dup(const struct collection_test_get_station_params *params)
+{
+    size_t len = sizeof(*params);
+    struct collection_test_get_station_params *copy;
+    char *p;
+
+    if (params->mac) {
+        len += strlen(params->mac) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->mac = params->mac ? ubus_idl_dup_string(&p, params->mac) : NULL;
+    return copy;
+}
+
+void collection_test_get_station_free(struct collection_test_get_station_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy collection_test_session_policy[] = {
+    [COLLECTION_TEST_SESSION_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+    [COLLECTION_TEST_SESSION_USER] = { .name = "user", .type = BLOBMSG_TYPE_STRING },
+    [COLLECTION_TEST_SESSION_ADDRESS] = { .name = "address", .type = BLOBMSG_TYPE_STRING },
+    [COLLECTION_TEST_SESSION_IDLE] = { .name = "idle", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int collection_test_session_deserialize(struct blob_attr *msg, struct collection_test_session *params)
+{
+    struct blob_attr *tb_collection_test_session[__COLLECTION_TEST_SESSION_MAX];
+    if (blobmsg_parse(collection_test_session_policy, ARRAY_SIZE(collection_test_session_policy), tb_collection_test_session, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_collection_test_session[COLLECTION_TEST_SESSION_ID] || !tb_collection_test_session[COLLECTION_TEST_SESSION_USER]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->id = blobmsg_get_u32(tb_collection_test_session[COLLECTION_TEST_SESSION_ID]);
+    params->user = blobmsg_get_string(tb_collection_test_session[COLLECTION_TEST_SESSION_USER]);
+
+    UBUS_IDL_GET_OPTIONAL(string, tb_collection_test_session, COLLECTION_TEST_SESSION_ADDRESS, params->address, params, FIELD, COLLECTION_TEST_SESSION_HAS_ADDRESS);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_collection_test_session, COLLECTION_TEST_SESSION_IDLE, params->idle, params, FIELD, COLLECTION_TEST_SESSION_HAS_IDLE);
+    return UBUS_STATUS_OK;
+}
+
+int collection_test_session_serialize(struct blob_buf *b, const struct collection_test_session *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    UBUS_IDL_ADD(string, b, "user", params->user);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "address", params->address, params, FIELD, COLLECTION_TEST_SESSION_HAS_ADDRESS);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "idle", params->idle, params, FIELD, COLLECTION_TEST_SESSION_HAS_IDLE);
+    return UBUS_STATUS_OK;
+}
+
+/* Same as collection_test_session_dup() with the strings and blobs after the first head bytes, for collection entries */
+static struct collection_test_session *collection_test_session_copy(const struct collection_test_session *params, size_t head)
+{
+    size_t len = head;
+    struct collection_test_session *copy;
+    char *p;
+
+    if (params->user) {
+        len += strlen(params->user) + 1;
+    }
+    if (UBUS_IDL_HAS_FIELD(params, COLLECTION_TEST_SESSION_HAS_ADDRESS) && params->address) {
+        len += strlen(params->address) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)copy + head;
+    copy->user = params->user ? ubus_idl_dup_string(&p, params->user) : NULL;
+    copy->address = UBUS_IDL_HAS_FIELD(params, COLLECTION_TEST_SESSION_HAS_ADDRESS) && params->address ? ubus_idl_dup_string(&p, params->address) : NULL;
+    return copy;
+}
+
+struct collection_test_session *collection_test_session_dup(const struct collection_test_session *params)
+{
+    return collection_test_session_copy(params, sizeof(*params));
+}
+
+void collection_test_session_free(struct collection_test_session *params)
+{
+    free(params);
+}
+
+static int collection_test_session_list_cmp(const void *k1, const void *k2, void *ptr)
+{
+    const struct collection_test_session *a = k1;
+    const struct collection_test_session *b = k2;
+
+    return a->id < b->id ? -1 : a->id > b->id;
+}
+
+void collection_test_session_list_init(struct collection_test_session_list *list)
+{
+    avl_init(&list->avl, collection_test_session_list_cmp, false, NULL);
+}
+
+/* Copy value into one allocation with its entry, replacing the entry with the same key */
+int collection_test_session_list_insert(struct collection_test_session_list *list, const struct collection_test_session *value)
+{
+    struct collection_test_session_list_entry *entry;
+    struct collection_test_session_list_entry *old;
+
+    entry = (struct collection_test_session_list_entry *)collection_test_session_copy(value, sizeof(*entry));
+    if (!entry) {
+        return UBUS_STATUS_NO_MEMORY;
+    }
+
+    old = avl_find_element(&list->avl, &entry->value, old, avl);
+    if (old) {
+        avl_delete(&list->avl, &old->avl);
+        free(old);
+    }
+
+    entry->avl.key = &entry->value;
+    avl_insert(&list->avl, &entry->avl);
+    return UBUS_STATUS_OK;
+}
+
+struct collection_test_session *collection_test_session_list_lookup(struct collection_test_session_list *list, int32_t id)
+{
+    struct collection_test_session key = {
+        .id = id,
+    };
+    struct collection_test_session_list_entry *entry;
+
+    entry = avl_find_element(&list->avl, &key, entry, avl);
+    return entry ? &entry->value : NULL;
+}
+
+int collection_test_session_list_delete(struct collection_test_session_list *list, int32_t id)
+{
+    struct collection_test_session *value = collection_test_session_list_lookup(list, id);
+    struct collection_test_session_list_entry *entry;
+
+    if (!value) {
+        return UBUS_STATUS_NOT_FOUND;
+    }
+
+    entry = (struct collection_test_session_list_entry *)value;
+    avl_delete(&list->avl, &entry->avl);
+    free(entry);
+    return UBUS_STATUS_OK;
+}
+
+void collection_test_session_list_clear(struct collection_test_session_list *list)
+{
+    struct collection_test_session_list_entry *entry;
+    struct collection_test_session_list_entry *tmp;
+
+    avl_for_each_element_safe(&list->avl, entry, avl, tmp) {
+        avl_delete(&list->avl, &entry->avl);
+        free(entry);
+    }
+}
+
+/* Add the whole collection as an array of tables, in key order */
+int collection_test_session_list_serialize(struct blob_buf *b, const char *name, struct collection_test_session_list *list)
+{
+    struct collection_test_session_list_entry *entry;
+    void *items;
+    void *table;
+    int ret;
+
+    items = blobmsg_open_array(b, name);
+    avl_for_each_element(&list->avl, entry, avl) {
+        table = blobmsg_open_table(b, NULL);
+        ret = collection_test_session_serialize(b, &entry->value);
+        blobmsg_close_table(b, table);
+        if (ret != UBUS_STATUS_OK) {
+            // Leave b well formed, the caller drops the message on error
+            blobmsg_close_array(b, items);
+            return ret;
+        }
+    }
+    blobmsg_close_array(b, items);
+
+    return UBUS_STATUS_OK;
+}
+
+static const struct blobmsg_policy station_policy[] = {
+    [STATION_MAC] = { .name = "mac", .type = BLOBMSG_TYPE_STRING },
+    [STATION_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [STATION_SIGNAL] = { .name = "signal", .type = BLOBMSG_TYPE_INT8 },
+    [STATION_RATES] = { .name = "rates", .type = BLOBMSG_TYPE_ARRAY }
+};
+
+int station_deserialize(struct blob_attr *msg, struct station *params)
+{
+    struct blob_attr *tb_station[__STATION_MAX];
+    if (blobmsg_parse(station_policy, ARRAY_SIZE(station_policy), tb_station, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_station[STATION_MAC] || !tb_station[STATION_IFNAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->mac = blobmsg_get_string(tb_station[STATION_MAC]);
+    params->ifname = blobmsg_get_string(tb_station[STATION_IFNAME]);
+
+    UBUS_IDL_GET_OPTIONAL(u8, tb_station, STATION_SIGNAL, params->signal, params, FIELD, STATION_HAS_SIGNAL);
+    if (tb_station[STATION_RATES]) {
+        params->rates = tb_station[STATION_RATES];
+        UBUS_IDL_SET_FIELD(params, STATION_HAS_RATES);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int station_serialize(struct blob_buf *b, const struct station *params)
+{
+    int ret;
+    UBUS_IDL_ADD(string, b, "mac", params->mac);
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    UBUS_IDL_ADD_OPTIONAL(u8, b, "signal", params->signal, params, FIELD, STATION_HAS_SIGNAL);
+    if (UBUS_IDL_HAS_FIELD(params, STATION_HAS_RATES)) {
+        blobmsg_add_field(b, BLOBMSG_TYPE_ARRAY, "rates", blob_data(params->rates), blob_len(params->rates));
+    }
+    return UBUS_STATUS_OK;
+}
+
+/* Same as station_dup() with the strings and blobs after the first head bytes, for collection entries */
+static struct station *station_copy(const struct station *params, size_t head)
+{
+    size_t len = head;
+    struct station *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, STATION_HAS_RATES) && params->rates) {
+        len += blob_pad_len(params->rates);
+    }
+    if (params->mac) {
+        len += strlen(params->mac) + 1;
+    }
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)copy + head;
+    copy->rates = UBUS_IDL_HAS_FIELD(params, STATION_HAS_RATES) && params->rates ? ubus_idl_dup_blob(&p, params->rates) : NULL;
+    copy->mac = params->mac ? ubus_idl_dup_string(&p, params->mac) : NULL;
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+struct station *station_dup(const struct station *params)
+{
+    return station_copy(params, sizeof(*params));
+}
+
+void station_free(struct station *params)
+{
+    free(params);
+}
+
+static int station_list_cmp(const void *k1, const void *k2, void *ptr)
+{
+    const struct station *a = k1;
+    const struct station *b = k2;
+    int ret;
+
+    ret = strcmp(a->mac, b->mac);
+    return ret;
+}
+
+void station_list_init(struct station_list *list)
+{
+    avl_init(&list->avl, station_list_cmp, false, NULL);
+}
+
+/* Copy value into one allocation with its entry, replacing the entry with the same key */
+int station_list_insert(struct station_list *list, const struct station *value)
+{
+    struct station_list_entry *entry;
+    struct station_list_entry *old;
+
+    entry = (struct station_list_entry *)station_copy(value, sizeof(*entry));
+    if (!entry) {
+        return UBUS_STATUS_NO_MEMORY;
+    }
+
+    old = avl_find_element(&list->avl, &entry->value, old, avl);
+    if (old) {
+        avl_delete(&list->avl, &old->avl);
+        free(old);
+    }
+
+    entry->avl.key = &entry->value;
+    avl_insert(&list->avl, &entry->avl);
+    return UBUS_STATUS_OK;
+}
+
+struct station *station_list_lookup(struct station_list *list, const char *mac)
+{
+    struct station key = {
+        .mac = mac,
+    };
+    struct station_list_entry *entry;
+
+    entry = avl_find_element(&list->avl, &key, entry, avl);
+    return entry ? &entry->value : NULL;
+}
+
+int station_list_delete(struct station_list *list, const char *mac)
+{
+    struct station *value = station_list_lookup(list, mac);
+    struct station_list_entry *entry;
+
+    if (!value) {
+        return UBUS_STATUS_NOT_FOUND;
+    }
+
+    entry = (struct station_list_entry *)value;
+    avl_delete(&list->avl, &entry->avl);
+    free(entry);
+    return UBUS_STATUS_OK;
+}
+
+void station_list_clear(struct station_list *list)
+{
+    struct station_list_entry *entry;
+    struct station_list_entry *tmp;
+
+    avl_for_each_element_safe(&list->avl, entry, avl, tmp) {
+        avl_delete(&list->avl, &entry->avl);
+        free(entry);
+    }
+}
+
+/* Add the whole collection as an array of tables, in key order */
+int station_list_serialize(struct blob_buf *b, const char *name, struct station_list *list)
+{
+    struct station_list_entry *entry;
+    void *items;
+    void *table;
+    int ret;
+
+    items = blobmsg_open_array(b, name);
+    avl_for_each_element(&list->avl, entry, avl) {
+        table = blobmsg_open_table(b, NULL);
+        ret = station_serialize(b, &entry->value);
+        blobmsg_close_table(b, table);
+        if (ret != UBUS_STATUS_OK) {
+            // Leave b well formed, the caller drops the message on error
+            blobmsg_close_array(b, items);
+            return ret;
+        }
+    }
+    blobmsg_close_array(b, items);
+
+    return UBUS_STATUS_OK;
+}
+
+static const struct blobmsg_policy collection_test_neighbor_policy[] = {
+    [COLLECTION_TEST_NEIGHBOR_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [COLLECTION_TEST_NEIGHBOR_VLAN] = { .name = "vlan", .type = BLOBMSG_TYPE_INT16 },
+    [COLLECTION_TEST_NEIGHBOR_STATE] = { .name = "state", .type = BLOBMSG_TYPE_STRING },
+    [COLLECTION_TEST_NEIGHBOR_ADDR] = { .name = "addr", .type = BLOBMSG_TYPE_STRING }
+};
+
+int collection_test_neighbor_deserialize(struct blob_attr *msg, struct collection_test_neighbor *params)
+{
+    struct blob_attr *tb_collection_test_neighbor[__COLLECTION_TEST_NEIGHBOR_MAX];
+    if (blobmsg_parse(collection_test_neighbor_policy, ARRAY_SIZE(collection_test_neighbor_policy), tb_collection_test_neighbor, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_collection_test_neighbor[COLLECTION_TEST_NEIGHBOR_IFNAME] || !tb_collection_test_neighbor[COLLECTION_TEST_NEIGHBOR_VLAN] || !tb_collection_test_neighbor[COLLECTION_TEST_NEIGHBOR_STATE] || !tb_collection_test_neighbor[COLLECTION_TEST_NEIGHBOR_ADDR]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->ifname = blobmsg_get_string(tb_collection_test_neighbor[COLLECTION_TEST_NEIGHBOR_IFNAME]);
+    params->vlan = blobmsg_get_u16(tb_collection_test_neighbor[COLLECTION_TEST_NEIGHBOR_VLAN]);
+    if (neighbor_state_parse(blobmsg_get_string(tb_collection_test_neighbor[COLLECTION_TEST_NEIGHBOR_STATE]), &params->state) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    params->addr = blobmsg_get_string(tb_collection_test_neighbor[COLLECTION_TEST_NEIGHBOR_ADDR]);
+    return UBUS_STATUS_OK;
+}
+
+int collection_test_neighbor_serialize(struct blob_buf *b, const struct collection_test_neighbor *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    UBUS_IDL_ADD(u16, b, "vlan", params->vlan);
+    if ((unsigned int)params->state >= __NEIGHBOR_STATE_MAX) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    UBUS_IDL_ADD(string, b, "state", neighbor_state_names[params->state]);
+    UBUS_IDL_ADD(string, b, "addr", params->addr);
+    return UBUS_STATUS_OK;
+}
+
+/* Same as collection_test_neighbor_dup() with the strings and blobs after the first head bytes, for collection entries */
+static struct collection_test_neighbor *collection_test_neighbor_copy(const struct collection_test_neighbor *params, size_t head)
+{
+    size_t len = head;
+    struct collection_test_neighbor *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+    if (params->addr) {
+        len += strlen(params->addr) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)copy + head;
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    copy->addr = params->addr ? ubus_idl_dup_string(&p, params->addr) : NULL;
+    return copy;
+}
+
+struct collection_test_neighbor *collection_test_neighbor_dup(const struct collection_test_neighbor *params)
+{
+    return collection_test_neighbor_copy(params, sizeof(*params));
+}
+
+void collection_test_neighbor_free(struct collection_test_neighbor *params)
+{
+    free(params);
+}
+
+static int collection_test_neighbor_list_cmp(const void *k1, const void *k2, void *ptr)
+{
+    const struct collection_test_neighbor *a = k1;
+    const struct collection_test_neighbor *b = k2;
+    int ret;
+
+    ret = strcmp(a->ifname, b->ifname);
+    if (ret) {
+        return ret;
+    }
+    return a->vlan < b->vlan ? -1 : a->vlan > b->vlan;
+}
+
+void collection_test_neighbor_list_init(struct collection_test_neighbor_list *list)
+{
+    avl_init(&list->avl, collection_test_neighbor_list_cmp, false, NULL);
+}
+
+/* Copy value into one allocation with its entry, replacing the entry with the same key */
+int collection_test_neighbor_list_insert(struct collection_test_neighbor_list *list, const struct collection_test_neighbor *value)
+{
+    struct collection_test_neighbor_list_entry *entry;
+    struct collection_test_neighbor_list_entry *old;
+
+    entry = (struct collection_test_neighbor_list_entry *)collection_test_neighbor_copy(value, sizeof(*entry));
+    if (!entry) {
+        return UBUS_STATUS_NO_MEMORY;
+    }
+
+    old = avl_find_element(&list->avl, &entry->value, old, avl);
+    if (old) {
+        avl_delete(&list->avl, &old->avl);
+        free(old);
+    }
+
+    entry->avl.key = &entry->value;
+    avl_insert(&list->avl, &entry->avl);
+    return UBUS_STATUS_OK;
+}
+
+struct collection_test_neighbor *collection_test_neighbor_list_lookup(struct collection_test_neighbor_list *list, const char *ifname, int16_t vlan)
+{
+    struct collection_test_neighbor key = {
+        .ifname = ifname,
+        .vlan = vlan,
+    };
+    struct collection_test_neighbor_list_entry *entry;
+
+    entry = avl_find_element(&list->avl, &key, entry, avl);
+    return entry ? &entry->value : NULL;
+}
+
+int collection_test_neighbor_list_delete(struct collection_test_neighbor_list *list, const char *ifname, int16_t vlan)
+{
+    struct collection_test_neighbor *value = collection_test_neighbor_list_lookup(list, ifname, vlan);
+    struct collection_test_neighbor_list_entry *entry;
+
+    if (!value) {
+        return UBUS_STATUS_NOT_FOUND;
+    }
+
+    entry = (struct collection_test_neighbor_list_entry *)value;
+    avl_delete(&list->avl, &entry->avl);
+    free(entry);
+    return UBUS_STATUS_OK;
+}
+
+void collection_test_neighbor_list_clear(struct collection_test_neighbor_list *list)
+{
+    struct collection_test_neighbor_list_entry *entry;
+    struct collection_test_neighbor_list_entry *tmp;
+
+    avl_for_each_element_safe(&list->avl, entry, avl, tmp) {
+        avl_delete(&list->avl, &entry->avl);
+        free(entry);
+    }
+}
+
+/* Add the whole collection as an array of tables, in key order */
+int collection_test_neighbor_list_serialize(struct blob_buf *b, const char *name, struct collection_test_neighbor_list *list)
+{
+    struct collection_test_neighbor_list_entry *entry;
+    void *items;
+    void *table;
+    int ret;
+
+    items = blobmsg_open_array(b, name);
+    avl_for_each_element(&list->avl, entry, avl) {
+        table = blobmsg_open_table(b, NULL);
+        ret = collection_test_neighbor_serialize(b, &entry->value);
+        blobmsg_close_table(b, table);
+        if (ret != UBUS_STATUS_OK) {
+            // Leave b well formed, the caller drops the message on error
+            blobmsg_close_array(b, items);
+            return ret;
+        }
+    }
+    blobmsg_close_array(b, items);
+
+    return UBUS_STATUS_OK;
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf collection_test_reply_buf;
+
+int collection_test_get_session_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct collection_test_session *reply)
+{
+    int ret;
+
+    blob_buf_init(&collection_test_reply_buf, 0);
+    ret = collection_test_session_serialize(&collection_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, collection_test_reply_buf.head);
+}
+
+int collection_test_get_station_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct station *reply)
+{
+    int ret;
+
+    blob_buf_init(&collection_test_reply_buf, 0);
+    ret = station_serialize(&collection_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, collection_test_reply_buf.head);
+}
+
+static int collection_test_list_neighbors_thunk(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return list_neighbors_handler(ctx, obj, req, COLLECTION_TEST_METHOD_LIST_NEIGHBORS);
+}
+
+static const struct ubus_method collection_test_methods[] = {
+    UBUS_METHOD("get_session", collection_test_get_session_handler, collection_test_get_session_policy),
+    UBUS_METHOD("get_station", collection_test_get_station_handler, collection_test_get_station_policy),
+    UBUS_METHOD_NOARG("list_neighbors", collection_test_list_neighbors_thunk)
+};
+
+static struct ubus_object_type collection_test_object_type =
+    UBUS_OBJECT_TYPE("collection_test", collection_test_methods);
+
+struct ubus_object collection_test_object = {
+    .name = "collection_test",
+    .type = &collection_test_object_type,
+    .methods = collection_test_methods,
+    .n_methods = ARRAY_SIZE(collection_test_methods),
+};
+
+void collection_test_object_cleanup(void)
+{
+    blob_buf_free(&collection_test_reply_buf);
+}
@@ -0,0 +1,218 @@
+/* Generated from ubus IDL - collection_test */
+
+#ifndef __COLLECTION_TEST_OBJECT_H__
+#define __COLLECTION_TEST_OBJECT_H__
+
+#include <libubox/avl.h>
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+enum neighbor_state {
+    NEIGHBOR_STATE_REACHABLE,
+    NEIGHBOR_STATE_STALE,
+    NEIGHBOR_STATE_FAILED,
+    __NEIGHBOR_STATE_MAX
+};
+
+struct station {
+    const char * mac;
+    const char * ifname;
+    struct blob_attr * rates;
+    int8_t signal;
+    uint8_t has_fields;
+};
+#define STATION_HAS_SIGNAL 0
+#define STATION_HAS_RATES 1
+_Static_assert(sizeof(struct station) == UBUS_IDL_PACKED_SIZE(struct station, 2 * sizeof(const char *) + sizeof(struct blob_attr *) + sizeof(int8_t) + sizeof(uint8_t)),
+               "struct station has padding between members");
+
+struct collection_test_session {
+    const char * user;
+    const char * address;
+    int32_t id;
+    int32_t idle;
+    uint8_t has_fields;
+};
+#define COLLECTION_TEST_SESSION_HAS_ADDRESS 0
+#define COLLECTION_TEST_SESSION_HAS_IDLE 1
+_Static_assert(sizeof(struct collection_test_session) == UBUS_IDL_PACKED_SIZE(struct collection_test_session, 2 * sizeof(const char *) + 2 * sizeof(int32_t) + sizeof(uint8_t)),
+               "struct collection_test_session has padding between members");
+
+struct collection_test_neighbor {
+    const char * ifname;
+    const char * addr;
+    enum neighbor_state state;
+    int16_t vlan;
+};
+_Static_assert(sizeof(struct collection_test_neighbor) == UBUS_IDL_PACKED_SIZE(struct collection_test_neighbor, 2 * sizeof(const char *) + sizeof(enum neighbor_state) + sizeof(int16_t)),
+               "struct collection_test_neighbor has padding between members");
+
+struct collection_test_get_session_params {
+    int32_t id;
+};
+_Static_assert(sizeof(struct collection_test_get_session_params) == UBUS_IDL_PACKED_SIZE(struct collection_test_get_session_params, sizeof(int32_t)),
+               "struct collection_test_get_session_params has padding between members");
+
+struct collection_test_get_station_params {
+    const char * mac;
+};
+_Static_assert(sizeof(struct collection_test_get_station_params) == UBUS_IDL_PACKED_SIZE(struct collection_test_get_station_params, sizeof(const char *)),
+               "struct collection_test_get_station_params has padding between members");
+
+enum {
+    COLLECTION_TEST_GET_SESSION_ID,
+    __COLLECTION_TEST_GET_SESSION_MAX
+};
+
+enum {
+    COLLECTION_TEST_GET_STATION_MAC,
+    __COLLECTION_TEST_GET_STATION_MAX
+};
+
+enum {
+    COLLECTION_TEST_SESSION_ID,
+    COLLECTION_TEST_SESSION_USER,
+    COLLECTION_TEST_SESSION_ADDRESS,
+    COLLECTION_TEST_SESSION_IDLE,
+    __COLLECTION_TEST_SESSION_MAX
+};
+
+enum {
+    STATION_MAC,
+    STATION_IFNAME,
+    STATION_SIGNAL,
+    STATION_RATES,
+    __STATION_MAX
+};
+
+enum {
+    COLLECTION_TEST_NEIGHBOR_IFNAME,
+    COLLECTION_TEST_NEIGHBOR_VLAN,
+    COLLECTION_TEST_NEIGHBOR_STATE,
+    COLLECTION_TEST_NEIGHBOR_ADDR,
+    __COLLECTION_TEST_NEIGHBOR_MAX
+};
+
+enum collection_test_method {
+    COLLECTION_TEST_METHOD_GET_SESSION,
+    COLLECTION_TEST_METHOD_GET_STATION,
+    COLLECTION_TEST_METHOD_LIST_NEIGHBORS,
+    __COLLECTION_TEST_METHOD_MAX
+};
+
+int collection_test_get_session_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int collection_test_get_station_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+/* Custom handlers, called by a generated thunk with the method and its decoded params */
+int list_neighbors_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, enum collection_test_method method);
+
+int collection_test_get_session_deserialize(struct blob_attr *msg, struct collection_test_get_session_params *params);
+int collection_test_get_session_serialize(struct blob_buf *b, const struct collection_test_get_session_params *params);
+int collection_test_get_station_deserialize(struct blob_attr *msg, struct collection_test_get_station_params *params);
+int collection_test_get_station_serialize(struct blob_buf *b, const struct collection_test_get_station_params *params);
+int collection_test_session_deserialize(struct blob_attr *msg, struct collection_test_session *params);
+int collection_test_session_serialize(struct blob_buf *b, const struct collection_test_session *params);
+int station_deserialize(struct blob_attr *msg, struct station *params);
+int station_serialize(struct blob_buf *b, const struct station *params);
+int collection_test_neighbor_deserialize(struct blob_attr *msg, struct collection_test_neighbor *params);
+int collection_test_neighbor_serialize(struct blob_buf *b, const struct collection_test_neighbor *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct collection_test_get_session_params *collection_test_get_session_dup(const struct collection_test_get_session_params *params);
+void collection_test_get_session_free(struct collection_test_get_session_params *params);
+struct collection_test_get_station_params *collection_test_get_station_dup(const struct collection_test_get_station_params *params);
+void collection_test_get_station_free(struct collection_test_get_station_params *params);
+struct collection_test_session *collection_test_session_dup(const struct collection_test_session *params);
+void collection_test_session_free(struct collection_test_session *params);
+struct station *station_dup(const struct station *params);
+void station_free(struct station *params);
+struct collection_test_neighbor *collection_test_neighbor_dup(const struct collection_test_neighbor *params);
+void collection_test_neighbor_free(struct collection_test_neighbor *params);
+
+/* Copies of struct collection_test_session ordered by their @key fields (id) */
+struct collection_test_session_list {
+    struct avl_tree avl;
+};
+
+struct collection_test_session_list_entry {
+    struct collection_test_session value;
+    struct avl_node avl;
+};
+
+#define collection_test_session_list_for_each(list, entry) avl_for_each_element(&(list)->avl, entry, avl)
+
+void collection_test_session_list_init(struct collection_test_session_list *list);
+int collection_test_session_list_insert(struct collection_test_session_list *list, const struct collection_test_session *value);
+struct collection_test_session *collection_test_session_list_lookup(struct collection_test_session_list *list, int32_t id);
+int collection_test_session_list_delete(struct collection_test_session_list *list, int32_t id);
+void collection_test_session_list_clear(struct collection_test_session_list *list);
+int collection_test_session_list_serialize(struct blob_buf *b, const char *name, struct collection_test_session_list *list);
+
+/* Copies of struct station ordered by their @key fields (mac) */
+struct station_list {
+    struct avl_tree avl;
+};
+
+struct station_list_entry {
+    struct station value;
+    struct avl_node avl;
+};
+
+#define station_list_for_each(list, entry) avl_for_each_element(&(list)->avl, entry, avl)
+
+void station_list_init(struct station_list *list);
+int station_list_insert(struct station_list *list, const struct station *value);
+struct station *station_list_lookup(struct station_list *list, const char *mac);
+int station_list_delete(struct station_list *list, const char *mac);
+void station_list_clear(struct station_list *list);
+int station_list_serialize(struct blob_buf *b, const char *name, struct station_list *list);
+
+/* Copies of struct collection_test_neighbor ordered by their @key fields (ifname, vlan) */
+struct collection_test_neighbor_list {
+    struct avl_tree avl;
+};
+
+struct collection_test_neighbor_list_entry {
+    struct collection_test_neighbor value;
+    struct avl_node avl;
+};
+
+#define collection_test_neighbor_list_for_each(list, entry) avl_for_each_element(&(list)->avl, entry, avl)
+
+void collection_test_neighbor_list_init(struct collection_test_neighbor_list *list);
+int collection_test_neighbor_list_insert(struct collection_test_neighbor_list *list, const struct collection_test_neighbor *value);
+struct collection_test_neighbor *collection_test_neighbor_list_lookup(struct collection_test_neighbor_list *list, const char *ifname, int16_t vlan);
+int collection_test_neighbor_list_delete(struct collection_test_neighbor_list *list, const char *ifname, int16_t vlan);
+void collection_test_neighbor_list_clear(struct collection_test_neighbor_list *list);
+int collection_test_neighbor_list_serialize(struct blob_buf *b, const char *name, struct collection_test_neighbor_list *list);
+
+/* Names of enum values, NULL for a value out of range, and the reverse lookup */
+const char *neighbor_state_name(enum neighbor_state value);
+int neighbor_state_parse(const char *name, enum neighbor_state *value);
+
+int collection_test_get_session_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct collection_test_session *reply);
+int collection_test_get_station_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct station *reply);
+
+extern struct ubus_object collection_test_object;
+
+void collection_test_object_cleanup(void);
+
+#endif /* __COLLECTION_TEST_OBJECT_H__ */
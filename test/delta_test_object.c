@@ -0,0 +1,1868 @@
+/* Generated from ubus IDL - delta_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "delta_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+/* Copy a blob to the cursor of a *_dup() allocation, blobs go first after the struct to stay aligned */
+static struct blob_attr *ubus_idl_dup_blob(char **p, const struct blob_attr *attr)
+{
+    struct blob_attr *copy = (struct blob_attr *)*p;
+
+    memcpy(copy, attr, blob_pad_len(attr));
+    *p += blob_pad_len(attr);
+    return copy;
+}
+
+static const struct blobmsg_policy delta_test_counters_event_policy[] = {
+    [DELTA_TEST_COUNTERS_EVENT_RX_PACKETS] = { .name = "rx_packets", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_COUNTERS_EVENT_TX_PACKETS] = { .name = "tx_packets", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_COUNTERS_EVENT_RX_BYTES] = { .name = "rx_bytes", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_COUNTERS_EVENT_TX_BYTES] = { .name = "tx_bytes", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_COUNTERS_EVENT_ERRORS] = { .name = "errors", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_COUNTERS_EVENT_LOAD] = { .name = "load", .type = BLOBMSG_TYPE_DOUBLE }
+};
+
+int delta_test_counters_event_deserialize(struct blob_attr *msg, struct delta_test_counters_event_params *params)
+{
+    struct blob_attr *tb_delta_test_counters_event[__DELTA_TEST_COUNTERS_EVENT_MAX];
+    if (blobmsg_parse(delta_test_counters_event_policy, ARRAY_SIZE(delta_test_counters_event_policy), tb_delta_test_counters_event, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_delta_test_counters_event[DELTA_TEST_COUNTERS_EVENT_RX_PACKETS] || !tb_delta_test_counters_event[DELTA_TEST_COUNTERS_EVENT_TX_PACKETS] || !tb_delta_test_counters_event[DELTA_TEST_COUNTERS_EVENT_RX_BYTES] || !tb_delta_test_counters_event[DELTA_TEST_COUNTERS_EVENT_TX_BYTES]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->rx_packets = blobmsg_get_u64(tb_delta_test_counters_event[DELTA_TEST_COUNTERS_EVENT_RX_PACKETS]);
+    params->tx_packets = blobmsg_get_u64(tb_delta_test_counters_event[DELTA_TEST_COUNTERS_EVENT_TX_PACKETS]);
+    params->rx_bytes = blobmsg_get_u64(tb_delta_test_counters_event[DELTA_TEST_COUNTERS_EVENT_RX_BYTES]);
+    params->tx_bytes = blobmsg_get_u64(tb_delta_test_counters_event[DELTA_TEST_COUNTERS_EVENT_TX_BYTES]);
+
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_counters_event, DELTA_TEST_COUNTERS_EVENT_ERRORS, params->errors, params, FIELD, DELTA_TEST_COUNTERS_EVENT_HAS_ERRORS);
+    UBUS_IDL_GET_OPTIONAL(double, tb_delta_test_counters_event, DELTA_TEST_COUNTERS_EVENT_LOAD, params->load, params, FIELD, DELTA_TEST_COUNTERS_EVENT_HAS_LOAD);
+    return UBUS_STATUS_OK;
+}
+
+int delta_test_counters_event_serialize(struct blob_buf *b, const struct delta_test_counters_event_params *params)
+{
+    UBUS_IDL_ADD(u64, b, "rx_packets", params->rx_packets);
+    UBUS_IDL_ADD(u64, b, "tx_packets", params->tx_packets);
+    UBUS_IDL_ADD(u64, b, "rx_bytes", params->rx_bytes);
+    UBUS_IDL_ADD(u64, b, "tx_bytes", params->tx_bytes);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "errors", params->errors, params, FIELD, DELTA_TEST_COUNTERS_EVENT_HAS_ERRORS);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "load", params->load, params, FIELD, DELTA_TEST_COUNTERS_EVENT_HAS_LOAD);
+    return UBUS_STATUS_OK;
+}
+
+struct delta_test_counters_event_params *delta_test_counters_event_dup(const struct delta_test_counters_event_params *params)
+{
+    size_t len = sizeof(*params);
+    struct delta_test_counters_event_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void delta_test_counters_event_free(struct delta_test_counters_event_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy delta_test_port_state_policy[] = {
+    [DELTA_TEST_PORT_STATE_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [DELTA_TEST_PORT_STATE_UP] = { .name = "up", .type = BLOBMSG_TYPE_BOOL },
+    [DELTA_TEST_PORT_STATE_SPEED] = { .name = "speed", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_PORT_STATE_DUPLEX] = { .name = "duplex", .type = BLOBMSG_TYPE_STRING },
+    [DELTA_TEST_PORT_STATE_VLANS] = { .name = "vlans", .type = BLOBMSG_TYPE_ARRAY }
+};
+
+int delta_test_port_state_deserialize(struct blob_attr *msg, struct delta_test_port_state *params)
+{
+    struct blob_attr *tb_delta_test_port_state[__DELTA_TEST_PORT_STATE_MAX];
+    if (blobmsg_parse(delta_test_port_state_policy, ARRAY_SIZE(delta_test_port_state_policy), tb_delta_test_port_state, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_delta_test_port_state[DELTA_TEST_PORT_STATE_IFNAME] || !tb_delta_test_port_state[DELTA_TEST_PORT_STATE_UP]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->ifname = blobmsg_get_string(tb_delta_test_port_state[DELTA_TEST_PORT_STATE_IFNAME]);
+    params->up = blobmsg_get_u8(tb_delta_test_port_state[DELTA_TEST_PORT_STATE_UP]) != 0;
+
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_port_state, DELTA_TEST_PORT_STATE_SPEED, params->speed, params, FIELD, DELTA_TEST_PORT_STATE_HAS_SPEED);
+    UBUS_IDL_GET_OPTIONAL(string, tb_delta_test_port_state, DELTA_TEST_PORT_STATE_DUPLEX, params->duplex, params, FIELD, DELTA_TEST_PORT_STATE_HAS_DUPLEX);
+    if (tb_delta_test_port_state[DELTA_TEST_PORT_STATE_VLANS]) {
+        params->vlans = tb_delta_test_port_state[DELTA_TEST_PORT_STATE_VLANS];
+        UBUS_IDL_SET_FIELD(params, DELTA_TEST_PORT_STATE_HAS_VLANS);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int delta_test_port_state_serialize(struct blob_buf *b, const struct delta_test_port_state *params)
+{
+    int ret;
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    UBUS_IDL_ADD(u8, b, "up", params->up ? 1 : 0);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "speed", params->speed, params, FIELD, DELTA_TEST_PORT_STATE_HAS_SPEED);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "duplex", params->duplex, params, FIELD, DELTA_TEST_PORT_STATE_HAS_DUPLEX);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_PORT_STATE_HAS_VLANS)) {
+        blobmsg_add_field(b, BLOBMSG_TYPE_ARRAY, "vlans", blob_data(params->vlans), blob_len(params->vlans));
+    }
+    return UBUS_STATUS_OK;
+}
+
+struct delta_test_port_state *delta_test_port_state_dup(const struct delta_test_port_state *params)
+{
+    size_t len = sizeof(*params);
+    struct delta_test_port_state *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_PORT_STATE_HAS_VLANS) && params->vlans) {
+        len += blob_pad_len(params->vlans);
+    }
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_PORT_STATE_HAS_DUPLEX) && params->duplex) {
+        len += strlen(params->duplex) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->vlans = UBUS_IDL_HAS_FIELD(params, DELTA_TEST_PORT_STATE_HAS_VLANS) && params->vlans ? ubus_idl_dup_blob(&p, params->vlans) : NULL;
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    copy->duplex = UBUS_IDL_HAS_FIELD(params, DELTA_TEST_PORT_STATE_HAS_DUPLEX) && params->duplex ? ubus_idl_dup_string(&p, params->duplex) : NULL;
+    return copy;
+}
+
+void delta_test_port_state_free(struct delta_test_port_state *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy delta_test_wide_state_policy[] = {
+    [DELTA_TEST_WIDE_STATE_P00] = { .name = "p00", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P01] = { .name = "p01", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P02] = { .name = "p02", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P03] = { .name = "p03", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P04] = { .name = "p04", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P05] = { .name = "p05", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P06] = { .name = "p06", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P07] = { .name = "p07", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P08] = { .name = "p08", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P09] = { .name = "p09", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P10] = { .name = "p10", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P11] = { .name = "p11", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P12] = { .name = "p12", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P13] = { .name = "p13", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P14] = { .name = "p14", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P15] = { .name = "p15", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P16] = { .name = "p16", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P17] = { .name = "p17", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P18] = { .name = "p18", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P19] = { .name = "p19", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P20] = { .name = "p20", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P21] = { .name = "p21", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P22] = { .name = "p22", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P23] = { .name = "p23", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P24] = { .name = "p24", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P25] = { .name = "p25", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P26] = { .name = "p26", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P27] = { .name = "p27", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P28] = { .name = "p28", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P29] = { .name = "p29", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P30] = { .name = "p30", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P31] = { .name = "p31", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P32] = { .name = "p32", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P33] = { .name = "p33", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P34] = { .name = "p34", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P35] = { .name = "p35", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P36] = { .name = "p36", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P37] = { .name = "p37", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P38] = { .name = "p38", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P39] = { .name = "p39", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P40] = { .name = "p40", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P41] = { .name = "p41", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P42] = { .name = "p42", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P43] = { .name = "p43", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P44] = { .name = "p44", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P45] = { .name = "p45", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P46] = { .name = "p46", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P47] = { .name = "p47", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P48] = { .name = "p48", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P49] = { .name = "p49", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P50] = { .name = "p50", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P51] = { .name = "p51", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P52] = { .name = "p52", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P53] = { .name = "p53", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P54] = { .name = "p54", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P55] = { .name = "p55", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P56] = { .name = "p56", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P57] = { .name = "p57", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P58] = { .name = "p58", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P59] = { .name = "p59", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P60] = { .name = "p60", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P61] = { .name = "p61", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P62] = { .name = "p62", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P63] = { .name = "p63", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P64] = { .name = "p64", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P65] = { .name = "p65", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P66] = { .name = "p66", .type = BLOBMSG_TYPE_INT64 },
+    [DELTA_TEST_WIDE_STATE_P67] = { .name = "p67", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P68] = { .name = "p68", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_WIDE_STATE_P69] = { .name = "p69", .type = BLOBMSG_TYPE_INT64 }
+};
+
+int delta_test_wide_state_deserialize(struct blob_attr *msg, struct delta_test_wide_state *params)
+{
+    struct blob_attr *tb_delta_test_wide_state[__DELTA_TEST_WIDE_STATE_MAX];
+    if (blobmsg_parse(delta_test_wide_state_policy, ARRAY_SIZE(delta_test_wide_state_policy), tb_delta_test_wide_state, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P00] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P02] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P04] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P06] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P08] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P10] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P12] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P14] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P16] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P18] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P20] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P22] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P24] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P26] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P28] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P30] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P32] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P34] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P36] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P38] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P40] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P42] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P44] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P46] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P48] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P50] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P52] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P54] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P56] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P58] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P60] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P62] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P64] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P66] || !tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P68]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->p00 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P00]);
+    params->p02 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P02]);
+    params->p04 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P04]);
+    params->p06 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P06]);
+    params->p08 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P08]);
+    params->p10 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P10]);
+    params->p12 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P12]);
+    params->p14 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P14]);
+    params->p16 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P16]);
+    params->p18 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P18]);
+    params->p20 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P20]);
+    params->p22 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P22]);
+    params->p24 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P24]);
+    params->p26 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P26]);
+    params->p28 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P28]);
+    params->p30 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P30]);
+    params->p32 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P32]);
+    params->p34 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P34]);
+    params->p36 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P36]);
+    params->p38 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P38]);
+    params->p40 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P40]);
+    params->p42 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P42]);
+    params->p44 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P44]);
+    params->p46 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P46]);
+    params->p48 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P48]);
+    params->p50 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P50]);
+    params->p52 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P52]);
+    params->p54 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P54]);
+    params->p56 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P56]);
+    params->p58 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P58]);
+    params->p60 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P60]);
+    params->p62 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P62]);
+    params->p64 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P64]);
+    params->p66 = blobmsg_get_u64(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P66]);
+    params->p68 = blobmsg_get_u32(tb_delta_test_wide_state[DELTA_TEST_WIDE_STATE_P68]);
+
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P01, params->p01, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P01);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P03, params->p03, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P03);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P05, params->p05, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P05);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P07, params->p07, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P07);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P09, params->p09, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P09);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P11, params->p11, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P11);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P13, params->p13, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P13);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P15, params->p15, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P15);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P17, params->p17, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P17);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P19, params->p19, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P19);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P21, params->p21, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P21);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P23, params->p23, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P23);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P25, params->p25, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P25);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P27, params->p27, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P27);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P29, params->p29, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P29);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P31, params->p31, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P31);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P33, params->p33, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P33);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P35, params->p35, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P35);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P37, params->p37, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P37);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P39, params->p39, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P39);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P41, params->p41, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P41);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P43, params->p43, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P43);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P45, params->p45, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P45);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P47, params->p47, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P47);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P49, params->p49, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P49);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P51, params->p51, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P51);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P53, params->p53, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P53);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P55, params->p55, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P55);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P57, params->p57, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P57);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P59, params->p59, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P59);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P61, params->p61, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P61);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P63, params->p63, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P63);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P65, params->p65, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P65);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P67, params->p67, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P67);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_delta_test_wide_state, DELTA_TEST_WIDE_STATE_P69, params->p69, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P69);
+    return UBUS_STATUS_OK;
+}
+
+int delta_test_wide_state_serialize(struct blob_buf *b, const struct delta_test_wide_state *params)
+{
+    UBUS_IDL_ADD(u64, b, "p00", params->p00);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p01", params->p01, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P01);
+    UBUS_IDL_ADD(u32, b, "p02", params->p02);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p03", params->p03, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P03);
+    UBUS_IDL_ADD(u32, b, "p04", params->p04);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p05", params->p05, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P05);
+    UBUS_IDL_ADD(u64, b, "p06", params->p06);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p07", params->p07, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P07);
+    UBUS_IDL_ADD(u32, b, "p08", params->p08);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p09", params->p09, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P09);
+    UBUS_IDL_ADD(u32, b, "p10", params->p10);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p11", params->p11, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P11);
+    UBUS_IDL_ADD(u64, b, "p12", params->p12);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p13", params->p13, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P13);
+    UBUS_IDL_ADD(u32, b, "p14", params->p14);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p15", params->p15, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P15);
+    UBUS_IDL_ADD(u32, b, "p16", params->p16);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p17", params->p17, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P17);
+    UBUS_IDL_ADD(u64, b, "p18", params->p18);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p19", params->p19, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P19);
+    UBUS_IDL_ADD(u32, b, "p20", params->p20);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p21", params->p21, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P21);
+    UBUS_IDL_ADD(u32, b, "p22", params->p22);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p23", params->p23, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P23);
+    UBUS_IDL_ADD(u64, b, "p24", params->p24);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p25", params->p25, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P25);
+    UBUS_IDL_ADD(u32, b, "p26", params->p26);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p27", params->p27, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P27);
+    UBUS_IDL_ADD(u32, b, "p28", params->p28);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p29", params->p29, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P29);
+    UBUS_IDL_ADD(u64, b, "p30", params->p30);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p31", params->p31, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P31);
+    UBUS_IDL_ADD(u32, b, "p32", params->p32);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p33", params->p33, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P33);
+    UBUS_IDL_ADD(u32, b, "p34", params->p34);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p35", params->p35, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P35);
+    UBUS_IDL_ADD(u64, b, "p36", params->p36);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p37", params->p37, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P37);
+    UBUS_IDL_ADD(u32, b, "p38", params->p38);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p39", params->p39, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P39);
+    UBUS_IDL_ADD(u32, b, "p40", params->p40);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p41", params->p41, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P41);
+    UBUS_IDL_ADD(u64, b, "p42", params->p42);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p43", params->p43, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P43);
+    UBUS_IDL_ADD(u32, b, "p44", params->p44);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p45", params->p45, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P45);
+    UBUS_IDL_ADD(u32, b, "p46", params->p46);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p47", params->p47, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P47);
+    UBUS_IDL_ADD(u64, b, "p48", params->p48);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p49", params->p49, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P49);
+    UBUS_IDL_ADD(u32, b, "p50", params->p50);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p51", params->p51, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P51);
+    UBUS_IDL_ADD(u32, b, "p52", params->p52);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p53", params->p53, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P53);
+    UBUS_IDL_ADD(u64, b, "p54", params->p54);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p55", params->p55, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P55);
+    UBUS_IDL_ADD(u32, b, "p56", params->p56);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p57", params->p57, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P57);
+    UBUS_IDL_ADD(u32, b, "p58", params->p58);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p59", params->p59, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P59);
+    UBUS_IDL_ADD(u64, b, "p60", params->p60);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p61", params->p61, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P61);
+    UBUS_IDL_ADD(u32, b, "p62", params->p62);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p63", params->p63, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P63);
+    UBUS_IDL_ADD(u32, b, "p64", params->p64);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p65", params->p65, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P65);
+    UBUS_IDL_ADD(u64, b, "p66", params->p66);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "p67", params->p67, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P67);
+    UBUS_IDL_ADD(u32, b, "p68", params->p68);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "p69", params->p69, params, FIELD, DELTA_TEST_WIDE_STATE_HAS_P69);
+    return UBUS_STATUS_OK;
+}
+
+struct delta_test_wide_state *delta_test_wide_state_dup(const struct delta_test_wide_state *params)
+{
+    size_t len = sizeof(*params);
+    struct delta_test_wide_state *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void delta_test_wide_state_free(struct delta_test_wide_state *params)
+{
+    free(params);
+}
+
+/* Fields added to delta notifications next to the event payload */
+enum {
+    DELTA_TEST_DELTA_SEQ,
+    DELTA_TEST_DELTA_FULL,
+    DELTA_TEST_DELTA_CLEARED,
+    __DELTA_TEST_DELTA_MAX
+};
+
+static const struct blobmsg_policy delta_test_delta_policy[] = {
+    [DELTA_TEST_DELTA_SEQ] = { .name = "_seq", .type = BLOBMSG_TYPE_INT32 },
+    [DELTA_TEST_DELTA_FULL] = { .name = "_full", .type = BLOBMSG_TYPE_BOOL },
+    [DELTA_TEST_DELTA_CLEARED] = { .name = "_cleared", .type = BLOBMSG_TYPE_ARRAY },
+};
+
+int delta_test_counters_mirror_apply(struct delta_test_counters_mirror *mirror, struct blob_attr *msg)
+{
+    struct blob_attr *meta[__DELTA_TEST_DELTA_MAX];
+    struct blob_attr *tb[__DELTA_TEST_COUNTERS_EVENT_MAX];
+    uint64_t cleared[1] = { 0 };
+    struct blob_attr *word;
+    size_t rem;
+    uint32_t seq;
+    bool full;
+    int i;
+
+    if (blobmsg_parse(delta_test_delta_policy, ARRAY_SIZE(delta_test_delta_policy), meta, blob_data(msg), blob_len(msg)) < 0 ||
+        !meta[DELTA_TEST_DELTA_SEQ]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    seq = blobmsg_get_u32(meta[DELTA_TEST_DELTA_SEQ]);
+    full = meta[DELTA_TEST_DELTA_FULL] && blobmsg_get_bool(meta[DELTA_TEST_DELTA_FULL]);
+    if (meta[DELTA_TEST_DELTA_CLEARED]) {
+        i = 0;
+        blobmsg_for_each_attr(word, meta[DELTA_TEST_DELTA_CLEARED], rem) {
+            if (i == 1 || blobmsg_type(word) != BLOBMSG_TYPE_INT64) {
+                return UBUS_STATUS_INVALID_ARGUMENT;
+            }
+            cleared[i++] = blobmsg_get_u64(word);
+        }
+    }
+
+    // A delta only applies on top of the previous message, wait for a snapshot after a gap
+    if (!full && (!mirror->synced || seq != mirror->seq + 1)) {
+        mirror->synced = false;
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    if (blobmsg_parse(delta_test_counters_event_policy, ARRAY_SIZE(delta_test_counters_event_policy), tb, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    for (i = 0; i < __DELTA_TEST_COUNTERS_EVENT_MAX; i++) {
+        if (full || tb[i] || UBUS_IDL_TEST_BIT(cleared, i)) {
+            free(mirror->fields[i]);
+            mirror->fields[i] = tb[i] ? blob_memdup(tb[i]) : NULL;
+        }
+    }
+
+    // Rebuild the whole table and decode it with the generated deserializer
+    blob_buf_init(&mirror->buf, 0);
+    for (i = 0; i < __DELTA_TEST_COUNTERS_EVENT_MAX; i++) {
+        if (mirror->fields[i]) {
+            blob_put_raw(&mirror->buf, mirror->fields[i], blob_pad_len(mirror->fields[i]));
+        }
+    }
+
+    mirror->seq = seq;
+    mirror->synced = true;
+    return delta_test_counters_event_deserialize(mirror->buf.head, &mirror->state);
+}
+
+void delta_test_counters_mirror_free(struct delta_test_counters_mirror *mirror)
+{
+    int i;
+
+    for (i = 0; i < __DELTA_TEST_COUNTERS_EVENT_MAX; i++) {
+        free(mirror->fields[i]);
+        mirror->fields[i] = NULL;
+    }
+    blob_buf_free(&mirror->buf);
+    mirror->synced = false;
+}
+
+int delta_test_port_mirror_apply(struct delta_test_port_mirror *mirror, struct blob_attr *msg)
+{
+    struct blob_attr *meta[__DELTA_TEST_DELTA_MAX];
+    struct blob_attr *tb[__DELTA_TEST_PORT_STATE_MAX];
+    uint64_t cleared[1] = { 0 };
+    struct blob_attr *word;
+    size_t rem;
+    uint32_t seq;
+    bool full;
+    int i;
+
+    if (blobmsg_parse(delta_test_delta_policy, ARRAY_SIZE(delta_test_delta_policy), meta, blob_data(msg), blob_len(msg)) < 0 ||
+        !meta[DELTA_TEST_DELTA_SEQ]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    seq = blobmsg_get_u32(meta[DELTA_TEST_DELTA_SEQ]);
+    full = meta[DELTA_TEST_DELTA_FULL] && blobmsg_get_bool(meta[DELTA_TEST_DELTA_FULL]);
+    if (meta[DELTA_TEST_DELTA_CLEARED]) {
+        i = 0;
+        blobmsg_for_each_attr(word, meta[DELTA_TEST_DELTA_CLEARED], rem) {
+            if (i == 1 || blobmsg_type(word) != BLOBMSG_TYPE_INT64) {
+                return UBUS_STATUS_INVALID_ARGUMENT;
+            }
+            cleared[i++] = blobmsg_get_u64(word);
+        }
+    }
+
+    // A delta only applies on top of the previous message, wait for a snapshot after a gap
+    if (!full && (!mirror->synced || seq != mirror->seq + 1)) {
+        mirror->synced = false;
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    if (blobmsg_parse(delta_test_port_state_policy, ARRAY_SIZE(delta_test_port_state_policy), tb, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    for (i = 0; i < __DELTA_TEST_PORT_STATE_MAX; i++) {
+        if (full || tb[i] || UBUS_IDL_TEST_BIT(cleared, i)) {
+            free(mirror->fields[i]);
+            mirror->fields[i] = tb[i] ? blob_memdup(tb[i]) : NULL;
+        }
+    }
+
+    // Rebuild the whole table and decode it with the generated deserializer
+    blob_buf_init(&mirror->buf, 0);
+    for (i = 0; i < __DELTA_TEST_PORT_STATE_MAX; i++) {
+        if (mirror->fields[i]) {
+            blob_put_raw(&mirror->buf, mirror->fields[i], blob_pad_len(mirror->fields[i]));
+        }
+    }
+
+    mirror->seq = seq;
+    mirror->synced = true;
+    return delta_test_port_state_deserialize(mirror->buf.head, &mirror->state);
+}
+
+void delta_test_port_mirror_free(struct delta_test_port_mirror *mirror)
+{
+    int i;
+
+    for (i = 0; i < __DELTA_TEST_PORT_STATE_MAX; i++) {
+        free(mirror->fields[i]);
+        mirror->fields[i] = NULL;
+    }
+    blob_buf_free(&mirror->buf);
+    mirror->synced = false;
+}
+
+int delta_test_wide_mirror_apply(struct delta_test_wide_mirror *mirror, struct blob_attr *msg)
+{
+    struct blob_attr *meta[__DELTA_TEST_DELTA_MAX];
+    struct blob_attr *tb[__DELTA_TEST_WIDE_STATE_MAX];
+    uint64_t cleared[2] = { 0 };
+    struct blob_attr *word;
+    size_t rem;
+    uint32_t seq;
+    bool full;
+    int i;
+
+    if (blobmsg_parse(delta_test_delta_policy, ARRAY_SIZE(delta_test_delta_policy), meta, blob_data(msg), blob_len(msg)) < 0 ||
+        !meta[DELTA_TEST_DELTA_SEQ]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    seq = blobmsg_get_u32(meta[DELTA_TEST_DELTA_SEQ]);
+    full = meta[DELTA_TEST_DELTA_FULL] && blobmsg_get_bool(meta[DELTA_TEST_DELTA_FULL]);
+    if (meta[DELTA_TEST_DELTA_CLEARED]) {
+        i = 0;
+        blobmsg_for_each_attr(word, meta[DELTA_TEST_DELTA_CLEARED], rem) {
+            if (i == 2 || blobmsg_type(word) != BLOBMSG_TYPE_INT64) {
+                return UBUS_STATUS_INVALID_ARGUMENT;
+            }
+            cleared[i++] = blobmsg_get_u64(word);
+        }
+    }
+
+    // A delta only applies on top of the previous message, wait for a snapshot after a gap
+    if (!full && (!mirror->synced || seq != mirror->seq + 1)) {
+        mirror->synced = false;
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    if (blobmsg_parse(delta_test_wide_state_policy, ARRAY_SIZE(delta_test_wide_state_policy), tb, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    for (i = 0; i < __DELTA_TEST_WIDE_STATE_MAX; i++) {
+        if (full || tb[i] || UBUS_IDL_TEST_BIT(cleared, i)) {
+            free(mirror->fields[i]);
+            mirror->fields[i] = tb[i] ? blob_memdup(tb[i]) : NULL;
+        }
+    }
+
+    // Rebuild the whole table and decode it with the generated deserializer
+    blob_buf_init(&mirror->buf, 0);
+    for (i = 0; i < __DELTA_TEST_WIDE_STATE_MAX; i++) {
+        if (mirror->fields[i]) {
+            blob_put_raw(&mirror->buf, mirror->fields[i], blob_pad_len(mirror->fields[i]));
+        }
+    }
+
+    mirror->seq = seq;
+    mirror->synced = true;
+    return delta_test_wide_state_deserialize(mirror->buf.head, &mirror->state);
+}
+
+void delta_test_wide_mirror_free(struct delta_test_wide_mirror *mirror)
+{
+    int i;
+
+    for (i = 0; i < __DELTA_TEST_WIDE_STATE_MAX; i++) {
+        free(mirror->fields[i]);
+        mirror->fields[i] = NULL;
+    }
+    blob_buf_free(&mirror->buf);
+    mirror->synced = false;
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf delta_test_reply_buf;
+
+int delta_test_get_counters_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct delta_test_port_state *reply)
+{
+    int ret;
+
+    blob_buf_init(&delta_test_reply_buf, 0);
+    ret = delta_test_port_state_serialize(&delta_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, delta_test_reply_buf.head);
+}
+
+static const struct ubus_method delta_test_methods[] = {
+    UBUS_METHOD_NOARG("get_counters", delta_test_get_counters_handler)
+};
+
+static struct ubus_object_type delta_test_object_type =
+    UBUS_OBJECT_TYPE("delta_test", delta_test_methods);
+
+static void delta_test_subscribe_cb(struct ubus_context *ctx, struct ubus_object *obj);
+
+struct ubus_object delta_test_object = {
+    .name = "delta_test",
+    .type = &delta_test_object_type,
+    .subscribe_cb = delta_test_subscribe_cb,
+    .methods = delta_test_methods,
+    .n_methods = ARRAY_SIZE(delta_test_methods),
+};
+
+/* Buffer reused by all event notifications of this object */
+static struct blob_buf delta_test_event_buf;
+
+static bool delta_test_delta_empty(const uint64_t *mask, int words)
+{
+    int i;
+
+    for (i = 0; i < words; i++) {
+        if (mask[i]) {
+            return false;
+        }
+    }
+    return true;
+}
+
+static bool delta_test_delta_str_equal(const char *a, const char *b)
+{
+    if (!a || !b) {
+        return a == b;
+    }
+    return !strcmp(a, b);
+}
+
+#ifndef DELTA_TEST_COUNTERS_SNAPSHOT_INTERVAL
+#define DELTA_TEST_COUNTERS_SNAPSHOT_INTERVAL 16
+#endif
+
+/* Last published counters event, the next delta is computed against it */
+static struct {
+    struct delta_test_counters_event_params last;
+    uint32_t seq;
+    unsigned int since_full;
+    bool valid;
+} delta_test_counters_delta;
+
+static void delta_test_counters_delta_reset(void)
+{
+    memset(&delta_test_counters_delta.last, 0, sizeof(delta_test_counters_delta.last));
+    delta_test_counters_delta.valid = false;
+}
+
+/* Set fields of params, the bits follow the policy indices */
+static void delta_test_counters_delta_present(const struct delta_test_counters_event_params *params, uint64_t *mask)
+{
+    memset(mask, 0, 1 * sizeof(uint64_t));
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_COUNTERS_EVENT_RX_PACKETS);
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_COUNTERS_EVENT_TX_PACKETS);
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_COUNTERS_EVENT_RX_BYTES);
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_COUNTERS_EVENT_TX_BYTES);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_COUNTERS_EVENT_HAS_ERRORS)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_COUNTERS_EVENT_ERRORS);
+    }
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_COUNTERS_EVENT_HAS_LOAD)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_COUNTERS_EVENT_LOAD);
+    }
+}
+
+static int delta_test_counters_delta_send(struct ubus_context *ctx, const uint64_t *dirty, const uint64_t *cleared, bool full)
+{
+    const struct delta_test_counters_event_params *last = &delta_test_counters_delta.last;
+    void *words;
+    int i;
+
+    blob_buf_init(&delta_test_event_buf, 0);
+    blobmsg_add_u32(&delta_test_event_buf, "_seq", ++delta_test_counters_delta.seq);
+    if (full) {
+        blobmsg_add_u8(&delta_test_event_buf, "_full", 1);
+    }
+    if (cleared && !delta_test_delta_empty(cleared, 1)) {
+        words = blobmsg_open_array(&delta_test_event_buf, "_cleared");
+        for (i = 0; i < 1; i++) {
+            blobmsg_add_u64(&delta_test_event_buf, NULL, cleared[i]);
+        }
+        blobmsg_close_array(&delta_test_event_buf, words);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_RX_PACKETS) {
+        blobmsg_add_u64(&delta_test_event_buf, "rx_packets", last->rx_packets);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_TX_PACKETS) {
+        blobmsg_add_u64(&delta_test_event_buf, "tx_packets", last->tx_packets);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_RX_BYTES) {
+        blobmsg_add_u64(&delta_test_event_buf, "rx_bytes", last->rx_bytes);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_TX_BYTES) {
+        blobmsg_add_u64(&delta_test_event_buf, "tx_bytes", last->tx_bytes);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_ERRORS) {
+        blobmsg_add_u32(&delta_test_event_buf, "errors", last->errors);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_LOAD) {
+        blobmsg_add_double(&delta_test_event_buf, "load", last->load);
+    }
+
+    delta_test_counters_delta.since_full = full ? 0 : delta_test_counters_delta.since_full + 1;
+    return ubus_notify(ctx, &delta_test_object, "counters", delta_test_event_buf.head, -1);
+}
+
+int delta_test_notify_counters(struct ubus_context *ctx, const struct delta_test_counters_event_params *params)
+{
+    struct delta_test_counters_event_params *last = &delta_test_counters_delta.last;
+    uint64_t present[1];
+    uint64_t previous[1] = { 0 };
+    uint64_t stale[1];
+    uint64_t dirty[1] = { 0 };
+    bool full;
+    int i;
+
+    // Nobody is subscribed, the next subscriber starts from a snapshot
+    if (!delta_test_object.has_subscribers) {
+        delta_test_counters_delta_reset();
+        return UBUS_STATUS_OK;
+    }
+
+    full = !delta_test_counters_delta.valid || delta_test_counters_delta.since_full >= DELTA_TEST_COUNTERS_SNAPSHOT_INTERVAL;
+    delta_test_counters_delta_present(params, present);
+    if (delta_test_counters_delta.valid) {
+        delta_test_counters_delta_present(last, previous);
+    }
+    for (i = 0; i < 1; i++) {
+        stale[i] = previous[i] & ~present[i];
+    }
+
+    // Compare field by field, the bits follow the policy indices
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_COUNTERS_EVENT_RX_PACKETS) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_COUNTERS_EVENT_RX_PACKETS) ||
+        params->rx_packets != last->rx_packets)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_RX_PACKETS);
+        last->rx_packets = params->rx_packets;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_COUNTERS_EVENT_TX_PACKETS) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_COUNTERS_EVENT_TX_PACKETS) ||
+        params->tx_packets != last->tx_packets)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_TX_PACKETS);
+        last->tx_packets = params->tx_packets;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_COUNTERS_EVENT_RX_BYTES) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_COUNTERS_EVENT_RX_BYTES) ||
+        params->rx_bytes != last->rx_bytes)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_RX_BYTES);
+        last->rx_bytes = params->rx_bytes;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_COUNTERS_EVENT_TX_BYTES) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_COUNTERS_EVENT_TX_BYTES) ||
+        params->tx_bytes != last->tx_bytes)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_TX_BYTES);
+        last->tx_bytes = params->tx_bytes;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_COUNTERS_EVENT_ERRORS) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_COUNTERS_EVENT_ERRORS) ||
+        params->errors != last->errors)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_ERRORS);
+        last->errors = params->errors;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_COUNTERS_EVENT_LOAD) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_COUNTERS_EVENT_LOAD) ||
+        params->load != last->load)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_COUNTERS_EVENT_LOAD);
+        last->load = params->load;
+    }
+    memcpy(&last->has_fields, &params->has_fields, sizeof(last->has_fields));
+
+    if (!full && delta_test_delta_empty(dirty, 1) && delta_test_delta_empty(stale, 1)) {
+        return UBUS_STATUS_OK;
+    }
+
+    delta_test_counters_delta.valid = true;
+    return delta_test_counters_delta_send(ctx, dirty, full ? NULL : stale, full);
+}
+
+int delta_test_notify_counters_full(struct ubus_context *ctx)
+{
+    uint64_t present[1];
+
+    if (!delta_test_counters_delta.valid || !delta_test_object.has_subscribers) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    delta_test_counters_delta_present(&delta_test_counters_delta.last, present);
+    return delta_test_counters_delta_send(ctx, present, NULL, true);
+}
+
+#ifndef DELTA_TEST_PORT_SNAPSHOT_INTERVAL
+#define DELTA_TEST_PORT_SNAPSHOT_INTERVAL 64
+#endif
+
+/* Last published port event, the next delta is computed against it */
+static struct {
+    struct delta_test_port_state last;
+    uint32_t seq;
+    unsigned int since_full;
+    bool valid;
+} delta_test_port_delta;
+
+static void delta_test_port_delta_reset(void)
+{
+    free((char *)delta_test_port_delta.last.ifname);
+    free((char *)delta_test_port_delta.last.duplex);
+    free(delta_test_port_delta.last.vlans);
+    memset(&delta_test_port_delta.last, 0, sizeof(delta_test_port_delta.last));
+    delta_test_port_delta.valid = false;
+}
+
+/* Set fields of params, the bits follow the policy indices */
+static void delta_test_port_delta_present(const struct delta_test_port_state *params, uint64_t *mask)
+{
+    memset(mask, 0, 1 * sizeof(uint64_t));
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_PORT_STATE_IFNAME);
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_PORT_STATE_UP);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_PORT_STATE_HAS_SPEED)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_PORT_STATE_SPEED);
+    }
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_PORT_STATE_HAS_DUPLEX)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_PORT_STATE_DUPLEX);
+    }
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_PORT_STATE_HAS_VLANS)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_PORT_STATE_VLANS);
+    }
+}
+
+static int delta_test_port_delta_send(struct ubus_context *ctx, const uint64_t *dirty, const uint64_t *cleared, bool full)
+{
+    const struct delta_test_port_state *last = &delta_test_port_delta.last;
+    void *words;
+    int i;
+
+    blob_buf_init(&delta_test_event_buf, 0);
+    blobmsg_add_u32(&delta_test_event_buf, "_seq", ++delta_test_port_delta.seq);
+    if (full) {
+        blobmsg_add_u8(&delta_test_event_buf, "_full", 1);
+    }
+    if (cleared && !delta_test_delta_empty(cleared, 1)) {
+        words = blobmsg_open_array(&delta_test_event_buf, "_cleared");
+        for (i = 0; i < 1; i++) {
+            blobmsg_add_u64(&delta_test_event_buf, NULL, cleared[i]);
+        }
+        blobmsg_close_array(&delta_test_event_buf, words);
+    }
+    if (UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_PORT_STATE_IFNAME) && last->ifname) {
+        blobmsg_add_string(&delta_test_event_buf, "ifname", last->ifname);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_PORT_STATE_UP) {
+        blobmsg_add_u8(&delta_test_event_buf, "up", last->up ? 1 : 0);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_PORT_STATE_SPEED) {
+        blobmsg_add_u32(&delta_test_event_buf, "speed", last->speed);
+    }
+    if (UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_PORT_STATE_DUPLEX) && last->duplex) {
+        blobmsg_add_string(&delta_test_event_buf, "duplex", last->duplex);
+    }
+    if (UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_PORT_STATE_VLANS) && last->vlans) {
+        blobmsg_add_field(&delta_test_event_buf, BLOBMSG_TYPE_ARRAY, "vlans", blob_data(last->vlans), blob_len(last->vlans));
+    }
+
+    delta_test_port_delta.since_full = full ? 0 : delta_test_port_delta.since_full + 1;
+    return ubus_notify(ctx, &delta_test_object, "port", delta_test_event_buf.head, -1);
+}
+
+int delta_test_notify_port(struct ubus_context *ctx, const struct delta_test_port_state *params)
+{
+    struct delta_test_port_state *last = &delta_test_port_delta.last;
+    uint64_t present[1];
+    uint64_t previous[1] = { 0 };
+    uint64_t stale[1];
+    uint64_t dirty[1] = { 0 };
+    bool full;
+    int i;
+
+    // Nobody is subscribed, the next subscriber starts from a snapshot
+    if (!delta_test_object.has_subscribers) {
+        delta_test_port_delta_reset();
+        return UBUS_STATUS_OK;
+    }
+
+    full = !delta_test_port_delta.valid || delta_test_port_delta.since_full >= DELTA_TEST_PORT_SNAPSHOT_INTERVAL;
+    delta_test_port_delta_present(params, present);
+    if (delta_test_port_delta.valid) {
+        delta_test_port_delta_present(last, previous);
+    }
+    for (i = 0; i < 1; i++) {
+        stale[i] = previous[i] & ~present[i];
+    }
+
+    // Compare field by field, the bits follow the policy indices
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_PORT_STATE_IFNAME) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_PORT_STATE_IFNAME) ||
+        !delta_test_delta_str_equal(params->ifname, last->ifname))) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_PORT_STATE_IFNAME);
+        free((char *)last->ifname);
+        last->ifname = params->ifname ? strdup(params->ifname) : NULL;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_PORT_STATE_UP) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_PORT_STATE_UP) ||
+        params->up != last->up)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_PORT_STATE_UP);
+        last->up = params->up;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_PORT_STATE_SPEED) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_PORT_STATE_SPEED) ||
+        params->speed != last->speed)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_PORT_STATE_SPEED);
+        last->speed = params->speed;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_PORT_STATE_DUPLEX) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_PORT_STATE_DUPLEX) ||
+        !delta_test_delta_str_equal(params->duplex, last->duplex))) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_PORT_STATE_DUPLEX);
+        free((char *)last->duplex);
+        last->duplex = params->duplex ? strdup(params->duplex) : NULL;
+    }
+    if (UBUS_IDL_TEST_BIT(stale, DELTA_TEST_PORT_STATE_DUPLEX)) {
+        free((char *)last->duplex);
+        last->duplex = NULL;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_PORT_STATE_VLANS) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_PORT_STATE_VLANS) ||
+        !blob_attr_equal(params->vlans, last->vlans))) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_PORT_STATE_VLANS);
+        free(last->vlans);
+        last->vlans = params->vlans ? blob_memdup(params->vlans) : NULL;
+    }
+    if (UBUS_IDL_TEST_BIT(stale, DELTA_TEST_PORT_STATE_VLANS)) {
+        free(last->vlans);
+        last->vlans = NULL;
+    }
+    memcpy(&last->has_fields, &params->has_fields, sizeof(last->has_fields));
+
+    if (!full && delta_test_delta_empty(dirty, 1) && delta_test_delta_empty(stale, 1)) {
+        return UBUS_STATUS_OK;
+    }
+
+    delta_test_port_delta.valid = true;
+    return delta_test_port_delta_send(ctx, dirty, full ? NULL : stale, full);
+}
+
+int delta_test_notify_port_full(struct ubus_context *ctx)
+{
+    uint64_t present[1];
+
+    if (!delta_test_port_delta.valid || !delta_test_object.has_subscribers) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    delta_test_port_delta_present(&delta_test_port_delta.last, present);
+    return delta_test_port_delta_send(ctx, present, NULL, true);
+}
+
+#ifndef DELTA_TEST_WIDE_SNAPSHOT_INTERVAL
+#define DELTA_TEST_WIDE_SNAPSHOT_INTERVAL 64
+#endif
+
+/* Last published wide event, the next delta is computed against it */
+static struct {
+    struct delta_test_wide_state last;
+    uint32_t seq;
+    unsigned int since_full;
+    bool valid;
+} delta_test_wide_delta;
+
+static void delta_test_wide_delta_reset(void)
+{
+    memset(&delta_test_wide_delta.last, 0, sizeof(delta_test_wide_delta.last));
+    delta_test_wide_delta.valid = false;
+}
+
+/* Set fields of params, the bits follow the policy indices */
+static void delta_test_wide_delta_present(const struct delta_test_wide_state *params, uint64_t *mask)
+{
+    memset(mask, 0, 2 * sizeof(uint64_t));
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P00);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P01)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P01);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P02);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P03)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P03);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P04);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P05)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P05);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P06);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P07)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P07);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P08);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P09)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P09);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P10);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P11)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P11);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P12);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P13)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P13);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P14);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P15)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P15);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P16);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P17)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P17);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P18);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P19)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P19);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P20);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P21)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P21);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P22);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P23)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P23);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P24);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P25)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P25);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P26);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P27)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P27);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P28);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P29)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P29);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P30);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P31)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P31);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P32);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P33)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P33);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P34);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P35)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P35);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P36);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P37)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P37);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P38);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P39)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P39);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P40);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P41)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P41);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P42);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P43)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P43);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P44);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P45)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P45);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P46);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P47)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P47);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P48);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P49)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P49);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P50);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P51)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P51);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P52);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P53)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P53);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P54);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P55)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P55);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P56);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P57)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P57);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P58);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P59)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P59);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P60);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P61)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P61);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P62);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P63)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P63);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P64);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P65)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P65);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P66);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P67)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P67);
+    }
+    UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P68);
+    if (UBUS_IDL_HAS_FIELD(params, DELTA_TEST_WIDE_STATE_HAS_P69)) {
+        UBUS_IDL_SET_BIT(mask, DELTA_TEST_WIDE_STATE_P69);
+    }
+}
+
+static int delta_test_wide_delta_send(struct ubus_context *ctx, const uint64_t *dirty, const uint64_t *cleared, bool full)
+{
+    const struct delta_test_wide_state *last = &delta_test_wide_delta.last;
+    void *words;
+    int i;
+
+    blob_buf_init(&delta_test_event_buf, 0);
+    blobmsg_add_u32(&delta_test_event_buf, "_seq", ++delta_test_wide_delta.seq);
+    if (full) {
+        blobmsg_add_u8(&delta_test_event_buf, "_full", 1);
+    }
+    if (cleared && !delta_test_delta_empty(cleared, 2)) {
+        words = blobmsg_open_array(&delta_test_event_buf, "_cleared");
+        for (i = 0; i < 2; i++) {
+            blobmsg_add_u64(&delta_test_event_buf, NULL, cleared[i]);
+        }
+        blobmsg_close_array(&delta_test_event_buf, words);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P00) {
+        blobmsg_add_u64(&delta_test_event_buf, "p00", last->p00);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P01) {
+        blobmsg_add_u32(&delta_test_event_buf, "p01", last->p01);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P02) {
+        blobmsg_add_u32(&delta_test_event_buf, "p02", last->p02);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P03) {
+        blobmsg_add_u64(&delta_test_event_buf, "p03", last->p03);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P04) {
+        blobmsg_add_u32(&delta_test_event_buf, "p04", last->p04);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P05) {
+        blobmsg_add_u32(&delta_test_event_buf, "p05", last->p05);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P06) {
+        blobmsg_add_u64(&delta_test_event_buf, "p06", last->p06);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P07) {
+        blobmsg_add_u32(&delta_test_event_buf, "p07", last->p07);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P08) {
+        blobmsg_add_u32(&delta_test_event_buf, "p08", last->p08);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P09) {
+        blobmsg_add_u64(&delta_test_event_buf, "p09", last->p09);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P10) {
+        blobmsg_add_u32(&delta_test_event_buf, "p10", last->p10);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P11) {
+        blobmsg_add_u32(&delta_test_event_buf, "p11", last->p11);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P12) {
+        blobmsg_add_u64(&delta_test_event_buf, "p12", last->p12);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P13) {
+        blobmsg_add_u32(&delta_test_event_buf, "p13", last->p13);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P14) {
+        blobmsg_add_u32(&delta_test_event_buf, "p14", last->p14);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P15) {
+        blobmsg_add_u64(&delta_test_event_buf, "p15", last->p15);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P16) {
+        blobmsg_add_u32(&delta_test_event_buf, "p16", last->p16);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P17) {
+        blobmsg_add_u32(&delta_test_event_buf, "p17", last->p17);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P18) {
+        blobmsg_add_u64(&delta_test_event_buf, "p18", last->p18);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P19) {
+        blobmsg_add_u32(&delta_test_event_buf, "p19", last->p19);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P20) {
+        blobmsg_add_u32(&delta_test_event_buf, "p20", last->p20);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P21) {
+        blobmsg_add_u64(&delta_test_event_buf, "p21", last->p21);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P22) {
+        blobmsg_add_u32(&delta_test_event_buf, "p22", last->p22);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P23) {
+        blobmsg_add_u32(&delta_test_event_buf, "p23", last->p23);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P24) {
+        blobmsg_add_u64(&delta_test_event_buf, "p24", last->p24);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P25) {
+        blobmsg_add_u32(&delta_test_event_buf, "p25", last->p25);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P26) {
+        blobmsg_add_u32(&delta_test_event_buf, "p26", last->p26);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P27) {
+        blobmsg_add_u64(&delta_test_event_buf, "p27", last->p27);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P28) {
+        blobmsg_add_u32(&delta_test_event_buf, "p28", last->p28);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P29) {
+        blobmsg_add_u32(&delta_test_event_buf, "p29", last->p29);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P30) {
+        blobmsg_add_u64(&delta_test_event_buf, "p30", last->p30);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P31) {
+        blobmsg_add_u32(&delta_test_event_buf, "p31", last->p31);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P32) {
+        blobmsg_add_u32(&delta_test_event_buf, "p32", last->p32);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P33) {
+        blobmsg_add_u64(&delta_test_event_buf, "p33", last->p33);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P34) {
+        blobmsg_add_u32(&delta_test_event_buf, "p34", last->p34);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P35) {
+        blobmsg_add_u32(&delta_test_event_buf, "p35", last->p35);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P36) {
+        blobmsg_add_u64(&delta_test_event_buf, "p36", last->p36);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P37) {
+        blobmsg_add_u32(&delta_test_event_buf, "p37", last->p37);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P38) {
+        blobmsg_add_u32(&delta_test_event_buf, "p38", last->p38);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P39) {
+        blobmsg_add_u64(&delta_test_event_buf, "p39", last->p39);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P40) {
+        blobmsg_add_u32(&delta_test_event_buf, "p40", last->p40);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P41) {
+        blobmsg_add_u32(&delta_test_event_buf, "p41", last->p41);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P42) {
+        blobmsg_add_u64(&delta_test_event_buf, "p42", last->p42);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P43) {
+        blobmsg_add_u32(&delta_test_event_buf, "p43", last->p43);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P44) {
+        blobmsg_add_u32(&delta_test_event_buf, "p44", last->p44);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P45) {
+        blobmsg_add_u64(&delta_test_event_buf, "p45", last->p45);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P46) {
+        blobmsg_add_u32(&delta_test_event_buf, "p46", last->p46);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P47) {
+        blobmsg_add_u32(&delta_test_event_buf, "p47", last->p47);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P48) {
+        blobmsg_add_u64(&delta_test_event_buf, "p48", last->p48);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P49) {
+        blobmsg_add_u32(&delta_test_event_buf, "p49", last->p49);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P50) {
+        blobmsg_add_u32(&delta_test_event_buf, "p50", last->p50);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P51) {
+        blobmsg_add_u64(&delta_test_event_buf, "p51", last->p51);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P52) {
+        blobmsg_add_u32(&delta_test_event_buf, "p52", last->p52);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P53) {
+        blobmsg_add_u32(&delta_test_event_buf, "p53", last->p53);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P54) {
+        blobmsg_add_u64(&delta_test_event_buf, "p54", last->p54);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P55) {
+        blobmsg_add_u32(&delta_test_event_buf, "p55", last->p55);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P56) {
+        blobmsg_add_u32(&delta_test_event_buf, "p56", last->p56);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P57) {
+        blobmsg_add_u64(&delta_test_event_buf, "p57", last->p57);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P58) {
+        blobmsg_add_u32(&delta_test_event_buf, "p58", last->p58);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P59) {
+        blobmsg_add_u32(&delta_test_event_buf, "p59", last->p59);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P60) {
+        blobmsg_add_u64(&delta_test_event_buf, "p60", last->p60);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P61) {
+        blobmsg_add_u32(&delta_test_event_buf, "p61", last->p61);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P62) {
+        blobmsg_add_u32(&delta_test_event_buf, "p62", last->p62);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P63) {
+        blobmsg_add_u64(&delta_test_event_buf, "p63", last->p63);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P64) {
+        blobmsg_add_u32(&delta_test_event_buf, "p64", last->p64);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P65) {
+        blobmsg_add_u32(&delta_test_event_buf, "p65", last->p65);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P66) {
+        blobmsg_add_u64(&delta_test_event_buf, "p66", last->p66);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P67) {
+        blobmsg_add_u32(&delta_test_event_buf, "p67", last->p67);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P68) {
+        blobmsg_add_u32(&delta_test_event_buf, "p68", last->p68);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, DELTA_TEST_WIDE_STATE_P69) {
+        blobmsg_add_u64(&delta_test_event_buf, "p69", last->p69);
+    }
+
+    delta_test_wide_delta.since_full = full ? 0 : delta_test_wide_delta.since_full + 1;
+    return ubus_notify(ctx, &delta_test_object, "wide", delta_test_event_buf.head, -1);
+}
+
+int delta_test_notify_wide(struct ubus_context *ctx, const struct delta_test_wide_state *params)
+{
+    struct delta_test_wide_state *last = &delta_test_wide_delta.last;
+    uint64_t present[2];
+    uint64_t previous[2] = { 0 };
+    uint64_t stale[2];
+    uint64_t dirty[2] = { 0 };
+    bool full;
+    int i;
+
+    // Nobody is subscribed, the next subscriber starts from a snapshot
+    if (!delta_test_object.has_subscribers) {
+        delta_test_wide_delta_reset();
+        return UBUS_STATUS_OK;
+    }
+
+    full = !delta_test_wide_delta.valid || delta_test_wide_delta.since_full >= DELTA_TEST_WIDE_SNAPSHOT_INTERVAL;
+    delta_test_wide_delta_present(params, present);
+    if (delta_test_wide_delta.valid) {
+        delta_test_wide_delta_present(last, previous);
+    }
+    for (i = 0; i < 2; i++) {
+        stale[i] = previous[i] & ~present[i];
+    }
+
+    // Compare field by field, the bits follow the policy indices
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P00) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P00) ||
+        params->p00 != last->p00)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P00);
+        last->p00 = params->p00;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P01) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P01) ||
+        params->p01 != last->p01)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P01);
+        last->p01 = params->p01;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P02) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P02) ||
+        params->p02 != last->p02)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P02);
+        last->p02 = params->p02;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P03) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P03) ||
+        params->p03 != last->p03)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P03);
+        last->p03 = params->p03;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P04) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P04) ||
+        params->p04 != last->p04)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P04);
+        last->p04 = params->p04;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P05) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P05) ||
+        params->p05 != last->p05)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P05);
+        last->p05 = params->p05;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P06) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P06) ||
+        params->p06 != last->p06)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P06);
+        last->p06 = params->p06;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P07) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P07) ||
+        params->p07 != last->p07)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P07);
+        last->p07 = params->p07;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P08) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P08) ||
+        params->p08 != last->p08)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P08);
+        last->p08 = params->p08;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P09) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P09) ||
+        params->p09 != last->p09)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P09);
+        last->p09 = params->p09;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P10) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P10) ||
+        params->p10 != last->p10)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P10);
+        last->p10 = params->p10;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P11) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P11) ||
+        params->p11 != last->p11)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P11);
+        last->p11 = params->p11;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P12) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P12) ||
+        params->p12 != last->p12)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P12);
+        last->p12 = params->p12;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P13) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P13) ||
+        params->p13 != last->p13)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P13);
+        last->p13 = params->p13;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P14) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P14) ||
+        params->p14 != last->p14)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P14);
+        last->p14 = params->p14;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P15) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P15) ||
+        params->p15 != last->p15)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P15);
+        last->p15 = params->p15;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P16) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P16) ||
+        params->p16 != last->p16)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P16);
+        last->p16 = params->p16;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P17) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P17) ||
+        params->p17 != last->p17)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P17);
+        last->p17 = params->p17;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P18) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P18) ||
+        params->p18 != last->p18)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P18);
+        last->p18 = params->p18;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P19) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P19) ||
+        params->p19 != last->p19)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P19);
+        last->p19 = params->p19;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P20) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P20) ||
+        params->p20 != last->p20)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P20);
+        last->p20 = params->p20;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P21) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P21) ||
+        params->p21 != last->p21)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P21);
+        last->p21 = params->p21;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P22) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P22) ||
+        params->p22 != last->p22)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P22);
+        last->p22 = params->p22;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P23) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P23) ||
+        params->p23 != last->p23)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P23);
+        last->p23 = params->p23;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P24) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P24) ||
+        params->p24 != last->p24)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P24);
+        last->p24 = params->p24;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P25) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P25) ||
+        params->p25 != last->p25)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P25);
+        last->p25 = params->p25;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P26) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P26) ||
+        params->p26 != last->p26)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P26);
+        last->p26 = params->p26;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P27) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P27) ||
+        params->p27 != last->p27)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P27);
+        last->p27 = params->p27;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P28) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P28) ||
+        params->p28 != last->p28)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P28);
+        last->p28 = params->p28;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P29) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P29) ||
+        params->p29 != last->p29)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P29);
+        last->p29 = params->p29;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P30) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P30) ||
+        params->p30 != last->p30)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P30);
+        last->p30 = params->p30;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P31) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P31) ||
+        params->p31 != last->p31)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P31);
+        last->p31 = params->p31;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P32) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P32) ||
+        params->p32 != last->p32)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P32);
+        last->p32 = params->p32;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P33) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P33) ||
+        params->p33 != last->p33)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P33);
+        last->p33 = params->p33;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P34) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P34) ||
+        params->p34 != last->p34)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P34);
+        last->p34 = params->p34;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P35) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P35) ||
+        params->p35 != last->p35)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P35);
+        last->p35 = params->p35;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P36) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P36) ||
+        params->p36 != last->p36)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P36);
+        last->p36 = params->p36;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P37) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P37) ||
+        params->p37 != last->p37)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P37);
+        last->p37 = params->p37;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P38) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P38) ||
+        params->p38 != last->p38)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P38);
+        last->p38 = params->p38;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P39) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P39) ||
+        params->p39 != last->p39)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P39);
+        last->p39 = params->p39;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P40) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P40) ||
+        params->p40 != last->p40)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P40);
+        last->p40 = params->p40;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P41) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P41) ||
+        params->p41 != last->p41)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P41);
+        last->p41 = params->p41;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P42) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P42) ||
+        params->p42 != last->p42)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P42);
+        last->p42 = params->p42;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P43) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P43) ||
+        params->p43 != last->p43)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P43);
+        last->p43 = params->p43;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P44) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P44) ||
+        params->p44 != last->p44)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P44);
+        last->p44 = params->p44;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P45) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P45) ||
+        params->p45 != last->p45)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P45);
+        last->p45 = params->p45;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P46) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P46) ||
+        params->p46 != last->p46)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P46);
+        last->p46 = params->p46;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P47) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P47) ||
+        params->p47 != last->p47)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P47);
+        last->p47 = params->p47;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P48) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P48) ||
+        params->p48 != last->p48)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P48);
+        last->p48 = params->p48;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P49) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P49) ||
+        params->p49 != last->p49)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P49);
+        last->p49 = params->p49;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P50) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P50) ||
+        params->p50 != last->p50)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P50);
+        last->p50 = params->p50;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P51) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P51) ||
+        params->p51 != last->p51)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P51);
+        last->p51 = params->p51;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P52) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P52) ||
+        params->p52 != last->p52)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P52);
+        last->p52 = params->p52;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P53) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P53) ||
+        params->p53 != last->p53)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P53);
+        last->p53 = params->p53;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P54) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P54) ||
+        params->p54 != last->p54)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P54);
+        last->p54 = params->p54;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P55) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P55) ||
+        params->p55 != last->p55)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P55);
+        last->p55 = params->p55;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P56) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P56) ||
+        params->p56 != last->p56)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P56);
+        last->p56 = params->p56;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P57) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P57) ||
+        params->p57 != last->p57)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P57);
+        last->p57 = params->p57;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P58) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P58) ||
+        params->p58 != last->p58)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P58);
+        last->p58 = params->p58;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P59) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P59) ||
+        params->p59 != last->p59)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P59);
+        last->p59 = params->p59;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P60) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P60) ||
+        params->p60 != last->p60)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P60);
+        last->p60 = params->p60;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P61) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P61) ||
+        params->p61 != last->p61)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P61);
+        last->p61 = params->p61;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P62) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P62) ||
+        params->p62 != last->p62)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P62);
+        last->p62 = params->p62;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P63) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P63) ||
+        params->p63 != last->p63)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P63);
+        last->p63 = params->p63;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P64) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P64) ||
+        params->p64 != last->p64)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P64);
+        last->p64 = params->p64;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P65) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P65) ||
+        params->p65 != last->p65)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P65);
+        last->p65 = params->p65;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P66) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P66) ||
+        params->p66 != last->p66)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P66);
+        last->p66 = params->p66;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P67) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P67) ||
+        params->p67 != last->p67)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P67);
+        last->p67 = params->p67;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P68) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P68) ||
+        params->p68 != last->p68)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P68);
+        last->p68 = params->p68;
+    }
+    if (UBUS_IDL_TEST_BIT(present, DELTA_TEST_WIDE_STATE_P69) && (full || !UBUS_IDL_TEST_BIT(previous, DELTA_TEST_WIDE_STATE_P69) ||
+        params->p69 != last->p69)) {
+        UBUS_IDL_SET_BIT(dirty, DELTA_TEST_WIDE_STATE_P69);
+        last->p69 = params->p69;
+    }
+    memcpy(&last->has_fields, &params->has_fields, sizeof(last->has_fields));
+
+    if (!full && delta_test_delta_empty(dirty, 2) && delta_test_delta_empty(stale, 2)) {
+        return UBUS_STATUS_OK;
+    }
+
+    delta_test_wide_delta.valid = true;
+    return delta_test_wide_delta_send(ctx, dirty, full ? NULL : stale, full);
+}
+
+int delta_test_notify_wide_full(struct ubus_context *ctx)
+{
+    uint64_t present[2];
+
+    if (!delta_test_wide_delta.valid || !delta_test_object.has_subscribers) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    delta_test_wide_delta_present(&delta_test_wide_delta.last, present);
+    return delta_test_wide_delta_send(ctx, present, NULL, true);
+}
+
+int delta_test_notify_reset(struct ubus_context *ctx)
+{
+    // Nobody is subscribed, skip building the message
+    if (!delta_test_object.has_subscribers) {
+        return UBUS_STATUS_OK;
+    }
+
+    blob_buf_init(&delta_test_event_buf, 0);
+
+    return ubus_notify(ctx, &delta_test_object, "reset", delta_test_event_buf.head, -1);
+}
+
+static void delta_test_subscribe_cb(struct ubus_context *ctx, struct ubus_object *obj)
+{
+    // Bring a new subscriber up to date with a snapshot of every delta event
+    if (!obj->has_subscribers) {
+        return;
+    }
+
+    delta_test_notify_counters_full(ctx);
+    delta_test_notify_port_full(ctx);
+    delta_test_notify_wide_full(ctx);
+}
+
+void delta_test_object_cleanup(void)
+{
+    blob_buf_free(&delta_test_reply_buf);
+    blob_buf_free(&delta_test_event_buf);
+    delta_test_counters_delta_reset();
+    delta_test_port_delta_reset();
+    delta_test_wide_delta_reset();
+}
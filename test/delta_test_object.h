@@ -0,0 +1,325 @@
+/* Generated from ubus IDL - delta_test */
+
+#ifndef __DELTA_TEST_OBJECT_H__
+#define __DELTA_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct delta_test_port_state {
+    const char * ifname;
+    const char * duplex;
+    struct blob_attr * vlans;
+    int32_t speed;
+    bool up;
+    uint8_t has_fields;
+};
+#define DELTA_TEST_PORT_STATE_HAS_SPEED 0
+#define DELTA_TEST_PORT_STATE_HAS_DUPLEX 1
+#define DELTA_TEST_PORT_STATE_HAS_VLANS 2
+_Static_assert(sizeof(struct delta_test_port_state) == UBUS_IDL_PACKED_SIZE(struct delta_test_port_state, 2 * sizeof(const char *) + sizeof(struct blob_attr *) + sizeof(int32_t) + sizeof(bool) + sizeof(uint8_t)),
+               "struct delta_test_port_state has padding between members");
+
+struct delta_test_wide_state {
+    int64_t p00;
+    int64_t p03;
+    int64_t p06;
+    int64_t p09;
+    int64_t p12;
+    int64_t p15;
+    int64_t p18;
+    int64_t p21;
+    int64_t p24;
+    int64_t p27;
+    int64_t p30;
+    int64_t p33;
+    int64_t p36;
+    int64_t p39;
+    int64_t p42;
+    int64_t p45;
+    int64_t p48;
+    int64_t p51;
+    int64_t p54;
+    int64_t p57;
+    int64_t p60;
+    int64_t p63;
+    int64_t p66;
+    int64_t p69;
+    uint64_t has_fields;
+    int32_t p01;
+    int32_t p02;
+    int32_t p04;
+    int32_t p05;
+    int32_t p07;
+    int32_t p08;
+    int32_t p10;
+    int32_t p11;
+    int32_t p13;
+    int32_t p14;
+    int32_t p16;
+    int32_t p17;
+    int32_t p19;
+    int32_t p20;
+    int32_t p22;
+    int32_t p23;
+    int32_t p25;
+    int32_t p26;
+    int32_t p28;
+    int32_t p29;
+    int32_t p31;
+    int32_t p32;
+    int32_t p34;
+    int32_t p35;
+    int32_t p37;
+    int32_t p38;
+    int32_t p40;
+    int32_t p41;
+    int32_t p43;
+    int32_t p44;
+    int32_t p46;
+    int32_t p47;
+    int32_t p49;
+    int32_t p50;
+    int32_t p52;
+    int32_t p53;
+    int32_t p55;
+    int32_t p56;
+    int32_t p58;
+    int32_t p59;
+    int32_t p61;
+    int32_t p62;
+    int32_t p64;
+    int32_t p65;
+    int32_t p67;
+    int32_t p68;
+};
+#define DELTA_TEST_WIDE_STATE_HAS_P01 0
+#define DELTA_TEST_WIDE_STATE_HAS_P03 1
+#define DELTA_TEST_WIDE_STATE_HAS_P05 2
+#define DELTA_TEST_WIDE_STATE_HAS_P07 3
+#define DELTA_TEST_WIDE_STATE_HAS_P09 4
+#define DELTA_TEST_WIDE_STATE_HAS_P11 5
+#define DELTA_TEST_WIDE_STATE_HAS_P13 6
+#define DELTA_TEST_WIDE_STATE_HAS_P15 7
+#define DELTA_TEST_WIDE_STATE_HAS_P17 8
+#define DELTA_TEST_WIDE_STATE_HAS_P19 9
+#define DELTA_TEST_WIDE_STATE_HAS_P21 10
+#define DELTA_TEST_WIDE_STATE_HAS_P23 11
+#define DELTA_TEST_WIDE_STATE_HAS_P25 12
+#define DELTA_TEST_WIDE_STATE_HAS_P27 13
+#define DELTA_TEST_WIDE_STATE_HAS_P29 14
+#define DELTA_TEST_WIDE_STATE_HAS_P31 15
+#define DELTA_TEST_WIDE_STATE_HAS_P33 16
+#define DELTA_TEST_WIDE_STATE_HAS_P35 17
+#define DELTA_TEST_WIDE_STATE_HAS_P37 18
+#define DELTA_TEST_WIDE_STATE_HAS_P39 19
+#define DELTA_TEST_WIDE_STATE_HAS_P41 20
+#define DELTA_TEST_WIDE_STATE_HAS_P43 21
+#define DELTA_TEST_WIDE_STATE_HAS_P45 22
+#define DELTA_TEST_WIDE_STATE_HAS_P47 23
+#define DELTA_TEST_WIDE_STATE_HAS_P49 24
+#define DELTA_TEST_WIDE_STATE_HAS_P51 25
+#define DELTA_TEST_WIDE_STATE_HAS_P53 26
+#define DELTA_TEST_WIDE_STATE_HAS_P55 27
+#define DELTA_TEST_WIDE_STATE_HAS_P57 28
+#define DELTA_TEST_WIDE_STATE_HAS_P59 29
+#define DELTA_TEST_WIDE_STATE_HAS_P61 30
+#define DELTA_TEST_WIDE_STATE_HAS_P63 31
+#define DELTA_TEST_WIDE_STATE_HAS_P65 32
+#define DELTA_TEST_WIDE_STATE_HAS_P67 33
+#define DELTA_TEST_WIDE_STATE_HAS_P69 34
+_Static_assert(sizeof(struct delta_test_wide_state) == UBUS_IDL_PACKED_SIZE(struct delta_test_wide_state, 24 * sizeof(int64_t) + sizeof(uint64_t) + 46 * sizeof(int32_t)),
+               "struct delta_test_wide_state has padding between members");
+
+struct delta_test_counters_event_params {
+    int64_t rx_packets;
+    int64_t tx_packets;
+    int64_t rx_bytes;
+    int64_t tx_bytes;
+    double load;
+    int32_t errors;
+    uint8_t has_fields;
+};
+#define DELTA_TEST_COUNTERS_EVENT_HAS_ERRORS 0
+#define DELTA_TEST_COUNTERS_EVENT_HAS_LOAD 1
+_Static_assert(sizeof(struct delta_test_counters_event_params) == UBUS_IDL_PACKED_SIZE(struct delta_test_counters_event_params, 4 * sizeof(int64_t) + sizeof(double) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct delta_test_counters_event_params has padding between members");
+
+enum {
+    DELTA_TEST_COUNTERS_EVENT_RX_PACKETS,
+    DELTA_TEST_COUNTERS_EVENT_TX_PACKETS,
+    DELTA_TEST_COUNTERS_EVENT_RX_BYTES,
+    DELTA_TEST_COUNTERS_EVENT_TX_BYTES,
+    DELTA_TEST_COUNTERS_EVENT_ERRORS,
+    DELTA_TEST_COUNTERS_EVENT_LOAD,
+    __DELTA_TEST_COUNTERS_EVENT_MAX
+};
+
+enum {
+    DELTA_TEST_PORT_STATE_IFNAME,
+    DELTA_TEST_PORT_STATE_UP,
+    DELTA_TEST_PORT_STATE_SPEED,
+    DELTA_TEST_PORT_STATE_DUPLEX,
+    DELTA_TEST_PORT_STATE_VLANS,
+    __DELTA_TEST_PORT_STATE_MAX
+};
+
+enum {
+    DELTA_TEST_WIDE_STATE_P00,
+    DELTA_TEST_WIDE_STATE_P01,
+    DELTA_TEST_WIDE_STATE_P02,
+    DELTA_TEST_WIDE_STATE_P03,
+    DELTA_TEST_WIDE_STATE_P04,
+    DELTA_TEST_WIDE_STATE_P05,
+    DELTA_TEST_WIDE_STATE_P06,
+    DELTA_TEST_WIDE_STATE_P07,
+    DELTA_TEST_WIDE_STATE_P08,
+    DELTA_TEST_WIDE_STATE_P09,
+    DELTA_TEST_WIDE_STATE_P10,
+    DELTA_TEST_WIDE_STATE_P11,
+    DELTA_TEST_WIDE_STATE_P12,
+    DELTA_TEST_WIDE_STATE_P13,
+    DELTA_TEST_WIDE_STATE_P14,
+    DELTA_TEST_WIDE_STATE_P15,
+    DELTA_TEST_WIDE_STATE_P16,
+    DELTA_TEST_WIDE_STATE_P17,
+    DELTA_TEST_WIDE_STATE_P18,
+    DELTA_TEST_WIDE_STATE_P19,
+    DELTA_TEST_WIDE_STATE_P20,
+    DELTA_TEST_WIDE_STATE_P21,
+    DELTA_TEST_WIDE_STATE_P22,
+    DELTA_TEST_WIDE_STATE_P23,
+    DELTA_TEST_WIDE_STATE_P24,
+    DELTA_TEST_WIDE_STATE_P25,
+    DELTA_TEST_WIDE_STATE_P26,
+    DELTA_TEST_WIDE_STATE_P27,
+    DELTA_TEST_WIDE_STATE_P28,
+    DELTA_TEST_WIDE_STATE_P29,
+    DELTA_TEST_WIDE_STATE_P30,
+    DELTA_TEST_WIDE_STATE_P31,
+    DELTA_TEST_WIDE_STATE_P32,
+    DELTA_TEST_WIDE_STATE_P33,
+    DELTA_TEST_WIDE_STATE_P34,
+    DELTA_TEST_WIDE_STATE_P35,
+    DELTA_TEST_WIDE_STATE_P36,
+    DELTA_TEST_WIDE_STATE_P37,
+    DELTA_TEST_WIDE_STATE_P38,
+    DELTA_TEST_WIDE_STATE_P39,
+    DELTA_TEST_WIDE_STATE_P40,
+    DELTA_TEST_WIDE_STATE_P41,
+    DELTA_TEST_WIDE_STATE_P42,
+    DELTA_TEST_WIDE_STATE_P43,
+    DELTA_TEST_WIDE_STATE_P44,
+    DELTA_TEST_WIDE_STATE_P45,
+    DELTA_TEST_WIDE_STATE_P46,
+    DELTA_TEST_WIDE_STATE_P47,
+    DELTA_TEST_WIDE_STATE_P48,
+    DELTA_TEST_WIDE_STATE_P49,
+    DELTA_TEST_WIDE_STATE_P50,
+    DELTA_TEST_WIDE_STATE_P51,
+    DELTA_TEST_WIDE_STATE_P52,
+    DELTA_TEST_WIDE_STATE_P53,
+    DELTA_TEST_WIDE_STATE_P54,
+    DELTA_TEST_WIDE_STATE_P55,
+    DELTA_TEST_WIDE_STATE_P56,
+    DELTA_TEST_WIDE_STATE_P57,
+    DELTA_TEST_WIDE_STATE_P58,
+    DELTA_TEST_WIDE_STATE_P59,
+    DELTA_TEST_WIDE_STATE_P60,
+    DELTA_TEST_WIDE_STATE_P61,
+    DELTA_TEST_WIDE_STATE_P62,
+    DELTA_TEST_WIDE_STATE_P63,
+    DELTA_TEST_WIDE_STATE_P64,
+    DELTA_TEST_WIDE_STATE_P65,
+    DELTA_TEST_WIDE_STATE_P66,
+    DELTA_TEST_WIDE_STATE_P67,
+    DELTA_TEST_WIDE_STATE_P68,
+    DELTA_TEST_WIDE_STATE_P69,
+    __DELTA_TEST_WIDE_STATE_MAX
+};
+
+int delta_test_get_counters_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+int delta_test_counters_event_deserialize(struct blob_attr *msg, struct delta_test_counters_event_params *params);
+int delta_test_counters_event_serialize(struct blob_buf *b, const struct delta_test_counters_event_params *params);
+int delta_test_port_state_deserialize(struct blob_attr *msg, struct delta_test_port_state *params);
+int delta_test_port_state_serialize(struct blob_buf *b, const struct delta_test_port_state *params);
+int delta_test_wide_state_deserialize(struct blob_attr *msg, struct delta_test_wide_state *params);
+int delta_test_wide_state_serialize(struct blob_buf *b, const struct delta_test_wide_state *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct delta_test_counters_event_params *delta_test_counters_event_dup(const struct delta_test_counters_event_params *params);
+void delta_test_counters_event_free(struct delta_test_counters_event_params *params);
+struct delta_test_port_state *delta_test_port_state_dup(const struct delta_test_port_state *params);
+void delta_test_port_state_free(struct delta_test_port_state *params);
+struct delta_test_wide_state *delta_test_wide_state_dup(const struct delta_test_wide_state *params);
+void delta_test_wide_state_free(struct delta_test_wide_state *params);
+
+int delta_test_get_counters_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct delta_test_port_state *reply);
+
+/* Local copy of the counters event, rebuilt from snapshots and deltas */
+struct delta_test_counters_mirror {
+    struct delta_test_counters_event_params state;
+    struct blob_attr *fields[__DELTA_TEST_COUNTERS_EVENT_MAX];
+    struct blob_buf buf;
+    uint32_t seq;
+    bool synced;
+};
+
+int delta_test_counters_mirror_apply(struct delta_test_counters_mirror *mirror, struct blob_attr *msg);
+void delta_test_counters_mirror_free(struct delta_test_counters_mirror *mirror);
+/* Local copy of the port event, rebuilt from snapshots and deltas */
+struct delta_test_port_mirror {
+    struct delta_test_port_state state;
+    struct blob_attr *fields[__DELTA_TEST_PORT_STATE_MAX];
+    struct blob_buf buf;
+    uint32_t seq;
+    bool synced;
+};
+
+int delta_test_port_mirror_apply(struct delta_test_port_mirror *mirror, struct blob_attr *msg);
+void delta_test_port_mirror_free(struct delta_test_port_mirror *mirror);
+/* Local copy of the wide event, rebuilt from snapshots and deltas */
+struct delta_test_wide_mirror {
+    struct delta_test_wide_state state;
+    struct blob_attr *fields[__DELTA_TEST_WIDE_STATE_MAX];
+    struct blob_buf buf;
+    uint32_t seq;
+    bool synced;
+};
+
+int delta_test_wide_mirror_apply(struct delta_test_wide_mirror *mirror, struct blob_attr *msg);
+void delta_test_wide_mirror_free(struct delta_test_wide_mirror *mirror);
+
+extern struct ubus_object delta_test_object;
+
+int delta_test_notify_counters(struct ubus_context *ctx, const struct delta_test_counters_event_params *params);
+int delta_test_notify_counters_full(struct ubus_context *ctx);
+int delta_test_notify_port(struct ubus_context *ctx, const struct delta_test_port_state *params);
+int delta_test_notify_port_full(struct ubus_context *ctx);
+int delta_test_notify_wide(struct ubus_context *ctx, const struct delta_test_wide_state *params);
+int delta_test_notify_wide_full(struct ubus_context *ctx);
+int delta_test_notify_reset(struct ubus_context *ctx);
+
+void delta_test_object_cleanup(void);
+
+#endif /* __DELTA_TEST_OBJECT_H__ */
@@ -0,0 +1,536 @@
+/* Generated from ubus IDL - enum_test client */
+
+#include <libubox/blobmsg.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "enum_test_client.h"
+
+static const struct blobmsg_policy enum_test_client_remove_policy[] = {
+    { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+};
+
+/* Drop the cached object id, the next call looks the object up again */
+static void enum_test_client_forget(struct enum_test_client *client)
+{
+    client->id = 0;
+}
+
+static int enum_test_client_resolve(struct enum_test_client *client)
+{
+    int ret;
+
+    if (client->id) {
+        return UBUS_STATUS_OK;
+    }
+
+    ret = ubus_lookup_id(client->ctx, "enum_test", &client->id);
+    if (ret != UBUS_STATUS_OK) {
+        client->id = 0;
+        return ret;
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static void enum_test_client_remove_cb(struct ubus_context *ctx, struct ubus_event_handler *ev, const char *type, struct blob_attr *msg)
+{
+    struct enum_test_client *client = container_of(ev, struct enum_test_client, remove_ev);
+    struct blob_attr *tb[ARRAY_SIZE(enum_test_client_remove_policy)];
+
+    blobmsg_parse(enum_test_client_remove_policy, ARRAY_SIZE(enum_test_client_remove_policy), tb, blob_data(msg), blob_len(msg));
+
+    if (tb[0] && blobmsg_get_u32(tb[0]) == client->id) {
+        enum_test_client_forget(client);
+    }
+}
+
+static void enum_test_client_data_cb(struct ubus_request *req, int type, struct blob_attr *msg)
+{
+    struct enum_test_client *client = req->priv;
+
+    // The reply is only valid during the callback, keep a copy for the deserializer
+    free(client->reply_msg);
+    client->reply_msg = msg ? blob_memdup(msg) : NULL;
+}
+
+static int enum_test_client_invoke(struct enum_test_client *client, const char *method, int timeout)
+{
+    int retry;
+    int ret;
+
+    free(client->reply_msg);
+    client->reply_msg = NULL;
+
+    for (retry = 0; retry < 2; retry++) {
+        ret = enum_test_client_resolve(client);
+        if (ret != UBUS_STATUS_OK) {
+            return ret;
+        }
+
+        ret = ubus_invoke(client->ctx, client->id, method, client->buf.head, enum_test_client_data_cb, client, timeout);
+
+        // The object was re-registered before the remove event arrived, look it up again
+        if (ret != UBUS_STATUS_NOT_FOUND) {
+            break;
+        }
+        enum_test_client_forget(client);
+    }
+
+    return ret;
+}
+
+/* Pipelined request, queued until the in-flight cap allows sending it */
+struct enum_test_client_async {
+    struct list_head list;
+    struct enum_test_client *client;
+    struct ubus_request req;
+    struct uloop_timeout timeout;
+    const char *method;
+    struct blob_attr *msg;
+    struct blob_attr *reply_msg;
+    int timeout_ms;
+    void (*complete)(struct enum_test_client_async *areq, int status);
+    void (*cb)(void);
+    void *priv;
+};
+
+static void enum_test_client_async_free(struct enum_test_client_async *areq)
+{
+    free(areq->msg);
+    free(areq->reply_msg);
+    free(areq);
+}
+
+static void enum_test_client_async_finish(struct enum_test_client_async *areq, int status)
+{
+    if (status == UBUS_STATUS_NOT_FOUND) {
+        enum_test_client_forget(areq->client);
+    }
+
+    areq->complete(areq, status);
+    enum_test_client_async_free(areq);
+}
+
+static void enum_test_client_async_kick(struct enum_test_client *client);
+
+static void enum_test_client_async_data_cb(struct ubus_request *req, int type, struct blob_attr *msg)
+{
+    struct enum_test_client_async *areq = req->priv;
+
+    free(areq->reply_msg);
+    areq->reply_msg = msg ? blob_memdup(msg) : NULL;
+}
+
+static void enum_test_client_async_complete_cb(struct ubus_request *req, int ret)
+{
+    struct enum_test_client_async *areq = req->priv;
+    struct enum_test_client *client = areq->client;
+
+    uloop_timeout_cancel(&areq->timeout);
+    list_del(&areq->list);
+    client->n_active--;
+
+    enum_test_client_async_finish(areq, ret);
+    enum_test_client_async_kick(client);
+}
+
+static void enum_test_client_async_timeout_cb(struct uloop_timeout *t)
+{
+    struct enum_test_client_async *areq = container_of(t, struct enum_test_client_async, timeout);
+    struct enum_test_client *client = areq->client;
+
+    // Aborting does not run the complete callback, finish the request here
+    ubus_abort_request(client->ctx, &areq->req);
+    list_del(&areq->list);
+    client->n_active--;
+
+    enum_test_client_async_finish(areq, UBUS_STATUS_TIMEOUT);
+    enum_test_client_async_kick(client);
+}
+
+static int enum_test_client_async_start(struct enum_test_client *client, struct enum_test_client_async *areq)
+{
+    int ret;
+
+    ret = enum_test_client_resolve(client);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = ubus_invoke_async(client->ctx, client->id, areq->method, areq->msg, &areq->req);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    areq->req.data_cb = enum_test_client_async_data_cb;
+    areq->req.complete_cb = enum_test_client_async_complete_cb;
+    areq->req.priv = areq;
+    ubus_complete_request_async(client->ctx, &areq->req);
+
+    if (areq->timeout_ms > 0) {
+        areq->timeout.cb = enum_test_client_async_timeout_cb;
+        uloop_timeout_set(&areq->timeout, areq->timeout_ms);
+    }
+
+    list_add_tail(&areq->list, &client->active);
+    client->n_active++;
+
+    return UBUS_STATUS_OK;
+}
+
+/* Send queued requests while the in-flight cap allows it */
+static void enum_test_client_async_kick(struct enum_test_client *client)
+{
+    struct enum_test_client_async *areq;
+    int ret;
+
+    while (client->n_active < client->max_inflight && !list_empty(&client->queued)) {
+        areq = list_first_entry(&client->queued, struct enum_test_client_async, list);
+        list_del(&areq->list);
+
+        ret = enum_test_client_async_start(client, areq);
+        if (ret != UBUS_STATUS_OK) {
+            enum_test_client_async_finish(areq, ret);
+        }
+    }
+}
+
+static int enum_test_client_async_submit(struct enum_test_client *client, const char *method, int cache_method, void (*complete)(struct enum_test_client_async *areq, int status), void (*cb)(void), void *priv, int timeout)
+{
+    struct enum_test_client_async *areq;
+
+    (void)cache_method;
+
+    areq = calloc(1, sizeof(*areq));
+    if (!areq) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    areq->client = client;
+    areq->method = method;
+    areq->timeout_ms = timeout;
+    areq->complete = complete;
+    areq->cb = cb;
+    areq->priv = priv;
+
+    // The request buffer is reused by the next call, keep a copy until it is sent
+    areq->msg = blob_memdup(client->buf.head);
+    if (!areq->msg) {
+        free(areq);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    list_add_tail(&areq->list, &client->queued);
+
+    enum_test_client_async_kick(client);
+
+    return UBUS_STATUS_OK;
+}
+
+int enum_test_client_init(struct enum_test_client *client, struct ubus_context *ctx)
+{
+    memset(client, 0, sizeof(*client));
+    client->ctx = ctx;
+    client->remove_ev.cb = enum_test_client_remove_cb;
+    INIT_LIST_HEAD(&client->queued);
+    INIT_LIST_HEAD(&client->active);
+    client->max_inflight = ENUM_TEST_CLIENT_MAX_INFLIGHT;
+
+    return ubus_register_event_handler(ctx, &client->remove_ev, "ubus.object.remove");
+}
+
+void enum_test_client_free(struct enum_test_client *client)
+{
+    struct enum_test_client_async *areq;
+    struct enum_test_client_async *tmp;
+
+    // Pending requests are dropped without running their callbacks
+    list_for_each_entry_safe(areq, tmp, &client->active, list) {
+        uloop_timeout_cancel(&areq->timeout);
+        ubus_abort_request(client->ctx, &areq->req);
+        list_del(&areq->list);
+        enum_test_client_async_free(areq);
+    }
+    list_for_each_entry_safe(areq, tmp, &client->queued, list) {
+        list_del(&areq->list);
+        enum_test_client_async_free(areq);
+    }
+    client->n_active = 0;
+
+    ubus_unregister_event_handler(client->ctx, &client->remove_ev);
+    blob_buf_free(&client->buf);
+    free(client->reply_msg);
+    client->reply_msg = NULL;
+    client->id = 0;
+}
+
+int enum_test_call_set_state(struct enum_test_client *client, const struct enum_test_set_state_params *params, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = enum_test_set_state_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return enum_test_client_invoke(client, "set_state", timeout);
+}
+
+int enum_test_call_query(struct enum_test_client *client, const struct enum_test_filter *params, struct link *reply, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = enum_test_filter_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = enum_test_client_invoke(client, "query", timeout);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    if (!client->reply_msg) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    // Strings in the reply point into the client and stay valid until its next call
+    return link_deserialize(client->reply_msg, reply);
+}
+
+int enum_test_call_set_mode(struct enum_test_client *client, const struct enum_test_set_mode_params *params, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = enum_test_set_mode_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return enum_test_client_invoke(client, "set_mode", timeout);
+}
+
+int enum_test_call_force(struct enum_test_client *client, const struct enum_test_force_params *params, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = enum_test_force_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return enum_test_client_invoke(client, "force", timeout);
+}
+
+static void enum_test_call_set_state_async_complete(struct enum_test_client_async *areq, int status)
+{
+    enum_test_call_set_state_cb cb = (enum_test_call_set_state_cb)areq->cb;
+
+    cb(areq->client, status, areq->priv);
+}
+
+int enum_test_call_set_state_async(struct enum_test_client *client, const struct enum_test_set_state_params *params, enum_test_call_set_state_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = enum_test_set_state_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return enum_test_client_async_submit(client, "set_state", -1, enum_test_call_set_state_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static void enum_test_call_query_async_complete(struct enum_test_client_async *areq, int status)
+{
+    enum_test_call_query_cb cb = (enum_test_call_query_cb)areq->cb;
+    struct link reply;
+
+    memset(&reply, 0, sizeof(reply));
+    if (status == UBUS_STATUS_OK && !areq->reply_msg) {
+        status = UBUS_STATUS_NO_DATA;
+    }
+    if (status == UBUS_STATUS_OK) {
+        status = link_deserialize(areq->reply_msg, &reply);
+    }
+
+    // The reply is only valid during the callback
+    cb(areq->client, status, status == UBUS_STATUS_OK ? &reply : NULL, areq->priv);
+}
+
+int enum_test_call_query_async(struct enum_test_client *client, const struct enum_test_filter *params, enum_test_call_query_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = enum_test_filter_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return enum_test_client_async_submit(client, "query", -1, enum_test_call_query_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static void enum_test_call_set_mode_async_complete(struct enum_test_client_async *areq, int status)
+{
+    enum_test_call_set_mode_cb cb = (enum_test_call_set_mode_cb)areq->cb;
+
+    cb(areq->client, status, areq->priv);
+}
+
+int enum_test_call_set_mode_async(struct enum_test_client *client, const struct enum_test_set_mode_params *params, enum_test_call_set_mode_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = enum_test_set_mode_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return enum_test_client_async_submit(client, "set_mode", -1, enum_test_call_set_mode_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static void enum_test_call_force_async_complete(struct enum_test_client_async *areq, int status)
+{
+    enum_test_call_force_cb cb = (enum_test_call_force_cb)areq->cb;
+
+    cb(areq->client, status, areq->priv);
+}
+
+int enum_test_call_force_async(struct enum_test_client *client, const struct enum_test_force_params *params, enum_test_call_force_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = enum_test_force_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return enum_test_client_async_submit(client, "force", -1, enum_test_call_force_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static const struct blobmsg_policy enum_test_subscriber_add_policy[] = {
+    { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+    { .name = "path", .type = BLOBMSG_TYPE_STRING },
+};
+
+/* FNV-1a, the case labels of the dispatch are hashed at generation time */
+static uint32_t enum_test_subscriber_hash(const char *s)
+{
+    uint32_t hash = 2166136261u;
+
+    while (*s) {
+        hash ^= (uint8_t)*s++;
+        hash *= 16777619u;
+    }
+
+    return hash;
+}
+
+static int enum_test_subscriber_notify_cb(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct enum_test_subscriber *sub = container_of(obj, struct enum_test_subscriber, sub.obj);
+    int ret;
+
+    switch (enum_test_subscriber_hash(method)) {
+    case 0x6c335f91u: { /* state_changed */
+        if (strcmp(method, "state_changed")) {
+            break;
+        }
+
+        // The mirror follows every message, the callback only sees complete states
+        ret = enum_test_state_changed_mirror_apply(&sub->state_changed_mirror, msg);
+        if (ret == UBUS_STATUS_OK && sub->on_state_changed) {
+            sub->on_state_changed(sub, &sub->state_changed_mirror.state);
+        }
+        return ret == UBUS_STATUS_NO_DATA ? UBUS_STATUS_OK : ret;
+    }
+    }
+
+    if (sub->on_other) {
+        sub->on_other(sub, method, msg);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static void enum_test_subscriber_subscribe(struct enum_test_subscriber *sub, uint32_t id)
+{
+    sub->id = id;
+    sub->subscribed = ubus_subscribe(sub->ctx, &sub->sub, id) == UBUS_STATUS_OK;
+}
+
+static void enum_test_subscriber_remove_cb(struct ubus_context *ctx, struct ubus_subscriber *s, uint32_t id)
+{
+    struct enum_test_subscriber *sub = container_of(s, struct enum_test_subscriber, sub);
+
+    if (id != sub->id) {
+        return;
+    }
+
+    sub->id = 0;
+    sub->subscribed = false;
+    // A restarted object starts a new sequence with a snapshot
+    sub->state_changed_mirror.synced = false;
+}
+
+static void enum_test_subscriber_add_cb(struct ubus_context *ctx, struct ubus_event_handler *ev, const char *type, struct blob_attr *msg)
+{
+    struct enum_test_subscriber *sub = container_of(ev, struct enum_test_subscriber, add_ev);
+    struct blob_attr *tb[ARRAY_SIZE(enum_test_subscriber_add_policy)];
+
+    blobmsg_parse(enum_test_subscriber_add_policy, ARRAY_SIZE(enum_test_subscriber_add_policy), tb, blob_data(msg), blob_len(msg));
+
+    if (!tb[0] || !tb[1] || strcmp(blobmsg_get_string(tb[1]), "enum_test")) {
+        return;
+    }
+
+    // The object was (re)registered, possibly under a new id
+    enum_test_subscriber_subscribe(sub, blobmsg_get_u32(tb[0]));
+}
+
+int enum_test_subscriber_init(struct enum_test_subscriber *sub, struct ubus_context *ctx)
+{
+    uint32_t id;
+    int ret;
+
+    memset(sub, 0, sizeof(*sub));
+    sub->ctx = ctx;
+    sub->sub.cb = enum_test_subscriber_notify_cb;
+    sub->sub.remove_cb = enum_test_subscriber_remove_cb;
+    sub->add_ev.cb = enum_test_subscriber_add_cb;
+
+    ret = ubus_register_subscriber(ctx, &sub->sub);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = ubus_register_event_handler(ctx, &sub->add_ev, "ubus.object.add");
+    if (ret != UBUS_STATUS_OK) {
+        ubus_unregister_subscriber(ctx, &sub->sub);
+        return ret;
+    }
+
+    // The object may not be registered yet, the add event subscribes later
+    if (ubus_lookup_id(ctx, "enum_test", &id) == UBUS_STATUS_OK) {
+        enum_test_subscriber_subscribe(sub, id);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+void enum_test_subscriber_free(struct enum_test_subscriber *sub)
+{
+    ubus_unregister_event_handler(sub->ctx, &sub->add_ev);
+    ubus_unregister_subscriber(sub->ctx, &sub->sub);
+    enum_test_state_changed_mirror_free(&sub->state_changed_mirror);
+    sub->id = 0;
+    sub->subscribed = false;
+}
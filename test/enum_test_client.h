@@ -0,0 +1,64 @@
+/* Generated from ubus IDL - enum_test client */
+
+#ifndef __ENUM_TEST_CLIENT_H__
+#define __ENUM_TEST_CLIENT_H__
+
+#include <libubus.h>
+#include "enum_test_object.h"
+
+/* Default cap of pipelined requests in flight per client */
+#ifndef ENUM_TEST_CLIENT_MAX_INFLIGHT
+#define ENUM_TEST_CLIENT_MAX_INFLIGHT 16
+#endif
+
+struct enum_test_client {
+    struct ubus_context *ctx;
+    uint32_t id;
+    struct ubus_event_handler remove_ev;
+    struct blob_buf buf;
+    struct blob_attr *reply_msg;
+    struct list_head queued;
+    struct list_head active;
+    unsigned int n_active;
+    unsigned int max_inflight;
+};
+
+typedef void (*enum_test_call_set_state_cb)(struct enum_test_client *client, int status, void *priv);
+typedef void (*enum_test_call_query_cb)(struct enum_test_client *client, int status, const struct link *reply, void *priv);
+typedef void (*enum_test_call_set_mode_cb)(struct enum_test_client *client, int status, void *priv);
+typedef void (*enum_test_call_force_cb)(struct enum_test_client *client, int status, void *priv);
+
+int enum_test_client_init(struct enum_test_client *client, struct ubus_context *ctx);
+void enum_test_client_free(struct enum_test_client *client);
+
+int enum_test_call_set_state(struct enum_test_client *client, const struct enum_test_set_state_params *params, int timeout);
+int enum_test_call_query(struct enum_test_client *client, const struct enum_test_filter *params, struct link *reply, int timeout);
+int enum_test_call_set_mode(struct enum_test_client *client, const struct enum_test_set_mode_params *params, int timeout);
+int enum_test_call_force(struct enum_test_client *client, const struct enum_test_force_params *params, int timeout);
+
+int enum_test_call_set_state_async(struct enum_test_client *client, const struct enum_test_set_state_params *params, enum_test_call_set_state_cb cb, void *priv, int timeout);
+int enum_test_call_query_async(struct enum_test_client *client, const struct enum_test_filter *params, enum_test_call_query_cb cb, void *priv, int timeout);
+int enum_test_call_set_mode_async(struct enum_test_client *client, const struct enum_test_set_mode_params *params, enum_test_call_set_mode_cb cb, void *priv, int timeout);
+int enum_test_call_force_async(struct enum_test_client *client, const struct enum_test_force_params *params, enum_test_call_force_cb cb, void *priv, int timeout);
+
+
+struct enum_test_subscriber;
+
+typedef void (*enum_test_state_changed_cb)(struct enum_test_subscriber *sub, const struct enum_test_state_changed_event_params *params);
+
+/* Set the callbacks after enum_test_subscriber_init(), notifications arrive from uloop */
+struct enum_test_subscriber {
+    struct ubus_context *ctx;
+    struct ubus_subscriber sub;
+    struct ubus_event_handler add_ev;
+    uint32_t id;
+    bool subscribed;
+    enum_test_state_changed_cb on_state_changed;
+    void (*on_other)(struct enum_test_subscriber *sub, const char *type, struct blob_attr *msg);
+    struct enum_test_state_changed_mirror state_changed_mirror;
+};
+
+int enum_test_subscriber_init(struct enum_test_subscriber *sub, struct ubus_context *ctx);
+void enum_test_subscriber_free(struct enum_test_subscriber *sub);
+
+#endif /* __ENUM_TEST_CLIENT_H__ */
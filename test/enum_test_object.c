@@ -0,0 +1,935 @@
+/* Generated from ubus IDL - enum_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "enum_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Locate a single attribute on first access and cache its tb slot */
+static struct blob_attr *ubus_idl_view_locate(struct blob_attr *msg, const struct blobmsg_policy *policy,
+                                              struct blob_attr **tb, uint32_t *located, int index)
+{
+    struct blob_attr *cur;
+    size_t rem;
+
+    if (located[index / 32] & (1U << (index % 32))) {
+        return tb[index];
+    }
+
+    located[index / 32] |= 1U << (index % 32);
+    tb[index] = NULL;
+    if (!msg) {
+        return NULL;
+    }
+
+    blob_for_each_attr(cur, msg, rem) {
+        if (policy[index].type != BLOBMSG_TYPE_UNSPEC && blob_id(cur) != policy[index].type) {
+            continue;
+        }
+        if (!blobmsg_check_attr(cur, true) || strcmp(blobmsg_name(cur), policy[index].name) != 0) {
+            continue;
+        }
+        // No break: the last attribute of a name wins, as in blobmsg_parse()
+        tb[index] = cur;
+    }
+
+    return tb[index];
+}
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const char *const link_state_names[] = {
+    [LINK_STATE_UP] = "up",
+    [LINK_STATE_DOWN] = "down",
+    [LINK_STATE_DORMANT] = "dormant",
+    [LINK_STATE_TESTING] = "testing",
+    [LINK_STATE_UNKNOWN] = "unknown",
+};
+
+/* FNV-1a slots of the names, collision free for the basis below, 0 when empty or value + 1 */
+static const uint8_t link_state_slots[16] = { 1, 0, 0, 0, 0, 2, 0, 0, 0, 5, 0, 4, 0, 0, 3, 0 };
+
+const char *link_state_name(enum link_state value)
+{
+    if ((unsigned int)value >= __LINK_STATE_MAX) {
+        return NULL;
+    }
+
+    return link_state_names[value];
+}
+
+int link_state_parse(const char *name, enum link_state *value)
+{
+    uint32_t hash = 0x811c9dc5u;
+    unsigned int slot;
+    const char *p;
+
+    for (p = name; *p; p++) {
+        hash = (hash ^ (uint8_t)*p) * 16777619u;
+    }
+
+    // Any other name may share a slot with a value, a single compare tells them apart
+    slot = link_state_slots[hash & 15];
+    if (!slot || strcmp(link_state_names[slot - 1], name) != 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *value = (enum link_state)(slot - 1);
+    return UBUS_STATUS_OK;
+}
+
+static const char *const duplex_names[] = {
+    [DUPLEX_HALF] = "half",
+    [DUPLEX_FULL] = "full",
+};
+
+/* FNV-1a slots of the names, collision free for the basis below, 0 when empty or value + 1 */
+static const uint8_t duplex_slots[8] = { 0, 2, 0, 0, 0, 1, 0, 0 };
+
+const char *duplex_name(enum duplex value)
+{
+    if ((unsigned int)value >= __DUPLEX_MAX) {
+        return NULL;
+    }
+
+    return duplex_names[value];
+}
+
+int duplex_parse(const char *name, enum duplex *value)
+{
+    uint32_t hash = 0x811c9dc4u;
+    unsigned int slot;
+    const char *p;
+
+    for (p = name; *p; p++) {
+        hash = (hash ^ (uint8_t)*p) * 16777619u;
+    }
+
+    // Any other name may share a slot with a value, a single compare tells them apart
+    slot = duplex_slots[hash & 7];
+    if (!slot || strcmp(duplex_names[slot - 1], name) != 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *value = (enum duplex)(slot - 1);
+    return UBUS_STATUS_OK;
+}
+
+static const char *const enum_test_mode_names[] = {
+    [ENUM_TEST_MODE_OFF] = "off",
+    [ENUM_TEST_MODE_MANUAL] = "manual",
+    [ENUM_TEST_MODE_AUTO_NEGOTIATE] = "auto_negotiate",
+};
+
+/* FNV-1a slots of the names, collision free for the basis below, 0 when empty or value + 1 */
+static const uint8_t enum_test_mode_slots[8] = { 0, 3, 1, 2, 0, 0, 0, 0 };
+
+const char *enum_test_mode_name(enum enum_test_mode value)
+{
+    if ((unsigned int)value >= __ENUM_TEST_MODE_MAX) {
+        return NULL;
+    }
+
+    return enum_test_mode_names[value];
+}
+
+int enum_test_mode_parse(const char *name, enum enum_test_mode *value)
+{
+    uint32_t hash = 0x811c9dc5u;
+    unsigned int slot;
+    const char *p;
+
+    for (p = name; *p; p++) {
+        hash = (hash ^ (uint8_t)*p) * 16777619u;
+    }
+
+    // Any other name may share a slot with a value, a single compare tells them apart
+    slot = enum_test_mode_slots[hash & 7];
+    if (!slot || strcmp(enum_test_mode_names[slot - 1], name) != 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *value = (enum enum_test_mode)(slot - 1);
+    return UBUS_STATUS_OK;
+}
+
+static const struct blobmsg_policy enum_test_set_state_policy[] = {
+    [ENUM_TEST_SET_STATE_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [ENUM_TEST_SET_STATE_STATE] = { .name = "state", .type = BLOBMSG_TYPE_STRING },
+    [ENUM_TEST_SET_STATE_DUPLEX] = { .name = "duplex", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int enum_test_set_state_deserialize(struct blob_attr *msg, struct enum_test_set_state_params *params)
+{
+    struct blob_attr *tb_enum_test_set_state[__ENUM_TEST_SET_STATE_MAX];
+    if (blobmsg_parse(enum_test_set_state_policy, ARRAY_SIZE(enum_test_set_state_policy), tb_enum_test_set_state, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_enum_test_set_state[ENUM_TEST_SET_STATE_IFNAME] || !tb_enum_test_set_state[ENUM_TEST_SET_STATE_STATE]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->ifname = blobmsg_get_string(tb_enum_test_set_state[ENUM_TEST_SET_STATE_IFNAME]);
+    if (link_state_parse(blobmsg_get_string(tb_enum_test_set_state[ENUM_TEST_SET_STATE_STATE]), &params->state) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (tb_enum_test_set_state[ENUM_TEST_SET_STATE_DUPLEX]) {
+        if (blobmsg_get_u32(tb_enum_test_set_state[ENUM_TEST_SET_STATE_DUPLEX]) >= __DUPLEX_MAX) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        params->duplex = (enum duplex)blobmsg_get_u32(tb_enum_test_set_state[ENUM_TEST_SET_STATE_DUPLEX]);
+        UBUS_IDL_SET_FIELD(params, ENUM_TEST_SET_STATE_HAS_DUPLEX);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int enum_test_set_state_serialize(struct blob_buf *b, const struct enum_test_set_state_params *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    if ((unsigned int)params->state >= __LINK_STATE_MAX) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    UBUS_IDL_ADD(string, b, "state", link_state_names[params->state]);
+    if (UBUS_IDL_HAS_FIELD(params, ENUM_TEST_SET_STATE_HAS_DUPLEX)) {
+        if ((unsigned int)params->duplex >= __DUPLEX_MAX) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        UBUS_IDL_ADD(u32, b, "duplex", params->duplex);
+    }
+    return UBUS_STATUS_OK;
+}
+
+struct enum_test_set_state_params *enum_test_set_state_dup(const struct enum_test_set_state_params *params)
+{
+    size_t len = sizeof(*params);
+    struct enum_test_set_state_params *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void enum_test_set_state_free(struct enum_test_set_state_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy enum_test_filter_policy[] = {
+    [ENUM_TEST_FILTER_MODE] = { .name = "mode", .type = BLOBMSG_TYPE_STRING },
+    [ENUM_TEST_FILTER_STATE] = { .name = "state", .type = BLOBMSG_TYPE_STRING }
+};
+
+int enum_test_filter_deserialize(struct blob_attr *msg, struct enum_test_filter *params)
+{
+    struct blob_attr *tb_enum_test_filter[__ENUM_TEST_FILTER_MAX];
+    if (blobmsg_parse(enum_test_filter_policy, ARRAY_SIZE(enum_test_filter_policy), tb_enum_test_filter, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_enum_test_filter[ENUM_TEST_FILTER_MODE]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    if (enum_test_mode_parse(blobmsg_get_string(tb_enum_test_filter[ENUM_TEST_FILTER_MODE]), &params->mode) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (tb_enum_test_filter[ENUM_TEST_FILTER_STATE]) {
+        if (link_state_parse(blobmsg_get_string(tb_enum_test_filter[ENUM_TEST_FILTER_STATE]), &params->state) != UBUS_STATUS_OK) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        UBUS_IDL_SET_FIELD(params, ENUM_TEST_FILTER_HAS_STATE);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int enum_test_filter_serialize(struct blob_buf *b, const struct enum_test_filter *params)
+{
+    if ((unsigned int)params->mode >= __ENUM_TEST_MODE_MAX) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    UBUS_IDL_ADD(string, b, "mode", enum_test_mode_names[params->mode]);
+    if (UBUS_IDL_HAS_FIELD(params, ENUM_TEST_FILTER_HAS_STATE)) {
+        if ((unsigned int)params->state >= __LINK_STATE_MAX) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        UBUS_IDL_ADD(string, b, "state", link_state_names[params->state]);
+    }
+    return UBUS_STATUS_OK;
+}
+
+struct enum_test_filter *enum_test_filter_dup(const struct enum_test_filter *params)
+{
+    size_t len = sizeof(*params);
+    struct enum_test_filter *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void enum_test_filter_free(struct enum_test_filter *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy enum_test_set_mode_policy[] = {
+    [ENUM_TEST_SET_MODE_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [ENUM_TEST_SET_MODE_MODE] = { .name = "mode", .type = BLOBMSG_TYPE_STRING }
+};
+
+int enum_test_set_mode_deserialize(struct blob_attr *msg, struct enum_test_set_mode_params *params)
+{
+    struct blob_attr *tb_enum_test_set_mode[__ENUM_TEST_SET_MODE_MAX];
+    if (blobmsg_parse(enum_test_set_mode_policy, ARRAY_SIZE(enum_test_set_mode_policy), tb_enum_test_set_mode, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_enum_test_set_mode[ENUM_TEST_SET_MODE_IFNAME] || !tb_enum_test_set_mode[ENUM_TEST_SET_MODE_MODE]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->ifname = blobmsg_get_string(tb_enum_test_set_mode[ENUM_TEST_SET_MODE_IFNAME]);
+    if (enum_test_mode_parse(blobmsg_get_string(tb_enum_test_set_mode[ENUM_TEST_SET_MODE_MODE]), &params->mode) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    return UBUS_STATUS_OK;
+}
+
+int enum_test_set_mode_serialize(struct blob_buf *b, const struct enum_test_set_mode_params *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    if ((unsigned int)params->mode >= __ENUM_TEST_MODE_MAX) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    UBUS_IDL_ADD(string, b, "mode", enum_test_mode_names[params->mode]);
+    return UBUS_STATUS_OK;
+}
+
+struct enum_test_set_mode_params *enum_test_set_mode_dup(const struct enum_test_set_mode_params *params)
+{
+    size_t len = sizeof(*params);
+    struct enum_test_set_mode_params *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void enum_test_set_mode_free(struct enum_test_set_mode_params *params)
+{
+    free(params);
+}
+
+void enum_test_set_mode_view_init(struct enum_test_set_mode_view *view, struct blob_attr *msg)
+{
+    view->msg = msg;
+    memset(view->located, 0, sizeof(view->located));
+}
+
+int enum_test_set_mode_get_ifname(struct enum_test_set_mode_view *view, const char **out)
+{
+    struct blob_attr *attr = ubus_idl_view_locate(view->msg, enum_test_set_mode_policy, view->tb, view->located, ENUM_TEST_SET_MODE_IFNAME);
+
+    if (!attr) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *out = blobmsg_get_string(attr);
+    return UBUS_STATUS_OK;
+}
+
+int enum_test_set_mode_get_mode(struct enum_test_set_mode_view *view, enum enum_test_mode *out)
+{
+    struct blob_attr *attr = ubus_idl_view_locate(view->msg, enum_test_set_mode_policy, view->tb, view->located, ENUM_TEST_SET_MODE_MODE);
+
+    if (!attr) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (enum_test_mode_parse(blobmsg_get_string(attr), out) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    return UBUS_STATUS_OK;
+}
+
+static const struct blobmsg_policy enum_test_force_policy[] = {
+    [ENUM_TEST_FORCE_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [ENUM_TEST_FORCE_DUPLEX] = { .name = "duplex", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int enum_test_force_deserialize(struct blob_attr *msg, struct enum_test_force_params *params)
+{
+    struct blob_attr *tb_enum_test_force[__ENUM_TEST_FORCE_MAX];
+    if (blobmsg_parse(enum_test_force_policy, ARRAY_SIZE(enum_test_force_policy), tb_enum_test_force, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_enum_test_force[ENUM_TEST_FORCE_IFNAME] || !tb_enum_test_force[ENUM_TEST_FORCE_DUPLEX]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->ifname = blobmsg_get_string(tb_enum_test_force[ENUM_TEST_FORCE_IFNAME]);
+    if (blobmsg_get_u32(tb_enum_test_force[ENUM_TEST_FORCE_DUPLEX]) >= __DUPLEX_MAX) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    params->duplex = (enum duplex)blobmsg_get_u32(tb_enum_test_force[ENUM_TEST_FORCE_DUPLEX]);
+    return UBUS_STATUS_OK;
+}
+
+int enum_test_force_serialize(struct blob_buf *b, const struct enum_test_force_params *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    if ((unsigned int)params->duplex >= __DUPLEX_MAX) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    UBUS_IDL_ADD(u32, b, "duplex", params->duplex);
+    return UBUS_STATUS_OK;
+}
+
+struct enum_test_force_params *enum_test_force_dup(const struct enum_test_force_params *params)
+{
+    size_t len = sizeof(*params);
+    struct enum_test_force_params *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void enum_test_force_free(struct enum_test_force_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy enum_test_state_changed_event_policy[] = {
+    [ENUM_TEST_STATE_CHANGED_EVENT_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [ENUM_TEST_STATE_CHANGED_EVENT_STATE] = { .name = "state", .type = BLOBMSG_TYPE_STRING },
+    [ENUM_TEST_STATE_CHANGED_EVENT_DUPLEX] = { .name = "duplex", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int enum_test_state_changed_event_deserialize(struct blob_attr *msg, struct enum_test_state_changed_event_params *params)
+{
+    struct blob_attr *tb_enum_test_state_changed_event[__ENUM_TEST_STATE_CHANGED_EVENT_MAX];
+    if (blobmsg_parse(enum_test_state_changed_event_policy, ARRAY_SIZE(enum_test_state_changed_event_policy), tb_enum_test_state_changed_event, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_enum_test_state_changed_event[ENUM_TEST_STATE_CHANGED_EVENT_IFNAME] || !tb_enum_test_state_changed_event[ENUM_TEST_STATE_CHANGED_EVENT_STATE]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->ifname = blobmsg_get_string(tb_enum_test_state_changed_event[ENUM_TEST_STATE_CHANGED_EVENT_IFNAME]);
+    if (link_state_parse(blobmsg_get_string(tb_enum_test_state_changed_event[ENUM_TEST_STATE_CHANGED_EVENT_STATE]), &params->state) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (tb_enum_test_state_changed_event[ENUM_TEST_STATE_CHANGED_EVENT_DUPLEX]) {
+        if (blobmsg_get_u32(tb_enum_test_state_changed_event[ENUM_TEST_STATE_CHANGED_EVENT_DUPLEX]) >= __DUPLEX_MAX) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        params->duplex = (enum duplex)blobmsg_get_u32(tb_enum_test_state_changed_event[ENUM_TEST_STATE_CHANGED_EVENT_DUPLEX]);
+        UBUS_IDL_SET_FIELD(params, ENUM_TEST_STATE_CHANGED_EVENT_HAS_DUPLEX);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int enum_test_state_changed_event_serialize(struct blob_buf *b, const struct enum_test_state_changed_event_params *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    if ((unsigned int)params->state >= __LINK_STATE_MAX) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    UBUS_IDL_ADD(string, b, "state", link_state_names[params->state]);
+    if (UBUS_IDL_HAS_FIELD(params, ENUM_TEST_STATE_CHANGED_EVENT_HAS_DUPLEX)) {
+        if ((unsigned int)params->duplex >= __DUPLEX_MAX) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        UBUS_IDL_ADD(u32, b, "duplex", params->duplex);
+    }
+    return UBUS_STATUS_OK;
+}
+
+struct enum_test_state_changed_event_params *enum_test_state_changed_event_dup(const struct enum_test_state_changed_event_params *params)
+{
+    size_t len = sizeof(*params);
+    struct enum_test_state_changed_event_params *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void enum_test_state_changed_event_free(struct enum_test_state_changed_event_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy link_policy[] = {
+    [LINK_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [LINK_STATE] = { .name = "state", .type = BLOBMSG_TYPE_STRING },
+    [LINK_DUPLEX] = { .name = "duplex", .type = BLOBMSG_TYPE_INT32 },
+    [LINK_SPEED] = { .name = "speed", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int link_deserialize(struct blob_attr *msg, struct link *params)
+{
+    struct blob_attr *tb_link[__LINK_MAX];
+    if (blobmsg_parse(link_policy, ARRAY_SIZE(link_policy), tb_link, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_link[LINK_IFNAME] || !tb_link[LINK_STATE]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->ifname = blobmsg_get_string(tb_link[LINK_IFNAME]);
+    if (link_state_parse(blobmsg_get_string(tb_link[LINK_STATE]), &params->state) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (tb_link[LINK_DUPLEX]) {
+        if (blobmsg_get_u32(tb_link[LINK_DUPLEX]) >= __DUPLEX_MAX) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        params->duplex = (enum duplex)blobmsg_get_u32(tb_link[LINK_DUPLEX]);
+        UBUS_IDL_SET_FIELD(params, LINK_HAS_DUPLEX);
+    }
+    UBUS_IDL_GET_OPTIONAL(u32, tb_link, LINK_SPEED, params->speed, params, FIELD, LINK_HAS_SPEED);
+    return UBUS_STATUS_OK;
+}
+
+int link_serialize(struct blob_buf *b, const struct link *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    if ((unsigned int)params->state >= __LINK_STATE_MAX) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    UBUS_IDL_ADD(string, b, "state", link_state_names[params->state]);
+    if (UBUS_IDL_HAS_FIELD(params, LINK_HAS_DUPLEX)) {
+        if ((unsigned int)params->duplex >= __DUPLEX_MAX) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        UBUS_IDL_ADD(u32, b, "duplex", params->duplex);
+    }
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "speed", params->speed, params, FIELD, LINK_HAS_SPEED);
+    return UBUS_STATUS_OK;
+}
+
+struct link *link_dup(const struct link *params)
+{
+    size_t len = sizeof(*params);
+    struct link *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void link_free(struct link *params)
+{
+    free(params);
+}
+
+/* Fields added to delta notifications next to the event payload */
+enum {
+    ENUM_TEST_DELTA_SEQ,
+    ENUM_TEST_DELTA_FULL,
+    ENUM_TEST_DELTA_CLEARED,
+    __ENUM_TEST_DELTA_MAX
+};
+
+static const struct blobmsg_policy enum_test_delta_policy[] = {
+    [ENUM_TEST_DELTA_SEQ] = { .name = "_seq", .type = BLOBMSG_TYPE_INT32 },
+    [ENUM_TEST_DELTA_FULL] = { .name = "_full", .type = BLOBMSG_TYPE_BOOL },
+    [ENUM_TEST_DELTA_CLEARED] = { .name = "_cleared", .type = BLOBMSG_TYPE_ARRAY },
+};
+
+int enum_test_state_changed_mirror_apply(struct enum_test_state_changed_mirror *mirror, struct blob_attr *msg)
+{
+    struct blob_attr *meta[__ENUM_TEST_DELTA_MAX];
+    struct blob_attr *tb[__ENUM_TEST_STATE_CHANGED_EVENT_MAX];
+    uint64_t cleared[1] = { 0 };
+    struct blob_attr *word;
+    size_t rem;
+    uint32_t seq;
+    bool full;
+    int i;
+
+    if (blobmsg_parse(enum_test_delta_policy, ARRAY_SIZE(enum_test_delta_policy), meta, blob_data(msg), blob_len(msg)) < 0 ||
+        !meta[ENUM_TEST_DELTA_SEQ]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    seq = blobmsg_get_u32(meta[ENUM_TEST_DELTA_SEQ]);
+    full = meta[ENUM_TEST_DELTA_FULL] && blobmsg_get_bool(meta[ENUM_TEST_DELTA_FULL]);
+    if (meta[ENUM_TEST_DELTA_CLEARED]) {
+        i = 0;
+        blobmsg_for_each_attr(word, meta[ENUM_TEST_DELTA_CLEARED], rem) {
+            if (i == 1 || blobmsg_type(word) != BLOBMSG_TYPE_INT64) {
+                return UBUS_STATUS_INVALID_ARGUMENT;
+            }
+            cleared[i++] = blobmsg_get_u64(word);
+        }
+    }
+
+    // A delta only applies on top of the previous message, wait for a snapshot after a gap
+    if (!full && (!mirror->synced || seq != mirror->seq + 1)) {
+        mirror->synced = false;
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    if (blobmsg_parse(enum_test_state_changed_event_policy, ARRAY_SIZE(enum_test_state_changed_event_policy), tb, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    for (i = 0; i < __ENUM_TEST_STATE_CHANGED_EVENT_MAX; i++) {
+        if (full || tb[i] || UBUS_IDL_TEST_BIT(cleared, i)) {
+            free(mirror->fields[i]);
+            mirror->fields[i] = tb[i] ? blob_memdup(tb[i]) : NULL;
+        }
+    }
+
+    // Rebuild the whole table and decode it with the generated deserializer
+    blob_buf_init(&mirror->buf, 0);
+    for (i = 0; i < __ENUM_TEST_STATE_CHANGED_EVENT_MAX; i++) {
+        if (mirror->fields[i]) {
+            blob_put_raw(&mirror->buf, mirror->fields[i], blob_pad_len(mirror->fields[i]));
+        }
+    }
+
+    mirror->seq = seq;
+    mirror->synced = true;
+    return enum_test_state_changed_event_deserialize(mirror->buf.head, &mirror->state);
+}
+
+void enum_test_state_changed_mirror_free(struct enum_test_state_changed_mirror *mirror)
+{
+    int i;
+
+    for (i = 0; i < __ENUM_TEST_STATE_CHANGED_EVENT_MAX; i++) {
+        free(mirror->fields[i]);
+        mirror->fields[i] = NULL;
+    }
+    blob_buf_free(&mirror->buf);
+    mirror->synced = false;
+}
+
+/* Server side, left out when only the client and the codecs are linked */
+#ifndef UBUS_IDL_CLIENT_ONLY
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf enum_test_reply_buf;
+
+int enum_test_query_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct link *reply)
+{
+    int ret;
+
+    blob_buf_init(&enum_test_reply_buf, 0);
+    ret = link_serialize(&enum_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, enum_test_reply_buf.head);
+}
+
+static int enum_test_force_thunk(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct enum_test_force_params params;
+
+    if (enum_test_force_deserialize(msg, &params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return force_handler(ctx, obj, req, ENUM_TEST_METHOD_FORCE, &params);
+}
+
+static const struct ubus_method enum_test_methods[] = {
+    UBUS_METHOD("set_state", enum_test_set_state_handler, enum_test_set_state_policy),
+    UBUS_METHOD("query", enum_test_query_handler, enum_test_filter_policy),
+    UBUS_METHOD("set_mode", enum_test_set_mode_handler, enum_test_set_mode_policy),
+    UBUS_METHOD("force", enum_test_force_thunk, enum_test_force_policy)
+};
+
+static struct ubus_object_type enum_test_object_type =
+    UBUS_OBJECT_TYPE("enum_test", enum_test_methods);
+
+static void enum_test_subscribe_cb(struct ubus_context *ctx, struct ubus_object *obj);
+
+struct ubus_object enum_test_object = {
+    .name = "enum_test",
+    .type = &enum_test_object_type,
+    .subscribe_cb = enum_test_subscribe_cb,
+    .methods = enum_test_methods,
+    .n_methods = ARRAY_SIZE(enum_test_methods),
+};
+
+/* Buffer reused by all event notifications of this object */
+static struct blob_buf enum_test_event_buf;
+
+static bool enum_test_delta_empty(const uint64_t *mask, int words)
+{
+    int i;
+
+    for (i = 0; i < words; i++) {
+        if (mask[i]) {
+            return false;
+        }
+    }
+    return true;
+}
+
+static bool enum_test_delta_str_equal(const char *a, const char *b)
+{
+    if (!a || !b) {
+        return a == b;
+    }
+    return !strcmp(a, b);
+}
+
+#ifndef ENUM_TEST_STATE_CHANGED_SNAPSHOT_INTERVAL
+#define ENUM_TEST_STATE_CHANGED_SNAPSHOT_INTERVAL 64
+#endif
+
+/* Last published state_changed event, the next delta is computed against it */
+static struct {
+    struct enum_test_state_changed_event_params last;
+    uint32_t seq;
+    unsigned int since_full;
+    bool valid;
+} enum_test_state_changed_delta;
+
+static void enum_test_state_changed_delta_reset(void)
+{
+    free((char *)enum_test_state_changed_delta.last.ifname);
+    memset(&enum_test_state_changed_delta.last, 0, sizeof(enum_test_state_changed_delta.last));
+    enum_test_state_changed_delta.valid = false;
+}
+
+/* Set fields of params, the bits follow the policy indices */
+static void enum_test_state_changed_delta_present(const struct enum_test_state_changed_event_params *params, uint64_t *mask)
+{
+    memset(mask, 0, 1 * sizeof(uint64_t));
+    UBUS_IDL_SET_BIT(mask, ENUM_TEST_STATE_CHANGED_EVENT_IFNAME);
+    UBUS_IDL_SET_BIT(mask, ENUM_TEST_STATE_CHANGED_EVENT_STATE);
+    if (UBUS_IDL_HAS_FIELD(params, ENUM_TEST_STATE_CHANGED_EVENT_HAS_DUPLEX)) {
+        UBUS_IDL_SET_BIT(mask, ENUM_TEST_STATE_CHANGED_EVENT_DUPLEX);
+    }
+}
+
+static int enum_test_state_changed_delta_send(struct ubus_context *ctx, const uint64_t *dirty, const uint64_t *cleared, bool full)
+{
+    const struct enum_test_state_changed_event_params *last = &enum_test_state_changed_delta.last;
+    void *words;
+    int i;
+
+    blob_buf_init(&enum_test_event_buf, 0);
+    blobmsg_add_u32(&enum_test_event_buf, "_seq", ++enum_test_state_changed_delta.seq);
+    if (full) {
+        blobmsg_add_u8(&enum_test_event_buf, "_full", 1);
+    }
+    if (cleared && !enum_test_delta_empty(cleared, 1)) {
+        words = blobmsg_open_array(&enum_test_event_buf, "_cleared");
+        for (i = 0; i < 1; i++) {
+            blobmsg_add_u64(&enum_test_event_buf, NULL, cleared[i]);
+        }
+        blobmsg_close_array(&enum_test_event_buf, words);
+    }
+    if (UBUS_IDL_TEST_BIT(dirty, ENUM_TEST_STATE_CHANGED_EVENT_IFNAME) && last->ifname) {
+        blobmsg_add_string(&enum_test_event_buf, "ifname", last->ifname);
+    }
+    if (UBUS_IDL_TEST_BIT(dirty, ENUM_TEST_STATE_CHANGED_EVENT_STATE) && link_state_name(last->state)) {
+        blobmsg_add_string(&enum_test_event_buf, "state", link_state_names[last->state]);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, ENUM_TEST_STATE_CHANGED_EVENT_DUPLEX) {
+        blobmsg_add_u32(&enum_test_event_buf, "duplex", last->duplex);
+    }
+
+    enum_test_state_changed_delta.since_full = full ? 0 : enum_test_state_changed_delta.since_full + 1;
+    return ubus_notify(ctx, &enum_test_object, "state_changed", enum_test_event_buf.head, -1);
+}
+
+int enum_test_notify_state_changed(struct ubus_context *ctx, const struct enum_test_state_changed_event_params *params)
+{
+    struct enum_test_state_changed_event_params *last = &enum_test_state_changed_delta.last;
+    uint64_t present[1];
+    uint64_t previous[1] = { 0 };
+    uint64_t stale[1];
+    uint64_t dirty[1] = { 0 };
+    bool full;
+    int i;
+
+    // Nobody is subscribed, the next subscriber starts from a snapshot
+    if (!enum_test_object.has_subscribers) {
+        enum_test_state_changed_delta_reset();
+        return UBUS_STATUS_OK;
+    }
+
+    full = !enum_test_state_changed_delta.valid || enum_test_state_changed_delta.since_full >= ENUM_TEST_STATE_CHANGED_SNAPSHOT_INTERVAL;
+    enum_test_state_changed_delta_present(params, present);
+    if (enum_test_state_changed_delta.valid) {
+        enum_test_state_changed_delta_present(last, previous);
+    }
+    for (i = 0; i < 1; i++) {
+        stale[i] = previous[i] & ~present[i];
+    }
+
+    // Compare field by field, the bits follow the policy indices
+    if (UBUS_IDL_TEST_BIT(present, ENUM_TEST_STATE_CHANGED_EVENT_IFNAME) && (full || !UBUS_IDL_TEST_BIT(previous, ENUM_TEST_STATE_CHANGED_EVENT_IFNAME) ||
+        !enum_test_delta_str_equal(params->ifname, last->ifname))) {
+        UBUS_IDL_SET_BIT(dirty, ENUM_TEST_STATE_CHANGED_EVENT_IFNAME);
+        free((char *)last->ifname);
+        last->ifname = params->ifname ? strdup(params->ifname) : NULL;
+    }
+    if (UBUS_IDL_TEST_BIT(present, ENUM_TEST_STATE_CHANGED_EVENT_STATE) && (full || !UBUS_IDL_TEST_BIT(previous, ENUM_TEST_STATE_CHANGED_EVENT_STATE) ||
+        params->state != last->state)) {
+        UBUS_IDL_SET_BIT(dirty, ENUM_TEST_STATE_CHANGED_EVENT_STATE);
+        last->state = params->state;
+    }
+    if (UBUS_IDL_TEST_BIT(present, ENUM_TEST_STATE_CHANGED_EVENT_DUPLEX) && (full || !UBUS_IDL_TEST_BIT(previous, ENUM_TEST_STATE_CHANGED_EVENT_DUPLEX) ||
+        params->duplex != last->duplex)) {
+        UBUS_IDL_SET_BIT(dirty, ENUM_TEST_STATE_CHANGED_EVENT_DUPLEX);
+        last->duplex = params->duplex;
+    }
+    memcpy(&last->has_fields, &params->has_fields, sizeof(last->has_fields));
+
+    if (!full && enum_test_delta_empty(dirty, 1) && enum_test_delta_empty(stale, 1)) {
+        return UBUS_STATUS_OK;
+    }
+
+    enum_test_state_changed_delta.valid = true;
+    return enum_test_state_changed_delta_send(ctx, dirty, full ? NULL : stale, full);
+}
+
+int enum_test_notify_state_changed_full(struct ubus_context *ctx)
+{
+    uint64_t present[1];
+
+    if (!enum_test_state_changed_delta.valid || !enum_test_object.has_subscribers) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    enum_test_state_changed_delta_present(&enum_test_state_changed_delta.last, present);
+    return enum_test_state_changed_delta_send(ctx, present, NULL, true);
+}
+
+static void enum_test_subscribe_cb(struct ubus_context *ctx, struct ubus_object *obj)
+{
+    // Bring a new subscriber up to date with a snapshot of every delta event
+    if (!obj->has_subscribers) {
+        return;
+    }
+
+    enum_test_notify_state_changed_full(ctx);
+}
+
+void enum_test_object_cleanup(void)
+{
+    blob_buf_free(&enum_test_reply_buf);
+    blob_buf_free(&enum_test_event_buf);
+    enum_test_state_changed_delta_reset();
+}
+
+#endif /* UBUS_IDL_CLIENT_ONLY */
@@ -0,0 +1,225 @@
+/* Generated from ubus IDL - enum_test */
+
+#ifndef __ENUM_TEST_OBJECT_H__
+#define __ENUM_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+enum link_state {
+    LINK_STATE_UP,
+    LINK_STATE_DOWN,
+    LINK_STATE_DORMANT,
+    LINK_STATE_TESTING,
+    LINK_STATE_UNKNOWN,
+    __LINK_STATE_MAX
+};
+
+enum duplex {
+    DUPLEX_HALF,
+    DUPLEX_FULL,
+    __DUPLEX_MAX
+};
+
+enum enum_test_mode {
+    ENUM_TEST_MODE_OFF,
+    ENUM_TEST_MODE_MANUAL,
+    ENUM_TEST_MODE_AUTO_NEGOTIATE,
+    __ENUM_TEST_MODE_MAX
+};
+
+struct link {
+    const char * ifname;
+    enum link_state state;
+    enum duplex duplex;
+    int32_t speed;
+    uint8_t has_fields;
+};
+#define LINK_HAS_DUPLEX 0
+#define LINK_HAS_SPEED 1
+_Static_assert(sizeof(struct link) == UBUS_IDL_PACKED_SIZE(struct link, sizeof(const char *) + sizeof(enum link_state) + sizeof(enum duplex) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct link has padding between members");
+
+struct enum_test_filter {
+    enum enum_test_mode mode;
+    enum link_state state;
+    uint8_t has_fields;
+};
+#define ENUM_TEST_FILTER_HAS_STATE 0
+_Static_assert(sizeof(struct enum_test_filter) == UBUS_IDL_PACKED_SIZE(struct enum_test_filter, sizeof(enum enum_test_mode) + sizeof(enum link_state) + sizeof(uint8_t)),
+               "struct enum_test_filter has padding between members");
+
+struct enum_test_set_state_params {
+    const char * ifname;
+    enum link_state state;
+    enum duplex duplex;
+    uint8_t has_fields;
+};
+#define ENUM_TEST_SET_STATE_HAS_DUPLEX 0
+_Static_assert(sizeof(struct enum_test_set_state_params) == UBUS_IDL_PACKED_SIZE(struct enum_test_set_state_params, sizeof(const char *) + sizeof(enum link_state) + sizeof(enum duplex) + sizeof(uint8_t)),
+               "struct enum_test_set_state_params has padding between members");
+
+struct enum_test_set_mode_params {
+    const char * ifname;
+    enum enum_test_mode mode;
+};
+_Static_assert(sizeof(struct enum_test_set_mode_params) == UBUS_IDL_PACKED_SIZE(struct enum_test_set_mode_params, sizeof(const char *) + sizeof(enum enum_test_mode)),
+               "struct enum_test_set_mode_params has padding between members");
+
+struct enum_test_force_params {
+    const char * ifname;
+    enum duplex duplex;
+};
+_Static_assert(sizeof(struct enum_test_force_params) == UBUS_IDL_PACKED_SIZE(struct enum_test_force_params, sizeof(const char *) + sizeof(enum duplex)),
+               "struct enum_test_force_params has padding between members");
+
+struct enum_test_state_changed_event_params {
+    const char * ifname;
+    enum link_state state;
+    enum duplex duplex;
+    uint8_t has_fields;
+};
+#define ENUM_TEST_STATE_CHANGED_EVENT_HAS_DUPLEX 0
+_Static_assert(sizeof(struct enum_test_state_changed_event_params) == UBUS_IDL_PACKED_SIZE(struct enum_test_state_changed_event_params, sizeof(const char *) + sizeof(enum link_state) + sizeof(enum duplex) + sizeof(uint8_t)),
+               "struct enum_test_state_changed_event_params has padding between members");
+
+enum {
+    ENUM_TEST_SET_STATE_IFNAME,
+    ENUM_TEST_SET_STATE_STATE,
+    ENUM_TEST_SET_STATE_DUPLEX,
+    __ENUM_TEST_SET_STATE_MAX
+};
+
+enum {
+    ENUM_TEST_FILTER_MODE,
+    ENUM_TEST_FILTER_STATE,
+    __ENUM_TEST_FILTER_MAX
+};
+
+enum {
+    ENUM_TEST_SET_MODE_IFNAME,
+    ENUM_TEST_SET_MODE_MODE,
+    __ENUM_TEST_SET_MODE_MAX
+};
+
+enum {
+    ENUM_TEST_FORCE_IFNAME,
+    ENUM_TEST_FORCE_DUPLEX,
+    __ENUM_TEST_FORCE_MAX
+};
+
+enum {
+    ENUM_TEST_STATE_CHANGED_EVENT_IFNAME,
+    ENUM_TEST_STATE_CHANGED_EVENT_STATE,
+    ENUM_TEST_STATE_CHANGED_EVENT_DUPLEX,
+    __ENUM_TEST_STATE_CHANGED_EVENT_MAX
+};
+
+enum {
+    LINK_IFNAME,
+    LINK_STATE,
+    LINK_DUPLEX,
+    LINK_SPEED,
+    __LINK_MAX
+};
+
+struct enum_test_set_mode_view {
+    struct blob_attr *msg;
+    struct blob_attr *tb[__ENUM_TEST_SET_MODE_MAX];
+    uint32_t located[(__ENUM_TEST_SET_MODE_MAX + 31) / 32];
+};
+
+enum enum_test_method {
+    ENUM_TEST_METHOD_SET_STATE,
+    ENUM_TEST_METHOD_QUERY,
+    ENUM_TEST_METHOD_SET_MODE,
+    ENUM_TEST_METHOD_FORCE,
+    __ENUM_TEST_METHOD_MAX
+};
+
+int enum_test_set_state_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int enum_test_query_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int enum_test_set_mode_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+/* Custom handlers, called by a generated thunk with the method and its decoded params */
+int force_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, enum enum_test_method method, const struct enum_test_force_params *params);
+
+int enum_test_set_state_deserialize(struct blob_attr *msg, struct enum_test_set_state_params *params);
+int enum_test_set_state_serialize(struct blob_buf *b, const struct enum_test_set_state_params *params);
+int enum_test_filter_deserialize(struct blob_attr *msg, struct enum_test_filter *params);
+int enum_test_filter_serialize(struct blob_buf *b, const struct enum_test_filter *params);
+int enum_test_set_mode_deserialize(struct blob_attr *msg, struct enum_test_set_mode_params *params);
+int enum_test_set_mode_serialize(struct blob_buf *b, const struct enum_test_set_mode_params *params);
+int enum_test_force_deserialize(struct blob_attr *msg, struct enum_test_force_params *params);
+int enum_test_force_serialize(struct blob_buf *b, const struct enum_test_force_params *params);
+int enum_test_state_changed_event_deserialize(struct blob_attr *msg, struct enum_test_state_changed_event_params *params);
+int enum_test_state_changed_event_serialize(struct blob_buf *b, const struct enum_test_state_changed_event_params *params);
+int link_deserialize(struct blob_attr *msg, struct link *params);
+int link_serialize(struct blob_buf *b, const struct link *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct enum_test_set_state_params *enum_test_set_state_dup(const struct enum_test_set_state_params *params);
+void enum_test_set_state_free(struct enum_test_set_state_params *params);
+struct enum_test_filter *enum_test_filter_dup(const struct enum_test_filter *params);
+void enum_test_filter_free(struct enum_test_filter *params);
+struct enum_test_set_mode_params *enum_test_set_mode_dup(const struct enum_test_set_mode_params *params);
+void enum_test_set_mode_free(struct enum_test_set_mode_params *params);
+struct enum_test_force_params *enum_test_force_dup(const struct enum_test_force_params *params);
+void enum_test_force_free(struct enum_test_force_params *params);
+struct enum_test_state_changed_event_params *enum_test_state_changed_event_dup(const struct enum_test_state_changed_event_params *params);
+void enum_test_state_changed_event_free(struct enum_test_state_changed_event_params *params);
+struct link *link_dup(const struct link *params);
+void link_free(struct link *params);
+
+/* Names of enum values, NULL for a value out of range, and the reverse lookup */
+const char *link_state_name(enum link_state value);
+int link_state_parse(const char *name, enum link_state *value);
+const char *duplex_name(enum duplex value);
+int duplex_parse(const char *name, enum duplex *value);
+const char *enum_test_mode_name(enum enum_test_mode value);
+int enum_test_mode_parse(const char *name, enum enum_test_mode *value);
+
+int enum_test_query_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct link *reply);
+
+void enum_test_set_mode_view_init(struct enum_test_set_mode_view *view, struct blob_attr *msg);
+int enum_test_set_mode_get_ifname(struct enum_test_set_mode_view *view, const char **out);
+int enum_test_set_mode_get_mode(struct enum_test_set_mode_view *view, enum enum_test_mode *out);
+
+/* Local copy of the state_changed event, rebuilt from snapshots and deltas */
+struct enum_test_state_changed_mirror {
+    struct enum_test_state_changed_event_params state;
+    struct blob_attr *fields[__ENUM_TEST_STATE_CHANGED_EVENT_MAX];
+    struct blob_buf buf;
+    uint32_t seq;
+    bool synced;
+};
+
+int enum_test_state_changed_mirror_apply(struct enum_test_state_changed_mirror *mirror, struct blob_attr *msg);
+void enum_test_state_changed_mirror_free(struct enum_test_state_changed_mirror *mirror);
+
+extern struct ubus_object enum_test_object;
+
+int enum_test_notify_state_changed(struct ubus_context *ctx, const struct enum_test_state_changed_event_params *params);
+int enum_test_notify_state_changed_full(struct ubus_context *ctx);
+
+void enum_test_object_cleanup(void);
+
+#endif /* __ENUM_TEST_OBJECT_H__ */
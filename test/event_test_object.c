@@ -0,0 +1,379 @@
+/* Generated from ubus IDL - event_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "event_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy event_test_get_link_policy[] = {
+    [EVENT_TEST_GET_LINK_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING }
+};
+
+int event_test_get_link_deserialize(struct blob_attr *msg, struct event_test_get_link_params *params)
+{
+    struct blob_attr *tb_event_test_get_link[__EVENT_TEST_GET_LINK_MAX];
+    if (blobmsg_parse(event_test_get_link_policy, ARRAY_SIZE(event_test_get_link_policy), tb_event_test_get_link, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_event_test_get_link[EVENT_TEST_GET_LINK_IFNAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->ifname = blobmsg_get_string(tb_event_test_get_link[EVENT_TEST_GET_LINK_IFNAME]);
+    return UBUS_STATUS_OK;
+}
+
+int event_test_get_link_serialize(struct blob_buf *b, const struct event_test_get_link_params *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    return UBUS_STATUS_OK;
+}
+
+struct event_test_get_link_params *event_test_get_link_dup(const struct event_test_get_link_params *params)
+{
+    size_t len = sizeof(*params);
+    struct event_test_get_link_params *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void event_test_get_link_free(struct event_test_get_link_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy event_test_changed_event_policy[] = {
+    [EVENT_TEST_CHANGED_EVENT_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [EVENT_TEST_CHANGED_EVENT_REASON] = { .name = "reason", .type = BLOBMSG_TYPE_STRING }
+};
+
+int event_test_changed_event_deserialize(struct blob_attr *msg, struct event_test_changed_event_params *params)
+{
+    struct blob_attr *tb_event_test_changed_event[__EVENT_TEST_CHANGED_EVENT_MAX];
+    if (blobmsg_parse(event_test_changed_event_policy, ARRAY_SIZE(event_test_changed_event_policy), tb_event_test_changed_event, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_event_test_changed_event[EVENT_TEST_CHANGED_EVENT_IFNAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->ifname = blobmsg_get_string(tb_event_test_changed_event[EVENT_TEST_CHANGED_EVENT_IFNAME]);
+
+    UBUS_IDL_GET_OPTIONAL(string, tb_event_test_changed_event, EVENT_TEST_CHANGED_EVENT_REASON, params->reason, params, FIELD, EVENT_TEST_CHANGED_EVENT_HAS_REASON);
+    return UBUS_STATUS_OK;
+}
+
+int event_test_changed_event_serialize(struct blob_buf *b, const struct event_test_changed_event_params *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "reason", params->reason, params, FIELD, EVENT_TEST_CHANGED_EVENT_HAS_REASON);
+    return UBUS_STATUS_OK;
+}
+
+struct event_test_changed_event_params *event_test_changed_event_dup(const struct event_test_changed_event_params *params)
+{
+    size_t len = sizeof(*params);
+    struct event_test_changed_event_params *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+    if (UBUS_IDL_HAS_FIELD(params, EVENT_TEST_CHANGED_EVENT_HAS_REASON) && params->reason) {
+        len += strlen(params->reason) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    copy->reason = UBUS_IDL_HAS_FIELD(params, EVENT_TEST_CHANGED_EVENT_HAS_REASON) && params->reason ? ubus_idl_dup_string(&p, params->reason) : NULL;
+    return copy;
+}
+
+void event_test_changed_event_free(struct event_test_changed_event_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy event_test_link_policy[] = {
+    [EVENT_TEST_LINK_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [EVENT_TEST_LINK_UP] = { .name = "up", .type = BLOBMSG_TYPE_BOOL },
+    [EVENT_TEST_LINK_SPEED] = { .name = "speed", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int event_test_link_deserialize(struct blob_attr *msg, struct event_test_link *params)
+{
+    struct blob_attr *tb_event_test_link[__EVENT_TEST_LINK_MAX];
+    if (blobmsg_parse(event_test_link_policy, ARRAY_SIZE(event_test_link_policy), tb_event_test_link, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_event_test_link[EVENT_TEST_LINK_IFNAME] || !tb_event_test_link[EVENT_TEST_LINK_UP]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->ifname = blobmsg_get_string(tb_event_test_link[EVENT_TEST_LINK_IFNAME]);
+    params->up = blobmsg_get_u8(tb_event_test_link[EVENT_TEST_LINK_UP]) != 0;
+
+    UBUS_IDL_GET_OPTIONAL(u32, tb_event_test_link, EVENT_TEST_LINK_SPEED, params->speed, params, FIELD, EVENT_TEST_LINK_HAS_SPEED);
+    return UBUS_STATUS_OK;
+}
+
+int event_test_link_serialize(struct blob_buf *b, const struct event_test_link *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    UBUS_IDL_ADD(u8, b, "up", params->up ? 1 : 0);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "speed", params->speed, params, FIELD, EVENT_TEST_LINK_HAS_SPEED);
+    return UBUS_STATUS_OK;
+}
+
+struct event_test_link *event_test_link_dup(const struct event_test_link *params)
+{
+    size_t len = sizeof(*params);
+    struct event_test_link *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void event_test_link_free(struct event_test_link *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy counters_policy[] = {
+    [COUNTERS_RX_PACKETS] = { .name = "rx_packets", .type = BLOBMSG_TYPE_INT64 },
+    [COUNTERS_TX_PACKETS] = { .name = "tx_packets", .type = BLOBMSG_TYPE_INT64 },
+    [COUNTERS_ERRORS] = { .name = "errors", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int counters_deserialize(struct blob_attr *msg, struct counters *params)
+{
+    struct blob_attr *tb_counters[__COUNTERS_MAX];
+    if (blobmsg_parse(counters_policy, ARRAY_SIZE(counters_policy), tb_counters, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_counters[COUNTERS_RX_PACKETS] || !tb_counters[COUNTERS_TX_PACKETS]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->rx_packets = blobmsg_get_u64(tb_counters[COUNTERS_RX_PACKETS]);
+    params->tx_packets = blobmsg_get_u64(tb_counters[COUNTERS_TX_PACKETS]);
+
+    UBUS_IDL_GET_OPTIONAL(u32, tb_counters, COUNTERS_ERRORS, params->errors, params, FIELD, COUNTERS_HAS_ERRORS);
+    return UBUS_STATUS_OK;
+}
+
+int counters_serialize(struct blob_buf *b, const struct counters *params)
+{
+    UBUS_IDL_ADD(u64, b, "rx_packets", params->rx_packets);
+    UBUS_IDL_ADD(u64, b, "tx_packets", params->tx_packets);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "errors", params->errors, params, FIELD, COUNTERS_HAS_ERRORS);
+    return UBUS_STATUS_OK;
+}
+
+struct counters *counters_dup(const struct counters *params)
+{
+    size_t len = sizeof(*params);
+    struct counters *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void counters_free(struct counters *params)
+{
+    free(params);
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf event_test_reply_buf;
+
+int event_test_get_link_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct event_test_link *reply)
+{
+    int ret;
+
+    blob_buf_init(&event_test_reply_buf, 0);
+    ret = event_test_link_serialize(&event_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, event_test_reply_buf.head);
+}
+
+static const struct ubus_method event_test_methods[] = {
+    UBUS_METHOD("get_link", event_test_get_link_handler, event_test_get_link_policy)
+};
+
+static struct ubus_object_type event_test_object_type =
+    UBUS_OBJECT_TYPE("event_test", event_test_methods);
+
+struct ubus_object event_test_object = {
+    .name = "event_test",
+    .type = &event_test_object_type,
+    .methods = event_test_methods,
+    .n_methods = ARRAY_SIZE(event_test_methods),
+};
+
+/* Buffer reused by all event notifications of this object */
+static struct blob_buf event_test_event_buf;
+
+int event_test_notify_changed(struct ubus_context *ctx, const struct event_test_changed_event_params *params)
+{
+    int ret;
+
+    // Nobody is subscribed, skip building the message
+    if (!event_test_object.has_subscribers) {
+        return UBUS_STATUS_OK;
+    }
+
+    blob_buf_init(&event_test_event_buf, 0);
+    ret = event_test_changed_event_serialize(&event_test_event_buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_notify(ctx, &event_test_object, "changed", event_test_event_buf.head, -1);
+}
+
+int event_test_notify_link_update(struct ubus_context *ctx, const struct event_test_link *params)
+{
+    int ret;
+
+    // Event listeners are not known to the sender, so a broadcast event is always built
+    blob_buf_init(&event_test_event_buf, 0);
+    ret = event_test_link_serialize(&event_test_event_buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    if (event_test_object.has_subscribers) {
+        ret = ubus_notify(ctx, &event_test_object, "link_update", event_test_event_buf.head, -1);
+        if (ret != UBUS_STATUS_OK) {
+            return ret;
+        }
+    }
+
+    return ubus_send_event(ctx, "network.link", event_test_event_buf.head);
+}
+
+int event_test_notify_stats(struct ubus_context *ctx, const struct counters *params)
+{
+    int ret;
+
+    // Nobody is subscribed, skip building the message
+    if (!event_test_object.has_subscribers) {
+        return UBUS_STATUS_OK;
+    }
+
+    blob_buf_init(&event_test_event_buf, 0);
+    ret = counters_serialize(&event_test_event_buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_notify(ctx, &event_test_object, "stats", event_test_event_buf.head, -1);
+}
+
+int event_test_notify_reload(struct ubus_context *ctx)
+{
+    int ret;
+
+    // Event listeners are not known to the sender, so a broadcast event is always built
+    blob_buf_init(&event_test_event_buf, 0);
+
+    if (event_test_object.has_subscribers) {
+        ret = ubus_notify(ctx, &event_test_object, "reload", event_test_event_buf.head, -1);
+        if (ret != UBUS_STATUS_OK) {
+            return ret;
+        }
+    }
+
+    return ubus_send_event(ctx, "event_test.reload", event_test_event_buf.head);
+}
+
+void event_test_object_cleanup(void)
+{
+    blob_buf_free(&event_test_reply_buf);
+    blob_buf_free(&event_test_event_buf);
+}
@@ -0,0 +1,120 @@
+/* Generated from ubus IDL - event_test */
+
+#ifndef __EVENT_TEST_OBJECT_H__
+#define __EVENT_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct counters {
+    int64_t rx_packets;
+    int64_t tx_packets;
+    int32_t errors;
+    uint8_t has_fields;
+};
+#define COUNTERS_HAS_ERRORS 0
+_Static_assert(sizeof(struct counters) == UBUS_IDL_PACKED_SIZE(struct counters, 2 * sizeof(int64_t) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct counters has padding between members");
+
+struct event_test_link {
+    const char * ifname;
+    int32_t speed;
+    bool up;
+    uint8_t has_fields;
+};
+#define EVENT_TEST_LINK_HAS_SPEED 0
+_Static_assert(sizeof(struct event_test_link) == UBUS_IDL_PACKED_SIZE(struct event_test_link, sizeof(const char *) + sizeof(int32_t) + sizeof(bool) + sizeof(uint8_t)),
+               "struct event_test_link has padding between members");
+
+struct event_test_get_link_params {
+    const char * ifname;
+};
+_Static_assert(sizeof(struct event_test_get_link_params) == UBUS_IDL_PACKED_SIZE(struct event_test_get_link_params, sizeof(const char *)),
+               "struct event_test_get_link_params has padding between members");
+
+struct event_test_changed_event_params {
+    const char * ifname;
+    const char * reason;
+    uint8_t has_fields;
+};
+#define EVENT_TEST_CHANGED_EVENT_HAS_REASON 0
+_Static_assert(sizeof(struct event_test_changed_event_params) == UBUS_IDL_PACKED_SIZE(struct event_test_changed_event_params, 2 * sizeof(const char *) + sizeof(uint8_t)),
+               "struct event_test_changed_event_params has padding between members");
+
+enum {
+    EVENT_TEST_GET_LINK_IFNAME,
+    __EVENT_TEST_GET_LINK_MAX
+};
+
+enum {
+    EVENT_TEST_CHANGED_EVENT_IFNAME,
+    EVENT_TEST_CHANGED_EVENT_REASON,
+    __EVENT_TEST_CHANGED_EVENT_MAX
+};
+
+enum {
+    EVENT_TEST_LINK_IFNAME,
+    EVENT_TEST_LINK_UP,
+    EVENT_TEST_LINK_SPEED,
+    __EVENT_TEST_LINK_MAX
+};
+
+enum {
+    COUNTERS_RX_PACKETS,
+    COUNTERS_TX_PACKETS,
+    COUNTERS_ERRORS,
+    __COUNTERS_MAX
+};
+
+int event_test_get_link_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+int event_test_get_link_deserialize(struct blob_attr *msg, struct event_test_get_link_params *params);
+int event_test_get_link_serialize(struct blob_buf *b, const struct event_test_get_link_params *params);
+int event_test_changed_event_deserialize(struct blob_attr *msg, struct event_test_changed_event_params *params);
+int event_test_changed_event_serialize(struct blob_buf *b, const struct event_test_changed_event_params *params);
+int event_test_link_deserialize(struct blob_attr *msg, struct event_test_link *params);
+int event_test_link_serialize(struct blob_buf *b, const struct event_test_link *params);
+int counters_deserialize(struct blob_attr *msg, struct counters *params);
+int counters_serialize(struct blob_buf *b, const struct counters *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct event_test_get_link_params *event_test_get_link_dup(const struct event_test_get_link_params *params);
+void event_test_get_link_free(struct event_test_get_link_params *params);
+struct event_test_changed_event_params *event_test_changed_event_dup(const struct event_test_changed_event_params *params);
+void event_test_changed_event_free(struct event_test_changed_event_params *params);
+struct event_test_link *event_test_link_dup(const struct event_test_link *params);
+void event_test_link_free(struct event_test_link *params);
+struct counters *counters_dup(const struct counters *params);
+void counters_free(struct counters *params);
+
+int event_test_get_link_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct event_test_link *reply);
+
+extern struct ubus_object event_test_object;
+
+int event_test_notify_changed(struct ubus_context *ctx, const struct event_test_changed_event_params *params);
+int event_test_notify_link_update(struct ubus_context *ctx, const struct event_test_link *params);
+int event_test_notify_stats(struct ubus_context *ctx, const struct counters *params);
+int event_test_notify_reload(struct ubus_context *ctx);
+
+void event_test_object_cleanup(void);
+
+#endif /* __EVENT_TEST_OBJECT_H__ */
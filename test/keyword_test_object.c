@@ -0,0 +1,292 @@
+/* Generated from ubus IDL - keyword_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "keyword_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const char *const level_names[] = {
+    [LEVEL_LOW] = "low",
+    [LEVEL_HIGH] = "high",
+};
+
+/* FNV-1a slots of the names, collision free for the basis below, 0 when empty or value + 1 */
+static const uint8_t level_slots[4] = { 2, 0, 1, 0 };
+
+const char *level_name(enum level value)
+{
+    if ((unsigned int)value >= __LEVEL_MAX) {
+        return NULL;
+    }
+
+    return level_names[value];
+}
+
+int level_parse(const char *name, enum level *value)
+{
+    uint32_t hash = 0x811c9dc4u;
+    unsigned int slot;
+    const char *p;
+
+    for (p = name; *p; p++) {
+        hash = (hash ^ (uint8_t)*p) * 16777619u;
+    }
+
+    // Any other name may share a slot with a value, a single compare tells them apart
+    slot = level_slots[hash & 3];
+    if (!slot || strcmp(level_names[slot - 1], name) != 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *value = (enum level)(slot - 1);
+    return UBUS_STATUS_OK;
+}
+
+static const struct blobmsg_policy keyword_test_event_policy[] = {
+    [KEYWORD_TEST_EVENT_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int keyword_test_event_deserialize(struct blob_attr *msg, struct keyword_test_event_params *params)
+{
+    struct blob_attr *tb_keyword_test_event[__KEYWORD_TEST_EVENT_MAX];
+    if (blobmsg_parse(keyword_test_event_policy, ARRAY_SIZE(keyword_test_event_policy), tb_keyword_test_event, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_keyword_test_event[KEYWORD_TEST_EVENT_ID]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->id = blobmsg_get_u32(tb_keyword_test_event[KEYWORD_TEST_EVENT_ID]);
+    return UBUS_STATUS_OK;
+}
+
+int keyword_test_event_serialize(struct blob_buf *b, const struct keyword_test_event_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    return UBUS_STATUS_OK;
+}
+
+struct keyword_test_event_params *keyword_test_event_dup(const struct keyword_test_event_params *params)
+{
+    size_t len = sizeof(*params);
+    struct keyword_test_event_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void keyword_test_event_free(struct keyword_test_event_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy event_policy[] = {
+    [EVENT_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+    [EVENT_SOURCE] = { .name = "source", .type = BLOBMSG_TYPE_STRING }
+};
+
+int event_deserialize(struct blob_attr *msg, struct event *params)
+{
+    struct blob_attr *tb_event[__EVENT_MAX];
+    if (blobmsg_parse(event_policy, ARRAY_SIZE(event_policy), tb_event, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_event[EVENT_ID]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->id = blobmsg_get_u32(tb_event[EVENT_ID]);
+
+    UBUS_IDL_GET_OPTIONAL(string, tb_event, EVENT_SOURCE, params->source, params, FIELD, EVENT_HAS_SOURCE);
+    return UBUS_STATUS_OK;
+}
+
+int event_serialize(struct blob_buf *b, const struct event *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "source", params->source, params, FIELD, EVENT_HAS_SOURCE);
+    return UBUS_STATUS_OK;
+}
+
+struct event *event_dup(const struct event *params)
+{
+    size_t len = sizeof(*params);
+    struct event *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, EVENT_HAS_SOURCE) && params->source) {
+        len += strlen(params->source) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->source = UBUS_IDL_HAS_FIELD(params, EVENT_HAS_SOURCE) && params->source ? ubus_idl_dup_string(&p, params->source) : NULL;
+    return copy;
+}
+
+void event_free(struct event *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy keyword_test_enum_policy[] = {
+    [KEYWORD_TEST_ENUM_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+    [KEYWORD_TEST_ENUM_LEVEL] = { .name = "level", .type = BLOBMSG_TYPE_STRING }
+};
+
+int keyword_test_enum_deserialize(struct blob_attr *msg, struct keyword_test_enum_params *params)
+{
+    struct blob_attr *tb_keyword_test_enum[__KEYWORD_TEST_ENUM_MAX];
+    if (blobmsg_parse(keyword_test_enum_policy, ARRAY_SIZE(keyword_test_enum_policy), tb_keyword_test_enum, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_keyword_test_enum[KEYWORD_TEST_ENUM_ID] || !tb_keyword_test_enum[KEYWORD_TEST_ENUM_LEVEL]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->id = blobmsg_get_u32(tb_keyword_test_enum[KEYWORD_TEST_ENUM_ID]);
+    if (level_parse(blobmsg_get_string(tb_keyword_test_enum[KEYWORD_TEST_ENUM_LEVEL]), &params->level) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    return UBUS_STATUS_OK;
+}
+
+int keyword_test_enum_serialize(struct blob_buf *b, const struct keyword_test_enum_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    if ((unsigned int)params->level >= __LEVEL_MAX) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+    UBUS_IDL_ADD(string, b, "level", level_names[params->level]);
+    return UBUS_STATUS_OK;
+}
+
+struct keyword_test_enum_params *keyword_test_enum_dup(const struct keyword_test_enum_params *params)
+{
+    size_t len = sizeof(*params);
+    struct keyword_test_enum_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void keyword_test_enum_free(struct keyword_test_enum_params *params)
+{
+    free(params);
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf keyword_test_reply_buf;
+
+int keyword_test_event_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct event *reply)
+{
+    int ret;
+
+    blob_buf_init(&keyword_test_reply_buf, 0);
+    ret = event_serialize(&keyword_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, keyword_test_reply_buf.head);
+}
+
+static const struct ubus_method keyword_test_methods[] = {
+    UBUS_METHOD("event", keyword_test_event_handler, keyword_test_event_policy),
+    UBUS_METHOD("post", keyword_test_post_handler, event_policy),
+    UBUS_METHOD("enum", keyword_test_enum_handler, keyword_test_enum_policy)
+};
+
+static struct ubus_object_type keyword_test_object_type =
+    UBUS_OBJECT_TYPE("keyword_test", keyword_test_methods);
+
+struct ubus_object keyword_test_object = {
+    .name = "keyword_test",
+    .type = &keyword_test_object_type,
+    .methods = keyword_test_methods,
+    .n_methods = ARRAY_SIZE(keyword_test_methods),
+};
+
+/* Buffer reused by all event notifications of this object */
+static struct blob_buf keyword_test_event_buf;
+
+int keyword_test_notify_posted(struct ubus_context *ctx, const struct event *params)
+{
+    int ret;
+
+    // Nobody is subscribed, skip building the message
+    if (!keyword_test_object.has_subscribers) {
+        return UBUS_STATUS_OK;
+    }
+
+    blob_buf_init(&keyword_test_event_buf, 0);
+    ret = event_serialize(&keyword_test_event_buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_notify(ctx, &keyword_test_object, "posted", keyword_test_event_buf.head, -1);
+}
+
+void keyword_test_object_cleanup(void)
+{
+    blob_buf_free(&keyword_test_reply_buf);
+    blob_buf_free(&keyword_test_event_buf);
+}
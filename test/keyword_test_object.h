@@ -0,0 +1,104 @@
+/* Generated from ubus IDL - keyword_test */
+
+#ifndef __KEYWORD_TEST_OBJECT_H__
+#define __KEYWORD_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+enum level {
+    LEVEL_LOW,
+    LEVEL_HIGH,
+    __LEVEL_MAX
+};
+
+struct event {
+    const char * source;
+    int32_t id;
+    uint8_t has_fields;
+};
+#define EVENT_HAS_SOURCE 0
+_Static_assert(sizeof(struct event) == UBUS_IDL_PACKED_SIZE(struct event, sizeof(const char *) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct event has padding between members");
+
+struct keyword_test_event_params {
+    int32_t id;
+};
+_Static_assert(sizeof(struct keyword_test_event_params) == UBUS_IDL_PACKED_SIZE(struct keyword_test_event_params, sizeof(int32_t)),
+               "struct keyword_test_event_params has padding between members");
+
+struct keyword_test_enum_params {
+    int32_t id;
+    enum level level;
+};
+_Static_assert(sizeof(struct keyword_test_enum_params) == UBUS_IDL_PACKED_SIZE(struct keyword_test_enum_params, sizeof(int32_t) + sizeof(enum level)),
+               "struct keyword_test_enum_params has padding between members");
+
+enum {
+    KEYWORD_TEST_EVENT_ID,
+    __KEYWORD_TEST_EVENT_MAX
+};
+
+enum {
+    EVENT_ID,
+    EVENT_SOURCE,
+    __EVENT_MAX
+};
+
+enum {
+    KEYWORD_TEST_ENUM_ID,
+    KEYWORD_TEST_ENUM_LEVEL,
+    __KEYWORD_TEST_ENUM_MAX
+};
+
+int keyword_test_event_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int keyword_test_post_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int keyword_test_enum_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+int keyword_test_event_deserialize(struct blob_attr *msg, struct keyword_test_event_params *params);
+int keyword_test_event_serialize(struct blob_buf *b, const struct keyword_test_event_params *params);
+int event_deserialize(struct blob_attr *msg, struct event *params);
+int event_serialize(struct blob_buf *b, const struct event *params);
+int keyword_test_enum_deserialize(struct blob_attr *msg, struct keyword_test_enum_params *params);
+int keyword_test_enum_serialize(struct blob_buf *b, const struct keyword_test_enum_params *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct keyword_test_event_params *keyword_test_event_dup(const struct keyword_test_event_params *params);
+void keyword_test_event_free(struct keyword_test_event_params *params);
+struct event *event_dup(const struct event *params);
+void event_free(struct event *params);
+struct keyword_test_enum_params *keyword_test_enum_dup(const struct keyword_test_enum_params *params);
+void keyword_test_enum_free(struct keyword_test_enum_params *params);
+
+/* Names of enum values, NULL for a value out of range, and the reverse lookup */
+const char *level_name(enum level value);
+int level_parse(const char *name, enum level *value);
+
+int keyword_test_event_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct event *reply);
+
+extern struct ubus_object keyword_test_object;
+
+int keyword_test_notify_posted(struct ubus_context *ctx, const struct event *params);
+
+void keyword_test_object_cleanup(void);
+
+#endif /* __KEYWORD_TEST_OBJECT_H__ */
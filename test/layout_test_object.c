@@ -0,0 +1,606 @@
+/* Generated from ubus IDL - layout_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "layout_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy layout_test_get_sample_policy[] = {
+    [LAYOUT_TEST_GET_SAMPLE_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING }
+};
+
+int layout_test_get_sample_deserialize(struct blob_attr *msg, struct layout_test_get_sample_params *params)
+{
+    struct blob_attr *tb_layout_test_get_sample[__LAYOUT_TEST_GET_SAMPLE_MAX];
+    if (blobmsg_parse(layout_test_get_sample_policy, ARRAY_SIZE(layout_test_get_sample_policy), tb_layout_test_get_sample, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_layout_test_get_sample[LAYOUT_TEST_GET_SAMPLE_NAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->name = blobmsg_get_string(tb_layout_test_get_sample[LAYOUT_TEST_GET_SAMPLE_NAME]);
+    return UBUS_STATUS_OK;
+}
+
+int layout_test_get_sample_serialize(struct blob_buf *b, const struct layout_test_get_sample_params *params)
+{
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    return UBUS_STATUS_OK;
+}
+
+struct layout_test_get_sample_params *layout_test_get_sample_dup(const struct layout_test_get_sample_params *params)
+{
+    size_t len = sizeof(*params);
+    struct layout_test_get_sample_params *copy;
+    char *p;
+
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void layout_test_get_sample_free(struct layout_test_get_sample_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy layout_test_set_flags_policy[] = {
+    [LAYOUT_TEST_SET_FLAGS_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+    [LAYOUT_TEST_SET_FLAGS_A] = { .name = "a", .type = BLOBMSG_TYPE_BOOL },
+    [LAYOUT_TEST_SET_FLAGS_B] = { .name = "b", .type = BLOBMSG_TYPE_BOOL },
+    [LAYOUT_TEST_SET_FLAGS_C] = { .name = "c", .type = BLOBMSG_TYPE_BOOL },
+    [LAYOUT_TEST_SET_FLAGS_D] = { .name = "d", .type = BLOBMSG_TYPE_BOOL },
+    [LAYOUT_TEST_SET_FLAGS_E] = { .name = "e", .type = BLOBMSG_TYPE_BOOL },
+    [LAYOUT_TEST_SET_FLAGS_F] = { .name = "f", .type = BLOBMSG_TYPE_BOOL },
+    [LAYOUT_TEST_SET_FLAGS_G] = { .name = "g", .type = BLOBMSG_TYPE_BOOL },
+    [LAYOUT_TEST_SET_FLAGS_H] = { .name = "h", .type = BLOBMSG_TYPE_BOOL },
+    [LAYOUT_TEST_SET_FLAGS_I] = { .name = "i", .type = BLOBMSG_TYPE_INT64 }
+};
+
+int layout_test_set_flags_deserialize(struct blob_attr *msg, struct layout_test_set_flags_params *params)
+{
+    struct blob_attr *tb_layout_test_set_flags[__LAYOUT_TEST_SET_FLAGS_MAX];
+    if (blobmsg_parse(layout_test_set_flags_policy, ARRAY_SIZE(layout_test_set_flags_policy), tb_layout_test_set_flags, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_layout_test_set_flags[LAYOUT_TEST_SET_FLAGS_ID]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->id = blobmsg_get_u32(tb_layout_test_set_flags[LAYOUT_TEST_SET_FLAGS_ID]);
+
+    UBUS_IDL_GET_OPTIONAL(u8, tb_layout_test_set_flags, LAYOUT_TEST_SET_FLAGS_A, params->a, params, FIELD, LAYOUT_TEST_SET_FLAGS_HAS_A);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_layout_test_set_flags, LAYOUT_TEST_SET_FLAGS_B, params->b, params, FIELD, LAYOUT_TEST_SET_FLAGS_HAS_B);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_layout_test_set_flags, LAYOUT_TEST_SET_FLAGS_C, params->c, params, FIELD, LAYOUT_TEST_SET_FLAGS_HAS_C);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_layout_test_set_flags, LAYOUT_TEST_SET_FLAGS_D, params->d, params, FIELD, LAYOUT_TEST_SET_FLAGS_HAS_D);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_layout_test_set_flags, LAYOUT_TEST_SET_FLAGS_E, params->e, params, FIELD, LAYOUT_TEST_SET_FLAGS_HAS_E);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_layout_test_set_flags, LAYOUT_TEST_SET_FLAGS_F, params->f, params, FIELD, LAYOUT_TEST_SET_FLAGS_HAS_F);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_layout_test_set_flags, LAYOUT_TEST_SET_FLAGS_G, params->g, params, FIELD, LAYOUT_TEST_SET_FLAGS_HAS_G);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_layout_test_set_flags, LAYOUT_TEST_SET_FLAGS_H, params->h, params, FIELD, LAYOUT_TEST_SET_FLAGS_HAS_H);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_layout_test_set_flags, LAYOUT_TEST_SET_FLAGS_I, params->i, params, FIELD, LAYOUT_TEST_SET_FLAGS_HAS_I);
+    return UBUS_STATUS_OK;
+}
+
+int layout_test_set_flags_serialize(struct blob_buf *b, const struct layout_test_set_flags_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    if (UBUS_IDL_HAS_FIELD(params, LAYOUT_TEST_SET_FLAGS_HAS_A)) {
+        blobmsg_add_u8(b, "a", params->a ? 1 : 0);
+    }
+    if (UBUS_IDL_HAS_FIELD(params, LAYOUT_TEST_SET_FLAGS_HAS_B)) {
+        blobmsg_add_u8(b, "b", params->b ? 1 : 0);
+    }
+    if (UBUS_IDL_HAS_FIELD(params, LAYOUT_TEST_SET_FLAGS_HAS_C)) {
+        blobmsg_add_u8(b, "c", params->c ? 1 : 0);
+    }
+    if (UBUS_IDL_HAS_FIELD(params, LAYOUT_TEST_SET_FLAGS_HAS_D)) {
+        blobmsg_add_u8(b, "d", params->d ? 1 : 0);
+    }
+    if (UBUS_IDL_HAS_FIELD(params, LAYOUT_TEST_SET_FLAGS_HAS_E)) {
+        blobmsg_add_u8(b, "e", params->e ? 1 : 0);
+    }
+    if (UBUS_IDL_HAS_FIELD(params, LAYOUT_TEST_SET_FLAGS_HAS_F)) {
+        blobmsg_add_u8(b, "f", params->f ? 1 : 0);
+    }
+    if (UBUS_IDL_HAS_FIELD(params, LAYOUT_TEST_SET_FLAGS_HAS_G)) {
+        blobmsg_add_u8(b, "g", params->g ? 1 : 0);
+    }
+    if (UBUS_IDL_HAS_FIELD(params, LAYOUT_TEST_SET_FLAGS_HAS_H)) {
+        blobmsg_add_u8(b, "h", params->h ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "i", params->i, params, FIELD, LAYOUT_TEST_SET_FLAGS_HAS_I);
+    return UBUS_STATUS_OK;
+}
+
+struct layout_test_set_flags_params *layout_test_set_flags_dup(const struct layout_test_set_flags_params *params)
+{
+    size_t len = sizeof(*params);
+    struct layout_test_set_flags_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void layout_test_set_flags_free(struct layout_test_set_flags_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy radio_stats_policy[] = {
+    [RADIO_STATS_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING },
+    [RADIO_STATS_COUNTER00] = { .name = "counter00", .type = BLOBMSG_TYPE_INT32 },
+    [RADIO_STATS_COUNTER01] = { .name = "counter01", .type = BLOBMSG_TYPE_BOOL },
+    [RADIO_STATS_COUNTER02] = { .name = "counter02", .type = BLOBMSG_TYPE_STRING },
+    [RADIO_STATS_COUNTER03] = { .name = "counter03", .type = BLOBMSG_TYPE_INT64 },
+    [RADIO_STATS_COUNTER04] = { .name = "counter04", .type = BLOBMSG_TYPE_INT8 },
+    [RADIO_STATS_COUNTER05] = { .name = "counter05", .type = BLOBMSG_TYPE_DOUBLE },
+    [RADIO_STATS_COUNTER06] = { .name = "counter06", .type = BLOBMSG_TYPE_INT16 },
+    [RADIO_STATS_COUNTER07] = { .name = "counter07", .type = BLOBMSG_TYPE_INT32 },
+    [RADIO_STATS_COUNTER08] = { .name = "counter08", .type = BLOBMSG_TYPE_BOOL },
+    [RADIO_STATS_COUNTER09] = { .name = "counter09", .type = BLOBMSG_TYPE_STRING },
+    [RADIO_STATS_COUNTER10] = { .name = "counter10", .type = BLOBMSG_TYPE_INT64 },
+    [RADIO_STATS_COUNTER11] = { .name = "counter11", .type = BLOBMSG_TYPE_INT8 },
+    [RADIO_STATS_COUNTER12] = { .name = "counter12", .type = BLOBMSG_TYPE_DOUBLE },
+    [RADIO_STATS_COUNTER13] = { .name = "counter13", .type = BLOBMSG_TYPE_INT16 },
+    [RADIO_STATS_COUNTER14] = { .name = "counter14", .type = BLOBMSG_TYPE_INT32 },
+    [RADIO_STATS_COUNTER15] = { .name = "counter15", .type = BLOBMSG_TYPE_BOOL },
+    [RADIO_STATS_COUNTER16] = { .name = "counter16", .type = BLOBMSG_TYPE_STRING },
+    [RADIO_STATS_COUNTER17] = { .name = "counter17", .type = BLOBMSG_TYPE_INT64 },
+    [RADIO_STATS_COUNTER18] = { .name = "counter18", .type = BLOBMSG_TYPE_INT8 },
+    [RADIO_STATS_COUNTER19] = { .name = "counter19", .type = BLOBMSG_TYPE_DOUBLE },
+    [RADIO_STATS_COUNTER20] = { .name = "counter20", .type = BLOBMSG_TYPE_INT16 },
+    [RADIO_STATS_COUNTER21] = { .name = "counter21", .type = BLOBMSG_TYPE_INT32 },
+    [RADIO_STATS_COUNTER22] = { .name = "counter22", .type = BLOBMSG_TYPE_BOOL },
+    [RADIO_STATS_COUNTER23] = { .name = "counter23", .type = BLOBMSG_TYPE_STRING },
+    [RADIO_STATS_COUNTER24] = { .name = "counter24", .type = BLOBMSG_TYPE_INT64 },
+    [RADIO_STATS_COUNTER25] = { .name = "counter25", .type = BLOBMSG_TYPE_INT8 },
+    [RADIO_STATS_COUNTER26] = { .name = "counter26", .type = BLOBMSG_TYPE_DOUBLE },
+    [RADIO_STATS_COUNTER27] = { .name = "counter27", .type = BLOBMSG_TYPE_INT16 },
+    [RADIO_STATS_COUNTER28] = { .name = "counter28", .type = BLOBMSG_TYPE_INT32 },
+    [RADIO_STATS_COUNTER29] = { .name = "counter29", .type = BLOBMSG_TYPE_BOOL },
+    [RADIO_STATS_COUNTER30] = { .name = "counter30", .type = BLOBMSG_TYPE_STRING },
+    [RADIO_STATS_COUNTER31] = { .name = "counter31", .type = BLOBMSG_TYPE_INT64 },
+    [RADIO_STATS_COUNTER32] = { .name = "counter32", .type = BLOBMSG_TYPE_INT8 },
+    [RADIO_STATS_COUNTER33] = { .name = "counter33", .type = BLOBMSG_TYPE_DOUBLE },
+    [RADIO_STATS_COUNTER34] = { .name = "counter34", .type = BLOBMSG_TYPE_INT16 },
+    [RADIO_STATS_COUNTER35] = { .name = "counter35", .type = BLOBMSG_TYPE_INT32 },
+    [RADIO_STATS_COUNTER36] = { .name = "counter36", .type = BLOBMSG_TYPE_BOOL },
+    [RADIO_STATS_COUNTER37] = { .name = "counter37", .type = BLOBMSG_TYPE_STRING },
+    [RADIO_STATS_COUNTER38] = { .name = "counter38", .type = BLOBMSG_TYPE_INT64 },
+    [RADIO_STATS_COUNTER39] = { .name = "counter39", .type = BLOBMSG_TYPE_INT8 },
+    [RADIO_STATS_COUNTER40] = { .name = "counter40", .type = BLOBMSG_TYPE_DOUBLE },
+    [RADIO_STATS_COUNTER41] = { .name = "counter41", .type = BLOBMSG_TYPE_INT16 },
+    [RADIO_STATS_COUNTER42] = { .name = "counter42", .type = BLOBMSG_TYPE_INT32 },
+    [RADIO_STATS_COUNTER43] = { .name = "counter43", .type = BLOBMSG_TYPE_BOOL },
+    [RADIO_STATS_COUNTER44] = { .name = "counter44", .type = BLOBMSG_TYPE_STRING },
+    [RADIO_STATS_COUNTER45] = { .name = "counter45", .type = BLOBMSG_TYPE_INT64 },
+    [RADIO_STATS_COUNTER46] = { .name = "counter46", .type = BLOBMSG_TYPE_INT8 },
+    [RADIO_STATS_COUNTER47] = { .name = "counter47", .type = BLOBMSG_TYPE_DOUBLE },
+    [RADIO_STATS_COUNTER48] = { .name = "counter48", .type = BLOBMSG_TYPE_INT16 },
+    [RADIO_STATS_COUNTER49] = { .name = "counter49", .type = BLOBMSG_TYPE_INT32 },
+    [RADIO_STATS_COUNTER50] = { .name = "counter50", .type = BLOBMSG_TYPE_BOOL },
+    [RADIO_STATS_COUNTER51] = { .name = "counter51", .type = BLOBMSG_TYPE_STRING },
+    [RADIO_STATS_COUNTER52] = { .name = "counter52", .type = BLOBMSG_TYPE_INT64 },
+    [RADIO_STATS_COUNTER53] = { .name = "counter53", .type = BLOBMSG_TYPE_INT8 },
+    [RADIO_STATS_COUNTER54] = { .name = "counter54", .type = BLOBMSG_TYPE_DOUBLE },
+    [RADIO_STATS_COUNTER55] = { .name = "counter55", .type = BLOBMSG_TYPE_INT16 },
+    [RADIO_STATS_COUNTER56] = { .name = "counter56", .type = BLOBMSG_TYPE_INT32 },
+    [RADIO_STATS_COUNTER57] = { .name = "counter57", .type = BLOBMSG_TYPE_BOOL },
+    [RADIO_STATS_COUNTER58] = { .name = "counter58", .type = BLOBMSG_TYPE_STRING },
+    [RADIO_STATS_COUNTER59] = { .name = "counter59", .type = BLOBMSG_TYPE_INT64 },
+    [RADIO_STATS_COUNTER60] = { .name = "counter60", .type = BLOBMSG_TYPE_INT8 },
+    [RADIO_STATS_COUNTER61] = { .name = "counter61", .type = BLOBMSG_TYPE_DOUBLE },
+    [RADIO_STATS_COUNTER62] = { .name = "counter62", .type = BLOBMSG_TYPE_INT16 },
+    [RADIO_STATS_COUNTER63] = { .name = "counter63", .type = BLOBMSG_TYPE_INT32 },
+    [RADIO_STATS_COUNTER64] = { .name = "counter64", .type = BLOBMSG_TYPE_BOOL },
+    [RADIO_STATS_COUNTER65] = { .name = "counter65", .type = BLOBMSG_TYPE_STRING }
+};
+
+int radio_stats_deserialize(struct blob_attr *msg, struct radio_stats *params)
+{
+    struct blob_attr *tb_radio_stats[__RADIO_STATS_MAX];
+    if (blobmsg_parse(radio_stats_policy, ARRAY_SIZE(radio_stats_policy), tb_radio_stats, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_radio_stats[RADIO_STATS_IFNAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields[0] = 0;
+    params->has_fields[1] = 0;
+    params->ifname = blobmsg_get_string(tb_radio_stats[RADIO_STATS_IFNAME]);
+
+    UBUS_IDL_GET_OPTIONAL(u32, tb_radio_stats, RADIO_STATS_COUNTER00, params->counter00, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER00);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER01, params->counter01, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER01);
+    UBUS_IDL_GET_OPTIONAL(string, tb_radio_stats, RADIO_STATS_COUNTER02, params->counter02, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER02);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_radio_stats, RADIO_STATS_COUNTER03, params->counter03, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER03);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER04, params->counter04, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER04);
+    UBUS_IDL_GET_OPTIONAL(double, tb_radio_stats, RADIO_STATS_COUNTER05, params->counter05, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER05);
+    UBUS_IDL_GET_OPTIONAL(u16, tb_radio_stats, RADIO_STATS_COUNTER06, params->counter06, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER06);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_radio_stats, RADIO_STATS_COUNTER07, params->counter07, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER07);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER08, params->counter08, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER08);
+    UBUS_IDL_GET_OPTIONAL(string, tb_radio_stats, RADIO_STATS_COUNTER09, params->counter09, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER09);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_radio_stats, RADIO_STATS_COUNTER10, params->counter10, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER10);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER11, params->counter11, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER11);
+    UBUS_IDL_GET_OPTIONAL(double, tb_radio_stats, RADIO_STATS_COUNTER12, params->counter12, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER12);
+    UBUS_IDL_GET_OPTIONAL(u16, tb_radio_stats, RADIO_STATS_COUNTER13, params->counter13, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER13);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_radio_stats, RADIO_STATS_COUNTER14, params->counter14, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER14);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER15, params->counter15, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER15);
+    UBUS_IDL_GET_OPTIONAL(string, tb_radio_stats, RADIO_STATS_COUNTER16, params->counter16, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER16);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_radio_stats, RADIO_STATS_COUNTER17, params->counter17, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER17);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER18, params->counter18, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER18);
+    UBUS_IDL_GET_OPTIONAL(double, tb_radio_stats, RADIO_STATS_COUNTER19, params->counter19, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER19);
+    UBUS_IDL_GET_OPTIONAL(u16, tb_radio_stats, RADIO_STATS_COUNTER20, params->counter20, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER20);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_radio_stats, RADIO_STATS_COUNTER21, params->counter21, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER21);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER22, params->counter22, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER22);
+    UBUS_IDL_GET_OPTIONAL(string, tb_radio_stats, RADIO_STATS_COUNTER23, params->counter23, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER23);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_radio_stats, RADIO_STATS_COUNTER24, params->counter24, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER24);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER25, params->counter25, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER25);
+    UBUS_IDL_GET_OPTIONAL(double, tb_radio_stats, RADIO_STATS_COUNTER26, params->counter26, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER26);
+    UBUS_IDL_GET_OPTIONAL(u16, tb_radio_stats, RADIO_STATS_COUNTER27, params->counter27, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER27);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_radio_stats, RADIO_STATS_COUNTER28, params->counter28, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER28);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER29, params->counter29, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER29);
+    UBUS_IDL_GET_OPTIONAL(string, tb_radio_stats, RADIO_STATS_COUNTER30, params->counter30, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER30);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_radio_stats, RADIO_STATS_COUNTER31, params->counter31, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER31);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER32, params->counter32, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER32);
+    UBUS_IDL_GET_OPTIONAL(double, tb_radio_stats, RADIO_STATS_COUNTER33, params->counter33, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER33);
+    UBUS_IDL_GET_OPTIONAL(u16, tb_radio_stats, RADIO_STATS_COUNTER34, params->counter34, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER34);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_radio_stats, RADIO_STATS_COUNTER35, params->counter35, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER35);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER36, params->counter36, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER36);
+    UBUS_IDL_GET_OPTIONAL(string, tb_radio_stats, RADIO_STATS_COUNTER37, params->counter37, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER37);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_radio_stats, RADIO_STATS_COUNTER38, params->counter38, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER38);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER39, params->counter39, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER39);
+    UBUS_IDL_GET_OPTIONAL(double, tb_radio_stats, RADIO_STATS_COUNTER40, params->counter40, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER40);
+    UBUS_IDL_GET_OPTIONAL(u16, tb_radio_stats, RADIO_STATS_COUNTER41, params->counter41, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER41);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_radio_stats, RADIO_STATS_COUNTER42, params->counter42, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER42);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER43, params->counter43, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER43);
+    UBUS_IDL_GET_OPTIONAL(string, tb_radio_stats, RADIO_STATS_COUNTER44, params->counter44, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER44);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_radio_stats, RADIO_STATS_COUNTER45, params->counter45, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER45);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER46, params->counter46, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER46);
+    UBUS_IDL_GET_OPTIONAL(double, tb_radio_stats, RADIO_STATS_COUNTER47, params->counter47, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER47);
+    UBUS_IDL_GET_OPTIONAL(u16, tb_radio_stats, RADIO_STATS_COUNTER48, params->counter48, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER48);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_radio_stats, RADIO_STATS_COUNTER49, params->counter49, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER49);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER50, params->counter50, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER50);
+    UBUS_IDL_GET_OPTIONAL(string, tb_radio_stats, RADIO_STATS_COUNTER51, params->counter51, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER51);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_radio_stats, RADIO_STATS_COUNTER52, params->counter52, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER52);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER53, params->counter53, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER53);
+    UBUS_IDL_GET_OPTIONAL(double, tb_radio_stats, RADIO_STATS_COUNTER54, params->counter54, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER54);
+    UBUS_IDL_GET_OPTIONAL(u16, tb_radio_stats, RADIO_STATS_COUNTER55, params->counter55, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER55);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_radio_stats, RADIO_STATS_COUNTER56, params->counter56, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER56);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER57, params->counter57, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER57);
+    UBUS_IDL_GET_OPTIONAL(string, tb_radio_stats, RADIO_STATS_COUNTER58, params->counter58, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER58);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_radio_stats, RADIO_STATS_COUNTER59, params->counter59, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER59);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER60, params->counter60, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER60);
+    UBUS_IDL_GET_OPTIONAL(double, tb_radio_stats, RADIO_STATS_COUNTER61, params->counter61, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER61);
+    UBUS_IDL_GET_OPTIONAL(u16, tb_radio_stats, RADIO_STATS_COUNTER62, params->counter62, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER62);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_radio_stats, RADIO_STATS_COUNTER63, params->counter63, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER63);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_radio_stats, RADIO_STATS_COUNTER64, params->counter64, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER64);
+    UBUS_IDL_GET_OPTIONAL(string, tb_radio_stats, RADIO_STATS_COUNTER65, params->counter65, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER65);
+    return UBUS_STATUS_OK;
+}
+
+int radio_stats_serialize(struct blob_buf *b, const struct radio_stats *params)
+{
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "counter00", params->counter00, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER00);
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER01)) {
+        blobmsg_add_u8(b, "counter01", params->counter01 ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(string, b, "counter02", params->counter02, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER02);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "counter03", params->counter03, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER03);
+    UBUS_IDL_ADD_OPTIONAL(u8, b, "counter04", params->counter04, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER04);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "counter05", params->counter05, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER05);
+    UBUS_IDL_ADD_OPTIONAL(u16, b, "counter06", params->counter06, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER06);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "counter07", params->counter07, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER07);
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER08)) {
+        blobmsg_add_u8(b, "counter08", params->counter08 ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(string, b, "counter09", params->counter09, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER09);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "counter10", params->counter10, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER10);
+    UBUS_IDL_ADD_OPTIONAL(u8, b, "counter11", params->counter11, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER11);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "counter12", params->counter12, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER12);
+    UBUS_IDL_ADD_OPTIONAL(u16, b, "counter13", params->counter13, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER13);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "counter14", params->counter14, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER14);
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER15)) {
+        blobmsg_add_u8(b, "counter15", params->counter15 ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(string, b, "counter16", params->counter16, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER16);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "counter17", params->counter17, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER17);
+    UBUS_IDL_ADD_OPTIONAL(u8, b, "counter18", params->counter18, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER18);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "counter19", params->counter19, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER19);
+    UBUS_IDL_ADD_OPTIONAL(u16, b, "counter20", params->counter20, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER20);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "counter21", params->counter21, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER21);
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER22)) {
+        blobmsg_add_u8(b, "counter22", params->counter22 ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(string, b, "counter23", params->counter23, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER23);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "counter24", params->counter24, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER24);
+    UBUS_IDL_ADD_OPTIONAL(u8, b, "counter25", params->counter25, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER25);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "counter26", params->counter26, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER26);
+    UBUS_IDL_ADD_OPTIONAL(u16, b, "counter27", params->counter27, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER27);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "counter28", params->counter28, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER28);
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER29)) {
+        blobmsg_add_u8(b, "counter29", params->counter29 ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(string, b, "counter30", params->counter30, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER30);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "counter31", params->counter31, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER31);
+    UBUS_IDL_ADD_OPTIONAL(u8, b, "counter32", params->counter32, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER32);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "counter33", params->counter33, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER33);
+    UBUS_IDL_ADD_OPTIONAL(u16, b, "counter34", params->counter34, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER34);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "counter35", params->counter35, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER35);
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER36)) {
+        blobmsg_add_u8(b, "counter36", params->counter36 ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(string, b, "counter37", params->counter37, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER37);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "counter38", params->counter38, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER38);
+    UBUS_IDL_ADD_OPTIONAL(u8, b, "counter39", params->counter39, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER39);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "counter40", params->counter40, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER40);
+    UBUS_IDL_ADD_OPTIONAL(u16, b, "counter41", params->counter41, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER41);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "counter42", params->counter42, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER42);
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER43)) {
+        blobmsg_add_u8(b, "counter43", params->counter43 ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(string, b, "counter44", params->counter44, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER44);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "counter45", params->counter45, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER45);
+    UBUS_IDL_ADD_OPTIONAL(u8, b, "counter46", params->counter46, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER46);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "counter47", params->counter47, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER47);
+    UBUS_IDL_ADD_OPTIONAL(u16, b, "counter48", params->counter48, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER48);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "counter49", params->counter49, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER49);
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER50)) {
+        blobmsg_add_u8(b, "counter50", params->counter50 ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(string, b, "counter51", params->counter51, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER51);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "counter52", params->counter52, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER52);
+    UBUS_IDL_ADD_OPTIONAL(u8, b, "counter53", params->counter53, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER53);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "counter54", params->counter54, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER54);
+    UBUS_IDL_ADD_OPTIONAL(u16, b, "counter55", params->counter55, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER55);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "counter56", params->counter56, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER56);
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER57)) {
+        blobmsg_add_u8(b, "counter57", params->counter57 ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(string, b, "counter58", params->counter58, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER58);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "counter59", params->counter59, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER59);
+    UBUS_IDL_ADD_OPTIONAL(u8, b, "counter60", params->counter60, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER60);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "counter61", params->counter61, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER61);
+    UBUS_IDL_ADD_OPTIONAL(u16, b, "counter62", params->counter62, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER62);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "counter63", params->counter63, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER63);
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER64)) {
+        blobmsg_add_u8(b, "counter64", params->counter64 ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(string, b, "counter65", params->counter65, params, WIDE_FIELD, RADIO_STATS_HAS_COUNTER65);
+    return UBUS_STATUS_OK;
+}
+
+struct radio_stats *radio_stats_dup(const struct radio_stats *params)
+{
+    size_t len = sizeof(*params);
+    struct radio_stats *copy;
+    char *p;
+
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER02) && params->counter02) {
+        len += strlen(params->counter02) + 1;
+    }
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER09) && params->counter09) {
+        len += strlen(params->counter09) + 1;
+    }
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER16) && params->counter16) {
+        len += strlen(params->counter16) + 1;
+    }
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER23) && params->counter23) {
+        len += strlen(params->counter23) + 1;
+    }
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER30) && params->counter30) {
+        len += strlen(params->counter30) + 1;
+    }
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER37) && params->counter37) {
+        len += strlen(params->counter37) + 1;
+    }
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER44) && params->counter44) {
+        len += strlen(params->counter44) + 1;
+    }
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER51) && params->counter51) {
+        len += strlen(params->counter51) + 1;
+    }
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER58) && params->counter58) {
+        len += strlen(params->counter58) + 1;
+    }
+    if (UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER65) && params->counter65) {
+        len += strlen(params->counter65) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    copy->counter02 = UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER02) && params->counter02 ? ubus_idl_dup_string(&p, params->counter02) : NULL;
+    copy->counter09 = UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER09) && params->counter09 ? ubus_idl_dup_string(&p, params->counter09) : NULL;
+    copy->counter16 = UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER16) && params->counter16 ? ubus_idl_dup_string(&p, params->counter16) : NULL;
+    copy->counter23 = UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER23) && params->counter23 ? ubus_idl_dup_string(&p, params->counter23) : NULL;
+    copy->counter30 = UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER30) && params->counter30 ? ubus_idl_dup_string(&p, params->counter30) : NULL;
+    copy->counter37 = UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER37) && params->counter37 ? ubus_idl_dup_string(&p, params->counter37) : NULL;
+    copy->counter44 = UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER44) && params->counter44 ? ubus_idl_dup_string(&p, params->counter44) : NULL;
+    copy->counter51 = UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER51) && params->counter51 ? ubus_idl_dup_string(&p, params->counter51) : NULL;
+    copy->counter58 = UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER58) && params->counter58 ? ubus_idl_dup_string(&p, params->counter58) : NULL;
+    copy->counter65 = UBUS_IDL_HAS_WIDE_FIELD(params, RADIO_STATS_HAS_COUNTER65) && params->counter65 ? ubus_idl_dup_string(&p, params->counter65) : NULL;
+    return copy;
+}
+
+void radio_stats_free(struct radio_stats *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy sample_policy[] = {
+    [SAMPLE_ENABLED] = { .name = "enabled", .type = BLOBMSG_TYPE_BOOL },
+    [SAMPLE_RX_BYTES] = { .name = "rx_bytes", .type = BLOBMSG_TYPE_INT64 },
+    [SAMPLE_CHANNEL] = { .name = "channel", .type = BLOBMSG_TYPE_INT8 },
+    [SAMPLE_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING },
+    [SAMPLE_NOISE] = { .name = "noise", .type = BLOBMSG_TYPE_INT16 },
+    [SAMPLE_BUSY] = { .name = "busy", .type = BLOBMSG_TYPE_BOOL },
+    [SAMPLE_LOAD] = { .name = "load", .type = BLOBMSG_TYPE_DOUBLE }
+};
+
+int sample_deserialize(struct blob_attr *msg, struct sample *params)
+{
+    struct blob_attr *tb_sample[__SAMPLE_MAX];
+    if (blobmsg_parse(sample_policy, ARRAY_SIZE(sample_policy), tb_sample, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_sample[SAMPLE_ENABLED] || !tb_sample[SAMPLE_RX_BYTES] || !tb_sample[SAMPLE_CHANNEL] || !tb_sample[SAMPLE_NAME] || !tb_sample[SAMPLE_NOISE] || !tb_sample[SAMPLE_LOAD]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->enabled = blobmsg_get_u8(tb_sample[SAMPLE_ENABLED]) != 0;
+    params->rx_bytes = blobmsg_get_u64(tb_sample[SAMPLE_RX_BYTES]);
+    params->channel = blobmsg_get_u8(tb_sample[SAMPLE_CHANNEL]);
+    params->name = blobmsg_get_string(tb_sample[SAMPLE_NAME]);
+    params->noise = blobmsg_get_u16(tb_sample[SAMPLE_NOISE]);
+    params->load = blobmsg_get_double(tb_sample[SAMPLE_LOAD]);
+
+    UBUS_IDL_GET_OPTIONAL(u8, tb_sample, SAMPLE_BUSY, params->busy, params, FIELD, SAMPLE_HAS_BUSY);
+    return UBUS_STATUS_OK;
+}
+
+int sample_serialize(struct blob_buf *b, const struct sample *params)
+{
+    UBUS_IDL_ADD(u8, b, "enabled", params->enabled ? 1 : 0);
+    UBUS_IDL_ADD(u64, b, "rx_bytes", params->rx_bytes);
+    UBUS_IDL_ADD(u8, b, "channel", params->channel);
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    UBUS_IDL_ADD(u16, b, "noise", params->noise);
+    if (UBUS_IDL_HAS_FIELD(params, SAMPLE_HAS_BUSY)) {
+        blobmsg_add_u8(b, "busy", params->busy ? 1 : 0);
+    }
+    UBUS_IDL_ADD(double, b, "load", params->load);
+    return UBUS_STATUS_OK;
+}
+
+struct sample *sample_dup(const struct sample *params)
+{
+    size_t len = sizeof(*params);
+    struct sample *copy;
+    char *p;
+
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void sample_free(struct sample *params)
+{
+    free(params);
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf layout_test_reply_buf;
+
+int layout_test_get_sample_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct sample *reply)
+{
+    int ret;
+
+    blob_buf_init(&layout_test_reply_buf, 0);
+    ret = sample_serialize(&layout_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, layout_test_reply_buf.head);
+}
+
+static const struct ubus_method layout_test_methods[] = {
+    UBUS_METHOD("get_sample", layout_test_get_sample_handler, layout_test_get_sample_policy),
+    UBUS_METHOD("set_flags", layout_test_set_flags_handler, layout_test_set_flags_policy),
+    UBUS_METHOD("update", layout_test_update_handler, radio_stats_policy)
+};
+
+static struct ubus_object_type layout_test_object_type =
+    UBUS_OBJECT_TYPE("layout_test", layout_test_methods);
+
+struct ubus_object layout_test_object = {
+    .name = "layout_test",
+    .type = &layout_test_object_type,
+    .methods = layout_test_methods,
+    .n_methods = ARRAY_SIZE(layout_test_methods),
+};
+
+void layout_test_object_cleanup(void)
+{
+    blob_buf_free(&layout_test_reply_buf);
+}
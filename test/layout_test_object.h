@@ -0,0 +1,342 @@
+/* Generated from ubus IDL - layout_test */
+
+#ifndef __LAYOUT_TEST_OBJECT_H__
+#define __LAYOUT_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct sample {
+    int64_t rx_bytes;
+    double load;
+    const char * name;
+    int16_t noise;
+    bool enabled;
+    int8_t channel;
+    bool busy;
+    uint8_t has_fields;
+};
+#define SAMPLE_HAS_BUSY 0
+_Static_assert(sizeof(struct sample) == UBUS_IDL_PACKED_SIZE(struct sample, sizeof(int64_t) + sizeof(double) + sizeof(const char *) + sizeof(int16_t) + 2 * sizeof(bool) + sizeof(int8_t) + sizeof(uint8_t)),
+               "struct sample has padding between members");
+
+struct radio_stats {
+    int64_t counter03;
+    double counter05;
+    int64_t counter10;
+    double counter12;
+    int64_t counter17;
+    double counter19;
+    int64_t counter24;
+    double counter26;
+    int64_t counter31;
+    double counter33;
+    int64_t counter38;
+    double counter40;
+    int64_t counter45;
+    double counter47;
+    int64_t counter52;
+    double counter54;
+    int64_t counter59;
+    double counter61;
+    uint64_t has_fields[2];
+    const char * ifname;
+    const char * counter02;
+    const char * counter09;
+    const char * counter16;
+    const char * counter23;
+    const char * counter30;
+    const char * counter37;
+    const char * counter44;
+    const char * counter51;
+    const char * counter58;
+    const char * counter65;
+    int32_t counter00;
+    int32_t counter07;
+    int32_t counter14;
+    int32_t counter21;
+    int32_t counter28;
+    int32_t counter35;
+    int32_t counter42;
+    int32_t counter49;
+    int32_t counter56;
+    int32_t counter63;
+    int16_t counter06;
+    int16_t counter13;
+    int16_t counter20;
+    int16_t counter27;
+    int16_t counter34;
+    int16_t counter41;
+    int16_t counter48;
+    int16_t counter55;
+    int16_t counter62;
+    bool counter01;
+    int8_t counter04;
+    bool counter08;
+    int8_t counter11;
+    bool counter15;
+    int8_t counter18;
+    bool counter22;
+    int8_t counter25;
+    bool counter29;
+    int8_t counter32;
+    bool counter36;
+    int8_t counter39;
+    bool counter43;
+    int8_t counter46;
+    bool counter50;
+    int8_t counter53;
+    bool counter57;
+    int8_t counter60;
+    bool counter64;
+};
+#define RADIO_STATS_HAS_COUNTER00 0
+#define RADIO_STATS_HAS_COUNTER01 1
+#define RADIO_STATS_HAS_COUNTER02 2
+#define RADIO_STATS_HAS_COUNTER03 3
+#define RADIO_STATS_HAS_COUNTER04 4
+#define RADIO_STATS_HAS_COUNTER05 5
+#define RADIO_STATS_HAS_COUNTER06 6
+#define RADIO_STATS_HAS_COUNTER07 7
+#define RADIO_STATS_HAS_COUNTER08 8
+#define RADIO_STATS_HAS_COUNTER09 9
+#define RADIO_STATS_HAS_COUNTER10 10
+#define RADIO_STATS_HAS_COUNTER11 11
+#define RADIO_STATS_HAS_COUNTER12 12
+#define RADIO_STATS_HAS_COUNTER13 13
+#define RADIO_STATS_HAS_COUNTER14 14
+#define RADIO_STATS_HAS_COUNTER15 15
+#define RADIO_STATS_HAS_COUNTER16 16
+#define RADIO_STATS_HAS_COUNTER17 17
+#define RADIO_STATS_HAS_COUNTER18 18
+#define RADIO_STATS_HAS_COUNTER19 19
+#define RADIO_STATS_HAS_COUNTER20 20
+#define RADIO_STATS_HAS_COUNTER21 21
+#define RADIO_STATS_HAS_COUNTER22 22
+#define RADIO_STATS_HAS_COUNTER23 23
+#define RADIO_STATS_HAS_COUNTER24 24
+#define RADIO_STATS_HAS_COUNTER25 25
+#define RADIO_STATS_HAS_COUNTER26 26
+#define RADIO_STATS_HAS_COUNTER27 27
+#define RADIO_STATS_HAS_COUNTER28 28
+#define RADIO_STATS_HAS_COUNTER29 29
+#define RADIO_STATS_HAS_COUNTER30 30
+#define RADIO_STATS_HAS_COUNTER31 31
+#define RADIO_STATS_HAS_COUNTER32 32
+#define RADIO_STATS_HAS_COUNTER33 33
+#define RADIO_STATS_HAS_COUNTER34 34
+#define RADIO_STATS_HAS_COUNTER35 35
+#define RADIO_STATS_HAS_COUNTER36 36
+#define RADIO_STATS_HAS_COUNTER37 37
+#define RADIO_STATS_HAS_COUNTER38 38
+#define RADIO_STATS_HAS_COUNTER39 39
+#define RADIO_STATS_HAS_COUNTER40 40
+#define RADIO_STATS_HAS_COUNTER41 41
+#define RADIO_STATS_HAS_COUNTER42 42
+#define RADIO_STATS_HAS_COUNTER43 43
+#define RADIO_STATS_HAS_COUNTER44 44
+#define RADIO_STATS_HAS_COUNTER45 45
+#define RADIO_STATS_HAS_COUNTER46 46
+#define RADIO_STATS_HAS_COUNTER47 47
+#define RADIO_STATS_HAS_COUNTER48 48
+#define RADIO_STATS_HAS_COUNTER49 49
+#define RADIO_STATS_HAS_COUNTER50 50
+#define RADIO_STATS_HAS_COUNTER51 51
+#define RADIO_STATS_HAS_COUNTER52 52
+#define RADIO_STATS_HAS_COUNTER53 53
+#define RADIO_STATS_HAS_COUNTER54 54
+#define RADIO_STATS_HAS_COUNTER55 55
+#define RADIO_STATS_HAS_COUNTER56 56
+#define RADIO_STATS_HAS_COUNTER57 57
+#define RADIO_STATS_HAS_COUNTER58 58
+#define RADIO_STATS_HAS_COUNTER59 59
+#define RADIO_STATS_HAS_COUNTER60 60
+#define RADIO_STATS_HAS_COUNTER61 61
+#define RADIO_STATS_HAS_COUNTER62 62
+#define RADIO_STATS_HAS_COUNTER63 63
+#define RADIO_STATS_HAS_COUNTER64 64
+#define RADIO_STATS_HAS_COUNTER65 65
+_Static_assert(sizeof(struct radio_stats) == UBUS_IDL_PACKED_SIZE(struct radio_stats, 9 * sizeof(int64_t) + 9 * sizeof(double) + 2 * sizeof(uint64_t) + 11 * sizeof(const char *) + 10 * sizeof(int32_t) + 9 * sizeof(int16_t) + 10 * sizeof(bool) + 9 * sizeof(int8_t)),
+               "struct radio_stats has padding between members");
+
+struct layout_test_get_sample_params {
+    const char * name;
+};
+_Static_assert(sizeof(struct layout_test_get_sample_params) == UBUS_IDL_PACKED_SIZE(struct layout_test_get_sample_params, sizeof(const char *)),
+               "struct layout_test_get_sample_params has padding between members");
+
+struct layout_test_set_flags_params {
+    int64_t i;
+    int32_t id;
+    uint16_t has_fields;
+    bool a;
+    bool b;
+    bool c;
+    bool d;
+    bool e;
+    bool f;
+    bool g;
+    bool h;
+};
+#define LAYOUT_TEST_SET_FLAGS_HAS_A 0
+#define LAYOUT_TEST_SET_FLAGS_HAS_B 1
+#define LAYOUT_TEST_SET_FLAGS_HAS_C 2
+#define LAYOUT_TEST_SET_FLAGS_HAS_D 3
+#define LAYOUT_TEST_SET_FLAGS_HAS_E 4
+#define LAYOUT_TEST_SET_FLAGS_HAS_F 5
+#define LAYOUT_TEST_SET_FLAGS_HAS_G 6
+#define LAYOUT_TEST_SET_FLAGS_HAS_H 7
+#define LAYOUT_TEST_SET_FLAGS_HAS_I 8
+_Static_assert(sizeof(struct layout_test_set_flags_params) == UBUS_IDL_PACKED_SIZE(struct layout_test_set_flags_params, sizeof(int64_t) + sizeof(int32_t) + sizeof(uint16_t) + 8 * sizeof(bool)),
+               "struct layout_test_set_flags_params has padding between members");
+
+enum {
+    LAYOUT_TEST_GET_SAMPLE_NAME,
+    __LAYOUT_TEST_GET_SAMPLE_MAX
+};
+
+enum {
+    LAYOUT_TEST_SET_FLAGS_ID,
+    LAYOUT_TEST_SET_FLAGS_A,
+    LAYOUT_TEST_SET_FLAGS_B,
+    LAYOUT_TEST_SET_FLAGS_C,
+    LAYOUT_TEST_SET_FLAGS_D,
+    LAYOUT_TEST_SET_FLAGS_E,
+    LAYOUT_TEST_SET_FLAGS_F,
+    LAYOUT_TEST_SET_FLAGS_G,
+    LAYOUT_TEST_SET_FLAGS_H,
+    LAYOUT_TEST_SET_FLAGS_I,
+    __LAYOUT_TEST_SET_FLAGS_MAX
+};
+
+enum {
+    RADIO_STATS_IFNAME,
+    RADIO_STATS_COUNTER00,
+    RADIO_STATS_COUNTER01,
+    RADIO_STATS_COUNTER02,
+    RADIO_STATS_COUNTER03,
+    RADIO_STATS_COUNTER04,
+    RADIO_STATS_COUNTER05,
+    RADIO_STATS_COUNTER06,
+    RADIO_STATS_COUNTER07,
+    RADIO_STATS_COUNTER08,
+    RADIO_STATS_COUNTER09,
+    RADIO_STATS_COUNTER10,
+    RADIO_STATS_COUNTER11,
+    RADIO_STATS_COUNTER12,
+    RADIO_STATS_COUNTER13,
+    RADIO_STATS_COUNTER14,
+    RADIO_STATS_COUNTER15,
+    RADIO_STATS_COUNTER16,
+    RADIO_STATS_COUNTER17,
+    RADIO_STATS_COUNTER18,
+    RADIO_STATS_COUNTER19,
+    RADIO_STATS_COUNTER20,
+    RADIO_STATS_COUNTER21,
+    RADIO_STATS_COUNTER22,
+    RADIO_STATS_COUNTER23,
+    RADIO_STATS_COUNTER24,
+    RADIO_STATS_COUNTER25,
+    RADIO_STATS_COUNTER26,
+    RADIO_STATS_COUNTER27,
+    RADIO_STATS_COUNTER28,
+    RADIO_STATS_COUNTER29,
+    RADIO_STATS_COUNTER30,
+    RADIO_STATS_COUNTER31,
+    RADIO_STATS_COUNTER32,
+    RADIO_STATS_COUNTER33,
+    RADIO_STATS_COUNTER34,
+    RADIO_STATS_COUNTER35,
+    RADIO_STATS_COUNTER36,
+    RADIO_STATS_COUNTER37,
+    RADIO_STATS_COUNTER38,
+    RADIO_STATS_COUNTER39,
+    RADIO_STATS_COUNTER40,
+    RADIO_STATS_COUNTER41,
+    RADIO_STATS_COUNTER42,
+    RADIO_STATS_COUNTER43,
+    RADIO_STATS_COUNTER44,
+    RADIO_STATS_COUNTER45,
+    RADIO_STATS_COUNTER46,
+    RADIO_STATS_COUNTER47,
+    RADIO_STATS_COUNTER48,
+    RADIO_STATS_COUNTER49,
+    RADIO_STATS_COUNTER50,
+    RADIO_STATS_COUNTER51,
+    RADIO_STATS_COUNTER52,
+    RADIO_STATS_COUNTER53,
+    RADIO_STATS_COUNTER54,
+    RADIO_STATS_COUNTER55,
+    RADIO_STATS_COUNTER56,
+    RADIO_STATS_COUNTER57,
+    RADIO_STATS_COUNTER58,
+    RADIO_STATS_COUNTER59,
+    RADIO_STATS_COUNTER60,
+    RADIO_STATS_COUNTER61,
+    RADIO_STATS_COUNTER62,
+    RADIO_STATS_COUNTER63,
+    RADIO_STATS_COUNTER64,
+    RADIO_STATS_COUNTER65,
+    __RADIO_STATS_MAX
+};
+
+enum {
+    SAMPLE_ENABLED,
+    SAMPLE_RX_BYTES,
+    SAMPLE_CHANNEL,
+    SAMPLE_NAME,
+    SAMPLE_NOISE,
+    SAMPLE_BUSY,
+    SAMPLE_LOAD,
+    __SAMPLE_MAX
+};
+
+int layout_test_get_sample_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int layout_test_set_flags_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int layout_test_update_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+int layout_test_get_sample_deserialize(struct blob_attr *msg, struct layout_test_get_sample_params *params);
+int layout_test_get_sample_serialize(struct blob_buf *b, const struct layout_test_get_sample_params *params);
+int layout_test_set_flags_deserialize(struct blob_attr *msg, struct layout_test_set_flags_params *params);
+int layout_test_set_flags_serialize(struct blob_buf *b, const struct layout_test_set_flags_params *params);
+int radio_stats_deserialize(struct blob_attr *msg, struct radio_stats *params);
+int radio_stats_serialize(struct blob_buf *b, const struct radio_stats *params);
+int sample_deserialize(struct blob_attr *msg, struct sample *params);
+int sample_serialize(struct blob_buf *b, const struct sample *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct layout_test_get_sample_params *layout_test_get_sample_dup(const struct layout_test_get_sample_params *params);
+void layout_test_get_sample_free(struct layout_test_get_sample_params *params);
+struct layout_test_set_flags_params *layout_test_set_flags_dup(const struct layout_test_set_flags_params *params);
+void layout_test_set_flags_free(struct layout_test_set_flags_params *params);
+struct radio_stats *radio_stats_dup(const struct radio_stats *params);
+void radio_stats_free(struct radio_stats *params);
+struct sample *sample_dup(const struct sample *params);
+void sample_free(struct sample *params);
+
+int layout_test_get_sample_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct sample *reply);
+
+extern struct ubus_object layout_test_object;
+
+void layout_test_object_cleanup(void);
+
+#endif /* __LAYOUT_TEST_OBJECT_H__ */
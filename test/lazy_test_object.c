@@ -0,0 +1,471 @@
+/* Generated from ubus IDL - lazy_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "lazy_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Locate a single attribute on first access and cache its tb slot */
+static struct blob_attr *ubus_idl_view_locate(struct blob_attr *msg, const struct blobmsg_policy *policy,
+                                              struct blob_attr **tb, uint32_t *located, int index)
+{
+    struct blob_attr *cur;
+    size_t rem;
+
+    if (located[index / 32] & (1U << (index % 32))) {
+        return tb[index];
+    }
+
+    located[index / 32] |= 1U << (index % 32);
+    tb[index] = NULL;
+    if (!msg) {
+        return NULL;
+    }
+
+    blob_for_each_attr(cur, msg, rem) {
+        if (policy[index].type != BLOBMSG_TYPE_UNSPEC && blob_id(cur) != policy[index].type) {
+            continue;
+        }
+        if (!blobmsg_check_attr(cur, true) || strcmp(blobmsg_name(cur), policy[index].name) != 0) {
+            continue;
+        }
+        // No break: the last attribute of a name wins, as in blobmsg_parse()
+        tb[index] = cur;
+    }
+
+    return tb[index];
+}
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+/* Copy a blob to the cursor of a *_dup() allocation, blobs go first after the struct to stay aligned */
+static struct blob_attr *ubus_idl_dup_blob(char **p, const struct blob_attr *attr)
+{
+    struct blob_attr *copy = (struct blob_attr *)*p;
+
+    memcpy(copy, attr, blob_pad_len(attr));
+    *p += blob_pad_len(attr);
+    return copy;
+}
+
+static const struct blobmsg_policy lazy_test_set_policy[] = {
+    [LAZY_TEST_SET_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+    [LAZY_TEST_SET_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING },
+    [LAZY_TEST_SET_WEIGHT] = { .name = "weight", .type = BLOBMSG_TYPE_DOUBLE }
+};
+
+int lazy_test_set_deserialize(struct blob_attr *msg, struct lazy_test_set_params *params)
+{
+    struct blob_attr *tb_lazy_test_set[__LAZY_TEST_SET_MAX];
+    if (blobmsg_parse(lazy_test_set_policy, ARRAY_SIZE(lazy_test_set_policy), tb_lazy_test_set, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_lazy_test_set[LAZY_TEST_SET_ID]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->id = blobmsg_get_u32(tb_lazy_test_set[LAZY_TEST_SET_ID]);
+
+    UBUS_IDL_GET_OPTIONAL(string, tb_lazy_test_set, LAZY_TEST_SET_NAME, params->name, params, FIELD, LAZY_TEST_SET_HAS_NAME);
+    UBUS_IDL_GET_OPTIONAL(double, tb_lazy_test_set, LAZY_TEST_SET_WEIGHT, params->weight, params, FIELD, LAZY_TEST_SET_HAS_WEIGHT);
+    return UBUS_STATUS_OK;
+}
+
+int lazy_test_set_serialize(struct blob_buf *b, const struct lazy_test_set_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "name", params->name, params, FIELD, LAZY_TEST_SET_HAS_NAME);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "weight", params->weight, params, FIELD, LAZY_TEST_SET_HAS_WEIGHT);
+    return UBUS_STATUS_OK;
+}
+
+struct lazy_test_set_params *lazy_test_set_dup(const struct lazy_test_set_params *params)
+{
+    size_t len = sizeof(*params);
+    struct lazy_test_set_params *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, LAZY_TEST_SET_HAS_NAME) && params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->name = UBUS_IDL_HAS_FIELD(params, LAZY_TEST_SET_HAS_NAME) && params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void lazy_test_set_free(struct lazy_test_set_params *params)
+{
+    free(params);
+}
+
+void lazy_test_set_view_init(struct lazy_test_set_view *view, struct blob_attr *msg)
+{
+    view->msg = msg;
+    memset(view->located, 0, sizeof(view->located));
+}
+
+int lazy_test_set_get_id(struct lazy_test_set_view *view, int32_t *out)
+{
+    struct blob_attr *attr = ubus_idl_view_locate(view->msg, lazy_test_set_policy, view->tb, view->located, LAZY_TEST_SET_ID);
+
+    if (!attr) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *out = blobmsg_get_u32(attr);
+    return UBUS_STATUS_OK;
+}
+
+int lazy_test_set_get_name(struct lazy_test_set_view *view, const char **out)
+{
+    struct blob_attr *attr = ubus_idl_view_locate(view->msg, lazy_test_set_policy, view->tb, view->located, LAZY_TEST_SET_NAME);
+
+    if (!attr) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    *out = blobmsg_get_string(attr);
+    return UBUS_STATUS_OK;
+}
+
+int lazy_test_set_get_weight(struct lazy_test_set_view *view, double *out)
+{
+    struct blob_attr *attr = ubus_idl_view_locate(view->msg, lazy_test_set_policy, view->tb, view->located, LAZY_TEST_SET_WEIGHT);
+
+    if (!attr) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    *out = blobmsg_get_double(attr);
+    return UBUS_STATUS_OK;
+}
+
+static const struct blobmsg_policy lazy_config_policy[] = {
+    [LAZY_CONFIG_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING },
+    [LAZY_CONFIG_ENABLED] = { .name = "enabled", .type = BLOBMSG_TYPE_BOOL },
+    [LAZY_CONFIG_MTU] = { .name = "mtu", .type = BLOBMSG_TYPE_INT32 },
+    [LAZY_CONFIG_OPTIONS] = { .name = "options", .type = BLOBMSG_TYPE_ARRAY }
+};
+
+int lazy_config_deserialize(struct blob_attr *msg, struct lazy_config *params)
+{
+    struct blob_attr *tb_lazy_config[__LAZY_CONFIG_MAX];
+    if (blobmsg_parse(lazy_config_policy, ARRAY_SIZE(lazy_config_policy), tb_lazy_config, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_lazy_config[LAZY_CONFIG_NAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->name = blobmsg_get_string(tb_lazy_config[LAZY_CONFIG_NAME]);
+
+    UBUS_IDL_GET_OPTIONAL(u8, tb_lazy_config, LAZY_CONFIG_ENABLED, params->enabled, params, FIELD, LAZY_CONFIG_HAS_ENABLED);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_lazy_config, LAZY_CONFIG_MTU, params->mtu, params, FIELD, LAZY_CONFIG_HAS_MTU);
+    if (tb_lazy_config[LAZY_CONFIG_OPTIONS]) {
+        params->options = tb_lazy_config[LAZY_CONFIG_OPTIONS];
+        UBUS_IDL_SET_FIELD(params, LAZY_CONFIG_HAS_OPTIONS);
+    }
+    return UBUS_STATUS_OK;
+}
+
+int lazy_config_serialize(struct blob_buf *b, const struct lazy_config *params)
+{
+    int ret;
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    if (UBUS_IDL_HAS_FIELD(params, LAZY_CONFIG_HAS_ENABLED)) {
+        blobmsg_add_u8(b, "enabled", params->enabled ? 1 : 0);
+    }
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "mtu", params->mtu, params, FIELD, LAZY_CONFIG_HAS_MTU);
+    if (UBUS_IDL_HAS_FIELD(params, LAZY_CONFIG_HAS_OPTIONS)) {
+        blobmsg_add_field(b, BLOBMSG_TYPE_ARRAY, "options", blob_data(params->options), blob_len(params->options));
+    }
+    return UBUS_STATUS_OK;
+}
+
+struct lazy_config *lazy_config_dup(const struct lazy_config *params)
+{
+    size_t len = sizeof(*params);
+    struct lazy_config *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, LAZY_CONFIG_HAS_OPTIONS) && params->options) {
+        len += blob_pad_len(params->options);
+    }
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->options = UBUS_IDL_HAS_FIELD(params, LAZY_CONFIG_HAS_OPTIONS) && params->options ? ubus_idl_dup_blob(&p, params->options) : NULL;
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void lazy_config_free(struct lazy_config *params)
+{
+    free(params);
+}
+
+void lazy_config_view_init(struct lazy_config_view *view, struct blob_attr *msg)
+{
+    view->msg = msg;
+    memset(view->located, 0, sizeof(view->located));
+}
+
+int lazy_config_get_name(struct lazy_config_view *view, const char **out)
+{
+    struct blob_attr *attr = ubus_idl_view_locate(view->msg, lazy_config_policy, view->tb, view->located, LAZY_CONFIG_NAME);
+
+    if (!attr) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *out = blobmsg_get_string(attr);
+    return UBUS_STATUS_OK;
+}
+
+int lazy_config_get_enabled(struct lazy_config_view *view, bool *out)
+{
+    struct blob_attr *attr = ubus_idl_view_locate(view->msg, lazy_config_policy, view->tb, view->located, LAZY_CONFIG_ENABLED);
+
+    if (!attr) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    *out = blobmsg_get_u8(attr) != 0;
+    return UBUS_STATUS_OK;
+}
+
+int lazy_config_get_mtu(struct lazy_config_view *view, int32_t *out)
+{
+    struct blob_attr *attr = ubus_idl_view_locate(view->msg, lazy_config_policy, view->tb, view->located, LAZY_CONFIG_MTU);
+
+    if (!attr) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    *out = blobmsg_get_u32(attr);
+    return UBUS_STATUS_OK;
+}
+
+int lazy_config_get_options(struct lazy_config_view *view, struct blob_attr **out)
+{
+    struct blob_attr *attr = ubus_idl_view_locate(view->msg, lazy_config_policy, view->tb, view->located, LAZY_CONFIG_OPTIONS);
+
+    if (!attr) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    *out = attr;
+    return UBUS_STATUS_OK;
+}
+
+static const struct blobmsg_policy lazy_test_get_policy[] = {
+    [LAZY_TEST_GET_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int lazy_test_get_deserialize(struct blob_attr *msg, struct lazy_test_get_params *params)
+{
+    struct blob_attr *tb_lazy_test_get[__LAZY_TEST_GET_MAX];
+    if (blobmsg_parse(lazy_test_get_policy, ARRAY_SIZE(lazy_test_get_policy), tb_lazy_test_get, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_lazy_test_get[LAZY_TEST_GET_ID]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->id = blobmsg_get_u32(tb_lazy_test_get[LAZY_TEST_GET_ID]);
+    return UBUS_STATUS_OK;
+}
+
+int lazy_test_get_serialize(struct blob_buf *b, const struct lazy_test_get_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    return UBUS_STATUS_OK;
+}
+
+struct lazy_test_get_params *lazy_test_get_dup(const struct lazy_test_get_params *params)
+{
+    size_t len = sizeof(*params);
+    struct lazy_test_get_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void lazy_test_get_free(struct lazy_test_get_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy lazy_test_route_policy[] = {
+    [LAZY_TEST_ROUTE_DEST] = { .name = "dest", .type = BLOBMSG_TYPE_STRING },
+    [LAZY_TEST_ROUTE_GATEWAY] = { .name = "gateway", .type = BLOBMSG_TYPE_TABLE }
+};
+
+int lazy_test_route_deserialize(struct blob_attr *msg, struct lazy_test_route_params *params)
+{
+    struct blob_attr *tb_lazy_test_route[__LAZY_TEST_ROUTE_MAX];
+    if (blobmsg_parse(lazy_test_route_policy, ARRAY_SIZE(lazy_test_route_policy), tb_lazy_test_route, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_lazy_test_route[LAZY_TEST_ROUTE_DEST]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->dest = blobmsg_get_string(tb_lazy_test_route[LAZY_TEST_ROUTE_DEST]);
+
+    // TODO: Handle custom type gateway
+    return UBUS_STATUS_OK;
+}
+
+int lazy_test_route_serialize(struct blob_buf *b, const struct lazy_test_route_params *params)
+{
+    UBUS_IDL_ADD(string, b, "dest", params->dest);
+    // TODO: Handle custom type gateway
+    return UBUS_STATUS_OK;
+}
+
+struct lazy_test_route_params *lazy_test_route_dup(const struct lazy_test_route_params *params)
+{
+    size_t len = sizeof(*params);
+    struct lazy_test_route_params *copy;
+    char *p;
+
+    if (params->dest) {
+        len += strlen(params->dest) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->dest = params->dest ? ubus_idl_dup_string(&p, params->dest) : NULL;
+    copy->gateway = NULL;
+    return copy;
+}
+
+void lazy_test_route_free(struct lazy_test_route_params *params)
+{
+    free(params);
+}
+
+void lazy_test_route_view_init(struct lazy_test_route_view *view, struct blob_attr *msg)
+{
+    view->msg = msg;
+    memset(view->located, 0, sizeof(view->located));
+}
+
+int lazy_test_route_get_dest(struct lazy_test_route_view *view, const char **out)
+{
+    struct blob_attr *attr = ubus_idl_view_locate(view->msg, lazy_test_route_policy, view->tb, view->located, LAZY_TEST_ROUTE_DEST);
+
+    if (!attr) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    *out = blobmsg_get_string(attr);
+    return UBUS_STATUS_OK;
+}
+
+int lazy_test_route_get_gateway(struct lazy_test_route_view *view, struct blob_attr **out)
+{
+    struct blob_attr *attr = ubus_idl_view_locate(view->msg, lazy_test_route_policy, view->tb, view->located, LAZY_TEST_ROUTE_GATEWAY);
+
+    if (!attr) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    *out = attr;
+    return UBUS_STATUS_OK;
+}
+
+static int lazy_test_apply_thunk(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct lazy_config_view view;
+
+    lazy_config_view_init(&view, msg);
+    return apply_handler(ctx, obj, req, LAZY_TEST_METHOD_APPLY, &view);
+}
+
+static const struct ubus_method lazy_test_methods[] = {
+    UBUS_METHOD("set", lazy_test_set_handler, lazy_test_set_policy),
+    UBUS_METHOD("configure", lazy_test_configure_handler, lazy_config_policy),
+    UBUS_METHOD("apply", lazy_test_apply_thunk, lazy_config_policy),
+    UBUS_METHOD("get", lazy_test_get_handler, lazy_test_get_policy),
+    UBUS_METHOD("route", lazy_test_route_handler, lazy_test_route_policy)
+};
+
+static struct ubus_object_type lazy_test_object_type =
+    UBUS_OBJECT_TYPE("lazy_test", lazy_test_methods);
+
+struct ubus_object lazy_test_object = {
+    .name = "lazy_test",
+    .type = &lazy_test_object_type,
+    .methods = lazy_test_methods,
+    .n_methods = ARRAY_SIZE(lazy_test_methods),
+};
@@ -0,0 +1,161 @@
+/* Generated from ubus IDL - lazy_test */
+
+#ifndef __LAZY_TEST_OBJECT_H__
+#define __LAZY_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct lazy_config {
+    const char * name;
+    struct blob_attr * options;
+    int32_t mtu;
+    bool enabled;
+    uint8_t has_fields;
+};
+#define LAZY_CONFIG_HAS_ENABLED 0
+#define LAZY_CONFIG_HAS_MTU 1
+#define LAZY_CONFIG_HAS_OPTIONS 2
+_Static_assert(sizeof(struct lazy_config) == UBUS_IDL_PACKED_SIZE(struct lazy_config, sizeof(const char *) + sizeof(struct blob_attr *) + sizeof(int32_t) + sizeof(bool) + sizeof(uint8_t)),
+               "struct lazy_config has padding between members");
+
+struct lazy_test_set_params {
+    double weight;
+    const char * name;
+    int32_t id;
+    uint8_t has_fields;
+};
+#define LAZY_TEST_SET_HAS_NAME 0
+#define LAZY_TEST_SET_HAS_WEIGHT 1
+_Static_assert(sizeof(struct lazy_test_set_params) == UBUS_IDL_PACKED_SIZE(struct lazy_test_set_params, sizeof(double) + sizeof(const char *) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct lazy_test_set_params has padding between members");
+
+struct lazy_test_get_params {
+    int32_t id;
+};
+_Static_assert(sizeof(struct lazy_test_get_params) == UBUS_IDL_PACKED_SIZE(struct lazy_test_get_params, sizeof(int32_t)),
+               "struct lazy_test_get_params has padding between members");
+
+struct lazy_test_route_params {
+    const char * dest;
+    struct gateway * gateway;
+    uint8_t has_fields;
+};
+#define LAZY_TEST_ROUTE_HAS_GATEWAY 0
+_Static_assert(sizeof(struct lazy_test_route_params) == UBUS_IDL_PACKED_SIZE(struct lazy_test_route_params, sizeof(const char *) + sizeof(struct gateway *) + sizeof(uint8_t)),
+               "struct lazy_test_route_params has padding between members");
+
+enum {
+    LAZY_TEST_SET_ID,
+    LAZY_TEST_SET_NAME,
+    LAZY_TEST_SET_WEIGHT,
+    __LAZY_TEST_SET_MAX
+};
+
+enum {
+    LAZY_CONFIG_NAME,
+    LAZY_CONFIG_ENABLED,
+    LAZY_CONFIG_MTU,
+    LAZY_CONFIG_OPTIONS,
+    __LAZY_CONFIG_MAX
+};
+
+enum {
+    LAZY_TEST_GET_ID,
+    __LAZY_TEST_GET_MAX
+};
+
+enum {
+    LAZY_TEST_ROUTE_DEST,
+    LAZY_TEST_ROUTE_GATEWAY,
+    __LAZY_TEST_ROUTE_MAX
+};
+
+struct lazy_test_set_view {
+    struct blob_attr *msg;
+    struct blob_attr *tb[__LAZY_TEST_SET_MAX];
+    uint32_t located[(__LAZY_TEST_SET_MAX + 31) / 32];
+};
+
+struct lazy_config_view {
+    struct blob_attr *msg;
+    struct blob_attr *tb[__LAZY_CONFIG_MAX];
+    uint32_t located[(__LAZY_CONFIG_MAX + 31) / 32];
+};
+
+struct lazy_test_route_view {
+    struct blob_attr *msg;
+    struct blob_attr *tb[__LAZY_TEST_ROUTE_MAX];
+    uint32_t located[(__LAZY_TEST_ROUTE_MAX + 31) / 32];
+};
+
+enum lazy_test_method {
+    LAZY_TEST_METHOD_SET,
+    LAZY_TEST_METHOD_CONFIGURE,
+    LAZY_TEST_METHOD_APPLY,
+    LAZY_TEST_METHOD_GET,
+    LAZY_TEST_METHOD_ROUTE,
+    __LAZY_TEST_METHOD_MAX
+};
+
+int lazy_test_set_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int lazy_test_configure_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int lazy_test_get_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int lazy_test_route_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+/* Custom handlers, called by a generated thunk with the method and its decoded params */
+int apply_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, enum lazy_test_method method, struct lazy_config_view *view);
+
+int lazy_test_set_deserialize(struct blob_attr *msg, struct lazy_test_set_params *params);
+int lazy_test_set_serialize(struct blob_buf *b, const struct lazy_test_set_params *params);
+int lazy_config_deserialize(struct blob_attr *msg, struct lazy_config *params);
+int lazy_config_serialize(struct blob_buf *b, const struct lazy_config *params);
+int lazy_test_get_deserialize(struct blob_attr *msg, struct lazy_test_get_params *params);
+int lazy_test_get_serialize(struct blob_buf *b, const struct lazy_test_get_params *params);
+int lazy_test_route_deserialize(struct blob_attr *msg, struct lazy_test_route_params *params);
+int lazy_test_route_serialize(struct blob_buf *b, const struct lazy_test_route_params *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct lazy_test_set_params *lazy_test_set_dup(const struct lazy_test_set_params *params);
+void lazy_test_set_free(struct lazy_test_set_params *params);
+struct lazy_config *lazy_config_dup(const struct lazy_config *params);
+void lazy_config_free(struct lazy_config *params);
+struct lazy_test_get_params *lazy_test_get_dup(const struct lazy_test_get_params *params);
+void lazy_test_get_free(struct lazy_test_get_params *params);
+struct lazy_test_route_params *lazy_test_route_dup(const struct lazy_test_route_params *params);
+void lazy_test_route_free(struct lazy_test_route_params *params);
+
+void lazy_test_set_view_init(struct lazy_test_set_view *view, struct blob_attr *msg);
+int lazy_test_set_get_id(struct lazy_test_set_view *view, int32_t *out);
+int lazy_test_set_get_name(struct lazy_test_set_view *view, const char **out);
+int lazy_test_set_get_weight(struct lazy_test_set_view *view, double *out);
+void lazy_config_view_init(struct lazy_config_view *view, struct blob_attr *msg);
+int lazy_config_get_name(struct lazy_config_view *view, const char **out);
+int lazy_config_get_enabled(struct lazy_config_view *view, bool *out);
+int lazy_config_get_mtu(struct lazy_config_view *view, int32_t *out);
+int lazy_config_get_options(struct lazy_config_view *view, struct blob_attr **out);
+void lazy_test_route_view_init(struct lazy_test_route_view *view, struct blob_attr *msg);
+int lazy_test_route_get_dest(struct lazy_test_route_view *view, const char **out);
+int lazy_test_route_get_gateway(struct lazy_test_route_view *view, struct blob_attr **out);
+
+extern struct ubus_object lazy_test_object;
+
+#endif /* __LAZY_TEST_OBJECT_H__ */
@@ -0,0 +1,916 @@
+/* Generated from ubus IDL - metrics_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <pthread.h>
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <sys/eventfd.h>
+#include <time.h>
+#include <unistd.h>
+#include "metrics_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+static const char *const metrics_test_method_names[] = {
+    [METRICS_TEST_METHOD_GET] = "get",
+    [METRICS_TEST_METHOD_PUT] = "put",
+    [METRICS_TEST_METHOD_PING] = "ping",
+    [METRICS_TEST_METHOD_REFRESH] = "refresh",
+    [METRICS_TEST_METHOD_COMPACT] = "compact",
+};
+
+static uint64_t metrics_test_now_us(clockid_t clock)
+{
+    struct timespec ts;
+
+    clock_gettime(clock, &ts);
+    return (uint64_t)ts.tv_sec * 1000000 + ts.tv_nsec / 1000;
+}
+
+/* Latency histogram bucket upper bounds in microseconds, the last bucket is open */
+static const uint64_t metrics_test_latency_bounds[] = { 10, 100, 1000, 10000, 100000, 1000000 };
+
+/* Per-method counters, only touched from the uloop thread */
+struct metrics_test_method_stats {
+    uint64_t calls;
+    uint64_t decode_errors;
+    uint64_t total_us;
+    uint64_t max_us;
+    uint64_t status[__UBUS_STATUS_LAST + 1];
+    uint64_t latency[ARRAY_SIZE(metrics_test_latency_bounds) + 1];
+};
+
+static struct metrics_test_method_stats metrics_test_stats[__METRICS_TEST_METHOD_MAX];
+static int metrics_test_stats_current = -1;
+
+/* Called by the deserializers, charged to the method being dispatched */
+static int metrics_test_metrics_decode_failed(void)
+{
+    if (metrics_test_stats_current >= 0) {
+        metrics_test_stats[metrics_test_stats_current].decode_errors++;
+    }
+
+    return UBUS_STATUS_INVALID_ARGUMENT;
+}
+
+static void metrics_test_metrics_record(int index, int status, uint64_t elapsed_us)
+{
+    struct metrics_test_method_stats *st = &metrics_test_stats[index];
+    size_t bucket = 0;
+
+    st->calls++;
+    st->total_us += elapsed_us;
+    if (elapsed_us > st->max_us) {
+        st->max_us = elapsed_us;
+    }
+
+    // Unknown status codes share the last slot
+    if (status >= 0 && status < __UBUS_STATUS_LAST) {
+        st->status[status]++;
+    } else {
+        st->status[__UBUS_STATUS_LAST]++;
+    }
+
+    while (bucket < ARRAY_SIZE(metrics_test_latency_bounds) && elapsed_us > metrics_test_latency_bounds[bucket]) {
+        bucket++;
+    }
+    st->latency[bucket]++;
+}
+
+/* Start of the call being dispatched, kept by a deferred call until it is answered */
+static uint64_t metrics_test_dispatch_start;
+
+/* Record a deferred call once answered, with the status sent to the caller */
+static void metrics_test_record_deferred(int index, int status, struct blob_attr *msg, uint64_t start_us)
+{
+    uint64_t elapsed = metrics_test_now_us(CLOCK_MONOTONIC) - start_us;
+
+    metrics_test_metrics_record(index, status, elapsed);
+    (void)msg;
+}
+
+/* Run a handler and record the call, a deferred call is recorded when it is answered instead */
+static int metrics_test_dispatch_call(int index, ubus_handler_t handler, bool deferrable, uint64_t start,
+                             struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req,
+                             const char *method, struct blob_attr *msg)
+{
+    uint64_t elapsed;
+    int ret;
+
+    metrics_test_stats_current = index;
+    metrics_test_dispatch_start = start;
+    ret = handler(ctx, obj, req, method, msg);
+    metrics_test_stats_current = -1;
+    elapsed = metrics_test_now_us(CLOCK_MONOTONIC) - start;
+
+    if (deferrable && req->deferred) {
+        return ret;
+    }
+
+    metrics_test_metrics_record(index, ret, elapsed);
+
+    return ret;
+}
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy metrics_test_get_policy[] = {
+    [METRICS_TEST_GET_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int metrics_test_get_deserialize(struct blob_attr *msg, struct metrics_test_get_params *params)
+{
+    struct blob_attr *tb_metrics_test_get[__METRICS_TEST_GET_MAX];
+    if (blobmsg_parse(metrics_test_get_policy, ARRAY_SIZE(metrics_test_get_policy), tb_metrics_test_get, blob_data(msg), blob_len(msg)) < 0) {
+        return metrics_test_metrics_decode_failed();
+    }
+
+    if (!tb_metrics_test_get[METRICS_TEST_GET_ID]) {
+        return metrics_test_metrics_decode_failed();
+    }
+
+    params->id = blobmsg_get_u32(tb_metrics_test_get[METRICS_TEST_GET_ID]);
+    return UBUS_STATUS_OK;
+}
+
+int metrics_test_get_serialize(struct blob_buf *b, const struct metrics_test_get_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    return UBUS_STATUS_OK;
+}
+
+struct metrics_test_get_params *metrics_test_get_dup(const struct metrics_test_get_params *params)
+{
+    size_t len = sizeof(*params);
+    struct metrics_test_get_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void metrics_test_get_free(struct metrics_test_get_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy metrics_test_sample_policy[] = {
+    [METRICS_TEST_SAMPLE_VALUE] = { .name = "value", .type = BLOBMSG_TYPE_INT32 },
+    [METRICS_TEST_SAMPLE_LABEL] = { .name = "label", .type = BLOBMSG_TYPE_STRING }
+};
+
+int metrics_test_sample_deserialize(struct blob_attr *msg, struct metrics_test_sample *params)
+{
+    struct blob_attr *tb_metrics_test_sample[__METRICS_TEST_SAMPLE_MAX];
+    if (blobmsg_parse(metrics_test_sample_policy, ARRAY_SIZE(metrics_test_sample_policy), tb_metrics_test_sample, blob_data(msg), blob_len(msg)) < 0) {
+        return metrics_test_metrics_decode_failed();
+    }
+
+    if (!tb_metrics_test_sample[METRICS_TEST_SAMPLE_VALUE]) {
+        return metrics_test_metrics_decode_failed();
+    }
+
+    params->has_fields = 0;
+    params->value = blobmsg_get_u32(tb_metrics_test_sample[METRICS_TEST_SAMPLE_VALUE]);
+
+    UBUS_IDL_GET_OPTIONAL(string, tb_metrics_test_sample, METRICS_TEST_SAMPLE_LABEL, params->label, params, FIELD, METRICS_TEST_SAMPLE_HAS_LABEL);
+    return UBUS_STATUS_OK;
+}
+
+int metrics_test_sample_serialize(struct blob_buf *b, const struct metrics_test_sample *params)
+{
+    UBUS_IDL_ADD(u32, b, "value", params->value);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "label", params->label, params, FIELD, METRICS_TEST_SAMPLE_HAS_LABEL);
+    return UBUS_STATUS_OK;
+}
+
+struct metrics_test_sample *metrics_test_sample_dup(const struct metrics_test_sample *params)
+{
+    size_t len = sizeof(*params);
+    struct metrics_test_sample *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, METRICS_TEST_SAMPLE_HAS_LABEL) && params->label) {
+        len += strlen(params->label) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->label = UBUS_IDL_HAS_FIELD(params, METRICS_TEST_SAMPLE_HAS_LABEL) && params->label ? ubus_idl_dup_string(&p, params->label) : NULL;
+    return copy;
+}
+
+void metrics_test_sample_free(struct metrics_test_sample *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy metrics_test_compact_policy[] = {
+    [METRICS_TEST_COMPACT_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int metrics_test_compact_deserialize(struct blob_attr *msg, struct metrics_test_compact_params *params)
+{
+    struct blob_attr *tb_metrics_test_compact[__METRICS_TEST_COMPACT_MAX];
+    if (blobmsg_parse(metrics_test_compact_policy, ARRAY_SIZE(metrics_test_compact_policy), tb_metrics_test_compact, blob_data(msg), blob_len(msg)) < 0) {
+        return metrics_test_metrics_decode_failed();
+    }
+
+    if (!tb_metrics_test_compact[METRICS_TEST_COMPACT_ID]) {
+        return metrics_test_metrics_decode_failed();
+    }
+
+    params->id = blobmsg_get_u32(tb_metrics_test_compact[METRICS_TEST_COMPACT_ID]);
+    return UBUS_STATUS_OK;
+}
+
+int metrics_test_compact_serialize(struct blob_buf *b, const struct metrics_test_compact_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    return UBUS_STATUS_OK;
+}
+
+struct metrics_test_compact_params *metrics_test_compact_dup(const struct metrics_test_compact_params *params)
+{
+    size_t len = sizeof(*params);
+    struct metrics_test_compact_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void metrics_test_compact_free(struct metrics_test_compact_params *params)
+{
+    free(params);
+}
+
+/* Deferred request waiting for a free slot of its method */
+struct metrics_test_admission_entry {
+    struct list_head list;
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct blob_attr *msg;
+    uint64_t start_us;
+};
+
+/* Concurrency limit of one deferred method, excess requests wait in a bounded FIFO */
+struct metrics_test_admission {
+    struct list_head queue;
+    unsigned int inflight;
+    unsigned int queued;
+    unsigned int max_inflight;
+    unsigned int queue_depth;
+    const char *method;
+    ubus_handler_t dispatch;
+    int index;
+};
+
+#ifndef METRICS_TEST_COMPACT_MAX_INFLIGHT
+#define METRICS_TEST_COMPACT_MAX_INFLIGHT 2
+#endif
+
+#ifndef METRICS_TEST_COMPACT_INFLIGHT_QUEUE
+#define METRICS_TEST_COMPACT_INFLIGHT_QUEUE 0
+#endif
+
+static int metrics_test_compact_blocking_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+static struct metrics_test_admission metrics_test_compact_admission = {
+    .queue = LIST_HEAD_INIT(metrics_test_compact_admission.queue),
+    .max_inflight = METRICS_TEST_COMPACT_MAX_INFLIGHT,
+    .queue_depth = METRICS_TEST_COMPACT_INFLIGHT_QUEUE,
+    .method = "compact",
+    .dispatch = metrics_test_compact_blocking_dispatch,
+    .index = METRICS_TEST_METHOD_COMPACT,
+};
+
+/* Park a request over the limit until a slot is released, or refuse it when the FIFO is full */
+static int metrics_test_admission_enqueue(struct metrics_test_admission *gate, struct ubus_context *ctx, struct ubus_request_data *req, struct blob_attr *msg)
+{
+    struct metrics_test_admission_entry *entry;
+
+    if (gate->queued >= gate->queue_depth) {
+        return UBUS_STATUS_NO_MEMORY;
+    }
+
+    entry = calloc(1, sizeof(*entry));
+    if (!entry) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    entry->msg = blob_memdup(msg);
+    if (!entry->msg) {
+        free(entry);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    entry->ctx = ctx;
+    entry->start_us = metrics_test_dispatch_start;
+    ubus_defer_request(ctx, req, &entry->req);
+    list_add_tail(&entry->list, &gate->queue);
+    gate->queued++;
+
+    return UBUS_STATUS_OK;
+}
+
+/* Called when a deferred request of the method completes, starts the oldest waiting ones */
+static void metrics_test_admission_release(struct metrics_test_admission *gate)
+{
+    struct metrics_test_admission_entry *entry;
+    int ret;
+
+    gate->inflight--;
+    while (gate->inflight < gate->max_inflight && !list_empty(&gate->queue)) {
+        entry = list_first_entry(&gate->queue, struct metrics_test_admission_entry, list);
+        list_del(&entry->list);
+        gate->queued--;
+
+        // Counted like a direct call, the wait in the queue is part of its latency
+        ret = metrics_test_dispatch_call(gate->index, gate->dispatch, true, entry->start_us,
+                                entry->ctx, &metrics_test_object, &entry->req, gate->method, entry->msg);
+        // The dispatcher did not take the request, answer it here
+        if (ret != UBUS_STATUS_OK) {
+            ubus_complete_deferred_request(entry->ctx, &entry->req, ret);
+        }
+
+        free(entry->msg);
+        free(entry);
+    }
+}
+
+/* Fail the requests still waiting, on cleanup */
+static void metrics_test_admission_flush(struct metrics_test_admission *gate)
+{
+    struct metrics_test_admission_entry *entry, *tmp;
+
+    list_for_each_entry_safe(entry, tmp, &gate->queue, list) {
+        list_del(&entry->list);
+        ubus_complete_deferred_request(entry->ctx, &entry->req, UBUS_STATUS_UNKNOWN_ERROR);
+        free(entry->msg);
+        free(entry);
+    }
+    gate->queued = 0;
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf metrics_test_reply_buf;
+
+int metrics_test_get_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct metrics_test_sample *reply)
+{
+    int ret;
+
+    blob_buf_init(&metrics_test_reply_buf, 0);
+    ret = metrics_test_sample_serialize(&metrics_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, metrics_test_reply_buf.head);
+}
+
+int metrics_test_compact_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct metrics_test_sample *reply)
+{
+    int ret;
+
+    blob_buf_init(&metrics_test_reply_buf, 0);
+    ret = metrics_test_sample_serialize(&metrics_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, metrics_test_reply_buf.head);
+}
+
+#ifndef METRICS_TEST_REFRESH_TIMEOUT_MS
+#define METRICS_TEST_REFRESH_TIMEOUT_MS 1000
+#endif
+
+static void metrics_test_refresh_async_timeout(struct uloop_timeout *t)
+{
+    struct metrics_test_refresh_async_ctx *actx = container_of(t, struct metrics_test_refresh_async_ctx, timeout);
+
+    actx->timed_out = true;
+    ubus_complete_deferred_request(actx->ctx, &actx->req, UBUS_STATUS_TIMEOUT);
+    metrics_test_record_deferred(METRICS_TEST_METHOD_REFRESH, UBUS_STATUS_TIMEOUT, actx->msg, actx->start_us);
+}
+
+void metrics_test_refresh_complete(struct metrics_test_refresh_async_ctx *actx, int status)
+{
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+        metrics_test_record_deferred(METRICS_TEST_METHOD_REFRESH, status, actx->msg, actx->start_us);
+    }
+
+    free(actx->msg);
+    free(actx);
+}
+
+static int metrics_test_refresh_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct metrics_test_refresh_async_ctx *actx;
+    int ret;
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    actx->ctx = ctx;
+    actx->start_us = metrics_test_dispatch_start;
+    ubus_defer_request(ctx, req, &actx->req);
+    actx->timeout.cb = metrics_test_refresh_async_timeout;
+    uloop_timeout_set(&actx->timeout, METRICS_TEST_REFRESH_TIMEOUT_MS);
+
+    // The handler owns the context on success and must call metrics_test_refresh_complete()
+    ret = metrics_test_refresh_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        metrics_test_refresh_complete(actx, ret);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+#ifndef METRICS_TEST_POOL_SIZE
+#define METRICS_TEST_POOL_SIZE 4
+#endif
+
+#ifndef METRICS_TEST_QUEUE_DEPTH
+#define METRICS_TEST_QUEUE_DEPTH 64
+#endif
+
+/* Job handed to the worker pool, the reply is serialized by the worker */
+struct metrics_test_job {
+    struct metrics_test_job *next;
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct blob_attr *msg;
+    int (*run)(struct metrics_test_job *job);
+    int status;
+    struct blob_buf reply;
+    int method;
+    uint64_t start_us;
+    struct metrics_test_admission *gate;
+};
+
+/* Worker pool state, ubus is only touched from the uloop thread */
+static struct {
+    pthread_mutex_t lock;
+    pthread_cond_t cond;
+    pthread_t threads[METRICS_TEST_POOL_SIZE];
+    int n_threads;
+    struct metrics_test_job *pending;
+    struct metrics_test_job *pending_tail;
+    struct metrics_test_job *done;
+    struct metrics_test_job *done_tail;
+    int queued;
+    struct uloop_fd efd;
+    bool started;
+    bool stopping;
+} metrics_test_pool = {
+    .lock = PTHREAD_MUTEX_INITIALIZER,
+    .cond = PTHREAD_COND_INITIALIZER,
+    .efd = { .fd = -1 },
+};
+
+static void metrics_test_job_append(struct metrics_test_job **head, struct metrics_test_job **tail, struct metrics_test_job *job)
+{
+    job->next = NULL;
+    if (*tail) {
+        (*tail)->next = job;
+    } else {
+        *head = job;
+    }
+    *tail = job;
+}
+
+static void metrics_test_job_free(struct metrics_test_job *job)
+{
+    blob_buf_free(&job->reply);
+    free(job->msg);
+    free(job);
+}
+
+static void *metrics_test_pool_worker(void *arg)
+{
+    struct metrics_test_job *job;
+    uint64_t one = 1;
+    ssize_t n;
+
+    (void)arg;
+
+    for (;;) {
+        pthread_mutex_lock(&metrics_test_pool.lock);
+        while (!metrics_test_pool.pending && !metrics_test_pool.stopping) {
+            pthread_cond_wait(&metrics_test_pool.cond, &metrics_test_pool.lock);
+        }
+        if (metrics_test_pool.stopping) {
+            pthread_mutex_unlock(&metrics_test_pool.lock);
+            break;
+        }
+        job = metrics_test_pool.pending;
+        metrics_test_pool.pending = job->next;
+        if (!metrics_test_pool.pending) {
+            metrics_test_pool.pending_tail = NULL;
+        }
+        pthread_mutex_unlock(&metrics_test_pool.lock);
+
+        job->status = job->run(job);
+
+        pthread_mutex_lock(&metrics_test_pool.lock);
+        metrics_test_job_append(&metrics_test_pool.done, &metrics_test_pool.done_tail, job);
+        pthread_mutex_unlock(&metrics_test_pool.lock);
+
+        // Wake the uloop thread to send the reply
+        n = write(metrics_test_pool.efd.fd, &one, sizeof(one));
+        (void)n;
+    }
+
+    return NULL;
+}
+
+static void metrics_test_pool_done_cb(struct uloop_fd *fd, unsigned int events)
+{
+    struct metrics_test_job *job;
+    struct metrics_test_job *next;
+    struct metrics_test_admission *gate;
+    uint64_t count;
+    ssize_t n;
+
+    (void)events;
+
+    n = read(fd->fd, &count, sizeof(count));
+    (void)n;
+
+    pthread_mutex_lock(&metrics_test_pool.lock);
+    job = metrics_test_pool.done;
+    metrics_test_pool.done = NULL;
+    metrics_test_pool.done_tail = NULL;
+    pthread_mutex_unlock(&metrics_test_pool.lock);
+
+    for (; job; job = next) {
+        next = job->next;
+        if (job->status == UBUS_STATUS_OK && job->reply.head) {
+            ubus_send_reply(job->ctx, &job->req, job->reply.head);
+        }
+        ubus_complete_deferred_request(job->ctx, &job->req, job->status);
+        metrics_test_record_deferred(job->method, job->status, job->msg, job->start_us);
+        metrics_test_pool.queued--;
+        gate = job->gate;
+        metrics_test_job_free(job);
+        if (gate) {
+            metrics_test_admission_release(gate);
+        }
+    }
+}
+
+static void metrics_test_pool_stop(void)
+{
+    struct metrics_test_job *job;
+    struct metrics_test_job *next;
+    int i;
+
+    if (!metrics_test_pool.started) {
+        return;
+    }
+
+    pthread_mutex_lock(&metrics_test_pool.lock);
+    metrics_test_pool.stopping = true;
+    pthread_cond_broadcast(&metrics_test_pool.cond);
+    pthread_mutex_unlock(&metrics_test_pool.lock);
+
+    for (i = 0; i < metrics_test_pool.n_threads; i++) {
+        pthread_join(metrics_test_pool.threads[i], NULL);
+    }
+    metrics_test_pool.n_threads = 0;
+
+    uloop_fd_delete(&metrics_test_pool.efd);
+    close(metrics_test_pool.efd.fd);
+    metrics_test_pool.efd.fd = -1;
+
+    // Finished jobs still get their result, the callers of jobs that never ran
+    // get an error instead of waiting for their timeout
+    for (job = metrics_test_pool.done; job; job = next) {
+        next = job->next;
+        if (job->status == UBUS_STATUS_OK && job->reply.head) {
+            ubus_send_reply(job->ctx, &job->req, job->reply.head);
+        }
+        ubus_complete_deferred_request(job->ctx, &job->req, job->status);
+        metrics_test_job_free(job);
+    }
+    for (job = metrics_test_pool.pending; job; job = next) {
+        next = job->next;
+        ubus_complete_deferred_request(job->ctx, &job->req, UBUS_STATUS_UNKNOWN_ERROR);
+        metrics_test_job_free(job);
+    }
+    metrics_test_pool.pending = NULL;
+    metrics_test_pool.pending_tail = NULL;
+    metrics_test_pool.done = NULL;
+    metrics_test_pool.done_tail = NULL;
+    metrics_test_pool.queued = 0;
+    metrics_test_pool.started = false;
+}
+
+static int metrics_test_pool_start(void)
+{
+    int fd;
+    int i;
+
+    if (metrics_test_pool.started) {
+        return 0;
+    }
+
+    fd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    if (fd < 0) {
+        return -1;
+    }
+
+    metrics_test_pool.efd.fd = fd;
+    metrics_test_pool.efd.cb = metrics_test_pool_done_cb;
+    uloop_fd_add(&metrics_test_pool.efd, ULOOP_READ);
+    metrics_test_pool.stopping = false;
+    metrics_test_pool.started = true;
+
+    for (i = 0; i < METRICS_TEST_POOL_SIZE; i++) {
+        if (pthread_create(&metrics_test_pool.threads[i], NULL, metrics_test_pool_worker, NULL) != 0) {
+            break;
+        }
+        metrics_test_pool.n_threads++;
+    }
+
+    // Run with fewer workers if some failed to start, but not with none
+    if (metrics_test_pool.n_threads == 0) {
+        metrics_test_pool_stop();
+        return -1;
+    }
+
+    return 0;
+}
+
+static void metrics_test_pool_submit(struct metrics_test_job *job)
+{
+    metrics_test_pool.queued++;
+
+    pthread_mutex_lock(&metrics_test_pool.lock);
+    metrics_test_job_append(&metrics_test_pool.pending, &metrics_test_pool.pending_tail, job);
+    pthread_cond_signal(&metrics_test_pool.cond);
+    pthread_mutex_unlock(&metrics_test_pool.lock);
+}
+
+struct metrics_test_compact_job {
+    struct metrics_test_job base;
+    struct metrics_test_compact_params params;
+};
+
+/* Runs on a worker thread */
+static int metrics_test_compact_job_run(struct metrics_test_job *job)
+{
+    struct metrics_test_compact_job *mjob = container_of(job, struct metrics_test_compact_job, base);
+    struct metrics_test_sample reply;
+    int ret;
+
+    memset(&reply, 0, sizeof(reply));
+    ret = metrics_test_compact_handler(&mjob->params, &reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    blob_buf_init(&job->reply, 0);
+    return metrics_test_sample_serialize(&job->reply, &reply);
+}
+
+static int metrics_test_compact_blocking_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct metrics_test_compact_job *mjob;
+
+    // Over the limit the request waits or is refused, before any decoding
+    if (metrics_test_compact_admission.inflight >= metrics_test_compact_admission.max_inflight) {
+        return metrics_test_admission_enqueue(&metrics_test_compact_admission, ctx, req, msg);
+    }
+
+    if (metrics_test_pool_start() != 0) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Refuse new work instead of queueing without bound
+    if (metrics_test_pool.queued >= METRICS_TEST_QUEUE_DEPTH) {
+        return UBUS_STATUS_NO_MEMORY;
+    }
+
+    mjob = calloc(1, sizeof(*mjob));
+    if (!mjob) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy for the worker
+    mjob->base.msg = blob_memdup(msg);
+    if (!mjob->base.msg) {
+        free(mjob);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    if (metrics_test_compact_deserialize(mjob->base.msg, &mjob->params) != UBUS_STATUS_OK) {
+        free(mjob->base.msg);
+        free(mjob);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    mjob->base.ctx = ctx;
+    mjob->base.run = metrics_test_compact_job_run;
+    mjob->base.method = METRICS_TEST_METHOD_COMPACT;
+    mjob->base.start_us = metrics_test_dispatch_start;
+    ubus_defer_request(ctx, req, &mjob->base.req);
+    mjob->base.gate = &metrics_test_compact_admission;
+    metrics_test_compact_admission.inflight++;
+    metrics_test_pool_submit(&mjob->base);
+
+    return UBUS_STATUS_OK;
+}
+
+static int metrics_test_get_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return metrics_test_dispatch_call(METRICS_TEST_METHOD_GET, metrics_test_get_handler, false,
+                             metrics_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+static int metrics_test_put_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return metrics_test_dispatch_call(METRICS_TEST_METHOD_PUT, metrics_test_put_handler, false,
+                             metrics_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+static int metrics_test_ping_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return metrics_test_dispatch_call(METRICS_TEST_METHOD_PING, metrics_test_ping_handler, false,
+                             metrics_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+static int metrics_test_refresh_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return metrics_test_dispatch_call(METRICS_TEST_METHOD_REFRESH, metrics_test_refresh_async_dispatch, true,
+                             metrics_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+static int metrics_test_compact_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return metrics_test_dispatch_call(METRICS_TEST_METHOD_COMPACT, metrics_test_compact_blocking_dispatch, true,
+                             metrics_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+enum {
+    METRICS_TEST_STATS_RESET,
+    __METRICS_TEST_STATS_MAX
+};
+
+static const struct blobmsg_policy metrics_test_stats_policy[] = {
+    [METRICS_TEST_STATS_RESET] = { .name = "reset", .type = BLOBMSG_TYPE_BOOL }
+};
+
+static int metrics_test_stats_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+static const struct ubus_method metrics_test_methods[] = {
+    UBUS_METHOD("get", metrics_test_get_dispatch, metrics_test_get_policy),
+    UBUS_METHOD("put", metrics_test_put_dispatch, metrics_test_sample_policy),
+    UBUS_METHOD_NOARG("ping", metrics_test_ping_dispatch),
+    UBUS_METHOD_NOARG("refresh", metrics_test_refresh_dispatch),
+    UBUS_METHOD("compact", metrics_test_compact_dispatch, metrics_test_compact_policy),
+    UBUS_METHOD("stats", metrics_test_stats_handler, metrics_test_stats_policy)
+};
+
+static struct ubus_object_type metrics_test_object_type =
+    UBUS_OBJECT_TYPE("metrics_test", metrics_test_methods);
+
+struct ubus_object metrics_test_object = {
+    .name = "metrics_test",
+    .type = &metrics_test_object_type,
+    .methods = metrics_test_methods,
+    .n_methods = ARRAY_SIZE(metrics_test_methods),
+};
+
+static struct blob_buf metrics_test_stats_buf;
+
+static int metrics_test_stats_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct blob_attr *tb[__METRICS_TEST_STATS_MAX];
+    struct metrics_test_method_stats *st;
+    void *methods;
+    void *entry;
+    void *table;
+    char key[24];
+    size_t i;
+    size_t j;
+    int ret;
+
+    if (blobmsg_parse(metrics_test_stats_policy, ARRAY_SIZE(metrics_test_stats_policy), tb, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    blob_buf_init(&metrics_test_stats_buf, 0);
+    methods = blobmsg_open_table(&metrics_test_stats_buf, "methods");
+
+    for (i = 0; i < __METRICS_TEST_METHOD_MAX; i++) {
+        st = &metrics_test_stats[i];
+        entry = blobmsg_open_table(&metrics_test_stats_buf, metrics_test_method_names[i]);
+        blobmsg_add_u64(&metrics_test_stats_buf, "calls", st->calls);
+        blobmsg_add_u64(&metrics_test_stats_buf, "decode_errors", st->decode_errors);
+        blobmsg_add_u64(&metrics_test_stats_buf, "total_us", st->total_us);
+        blobmsg_add_u64(&metrics_test_stats_buf, "max_us", st->max_us);
+
+        // Status codes that occurred, keyed by their numeric value
+        table = blobmsg_open_table(&metrics_test_stats_buf, "status");
+        for (j = 0; j <= __UBUS_STATUS_LAST; j++) {
+            if (!st->status[j]) {
+                continue;
+            }
+            if (j == __UBUS_STATUS_LAST) {
+                snprintf(key, sizeof(key), "other");
+            } else {
+                snprintf(key, sizeof(key), "%zu", j);
+            }
+            blobmsg_add_u64(&metrics_test_stats_buf, key, st->status[j]);
+        }
+        blobmsg_close_table(&metrics_test_stats_buf, table);
+
+        // Histogram keyed by bucket upper bound in microseconds
+        table = blobmsg_open_table(&metrics_test_stats_buf, "latency_us");
+        for (j = 0; j < ARRAY_SIZE(st->latency); j++) {
+            if (j < ARRAY_SIZE(metrics_test_latency_bounds)) {
+                snprintf(key, sizeof(key), "%llu", (unsigned long long)metrics_test_latency_bounds[j]);
+            } else {
+                snprintf(key, sizeof(key), "inf");
+            }
+            blobmsg_add_u64(&metrics_test_stats_buf, key, st->latency[j]);
+        }
+        blobmsg_close_table(&metrics_test_stats_buf, table);
+
+        blobmsg_close_table(&metrics_test_stats_buf, entry);
+    }
+
+    blobmsg_close_table(&metrics_test_stats_buf, methods);
+
+    ret = ubus_send_reply(ctx, req, metrics_test_stats_buf.head);
+
+    if (tb[METRICS_TEST_STATS_RESET] && blobmsg_get_bool(tb[METRICS_TEST_STATS_RESET])) {
+        memset(metrics_test_stats, 0, sizeof(metrics_test_stats));
+    }
+
+    return ret;
+}
+
+void metrics_test_object_cleanup(void)
+{
+    blob_buf_free(&metrics_test_reply_buf);
+    blob_buf_free(&metrics_test_stats_buf);
+    metrics_test_admission_flush(&metrics_test_compact_admission);
+    metrics_test_pool_stop();
+}
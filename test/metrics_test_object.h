@@ -0,0 +1,114 @@
+/* Generated from ubus IDL - metrics_test */
+
+#ifndef __METRICS_TEST_OBJECT_H__
+#define __METRICS_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct metrics_test_sample {
+    const char * label;
+    int32_t value;
+    uint8_t has_fields;
+};
+#define METRICS_TEST_SAMPLE_HAS_LABEL 0
+_Static_assert(sizeof(struct metrics_test_sample) == UBUS_IDL_PACKED_SIZE(struct metrics_test_sample, sizeof(const char *) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct metrics_test_sample has padding between members");
+
+struct metrics_test_get_params {
+    int32_t id;
+};
+_Static_assert(sizeof(struct metrics_test_get_params) == UBUS_IDL_PACKED_SIZE(struct metrics_test_get_params, sizeof(int32_t)),
+               "struct metrics_test_get_params has padding between members");
+
+struct metrics_test_compact_params {
+    int32_t id;
+};
+_Static_assert(sizeof(struct metrics_test_compact_params) == UBUS_IDL_PACKED_SIZE(struct metrics_test_compact_params, sizeof(int32_t)),
+               "struct metrics_test_compact_params has padding between members");
+
+enum {
+    METRICS_TEST_GET_ID,
+    __METRICS_TEST_GET_MAX
+};
+
+enum {
+    METRICS_TEST_SAMPLE_VALUE,
+    METRICS_TEST_SAMPLE_LABEL,
+    __METRICS_TEST_SAMPLE_MAX
+};
+
+enum {
+    METRICS_TEST_COMPACT_ID,
+    __METRICS_TEST_COMPACT_MAX
+};
+
+struct metrics_test_refresh_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    bool timed_out;
+    uint64_t start_us;
+    void *priv;
+};
+
+enum metrics_test_method {
+    METRICS_TEST_METHOD_GET,
+    METRICS_TEST_METHOD_PUT,
+    METRICS_TEST_METHOD_PING,
+    METRICS_TEST_METHOD_REFRESH,
+    METRICS_TEST_METHOD_COMPACT,
+    __METRICS_TEST_METHOD_MAX
+};
+
+int metrics_test_get_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int metrics_test_put_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int metrics_test_ping_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int metrics_test_refresh_handler(struct metrics_test_refresh_async_ctx *actx);
+int metrics_test_compact_handler(const struct metrics_test_compact_params *params, struct metrics_test_sample *reply);
+
+int metrics_test_get_deserialize(struct blob_attr *msg, struct metrics_test_get_params *params);
+int metrics_test_get_serialize(struct blob_buf *b, const struct metrics_test_get_params *params);
+int metrics_test_sample_deserialize(struct blob_attr *msg, struct metrics_test_sample *params);
+int metrics_test_sample_serialize(struct blob_buf *b, const struct metrics_test_sample *params);
+int metrics_test_compact_deserialize(struct blob_attr *msg, struct metrics_test_compact_params *params);
+int metrics_test_compact_serialize(struct blob_buf *b, const struct metrics_test_compact_params *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct metrics_test_get_params *metrics_test_get_dup(const struct metrics_test_get_params *params);
+void metrics_test_get_free(struct metrics_test_get_params *params);
+struct metrics_test_sample *metrics_test_sample_dup(const struct metrics_test_sample *params);
+void metrics_test_sample_free(struct metrics_test_sample *params);
+struct metrics_test_compact_params *metrics_test_compact_dup(const struct metrics_test_compact_params *params);
+void metrics_test_compact_free(struct metrics_test_compact_params *params);
+
+int metrics_test_get_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct metrics_test_sample *reply);
+int metrics_test_compact_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct metrics_test_sample *reply);
+
+void metrics_test_refresh_complete(struct metrics_test_refresh_async_ctx *actx, int status);
+
+extern struct ubus_object metrics_test_object;
+
+void metrics_test_object_cleanup(void);
+
+#endif /* __METRICS_TEST_OBJECT_H__ */
@@ -0,0 +1,333 @@
+/* Generated from ubus IDL - reply_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "reply_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy reply_test_get_policy[] = {
+    [REPLY_TEST_GET_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int reply_test_get_deserialize(struct blob_attr *msg, struct reply_test_get_params *params)
+{
+    struct blob_attr *tb_reply_test_get[__REPLY_TEST_GET_MAX];
+    if (blobmsg_parse(reply_test_get_policy, ARRAY_SIZE(reply_test_get_policy), tb_reply_test_get, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_reply_test_get[REPLY_TEST_GET_ID]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->id = blobmsg_get_u32(tb_reply_test_get[REPLY_TEST_GET_ID]);
+    return UBUS_STATUS_OK;
+}
+
+int reply_test_get_serialize(struct blob_buf *b, const struct reply_test_get_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    return UBUS_STATUS_OK;
+}
+
+struct reply_test_get_params *reply_test_get_dup(const struct reply_test_get_params *params)
+{
+    size_t len = sizeof(*params);
+    struct reply_test_get_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void reply_test_get_free(struct reply_test_get_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy reply_test_entry_policy[] = {
+    [REPLY_TEST_ENTRY_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+    [REPLY_TEST_ENTRY_NAME] = { .name = "name", .type = BLOBMSG_TYPE_STRING },
+    [REPLY_TEST_ENTRY_UPTIME] = { .name = "uptime", .type = BLOBMSG_TYPE_INT64 }
+};
+
+int reply_test_entry_deserialize(struct blob_attr *msg, struct reply_test_entry *params)
+{
+    struct blob_attr *tb_reply_test_entry[__REPLY_TEST_ENTRY_MAX];
+    if (blobmsg_parse(reply_test_entry_policy, ARRAY_SIZE(reply_test_entry_policy), tb_reply_test_entry, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_reply_test_entry[REPLY_TEST_ENTRY_ID] || !tb_reply_test_entry[REPLY_TEST_ENTRY_NAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->id = blobmsg_get_u32(tb_reply_test_entry[REPLY_TEST_ENTRY_ID]);
+    params->name = blobmsg_get_string(tb_reply_test_entry[REPLY_TEST_ENTRY_NAME]);
+
+    UBUS_IDL_GET_OPTIONAL(u64, tb_reply_test_entry, REPLY_TEST_ENTRY_UPTIME, params->uptime, params, FIELD, REPLY_TEST_ENTRY_HAS_UPTIME);
+    return UBUS_STATUS_OK;
+}
+
+int reply_test_entry_serialize(struct blob_buf *b, const struct reply_test_entry *params)
+{
+    UBUS_IDL_ADD(u32, b, "id", params->id);
+    UBUS_IDL_ADD(string, b, "name", params->name);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "uptime", params->uptime, params, FIELD, REPLY_TEST_ENTRY_HAS_UPTIME);
+    return UBUS_STATUS_OK;
+}
+
+struct reply_test_entry *reply_test_entry_dup(const struct reply_test_entry *params)
+{
+    size_t len = sizeof(*params);
+    struct reply_test_entry *copy;
+    char *p;
+
+    if (params->name) {
+        len += strlen(params->name) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->name = params->name ? ubus_idl_dup_string(&p, params->name) : NULL;
+    return copy;
+}
+
+void reply_test_entry_free(struct reply_test_entry *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy reply_test_reset_policy[] = {
+    [REPLY_TEST_RESET_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int reply_test_reset_deserialize(struct blob_attr *msg, struct reply_test_reset_params *params)
+{
+    struct blob_attr *tb_reply_test_reset[__REPLY_TEST_RESET_MAX];
+    if (blobmsg_parse(reply_test_reset_policy, ARRAY_SIZE(reply_test_reset_policy), tb_reply_test_reset, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    UBUS_IDL_GET_OPTIONAL(u32, tb_reply_test_reset, REPLY_TEST_RESET_ID, params->id, params, FIELD, REPLY_TEST_RESET_HAS_ID);
+    return UBUS_STATUS_OK;
+}
+
+int reply_test_reset_serialize(struct blob_buf *b, const struct reply_test_reset_params *params)
+{
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "id", params->id, params, FIELD, REPLY_TEST_RESET_HAS_ID);
+    return UBUS_STATUS_OK;
+}
+
+struct reply_test_reset_params *reply_test_reset_dup(const struct reply_test_reset_params *params)
+{
+    size_t len = sizeof(*params);
+    struct reply_test_reset_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void reply_test_reset_free(struct reply_test_reset_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy status_common_policy[] = {
+    [STATUS_COMMON_CODE] = { .name = "code", .type = BLOBMSG_TYPE_INT32 },
+    [STATUS_COMMON_MESSAGE] = { .name = "message", .type = BLOBMSG_TYPE_STRING }
+};
+
+int status_common_deserialize(struct blob_attr *msg, struct status_common *params)
+{
+    struct blob_attr *tb_status_common[__STATUS_COMMON_MAX];
+    if (blobmsg_parse(status_common_policy, ARRAY_SIZE(status_common_policy), tb_status_common, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_status_common[STATUS_COMMON_CODE]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->code = blobmsg_get_u32(tb_status_common[STATUS_COMMON_CODE]);
+
+    UBUS_IDL_GET_OPTIONAL(string, tb_status_common, STATUS_COMMON_MESSAGE, params->message, params, FIELD, STATUS_COMMON_HAS_MESSAGE);
+    return UBUS_STATUS_OK;
+}
+
+int status_common_serialize(struct blob_buf *b, const struct status_common *params)
+{
+    UBUS_IDL_ADD(u32, b, "code", params->code);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "message", params->message, params, FIELD, STATUS_COMMON_HAS_MESSAGE);
+    return UBUS_STATUS_OK;
+}
+
+struct status_common *status_common_dup(const struct status_common *params)
+{
+    size_t len = sizeof(*params);
+    struct status_common *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, STATUS_COMMON_HAS_MESSAGE) && params->message) {
+        len += strlen(params->message) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->message = UBUS_IDL_HAS_FIELD(params, STATUS_COMMON_HAS_MESSAGE) && params->message ? ubus_idl_dup_string(&p, params->message) : NULL;
+    return copy;
+}
+
+void status_common_free(struct status_common *params)
+{
+    free(params);
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf reply_test_reply_buf;
+
+int reply_test_status_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct status_common *reply)
+{
+    int ret;
+
+    blob_buf_init(&reply_test_reply_buf, 0);
+    ret = status_common_serialize(&reply_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, reply_test_reply_buf.head);
+}
+
+int reply_test_get_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct reply_test_entry *reply)
+{
+    int ret;
+
+    blob_buf_init(&reply_test_reply_buf, 0);
+    ret = reply_test_entry_serialize(&reply_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, reply_test_reply_buf.head);
+}
+
+int reply_test_update_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct reply_test_entry *reply)
+{
+    int ret;
+
+    blob_buf_init(&reply_test_reply_buf, 0);
+    ret = reply_test_entry_serialize(&reply_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, reply_test_reply_buf.head);
+}
+
+int reply_test_reset_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct status_common *reply)
+{
+    int ret;
+
+    blob_buf_init(&reply_test_reply_buf, 0);
+    ret = status_common_serialize(&reply_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, reply_test_reply_buf.head);
+}
+
+static int reply_test_reset_thunk(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct reply_test_reset_params params;
+
+    if (reply_test_reset_deserialize(msg, &params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return reset_handler(ctx, obj, req, REPLY_TEST_METHOD_RESET, &params);
+}
+
+static const struct ubus_method reply_test_methods[] = {
+    UBUS_METHOD_NOARG("status", reply_test_status_handler),
+    UBUS_METHOD("get", reply_test_get_handler, reply_test_get_policy),
+    UBUS_METHOD("update", reply_test_update_handler, reply_test_entry_policy),
+    UBUS_METHOD("reset", reply_test_reset_thunk, reply_test_reset_policy),
+    UBUS_METHOD_NOARG("ping", reply_test_ping_handler)
+};
+
+static struct ubus_object_type reply_test_object_type =
+    UBUS_OBJECT_TYPE("reply_test", reply_test_methods);
+
+struct ubus_object reply_test_object = {
+    .name = "reply_test",
+    .type = &reply_test_object_type,
+    .methods = reply_test_methods,
+    .n_methods = ARRAY_SIZE(reply_test_methods),
+};
+
+void reply_test_object_cleanup(void)
+{
+    blob_buf_free(&reply_test_reply_buf);
+}
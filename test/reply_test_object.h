@@ -0,0 +1,128 @@
+/* Generated from ubus IDL - reply_test */
+
+#ifndef __REPLY_TEST_OBJECT_H__
+#define __REPLY_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct status_common {
+    const char * message;
+    int32_t code;
+    uint8_t has_fields;
+};
+#define STATUS_COMMON_HAS_MESSAGE 0
+_Static_assert(sizeof(struct status_common) == UBUS_IDL_PACKED_SIZE(struct status_common, sizeof(const char *) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct status_common has padding between members");
+
+struct reply_test_entry {
+    int64_t uptime;
+    const char * name;
+    int32_t id;
+    uint8_t has_fields;
+};
+#define REPLY_TEST_ENTRY_HAS_UPTIME 0
+_Static_assert(sizeof(struct reply_test_entry) == UBUS_IDL_PACKED_SIZE(struct reply_test_entry, sizeof(int64_t) + sizeof(const char *) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct reply_test_entry has padding between members");
+
+struct reply_test_get_params {
+    int32_t id;
+};
+_Static_assert(sizeof(struct reply_test_get_params) == UBUS_IDL_PACKED_SIZE(struct reply_test_get_params, sizeof(int32_t)),
+               "struct reply_test_get_params has padding between members");
+
+struct reply_test_reset_params {
+    int32_t id;
+    uint8_t has_fields;
+};
+#define REPLY_TEST_RESET_HAS_ID 0
+_Static_assert(sizeof(struct reply_test_reset_params) == UBUS_IDL_PACKED_SIZE(struct reply_test_reset_params, sizeof(int32_t) + sizeof(uint8_t)),
+               "struct reply_test_reset_params has padding between members");
+
+enum {
+    REPLY_TEST_GET_ID,
+    __REPLY_TEST_GET_MAX
+};
+
+enum {
+    REPLY_TEST_ENTRY_ID,
+    REPLY_TEST_ENTRY_NAME,
+    REPLY_TEST_ENTRY_UPTIME,
+    __REPLY_TEST_ENTRY_MAX
+};
+
+enum {
+    REPLY_TEST_RESET_ID,
+    __REPLY_TEST_RESET_MAX
+};
+
+enum {
+    STATUS_COMMON_CODE,
+    STATUS_COMMON_MESSAGE,
+    __STATUS_COMMON_MAX
+};
+
+enum reply_test_method {
+    REPLY_TEST_METHOD_STATUS,
+    REPLY_TEST_METHOD_GET,
+    REPLY_TEST_METHOD_UPDATE,
+    REPLY_TEST_METHOD_RESET,
+    REPLY_TEST_METHOD_PING,
+    __REPLY_TEST_METHOD_MAX
+};
+
+int reply_test_status_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int reply_test_get_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int reply_test_update_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int reply_test_ping_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+/* Custom handlers, called by a generated thunk with the method and its decoded params */
+int reset_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, enum reply_test_method method, const struct reply_test_reset_params *params);
+
+int reply_test_get_deserialize(struct blob_attr *msg, struct reply_test_get_params *params);
+int reply_test_get_serialize(struct blob_buf *b, const struct reply_test_get_params *params);
+int reply_test_entry_deserialize(struct blob_attr *msg, struct reply_test_entry *params);
+int reply_test_entry_serialize(struct blob_buf *b, const struct reply_test_entry *params);
+int reply_test_reset_deserialize(struct blob_attr *msg, struct reply_test_reset_params *params);
+int reply_test_reset_serialize(struct blob_buf *b, const struct reply_test_reset_params *params);
+int status_common_deserialize(struct blob_attr *msg, struct status_common *params);
+int status_common_serialize(struct blob_buf *b, const struct status_common *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct reply_test_get_params *reply_test_get_dup(const struct reply_test_get_params *params);
+void reply_test_get_free(struct reply_test_get_params *params);
+struct reply_test_entry *reply_test_entry_dup(const struct reply_test_entry *params);
+void reply_test_entry_free(struct reply_test_entry *params);
+struct reply_test_reset_params *reply_test_reset_dup(const struct reply_test_reset_params *params);
+void reply_test_reset_free(struct reply_test_reset_params *params);
+struct status_common *status_common_dup(const struct status_common *params);
+void status_common_free(struct status_common *params);
+
+int reply_test_status_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct status_common *reply);
+int reply_test_get_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct reply_test_entry *reply);
+int reply_test_update_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct reply_test_entry *reply);
+int reply_test_reset_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct status_common *reply);
+
+extern struct ubus_object reply_test_object;
+
+void reply_test_object_cleanup(void);
+
+#endif /* __REPLY_TEST_OBJECT_H__ */
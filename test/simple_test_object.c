@@ -2,21 +2,23 @@
 
 #include <libubox/blobmsg_json.h>
 #include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
 #include "simple_test_object.h"
 
 /* Helper macros for optional field deserialization */
-#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, mask) \
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
     do { \
         if ((tb)[(enum)]) { \
             (field) = blobmsg_get_##type((tb)[(enum)]); \
-            UBUS_IDL_SET_FIELD((params), (mask)); \
+            UBUS_IDL_SET_##kind((params), (index)); \
         } \
     } while (0)
 
 /* Helper macros for optional field serialization */
-#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, mask) \
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
     do { \
-        if (UBUS_IDL_HAS_FIELD((params), (mask))) { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
             blobmsg_add_##type((b), (name), (field)); \
         } \
     } while (0)
@@ -30,6 +32,17 @@
         } \
     } while (0)
 
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
 static const struct blobmsg_policy simple_test_hello_policy[] = {
     [SIMPLE_TEST_HELLO_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 },
     [SIMPLE_TEST_HELLO_MSG] = { .name = "msg", .type = BLOBMSG_TYPE_STRING }
@@ -49,17 +62,43 @@ int simple_test_hello_deserialize(struct blob_attr *msg, struct simple_test_hell
     params->has_fields = 0;
     params->msg = blobmsg_get_string(tb_simple_test_hello[SIMPLE_TEST_HELLO_MSG]);
 
-    UBUS_IDL_GET_OPTIONAL(u32, tb_simple_test_hello, SIMPLE_TEST_HELLO_ID, params->id, params, SIMPLE_TEST_HELLO_HAS_ID);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_simple_test_hello, SIMPLE_TEST_HELLO_ID, params->id, params, FIELD, SIMPLE_TEST_HELLO_HAS_ID);
     return UBUS_STATUS_OK;
 }
 
 int simple_test_hello_serialize(struct blob_buf *b, const struct simple_test_hello_params *params)
 {
-    UBUS_IDL_ADD_OPTIONAL(u32, b, "id", params->id, params, SIMPLE_TEST_HELLO_HAS_ID);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "id", params->id, params, FIELD, SIMPLE_TEST_HELLO_HAS_ID);
     UBUS_IDL_ADD(string, b, "msg", params->msg);
     return UBUS_STATUS_OK;
 }
 
+struct simple_test_hello_params *simple_test_hello_dup(const struct simple_test_hello_params *params)
+{
+    size_t len = sizeof(*params);
+    struct simple_test_hello_params *copy;
+    char *p;
+
+    if (params->msg) {
+        len += strlen(params->msg) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->msg = params->msg ? ubus_idl_dup_string(&p, params->msg) : NULL;
+    return copy;
+}
+
+void simple_test_hello_free(struct simple_test_hello_params *params)
+{
+    free(params);
+}
+
 static const struct blobmsg_policy simple_test_hello1_policy[] = {
     [SIMPLE_TEST_HELLO1_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 },
     [SIMPLE_TEST_HELLO1_MSG] = { .name = "msg", .type = BLOBMSG_TYPE_STRING }
@@ -79,17 +118,43 @@ int simple_test_hello1_deserialize(struct blob_attr *msg, struct simple_test_hel
     params->has_fields = 0;
     params->id = blobmsg_get_u32(tb_simple_test_hello1[SIMPLE_TEST_HELLO1_ID]);
 
-    UBUS_IDL_GET_OPTIONAL(string, tb_simple_test_hello1, SIMPLE_TEST_HELLO1_MSG, params->msg, params, SIMPLE_TEST_HELLO1_HAS_MSG);
+    UBUS_IDL_GET_OPTIONAL(string, tb_simple_test_hello1, SIMPLE_TEST_HELLO1_MSG, params->msg, params, FIELD, SIMPLE_TEST_HELLO1_HAS_MSG);
     return UBUS_STATUS_OK;
 }
 
 int simple_test_hello1_serialize(struct blob_buf *b, const struct simple_test_hello1 *params)
 {
     UBUS_IDL_ADD(u32, b, "id", params->id);
-    UBUS_IDL_ADD_OPTIONAL(string, b, "msg", params->msg, params, SIMPLE_TEST_HELLO1_HAS_MSG);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "msg", params->msg, params, FIELD, SIMPLE_TEST_HELLO1_HAS_MSG);
     return UBUS_STATUS_OK;
 }
 
+struct simple_test_hello1 *simple_test_hello1_dup(const struct simple_test_hello1 *params)
+{
+    size_t len = sizeof(*params);
+    struct simple_test_hello1 *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, SIMPLE_TEST_HELLO1_HAS_MSG) && params->msg) {
+        len += strlen(params->msg) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->msg = UBUS_IDL_HAS_FIELD(params, SIMPLE_TEST_HELLO1_HAS_MSG) && params->msg ? ubus_idl_dup_string(&p, params->msg) : NULL;
+    return copy;
+}
+
+void simple_test_hello1_free(struct simple_test_hello1 *params)
+{
+    free(params);
+}
+
 static const struct blobmsg_policy hello_common_policy[] = {
     [HELLO_COMMON_ID] = { .name = "id", .type = BLOBMSG_TYPE_INT32 },
     [HELLO_COMMON_MSG] = { .name = "msg", .type = BLOBMSG_TYPE_STRING }
@@ -109,18 +174,44 @@ int hello_common_deserialize(struct blob_attr *msg, struct hello_common *params)
     params->has_fields = 0;
     params->id = blobmsg_get_u32(tb_hello_common[HELLO_COMMON_ID]);
 
-    UBUS_IDL_GET_OPTIONAL(string, tb_hello_common, HELLO_COMMON_MSG, params->msg, params, HELLO_COMMON_HAS_MSG);
+    UBUS_IDL_GET_OPTIONAL(string, tb_hello_common, HELLO_COMMON_MSG, params->msg, params, FIELD, HELLO_COMMON_HAS_MSG);
     return UBUS_STATUS_OK;
 }
 
 int hello_common_serialize(struct blob_buf *b, const struct hello_common *params)
 {
     UBUS_IDL_ADD(u32, b, "id", params->id);
-    UBUS_IDL_ADD_OPTIONAL(string, b, "msg", params->msg, params, HELLO_COMMON_HAS_MSG);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "msg", params->msg, params, FIELD, HELLO_COMMON_HAS_MSG);
     return UBUS_STATUS_OK;
 }
 
-int handler1(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+struct hello_common *hello_common_dup(const struct hello_common *params)
+{
+    size_t len = sizeof(*params);
+    struct hello_common *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, HELLO_COMMON_HAS_MSG) && params->msg) {
+        len += strlen(params->msg) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->msg = UBUS_IDL_HAS_FIELD(params, HELLO_COMMON_HAS_MSG) && params->msg ? ubus_idl_dup_string(&p, params->msg) : NULL;
+    return copy;
+}
+
+void hello_common_free(struct hello_common *params)
+{
+    free(params);
+}
+
+static int simple_test_hello3_thunk(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
 {
     struct simple_test_hello1 params;
 
@@ -128,25 +219,27 @@ int handler1(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_requ
         return UBUS_STATUS_INVALID_ARGUMENT;
     }
 
-    // TODO: Use params struct here
-    // Example: int32_t id = params.id;
+    return handler1(ctx, obj, req, SIMPLE_TEST_METHOD_HELLO3, &params);
+}
 
-    // Custom handler from handler1
-    // Include your custom handler implementation here
-    // #include "handler1.c"
+static int simple_test_hello5_thunk(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct simple_test_hello1 params;
 
-    // Call custom handler function
-    // return handler1_impl(ctx, obj, req, method, msg, ...);
+    if (simple_test_hello1_deserialize(msg, &params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
 
-    return UBUS_STATUS_OK;
+    return handler1(ctx, obj, req, SIMPLE_TEST_METHOD_HELLO5, &params);
 }
 
 static const struct ubus_method simple_test_methods[] = {
     UBUS_METHOD("hello", simple_test_hello_handler, simple_test_hello_policy),
     UBUS_METHOD_NOARG("hello1", simple_test_hello1_handler),
     UBUS_METHOD("hello2", simple_test_hello2_handler, simple_test_hello1_policy),
-    UBUS_METHOD("hello3", handler1, simple_test_hello1_policy),
-    UBUS_METHOD("hello4", simple_test_hello4_handler, hello_common_policy)
+    UBUS_METHOD("hello3", simple_test_hello3_thunk, simple_test_hello1_policy),
+    UBUS_METHOD("hello4", simple_test_hello4_handler, hello_common_policy),
+    UBUS_METHOD("hello5", simple_test_hello5_thunk, simple_test_hello1_policy)
 };
 
 static struct ubus_object_type simple_test_object_type =
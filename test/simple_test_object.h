@@ -6,29 +6,51 @@
 #include <libubus.h>
 #include <stdint.h>
 
-/* Helper macros for optional field operations */
-#define UBUS_IDL_HAS_FIELD(params, index) ((params)->has_fields & (1U << index))
-#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (1U << index))
-#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~(1U << index))
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
 
 
 struct hello_common {
-    int32_t id;
     const char * msg;
-    unsigned int has_fields;
+    int32_t id;
+    uint8_t has_fields;
 };
+#define HELLO_COMMON_HAS_MSG 0
+_Static_assert(sizeof(struct hello_common) == UBUS_IDL_PACKED_SIZE(struct hello_common, sizeof(const char *) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct hello_common has padding between members");
 
 struct simple_test_hello1 {
-    int32_t id;
     const char * msg;
-    unsigned int has_fields;
+    int32_t id;
+    uint8_t has_fields;
 };
+#define SIMPLE_TEST_HELLO1_HAS_MSG 0
+_Static_assert(sizeof(struct simple_test_hello1) == UBUS_IDL_PACKED_SIZE(struct simple_test_hello1, sizeof(const char *) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct simple_test_hello1 has padding between members");
 
 struct simple_test_hello_params {
-    int32_t id;
     const char * msg;
-    unsigned int has_fields;
+    int32_t id;
+    uint8_t has_fields;
 };
+#define SIMPLE_TEST_HELLO_HAS_ID 0
+_Static_assert(sizeof(struct simple_test_hello_params) == UBUS_IDL_PACKED_SIZE(struct simple_test_hello_params, sizeof(const char *) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct simple_test_hello_params has padding between members");
 
 enum {
     SIMPLE_TEST_HELLO_ID,
@@ -48,11 +70,22 @@ enum {
     __HELLO_COMMON_MAX
 };
 
+enum simple_test_method {
+    SIMPLE_TEST_METHOD_HELLO,
+    SIMPLE_TEST_METHOD_HELLO1,
+    SIMPLE_TEST_METHOD_HELLO2,
+    SIMPLE_TEST_METHOD_HELLO3,
+    SIMPLE_TEST_METHOD_HELLO4,
+    SIMPLE_TEST_METHOD_HELLO5,
+    __SIMPLE_TEST_METHOD_MAX
+};
+
 int simple_test_hello_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
 int simple_test_hello1_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
 int simple_test_hello2_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
-int handler1(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
 int simple_test_hello4_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+/* Custom handlers, called by a generated thunk with the method and its decoded params */
+int handler1(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, enum simple_test_method method, const struct simple_test_hello1 *params);
 
 int simple_test_hello_deserialize(struct blob_attr *msg, struct simple_test_hello_params *params);
 int simple_test_hello_serialize(struct blob_buf *b, const struct simple_test_hello_params *params);
@@ -61,6 +94,14 @@ int simple_test_hello1_serialize(struct blob_buf *b, const struct simple_test_he
 int hello_common_deserialize(struct blob_attr *msg, struct hello_common *params);
 int hello_common_serialize(struct blob_buf *b, const struct hello_common *params);
 
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct simple_test_hello_params *simple_test_hello_dup(const struct simple_test_hello_params *params);
+void simple_test_hello_free(struct simple_test_hello_params *params);
+struct simple_test_hello1 *simple_test_hello1_dup(const struct simple_test_hello1 *params);
+void simple_test_hello1_free(struct simple_test_hello1 *params);
+struct hello_common *hello_common_dup(const struct hello_common *params);
+void hello_common_free(struct hello_common *params);
+
 extern struct ubus_object simple_test_object;
 
 #endif /* __SIMPLE_TEST_OBJECT_H__ */
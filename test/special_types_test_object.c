@@ -2,21 +2,23 @@
 
 #include <libubox/blobmsg_json.h>
 #include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
 #include "special_types_test_object.h"
 
 /* Helper macros for optional field deserialization */
-#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, mask) \
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
     do { \
         if ((tb)[(enum)]) { \
             (field) = blobmsg_get_##type((tb)[(enum)]); \
-            UBUS_IDL_SET_FIELD((params), (mask)); \
+            UBUS_IDL_SET_##kind((params), (index)); \
         } \
     } while (0)
 
 /* Helper macros for optional field serialization */
-#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, mask) \
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
     do { \
-        if (UBUS_IDL_HAS_FIELD((params), (mask))) { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
             blobmsg_add_##type((b), (name), (field)); \
         } \
     } while (0)
@@ -30,6 +32,16 @@
         } \
     } while (0)
 
+/* Copy a blob to the cursor of a *_dup() allocation, blobs go first after the struct to stay aligned */
+static struct blob_attr *ubus_idl_dup_blob(char **p, const struct blob_attr *attr)
+{
+    struct blob_attr *copy = (struct blob_attr *)*p;
+
+    memcpy(copy, attr, blob_pad_len(attr));
+    *p += blob_pad_len(attr);
+    return copy;
+}
+
 static const struct blobmsg_policy special_types_test_array_policy[] = {
     [SPECIAL_TYPES_TEST_ARRAY_ARRAY_VAL] = { .name = "array_val", .type = BLOBMSG_TYPE_ARRAY }
 };
@@ -63,6 +75,32 @@ int special_types_test_array_serialize(struct blob_buf *b, const struct special_
     return UBUS_STATUS_OK;
 }
 
+struct special_types_test_array_params *special_types_test_array_dup(const struct special_types_test_array_params *params)
+{
+    size_t len = sizeof(*params);
+    struct special_types_test_array_params *copy;
+    char *p;
+
+    if (params->array_val) {
+        len += blob_pad_len(params->array_val);
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->array_val = params->array_val ? ubus_idl_dup_blob(&p, params->array_val) : NULL;
+    return copy;
+}
+
+void special_types_test_array_free(struct special_types_test_array_params *params)
+{
+    free(params);
+}
+
 static const struct blobmsg_policy special_types_test_unspec_policy[] = {
     [SPECIAL_TYPES_TEST_UNSPEC_UNSPEC_VAL] = { .name = "unspec_val", .type = BLOBMSG_TYPE_UNSPEC }
 };
@@ -96,6 +134,32 @@ int special_types_test_unspec_serialize(struct blob_buf *b, const struct special
     return UBUS_STATUS_OK;
 }
 
+struct special_types_test_unspec_params *special_types_test_unspec_dup(const struct special_types_test_unspec_params *params)
+{
+    size_t len = sizeof(*params);
+    struct special_types_test_unspec_params *copy;
+    char *p;
+
+    if (params->unspec_val) {
+        len += blob_pad_len(params->unspec_val);
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->unspec_val = params->unspec_val ? ubus_idl_dup_blob(&p, params->unspec_val) : NULL;
+    return copy;
+}
+
+void special_types_test_unspec_free(struct special_types_test_unspec_params *params)
+{
+    free(params);
+}
+
 static const struct blobmsg_policy special_types_test_table_policy[] = {
     [SPECIAL_TYPES_TEST_TABLE_TABLE_VAL] = { .name = "table_val", .type = BLOBMSG_TYPE_TABLE }
 };
@@ -125,6 +189,26 @@ int special_types_test_table_serialize(struct blob_buf *b, const struct special_
     return UBUS_STATUS_OK;
 }
 
+struct special_types_test_table_params *special_types_test_table_dup(const struct special_types_test_table_params *params)
+{
+    size_t len = sizeof(*params);
+    struct special_types_test_table_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    copy->table_val = NULL;
+    return copy;
+}
+
+void special_types_test_table_free(struct special_types_test_table_params *params)
+{
+    free(params);
+}
+
 static const struct blobmsg_policy special_types_test_all_special_policy[] = {
     [SPECIAL_TYPES_TEST_ALL_SPECIAL_ARRAY_VAL] = { .name = "array_val", .type = BLOBMSG_TYPE_ARRAY },
     [SPECIAL_TYPES_TEST_ALL_SPECIAL_UNSPEC_VAL] = { .name = "unspec_val", .type = BLOBMSG_TYPE_UNSPEC },
@@ -175,6 +259,37 @@ int special_types_test_all_special_serialize(struct blob_buf *b, const struct sp
     return UBUS_STATUS_OK;
 }
 
+struct special_types_test_all_special_params *special_types_test_all_special_dup(const struct special_types_test_all_special_params *params)
+{
+    size_t len = sizeof(*params);
+    struct special_types_test_all_special_params *copy;
+    char *p;
+
+    if (params->array_val) {
+        len += blob_pad_len(params->array_val);
+    }
+    if (params->unspec_val) {
+        len += blob_pad_len(params->unspec_val);
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->array_val = params->array_val ? ubus_idl_dup_blob(&p, params->array_val) : NULL;
+    copy->unspec_val = params->unspec_val ? ubus_idl_dup_blob(&p, params->unspec_val) : NULL;
+    copy->table_val = NULL;
+    return copy;
+}
+
+void special_types_test_all_special_free(struct special_types_test_all_special_params *params)
+{
+    free(params);
+}
+
 static const struct ubus_method special_types_test_methods[] = {
     UBUS_METHOD("array", special_types_test_array_handler, special_types_test_array_policy),
     UBUS_METHOD("unspec", special_types_test_unspec_handler, special_types_test_unspec_policy),
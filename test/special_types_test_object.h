@@ -6,29 +6,50 @@
 #include <libubus.h>
 #include <stdint.h>
 
-/* Helper macros for optional field operations */
-#define UBUS_IDL_HAS_FIELD(params, index) ((params)->has_fields & (1U << index))
-#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (1U << index))
-#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~(1U << index))
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
 
 
 struct special_types_test_array_params {
     struct blob_attr * array_val;
 };
+_Static_assert(sizeof(struct special_types_test_array_params) == UBUS_IDL_PACKED_SIZE(struct special_types_test_array_params, sizeof(struct blob_attr *)),
+               "struct special_types_test_array_params has padding between members");
 
 struct special_types_test_unspec_params {
     struct blob_attr * unspec_val;
 };
+_Static_assert(sizeof(struct special_types_test_unspec_params) == UBUS_IDL_PACKED_SIZE(struct special_types_test_unspec_params, sizeof(struct blob_attr *)),
+               "struct special_types_test_unspec_params has padding between members");
 
 struct special_types_test_table_params {
     struct custom_table_type * table_val;
 };
+_Static_assert(sizeof(struct special_types_test_table_params) == UBUS_IDL_PACKED_SIZE(struct special_types_test_table_params, sizeof(struct custom_table_type *)),
+               "struct special_types_test_table_params has padding between members");
 
 struct special_types_test_all_special_params {
     struct blob_attr * array_val;
     struct blob_attr * unspec_val;
     struct custom_table_type * table_val;
 };
+_Static_assert(sizeof(struct special_types_test_all_special_params) == UBUS_IDL_PACKED_SIZE(struct special_types_test_all_special_params, 2 * sizeof(struct blob_attr *) + sizeof(struct custom_table_type *)),
+               "struct special_types_test_all_special_params has padding between members");
 
 enum {
     SPECIAL_TYPES_TEST_ARRAY_ARRAY_VAL,
@@ -66,6 +87,16 @@ int special_types_test_table_serialize(struct blob_buf *b, const struct special_
 int special_types_test_all_special_deserialize(struct blob_attr *msg, struct special_types_test_all_special_params *params);
 int special_types_test_all_special_serialize(struct blob_buf *b, const struct special_types_test_all_special_params *params);
 
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct special_types_test_array_params *special_types_test_array_dup(const struct special_types_test_array_params *params);
+void special_types_test_array_free(struct special_types_test_array_params *params);
+struct special_types_test_unspec_params *special_types_test_unspec_dup(const struct special_types_test_unspec_params *params);
+void special_types_test_unspec_free(struct special_types_test_unspec_params *params);
+struct special_types_test_table_params *special_types_test_table_dup(const struct special_types_test_table_params *params);
+void special_types_test_table_free(struct special_types_test_table_params *params);
+struct special_types_test_all_special_params *special_types_test_all_special_dup(const struct special_types_test_all_special_params *params);
+void special_types_test_all_special_free(struct special_types_test_all_special_params *params);
+
 extern struct ubus_object special_types_test_object;
 
 #endif /* __SPECIAL_TYPES_TEST_OBJECT_H__ */
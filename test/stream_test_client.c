@@ -0,0 +1,727 @@
+/* Generated from ubus IDL - stream_test client */
+
+#include <libubox/blobmsg.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "stream_test_client.h"
+
+static const struct blobmsg_policy stream_test_client_remove_policy[] = {
+    { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+};
+
+/* Each reply of a @stream method carries a chunk of items */
+static const struct blobmsg_policy stream_test_client_chunk_policy[] = {
+    { .name = "items", .type = BLOBMSG_TYPE_ARRAY },
+};
+
+/* Drop the cached object id, the next call looks the object up again */
+static void stream_test_client_forget(struct stream_test_client *client)
+{
+    client->id = 0;
+}
+
+static int stream_test_client_resolve(struct stream_test_client *client)
+{
+    int ret;
+
+    if (client->id) {
+        return UBUS_STATUS_OK;
+    }
+
+    ret = ubus_lookup_id(client->ctx, "stream_test", &client->id);
+    if (ret != UBUS_STATUS_OK) {
+        client->id = 0;
+        return ret;
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static void stream_test_client_remove_cb(struct ubus_context *ctx, struct ubus_event_handler *ev, const char *type, struct blob_attr *msg)
+{
+    struct stream_test_client *client = container_of(ev, struct stream_test_client, remove_ev);
+    struct blob_attr *tb[ARRAY_SIZE(stream_test_client_remove_policy)];
+
+    blobmsg_parse(stream_test_client_remove_policy, ARRAY_SIZE(stream_test_client_remove_policy), tb, blob_data(msg), blob_len(msg));
+
+    if (tb[0] && blobmsg_get_u32(tb[0]) == client->id) {
+        stream_test_client_forget(client);
+    }
+}
+
+static void stream_test_client_data_cb(struct ubus_request *req, int type, struct blob_attr *msg)
+{
+    struct stream_test_client *client = req->priv;
+
+    // @stream replies are decoded chunk by chunk as they arrive, nothing is kept
+    if (client->chunk) {
+        if (msg && client->chunk_status == UBUS_STATUS_OK) {
+            client->chunk_status = client->chunk(client, msg, client->chunk_cb, client->chunk_priv);
+        }
+        return;
+    }
+
+    // The reply is only valid during the callback, keep a copy for the deserializer
+    free(client->reply_msg);
+    client->reply_msg = msg ? blob_memdup(msg) : NULL;
+}
+
+static int stream_test_client_invoke(struct stream_test_client *client, const char *method, int timeout)
+{
+    int retry;
+    int ret;
+
+    free(client->reply_msg);
+    client->reply_msg = NULL;
+
+    for (retry = 0; retry < 2; retry++) {
+        ret = stream_test_client_resolve(client);
+        if (ret != UBUS_STATUS_OK) {
+            return ret;
+        }
+
+        ret = ubus_invoke(client->ctx, client->id, method, client->buf.head, stream_test_client_data_cb, client, timeout);
+
+        // The object was re-registered before the remove event arrived, look it up again
+        if (ret != UBUS_STATUS_NOT_FOUND) {
+            break;
+        }
+        stream_test_client_forget(client);
+    }
+
+    return ret;
+}
+
+/* Pipelined request, queued until the in-flight cap allows sending it */
+struct stream_test_client_async {
+    struct list_head list;
+    struct stream_test_client *client;
+    struct ubus_request req;
+    struct uloop_timeout timeout;
+    const char *method;
+    struct blob_attr *msg;
+    struct blob_attr *reply_msg;
+    int (*chunk)(struct stream_test_client *client, struct blob_attr *msg, void (*cb)(void), void *priv);
+    void (*chunk_cb)(void);
+    int chunk_status;
+    int timeout_ms;
+    void (*complete)(struct stream_test_client_async *areq, int status);
+    void (*cb)(void);
+    void *priv;
+};
+
+static void stream_test_client_async_free(struct stream_test_client_async *areq)
+{
+    free(areq->msg);
+    free(areq->reply_msg);
+    free(areq);
+}
+
+static void stream_test_client_async_finish(struct stream_test_client_async *areq, int status)
+{
+    if (status == UBUS_STATUS_NOT_FOUND) {
+        stream_test_client_forget(areq->client);
+    }
+
+    areq->complete(areq, status);
+    stream_test_client_async_free(areq);
+}
+
+static void stream_test_client_async_kick(struct stream_test_client *client);
+
+static void stream_test_client_async_data_cb(struct ubus_request *req, int type, struct blob_attr *msg)
+{
+    struct stream_test_client_async *areq = req->priv;
+
+    if (areq->chunk) {
+        if (msg && areq->chunk_status == UBUS_STATUS_OK) {
+            areq->chunk_status = areq->chunk(areq->client, msg, areq->chunk_cb, areq->priv);
+        }
+        return;
+    }
+
+    free(areq->reply_msg);
+    areq->reply_msg = msg ? blob_memdup(msg) : NULL;
+}
+
+static void stream_test_client_async_complete_cb(struct ubus_request *req, int ret)
+{
+    struct stream_test_client_async *areq = req->priv;
+    struct stream_test_client *client = areq->client;
+
+    uloop_timeout_cancel(&areq->timeout);
+    list_del(&areq->list);
+    client->n_active--;
+
+    // A chunk that failed to decode fails the whole @stream call
+    if (ret == UBUS_STATUS_OK && areq->chunk) {
+        ret = areq->chunk_status;
+    }
+
+    stream_test_client_async_finish(areq, ret);
+    stream_test_client_async_kick(client);
+}
+
+static void stream_test_client_async_timeout_cb(struct uloop_timeout *t)
+{
+    struct stream_test_client_async *areq = container_of(t, struct stream_test_client_async, timeout);
+    struct stream_test_client *client = areq->client;
+
+    // Aborting does not run the complete callback, finish the request here
+    ubus_abort_request(client->ctx, &areq->req);
+    list_del(&areq->list);
+    client->n_active--;
+
+    stream_test_client_async_finish(areq, UBUS_STATUS_TIMEOUT);
+    stream_test_client_async_kick(client);
+}
+
+static int stream_test_client_async_start(struct stream_test_client *client, struct stream_test_client_async *areq)
+{
+    int ret;
+
+    ret = stream_test_client_resolve(client);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = ubus_invoke_async(client->ctx, client->id, areq->method, areq->msg, &areq->req);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    areq->req.data_cb = stream_test_client_async_data_cb;
+    areq->req.complete_cb = stream_test_client_async_complete_cb;
+    areq->req.priv = areq;
+    ubus_complete_request_async(client->ctx, &areq->req);
+
+    if (areq->timeout_ms > 0) {
+        areq->timeout.cb = stream_test_client_async_timeout_cb;
+        uloop_timeout_set(&areq->timeout, areq->timeout_ms);
+    }
+
+    list_add_tail(&areq->list, &client->active);
+    client->n_active++;
+
+    return UBUS_STATUS_OK;
+}
+
+/* Send queued requests while the in-flight cap allows it */
+static void stream_test_client_async_kick(struct stream_test_client *client)
+{
+    struct stream_test_client_async *areq;
+    int ret;
+
+    while (client->n_active < client->max_inflight && !list_empty(&client->queued)) {
+        areq = list_first_entry(&client->queued, struct stream_test_client_async, list);
+        list_del(&areq->list);
+
+        ret = stream_test_client_async_start(client, areq);
+        if (ret != UBUS_STATUS_OK) {
+            stream_test_client_async_finish(areq, ret);
+        }
+    }
+}
+
+static int stream_test_client_async_submit(struct stream_test_client *client, const char *method, int cache_method, void (*complete)(struct stream_test_client_async *areq, int status), void (*cb)(void), int (*chunk)(struct stream_test_client *client, struct blob_attr *msg, void (*cb)(void), void *priv), void (*chunk_cb)(void), void *priv, int timeout)
+{
+    struct stream_test_client_async *areq;
+
+    (void)cache_method;
+
+    areq = calloc(1, sizeof(*areq));
+    if (!areq) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    areq->client = client;
+    areq->method = method;
+    areq->timeout_ms = timeout;
+    areq->complete = complete;
+    areq->cb = cb;
+    areq->chunk = chunk;
+    areq->chunk_cb = chunk_cb;
+    areq->priv = priv;
+
+    // The request buffer is reused by the next call, keep a copy until it is sent
+    areq->msg = blob_memdup(client->buf.head);
+    if (!areq->msg) {
+        free(areq);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    list_add_tail(&areq->list, &client->queued);
+
+    stream_test_client_async_kick(client);
+
+    return UBUS_STATUS_OK;
+}
+
+int stream_test_client_init(struct stream_test_client *client, struct ubus_context *ctx)
+{
+    memset(client, 0, sizeof(*client));
+    client->ctx = ctx;
+    client->remove_ev.cb = stream_test_client_remove_cb;
+    INIT_LIST_HEAD(&client->queued);
+    INIT_LIST_HEAD(&client->active);
+    client->max_inflight = STREAM_TEST_CLIENT_MAX_INFLIGHT;
+
+    return ubus_register_event_handler(ctx, &client->remove_ev, "ubus.object.remove");
+}
+
+void stream_test_client_free(struct stream_test_client *client)
+{
+    struct stream_test_client_async *areq;
+    struct stream_test_client_async *tmp;
+
+    // Pending requests are dropped without running their callbacks
+    list_for_each_entry_safe(areq, tmp, &client->active, list) {
+        uloop_timeout_cancel(&areq->timeout);
+        ubus_abort_request(client->ctx, &areq->req);
+        list_del(&areq->list);
+        stream_test_client_async_free(areq);
+    }
+    list_for_each_entry_safe(areq, tmp, &client->queued, list) {
+        list_del(&areq->list);
+        stream_test_client_async_free(areq);
+    }
+    client->n_active = 0;
+
+    ubus_unregister_event_handler(client->ctx, &client->remove_ev);
+    blob_buf_free(&client->buf);
+    blob_buf_free(&client->chunk_buf);
+    free(client->reply_msg);
+    client->reply_msg = NULL;
+    client->id = 0;
+}
+
+/* Decode one leases reply and pass its items to the chunk callback */
+static int stream_test_call_leases_chunk(struct stream_test_client *client, struct blob_attr *msg, void (*cb)(void), void *priv)
+{
+    stream_test_call_leases_chunk_cb chunk_cb = (stream_test_call_leases_chunk_cb)cb;
+    struct blob_attr *tb[ARRAY_SIZE(stream_test_client_chunk_policy)];
+    struct lease *items;
+    struct blob_attr *cur;
+    size_t n_items = 0;
+    size_t rem;
+    int ret = UBUS_STATUS_OK;
+
+    blobmsg_parse(stream_test_client_chunk_policy, ARRAY_SIZE(stream_test_client_chunk_policy), tb, blob_data(msg), blob_len(msg));
+    if (!tb[0]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    // The deserializer takes plain blob attributes, re-frame the item tables as such
+    blob_buf_init(&client->chunk_buf, 0);
+    blobmsg_for_each_attr(cur, tb[0], rem) {
+        if (blobmsg_type(cur) != BLOBMSG_TYPE_TABLE) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        if (!blob_put(&client->chunk_buf, 0, blobmsg_data(cur), blobmsg_data_len(cur))) {
+            return UBUS_STATUS_UNKNOWN_ERROR;
+        }
+        n_items++;
+    }
+    if (!n_items) {
+        return UBUS_STATUS_OK;
+    }
+
+    items = calloc(n_items, sizeof(*items));
+    if (!items) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    n_items = 0;
+    blob_for_each_attr(cur, client->chunk_buf.head, rem) {
+        ret = lease_deserialize(cur, &items[n_items++]);
+        if (ret != UBUS_STATUS_OK) {
+            break;
+        }
+    }
+
+    // Strings in the items point into the client and are only valid during the callback
+    if (ret == UBUS_STATUS_OK) {
+        chunk_cb(client, items, n_items, priv);
+    }
+
+    free(items);
+    return ret;
+}
+
+/* Decode one routes reply and pass its items to the chunk callback */
+static int stream_test_call_routes_chunk(struct stream_test_client *client, struct blob_attr *msg, void (*cb)(void), void *priv)
+{
+    stream_test_call_routes_chunk_cb chunk_cb = (stream_test_call_routes_chunk_cb)cb;
+    struct blob_attr *tb[ARRAY_SIZE(stream_test_client_chunk_policy)];
+    struct stream_test_route *items;
+    struct blob_attr *cur;
+    size_t n_items = 0;
+    size_t rem;
+    int ret = UBUS_STATUS_OK;
+
+    blobmsg_parse(stream_test_client_chunk_policy, ARRAY_SIZE(stream_test_client_chunk_policy), tb, blob_data(msg), blob_len(msg));
+    if (!tb[0]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    // The deserializer takes plain blob attributes, re-frame the item tables as such
+    blob_buf_init(&client->chunk_buf, 0);
+    blobmsg_for_each_attr(cur, tb[0], rem) {
+        if (blobmsg_type(cur) != BLOBMSG_TYPE_TABLE) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        if (!blob_put(&client->chunk_buf, 0, blobmsg_data(cur), blobmsg_data_len(cur))) {
+            return UBUS_STATUS_UNKNOWN_ERROR;
+        }
+        n_items++;
+    }
+    if (!n_items) {
+        return UBUS_STATUS_OK;
+    }
+
+    items = calloc(n_items, sizeof(*items));
+    if (!items) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    n_items = 0;
+    blob_for_each_attr(cur, client->chunk_buf.head, rem) {
+        ret = stream_test_route_deserialize(cur, &items[n_items++]);
+        if (ret != UBUS_STATUS_OK) {
+            break;
+        }
+    }
+
+    // Strings in the items point into the client and are only valid during the callback
+    if (ret == UBUS_STATUS_OK) {
+        chunk_cb(client, items, n_items, priv);
+    }
+
+    free(items);
+    return ret;
+}
+
+/* Decode one dump reply and pass its items to the chunk callback */
+static int stream_test_call_dump_chunk(struct stream_test_client *client, struct blob_attr *msg, void (*cb)(void), void *priv)
+{
+    stream_test_call_dump_chunk_cb chunk_cb = (stream_test_call_dump_chunk_cb)cb;
+    struct blob_attr *tb[ARRAY_SIZE(stream_test_client_chunk_policy)];
+    struct stream_test_route *items;
+    struct blob_attr *cur;
+    size_t n_items = 0;
+    size_t rem;
+    int ret = UBUS_STATUS_OK;
+
+    blobmsg_parse(stream_test_client_chunk_policy, ARRAY_SIZE(stream_test_client_chunk_policy), tb, blob_data(msg), blob_len(msg));
+    if (!tb[0]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    // The deserializer takes plain blob attributes, re-frame the item tables as such
+    blob_buf_init(&client->chunk_buf, 0);
+    blobmsg_for_each_attr(cur, tb[0], rem) {
+        if (blobmsg_type(cur) != BLOBMSG_TYPE_TABLE) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        if (!blob_put(&client->chunk_buf, 0, blobmsg_data(cur), blobmsg_data_len(cur))) {
+            return UBUS_STATUS_UNKNOWN_ERROR;
+        }
+        n_items++;
+    }
+    if (!n_items) {
+        return UBUS_STATUS_OK;
+    }
+
+    items = calloc(n_items, sizeof(*items));
+    if (!items) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    n_items = 0;
+    blob_for_each_attr(cur, client->chunk_buf.head, rem) {
+        ret = stream_test_route_deserialize(cur, &items[n_items++]);
+        if (ret != UBUS_STATUS_OK) {
+            break;
+        }
+    }
+
+    // Strings in the items point into the client and are only valid during the callback
+    if (ret == UBUS_STATUS_OK) {
+        chunk_cb(client, items, n_items, priv);
+    }
+
+    free(items);
+    return ret;
+}
+
+/* Decode one neighbors reply and pass its items to the chunk callback */
+static int stream_test_call_neighbors_chunk(struct stream_test_client *client, struct blob_attr *msg, void (*cb)(void), void *priv)
+{
+    stream_test_call_neighbors_chunk_cb chunk_cb = (stream_test_call_neighbors_chunk_cb)cb;
+    struct blob_attr *tb[ARRAY_SIZE(stream_test_client_chunk_policy)];
+    struct lease *items;
+    struct blob_attr *cur;
+    size_t n_items = 0;
+    size_t rem;
+    int ret = UBUS_STATUS_OK;
+
+    blobmsg_parse(stream_test_client_chunk_policy, ARRAY_SIZE(stream_test_client_chunk_policy), tb, blob_data(msg), blob_len(msg));
+    if (!tb[0]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    // The deserializer takes plain blob attributes, re-frame the item tables as such
+    blob_buf_init(&client->chunk_buf, 0);
+    blobmsg_for_each_attr(cur, tb[0], rem) {
+        if (blobmsg_type(cur) != BLOBMSG_TYPE_TABLE) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+        if (!blob_put(&client->chunk_buf, 0, blobmsg_data(cur), blobmsg_data_len(cur))) {
+            return UBUS_STATUS_UNKNOWN_ERROR;
+        }
+        n_items++;
+    }
+    if (!n_items) {
+        return UBUS_STATUS_OK;
+    }
+
+    items = calloc(n_items, sizeof(*items));
+    if (!items) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    n_items = 0;
+    blob_for_each_attr(cur, client->chunk_buf.head, rem) {
+        ret = lease_deserialize(cur, &items[n_items++]);
+        if (ret != UBUS_STATUS_OK) {
+            break;
+        }
+    }
+
+    // Strings in the items point into the client and are only valid during the callback
+    if (ret == UBUS_STATUS_OK) {
+        chunk_cb(client, items, n_items, priv);
+    }
+
+    free(items);
+    return ret;
+}
+
+int stream_test_call_leases(struct stream_test_client *client, const struct stream_test_leases_params *params, stream_test_call_leases_chunk_cb chunk_cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = stream_test_leases_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    // Replies are passed to chunk_cb as they arrive, until the request completes
+    client->chunk = stream_test_call_leases_chunk;
+    client->chunk_cb = (void (*)(void))chunk_cb;
+    client->chunk_priv = priv;
+    client->chunk_status = UBUS_STATUS_OK;
+    ret = stream_test_client_invoke(client, "leases", timeout);
+    client->chunk = NULL;
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return client->chunk_status;
+}
+
+int stream_test_call_routes(struct stream_test_client *client, stream_test_call_routes_chunk_cb chunk_cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+
+    // Replies are passed to chunk_cb as they arrive, until the request completes
+    client->chunk = stream_test_call_routes_chunk;
+    client->chunk_cb = (void (*)(void))chunk_cb;
+    client->chunk_priv = priv;
+    client->chunk_status = UBUS_STATUS_OK;
+    ret = stream_test_client_invoke(client, "routes", timeout);
+    client->chunk = NULL;
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return client->chunk_status;
+}
+
+int stream_test_call_dump(struct stream_test_client *client, const struct stream_test_dump_params *params, stream_test_call_dump_chunk_cb chunk_cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = stream_test_dump_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    // Replies are passed to chunk_cb as they arrive, until the request completes
+    client->chunk = stream_test_call_dump_chunk;
+    client->chunk_cb = (void (*)(void))chunk_cb;
+    client->chunk_priv = priv;
+    client->chunk_status = UBUS_STATUS_OK;
+    ret = stream_test_client_invoke(client, "dump", timeout);
+    client->chunk = NULL;
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return client->chunk_status;
+}
+
+int stream_test_call_neighbors(struct stream_test_client *client, const struct stream_test_neighbors_params *params, stream_test_call_neighbors_chunk_cb chunk_cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = stream_test_neighbors_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    // Replies are passed to chunk_cb as they arrive, until the request completes
+    client->chunk = stream_test_call_neighbors_chunk;
+    client->chunk_cb = (void (*)(void))chunk_cb;
+    client->chunk_priv = priv;
+    client->chunk_status = UBUS_STATUS_OK;
+    ret = stream_test_client_invoke(client, "neighbors", timeout);
+    client->chunk = NULL;
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return client->chunk_status;
+}
+
+int stream_test_call_count(struct stream_test_client *client, const struct stream_test_count_params *params, struct lease *reply, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = stream_test_count_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = stream_test_client_invoke(client, "count", timeout);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    if (!client->reply_msg) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    // Strings in the reply point into the client and stay valid until its next call
+    return lease_deserialize(client->reply_msg, reply);
+}
+
+static void stream_test_call_leases_async_complete(struct stream_test_client_async *areq, int status)
+{
+    stream_test_call_leases_cb cb = (stream_test_call_leases_cb)areq->cb;
+
+    cb(areq->client, status, areq->priv);
+}
+
+int stream_test_call_leases_async(struct stream_test_client *client, const struct stream_test_leases_params *params, stream_test_call_leases_chunk_cb chunk_cb, stream_test_call_leases_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = stream_test_leases_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return stream_test_client_async_submit(client, "leases", -1, stream_test_call_leases_async_complete, (void (*)(void))cb, stream_test_call_leases_chunk, (void (*)(void))chunk_cb, priv, timeout);
+}
+
+static void stream_test_call_routes_async_complete(struct stream_test_client_async *areq, int status)
+{
+    stream_test_call_routes_cb cb = (stream_test_call_routes_cb)areq->cb;
+
+    cb(areq->client, status, areq->priv);
+}
+
+int stream_test_call_routes_async(struct stream_test_client *client, stream_test_call_routes_chunk_cb chunk_cb, stream_test_call_routes_cb cb, void *priv, int timeout)
+{
+    blob_buf_init(&client->buf, 0);
+
+    return stream_test_client_async_submit(client, "routes", -1, stream_test_call_routes_async_complete, (void (*)(void))cb, stream_test_call_routes_chunk, (void (*)(void))chunk_cb, priv, timeout);
+}
+
+static void stream_test_call_dump_async_complete(struct stream_test_client_async *areq, int status)
+{
+    stream_test_call_dump_cb cb = (stream_test_call_dump_cb)areq->cb;
+
+    cb(areq->client, status, areq->priv);
+}
+
+int stream_test_call_dump_async(struct stream_test_client *client, const struct stream_test_dump_params *params, stream_test_call_dump_chunk_cb chunk_cb, stream_test_call_dump_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = stream_test_dump_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return stream_test_client_async_submit(client, "dump", -1, stream_test_call_dump_async_complete, (void (*)(void))cb, stream_test_call_dump_chunk, (void (*)(void))chunk_cb, priv, timeout);
+}
+
+static void stream_test_call_neighbors_async_complete(struct stream_test_client_async *areq, int status)
+{
+    stream_test_call_neighbors_cb cb = (stream_test_call_neighbors_cb)areq->cb;
+
+    cb(areq->client, status, areq->priv);
+}
+
+int stream_test_call_neighbors_async(struct stream_test_client *client, const struct stream_test_neighbors_params *params, stream_test_call_neighbors_chunk_cb chunk_cb, stream_test_call_neighbors_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = stream_test_neighbors_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return stream_test_client_async_submit(client, "neighbors", -1, stream_test_call_neighbors_async_complete, (void (*)(void))cb, stream_test_call_neighbors_chunk, (void (*)(void))chunk_cb, priv, timeout);
+}
+
+static void stream_test_call_count_async_complete(struct stream_test_client_async *areq, int status)
+{
+    stream_test_call_count_cb cb = (stream_test_call_count_cb)areq->cb;
+    struct lease reply;
+
+    memset(&reply, 0, sizeof(reply));
+    if (status == UBUS_STATUS_OK && !areq->reply_msg) {
+        status = UBUS_STATUS_NO_DATA;
+    }
+    if (status == UBUS_STATUS_OK) {
+        status = lease_deserialize(areq->reply_msg, &reply);
+    }
+
+    // The reply is only valid during the callback
+    cb(areq->client, status, status == UBUS_STATUS_OK ? &reply : NULL, areq->priv);
+}
+
+int stream_test_call_count_async(struct stream_test_client *client, const struct stream_test_count_params *params, stream_test_call_count_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = stream_test_count_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return stream_test_client_async_submit(client, "count", -1, stream_test_call_count_async_complete, (void (*)(void))cb, NULL, NULL, priv, timeout);
+}
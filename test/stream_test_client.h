@@ -0,0 +1,57 @@
+/* Generated from ubus IDL - stream_test client */
+
+#ifndef __STREAM_TEST_CLIENT_H__
+#define __STREAM_TEST_CLIENT_H__
+
+#include <libubus.h>
+#include "stream_test_object.h"
+
+/* Default cap of pipelined requests in flight per client */
+#ifndef STREAM_TEST_CLIENT_MAX_INFLIGHT
+#define STREAM_TEST_CLIENT_MAX_INFLIGHT 16
+#endif
+
+struct stream_test_client {
+    struct ubus_context *ctx;
+    uint32_t id;
+    struct ubus_event_handler remove_ev;
+    struct blob_buf buf;
+    struct blob_attr *reply_msg;
+    struct blob_buf chunk_buf;
+    int (*chunk)(struct stream_test_client *client, struct blob_attr *msg, void (*cb)(void), void *priv);
+    void (*chunk_cb)(void);
+    void *chunk_priv;
+    int chunk_status;
+    struct list_head queued;
+    struct list_head active;
+    unsigned int n_active;
+    unsigned int max_inflight;
+};
+
+typedef void (*stream_test_call_leases_cb)(struct stream_test_client *client, int status, void *priv);
+typedef void (*stream_test_call_routes_cb)(struct stream_test_client *client, int status, void *priv);
+typedef void (*stream_test_call_dump_cb)(struct stream_test_client *client, int status, void *priv);
+typedef void (*stream_test_call_neighbors_cb)(struct stream_test_client *client, int status, void *priv);
+typedef void (*stream_test_call_count_cb)(struct stream_test_client *client, int status, const struct lease *reply, void *priv);
+
+typedef void (*stream_test_call_leases_chunk_cb)(struct stream_test_client *client, const struct lease *items, size_t n_items, void *priv);
+typedef void (*stream_test_call_routes_chunk_cb)(struct stream_test_client *client, const struct stream_test_route *items, size_t n_items, void *priv);
+typedef void (*stream_test_call_dump_chunk_cb)(struct stream_test_client *client, const struct stream_test_route *items, size_t n_items, void *priv);
+typedef void (*stream_test_call_neighbors_chunk_cb)(struct stream_test_client *client, const struct lease *items, size_t n_items, void *priv);
+
+int stream_test_client_init(struct stream_test_client *client, struct ubus_context *ctx);
+void stream_test_client_free(struct stream_test_client *client);
+
+int stream_test_call_leases(struct stream_test_client *client, const struct stream_test_leases_params *params, stream_test_call_leases_chunk_cb chunk_cb, void *priv, int timeout);
+int stream_test_call_routes(struct stream_test_client *client, stream_test_call_routes_chunk_cb chunk_cb, void *priv, int timeout);
+int stream_test_call_dump(struct stream_test_client *client, const struct stream_test_dump_params *params, stream_test_call_dump_chunk_cb chunk_cb, void *priv, int timeout);
+int stream_test_call_neighbors(struct stream_test_client *client, const struct stream_test_neighbors_params *params, stream_test_call_neighbors_chunk_cb chunk_cb, void *priv, int timeout);
+int stream_test_call_count(struct stream_test_client *client, const struct stream_test_count_params *params, struct lease *reply, int timeout);
+
+int stream_test_call_leases_async(struct stream_test_client *client, const struct stream_test_leases_params *params, stream_test_call_leases_chunk_cb chunk_cb, stream_test_call_leases_cb cb, void *priv, int timeout);
+int stream_test_call_routes_async(struct stream_test_client *client, stream_test_call_routes_chunk_cb chunk_cb, stream_test_call_routes_cb cb, void *priv, int timeout);
+int stream_test_call_dump_async(struct stream_test_client *client, const struct stream_test_dump_params *params, stream_test_call_dump_chunk_cb chunk_cb, stream_test_call_dump_cb cb, void *priv, int timeout);
+int stream_test_call_neighbors_async(struct stream_test_client *client, const struct stream_test_neighbors_params *params, stream_test_call_neighbors_chunk_cb chunk_cb, stream_test_call_neighbors_cb cb, void *priv, int timeout);
+int stream_test_call_count_async(struct stream_test_client *client, const struct stream_test_count_params *params, stream_test_call_count_cb cb, void *priv, int timeout);
+
+#endif /* __STREAM_TEST_CLIENT_H__ */
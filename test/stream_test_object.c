@@ -0,0 +1,851 @@
+/* Generated from ubus IDL - stream_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "stream_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy stream_test_leases_policy[] = {
+    [STREAM_TEST_LEASES_IFACE] = { .name = "iface", .type = BLOBMSG_TYPE_STRING }
+};
+
+int stream_test_leases_deserialize(struct blob_attr *msg, struct stream_test_leases_params *params)
+{
+    struct blob_attr *tb_stream_test_leases[__STREAM_TEST_LEASES_MAX];
+    if (blobmsg_parse(stream_test_leases_policy, ARRAY_SIZE(stream_test_leases_policy), tb_stream_test_leases, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    UBUS_IDL_GET_OPTIONAL(string, tb_stream_test_leases, STREAM_TEST_LEASES_IFACE, params->iface, params, FIELD, STREAM_TEST_LEASES_HAS_IFACE);
+    return UBUS_STATUS_OK;
+}
+
+int stream_test_leases_serialize(struct blob_buf *b, const struct stream_test_leases_params *params)
+{
+    UBUS_IDL_ADD_OPTIONAL(string, b, "iface", params->iface, params, FIELD, STREAM_TEST_LEASES_HAS_IFACE);
+    return UBUS_STATUS_OK;
+}
+
+struct stream_test_leases_params *stream_test_leases_dup(const struct stream_test_leases_params *params)
+{
+    size_t len = sizeof(*params);
+    struct stream_test_leases_params *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, STREAM_TEST_LEASES_HAS_IFACE) && params->iface) {
+        len += strlen(params->iface) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->iface = UBUS_IDL_HAS_FIELD(params, STREAM_TEST_LEASES_HAS_IFACE) && params->iface ? ubus_idl_dup_string(&p, params->iface) : NULL;
+    return copy;
+}
+
+void stream_test_leases_free(struct stream_test_leases_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy stream_test_dump_policy[] = {
+    [STREAM_TEST_DUMP_TABLE] = { .name = "table", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int stream_test_dump_deserialize(struct blob_attr *msg, struct stream_test_dump_params *params)
+{
+    struct blob_attr *tb_stream_test_dump[__STREAM_TEST_DUMP_MAX];
+    if (blobmsg_parse(stream_test_dump_policy, ARRAY_SIZE(stream_test_dump_policy), tb_stream_test_dump, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_stream_test_dump[STREAM_TEST_DUMP_TABLE]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->table = blobmsg_get_u32(tb_stream_test_dump[STREAM_TEST_DUMP_TABLE]);
+    return UBUS_STATUS_OK;
+}
+
+int stream_test_dump_serialize(struct blob_buf *b, const struct stream_test_dump_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "table", params->table);
+    return UBUS_STATUS_OK;
+}
+
+struct stream_test_dump_params *stream_test_dump_dup(const struct stream_test_dump_params *params)
+{
+    size_t len = sizeof(*params);
+    struct stream_test_dump_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void stream_test_dump_free(struct stream_test_dump_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy stream_test_neighbors_policy[] = {
+    [STREAM_TEST_NEIGHBORS_IFACE] = { .name = "iface", .type = BLOBMSG_TYPE_STRING }
+};
+
+int stream_test_neighbors_deserialize(struct blob_attr *msg, struct stream_test_neighbors_params *params)
+{
+    struct blob_attr *tb_stream_test_neighbors[__STREAM_TEST_NEIGHBORS_MAX];
+    if (blobmsg_parse(stream_test_neighbors_policy, ARRAY_SIZE(stream_test_neighbors_policy), tb_stream_test_neighbors, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_stream_test_neighbors[STREAM_TEST_NEIGHBORS_IFACE]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->iface = blobmsg_get_string(tb_stream_test_neighbors[STREAM_TEST_NEIGHBORS_IFACE]);
+    return UBUS_STATUS_OK;
+}
+
+int stream_test_neighbors_serialize(struct blob_buf *b, const struct stream_test_neighbors_params *params)
+{
+    UBUS_IDL_ADD(string, b, "iface", params->iface);
+    return UBUS_STATUS_OK;
+}
+
+struct stream_test_neighbors_params *stream_test_neighbors_dup(const struct stream_test_neighbors_params *params)
+{
+    size_t len = sizeof(*params);
+    struct stream_test_neighbors_params *copy;
+    char *p;
+
+    if (params->iface) {
+        len += strlen(params->iface) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->iface = params->iface ? ubus_idl_dup_string(&p, params->iface) : NULL;
+    return copy;
+}
+
+void stream_test_neighbors_free(struct stream_test_neighbors_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy stream_test_count_policy[] = {
+    [STREAM_TEST_COUNT_IFACE] = { .name = "iface", .type = BLOBMSG_TYPE_STRING }
+};
+
+int stream_test_count_deserialize(struct blob_attr *msg, struct stream_test_count_params *params)
+{
+    struct blob_attr *tb_stream_test_count[__STREAM_TEST_COUNT_MAX];
+    if (blobmsg_parse(stream_test_count_policy, ARRAY_SIZE(stream_test_count_policy), tb_stream_test_count, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    UBUS_IDL_GET_OPTIONAL(string, tb_stream_test_count, STREAM_TEST_COUNT_IFACE, params->iface, params, FIELD, STREAM_TEST_COUNT_HAS_IFACE);
+    return UBUS_STATUS_OK;
+}
+
+int stream_test_count_serialize(struct blob_buf *b, const struct stream_test_count_params *params)
+{
+    UBUS_IDL_ADD_OPTIONAL(string, b, "iface", params->iface, params, FIELD, STREAM_TEST_COUNT_HAS_IFACE);
+    return UBUS_STATUS_OK;
+}
+
+struct stream_test_count_params *stream_test_count_dup(const struct stream_test_count_params *params)
+{
+    size_t len = sizeof(*params);
+    struct stream_test_count_params *copy;
+    char *p;
+
+    if (UBUS_IDL_HAS_FIELD(params, STREAM_TEST_COUNT_HAS_IFACE) && params->iface) {
+        len += strlen(params->iface) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->iface = UBUS_IDL_HAS_FIELD(params, STREAM_TEST_COUNT_HAS_IFACE) && params->iface ? ubus_idl_dup_string(&p, params->iface) : NULL;
+    return copy;
+}
+
+void stream_test_count_free(struct stream_test_count_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy lease_policy[] = {
+    [LEASE_MAC] = { .name = "mac", .type = BLOBMSG_TYPE_STRING },
+    [LEASE_IP] = { .name = "ip", .type = BLOBMSG_TYPE_STRING },
+    [LEASE_EXPIRES] = { .name = "expires", .type = BLOBMSG_TYPE_INT64 },
+    [LEASE_HOSTNAME] = { .name = "hostname", .type = BLOBMSG_TYPE_STRING }
+};
+
+int lease_deserialize(struct blob_attr *msg, struct lease *params)
+{
+    struct blob_attr *tb_lease[__LEASE_MAX];
+    if (blobmsg_parse(lease_policy, ARRAY_SIZE(lease_policy), tb_lease, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_lease[LEASE_MAC] || !tb_lease[LEASE_IP] || !tb_lease[LEASE_EXPIRES]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->mac = blobmsg_get_string(tb_lease[LEASE_MAC]);
+    params->ip = blobmsg_get_string(tb_lease[LEASE_IP]);
+    params->expires = blobmsg_get_u64(tb_lease[LEASE_EXPIRES]);
+
+    UBUS_IDL_GET_OPTIONAL(string, tb_lease, LEASE_HOSTNAME, params->hostname, params, FIELD, LEASE_HAS_HOSTNAME);
+    return UBUS_STATUS_OK;
+}
+
+int lease_serialize(struct blob_buf *b, const struct lease *params)
+{
+    UBUS_IDL_ADD(string, b, "mac", params->mac);
+    UBUS_IDL_ADD(string, b, "ip", params->ip);
+    UBUS_IDL_ADD(u64, b, "expires", params->expires);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "hostname", params->hostname, params, FIELD, LEASE_HAS_HOSTNAME);
+    return UBUS_STATUS_OK;
+}
+
+struct lease *lease_dup(const struct lease *params)
+{
+    size_t len = sizeof(*params);
+    struct lease *copy;
+    char *p;
+
+    if (params->mac) {
+        len += strlen(params->mac) + 1;
+    }
+    if (params->ip) {
+        len += strlen(params->ip) + 1;
+    }
+    if (UBUS_IDL_HAS_FIELD(params, LEASE_HAS_HOSTNAME) && params->hostname) {
+        len += strlen(params->hostname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->mac = params->mac ? ubus_idl_dup_string(&p, params->mac) : NULL;
+    copy->ip = params->ip ? ubus_idl_dup_string(&p, params->ip) : NULL;
+    copy->hostname = UBUS_IDL_HAS_FIELD(params, LEASE_HAS_HOSTNAME) && params->hostname ? ubus_idl_dup_string(&p, params->hostname) : NULL;
+    return copy;
+}
+
+void lease_free(struct lease *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy stream_test_route_policy[] = {
+    [STREAM_TEST_ROUTE_DEST] = { .name = "dest", .type = BLOBMSG_TYPE_STRING },
+    [STREAM_TEST_ROUTE_GATEWAY] = { .name = "gateway", .type = BLOBMSG_TYPE_STRING },
+    [STREAM_TEST_ROUTE_METRIC] = { .name = "metric", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int stream_test_route_deserialize(struct blob_attr *msg, struct stream_test_route *params)
+{
+    struct blob_attr *tb_stream_test_route[__STREAM_TEST_ROUTE_MAX];
+    if (blobmsg_parse(stream_test_route_policy, ARRAY_SIZE(stream_test_route_policy), tb_stream_test_route, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_stream_test_route[STREAM_TEST_ROUTE_DEST] || !tb_stream_test_route[STREAM_TEST_ROUTE_METRIC]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->dest = blobmsg_get_string(tb_stream_test_route[STREAM_TEST_ROUTE_DEST]);
+    params->metric = blobmsg_get_u32(tb_stream_test_route[STREAM_TEST_ROUTE_METRIC]);
+
+    UBUS_IDL_GET_OPTIONAL(string, tb_stream_test_route, STREAM_TEST_ROUTE_GATEWAY, params->gateway, params, FIELD, STREAM_TEST_ROUTE_HAS_GATEWAY);
+    return UBUS_STATUS_OK;
+}
+
+int stream_test_route_serialize(struct blob_buf *b, const struct stream_test_route *params)
+{
+    UBUS_IDL_ADD(string, b, "dest", params->dest);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "gateway", params->gateway, params, FIELD, STREAM_TEST_ROUTE_HAS_GATEWAY);
+    UBUS_IDL_ADD(u32, b, "metric", params->metric);
+    return UBUS_STATUS_OK;
+}
+
+struct stream_test_route *stream_test_route_dup(const struct stream_test_route *params)
+{
+    size_t len = sizeof(*params);
+    struct stream_test_route *copy;
+    char *p;
+
+    if (params->dest) {
+        len += strlen(params->dest) + 1;
+    }
+    if (UBUS_IDL_HAS_FIELD(params, STREAM_TEST_ROUTE_HAS_GATEWAY) && params->gateway) {
+        len += strlen(params->gateway) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->dest = params->dest ? ubus_idl_dup_string(&p, params->dest) : NULL;
+    copy->gateway = UBUS_IDL_HAS_FIELD(params, STREAM_TEST_ROUTE_HAS_GATEWAY) && params->gateway ? ubus_idl_dup_string(&p, params->gateway) : NULL;
+    return copy;
+}
+
+void stream_test_route_free(struct stream_test_route *params)
+{
+    free(params);
+}
+
+/* Server side, left out when only the client and the codecs are linked */
+#ifndef UBUS_IDL_CLIENT_ONLY
+
+/* Set while a batch runs its calls, reply helpers then append to the batch response */
+static struct blob_buf *stream_test_batch_capture;
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf stream_test_reply_buf;
+
+int stream_test_count_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct lease *reply)
+{
+    void *tbl;
+    int ret;
+
+    if (stream_test_batch_capture) {
+        tbl = blobmsg_open_table(stream_test_batch_capture, "reply");
+        ret = lease_serialize(stream_test_batch_capture, reply);
+        blobmsg_close_table(stream_test_batch_capture, tbl);
+        return ret;
+    }
+
+    blob_buf_init(&stream_test_reply_buf, 0);
+    ret = lease_serialize(&stream_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, stream_test_reply_buf.head);
+}
+
+#ifndef STREAM_TEST_LEASES_CHUNK_SIZE
+#define STREAM_TEST_LEASES_CHUNK_SIZE 16384
+#endif
+
+/* Send the items in replies of about STREAM_TEST_LEASES_CHUNK_SIZE bytes, the buffer never holds more than one chunk */
+int stream_test_leases_stream_reply(struct ubus_context *ctx, struct ubus_request_data *req, stream_test_leases_next_fn next, void *iter)
+{
+    struct lease item;
+    unsigned int n_items = 0;
+    bool sent = false;
+    void *items;
+    void *entry;
+    int ret;
+
+    blob_buf_init(&stream_test_reply_buf, 0);
+    items = blobmsg_open_array(&stream_test_reply_buf, "items");
+
+    for (;;) {
+        // Presence bits of optional fields start cleared for every item
+        memset(&item, 0, sizeof(item));
+        ret = next(iter, &item);
+        if (ret != UBUS_STATUS_OK) {
+            break;
+        }
+
+        entry = blobmsg_open_table(&stream_test_reply_buf, NULL);
+        ret = lease_serialize(&stream_test_reply_buf, &item);
+        if (ret != UBUS_STATUS_OK) {
+            return ret;
+        }
+        blobmsg_close_table(&stream_test_reply_buf, entry);
+        n_items++;
+
+        if (blob_len(stream_test_reply_buf.head) >= STREAM_TEST_LEASES_CHUNK_SIZE) {
+            blobmsg_close_array(&stream_test_reply_buf, items);
+            ret = ubus_send_reply(ctx, req, stream_test_reply_buf.head);
+            if (ret != UBUS_STATUS_OK) {
+                return ret;
+            }
+            sent = true;
+            n_items = 0;
+
+            // blob_buf_init() keeps the allocation, the next chunk reuses it
+            blob_buf_init(&stream_test_reply_buf, 0);
+            items = blobmsg_open_array(&stream_test_reply_buf, "items");
+        }
+    }
+
+    if (ret != UBUS_STATUS_NO_DATA) {
+        return ret;
+    }
+
+    // The last partial chunk, or an empty list when there was no item at all
+    blobmsg_close_array(&stream_test_reply_buf, items);
+    if (sent && !n_items) {
+        return UBUS_STATUS_OK;
+    }
+
+    return ubus_send_reply(ctx, req, stream_test_reply_buf.head);
+}
+
+#ifndef STREAM_TEST_ROUTES_CHUNK_SIZE
+#define STREAM_TEST_ROUTES_CHUNK_SIZE 4096
+#endif
+
+/* Send the items in replies of about STREAM_TEST_ROUTES_CHUNK_SIZE bytes, the buffer never holds more than one chunk */
+int stream_test_routes_stream_reply(struct ubus_context *ctx, struct ubus_request_data *req, stream_test_routes_next_fn next, void *iter)
+{
+    struct stream_test_route item;
+    unsigned int n_items = 0;
+    bool sent = false;
+    void *items;
+    void *entry;
+    int ret;
+
+    blob_buf_init(&stream_test_reply_buf, 0);
+    items = blobmsg_open_array(&stream_test_reply_buf, "items");
+
+    for (;;) {
+        // Presence bits of optional fields start cleared for every item
+        memset(&item, 0, sizeof(item));
+        ret = next(iter, &item);
+        if (ret != UBUS_STATUS_OK) {
+            break;
+        }
+
+        entry = blobmsg_open_table(&stream_test_reply_buf, NULL);
+        ret = stream_test_route_serialize(&stream_test_reply_buf, &item);
+        if (ret != UBUS_STATUS_OK) {
+            return ret;
+        }
+        blobmsg_close_table(&stream_test_reply_buf, entry);
+        n_items++;
+
+        if (blob_len(stream_test_reply_buf.head) >= STREAM_TEST_ROUTES_CHUNK_SIZE) {
+            blobmsg_close_array(&stream_test_reply_buf, items);
+            ret = ubus_send_reply(ctx, req, stream_test_reply_buf.head);
+            if (ret != UBUS_STATUS_OK) {
+                return ret;
+            }
+            sent = true;
+            n_items = 0;
+
+            // blob_buf_init() keeps the allocation, the next chunk reuses it
+            blob_buf_init(&stream_test_reply_buf, 0);
+            items = blobmsg_open_array(&stream_test_reply_buf, "items");
+        }
+    }
+
+    if (ret != UBUS_STATUS_NO_DATA) {
+        return ret;
+    }
+
+    // The last partial chunk, or an empty list when there was no item at all
+    blobmsg_close_array(&stream_test_reply_buf, items);
+    if (sent && !n_items) {
+        return UBUS_STATUS_OK;
+    }
+
+    return ubus_send_reply(ctx, req, stream_test_reply_buf.head);
+}
+
+#ifndef STREAM_TEST_DUMP_CHUNK_SIZE
+#define STREAM_TEST_DUMP_CHUNK_SIZE 16384
+#endif
+
+/* Send the items in replies of about STREAM_TEST_DUMP_CHUNK_SIZE bytes, the buffer never holds more than one chunk */
+int stream_test_dump_stream_reply(struct ubus_context *ctx, struct ubus_request_data *req, stream_test_dump_next_fn next, void *iter)
+{
+    struct stream_test_route item;
+    unsigned int n_items = 0;
+    bool sent = false;
+    void *items;
+    void *entry;
+    int ret;
+
+    blob_buf_init(&stream_test_reply_buf, 0);
+    items = blobmsg_open_array(&stream_test_reply_buf, "items");
+
+    for (;;) {
+        // Presence bits of optional fields start cleared for every item
+        memset(&item, 0, sizeof(item));
+        ret = next(iter, &item);
+        if (ret != UBUS_STATUS_OK) {
+            break;
+        }
+
+        entry = blobmsg_open_table(&stream_test_reply_buf, NULL);
+        ret = stream_test_route_serialize(&stream_test_reply_buf, &item);
+        if (ret != UBUS_STATUS_OK) {
+            return ret;
+        }
+        blobmsg_close_table(&stream_test_reply_buf, entry);
+        n_items++;
+
+        if (blob_len(stream_test_reply_buf.head) >= STREAM_TEST_DUMP_CHUNK_SIZE) {
+            blobmsg_close_array(&stream_test_reply_buf, items);
+            ret = ubus_send_reply(ctx, req, stream_test_reply_buf.head);
+            if (ret != UBUS_STATUS_OK) {
+                return ret;
+            }
+            sent = true;
+            n_items = 0;
+
+            // blob_buf_init() keeps the allocation, the next chunk reuses it
+            blob_buf_init(&stream_test_reply_buf, 0);
+            items = blobmsg_open_array(&stream_test_reply_buf, "items");
+        }
+    }
+
+    if (ret != UBUS_STATUS_NO_DATA) {
+        return ret;
+    }
+
+    // The last partial chunk, or an empty list when there was no item at all
+    blobmsg_close_array(&stream_test_reply_buf, items);
+    if (sent && !n_items) {
+        return UBUS_STATUS_OK;
+    }
+
+    return ubus_send_reply(ctx, req, stream_test_reply_buf.head);
+}
+
+#ifndef STREAM_TEST_NEIGHBORS_CHUNK_SIZE
+#define STREAM_TEST_NEIGHBORS_CHUNK_SIZE 16384
+#endif
+
+/* Send the items in replies of about STREAM_TEST_NEIGHBORS_CHUNK_SIZE bytes, the buffer never holds more than one chunk */
+int stream_test_neighbors_stream_reply(struct ubus_context *ctx, struct ubus_request_data *req, stream_test_neighbors_next_fn next, void *iter)
+{
+    struct lease item;
+    unsigned int n_items = 0;
+    bool sent = false;
+    void *items;
+    void *entry;
+    int ret;
+
+    blob_buf_init(&stream_test_reply_buf, 0);
+    items = blobmsg_open_array(&stream_test_reply_buf, "items");
+
+    for (;;) {
+        // Presence bits of optional fields start cleared for every item
+        memset(&item, 0, sizeof(item));
+        ret = next(iter, &item);
+        if (ret != UBUS_STATUS_OK) {
+            break;
+        }
+
+        entry = blobmsg_open_table(&stream_test_reply_buf, NULL);
+        ret = lease_serialize(&stream_test_reply_buf, &item);
+        if (ret != UBUS_STATUS_OK) {
+            return ret;
+        }
+        blobmsg_close_table(&stream_test_reply_buf, entry);
+        n_items++;
+
+        if (blob_len(stream_test_reply_buf.head) >= STREAM_TEST_NEIGHBORS_CHUNK_SIZE) {
+            blobmsg_close_array(&stream_test_reply_buf, items);
+            ret = ubus_send_reply(ctx, req, stream_test_reply_buf.head);
+            if (ret != UBUS_STATUS_OK) {
+                return ret;
+            }
+            sent = true;
+            n_items = 0;
+
+            // blob_buf_init() keeps the allocation, the next chunk reuses it
+            blob_buf_init(&stream_test_reply_buf, 0);
+            items = blobmsg_open_array(&stream_test_reply_buf, "items");
+        }
+    }
+
+    if (ret != UBUS_STATUS_NO_DATA) {
+        return ret;
+    }
+
+    // The last partial chunk, or an empty list when there was no item at all
+    blobmsg_close_array(&stream_test_reply_buf, items);
+    if (sent && !n_items) {
+        return UBUS_STATUS_OK;
+    }
+
+    return ubus_send_reply(ctx, req, stream_test_reply_buf.head);
+}
+
+#ifndef STREAM_TEST_DUMP_TIMEOUT_MS
+#define STREAM_TEST_DUMP_TIMEOUT_MS 30000
+#endif
+
+static void stream_test_dump_async_timeout(struct uloop_timeout *t)
+{
+    struct stream_test_dump_async_ctx *actx = container_of(t, struct stream_test_dump_async_ctx, timeout);
+
+    actx->timed_out = true;
+    ubus_complete_deferred_request(actx->ctx, &actx->req, UBUS_STATUS_TIMEOUT);
+}
+
+void stream_test_dump_complete(struct stream_test_dump_async_ctx *actx, int status)
+{
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+    }
+
+    free(actx->msg);
+    free(actx);
+}
+
+static int stream_test_dump_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct stream_test_dump_async_ctx *actx;
+    int ret;
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy beyond the handler call
+    actx->msg = blob_memdup(msg);
+    if (!actx->msg) {
+        free(actx);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    if (stream_test_dump_deserialize(actx->msg, &actx->params) != UBUS_STATUS_OK) {
+        free(actx->msg);
+        free(actx);
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    actx->ctx = ctx;
+    ubus_defer_request(ctx, req, &actx->req);
+    actx->timeout.cb = stream_test_dump_async_timeout;
+    uloop_timeout_set(&actx->timeout, STREAM_TEST_DUMP_TIMEOUT_MS);
+
+    // The handler owns the context on success and must call stream_test_dump_complete()
+    // after sending its items with stream_test_dump_stream_reply(actx->ctx, &actx->req, ...)
+    ret = stream_test_dump_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        stream_test_dump_complete(actx, ret);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static int stream_test_neighbors_thunk(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct stream_test_neighbors_params params;
+
+    if (stream_test_neighbors_deserialize(msg, &params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    return neighbors_handler(ctx, obj, req, STREAM_TEST_METHOD_NEIGHBORS, &params);
+}
+
+enum {
+    STREAM_TEST_BATCH_CALLS,
+    __STREAM_TEST_BATCH_MAX
+};
+
+static const struct blobmsg_policy stream_test_batch_policy[] = {
+    [STREAM_TEST_BATCH_CALLS] = { .name = "calls", .type = BLOBMSG_TYPE_ARRAY }
+};
+
+enum {
+    STREAM_TEST_BATCH_CALL_METHOD,
+    STREAM_TEST_BATCH_CALL_PARAMS,
+    __STREAM_TEST_BATCH_CALL_MAX
+};
+
+static const struct blobmsg_policy stream_test_batch_call_policy[] = {
+    [STREAM_TEST_BATCH_CALL_METHOD] = { .name = "method", .type = BLOBMSG_TYPE_STRING },
+    [STREAM_TEST_BATCH_CALL_PARAMS] = { .name = "params", .type = BLOBMSG_TYPE_TABLE }
+};
+
+static int stream_test_batch_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+static const struct ubus_method stream_test_methods[] = {
+    UBUS_METHOD("leases", stream_test_leases_handler, stream_test_leases_policy),
+    UBUS_METHOD_NOARG("routes", stream_test_routes_handler),
+    UBUS_METHOD("dump", stream_test_dump_async_dispatch, stream_test_dump_policy),
+    UBUS_METHOD("neighbors", stream_test_neighbors_thunk, stream_test_neighbors_policy),
+    UBUS_METHOD("count", stream_test_count_handler, stream_test_count_policy),
+    UBUS_METHOD("batch", stream_test_batch_handler, stream_test_batch_policy)
+};
+
+static struct ubus_object_type stream_test_object_type =
+    UBUS_OBJECT_TYPE("stream_test", stream_test_methods);
+
+struct ubus_object stream_test_object = {
+    .name = "stream_test",
+    .type = &stream_test_object_type,
+    .methods = stream_test_methods,
+    .n_methods = ARRAY_SIZE(stream_test_methods),
+};
+
+/* Methods allowed inside a batch, ubusd only checks the ACL of the batch call */
+static const char *const stream_test_batch_allowed[] = {
+    "count",
+};
+
+static struct blob_buf stream_test_batch_buf;
+static struct blob_buf stream_test_batch_args;
+
+static const struct ubus_method *stream_test_batch_find(const char *name)
+{
+    size_t i;
+
+    for (i = 0; i < ARRAY_SIZE(stream_test_batch_allowed); i++) {
+        if (!strcmp(stream_test_batch_allowed[i], name)) {
+            break;
+        }
+    }
+    if (i == ARRAY_SIZE(stream_test_batch_allowed)) {
+        return NULL;
+    }
+
+    for (i = 0; i < ARRAY_SIZE(stream_test_methods); i++) {
+        if (!strcmp(stream_test_methods[i].name, name)) {
+            return &stream_test_methods[i];
+        }
+    }
+
+    return NULL;
+}
+
+static int stream_test_batch_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct blob_attr *tb[__STREAM_TEST_BATCH_MAX];
+    struct blob_attr *call_tb[__STREAM_TEST_BATCH_CALL_MAX];
+    struct ubus_request_data call_req;
+    const struct ubus_method *m;
+    struct blob_attr *cur;
+    void *results;
+    void *entry;
+    size_t rem;
+    int ret;
+
+    if (blobmsg_parse(stream_test_batch_policy, ARRAY_SIZE(stream_test_batch_policy), tb, blob_data(msg), blob_len(msg)) < 0 || !tb[STREAM_TEST_BATCH_CALLS]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    blob_buf_init(&stream_test_batch_buf, 0);
+    results = blobmsg_open_array(&stream_test_batch_buf, "results");
+
+    blobmsg_for_each_attr(cur, tb[STREAM_TEST_BATCH_CALLS], rem) {
+        entry = blobmsg_open_table(&stream_test_batch_buf, NULL);
+
+        if (blobmsg_type(cur) != BLOBMSG_TYPE_TABLE ||
+            blobmsg_parse(stream_test_batch_call_policy, ARRAY_SIZE(stream_test_batch_call_policy), call_tb, blobmsg_data(cur), blobmsg_data_len(cur)) < 0 ||
+            !call_tb[STREAM_TEST_BATCH_CALL_METHOD]) {
+            ret = UBUS_STATUS_INVALID_ARGUMENT;
+        } else if (!(m = stream_test_batch_find(blobmsg_get_string(call_tb[STREAM_TEST_BATCH_CALL_METHOD])))) {
+            ret = UBUS_STATUS_METHOD_NOT_FOUND;
+        } else {
+            // Handlers expect the bare params payload, as in a direct call
+            blob_buf_init(&stream_test_batch_args, 0);
+            if (call_tb[STREAM_TEST_BATCH_CALL_PARAMS]) {
+                blob_put_raw(&stream_test_batch_args, blobmsg_data(call_tb[STREAM_TEST_BATCH_CALL_PARAMS]),
+                             blobmsg_data_len(call_tb[STREAM_TEST_BATCH_CALL_PARAMS]));
+            }
+
+            // Inner calls get a request without peer, ubusd drops a reply sent on it
+            // instead of delivering it to the caller before the batch response
+            memset(&call_req, 0, sizeof(call_req));
+            call_req.fd = -1;
+            call_req.req_fd = -1;
+
+            stream_test_batch_capture = &stream_test_batch_buf;
+            ret = m->handler(ctx, obj, &call_req, m->name, stream_test_batch_args.head);
+            stream_test_batch_capture = NULL;
+        }
+
+        blobmsg_add_u32(&stream_test_batch_buf, "status", ret);
+        blobmsg_close_table(&stream_test_batch_buf, entry);
+    }
+
+    blobmsg_close_array(&stream_test_batch_buf, results);
+
+    return ubus_send_reply(ctx, req, stream_test_batch_buf.head);
+}
+
+void stream_test_object_cleanup(void)
+{
+    blob_buf_free(&stream_test_reply_buf);
+    blob_buf_free(&stream_test_batch_buf);
+    blob_buf_free(&stream_test_batch_args);
+}
+
+#endif /* UBUS_IDL_CLIENT_ONLY */
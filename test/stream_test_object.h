@@ -0,0 +1,183 @@
+/* Generated from ubus IDL - stream_test */
+
+#ifndef __STREAM_TEST_OBJECT_H__
+#define __STREAM_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct lease {
+    int64_t expires;
+    const char * mac;
+    const char * ip;
+    const char * hostname;
+    uint8_t has_fields;
+};
+#define LEASE_HAS_HOSTNAME 0
+_Static_assert(sizeof(struct lease) == UBUS_IDL_PACKED_SIZE(struct lease, sizeof(int64_t) + 3 * sizeof(const char *) + sizeof(uint8_t)),
+               "struct lease has padding between members");
+
+struct stream_test_route {
+    const char * dest;
+    const char * gateway;
+    int32_t metric;
+    uint8_t has_fields;
+};
+#define STREAM_TEST_ROUTE_HAS_GATEWAY 0
+_Static_assert(sizeof(struct stream_test_route) == UBUS_IDL_PACKED_SIZE(struct stream_test_route, 2 * sizeof(const char *) + sizeof(int32_t) + sizeof(uint8_t)),
+               "struct stream_test_route has padding between members");
+
+struct stream_test_leases_params {
+    const char * iface;
+    uint8_t has_fields;
+};
+#define STREAM_TEST_LEASES_HAS_IFACE 0
+_Static_assert(sizeof(struct stream_test_leases_params) == UBUS_IDL_PACKED_SIZE(struct stream_test_leases_params, sizeof(const char *) + sizeof(uint8_t)),
+               "struct stream_test_leases_params has padding between members");
+
+struct stream_test_dump_params {
+    int32_t table;
+};
+_Static_assert(sizeof(struct stream_test_dump_params) == UBUS_IDL_PACKED_SIZE(struct stream_test_dump_params, sizeof(int32_t)),
+               "struct stream_test_dump_params has padding between members");
+
+struct stream_test_neighbors_params {
+    const char * iface;
+};
+_Static_assert(sizeof(struct stream_test_neighbors_params) == UBUS_IDL_PACKED_SIZE(struct stream_test_neighbors_params, sizeof(const char *)),
+               "struct stream_test_neighbors_params has padding between members");
+
+struct stream_test_count_params {
+    const char * iface;
+    uint8_t has_fields;
+};
+#define STREAM_TEST_COUNT_HAS_IFACE 0
+_Static_assert(sizeof(struct stream_test_count_params) == UBUS_IDL_PACKED_SIZE(struct stream_test_count_params, sizeof(const char *) + sizeof(uint8_t)),
+               "struct stream_test_count_params has padding between members");
+
+enum {
+    STREAM_TEST_LEASES_IFACE,
+    __STREAM_TEST_LEASES_MAX
+};
+
+enum {
+    STREAM_TEST_DUMP_TABLE,
+    __STREAM_TEST_DUMP_MAX
+};
+
+enum {
+    STREAM_TEST_NEIGHBORS_IFACE,
+    __STREAM_TEST_NEIGHBORS_MAX
+};
+
+enum {
+    STREAM_TEST_COUNT_IFACE,
+    __STREAM_TEST_COUNT_MAX
+};
+
+enum {
+    LEASE_MAC,
+    LEASE_IP,
+    LEASE_EXPIRES,
+    LEASE_HOSTNAME,
+    __LEASE_MAX
+};
+
+enum {
+    STREAM_TEST_ROUTE_DEST,
+    STREAM_TEST_ROUTE_GATEWAY,
+    STREAM_TEST_ROUTE_METRIC,
+    __STREAM_TEST_ROUTE_MAX
+};
+
+struct stream_test_dump_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    struct stream_test_dump_params params;
+    bool timed_out;
+    void *priv;
+};
+
+enum stream_test_method {
+    STREAM_TEST_METHOD_LEASES,
+    STREAM_TEST_METHOD_ROUTES,
+    STREAM_TEST_METHOD_DUMP,
+    STREAM_TEST_METHOD_NEIGHBORS,
+    STREAM_TEST_METHOD_COUNT,
+    __STREAM_TEST_METHOD_MAX
+};
+
+int stream_test_leases_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int stream_test_routes_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int stream_test_dump_handler(struct stream_test_dump_async_ctx *actx);
+int stream_test_count_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+/* Custom handlers, called by a generated thunk with the method and its decoded params */
+int neighbors_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, enum stream_test_method method, const struct stream_test_neighbors_params *params);
+
+int stream_test_leases_deserialize(struct blob_attr *msg, struct stream_test_leases_params *params);
+int stream_test_leases_serialize(struct blob_buf *b, const struct stream_test_leases_params *params);
+int stream_test_dump_deserialize(struct blob_attr *msg, struct stream_test_dump_params *params);
+int stream_test_dump_serialize(struct blob_buf *b, const struct stream_test_dump_params *params);
+int stream_test_neighbors_deserialize(struct blob_attr *msg, struct stream_test_neighbors_params *params);
+int stream_test_neighbors_serialize(struct blob_buf *b, const struct stream_test_neighbors_params *params);
+int stream_test_count_deserialize(struct blob_attr *msg, struct stream_test_count_params *params);
+int stream_test_count_serialize(struct blob_buf *b, const struct stream_test_count_params *params);
+int lease_deserialize(struct blob_attr *msg, struct lease *params);
+int lease_serialize(struct blob_buf *b, const struct lease *params);
+int stream_test_route_deserialize(struct blob_attr *msg, struct stream_test_route *params);
+int stream_test_route_serialize(struct blob_buf *b, const struct stream_test_route *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct stream_test_leases_params *stream_test_leases_dup(const struct stream_test_leases_params *params);
+void stream_test_leases_free(struct stream_test_leases_params *params);
+struct stream_test_dump_params *stream_test_dump_dup(const struct stream_test_dump_params *params);
+void stream_test_dump_free(struct stream_test_dump_params *params);
+struct stream_test_neighbors_params *stream_test_neighbors_dup(const struct stream_test_neighbors_params *params);
+void stream_test_neighbors_free(struct stream_test_neighbors_params *params);
+struct stream_test_count_params *stream_test_count_dup(const struct stream_test_count_params *params);
+void stream_test_count_free(struct stream_test_count_params *params);
+struct lease *lease_dup(const struct lease *params);
+void lease_free(struct lease *params);
+struct stream_test_route *stream_test_route_dup(const struct stream_test_route *params);
+void stream_test_route_free(struct stream_test_route *params);
+
+int stream_test_count_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct lease *reply);
+
+/* Iterators fill *item and return UBUS_STATUS_OK, or UBUS_STATUS_NO_DATA after the last item */
+typedef int (*stream_test_leases_next_fn)(void *iter, struct lease *item);
+int stream_test_leases_stream_reply(struct ubus_context *ctx, struct ubus_request_data *req, stream_test_leases_next_fn next, void *iter);
+typedef int (*stream_test_routes_next_fn)(void *iter, struct stream_test_route *item);
+int stream_test_routes_stream_reply(struct ubus_context *ctx, struct ubus_request_data *req, stream_test_routes_next_fn next, void *iter);
+typedef int (*stream_test_dump_next_fn)(void *iter, struct stream_test_route *item);
+int stream_test_dump_stream_reply(struct ubus_context *ctx, struct ubus_request_data *req, stream_test_dump_next_fn next, void *iter);
+typedef int (*stream_test_neighbors_next_fn)(void *iter, struct lease *item);
+int stream_test_neighbors_stream_reply(struct ubus_context *ctx, struct ubus_request_data *req, stream_test_neighbors_next_fn next, void *iter);
+
+void stream_test_dump_complete(struct stream_test_dump_async_ctx *actx, int status);
+
+extern struct ubus_object stream_test_object;
+
+void stream_test_object_cleanup(void);
+
+#endif /* __STREAM_TEST_OBJECT_H__ */
@@ -0,0 +1,74 @@
+/* Test daemon for blocking_test: serves the generated object on a private ubusd */
+
+#include <libubox/uloop.h>
+#include <libubus.h>
+#include <stdio.h>
+#include <time.h>
+#include <unistd.h>
+#include "blocking_test_object.h"
+
+static int64_t now_ms(void)
+{
+    struct timespec ts;
+
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (int64_t)ts.tv_sec * 1000 + ts.tv_nsec / 1000000;
+}
+
+int blocking_test_sleep_handler(const struct blocking_test_sleep_params *params, struct blocking_test_result *reply)
+{
+    int64_t start = now_ms();
+
+    // Stands in for slow file or flash I/O
+    usleep(params->ms * 1000);
+
+    reply->elapsed_ms = (int32_t)(now_ms() - start);
+    return UBUS_STATUS_OK;
+}
+
+int blocking_test_sync_flash_handler(void)
+{
+    sync();
+    return UBUS_STATUS_OK;
+}
+
+int replay_handler(const struct blocking_test_result *params)
+{
+    return params->elapsed_ms >= 0 ? UBUS_STATUS_OK : UBUS_STATUS_INVALID_ARGUMENT;
+}
+
+int blocking_test_ping_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct blocking_test_result reply = { .elapsed_ms = 0 };
+
+    return blocking_test_ping_reply(ctx, req, &reply);
+}
+
+int main(int argc, char **argv)
+{
+    struct ubus_context *ctx;
+    const char *socket = argc > 1 ? argv[1] : NULL;
+
+    uloop_init();
+
+    ctx = ubus_connect(socket);
+    if (!ctx) {
+        fprintf(stderr, "Failed to connect to ubus\n");
+        return 1;
+    }
+    ubus_add_uloop(ctx);
+
+    if (ubus_add_object(ctx, &blocking_test_object)) {
+        fprintf(stderr, "Failed to add object\n");
+        ubus_free(ctx);
+        return 1;
+    }
+
+    uloop_run();
+
+    blocking_test_object_cleanup();
+    ubus_free(ctx);
+    uloop_done();
+
+    return 0;
+}
@@ -0,0 +1,96 @@
+#!/bin/bash
+# 压力测试：对 @blocking 方法发起大量并发调用
+# 需要 ubusd、ubus 命令行工具以及 libubus/libubox 开发库
+#
+# 用法: ./blocking_stress.sh [并发调用数] [每次调用的 sleep 毫秒数]
+
+CALLS="${1:-32}"
+SLEEP_MS="${2:-200}"
+POOL_SIZE=4
+
+# 获取脚本所在目录
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+ROOT_DIR="$(cd "${SCRIPT_DIR}/../.." && pwd)"
+
+for tool in ubusd ubus gcc; do
+    if ! command -v "$tool" >/dev/null 2>&1; then
+        echo "跳过: 未找到 $tool"
+        exit 0
+    fi
+done
+
+WORK_DIR="$(mktemp -d)"
+SOCKET="${WORK_DIR}/ubus.sock"
+UBUSD_PID=""
+DAEMON_PID=""
+
+cleanup() {
+    [ -n "$DAEMON_PID" ] && kill "$DAEMON_PID" 2>/dev/null
+    [ -n "$UBUSD_PID" ] && kill "$UBUSD_PID" 2>/dev/null
+    wait 2>/dev/null
+    rm -rf "$WORK_DIR"
+}
+trap cleanup EXIT
+
+# 生成代码并编译测试守护进程
+(cd "$ROOT_DIR" && python3 -m ubus_idl.main test/blocking_test.uidl -o "$WORK_DIR") >/dev/null || exit 1
+gcc -O2 -Wall -o "${WORK_DIR}/blocking_daemon" \
+    -DBLOCKING_TEST_POOL_SIZE=${POOL_SIZE} -DBLOCKING_TEST_QUEUE_DEPTH=${CALLS} \
+    -I"$WORK_DIR" "${SCRIPT_DIR}/blocking_main.c" "${WORK_DIR}/blocking_test_object.c" \
+    -lubus -lubox -lblobmsg_json -lpthread || exit 1
+
+# 在私有 socket 上启动 ubusd 和测试守护进程
+ubusd -s "$SOCKET" &
+UBUSD_PID=$!
+sleep 0.2
+"${WORK_DIR}/blocking_daemon" "$SOCKET" &
+DAEMON_PID=$!
+
+for _ in $(seq 1 50); do
+    ubus -s "$SOCKET" list blocking_test >/dev/null 2>&1 && break
+    sleep 0.1
+done
+
+echo "=========================================="
+echo "并发调用: $CALLS, 每次 ${SLEEP_MS}ms, 线程池: $POOL_SIZE"
+echo "=========================================="
+
+START=$(date +%s%N)
+for i in $(seq 1 "$CALLS"); do
+    ubus -s "$SOCKET" -t 60 call blocking_test sleep "{\"ms\":${SLEEP_MS}}" \
+        >"${WORK_DIR}/call_${i}.out" 2>&1 &
+done
+
+# 线程池繁忙时，普通方法仍应由事件循环立即响应
+PING_START=$(date +%s%N)
+ubus -s "$SOCKET" -t 5 call blocking_test ping >/dev/null 2>&1
+PING_STATUS=$?
+PING_MS=$(( ($(date +%s%N) - PING_START) / 1000000 ))
+
+wait $(jobs -p | grep -v -e "^${UBUSD_PID}\$" -e "^${DAEMON_PID}\$")
+ELAPSED_MS=$(( ($(date +%s%N) - START) / 1000000 ))
+
+FAILED=0
+for i in $(seq 1 "$CALLS"); do
+    grep -q '"elapsed_ms"' "${WORK_DIR}/call_${i}.out" || FAILED=$((FAILED + 1))
+done
+
+SERIAL_MS=$(( CALLS * SLEEP_MS ))
+echo "总耗时: ${ELAPSED_MS}ms (串行约 ${SERIAL_MS}ms)"
+echo "ping 耗时: ${PING_MS}ms"
+echo "失败调用: $FAILED"
+
+if [ "$FAILED" -ne 0 ]; then
+    echo "✗ 有调用失败"
+    exit 1
+fi
+if [ "$PING_STATUS" -ne 0 ] || [ "$PING_MS" -ge "$SLEEP_MS" ]; then
+    echo "✗ 事件循环被阻塞"
+    exit 1
+fi
+if [ "$ELAPSED_MS" -ge $(( SERIAL_MS / 2 )) ]; then
+    echo "✗ 调用没有并行执行"
+    exit 1
+fi
+
+echo "✓ 压力测试通过!"
@@ -0,0 +1,132 @@
+/* Test client for bulk_test: moves large buffers through sealed memfds */
+
+#include <libubox/uloop.h>
+#include <libubus.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "bulk_test_client.h"
+
+static int failed;
+
+static int32_t checksum(const void *data, size_t len)
+{
+    const unsigned char *p = data;
+    uint32_t sum = 0;
+    size_t i;
+
+    for (i = 0; i < len; i++) {
+        sum = sum * 31 + p[i];
+    }
+
+    return (int32_t)sum;
+}
+
+static long elapsed_us(const struct timespec *start)
+{
+    struct timespec now;
+
+    clock_gettime(CLOCK_MONOTONIC, &now);
+    return (now.tv_sec - start->tv_sec) * 1000000L + (now.tv_nsec - start->tv_nsec) / 1000;
+}
+
+static void check(int ok, const char *what)
+{
+    printf("%s %s\n", ok ? "✓" : "✗", what);
+    if (!ok) {
+        failed = 1;
+    }
+}
+
+static void capture_cb(struct bulk_test_client *client, int status, const struct bulk_test_trace *reply, void *priv)
+{
+    const struct blob_attr *filter = priv;
+
+    check(status == UBUS_STATUS_OK && reply->packets == 3 &&
+          UBUS_IDL_HAS_FIELD(reply, BULK_TEST_TRACE_HAS_PCAP) &&
+          reply->pcap.len == blob_pad_len(filter) &&
+          !memcmp(reply->pcap.data, filter, reply->pcap.len),
+          "异步 capture 返回的 pcap 与 filter 一致");
+    uloop_end();
+}
+
+int main(int argc, char **argv)
+{
+    struct ubus_context *ctx;
+    struct bulk_test_client client;
+    struct bulk_test_put_params put = { .name = "image" };
+    struct bulk_test_get_params get = { .name = "image" };
+    struct bulk_test_capture_params capture = { .packets = 3 };
+    struct bulk_test_image_info info;
+    struct bulk_test_image image;
+    struct blob_buf filter = {};
+    struct timespec start;
+    const char *socket = argc > 1 ? argv[1] : NULL;
+    size_t size = argc > 2 ? strtoul(argv[2], NULL, 0) : 1 << 20;
+    unsigned char *data;
+    size_t i;
+    int ret;
+
+    data = malloc(size ? size : 1);
+    if (!data) {
+        return 1;
+    }
+    for (i = 0; i < size; i++) {
+        data[i] = (unsigned char)(i * 7 + 3);
+    }
+
+    uloop_init();
+
+    ctx = ubus_connect(socket);
+    if (!ctx) {
+        fprintf(stderr, "Failed to connect to ubus\n");
+        return 1;
+    }
+    ubus_add_uloop(ctx);
+
+    if (bulk_test_client_init(&client, ctx) != UBUS_STATUS_OK) {
+        fprintf(stderr, "Failed to init client\n");
+        return 1;
+    }
+
+    // Upload: the server checksums the mapped memfd
+    put.data.data = data;
+    put.data.len = size;
+    clock_gettime(CLOCK_MONOTONIC, &start);
+    ret = bulk_test_call_put(&client, &put, &info, 5000);
+    printf("put %zu 字节: %ldus\n", size, elapsed_us(&start));
+    check(ret == UBUS_STATUS_OK && info.size == (int64_t)size && info.checksum == checksum(data, size),
+          "put 的大小与校验和一致");
+
+    // Download: the reply fd is mapped until bulk_unmap
+    clock_gettime(CLOCK_MONOTONIC, &start);
+    ret = bulk_test_call_get(&client, &get, &image, 5000);
+    printf("get %zu 字节: %ldus\n", size, elapsed_us(&start));
+    check(ret == UBUS_STATUS_OK && image.data.len == size &&
+          (size == 0 || !memcmp(image.data.data, data, size)),
+          "get 返回的数据一致");
+    if (ret == UBUS_STATUS_OK) {
+        bulk_test_image_bulk_unmap(&image);
+    }
+
+    // Asynchronous call with an optional bulk field, answered from the server's async context
+    blob_buf_init(&filter, 0);
+    blobmsg_add_string(&filter, "proto", "udp");
+    capture.filter.data = filter.head;
+    capture.filter.len = blob_pad_len(filter.head);
+    UBUS_IDL_SET_FIELD(&capture, BULK_TEST_CAPTURE_HAS_FILTER);
+    ret = bulk_test_call_capture_async(&client, &capture, capture_cb, filter.head, 5000);
+    check(ret == UBUS_STATUS_OK, "异步 capture 已提交");
+    if (ret == UBUS_STATUS_OK) {
+        uloop_run();
+    }
+
+    blob_buf_free(&filter);
+    bulk_test_client_free(&client);
+    ubus_free(ctx);
+    uloop_done();
+    free(data);
+
+    return failed;
+}
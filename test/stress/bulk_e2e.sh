@@ -0,0 +1,71 @@
+#!/bin/bash
+# 端到端测试：通过密封的 memfd 传递 @bulk 字段
+# 需要 ubusd 以及支持 fd 传递的 libubus/libubox 开发库
+# 可通过 UBUSD、CFLAGS、LDFLAGS 使用本地编译的 ubusd 和库
+#
+# 用法: ./bulk_e2e.sh [数据字节数]
+
+SIZE="${1:-16777216}"
+UBUSD="${UBUSD:-ubusd}"
+
+# 获取脚本所在目录
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+ROOT_DIR="$(cd "${SCRIPT_DIR}/../.." && pwd)"
+
+for tool in "$UBUSD" ubus gcc; do
+    if ! command -v "$tool" >/dev/null 2>&1; then
+        echo "跳过: 未找到 $tool"
+        exit 0
+    fi
+done
+
+WORK_DIR="$(mktemp -d)"
+SOCKET="${WORK_DIR}/ubus.sock"
+UBUSD_PID=""
+DAEMON_PID=""
+
+cleanup() {
+    [ -n "$DAEMON_PID" ] && kill "$DAEMON_PID" 2>/dev/null
+    [ -n "$UBUSD_PID" ] && kill "$UBUSD_PID" 2>/dev/null
+    wait 2>/dev/null
+    rm -rf "$WORK_DIR"
+}
+trap cleanup EXIT
+
+# 生成代码并编译测试守护进程和客户端
+(cd "$ROOT_DIR" && python3 -m ubus_idl.main test/bulk_test.uidl -o "$WORK_DIR") >/dev/null || exit 1
+gcc -O2 -Wall $CFLAGS -o "${WORK_DIR}/bulk_daemon" \
+    -I"$WORK_DIR" "${SCRIPT_DIR}/bulk_main.c" "${WORK_DIR}/bulk_test_object.c" \
+    $LDFLAGS -lubus -lubox -lblobmsg_json || exit 1
+gcc -O2 -Wall $CFLAGS -o "${WORK_DIR}/bulk_client" -DUBUS_IDL_CLIENT_ONLY \
+    -I"$WORK_DIR" "${SCRIPT_DIR}/bulk_client.c" "${WORK_DIR}/bulk_test_object.c" "${WORK_DIR}/bulk_test_client.c" \
+    $LDFLAGS -lubus -lubox -lblobmsg_json || exit 1
+
+# 在私有 socket 上启动 ubusd 和测试守护进程
+"$UBUSD" -s "$SOCKET" &
+UBUSD_PID=$!
+sleep 0.2
+"${WORK_DIR}/bulk_daemon" "$SOCKET" "$SIZE" &
+DAEMON_PID=$!
+
+for _ in $(seq 1 50); do
+    ubus -s "$SOCKET" list bulk_test >/dev/null 2>&1 && break
+    sleep 0.1
+done
+
+echo "=========================================="
+echo "@bulk 数据大小: $SIZE 字节"
+echo "=========================================="
+
+# 不带 fd 的普通方法不受影响
+if ! ubus -s "$SOCKET" call bulk_test info | grep -q "\"size\": ${SIZE}"; then
+    echo "✗ info 调用失败"
+    exit 1
+fi
+
+if ! "${WORK_DIR}/bulk_client" "$SOCKET" "$SIZE"; then
+    echo "✗ 端到端测试失败"
+    exit 1
+fi
+
+echo "✓ 端到端测试通过!"
@@ -0,0 +1,123 @@
+/* Test daemon for bulk_test: serves the generated object on a private ubusd */
+
+#include <libubox/uloop.h>
+#include <libubus.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include "bulk_test_object.h"
+
+static unsigned char *image;
+static size_t image_size;
+
+static int32_t checksum(const void *data, size_t len)
+{
+    const unsigned char *p = data;
+    uint32_t sum = 0;
+    size_t i;
+
+    for (i = 0; i < len; i++) {
+        sum = sum * 31 + p[i];
+    }
+
+    return (int32_t)sum;
+}
+
+int bulk_test_put_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct bulk_test_put_params params;
+    struct bulk_test_image_info info;
+    int ret;
+
+    if (bulk_test_put_deserialize(msg, &params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    ret = bulk_test_put_bulk_map(&params, ubus_request_get_caller_fd(req));
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    info.name = params.name;
+    info.size = params.data.len;
+    info.checksum = checksum(params.data.data, params.data.len);
+    ret = bulk_test_put_reply(ctx, req, &info);
+
+    bulk_test_put_bulk_unmap(&params);
+    return ret;
+}
+
+int bulk_test_get_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct bulk_test_get_params params;
+    struct bulk_test_image reply;
+
+    if (bulk_test_get_deserialize(msg, &params) != UBUS_STATUS_OK) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    reply.name = params.name;
+    reply.data.data = image;
+    reply.data.len = image_size;
+    return bulk_test_get_reply(ctx, req, &reply);
+}
+
+int bulk_test_capture_handler(struct bulk_test_capture_async_ctx *actx)
+{
+    struct bulk_test_trace reply = { .packets = actx->params.packets };
+
+    // Echo the filter as the capture, it stays mapped until the request completes
+    if (UBUS_IDL_HAS_FIELD(&actx->params, BULK_TEST_CAPTURE_HAS_FILTER)) {
+        reply.pcap = actx->params.filter;
+        UBUS_IDL_SET_FIELD(&reply, BULK_TEST_TRACE_HAS_PCAP);
+    }
+
+    bulk_test_capture_complete(actx, UBUS_STATUS_OK, &reply);
+    return UBUS_STATUS_OK;
+}
+
+int bulk_test_info_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct bulk_test_image_info reply = { .name = "image", .size = image_size, .checksum = checksum(image, image_size) };
+
+    return bulk_test_info_reply(ctx, req, &reply);
+}
+
+int main(int argc, char **argv)
+{
+    struct ubus_context *ctx;
+    const char *socket = argc > 1 ? argv[1] : NULL;
+    size_t i;
+
+    image_size = argc > 2 ? strtoul(argv[2], NULL, 0) : 1 << 20;
+    image = malloc(image_size ? image_size : 1);
+    if (!image) {
+        return 1;
+    }
+    for (i = 0; i < image_size; i++) {
+        image[i] = (unsigned char)(i * 7 + 3);
+    }
+
+    uloop_init();
+
+    ctx = ubus_connect(socket);
+    if (!ctx) {
+        fprintf(stderr, "Failed to connect to ubus\n");
+        return 1;
+    }
+    ubus_add_uloop(ctx);
+
+    if (ubus_add_object(ctx, &bulk_test_object)) {
+        fprintf(stderr, "Failed to add object\n");
+        ubus_free(ctx);
+        return 1;
+    }
+
+    uloop_run();
+
+    bulk_test_object_cleanup();
+    ubus_free(ctx);
+    uloop_done();
+    free(image);
+
+    return 0;
+}
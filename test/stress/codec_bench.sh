@@ -0,0 +1,84 @@
+#!/bin/bash
+# 编解码基准：比较展开模式和表驱动模式（--codec=table）的代码大小和每次操作耗时
+# 需要 gcc、size 以及 libubus/libubox 开发库
+#
+# 用法: [TYPES=类型数] ./codec_bench.sh [迭代次数] [优化选项]
+
+ITERATIONS="${1:-1000000}"
+OPT="${2:--Os}"
+
+# 获取脚本所在目录
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+ROOT_DIR="$(cd "${SCRIPT_DIR}/../.." && pwd)"
+
+for tool in gcc size; do
+    if ! command -v "$tool" >/dev/null 2>&1; then
+        echo "跳过: 未找到 $tool"
+        exit 0
+    fi
+done
+
+WORK_DIR="$(mktemp -d)"
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+echo "=========================================="
+echo "迭代次数: $ITERATIONS, 优化选项: $OPT"
+echo "=========================================="
+printf "%-10s %12s %12s %12s\n" "codec" "text(B)" "encode(ns)" "decode(ns)"
+
+CHECKSUMS=""
+for codec in unrolled table; do
+    OUT_DIR="${WORK_DIR}/${codec}"
+    mkdir -p "$OUT_DIR"
+
+    # 去掉 @codec 注解，由命令行选择模式
+    grep -v '^@codec' "${ROOT_DIR}/test/codec_test.uidl" >"${OUT_DIR}/codec_test.uidl"
+    (cd "$ROOT_DIR" && python3 -m ubus_idl.main "${OUT_DIR}/codec_test.uidl" -o "$OUT_DIR" --codec="$codec") >/dev/null || exit 1
+
+    gcc $OPT -Wall -c -o "${OUT_DIR}/codec_test_object.o" -I"$OUT_DIR" "${OUT_DIR}/codec_test_object.c" || exit 1
+    gcc $OPT -Wall -o "${OUT_DIR}/codec_bench" -I"$OUT_DIR" "${SCRIPT_DIR}/codec_main.c" \
+        "${OUT_DIR}/codec_test_object.o" -lubus -lubox -lblobmsg_json || exit 1
+
+    TEXT=$(size "${OUT_DIR}/codec_test_object.o" | awk 'NR == 2 { print $1 }')
+    RESULT=$("${OUT_DIR}/codec_bench" "$ITERATIONS") || exit 1
+    ENCODE=$(echo "$RESULT" | sed -n 's/.*encode_ns=\([0-9.]*\).*/\1/p')
+    DECODE=$(echo "$RESULT" | sed -n 's/.*decode_ns=\([0-9.]*\).*/\1/p')
+    CHECKSUMS="${CHECKSUMS} $(echo "$RESULT" | sed -n 's/.*checksum=\([0-9a-f]*\).*/\1/p')"
+
+    printf "%-10s %12s %12s %12s\n" "$codec" "$TEXT" "$ENCODE" "$DECODE"
+done
+
+# 两种模式的编码结果必须逐字节相同
+set -- $CHECKSUMS
+if [ "$1" != "$2" ]; then
+    echo "✗ 两种模式的编码结果不同"
+    exit 1
+fi
+
+# 类型较多时的代码大小：生成 N 个各含 10 个字段的类型
+TYPES="${TYPES:-100}"
+python3 - "$TYPES" >"${WORK_DIR}/many.uidl" <<'PY'
+import sys
+n = int(sys.argv[1])
+kinds = ["int32", "bool", "string", "int64", "int8", "double", "int16", "array"]
+for t in range(n):
+    print(f"t{t}: {{")
+    for f in range(10):
+        print(f"    f{f}{'?' if f % 3 == 0 else ''}: {kinds[(t + f) % len(kinds)]}")
+    print("}")
+print("object many {")
+for t in range(n):
+    print(f"    m{t}(t{t}) -> t{(t + 1) % n}")
+print("}")
+PY
+
+echo "------------------------------------------"
+echo "${TYPES} 个类型的 text(B)（size 的 text 列，含 .rodata）:"
+for codec in unrolled table; do
+    OUT_DIR="${WORK_DIR}/many_${codec}"
+    (cd "$ROOT_DIR" && python3 -m ubus_idl.main "${WORK_DIR}/many.uidl" -o "$OUT_DIR" --codec="$codec") >/dev/null || exit 1
+    gcc $OPT -w -c -o "${OUT_DIR}/many_object.o" -I"$OUT_DIR" "${OUT_DIR}/many_object.c" || exit 1
+    printf "%-10s %12s\n" "$codec" "$(size "${OUT_DIR}/many_object.o" | awk 'NR == 2 { print $1 }')"
+done
+
+echo "✓ 编码结果一致"
@@ -0,0 +1,110 @@
+/* Codec benchmark for codec_test: encode and decode one interface in a loop */
+
+#include <libubox/blobmsg.h>
+#include <libubus.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "codec_test_object.h"
+
+int codec_test_get_interface_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return UBUS_STATUS_NOT_SUPPORTED;
+}
+
+int codec_test_set_mtu_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return UBUS_STATUS_NOT_SUPPORTED;
+}
+
+int codec_test_add_address_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return UBUS_STATUS_NOT_SUPPORTED;
+}
+
+static int64_t now_ns(void)
+{
+    struct timespec ts;
+
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (int64_t)ts.tv_sec * 1000000000 + ts.tv_nsec;
+}
+
+/* FNV-1a of the encoded message, both codecs must print the same value */
+static uint32_t checksum(const struct blob_attr *msg)
+{
+    const uint8_t *p = (const uint8_t *)msg;
+    uint32_t hash = 2166136261u;
+    size_t i;
+
+    for (i = 0; i < blob_raw_len(msg); i++) {
+        hash ^= p[i];
+        hash *= 16777619u;
+    }
+
+    return hash;
+}
+
+int main(int argc, char **argv)
+{
+    long iterations = argc > 1 ? atol(argv[1]) : 1000000;
+    struct codec_test_interface in = {
+        .ifname = "br-lan",
+        .up = true,
+        .mtu = 1500,
+        .ifindex = 7,
+        .rx_bytes = 123456789012LL,
+        .load = 0.25,
+    };
+    struct codec_test_interface out;
+    struct blob_buf flags = { 0 };
+    struct blob_buf b = { 0 };
+    int64_t encode_ns;
+    int64_t decode_ns;
+    int ret = UBUS_STATUS_OK;
+    long i;
+
+    blob_buf_init(&flags, 0);
+    blobmsg_add_u32(&flags, "", 1);
+    blobmsg_add_u32(&flags, "", 4);
+    in.flags = flags.head;
+
+    // Nested tables are left out, the unrolled codec does not encode them
+    in.has_fields = 0;
+    UBUS_IDL_SET_FIELD(&in, CODEC_TEST_INTERFACE_HAS_MTU);
+    UBUS_IDL_SET_FIELD(&in, CODEC_TEST_INTERFACE_HAS_RX_BYTES);
+    UBUS_IDL_SET_FIELD(&in, CODEC_TEST_INTERFACE_HAS_LOAD);
+    UBUS_IDL_SET_FIELD(&in, CODEC_TEST_INTERFACE_HAS_FLAGS);
+
+    encode_ns = now_ns();
+    for (i = 0; i < iterations && ret == UBUS_STATUS_OK; i++) {
+        blob_buf_init(&b, 0);
+        ret = codec_test_interface_serialize(&b, &in);
+    }
+    encode_ns = now_ns() - encode_ns;
+
+    decode_ns = now_ns();
+    for (i = 0; i < iterations && ret == UBUS_STATUS_OK; i++) {
+        ret = codec_test_interface_deserialize(b.head, &out);
+    }
+    decode_ns = now_ns() - decode_ns;
+
+    if (ret != UBUS_STATUS_OK) {
+        fprintf(stderr, "codec failed: %d\n", ret);
+        return 1;
+    }
+    if (out.ifindex != in.ifindex || out.mtu != in.mtu || out.rx_bytes != in.rx_bytes ||
+        strcmp(out.ifname, in.ifname) || !UBUS_IDL_HAS_FIELD(&out, CODEC_TEST_INTERFACE_HAS_FLAGS) ||
+        UBUS_IDL_HAS_FIELD(&out, CODEC_TEST_INTERFACE_HAS_EXTRA)) {
+        fprintf(stderr, "decoded struct differs\n");
+        return 1;
+    }
+
+    printf("checksum=%08x encode_ns=%.1f decode_ns=%.1f\n", checksum(b.head),
+           (double)encode_ns / iterations, (double)decode_ns / iterations);
+
+    blob_buf_free(&b);
+    blob_buf_free(&flags);
+    return 0;
+}
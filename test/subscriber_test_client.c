@@ -0,0 +1,480 @@
+/* Generated from ubus IDL - subscriber_test client */
+
+#include <libubox/blobmsg.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "subscriber_test_client.h"
+
+static const struct blobmsg_policy subscriber_test_client_remove_policy[] = {
+    { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+};
+
+/* Drop the cached object id, the next call looks the object up again */
+static void subscriber_test_client_forget(struct subscriber_test_client *client)
+{
+    client->id = 0;
+}
+
+static int subscriber_test_client_resolve(struct subscriber_test_client *client)
+{
+    int ret;
+
+    if (client->id) {
+        return UBUS_STATUS_OK;
+    }
+
+    ret = ubus_lookup_id(client->ctx, "subscriber_test", &client->id);
+    if (ret != UBUS_STATUS_OK) {
+        client->id = 0;
+        return ret;
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static void subscriber_test_client_remove_cb(struct ubus_context *ctx, struct ubus_event_handler *ev, const char *type, struct blob_attr *msg)
+{
+    struct subscriber_test_client *client = container_of(ev, struct subscriber_test_client, remove_ev);
+    struct blob_attr *tb[ARRAY_SIZE(subscriber_test_client_remove_policy)];
+
+    blobmsg_parse(subscriber_test_client_remove_policy, ARRAY_SIZE(subscriber_test_client_remove_policy), tb, blob_data(msg), blob_len(msg));
+
+    if (tb[0] && blobmsg_get_u32(tb[0]) == client->id) {
+        subscriber_test_client_forget(client);
+    }
+}
+
+static void subscriber_test_client_data_cb(struct ubus_request *req, int type, struct blob_attr *msg)
+{
+    struct subscriber_test_client *client = req->priv;
+
+    // The reply is only valid during the callback, keep a copy for the deserializer
+    free(client->reply_msg);
+    client->reply_msg = msg ? blob_memdup(msg) : NULL;
+}
+
+static int subscriber_test_client_invoke(struct subscriber_test_client *client, const char *method, int timeout)
+{
+    int retry;
+    int ret;
+
+    free(client->reply_msg);
+    client->reply_msg = NULL;
+
+    for (retry = 0; retry < 2; retry++) {
+        ret = subscriber_test_client_resolve(client);
+        if (ret != UBUS_STATUS_OK) {
+            return ret;
+        }
+
+        ret = ubus_invoke(client->ctx, client->id, method, client->buf.head, subscriber_test_client_data_cb, client, timeout);
+
+        // The object was re-registered before the remove event arrived, look it up again
+        if (ret != UBUS_STATUS_NOT_FOUND) {
+            break;
+        }
+        subscriber_test_client_forget(client);
+    }
+
+    return ret;
+}
+
+/* Pipelined request, queued until the in-flight cap allows sending it */
+struct subscriber_test_client_async {
+    struct list_head list;
+    struct subscriber_test_client *client;
+    struct ubus_request req;
+    struct uloop_timeout timeout;
+    const char *method;
+    struct blob_attr *msg;
+    struct blob_attr *reply_msg;
+    int timeout_ms;
+    void (*complete)(struct subscriber_test_client_async *areq, int status);
+    void (*cb)(void);
+    void *priv;
+};
+
+static void subscriber_test_client_async_free(struct subscriber_test_client_async *areq)
+{
+    free(areq->msg);
+    free(areq->reply_msg);
+    free(areq);
+}
+
+static void subscriber_test_client_async_finish(struct subscriber_test_client_async *areq, int status)
+{
+    if (status == UBUS_STATUS_NOT_FOUND) {
+        subscriber_test_client_forget(areq->client);
+    }
+
+    areq->complete(areq, status);
+    subscriber_test_client_async_free(areq);
+}
+
+static void subscriber_test_client_async_kick(struct subscriber_test_client *client);
+
+static void subscriber_test_client_async_data_cb(struct ubus_request *req, int type, struct blob_attr *msg)
+{
+    struct subscriber_test_client_async *areq = req->priv;
+
+    free(areq->reply_msg);
+    areq->reply_msg = msg ? blob_memdup(msg) : NULL;
+}
+
+static void subscriber_test_client_async_complete_cb(struct ubus_request *req, int ret)
+{
+    struct subscriber_test_client_async *areq = req->priv;
+    struct subscriber_test_client *client = areq->client;
+
+    uloop_timeout_cancel(&areq->timeout);
+    list_del(&areq->list);
+    client->n_active--;
+
+    subscriber_test_client_async_finish(areq, ret);
+    subscriber_test_client_async_kick(client);
+}
+
+static void subscriber_test_client_async_timeout_cb(struct uloop_timeout *t)
+{
+    struct subscriber_test_client_async *areq = container_of(t, struct subscriber_test_client_async, timeout);
+    struct subscriber_test_client *client = areq->client;
+
+    // Aborting does not run the complete callback, finish the request here
+    ubus_abort_request(client->ctx, &areq->req);
+    list_del(&areq->list);
+    client->n_active--;
+
+    subscriber_test_client_async_finish(areq, UBUS_STATUS_TIMEOUT);
+    subscriber_test_client_async_kick(client);
+}
+
+static int subscriber_test_client_async_start(struct subscriber_test_client *client, struct subscriber_test_client_async *areq)
+{
+    int ret;
+
+    ret = subscriber_test_client_resolve(client);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = ubus_invoke_async(client->ctx, client->id, areq->method, areq->msg, &areq->req);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    areq->req.data_cb = subscriber_test_client_async_data_cb;
+    areq->req.complete_cb = subscriber_test_client_async_complete_cb;
+    areq->req.priv = areq;
+    ubus_complete_request_async(client->ctx, &areq->req);
+
+    if (areq->timeout_ms > 0) {
+        areq->timeout.cb = subscriber_test_client_async_timeout_cb;
+        uloop_timeout_set(&areq->timeout, areq->timeout_ms);
+    }
+
+    list_add_tail(&areq->list, &client->active);
+    client->n_active++;
+
+    return UBUS_STATUS_OK;
+}
+
+/* Send queued requests while the in-flight cap allows it */
+static void subscriber_test_client_async_kick(struct subscriber_test_client *client)
+{
+    struct subscriber_test_client_async *areq;
+    int ret;
+
+    while (client->n_active < client->max_inflight && !list_empty(&client->queued)) {
+        areq = list_first_entry(&client->queued, struct subscriber_test_client_async, list);
+        list_del(&areq->list);
+
+        ret = subscriber_test_client_async_start(client, areq);
+        if (ret != UBUS_STATUS_OK) {
+            subscriber_test_client_async_finish(areq, ret);
+        }
+    }
+}
+
+static int subscriber_test_client_async_submit(struct subscriber_test_client *client, const char *method, int cache_method, void (*complete)(struct subscriber_test_client_async *areq, int status), void (*cb)(void), void *priv, int timeout)
+{
+    struct subscriber_test_client_async *areq;
+
+    (void)cache_method;
+
+    areq = calloc(1, sizeof(*areq));
+    if (!areq) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    areq->client = client;
+    areq->method = method;
+    areq->timeout_ms = timeout;
+    areq->complete = complete;
+    areq->cb = cb;
+    areq->priv = priv;
+
+    // The request buffer is reused by the next call, keep a copy until it is sent
+    areq->msg = blob_memdup(client->buf.head);
+    if (!areq->msg) {
+        free(areq);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    list_add_tail(&areq->list, &client->queued);
+
+    subscriber_test_client_async_kick(client);
+
+    return UBUS_STATUS_OK;
+}
+
+int subscriber_test_client_init(struct subscriber_test_client *client, struct ubus_context *ctx)
+{
+    memset(client, 0, sizeof(*client));
+    client->ctx = ctx;
+    client->remove_ev.cb = subscriber_test_client_remove_cb;
+    INIT_LIST_HEAD(&client->queued);
+    INIT_LIST_HEAD(&client->active);
+    client->max_inflight = SUBSCRIBER_TEST_CLIENT_MAX_INFLIGHT;
+
+    return ubus_register_event_handler(ctx, &client->remove_ev, "ubus.object.remove");
+}
+
+void subscriber_test_client_free(struct subscriber_test_client *client)
+{
+    struct subscriber_test_client_async *areq;
+    struct subscriber_test_client_async *tmp;
+
+    // Pending requests are dropped without running their callbacks
+    list_for_each_entry_safe(areq, tmp, &client->active, list) {
+        uloop_timeout_cancel(&areq->timeout);
+        ubus_abort_request(client->ctx, &areq->req);
+        list_del(&areq->list);
+        subscriber_test_client_async_free(areq);
+    }
+    list_for_each_entry_safe(areq, tmp, &client->queued, list) {
+        list_del(&areq->list);
+        subscriber_test_client_async_free(areq);
+    }
+    client->n_active = 0;
+
+    ubus_unregister_event_handler(client->ctx, &client->remove_ev);
+    blob_buf_free(&client->buf);
+    free(client->reply_msg);
+    client->reply_msg = NULL;
+    client->id = 0;
+}
+
+int subscriber_test_call_get_station(struct subscriber_test_client *client, const struct subscriber_test_get_station_params *params, struct subscriber_test_station *reply, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = subscriber_test_get_station_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = subscriber_test_client_invoke(client, "get_station", timeout);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+    if (!client->reply_msg) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    // Strings in the reply point into the client and stay valid until its next call
+    return subscriber_test_station_deserialize(client->reply_msg, reply);
+}
+
+static void subscriber_test_call_get_station_async_complete(struct subscriber_test_client_async *areq, int status)
+{
+    subscriber_test_call_get_station_cb cb = (subscriber_test_call_get_station_cb)areq->cb;
+    struct subscriber_test_station reply;
+
+    memset(&reply, 0, sizeof(reply));
+    if (status == UBUS_STATUS_OK && !areq->reply_msg) {
+        status = UBUS_STATUS_NO_DATA;
+    }
+    if (status == UBUS_STATUS_OK) {
+        status = subscriber_test_station_deserialize(areq->reply_msg, &reply);
+    }
+
+    // The reply is only valid during the callback
+    cb(areq->client, status, status == UBUS_STATUS_OK ? &reply : NULL, areq->priv);
+}
+
+int subscriber_test_call_get_station_async(struct subscriber_test_client *client, const struct subscriber_test_get_station_params *params, subscriber_test_call_get_station_cb cb, void *priv, int timeout)
+{
+    int ret;
+
+    blob_buf_init(&client->buf, 0);
+    ret = subscriber_test_get_station_serialize(&client->buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return subscriber_test_client_async_submit(client, "get_station", -1, subscriber_test_call_get_station_async_complete, (void (*)(void))cb, priv, timeout);
+}
+
+static const struct blobmsg_policy subscriber_test_subscriber_add_policy[] = {
+    { .name = "id", .type = BLOBMSG_TYPE_INT32 },
+    { .name = "path", .type = BLOBMSG_TYPE_STRING },
+};
+
+/* FNV-1a, the case labels of the dispatch are hashed at generation time */
+static uint32_t subscriber_test_subscriber_hash(const char *s)
+{
+    uint32_t hash = 2166136261u;
+
+    while (*s) {
+        hash ^= (uint8_t)*s++;
+        hash *= 16777619u;
+    }
+
+    return hash;
+}
+
+static int subscriber_test_subscriber_notify_cb(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct subscriber_test_subscriber *sub = container_of(obj, struct subscriber_test_subscriber, sub.obj);
+    int ret;
+
+    switch (subscriber_test_subscriber_hash(method)) {
+    case 0xd1c9f764u: { /* assoc */
+        struct subscriber_test_assoc_event_params params;
+
+        if (strcmp(method, "assoc")) {
+            break;
+        }
+        if (!sub->on_assoc) {
+            return UBUS_STATUS_OK;
+        }
+        if (subscriber_test_assoc_event_deserialize(msg, &params) != UBUS_STATUS_OK) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+
+        // Strings in params point into msg and are only valid during the callback
+        sub->on_assoc(sub, &params);
+        return UBUS_STATUS_OK;
+    }
+    case 0x7033c825u: { /* station_update */
+        struct subscriber_test_station params;
+
+        if (strcmp(method, "station_update")) {
+            break;
+        }
+        if (!sub->on_station_update) {
+            return UBUS_STATUS_OK;
+        }
+        if (subscriber_test_station_deserialize(msg, &params) != UBUS_STATUS_OK) {
+            return UBUS_STATUS_INVALID_ARGUMENT;
+        }
+
+        // Strings in params point into msg and are only valid during the callback
+        sub->on_station_update(sub, &params);
+        return UBUS_STATUS_OK;
+    }
+    case 0xe60759e9u: { /* load */
+        if (strcmp(method, "load")) {
+            break;
+        }
+
+        // The mirror follows every message, the callback only sees complete states
+        ret = subscriber_test_load_mirror_apply(&sub->load_mirror, msg);
+        if (ret == UBUS_STATUS_OK && sub->on_load) {
+            sub->on_load(sub, &sub->load_mirror.state);
+        }
+        return ret == UBUS_STATUS_NO_DATA ? UBUS_STATUS_OK : ret;
+    }
+    case 0xb2f3fe9du: { /* flush */
+        if (strcmp(method, "flush")) {
+            break;
+        }
+        if (sub->on_flush) {
+            sub->on_flush(sub);
+        }
+        return UBUS_STATUS_OK;
+    }
+    }
+
+    if (sub->on_other) {
+        sub->on_other(sub, method, msg);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static void subscriber_test_subscriber_subscribe(struct subscriber_test_subscriber *sub, uint32_t id)
+{
+    sub->id = id;
+    sub->subscribed = ubus_subscribe(sub->ctx, &sub->sub, id) == UBUS_STATUS_OK;
+}
+
+static void subscriber_test_subscriber_remove_cb(struct ubus_context *ctx, struct ubus_subscriber *s, uint32_t id)
+{
+    struct subscriber_test_subscriber *sub = container_of(s, struct subscriber_test_subscriber, sub);
+
+    if (id != sub->id) {
+        return;
+    }
+
+    sub->id = 0;
+    sub->subscribed = false;
+    // A restarted object starts a new sequence with a snapshot
+    sub->load_mirror.synced = false;
+}
+
+static void subscriber_test_subscriber_add_cb(struct ubus_context *ctx, struct ubus_event_handler *ev, const char *type, struct blob_attr *msg)
+{
+    struct subscriber_test_subscriber *sub = container_of(ev, struct subscriber_test_subscriber, add_ev);
+    struct blob_attr *tb[ARRAY_SIZE(subscriber_test_subscriber_add_policy)];
+
+    blobmsg_parse(subscriber_test_subscriber_add_policy, ARRAY_SIZE(subscriber_test_subscriber_add_policy), tb, blob_data(msg), blob_len(msg));
+
+    if (!tb[0] || !tb[1] || strcmp(blobmsg_get_string(tb[1]), "subscriber_test")) {
+        return;
+    }
+
+    // The object was (re)registered, possibly under a new id
+    subscriber_test_subscriber_subscribe(sub, blobmsg_get_u32(tb[0]));
+}
+
+int subscriber_test_subscriber_init(struct subscriber_test_subscriber *sub, struct ubus_context *ctx)
+{
+    uint32_t id;
+    int ret;
+
+    memset(sub, 0, sizeof(*sub));
+    sub->ctx = ctx;
+    sub->sub.cb = subscriber_test_subscriber_notify_cb;
+    sub->sub.remove_cb = subscriber_test_subscriber_remove_cb;
+    sub->add_ev.cb = subscriber_test_subscriber_add_cb;
+
+    ret = ubus_register_subscriber(ctx, &sub->sub);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    ret = ubus_register_event_handler(ctx, &sub->add_ev, "ubus.object.add");
+    if (ret != UBUS_STATUS_OK) {
+        ubus_unregister_subscriber(ctx, &sub->sub);
+        return ret;
+    }
+
+    // The object may not be registered yet, the add event subscribes later
+    if (ubus_lookup_id(ctx, "subscriber_test", &id) == UBUS_STATUS_OK) {
+        subscriber_test_subscriber_subscribe(sub, id);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+void subscriber_test_subscriber_free(struct subscriber_test_subscriber *sub)
+{
+    ubus_unregister_event_handler(sub->ctx, &sub->add_ev);
+    ubus_unregister_subscriber(sub->ctx, &sub->sub);
+    subscriber_test_load_mirror_free(&sub->load_mirror);
+    sub->id = 0;
+    sub->subscribed = false;
+}
@@ -0,0 +1,61 @@
+/* Generated from ubus IDL - subscriber_test client */
+
+#ifndef __SUBSCRIBER_TEST_CLIENT_H__
+#define __SUBSCRIBER_TEST_CLIENT_H__
+
+#include <libubus.h>
+#include "subscriber_test_object.h"
+
+/* Default cap of pipelined requests in flight per client */
+#ifndef SUBSCRIBER_TEST_CLIENT_MAX_INFLIGHT
+#define SUBSCRIBER_TEST_CLIENT_MAX_INFLIGHT 16
+#endif
+
+struct subscriber_test_client {
+    struct ubus_context *ctx;
+    uint32_t id;
+    struct ubus_event_handler remove_ev;
+    struct blob_buf buf;
+    struct blob_attr *reply_msg;
+    struct list_head queued;
+    struct list_head active;
+    unsigned int n_active;
+    unsigned int max_inflight;
+};
+
+typedef void (*subscriber_test_call_get_station_cb)(struct subscriber_test_client *client, int status, const struct subscriber_test_station *reply, void *priv);
+
+int subscriber_test_client_init(struct subscriber_test_client *client, struct ubus_context *ctx);
+void subscriber_test_client_free(struct subscriber_test_client *client);
+
+int subscriber_test_call_get_station(struct subscriber_test_client *client, const struct subscriber_test_get_station_params *params, struct subscriber_test_station *reply, int timeout);
+
+int subscriber_test_call_get_station_async(struct subscriber_test_client *client, const struct subscriber_test_get_station_params *params, subscriber_test_call_get_station_cb cb, void *priv, int timeout);
+
+
+struct subscriber_test_subscriber;
+
+typedef void (*subscriber_test_assoc_cb)(struct subscriber_test_subscriber *sub, const struct subscriber_test_assoc_event_params *params);
+typedef void (*subscriber_test_station_update_cb)(struct subscriber_test_subscriber *sub, const struct subscriber_test_station *params);
+typedef void (*subscriber_test_load_cb)(struct subscriber_test_subscriber *sub, const struct subscriber_test_load_event_params *params);
+typedef void (*subscriber_test_flush_cb)(struct subscriber_test_subscriber *sub);
+
+/* Set the callbacks after subscriber_test_subscriber_init(), notifications arrive from uloop */
+struct subscriber_test_subscriber {
+    struct ubus_context *ctx;
+    struct ubus_subscriber sub;
+    struct ubus_event_handler add_ev;
+    uint32_t id;
+    bool subscribed;
+    subscriber_test_assoc_cb on_assoc;
+    subscriber_test_station_update_cb on_station_update;
+    subscriber_test_load_cb on_load;
+    subscriber_test_flush_cb on_flush;
+    void (*on_other)(struct subscriber_test_subscriber *sub, const char *type, struct blob_attr *msg);
+    struct subscriber_test_load_mirror load_mirror;
+};
+
+int subscriber_test_subscriber_init(struct subscriber_test_subscriber *sub, struct ubus_context *ctx);
+void subscriber_test_subscriber_free(struct subscriber_test_subscriber *sub);
+
+#endif /* __SUBSCRIBER_TEST_CLIENT_H__ */
@@ -0,0 +1,590 @@
+/* Generated from ubus IDL - subscriber_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include "subscriber_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy subscriber_test_get_station_policy[] = {
+    [SUBSCRIBER_TEST_GET_STATION_MAC] = { .name = "mac", .type = BLOBMSG_TYPE_STRING }
+};
+
+int subscriber_test_get_station_deserialize(struct blob_attr *msg, struct subscriber_test_get_station_params *params)
+{
+    struct blob_attr *tb_subscriber_test_get_station[__SUBSCRIBER_TEST_GET_STATION_MAX];
+    if (blobmsg_parse(subscriber_test_get_station_policy, ARRAY_SIZE(subscriber_test_get_station_policy), tb_subscriber_test_get_station, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_subscriber_test_get_station[SUBSCRIBER_TEST_GET_STATION_MAC]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->mac = blobmsg_get_string(tb_subscriber_test_get_station[SUBSCRIBER_TEST_GET_STATION_MAC]);
+    return UBUS_STATUS_OK;
+}
+
+int subscriber_test_get_station_serialize(struct blob_buf *b, const struct subscriber_test_get_station_params *params)
+{
+    UBUS_IDL_ADD(string, b, "mac", params->mac);
+    return UBUS_STATUS_OK;
+}
+
+struct subscriber_test_get_station_params *subscriber_test_get_station_dup(const struct subscriber_test_get_station_params *params)
+{
+    size_t len = sizeof(*params);
+    struct subscriber_test_get_station_params *copy;
+    char *p;
+
+    if (params->mac) {
+        len += strlen(params->mac) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->mac = params->mac ? ubus_idl_dup_string(&p, params->mac) : NULL;
+    return copy;
+}
+
+void subscriber_test_get_station_free(struct subscriber_test_get_station_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy subscriber_test_assoc_event_policy[] = {
+    [SUBSCRIBER_TEST_ASSOC_EVENT_MAC] = { .name = "mac", .type = BLOBMSG_TYPE_STRING },
+    [SUBSCRIBER_TEST_ASSOC_EVENT_IFNAME] = { .name = "ifname", .type = BLOBMSG_TYPE_STRING }
+};
+
+int subscriber_test_assoc_event_deserialize(struct blob_attr *msg, struct subscriber_test_assoc_event_params *params)
+{
+    struct blob_attr *tb_subscriber_test_assoc_event[__SUBSCRIBER_TEST_ASSOC_EVENT_MAX];
+    if (blobmsg_parse(subscriber_test_assoc_event_policy, ARRAY_SIZE(subscriber_test_assoc_event_policy), tb_subscriber_test_assoc_event, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_subscriber_test_assoc_event[SUBSCRIBER_TEST_ASSOC_EVENT_MAC] || !tb_subscriber_test_assoc_event[SUBSCRIBER_TEST_ASSOC_EVENT_IFNAME]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->mac = blobmsg_get_string(tb_subscriber_test_assoc_event[SUBSCRIBER_TEST_ASSOC_EVENT_MAC]);
+    params->ifname = blobmsg_get_string(tb_subscriber_test_assoc_event[SUBSCRIBER_TEST_ASSOC_EVENT_IFNAME]);
+    return UBUS_STATUS_OK;
+}
+
+int subscriber_test_assoc_event_serialize(struct blob_buf *b, const struct subscriber_test_assoc_event_params *params)
+{
+    UBUS_IDL_ADD(string, b, "mac", params->mac);
+    UBUS_IDL_ADD(string, b, "ifname", params->ifname);
+    return UBUS_STATUS_OK;
+}
+
+struct subscriber_test_assoc_event_params *subscriber_test_assoc_event_dup(const struct subscriber_test_assoc_event_params *params)
+{
+    size_t len = sizeof(*params);
+    struct subscriber_test_assoc_event_params *copy;
+    char *p;
+
+    if (params->mac) {
+        len += strlen(params->mac) + 1;
+    }
+    if (params->ifname) {
+        len += strlen(params->ifname) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->mac = params->mac ? ubus_idl_dup_string(&p, params->mac) : NULL;
+    copy->ifname = params->ifname ? ubus_idl_dup_string(&p, params->ifname) : NULL;
+    return copy;
+}
+
+void subscriber_test_assoc_event_free(struct subscriber_test_assoc_event_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy subscriber_test_station_policy[] = {
+    [SUBSCRIBER_TEST_STATION_MAC] = { .name = "mac", .type = BLOBMSG_TYPE_STRING },
+    [SUBSCRIBER_TEST_STATION_SIGNAL] = { .name = "signal", .type = BLOBMSG_TYPE_INT32 },
+    [SUBSCRIBER_TEST_STATION_RX_RATE] = { .name = "rx_rate", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int subscriber_test_station_deserialize(struct blob_attr *msg, struct subscriber_test_station *params)
+{
+    struct blob_attr *tb_subscriber_test_station[__SUBSCRIBER_TEST_STATION_MAX];
+    if (blobmsg_parse(subscriber_test_station_policy, ARRAY_SIZE(subscriber_test_station_policy), tb_subscriber_test_station, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_subscriber_test_station[SUBSCRIBER_TEST_STATION_MAC] || !tb_subscriber_test_station[SUBSCRIBER_TEST_STATION_SIGNAL]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->mac = blobmsg_get_string(tb_subscriber_test_station[SUBSCRIBER_TEST_STATION_MAC]);
+    params->signal = blobmsg_get_u32(tb_subscriber_test_station[SUBSCRIBER_TEST_STATION_SIGNAL]);
+
+    UBUS_IDL_GET_OPTIONAL(u32, tb_subscriber_test_station, SUBSCRIBER_TEST_STATION_RX_RATE, params->rx_rate, params, FIELD, SUBSCRIBER_TEST_STATION_HAS_RX_RATE);
+    return UBUS_STATUS_OK;
+}
+
+int subscriber_test_station_serialize(struct blob_buf *b, const struct subscriber_test_station *params)
+{
+    UBUS_IDL_ADD(string, b, "mac", params->mac);
+    UBUS_IDL_ADD(u32, b, "signal", params->signal);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "rx_rate", params->rx_rate, params, FIELD, SUBSCRIBER_TEST_STATION_HAS_RX_RATE);
+    return UBUS_STATUS_OK;
+}
+
+struct subscriber_test_station *subscriber_test_station_dup(const struct subscriber_test_station *params)
+{
+    size_t len = sizeof(*params);
+    struct subscriber_test_station *copy;
+    char *p;
+
+    if (params->mac) {
+        len += strlen(params->mac) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->mac = params->mac ? ubus_idl_dup_string(&p, params->mac) : NULL;
+    return copy;
+}
+
+void subscriber_test_station_free(struct subscriber_test_station *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy subscriber_test_load_event_policy[] = {
+    [SUBSCRIBER_TEST_LOAD_EVENT_CHANNEL_LOAD] = { .name = "channel_load", .type = BLOBMSG_TYPE_INT32 },
+    [SUBSCRIBER_TEST_LOAD_EVENT_NOISE] = { .name = "noise", .type = BLOBMSG_TYPE_INT32 },
+    [SUBSCRIBER_TEST_LOAD_EVENT_CLIENTS] = { .name = "clients", .type = BLOBMSG_TYPE_INT32 }
+};
+
+int subscriber_test_load_event_deserialize(struct blob_attr *msg, struct subscriber_test_load_event_params *params)
+{
+    struct blob_attr *tb_subscriber_test_load_event[__SUBSCRIBER_TEST_LOAD_EVENT_MAX];
+    if (blobmsg_parse(subscriber_test_load_event_policy, ARRAY_SIZE(subscriber_test_load_event_policy), tb_subscriber_test_load_event, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_subscriber_test_load_event[SUBSCRIBER_TEST_LOAD_EVENT_CHANNEL_LOAD] || !tb_subscriber_test_load_event[SUBSCRIBER_TEST_LOAD_EVENT_NOISE]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->channel_load = blobmsg_get_u32(tb_subscriber_test_load_event[SUBSCRIBER_TEST_LOAD_EVENT_CHANNEL_LOAD]);
+    params->noise = blobmsg_get_u32(tb_subscriber_test_load_event[SUBSCRIBER_TEST_LOAD_EVENT_NOISE]);
+
+    UBUS_IDL_GET_OPTIONAL(u32, tb_subscriber_test_load_event, SUBSCRIBER_TEST_LOAD_EVENT_CLIENTS, params->clients, params, FIELD, SUBSCRIBER_TEST_LOAD_EVENT_HAS_CLIENTS);
+    return UBUS_STATUS_OK;
+}
+
+int subscriber_test_load_event_serialize(struct blob_buf *b, const struct subscriber_test_load_event_params *params)
+{
+    UBUS_IDL_ADD(u32, b, "channel_load", params->channel_load);
+    UBUS_IDL_ADD(u32, b, "noise", params->noise);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "clients", params->clients, params, FIELD, SUBSCRIBER_TEST_LOAD_EVENT_HAS_CLIENTS);
+    return UBUS_STATUS_OK;
+}
+
+struct subscriber_test_load_event_params *subscriber_test_load_event_dup(const struct subscriber_test_load_event_params *params)
+{
+    size_t len = sizeof(*params);
+    struct subscriber_test_load_event_params *copy;
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    return copy;
+}
+
+void subscriber_test_load_event_free(struct subscriber_test_load_event_params *params)
+{
+    free(params);
+}
+
+/* Fields added to delta notifications next to the event payload */
+enum {
+    SUBSCRIBER_TEST_DELTA_SEQ,
+    SUBSCRIBER_TEST_DELTA_FULL,
+    SUBSCRIBER_TEST_DELTA_CLEARED,
+    __SUBSCRIBER_TEST_DELTA_MAX
+};
+
+static const struct blobmsg_policy subscriber_test_delta_policy[] = {
+    [SUBSCRIBER_TEST_DELTA_SEQ] = { .name = "_seq", .type = BLOBMSG_TYPE_INT32 },
+    [SUBSCRIBER_TEST_DELTA_FULL] = { .name = "_full", .type = BLOBMSG_TYPE_BOOL },
+    [SUBSCRIBER_TEST_DELTA_CLEARED] = { .name = "_cleared", .type = BLOBMSG_TYPE_ARRAY },
+};
+
+int subscriber_test_load_mirror_apply(struct subscriber_test_load_mirror *mirror, struct blob_attr *msg)
+{
+    struct blob_attr *meta[__SUBSCRIBER_TEST_DELTA_MAX];
+    struct blob_attr *tb[__SUBSCRIBER_TEST_LOAD_EVENT_MAX];
+    uint64_t cleared[1] = { 0 };
+    struct blob_attr *word;
+    size_t rem;
+    uint32_t seq;
+    bool full;
+    int i;
+
+    if (blobmsg_parse(subscriber_test_delta_policy, ARRAY_SIZE(subscriber_test_delta_policy), meta, blob_data(msg), blob_len(msg)) < 0 ||
+        !meta[SUBSCRIBER_TEST_DELTA_SEQ]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    seq = blobmsg_get_u32(meta[SUBSCRIBER_TEST_DELTA_SEQ]);
+    full = meta[SUBSCRIBER_TEST_DELTA_FULL] && blobmsg_get_bool(meta[SUBSCRIBER_TEST_DELTA_FULL]);
+    if (meta[SUBSCRIBER_TEST_DELTA_CLEARED]) {
+        i = 0;
+        blobmsg_for_each_attr(word, meta[SUBSCRIBER_TEST_DELTA_CLEARED], rem) {
+            if (i == 1 || blobmsg_type(word) != BLOBMSG_TYPE_INT64) {
+                return UBUS_STATUS_INVALID_ARGUMENT;
+            }
+            cleared[i++] = blobmsg_get_u64(word);
+        }
+    }
+
+    // A delta only applies on top of the previous message, wait for a snapshot after a gap
+    if (!full && (!mirror->synced || seq != mirror->seq + 1)) {
+        mirror->synced = false;
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    if (blobmsg_parse(subscriber_test_load_event_policy, ARRAY_SIZE(subscriber_test_load_event_policy), tb, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    for (i = 0; i < __SUBSCRIBER_TEST_LOAD_EVENT_MAX; i++) {
+        if (full || tb[i] || UBUS_IDL_TEST_BIT(cleared, i)) {
+            free(mirror->fields[i]);
+            mirror->fields[i] = tb[i] ? blob_memdup(tb[i]) : NULL;
+        }
+    }
+
+    // Rebuild the whole table and decode it with the generated deserializer
+    blob_buf_init(&mirror->buf, 0);
+    for (i = 0; i < __SUBSCRIBER_TEST_LOAD_EVENT_MAX; i++) {
+        if (mirror->fields[i]) {
+            blob_put_raw(&mirror->buf, mirror->fields[i], blob_pad_len(mirror->fields[i]));
+        }
+    }
+
+    mirror->seq = seq;
+    mirror->synced = true;
+    return subscriber_test_load_event_deserialize(mirror->buf.head, &mirror->state);
+}
+
+void subscriber_test_load_mirror_free(struct subscriber_test_load_mirror *mirror)
+{
+    int i;
+
+    for (i = 0; i < __SUBSCRIBER_TEST_LOAD_EVENT_MAX; i++) {
+        free(mirror->fields[i]);
+        mirror->fields[i] = NULL;
+    }
+    blob_buf_free(&mirror->buf);
+    mirror->synced = false;
+}
+
+/* Server side, left out when only the client and the codecs are linked */
+#ifndef UBUS_IDL_CLIENT_ONLY
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf subscriber_test_reply_buf;
+
+int subscriber_test_get_station_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct subscriber_test_station *reply)
+{
+    int ret;
+
+    blob_buf_init(&subscriber_test_reply_buf, 0);
+    ret = subscriber_test_station_serialize(&subscriber_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, subscriber_test_reply_buf.head);
+}
+
+static const struct ubus_method subscriber_test_methods[] = {
+    UBUS_METHOD("get_station", subscriber_test_get_station_handler, subscriber_test_get_station_policy)
+};
+
+static struct ubus_object_type subscriber_test_object_type =
+    UBUS_OBJECT_TYPE("subscriber_test", subscriber_test_methods);
+
+static void subscriber_test_subscribe_cb(struct ubus_context *ctx, struct ubus_object *obj);
+
+struct ubus_object subscriber_test_object = {
+    .name = "subscriber_test",
+    .type = &subscriber_test_object_type,
+    .subscribe_cb = subscriber_test_subscribe_cb,
+    .methods = subscriber_test_methods,
+    .n_methods = ARRAY_SIZE(subscriber_test_methods),
+};
+
+/* Buffer reused by all event notifications of this object */
+static struct blob_buf subscriber_test_event_buf;
+
+static bool subscriber_test_delta_empty(const uint64_t *mask, int words)
+{
+    int i;
+
+    for (i = 0; i < words; i++) {
+        if (mask[i]) {
+            return false;
+        }
+    }
+    return true;
+}
+
+int subscriber_test_notify_assoc(struct ubus_context *ctx, const struct subscriber_test_assoc_event_params *params)
+{
+    int ret;
+
+    // Nobody is subscribed, skip building the message
+    if (!subscriber_test_object.has_subscribers) {
+        return UBUS_STATUS_OK;
+    }
+
+    blob_buf_init(&subscriber_test_event_buf, 0);
+    ret = subscriber_test_assoc_event_serialize(&subscriber_test_event_buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_notify(ctx, &subscriber_test_object, "assoc", subscriber_test_event_buf.head, -1);
+}
+
+int subscriber_test_notify_station_update(struct ubus_context *ctx, const struct subscriber_test_station *params)
+{
+    int ret;
+
+    // Nobody is subscribed, skip building the message
+    if (!subscriber_test_object.has_subscribers) {
+        return UBUS_STATUS_OK;
+    }
+
+    blob_buf_init(&subscriber_test_event_buf, 0);
+    ret = subscriber_test_station_serialize(&subscriber_test_event_buf, params);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_notify(ctx, &subscriber_test_object, "station_update", subscriber_test_event_buf.head, -1);
+}
+
+#ifndef SUBSCRIBER_TEST_LOAD_SNAPSHOT_INTERVAL
+#define SUBSCRIBER_TEST_LOAD_SNAPSHOT_INTERVAL 8
+#endif
+
+/* Last published load event, the next delta is computed against it */
+static struct {
+    struct subscriber_test_load_event_params last;
+    uint32_t seq;
+    unsigned int since_full;
+    bool valid;
+} subscriber_test_load_delta;
+
+static void subscriber_test_load_delta_reset(void)
+{
+    memset(&subscriber_test_load_delta.last, 0, sizeof(subscriber_test_load_delta.last));
+    subscriber_test_load_delta.valid = false;
+}
+
+/* Set fields of params, the bits follow the policy indices */
+static void subscriber_test_load_delta_present(const struct subscriber_test_load_event_params *params, uint64_t *mask)
+{
+    memset(mask, 0, 1 * sizeof(uint64_t));
+    UBUS_IDL_SET_BIT(mask, SUBSCRIBER_TEST_LOAD_EVENT_CHANNEL_LOAD);
+    UBUS_IDL_SET_BIT(mask, SUBSCRIBER_TEST_LOAD_EVENT_NOISE);
+    if (UBUS_IDL_HAS_FIELD(params, SUBSCRIBER_TEST_LOAD_EVENT_HAS_CLIENTS)) {
+        UBUS_IDL_SET_BIT(mask, SUBSCRIBER_TEST_LOAD_EVENT_CLIENTS);
+    }
+}
+
+static int subscriber_test_load_delta_send(struct ubus_context *ctx, const uint64_t *dirty, const uint64_t *cleared, bool full)
+{
+    const struct subscriber_test_load_event_params *last = &subscriber_test_load_delta.last;
+    void *words;
+    int i;
+
+    blob_buf_init(&subscriber_test_event_buf, 0);
+    blobmsg_add_u32(&subscriber_test_event_buf, "_seq", ++subscriber_test_load_delta.seq);
+    if (full) {
+        blobmsg_add_u8(&subscriber_test_event_buf, "_full", 1);
+    }
+    if (cleared && !subscriber_test_delta_empty(cleared, 1)) {
+        words = blobmsg_open_array(&subscriber_test_event_buf, "_cleared");
+        for (i = 0; i < 1; i++) {
+            blobmsg_add_u64(&subscriber_test_event_buf, NULL, cleared[i]);
+        }
+        blobmsg_close_array(&subscriber_test_event_buf, words);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, SUBSCRIBER_TEST_LOAD_EVENT_CHANNEL_LOAD) {
+        blobmsg_add_u32(&subscriber_test_event_buf, "channel_load", last->channel_load);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, SUBSCRIBER_TEST_LOAD_EVENT_NOISE) {
+        blobmsg_add_u32(&subscriber_test_event_buf, "noise", last->noise);
+    }
+    if UBUS_IDL_TEST_BIT(dirty, SUBSCRIBER_TEST_LOAD_EVENT_CLIENTS) {
+        blobmsg_add_u32(&subscriber_test_event_buf, "clients", last->clients);
+    }
+
+    subscriber_test_load_delta.since_full = full ? 0 : subscriber_test_load_delta.since_full + 1;
+    return ubus_notify(ctx, &subscriber_test_object, "load", subscriber_test_event_buf.head, -1);
+}
+
+int subscriber_test_notify_load(struct ubus_context *ctx, const struct subscriber_test_load_event_params *params)
+{
+    struct subscriber_test_load_event_params *last = &subscriber_test_load_delta.last;
+    uint64_t present[1];
+    uint64_t previous[1] = { 0 };
+    uint64_t stale[1];
+    uint64_t dirty[1] = { 0 };
+    bool full;
+    int i;
+
+    // Nobody is subscribed, the next subscriber starts from a snapshot
+    if (!subscriber_test_object.has_subscribers) {
+        subscriber_test_load_delta_reset();
+        return UBUS_STATUS_OK;
+    }
+
+    full = !subscriber_test_load_delta.valid || subscriber_test_load_delta.since_full >= SUBSCRIBER_TEST_LOAD_SNAPSHOT_INTERVAL;
+    subscriber_test_load_delta_present(params, present);
+    if (subscriber_test_load_delta.valid) {
+        subscriber_test_load_delta_present(last, previous);
+    }
+    for (i = 0; i < 1; i++) {
+        stale[i] = previous[i] & ~present[i];
+    }
+
+    // Compare field by field, the bits follow the policy indices
+    if (UBUS_IDL_TEST_BIT(present, SUBSCRIBER_TEST_LOAD_EVENT_CHANNEL_LOAD) && (full || !UBUS_IDL_TEST_BIT(previous, SUBSCRIBER_TEST_LOAD_EVENT_CHANNEL_LOAD) ||
+        params->channel_load != last->channel_load)) {
+        UBUS_IDL_SET_BIT(dirty, SUBSCRIBER_TEST_LOAD_EVENT_CHANNEL_LOAD);
+        last->channel_load = params->channel_load;
+    }
+    if (UBUS_IDL_TEST_BIT(present, SUBSCRIBER_TEST_LOAD_EVENT_NOISE) && (full || !UBUS_IDL_TEST_BIT(previous, SUBSCRIBER_TEST_LOAD_EVENT_NOISE) ||
+        params->noise != last->noise)) {
+        UBUS_IDL_SET_BIT(dirty, SUBSCRIBER_TEST_LOAD_EVENT_NOISE);
+        last->noise = params->noise;
+    }
+    if (UBUS_IDL_TEST_BIT(present, SUBSCRIBER_TEST_LOAD_EVENT_CLIENTS) && (full || !UBUS_IDL_TEST_BIT(previous, SUBSCRIBER_TEST_LOAD_EVENT_CLIENTS) ||
+        params->clients != last->clients)) {
+        UBUS_IDL_SET_BIT(dirty, SUBSCRIBER_TEST_LOAD_EVENT_CLIENTS);
+        last->clients = params->clients;
+    }
+    memcpy(&last->has_fields, &params->has_fields, sizeof(last->has_fields));
+
+    if (!full && subscriber_test_delta_empty(dirty, 1) && subscriber_test_delta_empty(stale, 1)) {
+        return UBUS_STATUS_OK;
+    }
+
+    subscriber_test_load_delta.valid = true;
+    return subscriber_test_load_delta_send(ctx, dirty, full ? NULL : stale, full);
+}
+
+int subscriber_test_notify_load_full(struct ubus_context *ctx)
+{
+    uint64_t present[1];
+
+    if (!subscriber_test_load_delta.valid || !subscriber_test_object.has_subscribers) {
+        return UBUS_STATUS_NO_DATA;
+    }
+
+    subscriber_test_load_delta_present(&subscriber_test_load_delta.last, present);
+    return subscriber_test_load_delta_send(ctx, present, NULL, true);
+}
+
+int subscriber_test_notify_flush(struct ubus_context *ctx)
+{
+    // Nobody is subscribed, skip building the message
+    if (!subscriber_test_object.has_subscribers) {
+        return UBUS_STATUS_OK;
+    }
+
+    blob_buf_init(&subscriber_test_event_buf, 0);
+
+    return ubus_notify(ctx, &subscriber_test_object, "flush", subscriber_test_event_buf.head, -1);
+}
+
+static void subscriber_test_subscribe_cb(struct ubus_context *ctx, struct ubus_object *obj)
+{
+    // Bring a new subscriber up to date with a snapshot of every delta event
+    if (!obj->has_subscribers) {
+        return;
+    }
+
+    subscriber_test_notify_load_full(ctx);
+}
+
+void subscriber_test_object_cleanup(void)
+{
+    blob_buf_free(&subscriber_test_reply_buf);
+    blob_buf_free(&subscriber_test_event_buf);
+    subscriber_test_load_delta_reset();
+}
+
+#endif /* UBUS_IDL_CLIENT_ONLY */
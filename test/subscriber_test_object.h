@@ -0,0 +1,131 @@
+/* Generated from ubus IDL - subscriber_test */
+
+#ifndef __SUBSCRIBER_TEST_OBJECT_H__
+#define __SUBSCRIBER_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct subscriber_test_station {
+    const char * mac;
+    int32_t signal;
+    int32_t rx_rate;
+    uint8_t has_fields;
+};
+#define SUBSCRIBER_TEST_STATION_HAS_RX_RATE 0
+_Static_assert(sizeof(struct subscriber_test_station) == UBUS_IDL_PACKED_SIZE(struct subscriber_test_station, sizeof(const char *) + 2 * sizeof(int32_t) + sizeof(uint8_t)),
+               "struct subscriber_test_station has padding between members");
+
+struct subscriber_test_get_station_params {
+    const char * mac;
+};
+_Static_assert(sizeof(struct subscriber_test_get_station_params) == UBUS_IDL_PACKED_SIZE(struct subscriber_test_get_station_params, sizeof(const char *)),
+               "struct subscriber_test_get_station_params has padding between members");
+
+struct subscriber_test_assoc_event_params {
+    const char * mac;
+    const char * ifname;
+};
+_Static_assert(sizeof(struct subscriber_test_assoc_event_params) == UBUS_IDL_PACKED_SIZE(struct subscriber_test_assoc_event_params, 2 * sizeof(const char *)),
+               "struct subscriber_test_assoc_event_params has padding between members");
+
+struct subscriber_test_load_event_params {
+    int32_t channel_load;
+    int32_t noise;
+    int32_t clients;
+    uint8_t has_fields;
+};
+#define SUBSCRIBER_TEST_LOAD_EVENT_HAS_CLIENTS 0
+_Static_assert(sizeof(struct subscriber_test_load_event_params) == UBUS_IDL_PACKED_SIZE(struct subscriber_test_load_event_params, 3 * sizeof(int32_t) + sizeof(uint8_t)),
+               "struct subscriber_test_load_event_params has padding between members");
+
+enum {
+    SUBSCRIBER_TEST_GET_STATION_MAC,
+    __SUBSCRIBER_TEST_GET_STATION_MAX
+};
+
+enum {
+    SUBSCRIBER_TEST_ASSOC_EVENT_MAC,
+    SUBSCRIBER_TEST_ASSOC_EVENT_IFNAME,
+    __SUBSCRIBER_TEST_ASSOC_EVENT_MAX
+};
+
+enum {
+    SUBSCRIBER_TEST_STATION_MAC,
+    SUBSCRIBER_TEST_STATION_SIGNAL,
+    SUBSCRIBER_TEST_STATION_RX_RATE,
+    __SUBSCRIBER_TEST_STATION_MAX
+};
+
+enum {
+    SUBSCRIBER_TEST_LOAD_EVENT_CHANNEL_LOAD,
+    SUBSCRIBER_TEST_LOAD_EVENT_NOISE,
+    SUBSCRIBER_TEST_LOAD_EVENT_CLIENTS,
+    __SUBSCRIBER_TEST_LOAD_EVENT_MAX
+};
+
+int subscriber_test_get_station_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+int subscriber_test_get_station_deserialize(struct blob_attr *msg, struct subscriber_test_get_station_params *params);
+int subscriber_test_get_station_serialize(struct blob_buf *b, const struct subscriber_test_get_station_params *params);
+int subscriber_test_assoc_event_deserialize(struct blob_attr *msg, struct subscriber_test_assoc_event_params *params);
+int subscriber_test_assoc_event_serialize(struct blob_buf *b, const struct subscriber_test_assoc_event_params *params);
+int subscriber_test_station_deserialize(struct blob_attr *msg, struct subscriber_test_station *params);
+int subscriber_test_station_serialize(struct blob_buf *b, const struct subscriber_test_station *params);
+int subscriber_test_load_event_deserialize(struct blob_attr *msg, struct subscriber_test_load_event_params *params);
+int subscriber_test_load_event_serialize(struct blob_buf *b, const struct subscriber_test_load_event_params *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct subscriber_test_get_station_params *subscriber_test_get_station_dup(const struct subscriber_test_get_station_params *params);
+void subscriber_test_get_station_free(struct subscriber_test_get_station_params *params);
+struct subscriber_test_assoc_event_params *subscriber_test_assoc_event_dup(const struct subscriber_test_assoc_event_params *params);
+void subscriber_test_assoc_event_free(struct subscriber_test_assoc_event_params *params);
+struct subscriber_test_station *subscriber_test_station_dup(const struct subscriber_test_station *params);
+void subscriber_test_station_free(struct subscriber_test_station *params);
+struct subscriber_test_load_event_params *subscriber_test_load_event_dup(const struct subscriber_test_load_event_params *params);
+void subscriber_test_load_event_free(struct subscriber_test_load_event_params *params);
+
+int subscriber_test_get_station_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct subscriber_test_station *reply);
+
+/* Local copy of the load event, rebuilt from snapshots and deltas */
+struct subscriber_test_load_mirror {
+    struct subscriber_test_load_event_params state;
+    struct blob_attr *fields[__SUBSCRIBER_TEST_LOAD_EVENT_MAX];
+    struct blob_buf buf;
+    uint32_t seq;
+    bool synced;
+};
+
+int subscriber_test_load_mirror_apply(struct subscriber_test_load_mirror *mirror, struct blob_attr *msg);
+void subscriber_test_load_mirror_free(struct subscriber_test_load_mirror *mirror);
+
+extern struct ubus_object subscriber_test_object;
+
+int subscriber_test_notify_assoc(struct ubus_context *ctx, const struct subscriber_test_assoc_event_params *params);
+int subscriber_test_notify_station_update(struct ubus_context *ctx, const struct subscriber_test_station *params);
+int subscriber_test_notify_load(struct ubus_context *ctx, const struct subscriber_test_load_event_params *params);
+int subscriber_test_notify_load_full(struct ubus_context *ctx);
+int subscriber_test_notify_flush(struct ubus_context *ctx);
+
+void subscriber_test_object_cleanup(void);
+
+#endif /* __SUBSCRIBER_TEST_OBJECT_H__ */
@@ -0,0 +1,487 @@
+/* Generated from ubus IDL - trace_test */
+
+#include <libubox/blobmsg_json.h>
+#include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "trace_test_object.h"
+
+/* Helper macros for optional field deserialization */
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
+    do { \
+        if ((tb)[(enum)]) { \
+            (field) = blobmsg_get_##type((tb)[(enum)]); \
+            UBUS_IDL_SET_##kind((params), (index)); \
+        } \
+    } while (0)
+
+/* Helper macros for optional field serialization */
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
+    do { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
+            blobmsg_add_##type((b), (name), (field)); \
+        } \
+    } while (0)
+
+/* Helper macros for field serialization with error checking */
+#define UBUS_IDL_ADD(type, b, name, val) \
+    do { \
+        int _ret = blobmsg_add_##type((b), (name), (val)); \
+        if (_ret < 0) { \
+            return UBUS_STATUS_INVALID_ARGUMENT; \
+        } \
+    } while (0)
+
+static const char *const trace_test_method_names[] = {
+    [TRACE_TEST_METHOD_LOOKUP] = "lookup",
+    [TRACE_TEST_METHOD_STORE] = "store",
+    [TRACE_TEST_METHOD_PING] = "ping",
+    [TRACE_TEST_METHOD_SYNC] = "sync",
+};
+
+static uint64_t trace_test_now_us(clockid_t clock)
+{
+    struct timespec ts;
+
+    clock_gettime(clock, &ts);
+    return (uint64_t)ts.tv_sec * 1000000 + ts.tv_nsec / 1000;
+}
+
+#ifndef TRACE_TEST_TRACE_SAMPLE
+#define TRACE_TEST_TRACE_SAMPLE 4
+#endif
+
+#ifndef TRACE_TEST_TRACE_SIZE
+#define TRACE_TEST_TRACE_SIZE 128
+#endif
+
+#ifndef TRACE_TEST_TRACE_PAYLOAD_MAX
+#define TRACE_TEST_TRACE_PAYLOAD_MAX 256
+#endif
+
+/* One sampled request, the payload is the raw blob_attr cut at the payload limit */
+struct trace_test_trace_entry {
+    uint64_t timestamp_us;
+    uint32_t duration_us;
+    int method;
+    int status;
+    uint32_t size;
+    uint32_t captured;
+    uint8_t payload[TRACE_TEST_TRACE_PAYLOAD_MAX];
+};
+
+/* Ring of the latest sampled requests, only touched from the uloop thread */
+static struct {
+    struct trace_test_trace_entry entries[TRACE_TEST_TRACE_SIZE];
+    uint32_t next;
+    uint32_t count;
+    uint32_t seen;
+} trace_test_trace;
+
+static void trace_test_trace_record(int index, int status, struct blob_attr *msg, uint64_t start_us, uint64_t elapsed_us)
+{
+    struct trace_test_trace_entry *entry;
+
+    if (++trace_test_trace.seen < TRACE_TEST_TRACE_SAMPLE) {
+        return;
+    }
+    trace_test_trace.seen = 0;
+
+    entry = &trace_test_trace.entries[trace_test_trace.next];
+    trace_test_trace.next = (trace_test_trace.next + 1) % TRACE_TEST_TRACE_SIZE;
+    if (trace_test_trace.count < TRACE_TEST_TRACE_SIZE) {
+        trace_test_trace.count++;
+    }
+
+    entry->timestamp_us = start_us;
+    entry->duration_us = elapsed_us > UINT32_MAX ? UINT32_MAX : (uint32_t)elapsed_us;
+    entry->method = index;
+    entry->status = status;
+    entry->size = msg ? blob_raw_len(msg) : 0;
+    entry->captured = entry->size < sizeof(entry->payload) ? entry->size : sizeof(entry->payload);
+    if (entry->captured) {
+        memcpy(entry->payload, msg, entry->captured);
+    }
+}
+
+/* Start of the call being dispatched, kept by a deferred call until it is answered */
+static uint64_t trace_test_dispatch_start;
+
+/* Record a deferred call once answered, with the status sent to the caller */
+static void trace_test_record_deferred(int index, int status, struct blob_attr *msg, uint64_t start_us)
+{
+    uint64_t elapsed = trace_test_now_us(CLOCK_MONOTONIC) - start_us;
+
+    // The wall clock start is taken back from the measured duration
+    trace_test_trace_record(index, status, msg, trace_test_now_us(CLOCK_REALTIME) - elapsed, elapsed);
+}
+
+/* Run a handler and record the call, a deferred call is recorded when it is answered instead */
+static int trace_test_dispatch_call(int index, ubus_handler_t handler, bool deferrable, uint64_t start,
+                             struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req,
+                             const char *method, struct blob_attr *msg)
+{
+    // Queued calls started before now, the wall clock start is taken back from start
+    uint64_t timestamp = trace_test_now_us(CLOCK_REALTIME) - (trace_test_now_us(CLOCK_MONOTONIC) - start);
+    uint64_t elapsed;
+    int ret;
+
+    trace_test_dispatch_start = start;
+    ret = handler(ctx, obj, req, method, msg);
+    elapsed = trace_test_now_us(CLOCK_MONOTONIC) - start;
+
+    if (deferrable && req->deferred) {
+        return ret;
+    }
+
+    trace_test_trace_record(index, ret, msg, timestamp, elapsed);
+
+    return ret;
+}
+
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
+static const struct blobmsg_policy trace_test_lookup_policy[] = {
+    [TRACE_TEST_LOOKUP_KEY] = { .name = "key", .type = BLOBMSG_TYPE_STRING }
+};
+
+int trace_test_lookup_deserialize(struct blob_attr *msg, struct trace_test_lookup_params *params)
+{
+    struct blob_attr *tb_trace_test_lookup[__TRACE_TEST_LOOKUP_MAX];
+    if (blobmsg_parse(trace_test_lookup_policy, ARRAY_SIZE(trace_test_lookup_policy), tb_trace_test_lookup, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_trace_test_lookup[TRACE_TEST_LOOKUP_KEY]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->key = blobmsg_get_string(tb_trace_test_lookup[TRACE_TEST_LOOKUP_KEY]);
+    return UBUS_STATUS_OK;
+}
+
+int trace_test_lookup_serialize(struct blob_buf *b, const struct trace_test_lookup_params *params)
+{
+    UBUS_IDL_ADD(string, b, "key", params->key);
+    return UBUS_STATUS_OK;
+}
+
+struct trace_test_lookup_params *trace_test_lookup_dup(const struct trace_test_lookup_params *params)
+{
+    size_t len = sizeof(*params);
+    struct trace_test_lookup_params *copy;
+    char *p;
+
+    if (params->key) {
+        len += strlen(params->key) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->key = params->key ? ubus_idl_dup_string(&p, params->key) : NULL;
+    return copy;
+}
+
+void trace_test_lookup_free(struct trace_test_lookup_params *params)
+{
+    free(params);
+}
+
+static const struct blobmsg_policy trace_test_record_policy[] = {
+    [TRACE_TEST_RECORD_KEY] = { .name = "key", .type = BLOBMSG_TYPE_STRING },
+    [TRACE_TEST_RECORD_DATA] = { .name = "data", .type = BLOBMSG_TYPE_STRING }
+};
+
+int trace_test_record_deserialize(struct blob_attr *msg, struct trace_test_record *params)
+{
+    struct blob_attr *tb_trace_test_record[__TRACE_TEST_RECORD_MAX];
+    if (blobmsg_parse(trace_test_record_policy, ARRAY_SIZE(trace_test_record_policy), tb_trace_test_record, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    if (!tb_trace_test_record[TRACE_TEST_RECORD_KEY]) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    params->has_fields = 0;
+    params->key = blobmsg_get_string(tb_trace_test_record[TRACE_TEST_RECORD_KEY]);
+
+    UBUS_IDL_GET_OPTIONAL(string, tb_trace_test_record, TRACE_TEST_RECORD_DATA, params->data, params, FIELD, TRACE_TEST_RECORD_HAS_DATA);
+    return UBUS_STATUS_OK;
+}
+
+int trace_test_record_serialize(struct blob_buf *b, const struct trace_test_record *params)
+{
+    UBUS_IDL_ADD(string, b, "key", params->key);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "data", params->data, params, FIELD, TRACE_TEST_RECORD_HAS_DATA);
+    return UBUS_STATUS_OK;
+}
+
+struct trace_test_record *trace_test_record_dup(const struct trace_test_record *params)
+{
+    size_t len = sizeof(*params);
+    struct trace_test_record *copy;
+    char *p;
+
+    if (params->key) {
+        len += strlen(params->key) + 1;
+    }
+    if (UBUS_IDL_HAS_FIELD(params, TRACE_TEST_RECORD_HAS_DATA) && params->data) {
+        len += strlen(params->data) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->key = params->key ? ubus_idl_dup_string(&p, params->key) : NULL;
+    copy->data = UBUS_IDL_HAS_FIELD(params, TRACE_TEST_RECORD_HAS_DATA) && params->data ? ubus_idl_dup_string(&p, params->data) : NULL;
+    return copy;
+}
+
+void trace_test_record_free(struct trace_test_record *params)
+{
+    free(params);
+}
+
+/* Reply buffer reused by all reply helpers of this object */
+static struct blob_buf trace_test_reply_buf;
+
+int trace_test_lookup_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct trace_test_record *reply)
+{
+    int ret;
+
+    blob_buf_init(&trace_test_reply_buf, 0);
+    ret = trace_test_record_serialize(&trace_test_reply_buf, reply);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    return ubus_send_reply(ctx, req, trace_test_reply_buf.head);
+}
+
+#ifndef TRACE_TEST_SYNC_TIMEOUT_MS
+#define TRACE_TEST_SYNC_TIMEOUT_MS 500
+#endif
+
+static void trace_test_sync_async_timeout(struct uloop_timeout *t)
+{
+    struct trace_test_sync_async_ctx *actx = container_of(t, struct trace_test_sync_async_ctx, timeout);
+
+    actx->timed_out = true;
+    ubus_complete_deferred_request(actx->ctx, &actx->req, UBUS_STATUS_TIMEOUT);
+    trace_test_record_deferred(TRACE_TEST_METHOD_SYNC, UBUS_STATUS_TIMEOUT, actx->msg, actx->start_us);
+}
+
+void trace_test_sync_complete(struct trace_test_sync_async_ctx *actx, int status)
+{
+    // After a timeout the request was already answered, only release the context
+    if (!actx->timed_out) {
+        uloop_timeout_cancel(&actx->timeout);
+        ubus_complete_deferred_request(actx->ctx, &actx->req, status);
+        trace_test_record_deferred(TRACE_TEST_METHOD_SYNC, status, actx->msg, actx->start_us);
+    }
+
+    free(actx->msg);
+    free(actx);
+}
+
+static int trace_test_sync_async_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct trace_test_sync_async_ctx *actx;
+    int ret;
+
+    actx = calloc(1, sizeof(*actx));
+    if (!actx) {
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    // Decoded params point into the request, keep a copy beyond the handler call
+    actx->msg = blob_memdup(msg);
+    if (!actx->msg) {
+        free(actx);
+        return UBUS_STATUS_UNKNOWN_ERROR;
+    }
+
+    actx->ctx = ctx;
+    actx->start_us = trace_test_dispatch_start;
+    ubus_defer_request(ctx, req, &actx->req);
+    actx->timeout.cb = trace_test_sync_async_timeout;
+    uloop_timeout_set(&actx->timeout, TRACE_TEST_SYNC_TIMEOUT_MS);
+
+    // The handler owns the context on success and must call trace_test_sync_complete()
+    ret = trace_test_sync_handler(actx);
+    if (ret != UBUS_STATUS_OK) {
+        trace_test_sync_complete(actx, ret);
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+static int trace_test_lookup_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return trace_test_dispatch_call(TRACE_TEST_METHOD_LOOKUP, trace_test_lookup_handler, false,
+                             trace_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+static int trace_test_store_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return trace_test_dispatch_call(TRACE_TEST_METHOD_STORE, trace_test_store_handler, false,
+                             trace_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+static int trace_test_ping_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return trace_test_dispatch_call(TRACE_TEST_METHOD_PING, trace_test_ping_handler, false,
+                             trace_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+static int trace_test_sync_dispatch(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    return trace_test_dispatch_call(TRACE_TEST_METHOD_SYNC, trace_test_sync_async_dispatch, true,
+                             trace_test_now_us(CLOCK_MONOTONIC), ctx, obj, req, method, msg);
+}
+
+enum {
+    TRACE_TEST_TRACE_DUMP_CLEAR,
+    __TRACE_TEST_TRACE_DUMP_MAX
+};
+
+static const struct blobmsg_policy trace_test_trace_dump_policy[] = {
+    [TRACE_TEST_TRACE_DUMP_CLEAR] = { .name = "clear", .type = BLOBMSG_TYPE_BOOL }
+};
+
+static int trace_test_trace_dump_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+
+static const struct ubus_method trace_test_methods[] = {
+    UBUS_METHOD("lookup", trace_test_lookup_dispatch, trace_test_lookup_policy),
+    UBUS_METHOD("store", trace_test_store_dispatch, trace_test_record_policy),
+    UBUS_METHOD_NOARG("ping", trace_test_ping_dispatch),
+    UBUS_METHOD_NOARG("sync", trace_test_sync_dispatch),
+    UBUS_METHOD("trace_dump", trace_test_trace_dump_handler, trace_test_trace_dump_policy)
+};
+
+static struct ubus_object_type trace_test_object_type =
+    UBUS_OBJECT_TYPE("trace_test", trace_test_methods);
+
+struct ubus_object trace_test_object = {
+    .name = "trace_test",
+    .type = &trace_test_object_type,
+    .methods = trace_test_methods,
+    .n_methods = ARRAY_SIZE(trace_test_methods),
+};
+
+#ifndef TRACE_TEST_TRACE_DUMP_CHUNK
+#define TRACE_TEST_TRACE_DUMP_CHUNK 16
+#endif
+
+static struct blob_buf trace_test_trace_buf;
+
+static void trace_test_trace_add_entry(struct blob_buf *b, const struct trace_test_trace_entry *entry)
+{
+    static const char hex[] = "0123456789abcdef";
+    struct blob_attr *payload = (struct blob_attr *)entry->payload;
+    void *params;
+    void *table;
+    char *str;
+    uint32_t i;
+
+    table = blobmsg_open_table(b, NULL);
+    blobmsg_add_string(b, "method", trace_test_method_names[entry->method]);
+    blobmsg_add_u64(b, "timestamp_us", entry->timestamp_us);
+    blobmsg_add_u32(b, "duration_us", entry->duration_us);
+    blobmsg_add_u32(b, "status", entry->status);
+    blobmsg_add_u32(b, "size", entry->size);
+
+    if (entry->captured && entry->captured == entry->size) {
+        // Complete payloads are emitted as the original params
+        params = blobmsg_open_table(b, "params");
+        blob_put_raw(b, blob_data(payload), blob_len(payload));
+        blobmsg_close_table(b, params);
+    } else if (entry->captured) {
+        // Truncated payloads can't be decoded, emit the captured bytes as hex
+        str = blobmsg_alloc_string_buffer(b, "payload", entry->captured * 2 + 1);
+        for (i = 0; i < entry->captured; i++) {
+            str[i * 2] = hex[entry->payload[i] >> 4];
+            str[i * 2 + 1] = hex[entry->payload[i] & 0xf];
+        }
+        str[entry->captured * 2] = '\0';
+        blobmsg_add_string_buffer(b);
+    }
+
+    blobmsg_close_table(b, table);
+}
+
+/* Send the ring oldest first, split into several replies of up to a chunk of entries */
+static int trace_test_trace_dump_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg)
+{
+    struct blob_attr *tb[__TRACE_TEST_TRACE_DUMP_MAX];
+    uint32_t first;
+    uint32_t i;
+    void *entries;
+    int ret;
+
+    if (blobmsg_parse(trace_test_trace_dump_policy, ARRAY_SIZE(trace_test_trace_dump_policy), tb, blob_data(msg), blob_len(msg)) < 0) {
+        return UBUS_STATUS_INVALID_ARGUMENT;
+    }
+
+    first = (trace_test_trace.next + TRACE_TEST_TRACE_SIZE - trace_test_trace.count) % TRACE_TEST_TRACE_SIZE;
+
+    blob_buf_init(&trace_test_trace_buf, 0);
+    entries = blobmsg_open_array(&trace_test_trace_buf, "entries");
+
+    for (i = 0; i < trace_test_trace.count; i++) {
+        trace_test_trace_add_entry(&trace_test_trace_buf, &trace_test_trace.entries[(first + i) % TRACE_TEST_TRACE_SIZE]);
+
+        // Full chunks are sent as they fill, the last one after the loop
+        if ((i + 1) % TRACE_TEST_TRACE_DUMP_CHUNK == 0 && i + 1 < trace_test_trace.count) {
+            blobmsg_close_array(&trace_test_trace_buf, entries);
+            ret = ubus_send_reply(ctx, req, trace_test_trace_buf.head);
+            if (ret != UBUS_STATUS_OK) {
+                return ret;
+            }
+
+            blob_buf_init(&trace_test_trace_buf, 0);
+            entries = blobmsg_open_array(&trace_test_trace_buf, "entries");
+        }
+    }
+
+    // The last partial chunk, or an empty list when the ring is empty
+    blobmsg_close_array(&trace_test_trace_buf, entries);
+    ret = ubus_send_reply(ctx, req, trace_test_trace_buf.head);
+    if (ret != UBUS_STATUS_OK) {
+        return ret;
+    }
+
+    // The ring is only cleared once all of it was sent
+    if (tb[TRACE_TEST_TRACE_DUMP_CLEAR] && blobmsg_get_bool(tb[TRACE_TEST_TRACE_DUMP_CLEAR])) {
+        trace_test_trace.next = 0;
+        trace_test_trace.count = 0;
+    }
+
+    return UBUS_STATUS_OK;
+}
+
+void trace_test_object_cleanup(void)
+{
+    blob_buf_free(&trace_test_reply_buf);
+    blob_buf_free(&trace_test_trace_buf);
+}
@@ -0,0 +1,96 @@
+/* Generated from ubus IDL - trace_test */
+
+#ifndef __TRACE_TEST_OBJECT_H__
+#define __TRACE_TEST_OBJECT_H__
+
+#include <libubus.h>
+#include <stdint.h>
+
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
+
+
+struct trace_test_record {
+    const char * key;
+    const char * data;
+    uint8_t has_fields;
+};
+#define TRACE_TEST_RECORD_HAS_DATA 0
+_Static_assert(sizeof(struct trace_test_record) == UBUS_IDL_PACKED_SIZE(struct trace_test_record, 2 * sizeof(const char *) + sizeof(uint8_t)),
+               "struct trace_test_record has padding between members");
+
+struct trace_test_lookup_params {
+    const char * key;
+};
+_Static_assert(sizeof(struct trace_test_lookup_params) == UBUS_IDL_PACKED_SIZE(struct trace_test_lookup_params, sizeof(const char *)),
+               "struct trace_test_lookup_params has padding between members");
+
+enum {
+    TRACE_TEST_LOOKUP_KEY,
+    __TRACE_TEST_LOOKUP_MAX
+};
+
+enum {
+    TRACE_TEST_RECORD_KEY,
+    TRACE_TEST_RECORD_DATA,
+    __TRACE_TEST_RECORD_MAX
+};
+
+struct trace_test_sync_async_ctx {
+    struct ubus_context *ctx;
+    struct ubus_request_data req;
+    struct uloop_timeout timeout;
+    struct blob_attr *msg;
+    bool timed_out;
+    uint64_t start_us;
+    void *priv;
+};
+
+enum trace_test_method {
+    TRACE_TEST_METHOD_LOOKUP,
+    TRACE_TEST_METHOD_STORE,
+    TRACE_TEST_METHOD_PING,
+    TRACE_TEST_METHOD_SYNC,
+    __TRACE_TEST_METHOD_MAX
+};
+
+int trace_test_lookup_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int trace_test_store_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int trace_test_ping_handler(struct ubus_context *ctx, struct ubus_object *obj, struct ubus_request_data *req, const char *method, struct blob_attr *msg);
+int trace_test_sync_handler(struct trace_test_sync_async_ctx *actx);
+
+int trace_test_lookup_deserialize(struct blob_attr *msg, struct trace_test_lookup_params *params);
+int trace_test_lookup_serialize(struct blob_buf *b, const struct trace_test_lookup_params *params);
+int trace_test_record_deserialize(struct blob_attr *msg, struct trace_test_record *params);
+int trace_test_record_serialize(struct blob_buf *b, const struct trace_test_record *params);
+
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct trace_test_lookup_params *trace_test_lookup_dup(const struct trace_test_lookup_params *params);
+void trace_test_lookup_free(struct trace_test_lookup_params *params);
+struct trace_test_record *trace_test_record_dup(const struct trace_test_record *params);
+void trace_test_record_free(struct trace_test_record *params);
+
+int trace_test_lookup_reply(struct ubus_context *ctx, struct ubus_request_data *req, const struct trace_test_record *reply);
+
+void trace_test_sync_complete(struct trace_test_sync_async_ctx *actx, int status);
+
+extern struct ubus_object trace_test_object;
+
+void trace_test_object_cleanup(void);
+
+#endif /* __TRACE_TEST_OBJECT_H__ */
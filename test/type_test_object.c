@@ -2,21 +2,23 @@
 
 #include <libubox/blobmsg_json.h>
 #include <libubus.h>
+#include <stdlib.h>
+#include <string.h>
 #include "type_test_object.h"
 
 /* Helper macros for optional field deserialization */
-#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, mask) \
+#define UBUS_IDL_GET_OPTIONAL(type, tb, enum, field, params, kind, index) \
     do { \
         if ((tb)[(enum)]) { \
             (field) = blobmsg_get_##type((tb)[(enum)]); \
-            UBUS_IDL_SET_FIELD((params), (mask)); \
+            UBUS_IDL_SET_##kind((params), (index)); \
         } \
     } while (0)
 
 /* Helper macros for optional field serialization */
-#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, mask) \
+#define UBUS_IDL_ADD_OPTIONAL(type, b, name, field, params, kind, index) \
     do { \
-        if (UBUS_IDL_HAS_FIELD((params), (mask))) { \
+        if (UBUS_IDL_HAS_##kind((params), (index))) { \
             blobmsg_add_##type((b), (name), (field)); \
         } \
     } while (0)
@@ -30,6 +32,17 @@
         } \
     } while (0)
 
+/* Copy a string to the cursor of a *_dup() allocation and move the cursor past it */
+static const char *ubus_idl_dup_string(char **p, const char *str)
+{
+    size_t len = strlen(str) + 1;
+    char *copy = *p;
+
+    memcpy(copy, str, len);
+    *p += len;
+    return copy;
+}
+
 static const struct blobmsg_policy type_test_all_types_policy[] = {
     [TYPE_TEST_ALL_TYPES_INT8_VAL] = { .name = "int8_val", .type = BLOBMSG_TYPE_INT8 },
     [TYPE_TEST_ALL_TYPES_INT16_VAL] = { .name = "int16_val", .type = BLOBMSG_TYPE_INT16 },
@@ -73,6 +86,32 @@ int type_test_all_types_serialize(struct blob_buf *b, const struct type_test_all
     return UBUS_STATUS_OK;
 }
 
+struct type_test_all_types_params *type_test_all_types_dup(const struct type_test_all_types_params *params)
+{
+    size_t len = sizeof(*params);
+    struct type_test_all_types_params *copy;
+    char *p;
+
+    if (params->string_val) {
+        len += strlen(params->string_val) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->string_val = params->string_val ? ubus_idl_dup_string(&p, params->string_val) : NULL;
+    return copy;
+}
+
+void type_test_all_types_free(struct type_test_all_types_params *params)
+{
+    free(params);
+}
+
 static const struct blobmsg_policy type_with_all_types_policy[] = {
     [TYPE_WITH_ALL_TYPES_INT8_FIELD] = { .name = "int8_field", .type = BLOBMSG_TYPE_INT8 },
     [TYPE_WITH_ALL_TYPES_INT16_FIELD] = { .name = "int16_field", .type = BLOBMSG_TYPE_INT16 },
@@ -110,13 +149,13 @@ int type_with_all_types_deserialize(struct blob_attr *msg, struct type_with_all_
     params->double_field = blobmsg_get_double(tb_type_with_all_types[TYPE_WITH_ALL_TYPES_DOUBLE_FIELD]);
     params->string_field = blobmsg_get_string(tb_type_with_all_types[TYPE_WITH_ALL_TYPES_STRING_FIELD]);
 
-    UBUS_IDL_GET_OPTIONAL(u8, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_INT8, params->optional_int8, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT8);
-    UBUS_IDL_GET_OPTIONAL(u16, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_INT16, params->optional_int16, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT16);
-    UBUS_IDL_GET_OPTIONAL(u32, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_INT32, params->optional_int32, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT32);
-    UBUS_IDL_GET_OPTIONAL(u64, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_INT64, params->optional_int64, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT64);
-    UBUS_IDL_GET_OPTIONAL(u8, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_BOOL, params->optional_bool, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_BOOL);
-    UBUS_IDL_GET_OPTIONAL(double, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_DOUBLE, params->optional_double, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_DOUBLE);
-    UBUS_IDL_GET_OPTIONAL(string, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_STRING, params->optional_string, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_STRING);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_INT8, params->optional_int8, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT8);
+    UBUS_IDL_GET_OPTIONAL(u16, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_INT16, params->optional_int16, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT16);
+    UBUS_IDL_GET_OPTIONAL(u32, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_INT32, params->optional_int32, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT32);
+    UBUS_IDL_GET_OPTIONAL(u64, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_INT64, params->optional_int64, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT64);
+    UBUS_IDL_GET_OPTIONAL(u8, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_BOOL, params->optional_bool, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_BOOL);
+    UBUS_IDL_GET_OPTIONAL(double, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_DOUBLE, params->optional_double, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_DOUBLE);
+    UBUS_IDL_GET_OPTIONAL(string, tb_type_with_all_types, TYPE_WITH_ALL_TYPES_OPTIONAL_STRING, params->optional_string, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_STRING);
     return UBUS_STATUS_OK;
 }
 
@@ -129,18 +168,48 @@ int type_with_all_types_serialize(struct blob_buf *b, const struct type_with_all
     UBUS_IDL_ADD(u8, b, "bool_field", params->bool_field ? 1 : 0);
     UBUS_IDL_ADD(double, b, "double_field", params->double_field);
     UBUS_IDL_ADD(string, b, "string_field", params->string_field);
-    UBUS_IDL_ADD_OPTIONAL(u8, b, "optional_int8", params->optional_int8, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT8);
-    UBUS_IDL_ADD_OPTIONAL(u16, b, "optional_int16", params->optional_int16, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT16);
-    UBUS_IDL_ADD_OPTIONAL(u32, b, "optional_int32", params->optional_int32, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT32);
-    UBUS_IDL_ADD_OPTIONAL(u64, b, "optional_int64", params->optional_int64, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT64);
+    UBUS_IDL_ADD_OPTIONAL(u8, b, "optional_int8", params->optional_int8, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT8);
+    UBUS_IDL_ADD_OPTIONAL(u16, b, "optional_int16", params->optional_int16, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT16);
+    UBUS_IDL_ADD_OPTIONAL(u32, b, "optional_int32", params->optional_int32, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT32);
+    UBUS_IDL_ADD_OPTIONAL(u64, b, "optional_int64", params->optional_int64, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT64);
     if (UBUS_IDL_HAS_FIELD(params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_BOOL)) {
         blobmsg_add_u8(b, "optional_bool", params->optional_bool ? 1 : 0);
     }
-    UBUS_IDL_ADD_OPTIONAL(double, b, "optional_double", params->optional_double, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_DOUBLE);
-    UBUS_IDL_ADD_OPTIONAL(string, b, "optional_string", params->optional_string, params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_STRING);
+    UBUS_IDL_ADD_OPTIONAL(double, b, "optional_double", params->optional_double, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_DOUBLE);
+    UBUS_IDL_ADD_OPTIONAL(string, b, "optional_string", params->optional_string, params, FIELD, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_STRING);
     return UBUS_STATUS_OK;
 }
 
+struct type_with_all_types *type_with_all_types_dup(const struct type_with_all_types *params)
+{
+    size_t len = sizeof(*params);
+    struct type_with_all_types *copy;
+    char *p;
+
+    if (params->string_field) {
+        len += strlen(params->string_field) + 1;
+    }
+    if (UBUS_IDL_HAS_FIELD(params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_STRING) && params->optional_string) {
+        len += strlen(params->optional_string) + 1;
+    }
+
+    copy = malloc(len);
+    if (!copy) {
+        return NULL;
+    }
+
+    memcpy(copy, params, sizeof(*copy));
+    p = (char *)(copy + 1);
+    copy->string_field = params->string_field ? ubus_idl_dup_string(&p, params->string_field) : NULL;
+    copy->optional_string = UBUS_IDL_HAS_FIELD(params, TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_STRING) && params->optional_string ? ubus_idl_dup_string(&p, params->optional_string) : NULL;
+    return copy;
+}
+
+void type_with_all_types_free(struct type_with_all_types *params)
+{
+    free(params);
+}
+
 static const struct ubus_method type_test_methods[] = {
     UBUS_METHOD("all_types", type_test_all_types_handler, type_test_all_types_policy),
     UBUS_METHOD("type_with_all_types", type_test_type_with_all_types_handler, type_with_all_types_policy)
@@ -6,39 +6,63 @@
 #include <libubus.h>
 #include <stdint.h>
 
-/* Helper macros for optional field operations */
-#define UBUS_IDL_HAS_FIELD(params, index) ((params)->has_fields & (1U << index))
-#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (1U << index))
-#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~(1U << index))
+/* Helper macros for optional field operations, indexed over the optional fields only */
+#define UBUS_IDL_HAS_FIELD(params, index) (((params)->has_fields >> (index)) & 1U)
+#define UBUS_IDL_SET_FIELD(params, index) ((params)->has_fields |= (uint64_t)1 << (index))
+#define UBUS_IDL_CLEAR_FIELD(params, index) ((params)->has_fields &= ~((uint64_t)1 << (index)))
+
+/* Bits of an array of 64-bit words */
+#define UBUS_IDL_TEST_BIT(words, index) (((words)[(index) / 64] >> ((index) % 64)) & 1U)
+#define UBUS_IDL_SET_BIT(words, index) ((words)[(index) / 64] |= (uint64_t)1 << ((index) % 64))
+#define UBUS_IDL_CLEAR_BIT(words, index) ((words)[(index) / 64] &= ~((uint64_t)1 << ((index) % 64)))
+
+/* Same for types with more than 64 optional fields, whose bits are an array of words */
+#define UBUS_IDL_HAS_WIDE_FIELD(params, index) UBUS_IDL_TEST_BIT((params)->has_fields, index)
+#define UBUS_IDL_SET_WIDE_FIELD(params, index) UBUS_IDL_SET_BIT((params)->has_fields, index)
+#define UBUS_IDL_CLEAR_WIDE_FIELD(params, index) UBUS_IDL_CLEAR_BIT((params)->has_fields, index)
+
+/* Size of a struct without padding between its members */
+#define UBUS_IDL_PACKED_SIZE(type, size) (((size) + _Alignof(type) - 1) / _Alignof(type) * _Alignof(type))
 
 
 struct type_with_all_types {
-    int8_t int8_field;
-    int16_t int16_field;
-    int32_t int32_field;
     int64_t int64_field;
-    bool bool_field;
     double double_field;
-    const char * string_field;
-    int8_t optional_int8;
-    int16_t optional_int16;
-    int32_t optional_int32;
     int64_t optional_int64;
-    bool optional_bool;
     double optional_double;
+    const char * string_field;
     const char * optional_string;
-    unsigned int has_fields;
+    int32_t int32_field;
+    int32_t optional_int32;
+    int16_t int16_field;
+    int16_t optional_int16;
+    int8_t int8_field;
+    bool bool_field;
+    int8_t optional_int8;
+    bool optional_bool;
+    uint8_t has_fields;
 };
+#define TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT8 0
+#define TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT16 1
+#define TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT32 2
+#define TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_INT64 3
+#define TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_BOOL 4
+#define TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_DOUBLE 5
+#define TYPE_WITH_ALL_TYPES_HAS_OPTIONAL_STRING 6
+_Static_assert(sizeof(struct type_with_all_types) == UBUS_IDL_PACKED_SIZE(struct type_with_all_types, 2 * sizeof(int64_t) + 2 * sizeof(double) + 2 * sizeof(const char *) + 2 * sizeof(int32_t) + 2 * sizeof(int16_t) + 2 * sizeof(int8_t) + 2 * sizeof(bool) + sizeof(uint8_t)),
+               "struct type_with_all_types has padding between members");
 
 struct type_test_all_types_params {
-    int8_t int8_val;
-    int16_t int16_val;
-    int32_t int32_val;
     int64_t int64_val;
-    bool bool_val;
     double double_val;
     const char * string_val;
+    int32_t int32_val;
+    int16_t int16_val;
+    int8_t int8_val;
+    bool bool_val;
 };
+_Static_assert(sizeof(struct type_test_all_types_params) == UBUS_IDL_PACKED_SIZE(struct type_test_all_types_params, sizeof(int64_t) + sizeof(double) + sizeof(const char *) + sizeof(int32_t) + sizeof(int16_t) + sizeof(int8_t) + sizeof(bool)),
+               "struct type_test_all_types_params has padding between members");
 
 enum {
     TYPE_TEST_ALL_TYPES_INT8_VAL,
@@ -77,6 +101,12 @@ int type_test_all_types_serialize(struct blob_buf *b, const struct type_test_all
 int type_with_all_types_deserialize(struct blob_attr *msg, struct type_with_all_types *params);
 int type_with_all_types_serialize(struct blob_buf *b, const struct type_with_all_types *params);
 
+/* Copy decoded params out of the request in a single allocation, released with *_free() */
+struct type_test_all_types_params *type_test_all_types_dup(const struct type_test_all_types_params *params);
+void type_test_all_types_free(struct type_test_all_types_params *params);
+struct type_with_all_types *type_with_all_types_dup(const struct type_with_all_types *params);
+void type_with_all_types_free(struct type_with_all_types *params);
+
 extern struct ubus_object type_test_object;
 
 #endif /* __TYPE_TEST_OBJECT_H__ */
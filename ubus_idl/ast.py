@@ -6,17 +6,22 @@ from typing import List, Optional, Union
 
 @dataclass
 class Annotation:
-    """Annotation, e.g., @name("value"), @mask(0x1), @tag(0x1)"""
+    """Annotation, e.g., @name("value"), @mask(0x1), @tag(0x1) or @lazy"""
     name: str
-    value: Union[str, int]
+    value: Union[str, int, None]
 
 
 @dataclass
 class FieldDef:
-    """Field definition, e.g., id: int32 or msg?: string"""
+    """Field definition, e.g., id: int32, msg?: string or @bulk data: unspec"""
     name: str
     type_name: str
     optional: bool = False
+    annotations: List[Annotation] = None
+    
+    def __post_init__(self):
+        if self.annotations is None:
+            self.annotations = []
 
 
 @dataclass
@@ -24,6 +29,23 @@ class TypeDef:
     """Type definition, e.g., hello1: { id: int32, msg?: string }"""
     name: str
     fields: List[FieldDef]
+    annotations: List[Annotation] = None
+    
+    def __post_init__(self):
+        if self.annotations is None:
+            self.annotations = []
+
+
+@dataclass
+class EnumDef:
+    """Enum definition, e.g., enum link_state { up, down, dormant }"""
+    name: str
+    values: List[str]
+    annotations: List[Annotation] = None
+    
+    def __post_init__(self):
+        if self.annotations is None:
+            self.annotations = []
 
 
 @dataclass
@@ -32,6 +54,11 @@ class Parameter:
     name: Optional[str]  # None means using defined type
     type_name: str
     optional: bool = False
+    annotations: List[Annotation] = None
+    
+    def __post_init__(self):
+        if self.annotations is None:
+            self.annotations = []
 
 
 @dataclass
@@ -40,7 +67,20 @@ class MethodDef:
     name: str
     parameters: List[Parameter]
     annotations: List[Annotation]
-    custom_handler: Optional[str] = None  # For -> handler2 syntax (future support)
+    custom_handler: Optional[str] = None  # For : handler2 syntax
+    result_type: Optional[str] = None  # For -> reply_type syntax
+
+
+@dataclass
+class EventDef:
+    """Event definition, e.g., event link_up(ifname: string)"""
+    name: str
+    parameters: List[Parameter]
+    annotations: List[Annotation] = None
+    
+    def __post_init__(self):
+        if self.annotations is None:
+            self.annotations = []
 
 
 @dataclass
@@ -49,6 +89,17 @@ class ObjectDef:
     name: str
     types: List[TypeDef]
     methods: List[MethodDef]
+    annotations: List[Annotation] = None
+    events: List[EventDef] = None
+    enums: List[EnumDef] = None
+    
+    def __post_init__(self):
+        if self.annotations is None:
+            self.annotations = []
+        if self.events is None:
+            self.events = []
+        if self.enums is None:
+            self.enums = []
 
 
 @dataclass
@@ -56,8 +107,11 @@ class Document:
     """Complete IDL document"""
     objects: List[ObjectDef]
     global_types: List[TypeDef] = None  # Types defined outside objects
+    enums: List[EnumDef] = None  # Enums defined outside objects
     
     def __post_init__(self):
         if self.global_types is None:
             self.global_types = []
+        if self.enums is None:
+            self.enums = []
 
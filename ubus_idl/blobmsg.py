@@ -0,0 +1,237 @@
+"""Pure Python blob/blobmsg codec, wire compatible with libubox"""
+
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+# blob_attr header layout
+BLOB_ATTR_ID_MASK = 0x7f000000
+BLOB_ATTR_ID_SHIFT = 24
+BLOB_ATTR_LEN_MASK = 0x00ffffff
+BLOB_ATTR_EXTENDED = 0x80000000
+BLOB_ATTR_ALIGN = 4
+
+# blobmsg types
+BLOBMSG_TYPE_UNSPEC = 0
+BLOBMSG_TYPE_ARRAY = 1
+BLOBMSG_TYPE_TABLE = 2
+BLOBMSG_TYPE_STRING = 3
+BLOBMSG_TYPE_INT64 = 4
+BLOBMSG_TYPE_INT32 = 5
+BLOBMSG_TYPE_INT16 = 6
+BLOBMSG_TYPE_INT8 = 7
+BLOBMSG_TYPE_DOUBLE = 8
+BLOBMSG_TYPE_BOOL = BLOBMSG_TYPE_INT8
+
+# IDL type name -> blobmsg type
+IDL_BLOBMSG_TYPES = {
+    "int8": BLOBMSG_TYPE_INT8,
+    "int16": BLOBMSG_TYPE_INT16,
+    "int32": BLOBMSG_TYPE_INT32,
+    "int64": BLOBMSG_TYPE_INT64,
+    "bool": BLOBMSG_TYPE_BOOL,
+    "double": BLOBMSG_TYPE_DOUBLE,
+    "string": BLOBMSG_TYPE_STRING,
+    "array": BLOBMSG_TYPE_ARRAY,
+    "unspec": BLOBMSG_TYPE_UNSPEC,
+}
+
+_INT_FORMATS = {
+    BLOBMSG_TYPE_INT8: ">B",
+    BLOBMSG_TYPE_INT16: ">H",
+    BLOBMSG_TYPE_INT32: ">I",
+    BLOBMSG_TYPE_INT64: ">Q",
+}
+
+
+class BlobError(ValueError):
+    """Malformed blob data"""
+
+
+def pad(length: int) -> int:
+    """Round a length up to the blob attribute alignment"""
+    return (length + BLOB_ATTR_ALIGN - 1) & ~(BLOB_ATTR_ALIGN - 1)
+
+
+def _pad_bytes(data: bytes) -> bytes:
+    return data + b"\0" * (pad(len(data)) - len(data))
+
+
+def encode_attr(attr_id: int, payload: bytes, extended: bool = False) -> bytes:
+    """Encode a plain blob attribute with its padding"""
+    id_len = ((attr_id << BLOB_ATTR_ID_SHIFT) & BLOB_ATTR_ID_MASK) | (len(payload) + 4)
+    if extended:
+        id_len |= BLOB_ATTR_EXTENDED
+    return _pad_bytes(struct.pack(">I", id_len) + payload)
+
+
+def iter_attrs(data: bytes):
+    """Yield (id, extended, payload) for each attribute in a blob payload"""
+    offset = 0
+    while offset + 4 <= len(data):
+        id_len, = struct.unpack_from(">I", data, offset)
+        raw_len = id_len & BLOB_ATTR_LEN_MASK
+        if raw_len < 4 or offset + raw_len > len(data):
+            raise BlobError(f"attribute length {raw_len} out of bounds at offset {offset}")
+        attr_id = (id_len & BLOB_ATTR_ID_MASK) >> BLOB_ATTR_ID_SHIFT
+        yield attr_id, bool(id_len & BLOB_ATTR_EXTENDED), data[offset + 4:offset + raw_len]
+        offset += pad(raw_len)
+
+
+def split_attr(data: bytes) -> Tuple[bytes, bytes]:
+    """Split the first blob attribute off a buffer, returning (payload, rest)"""
+    if len(data) < 4:
+        raise BlobError("truncated attribute header")
+    id_len, = struct.unpack_from(">I", data)
+    raw_len = id_len & BLOB_ATTR_LEN_MASK
+    if raw_len < 4 or raw_len > len(data):
+        raise BlobError(f"attribute length {raw_len} out of bounds")
+    return data[4:raw_len], data[pad(raw_len):]
+
+
+def _guess_type(value: Any) -> int:
+    """Pick a blobmsg type for a value without schema information"""
+    if isinstance(value, bool):
+        return BLOBMSG_TYPE_BOOL
+    if isinstance(value, int):
+        return BLOBMSG_TYPE_INT32 if -2**31 <= value < 2**31 else BLOBMSG_TYPE_INT64
+    if isinstance(value, float):
+        return BLOBMSG_TYPE_DOUBLE
+    if isinstance(value, str):
+        return BLOBMSG_TYPE_STRING
+    if isinstance(value, dict):
+        return BLOBMSG_TYPE_TABLE
+    if isinstance(value, (list, tuple)):
+        return BLOBMSG_TYPE_ARRAY
+    if value is None:
+        return BLOBMSG_TYPE_UNSPEC
+    raise BlobError(f"cannot encode value of type {type(value).__name__}")
+
+
+def encode_value(name: str, value: Any, msg_type: Optional[int] = None,
+                 types: Optional[Dict[str, Any]] = None) -> bytes:
+    """Encode one named blobmsg attribute
+
+    msg_type forces the blobmsg type, types maps table keys to nested types
+    (a blobmsg type, or a dict for nested tables) when a schema is known.
+    """
+    if msg_type is None:
+        msg_type = _guess_type(value)
+
+    name_bytes = name.encode("utf-8")
+    hdr = _pad_bytes(struct.pack(">H", len(name_bytes)) + name_bytes + b"\0")
+
+    if msg_type in _INT_FORMATS:
+        fmt = _INT_FORMATS[msg_type]
+        bits = struct.calcsize(fmt) * 8
+        payload = struct.pack(fmt, int(value) & ((1 << bits) - 1))
+    elif msg_type == BLOBMSG_TYPE_DOUBLE:
+        payload = struct.pack(">d", float(value))
+    elif msg_type == BLOBMSG_TYPE_STRING:
+        payload = str(value).encode("utf-8") + b"\0"
+    elif msg_type == BLOBMSG_TYPE_TABLE:
+        payload = encode_table(value, types)
+    elif msg_type == BLOBMSG_TYPE_ARRAY:
+        payload = b"".join(encode_value("", item) for item in value)
+    else:
+        payload = b""
+
+    return encode_attr(msg_type, hdr + payload, extended=True)
+
+
+def encode_table(values: Dict[str, Any], types: Optional[Dict[str, Any]] = None) -> bytes:
+    """Encode a dict as the payload of a blobmsg table (a list of named attributes)"""
+    parts = []
+    for key, value in values.items():
+        msg_type = None
+        nested = None
+        if types and key in types:
+            if isinstance(types[key], dict):
+                msg_type, nested = BLOBMSG_TYPE_TABLE, types[key]
+            else:
+                msg_type = types[key]
+        parts.append(encode_value(key, value, msg_type, nested))
+    return b"".join(parts)
+
+
+def _decode_attr(attr_id: int, payload: bytes) -> Tuple[str, Any]:
+    """Decode the payload of one blobmsg attribute into (name, value)"""
+    if len(payload) < 2:
+        raise BlobError("truncated blobmsg header")
+    namelen, = struct.unpack_from(">H", payload)
+    hdr_len = pad(2 + namelen + 1)
+    if hdr_len > len(payload):
+        raise BlobError("truncated blobmsg name")
+    name = payload[2:2 + namelen].decode("utf-8", errors="replace")
+    data = payload[hdr_len:]
+
+    if attr_id in _INT_FORMATS:
+        fmt = _INT_FORMATS[attr_id]
+        size = struct.calcsize(fmt)
+        if len(data) < size:
+            raise BlobError(f"truncated integer '{name}'")
+        value = struct.unpack_from(fmt, data)[0]
+        # Integers are signed on the C side except for the bool/int8 case
+        if attr_id != BLOBMSG_TYPE_INT8 and value >= 1 << (size * 8 - 1):
+            value -= 1 << (size * 8)
+        return name, value
+    if attr_id == BLOBMSG_TYPE_DOUBLE:
+        if len(data) < 8:
+            raise BlobError(f"truncated double '{name}'")
+        return name, struct.unpack_from(">d", data)[0]
+    if attr_id == BLOBMSG_TYPE_STRING:
+        return name, data.split(b"\0", 1)[0].decode("utf-8", errors="replace")
+    if attr_id == BLOBMSG_TYPE_TABLE:
+        return name, decode_table(data)
+    if attr_id == BLOBMSG_TYPE_ARRAY:
+        return name, decode_array(data)
+    return name, None
+
+
+def decode_table(data: bytes) -> Dict[str, Any]:
+    """Decode a list of blobmsg attributes into a dict"""
+    result = {}
+    for attr_id, extended, payload in iter_attrs(data):
+        if not extended:
+            continue
+        name, value = _decode_attr(attr_id, payload)
+        result[name] = value
+    return result
+
+
+def decode_array(data: bytes) -> List[Any]:
+    """Decode a list of blobmsg attributes into a list, ignoring names"""
+    result = []
+    for attr_id, extended, payload in iter_attrs(data):
+        if not extended:
+            continue
+        result.append(_decode_attr(attr_id, payload)[1])
+    return result
+
+
+def decode_typed_table(data: bytes) -> Dict[str, Tuple[int, Any]]:
+    """Decode a blobmsg table into name -> (blobmsg type, value)
+
+    Nested tables are decoded the same way, so callers can check wire types
+    the way blobmsg_parse() does against a policy.
+    """
+    result = {}
+    for attr_id, extended, payload in iter_attrs(data):
+        if not extended:
+            continue
+        name, value = _decode_attr(attr_id, payload)
+        if attr_id == BLOBMSG_TYPE_TABLE:
+            namelen, = struct.unpack_from(">H", payload)
+            value = decode_typed_table(payload[pad(2 + namelen + 1):])
+        result[name] = (attr_id, value)
+    return result
+
+
+def decode_blob(data: bytes) -> Dict[str, Any]:
+    """Decode a whole blob buffer (header included) holding a blobmsg table"""
+    payload, _ = split_attr(data)
+    return decode_table(payload)
+
+
+def encode_blob(values: Dict[str, Any], types: Optional[Dict[str, Any]] = None) -> bytes:
+    """Encode a dict as a whole blob buffer, like blob_buf.head"""
+    return encode_attr(0, encode_table(values, types))
@@ -1,14 +1,28 @@
 """C code generator for ubus IDL using Jinja2 templates"""
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from .ast import (
-    Document, ObjectDef, TypeDef, MethodDef, FieldDef, Parameter, Annotation
+    Document, ObjectDef, TypeDef, EnumDef, MethodDef, EventDef, FieldDef, Parameter, Annotation
 )
 
 
+# Generated type of @bulk fields, reserved as a type name
+BULK_TYPE = "bulk"
+
+# Generated type of fields declared with an IDL enum, the C enum itself is in the field's 'enum'
+ENUM_TYPE = "enum"
+
+# Wire formats of enum fields (@wire), the value name or its index in the declaration
+ENUM_WIRES = ("string", "int")
+
+# Generated types that @key fields may have, compared by value or with strcmp()
+KEY_TYPES = ("int8", "int16", "int32", "int64", "bool", "string", ENUM_TYPE)
+
+
 @dataclass
 class TypeInfo:
     """Type information for code generation"""
@@ -18,6 +32,7 @@ class TypeInfo:
     add_func: str  # blobmsg_add function name (e.g., "u32", "string")
     is_pointer: bool = False  # Whether the type is a pointer
     use_field_api: bool = False  # Whether to use blobmsg_add_field instead of blobmsg_add_xxx
+    align_rank: int = 1  # Struct layout order: 0 for 8-byte members, 1 for pointers, then 4, 2 and 1-byte members
 
 
 class TypeFactory:
@@ -36,36 +51,42 @@ class TypeFactory:
             blob_type="BLOBMSG_TYPE_INT8",
             get_func="u8",
             add_func="u8",
+            align_rank=4,
         ),
         "int16": TypeInfo(
             c_type="int16_t",
             blob_type="BLOBMSG_TYPE_INT16",
             get_func="u16",
             add_func="u16",
+            align_rank=3,
         ),
         "int32": TypeInfo(
             c_type="int32_t",
             blob_type="BLOBMSG_TYPE_INT32",
             get_func="u32",
             add_func="u32",
+            align_rank=2,
         ),
         "int64": TypeInfo(
             c_type="int64_t",
             blob_type="BLOBMSG_TYPE_INT64",
             get_func="u64",
             add_func="u64",
+            align_rank=0,
         ),
         "bool": TypeInfo(
             c_type="bool",
             blob_type="BLOBMSG_TYPE_BOOL",
             get_func="u8",
             add_func="u8",
+            align_rank=4,
         ),
         "double": TypeInfo(
             c_type="double",
             blob_type="BLOBMSG_TYPE_DOUBLE",
             get_func="double",
             add_func="double",
+            align_rank=0,
         ),
         "array": TypeInfo(
             c_type="struct blob_attr *",
@@ -83,6 +104,14 @@ class TypeFactory:
             is_pointer=True,
             use_field_api=True,
         ),
+        # Pseudo type of @bulk fields: a length on the wire, the data in a memfd
+        BULK_TYPE: TypeInfo(
+            c_type="struct ubus_idl_bulk",
+            blob_type="BLOBMSG_TYPE_INT64",
+            get_func="u64",
+            add_func="u64",
+            align_rank=1,
+        ),
     }
     
     @classmethod
@@ -108,6 +137,12 @@ class TypeFactory:
         # Custom type - use pointer to struct
         return f"struct {type_name} *"
     
+    @classmethod
+    def get_align_rank(cls, type_name: str) -> int:
+        """Get the struct layout rank of a type, custom types are pointers"""
+        type_info = cls.get_type_info(type_name)
+        return type_info.align_rank if type_info else 1
+    
     @classmethod
     def get_c_type_decl(cls, type_name: str, var_name: str, optional: bool = False) -> str:
         """Get C type declaration for parameter"""
@@ -125,15 +160,43 @@ class TypeFactory:
         return f"struct blob_attr *{var_name}_attr"
 
 
+# Serializer styles: one function body per type, or descriptors run by a shared interpreter
+CODECS = ("unrolled", "table")
+
+# Member kinds understood by the table codec interpreter
+_TABLE_KINDS = {
+    "string": "UBUS_IDL_T_STRING",
+    "int8": "UBUS_IDL_T_INT8",
+    "int16": "UBUS_IDL_T_INT16",
+    "int32": "UBUS_IDL_T_INT32",
+    "int64": "UBUS_IDL_T_INT64",
+    "bool": "UBUS_IDL_T_BOOL",
+    "double": "UBUS_IDL_T_DOUBLE",
+    "array": "UBUS_IDL_T_BLOB",
+    "unspec": "UBUS_IDL_T_BLOB",
+}
+
+
 class CodeGenerator:
     """C code generator using Jinja2 templates"""
     
-    def __init__(self, document: Document):
+    def __init__(self, document: Document, client: bool = False, metrics: bool = False,
+                 codec: str = "unrolled"):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec '{codec}', expected one of: {', '.join(CODECS)}")
         self.document = document
+        self.client = client  # Generate client stubs for every object, not only @client ones
+        self.metrics = metrics  # Instrument every object, not only @metrics ones
+        self.codec = codec  # Codec of objects without @codec
         self.type_defs: Dict[str, TypeDef] = {}
         self.type_owners: Dict[str, str] = {}  # type_name -> object_name (None for global)
+        self.enum_defs: Dict[str, EnumDef] = {}
+        self.enum_owners: Dict[str, str] = {}  # enum_name -> object_name (None for global)
         
         # Collect all type definitions
+        for type_def in document.global_types + [t for obj in document.objects for t in obj.types]:
+            if type_def.name == BULK_TYPE:
+                raise ValueError(f"Type name '{BULK_TYPE}' is reserved for @bulk fields")
         for type_def in document.global_types:
             self.type_defs[type_def.name] = type_def
             self.type_owners[type_def.name] = None
@@ -141,6 +204,15 @@ class CodeGenerator:
             for type_def in obj.types:
                 self.type_defs[type_def.name] = type_def
                 self.type_owners[type_def.name] = obj.name
+        for enum_def in document.enums:
+            self.enum_defs[enum_def.name] = enum_def
+            self.enum_owners[enum_def.name] = None
+        for obj in document.objects:
+            for enum_def in obj.enums:
+                self.enum_defs[enum_def.name] = enum_def
+                self.enum_owners[enum_def.name] = obj.name
+        for enum_def in document.enums + [e for obj in document.objects for e in obj.enums]:
+            self._check_enum(enum_def)
         
         # Initialize Jinja2 environment
         template_dir = Path(__file__).parent / "templates"
@@ -168,6 +240,12 @@ class CodeGenerator:
             
             result[header_name] = header_template.render(**context)
             result[source_name] = source_template.render(**context)
+            
+            if context['client']:
+                client_header_template = self.env.get_template('client.h.j2')
+                client_source_template = self.env.get_template('client.c.j2')
+                result[f"{obj.name.lower()}_client.h"] = client_header_template.render(**context)
+                result[f"{obj.name.lower()}_client.c"] = client_source_template.render(**context)
         
         return result
     
@@ -177,15 +255,21 @@ class CodeGenerator:
         obj_name_upper = obj.name.upper().replace("-", "_")
         header_guard = f"__{obj_name_upper}_OBJECT_H__"
         
-        # Collect global types used by this object
-        used_global_types = set()
-        for method in obj.methods:
-            if method.parameters:
-                param = method.parameters[0]
-                if not param.name:  # Using defined type
-                    type_name = param.type_name
-                    if type_name in self.type_owners and self.type_owners[type_name] is None:
-                        used_global_types.add(type_name)
+        # Event payloads reuse the method params machinery under a "<event>_event" name
+        event_methods = [self._event_as_method(event) for event in obj.events]
+        
+        # Collect global types used by this object (as parameters or results)
+        used_global_types = []
+        for method in obj.methods + event_methods:
+            type_names = []
+            if method.parameters and not method.parameters[0].name:  # Using defined type
+                type_names.append(method.parameters[0].type_name)
+            if method.result_type:
+                type_names.append(method.result_type)
+            for type_name in type_names:
+                if type_name in self.type_owners and self.type_owners[type_name] is None:
+                    if type_name not in used_global_types:
+                        used_global_types.append(type_name)
         
         global_types = []
         for type_name in used_global_types:
@@ -198,7 +282,7 @@ class CodeGenerator:
         
         # Method parameters structs
         method_params = []
-        for method in obj.methods:
+        for method in obj.methods + event_methods:
             if method.parameters:
                 param = method.parameters[0]
                 if param.name:  # Direct parameters
@@ -217,7 +301,7 @@ class CodeGenerator:
         # Serialize/deserialize types
         serialize_types = []
         declared_types = set()
-        for method in obj.methods:
+        for method in obj.methods + event_methods:
             if method.parameters:
                 param = method.parameters[0]
                 if param.name:
@@ -254,11 +338,26 @@ class CodeGenerator:
                             'serialize_func': f"{func_prefix}_serialize",
                             'struct_type': struct_type_name,
                         })
+        # Result types, then object types with @key fields whose collections serialize them
+        keyed_types = [t.name for t in obj.types if any(self._has_annotation(f.annotations, "key") for f in t.fields)]
+        for method in obj.methods:
+            type_name = method.result_type
+            if type_name and type_name not in declared_types:
+                self._check_result_type(obj, method)
+        for type_name in [m.result_type for m in obj.methods] + keyed_types:
+            if type_name and type_name not in declared_types:
+                declared_types.add(type_name)
+                func_prefix = self._get_type_prefix(type_name)
+                serialize_types.append({
+                    'deserialize_func': f"{func_prefix}_deserialize",
+                    'serialize_func': f"{func_prefix}_serialize",
+                    'struct_type': func_prefix,
+                })
         
         # Policy types for source file
         policy_types = []
         policy_type_keys = {}
-        for method in obj.methods:
+        for method in obj.methods + event_methods:
             if method.parameters:
                 param = method.parameters[0]
                 if param.name:
@@ -275,14 +374,201 @@ class CodeGenerator:
                     if type_name not in policy_type_keys:
                         policy_type_keys[type_name] = (False, type_name, None)
         
+        for type_name in [m.result_type for m in obj.methods] + keyed_types:
+            if type_name and type_name not in policy_type_keys:
+                policy_type_keys[type_name] = (False, type_name, None)
+        
         for type_key, (is_method_params, name, method) in policy_type_keys.items():
             policy_types.append(self._policy_type_to_dict(obj, method, name, is_method_params))
         
-        # Custom handlers
+        # Table-driven codec (@codec("table") or --codec=table)
+        codec = self._get_annotation_value(obj.annotations, "codec") or self.codec
+        if codec not in CODECS:
+            raise ValueError(f"@codec in object '{obj.name}' must be one of: {', '.join(CODECS)}")
+        codec_table = self._table_codec_to_dict(policy_types) if codec == "table" else None
+        
+        # Serializers that move @bulk fields through a memfd
+        bulk_types = [t for t in policy_types if t and t['bulk']]
+        if bulk_types and codec_table:
+            raise ValueError(f"Object '{obj.name}' has @bulk fields and cannot use the table codec")
+        
+        # Custom handlers, shared by several methods through per-method thunks
         custom_handlers = []
+        shared_handlers = []
+        for method in obj.methods:
+            if method.custom_handler and not self._is_deferred_method(method):
+                handler_info = self._custom_handler_to_dict(obj, method)
+                shared = next((h for h in shared_handlers if h['name'] == handler_info['custom_handler']), None)
+                if not shared:
+                    shared_handlers.append({'name': handler_info['custom_handler'], 'args': handler_info['impl_args']})
+                elif shared['args'] != handler_info['impl_args']:
+                    raise ValueError(
+                        f"Methods sharing handler '{shared['name']}' in object '{obj.name}' must have "
+                        f"the same params type, '{method.name}' takes {handler_info['params_decl'] or 'no params'}"
+                    )
+                custom_handlers.append(handler_info)
+        
+        # Deferred (@async) methods
+        async_methods = []
+        for method in obj.methods:
+            if self._has_annotation(method.annotations, "async"):
+                async_methods.append(self._async_to_dict(obj, method))
+        
+        # Methods offloaded to the worker thread pool (@blocking)
+        blocking_methods = []
+        for method in obj.methods:
+            if self._has_annotation(method.annotations, "blocking"):
+                blocking_methods.append(self._blocking_to_dict(obj, method))
+        
+        # Server side reply memoization (@cache)
+        cached_methods = []
+        for method in obj.methods:
+            if self._has_annotation(method.annotations, "cache"):
+                cached_methods.append(self._cache_to_dict(obj, method))
+        
+        # Concurrency limits of deferred methods (@max_inflight)
+        admissions = [m['admission'] for m in async_methods + blocking_methods if m['admission']]
+        
+        # Generated batch method (@batch)
+        batch = None
+        if self._has_annotation(obj.annotations, "batch"):
+            if any(self._get_method_name(m) == "batch" for m in obj.methods):
+                raise ValueError(f"@batch object '{obj.name}' already has a method named 'batch'")
+            # Deferred methods answer after the batch reply and cannot run inside it,
+            # the batch reply cannot carry the fd of @bulk fields nor several @stream chunks
+            for m in obj.methods:
+                if self._has_annotation(m.annotations, "batch") and (
+                        self._is_deferred_method(m) or any(self._get_method_bulk(m))
+                        or self._has_annotation(m.annotations, "stream")):
+                    raise ValueError(f"Method '{m.name}' of '{obj.name}' cannot run inside a batch")
+            # Shared custom handlers may reply on their own and must opt in with @batch,
+            # so must every method of an @acl object since ubusd only checks the batch call
+            acl = self._has_annotation(obj.annotations, "acl")
+            allowed = [self._get_method_name(m) for m in obj.methods
+                       if self._has_annotation(m.annotations, "batch")
+                       or not (acl or m.custom_handler or self._is_deferred_method(m)
+                               or any(self._get_method_bulk(m))
+                               or self._has_annotation(m.annotations, "stream"))]
+            if not allowed:
+                raise ValueError(f"@batch object '{obj.name}' has no method allowed in a batch")
+            batch = {
+                'handler': f"{obj_name_lower}_batch_handler",
+                'policy': f"{obj_name_lower}_batch_policy",
+                'call_policy': f"{obj_name_lower}_batch_call_policy",
+                'enum_prefix': f"{obj_name_upper}_BATCH",
+                'allowed': allowed,
+                'method_def': f'UBUS_METHOD("batch", {obj_name_lower}_batch_handler, {obj_name_lower}_batch_policy)',
+            }
+        else:
+            for m in obj.methods:
+                if self._has_annotation(m.annotations, "batch"):
+                    raise ValueError(f"Method '{m.name}' has @batch but object '{obj.name}' has no @batch")
+        
+        # Per-method metrics and the generated stats method (@metrics or --metrics)
+        metrics = self.metrics or self._has_annotation(obj.annotations, "metrics")
+        if metrics and any(self._get_method_name(m) == "stats" for m in obj.methods):
+            raise ValueError(f"@metrics object '{obj.name}' already has a method named 'stats'")
+        
+        # Sampled request trace ring and the trace_dump method (@trace)
+        trace = None
+        if self._has_annotation(obj.annotations, "trace"):
+            if any(self._get_method_name(m) == "trace_dump" for m in obj.methods):
+                raise ValueError(f"@trace object '{obj.name}' already has a method named 'trace_dump'")
+            trace = {
+                'sample': self._get_positive_annotation(obj, obj.annotations, "trace", 1),
+                'size': self._get_positive_annotation(obj, obj.annotations, "trace_size", 64),
+                'sample_macro': f"{obj_name_upper}_TRACE_SAMPLE",
+                'size_macro': f"{obj_name_upper}_TRACE_SIZE",
+                'payload_macro': f"{obj_name_upper}_TRACE_PAYLOAD_MAX",
+                'chunk_macro': f"{obj_name_upper}_TRACE_DUMP_CHUNK",
+            }
+        
+        # Registered handlers are wrapped by a generated dispatch thunk
+        dispatch = bool(metrics or trace)
+        # Deferred calls are recorded when answered, from the start kept in their context
+        record_deferred = bool(dispatch and (async_methods or blocking_methods))
+        if dispatch:
+            for method, method_info in zip(obj.methods, all_methods):
+                method_info['method_def'] = self._generate_method_def(obj, method, method_info['dispatch_func'])
+        
+        extra_method_defs = []
+        if batch:
+            extra_method_defs.append(batch['method_def'])
+        if metrics:
+            extra_method_defs.append(f'UBUS_METHOD("stats", {obj_name_lower}_stats_handler, {obj_name_lower}_stats_policy)')
+        if trace:
+            extra_method_defs.append(f'UBUS_METHOD("trace_dump", {obj_name_lower}_trace_dump_handler, {obj_name_lower}_trace_dump_policy)')
+        
+        # Typed client stubs (@client or --client)
+        client = self.client or self._has_annotation(obj.annotations, "client")
+        client_methods = []
+        cache_methods = []
+        if client:
+            for method in obj.methods:
+                method_info = self._client_method_to_dict(obj, method)
+                if self._has_annotation(method.annotations, "cacheable"):
+                    method_info['cache_index'] = len(cache_methods)
+                    cache_methods.append({
+                        'method_name': self._get_method_name(method),
+                        'notify': self._get_cache_notify(obj, method),
+                    })
+                client_methods.append(method_info)
+        
+        # Server side notifications that invalidate client caches (@cacheable)
+        notifications = []
         for method in obj.methods:
-            if method.custom_handler:
-                custom_handlers.append(self._custom_handler_to_dict(obj, method))
+            if self._has_annotation(method.annotations, "cacheable"):
+                notify = self._get_cache_notify(obj, method)
+                if notify not in [n['name'] for n in notifications]:
+                    notifications.append({
+                        'name': notify,
+                        'notify_func': f"{obj_name_lower}_notify_{re.sub(r'[^A-Za-z0-9_]', '_', notify)}",
+                    })
+        
+        # Typed notifications (event declarations)
+        events = []
+        for event, event_method in zip(obj.events, event_methods):
+            if event.name in [e['name'] for e in events]:
+                raise ValueError(f"Event '{event.name}' is declared twice in object '{obj.name}'")
+            events.append(self._event_to_dict(obj, event, event_method))
+        # Subscribers dispatch on the FNV-1a hash of the notification type
+        if client:
+            hashes = {}
+            for event_info in events:
+                if event_info['hash'] in hashes:
+                    raise ValueError(
+                        f"Events '{hashes[event_info['hash']]}' and '{event_info['name']}' "
+                        f"in object '{obj.name}' have the same hash"
+                    )
+                hashes[event_info['hash']] = event_info['name']
+        # A @cacheable notification named like an event is sent by the typed function
+        event_funcs = [e['notify_func'] for e in events]
+        notifications = [n for n in notifications if n['notify_func'] not in event_funcs]
+        
+        pool = None
+        if blocking_methods:
+            pool = {
+                'size': self._get_positive_annotation(obj, obj.annotations, "pool_size", 4),
+                'queue_depth': self._get_positive_annotation(obj, obj.annotations, "queue_depth", 64),
+                'size_macro': f"{obj_name_upper}_POOL_SIZE",
+                'queue_depth_macro': f"{obj_name_upper}_QUEUE_DEPTH",
+            }
+        
+        # Typed reply helpers for methods with a result type, @stream methods send chunks instead
+        reply_methods = []
+        stream_methods = []
+        for method in obj.methods:
+            stream = self._get_stream(obj, method)
+            if stream:
+                stream_methods.append(stream)
+            elif method.result_type:
+                reply_methods.append(self._reply_to_dict(obj, method))
+        
+        # Types decoded through lazy views
+        lazy_types = [t for t in policy_types if t and t['lazy']]
+        
+        # avl_tree collections of the types with @key fields
+        collection_types = [t for t in policy_types if t and t['collection']]
         
         # 合并所有结构体定义为一个统一列表
         all_structs = []
@@ -290,6 +576,14 @@ class CodeGenerator:
         all_structs.extend(object_types)
         all_structs.extend(method_params)
         
+        # Enums declared in the object and those of the struct fields, in declaration order
+        used_enums = {f['enum']['name'] for struct_info in all_structs for f in struct_info['fields'] if f['enum']}
+        enums = [
+            self._enum_to_dict(enum_def.name)
+            for enum_def in self.document.enums + [e for o in self.document.objects for e in o.enums]
+            if enum_def.name in used_enums or enum_def in obj.enums
+        ]
+        
         return {
             'obj': obj,
             'obj_name': obj.name,
@@ -300,10 +594,46 @@ class CodeGenerator:
             'object_types': object_types,
             'method_params': method_params,
             'all_structs': all_structs,  # 统一的结构体列表
+            'enums': enums,
             'all_methods': all_methods,
             'serialize_types': serialize_types,
             'policy_types': policy_types,
             'custom_handlers': custom_handlers,
+            'shared_handlers': shared_handlers,
+            'lazy_types': lazy_types,
+            'collection_types': collection_types,
+            'reply_methods': reply_methods,
+            'stream_methods': stream_methods,
+            'async_methods': async_methods,
+            'blocking_methods': blocking_methods,
+            'pool': pool,
+            'cached_methods': cached_methods,
+            'cached_async': any(c['async'] for c in cached_methods),
+            'blocking_gates': [b for b in blocking_methods if b['admission']],
+            'guards': [m['guard'] for m in all_methods if m['guard']],
+            'admissions': admissions,
+            'has_cleanup': bool(reply_methods or stream_methods or blocking_methods or cached_methods or admissions or batch or metrics or trace or events),
+            'batch': batch,
+            'metrics': metrics,
+            'trace': trace,
+            'dispatch': dispatch,
+            'record_deferred': record_deferred,
+            'extra_method_defs': extra_method_defs,
+            'decode_fail': f"{obj_name_lower}_metrics_decode_failed()" if metrics else "UBUS_STATUS_INVALID_ARGUMENT",
+            'codec_table': codec_table,
+            'bulk_types': bulk_types,
+            'dup_kinds': sorted({f['type_name'] for t in policy_types if t for f in t['dup_fields']}),
+            'client': client,
+            'client_methods': client_methods,
+            'client_streams': [m for m in client_methods if m['stream']],
+            'client_header_guard': f"__{obj_name_upper}_CLIENT_H__",
+            'client_max_inflight_macro': f"{obj_name_upper}_CLIENT_MAX_INFLIGHT",
+            'client_cache_size_macro': f"{obj_name_upper}_CLIENT_CACHE_SIZE",
+            'cache_methods': cache_methods,
+            'notifications': notifications,
+            'events': events,
+            'delta_events': [e for e in events if e['delta']],
+            'delta_strings': any(f['type_name'] == 'string' for e in events if e['delta'] for f in e['delta']['fields']),
         }
     
     def _type_to_dict(self, obj: Optional[ObjectDef], type_def: TypeDef) -> Dict:
@@ -321,11 +651,10 @@ class CodeGenerator:
             enum_item = f"{enum_prefix}{field.name.upper()}"
             field_dict = {
                 'name': field.name,
-                'type_name': field.type_name,
                 'optional': field.optional,
-                'c_type': TypeFactory.get_struct_field_type(field.type_name),
                 'enum_item': enum_item,
             }
+            field_dict.update(self._field_type_to_dict(field))
             if field.optional:
                 field_dict['macro_name'] = f"{prefix.upper()}_HAS_{field.name.upper()}"
             fields.append(field_dict)
@@ -338,6 +667,7 @@ class CodeGenerator:
             'fields': fields,
             'optional_fields': [f for f in fields if f['optional']],
             'has_optional_fields': bool(optional_fields),
+            'layout': self._struct_layout(fields),
         }
     
     def _method_params_to_dict(self, obj: ObjectDef, method_name: str, parameters: List[Parameter]) -> Dict:
@@ -357,13 +687,13 @@ class CodeGenerator:
                 enum_item = f"{enum_prefix}{param.name.upper()}"
                 param_dict = {
                     'name': param.name,
-                    'type_name': param.type_name,
                     'optional': param.optional,
-                    'c_type': TypeFactory.get_struct_field_type(param.type_name),
                     'enum_item': enum_item,
                 }
+                param_dict.update(self._field_type_to_dict(param))
                 if param.optional:
                     param_dict['name_upper'] = param.name.upper()
+                    param_dict['macro_name'] = f"{prefix.upper()}_HAS_{param.name.upper()}"
                 params.append(param_dict)
         
         return {
@@ -373,21 +703,387 @@ class CodeGenerator:
             'params': params,
             'optional_params': [p for p in params if p['optional']],
             'has_optional_params': bool(optional_params),
+            'layout': self._struct_layout(params),
+        }
+    
+    def _table_codec_to_dict(self, policy_types: List[Dict]) -> Dict:
+        """Describe policy types for the table codec interpreter"""
+        types = [t for t in policy_types if t]
+        descs = {t['type_name']: t['desc_name'] for t in types if t['type_name']}
+        nested = []
+        for type_info in types:
+            for field in type_info['fields']:
+                if field['enum']:
+                    field['table_kind'] = "UBUS_IDL_T_ENUM"
+                else:
+                    field['table_kind'] = _TABLE_KINDS.get(field['type_name'], "UBUS_IDL_T_TABLE")
+                # Nested tables point to the descriptor of their type when this file has one
+                field['nested_desc'] = descs.get(field['type_name'])
+                if field['nested_desc'] and field['nested_desc'] not in nested:
+                    nested.append(field['nested_desc'])
+        return {
+            'max_fields': max([len(t['fields']) for t in types] or [1]),
+            'nested': nested,
+        }
+    
+    def _get_align_rank(self, field: Dict) -> int:
+        """Get the struct layout rank of a field, C enums have the size of an int"""
+        if field['type_name'] == ENUM_TYPE:
+            return TypeFactory.get_align_rank("int32")
+        return TypeFactory.get_align_rank(field['type_name'])
+    
+    def _presence_words(self, count: int) -> int:
+        """Number of 64-bit words of a presence bitset, 0 when it fits one integer"""
+        return 0 if count <= 64 else (count + 63) // 64
+    
+    def _struct_layout(self, fields: List[Dict]) -> Dict:
+        """Order struct members by alignment and size the presence bitset
+        
+        Members go from 8-byte to 1-byte alignment, so there is no padding
+        between them on any ABI and the bools end up packed together. The
+        bitset has one bit per optional field, indexed in declaration order.
+        """
+        members = [(self._get_align_rank(f), f['c_type'], f['name']) for f in fields]
+        optional = [f for f in fields if f['optional']]
+        presence = []
+        if optional:
+            words = self._presence_words(len(optional))
+            if words:
+                members.append((0, "uint64_t", f"has_fields[{words}]"))
+            else:
+                bits = next(b for b in (8, 16, 32, 64) if len(optional) <= b)
+                members.append(({8: 4, 16: 3, 32: 2, 64: 0}[bits], f"uint{bits}_t", "has_fields"))
+            presence = [{'macro_name': f['macro_name'], 'index': i} for i, f in enumerate(optional)]
+        members.sort(key=lambda m: m[0])
+        
+        # Expected size without padding between members, grouped by C type
+        counts: Dict[str, int] = {}
+        for _, c_type, name in members:
+            words = int(name[name.index('[') + 1:-1]) if name.endswith(']') else 1
+            counts[c_type] = counts.get(c_type, 0) + words
+        size_expr = " + ".join(
+            f"sizeof({c_type})" if n == 1 else f"{n} * sizeof({c_type})"
+            for c_type, n in counts.items()
+        )
+        
+        return {
+            'members': [{'c_type': c_type, 'name': name} for _, c_type, name in members],
+            'presence': presence,
+            'size_expr': size_expr,
         }
     
     def _method_to_dict(self, obj: ObjectDef, method: MethodDef) -> Dict:
         """Convert method to dictionary for template"""
         method_name = self._get_method_name(method)
         handler_name = self._get_handler_name(obj, method)
-        method_def = self._generate_method_def(obj, method)
+        is_async = self._has_annotation(method.annotations, "async")
+        is_blocking = self._has_annotation(method.annotations, "blocking")
+        if is_async and is_blocking:
+            raise ValueError(
+                f"Method '{method.name}' in object '{obj.name}' cannot be both @async and @blocking"
+            )
+        self._check_bulk_method(obj, method)
+        self._get_stream(obj, method)
+        # Deferred methods are registered through the generated dispatcher
+        prefix = self._get_method_prefix(obj, method)
+        if is_async:
+            registered_handler = f"{prefix}_async_dispatch"
+        elif is_blocking:
+            registered_handler = f"{prefix}_blocking_dispatch"
+        else:
+            registered_handler = handler_name
+        # Cached methods are looked up before reaching the handler or dispatcher
+        if self._has_annotation(method.annotations, "cache"):
+            registered_handler = f"{prefix}_cache_dispatch"
+        if self._has_annotation(method.annotations, "max_inflight") and not (is_async or is_blocking):
+            raise ValueError(
+                f"@max_inflight method '{method.name}' in object '{obj.name}' must be @async or @blocking"
+            )
+        # Oversized payloads are refused before any other generated code runs
+        guard = None
+        max_size = self._get_max_size(obj, method)
+        if max_size:
+            guard = {
+                'func': f"{prefix}_guard",
+                'inner_handler': registered_handler,
+                'max_size': max_size,
+                'size_macro': f"{prefix.upper()}_MAX_SIZE",
+            }
+            registered_handler = guard['func']
+        method_def = self._generate_method_def(obj, method, registered_handler)
         
         return {
             'name': method.name,
             'method_name': method_name,
             'handler_name': handler_name,
+            'registered_handler': registered_handler,
+            'dispatch_func': f"{prefix}_dispatch",
+            'method_enum': self._get_method_enum(obj, method),
             'method_def': method_def,
             'has_parameters': bool(method.parameters),
             'custom_handler': method.custom_handler,
+            'thunk': bool(method.custom_handler) and not (is_async or is_blocking),
+            'async': is_async,
+            'async_struct': f"{self._get_method_prefix(obj, method)}_async_ctx",
+            'blocking': is_blocking,
+            'blocking_args': self._blocking_to_dict(obj, method)['handler_args'] if is_blocking else None,
+            'guard': guard,
+        }
+    
+    def _blocking_to_dict(self, obj: ObjectDef, method: MethodDef) -> Dict:
+        """Convert @blocking method to worker pool job dictionary for template"""
+        prefix = self._get_method_prefix(obj, method)
+        params_struct_type, params_prefix = self._get_params_type(obj, method)
+        
+        result_struct_type = None
+        if method.result_type:
+            result_struct_type = self._get_type_prefix(method.result_type)
+        
+        # Handler signature runs on a worker thread and only sees decoded data
+        handler_args = []
+        if params_struct_type:
+            handler_args.append(f"const struct {params_struct_type} *params")
+        if result_struct_type:
+            handler_args.append(f"struct {result_struct_type} *reply")
+        
+        return {
+            'handler_name': self._get_handler_name(obj, method),
+            'handler_args': ", ".join(handler_args) if handler_args else "void",
+            'job_struct': f"{prefix}_job",
+            'run_func': f"{prefix}_job_run",
+            'dispatch_func': f"{prefix}_blocking_dispatch",
+            'has_params': params_struct_type is not None,
+            'params_struct_type': params_struct_type,
+            'deserialize_func': f"{params_prefix}_deserialize" if params_prefix else None,
+            'result_struct_type': result_struct_type,
+            'result_serialize_func': f"{result_struct_type}_serialize" if result_struct_type else None,
+            'admission': self._admission_to_dict(obj, method),
+            'method_enum': self._get_method_enum(obj, method),
+        }
+    
+    def _client_method_to_dict(self, obj: ObjectDef, method: MethodDef) -> Dict:
+        """Convert method to client call stub dictionary for template"""
+        prefix = self._get_method_prefix(obj, method)
+        params_struct_type, params_prefix = self._get_params_type(obj, method)
+        
+        call_func = f"{obj.name.lower()}_call_{prefix[len(obj.name) + 1:]}"
+        
+        # @stream items are passed chunk by chunk, the call itself has no reply
+        stream = None
+        result_struct_type = None
+        if self._get_stream(obj, method):
+            item_struct_type = self._get_type_prefix(method.result_type)
+            stream = {
+                'chunk_cb_type': f"{call_func}_chunk_cb",
+                'chunk_cb_args': (f"struct {obj.name.lower()}_client *client, "
+                                  f"const struct {item_struct_type} *items, size_t n_items, void *priv"),
+                'decode_func': f"{call_func}_chunk",
+                'item_struct_type': item_struct_type,
+                'item_deserialize_func': f"{item_struct_type}_deserialize",
+            }
+        elif method.result_type:
+            result_struct_type = self._get_type_prefix(method.result_type)
+        
+        call_args = [f"struct {obj.name.lower()}_client *client"]
+        if params_struct_type:
+            call_args.append(f"const struct {params_struct_type} *params")
+        if result_struct_type:
+            call_args.append(f"struct {result_struct_type} *reply")
+        if stream:
+            call_args.extend([f"{stream['chunk_cb_type']} chunk_cb", "void *priv"])
+        call_args.append("int timeout")
+        
+        # Completion callback of the pipelined variant gets the decoded reply
+        cb_args = [f"struct {obj.name.lower()}_client *client", "int status"]
+        if result_struct_type:
+            cb_args.append(f"const struct {result_struct_type} *reply")
+        cb_args.append("void *priv")
+        
+        params_bulk, result_bulk = self._get_method_bulk(method)
+        async_args = [f"struct {obj.name.lower()}_client *client"]
+        if params_struct_type:
+            async_args.append(f"const struct {params_struct_type} *params")
+        if stream:
+            async_args.append(f"{stream['chunk_cb_type']} chunk_cb")
+        async_args.extend([f"{call_func}_cb cb", "void *priv", "int timeout"])
+        
+        return {
+            'method_name': self._get_method_name(method),
+            'call_func': call_func,
+            'call_args': ", ".join(call_args),
+            'async_func': f"{call_func}_async",
+            'async_args': ", ".join(async_args),
+            'async_complete_func': f"{call_func}_async_complete",
+            'cb_type': f"{call_func}_cb",
+            'cb_args': ", ".join(cb_args),
+            'cache_index': None,
+            'has_params': params_struct_type is not None,
+            'serialize_func': f"{params_prefix}_serialize" if params_prefix else None,
+            'result_struct_type': result_struct_type,
+            'result_deserialize_func': f"{result_struct_type}_deserialize" if result_struct_type else None,
+            'bulk_fd_func': f"{params_prefix}_bulk_fd" if params_bulk else None,
+            'result_bulk_map_func': f"{result_struct_type}_bulk_map" if result_bulk else None,
+            'result_bulk_unmap_func': f"{result_struct_type}_bulk_unmap" if result_bulk else None,
+            'stream': stream,
+        }
+    
+    def _async_to_dict(self, obj: ObjectDef, method: MethodDef) -> Dict:
+        """Convert @async method to deferred request dictionary for template"""
+        prefix = self._get_method_prefix(obj, method)
+        params_struct_type, params_prefix = self._get_params_type(obj, method)
+        
+        timeout_ms = self._get_annotation_value(method.annotations, "async")
+        if timeout_ms is not None and (not isinstance(timeout_ms, int) or timeout_ms <= 0):
+            raise ValueError(
+                f"@async timeout of method '{method.name}' in object '{obj.name}' "
+                f"must be a positive number of milliseconds"
+            )
+        
+        # @stream handlers send their chunks before completing without a reply
+        stream = self._get_stream(obj, method)
+        result_struct_type = None
+        if method.result_type and not stream:
+            result_struct_type = self._get_type_prefix(method.result_type)
+        params_bulk = self._get_method_bulk(method)[0]
+        
+        return {
+            'handler_name': self._get_handler_name(obj, method),
+            'ctx_struct': f"{prefix}_async_ctx",
+            'dispatch_func': f"{prefix}_async_dispatch",
+            'timeout_func': f"{prefix}_async_timeout",
+            'complete_func': f"{prefix}_complete",
+            'timeout_ms': timeout_ms,
+            'timeout_macro': f"{prefix.upper()}_TIMEOUT_MS",
+            'has_params': params_struct_type is not None,
+            'params_struct_type': params_struct_type,
+            'deserialize_func': f"{params_prefix}_deserialize" if params_prefix else None,
+            'result_struct_type': result_struct_type,
+            'reply_func': f"{prefix}_reply" if result_struct_type else None,
+            'stream_func': stream['stream_func'] if stream else None,
+            'cached': self._has_annotation(method.annotations, "cache"),
+            'admission': self._admission_to_dict(obj, method),
+            'method_enum': self._get_method_enum(obj, method),
+            'bulk_map_func': f"{params_prefix}_bulk_map" if params_bulk else None,
+            'bulk_unmap_func': f"{params_prefix}_bulk_unmap" if params_bulk else None,
+        }
+    
+    def _admission_to_dict(self, obj: ObjectDef, method: MethodDef) -> Optional[Dict]:
+        """Get the concurrency limit of a deferred method (@max_inflight), or None"""
+        if not self._has_annotation(method.annotations, "max_inflight"):
+            if self._has_annotation(method.annotations, "inflight_queue"):
+                raise ValueError(
+                    f"@inflight_queue method '{method.name}' in object '{obj.name}' needs @max_inflight"
+                )
+            return None
+        prefix = self._get_method_prefix(obj, method)
+        
+        return {
+            'gate': f"{prefix}_admission",
+            'dispatch_func': f"{prefix}_async_dispatch" if self._has_annotation(method.annotations, "async") else f"{prefix}_blocking_dispatch",
+            'method_name': self._get_method_name(method),
+            'method_enum': self._get_method_enum(obj, method),
+            'max_inflight': self._get_positive_annotation(obj, method.annotations, "max_inflight", 1),
+            'max_inflight_macro': f"{prefix.upper()}_MAX_INFLIGHT",
+            'queue_depth': self._get_positive_annotation(obj, method.annotations, "inflight_queue", 0),
+            'queue_depth_macro': f"{prefix.upper()}_INFLIGHT_QUEUE",
+        }
+    
+    def _cache_to_dict(self, obj: ObjectDef, method: MethodDef) -> Dict:
+        """Convert @cache method to reply cache dictionary for template"""
+        prefix = self._get_method_prefix(obj, method)
+        if not method.result_type:
+            raise ValueError(f"@cache method '{method.name}' in object '{obj.name}' needs a result type")
+        if self._has_annotation(method.annotations, "blocking"):
+            raise ValueError(f"@cache method '{method.name}' in object '{obj.name}' cannot be @blocking")
+        is_async = self._has_annotation(method.annotations, "async")
+        
+        return {
+            'cache_var': f"{prefix}_cache",
+            'dispatch_func': f"{prefix}_cache_dispatch",
+            'inner_handler': f"{prefix}_async_dispatch" if is_async else self._get_handler_name(obj, method),
+            'invalidate_func': f"{prefix}_cache_invalidate",
+            'ttl_ms': self._get_positive_annotation(obj, method.annotations, "cache", 1000),
+            'ttl_macro': f"{prefix.upper()}_CACHE_TTL_MS",
+            'size': self._get_positive_annotation(obj, method.annotations, "cache_size", 16),
+            'size_macro': f"{prefix.upper()}_CACHE_SIZE",
+            'async': is_async,
+            'method_enum': self._get_method_enum(obj, method),
+        }
+    
+    def _event_as_method(self, event: EventDef) -> MethodDef:
+        """Get a method carrying the event payload, named "<event>_event" so its structs do not clash with methods"""
+        return MethodDef(name=f"{event.name}_event", parameters=event.parameters, annotations=[])
+    
+    def _event_to_dict(self, obj: ObjectDef, event: EventDef, event_method: MethodDef) -> Dict:
+        """Convert event declaration to dictionary for template"""
+        struct_type, func_prefix = self._get_params_type(obj, event_method)
+        if self._get_method_bulk(event_method)[0]:
+            raise ValueError(f"Event '{event.name}' in object '{obj.name}' cannot have @bulk fields")
+        broadcast = None
+        if self._has_annotation(event.annotations, "broadcast"):
+            broadcast = self._get_annotation_value(event.annotations, "broadcast")
+            if broadcast is None:
+                broadcast = f"{obj.name.lower()}.{event.name}"
+            elif not isinstance(broadcast, str) or not broadcast:
+                raise ValueError(
+                    f"@broadcast of event '{event.name}' in object '{obj.name}' must be a string"
+                )
+        return {
+            'name': event.name,
+            'notify_func': f"{obj.name.lower()}_notify_{event.name}",
+            'struct_type': struct_type,
+            'serialize_func': f"{func_prefix}_serialize" if func_prefix else None,
+            'deserialize_func': f"{func_prefix}_deserialize" if func_prefix else None,
+            'broadcast': broadcast,
+            'hash': f"0x{self._fnv1a(event.name):08x}u",
+            'cb_type': f"{obj.name.lower()}_{event.name}_cb",
+            'delta': self._delta_to_dict(obj, event, event_method, broadcast),
+        }
+    
+    def _fnv1a(self, text: str, basis: int = 2166136261) -> int:
+        """32-bit FNV-1a hash, same as the generated subscriber dispatch and enum lookups"""
+        value = basis
+        for byte in text.encode("utf-8"):
+            value = ((value ^ byte) * 16777619) & 0xffffffff
+        return value
+    
+    def _delta_to_dict(self, obj: ObjectDef, event: EventDef, event_method: MethodDef, broadcast) -> Optional[Dict]:
+        """Get delta publisher and mirror information of a @delta event, or None"""
+        if not self._has_annotation(event.annotations, "delta"):
+            return None
+        if broadcast:
+            raise ValueError(
+                f"@delta event '{event.name}' in object '{obj.name}' cannot be @broadcast"
+            )
+        if not event.parameters:
+            raise ValueError(f"@delta event '{event.name}' in object '{obj.name}' has no payload")
+        param = event.parameters[0]
+        if param.name:
+            payload = self._policy_type_to_dict(obj, event_method, event_method.name, True)
+        else:
+            payload = self._policy_type_to_dict(obj, None, param.type_name, False)
+        for field in payload['fields']:
+            if not field['enum'] and not TypeFactory.get_type_info(field['type_name']):
+                raise ValueError(
+                    f"@delta event '{event.name}' in object '{obj.name}' has field "
+                    f"'{field['name']}' of custom type '{field['type_name']}'"
+                )
+        prefix = f"{obj.name.lower()}_{event.name}"
+        return {
+            'fields': payload['fields'],
+            'has_optional': bool(payload['optional_fields']),
+            'policy_name': payload['policy_name'],
+            'enum_max': payload['enum_max'],
+            'deserialize_func': payload['deserialize_func'],
+            # The dirty and cleared masks are arrays of 64-bit words indexed like the policy
+            'words': (len(payload['fields']) + 63) // 64,
+            'state': f"{prefix}_delta",
+            'interval': self._get_positive_annotation(obj, event.annotations, "delta", 64),
+            'interval_macro': f"{prefix.upper()}_SNAPSHOT_INTERVAL",
+            'full_func': f"{obj.name.lower()}_notify_{event.name}_full",
+            'mirror_struct': f"{prefix}_mirror",
+            'mirror_apply': f"{prefix}_mirror_apply",
+            'mirror_free': f"{prefix}_mirror_free",
         }
     
     def _policy_type_to_dict(self, obj: ObjectDef, method: Optional[MethodDef], type_name: str, is_method_params: bool) -> Dict:
@@ -410,20 +1106,25 @@ class CodeGenerator:
             
             for param in method.parameters:
                 if param.name:
+                    if self._has_annotation(param.annotations, "key"):
+                        raise ValueError(f"@key is only allowed on type fields, not on parameter '{param.name}' of '{struct_type_name}'")
                     enum_item = f"{enum_prefix}{param.name.upper()}"
                     field_dict = {
                         'name': param.name,
-                        'type_name': param.type_name,
                         'optional': param.optional,
                         'enum_item': enum_item,
-                        'blob_type': TypeFactory.get_blob_type(param.type_name),
                     }
+                    field_dict.update(self._field_type_to_dict(param))
+                    field_dict.update(self._field_accessor_to_dict(func_prefix, param.name, field_dict))
                     if param.optional:
                         field_dict['macro_name'] = f"{prefix.upper()}_HAS_{param.name.upper()}"
                         optional_fields.append(field_dict)
                     else:
                         required_fields.append(field_dict)
                     fields.append(field_dict)
+            
+            lazy = self._has_annotation(method.annotations, "lazy")
+            collection = None
         else:
             owner = self.type_owners.get(type_name)
             if owner:
@@ -448,17 +1149,31 @@ class CodeGenerator:
                 enum_item = f"{enum_prefix}{field.name.upper()}"
                 field_dict = {
                     'name': field.name,
-                    'type_name': field.type_name,
                     'optional': field.optional,
                     'enum_item': enum_item,
-                    'blob_type': TypeFactory.get_blob_type(field.type_name),
                 }
+                field_dict.update(self._field_type_to_dict(field))
+                field_dict.update(self._field_accessor_to_dict(func_prefix, field.name, field_dict))
                 if field.optional:
                     field_dict['macro_name'] = f"{prefix.upper()}_HAS_{field.name.upper()}"
                     optional_fields.append(field_dict)
                 else:
                     required_fields.append(field_dict)
                 fields.append(field_dict)
+            
+            # A type is lazy if declared @lazy or referenced by a @lazy method
+            lazy = self._has_annotation(type_def.annotations, "lazy") or any(
+                self._has_annotation(m.annotations, "lazy")
+                for m in obj.methods
+                if m.parameters and not m.parameters[0].name and m.parameters[0].type_name == type_name
+            )
+            keys = [f for field, f in zip(type_def.fields, fields) if self._has_annotation(field.annotations, "key")]
+            collection = self._collection_to_dict(func_prefix, struct_type_name, keys) if keys else None
+        
+        # Types with more than 64 optional fields keep their presence bits in an array
+        presence_words = self._presence_words(len(optional_fields))
+        for field_dict in optional_fields:
+            field_dict['presence'] = "WIDE_FIELD" if presence_words else "FIELD"
         
         enum_items = [f['enum_item'] for f in fields]
         enum_max = f"__{prefix.upper()}_MAX"
@@ -468,6 +1183,23 @@ class CodeGenerator:
         # Check if needs ret variable
         needs_ret = any(f['type_name'] in ['array', 'unspec'] for f in fields)
         
+        # At most one @bulk field, the request or reply carries a single fd
+        bulk_fields = [f for f in fields if f['type_name'] == BULK_TYPE]
+        if len(bulk_fields) > 1:
+            raise ValueError(
+                f"'{struct_type_name}' has more than one @bulk field: "
+                f"{', '.join(f['name'] for f in bulk_fields)}"
+            )
+        if bulk_fields and lazy:
+            raise ValueError(f"'{struct_type_name}' has a @bulk field and cannot be decoded lazily")
+        bulk = bulk_fields[0] if bulk_fields else None
+        if bulk:
+            bulk['memfd_name'] = f"{func_prefix}.{bulk['name']}"
+        
+        # *_dup() copies blobs right after the struct so they keep its alignment, then bulk data and strings
+        dup_order = {"array": 0, "unspec": 0, BULK_TYPE: 1, "string": 2}
+        dup_fields = sorted([f for f in fields if f['type_name'] in dup_order], key=lambda f: dup_order[f['type_name']])
+        
         return {
             'prefix': prefix,
             'enum_items': enum_items,
@@ -482,6 +1214,83 @@ class CodeGenerator:
             'optional_fields': optional_fields,
             'all_fields': fields,
             'needs_ret': needs_ret,
+            'presence_words': presence_words,
+            'type_name': None if is_method_params else type_name,
+            'desc_name': f"{func_prefix}_desc",
+            'lazy': lazy,
+            'view_struct': f"{func_prefix}_view",
+            'view_init_func': f"{func_prefix}_view_init",
+            'bulk': bulk,
+            'bulk_fd_func': f"{func_prefix}_bulk_fd",
+            'bulk_map_func': f"{func_prefix}_bulk_map",
+            'bulk_unmap_func': f"{func_prefix}_bulk_unmap",
+            'dup_func': f"{func_prefix}_dup",
+            'copy_func': f"{func_prefix}_copy",
+            'free_func': f"{func_prefix}_free",
+            'dup_fields': dup_fields,
+            # Nested tables are never decoded, copies do not point to them
+            'dup_nested': [f for f in fields if not f['enum'] and not TypeFactory.get_type_info(f['type_name'])],
+            'collection': collection,
+        }
+    
+    def _collection_to_dict(self, func_prefix: str, struct_type_name: str, keys: List[Dict]) -> Dict:
+        """Get the avl_tree collection of a type, ordered by its @key fields in declaration order"""
+        for key in keys:
+            if key['optional']:
+                raise ValueError(f"@key field '{key['name']}' of '{struct_type_name}' cannot be optional")
+            if key['type_name'] not in KEY_TYPES:
+                raise ValueError(
+                    f"@key field '{key['name']}' of '{struct_type_name}' must be an integer, bool, "
+                    f"string or enum, not {key['type_name']}"
+                )
+        c_types = [key['c_type'] for key in keys]
+        key_decls = [f"{c_type}{key['name']}" if c_type.endswith("*") else f"{c_type} {key['name']}"
+                     for c_type, key in zip(c_types, keys)]
+        list_prefix = f"{func_prefix}_list"
+        return {
+            'struct': list_prefix,
+            'entry_struct': f"{list_prefix}_entry",
+            'key_fields': keys,
+            'key_decls': ", ".join(key_decls),
+            'key_args': ", ".join(key['name'] for key in keys),
+            'cmp_func': f"{list_prefix}_cmp",
+            'init_func': f"{list_prefix}_init",
+            'insert_func': f"{list_prefix}_insert",
+            'lookup_func': f"{list_prefix}_lookup",
+            'delete_func': f"{list_prefix}_delete",
+            'clear_func': f"{list_prefix}_clear",
+            'serialize_func': f"{list_prefix}_serialize",
+            'for_each_macro': f"{list_prefix}_for_each",
+        }
+    
+    def _field_accessor_to_dict(self, func_prefix: str, field_name: str, field_type: Dict) -> Dict:
+        """Get lazy accessor information for a field, field_type as given by _field_type_to_dict"""
+        c_type = field_type['c_type']
+        type_info = TypeFactory.get_type_info(field_type['type_name'])
+        # Nested custom types are never decoded, their accessor gives the located table
+        table = not type_info and not field_type['enum'] and field_type['type_name'] != BULK_TYPE
+        if table:
+            out_decl = "struct blob_attr **out"
+        elif c_type.endswith("*"):
+            out_decl = f"{c_type}*out"
+        else:
+            out_decl = f"{c_type} *out"
+        return {
+            'out_decl': out_decl,
+            'table': table,
+            'get_func': type_info.get_func if type_info else "",
+            'getter': f"{func_prefix}_get_{field_name}",
+        }
+    
+    def _reply_to_dict(self, obj: ObjectDef, method: MethodDef) -> Dict:
+        """Convert method result type to reply helper dictionary for template"""
+        result_prefix = self._get_type_prefix(method.result_type)
+        return {
+            'reply_func': f"{self._get_method_prefix(obj, method)}_reply",
+            'result_struct_type': result_prefix,
+            'serialize_func': f"{result_prefix}_serialize",
+            'cached': self._has_annotation(method.annotations, "cache"),
+            'bulk_fd_func': f"{result_prefix}_bulk_fd" if self._get_method_bulk(method)[1] else None,
         }
     
     def _custom_handler_to_dict(self, obj: ObjectDef, method: MethodDef) -> Dict:
@@ -491,6 +1300,7 @@ class CodeGenerator:
         
         params_struct_type = None
         deserialize_func = None
+        func_prefix = None
         
         if has_params:
             param = method.parameters[0]
@@ -498,20 +1308,37 @@ class CodeGenerator:
                 method_name = self._get_method_name(method)
                 obj_prefix = obj.name.lower()
                 if method_name.startswith(obj_prefix + "_"):
+                    func_prefix = method_name
                     params_struct_type = f"{method_name}_params"
-                    deserialize_func = f"{method_name}_deserialize"
                 else:
+                    func_prefix = f"{obj_prefix}_{method_name}"
                     params_struct_type = f"{obj_prefix}_{method_name}_params"
-                    deserialize_func = f"{obj_prefix}_{method_name}_deserialize"
             else:
                 type_name = param.type_name
                 owner = self.type_owners.get(type_name)
                 if owner:
-                    params_struct_type = f"{owner.lower()}_{type_name}"
-                    deserialize_func = f"{owner.lower()}_{type_name}_deserialize"
+                    func_prefix = f"{owner.lower()}_{type_name}"
                 else:
-                    params_struct_type = type_name
-                    deserialize_func = f"{type_name}_deserialize"
+                    func_prefix = type_name
+                params_struct_type = func_prefix
+            deserialize_func = f"{func_prefix}_deserialize"
+        params_bulk = self._get_method_bulk(method)[0]
+        lazy = has_params and self._is_lazy_method(method)
+        
+        # The shared handler gets the method as an enum and the decoded params
+        params_decl = None
+        if lazy:
+            params_decl = f"struct {func_prefix}_view *view"
+        elif has_params:
+            params_decl = f"const struct {params_struct_type} *params"
+        impl_args = [
+            "struct ubus_context *ctx",
+            "struct ubus_object *obj",
+            "struct ubus_request_data *req",
+            f"enum {obj.name.lower()}_method method",
+        ]
+        if params_decl:
+            impl_args.append(params_decl)
         
         return {
             'handler_name': handler_name,
@@ -519,8 +1346,244 @@ class CodeGenerator:
             'params_struct_type': params_struct_type,
             'deserialize_func': deserialize_func,
             'custom_handler': method.custom_handler,
+            'method_name': self._get_method_name(method),
+            'method_enum': self._get_method_enum(obj, method),
+            'params_decl': params_decl,
+            'impl_args': ", ".join(impl_args),
+            'lazy': lazy,
+            'func_prefix': func_prefix,
+            'view_struct': f"{func_prefix}_view",
+            'view_init_func': f"{func_prefix}_view_init",
+            'bulk_map_func': f"{func_prefix}_bulk_map" if params_bulk else None,
+            'bulk_unmap_func': f"{func_prefix}_bulk_unmap" if params_bulk else None,
         }
     
+    def _get_type_prefix(self, type_name: str) -> str:
+        """Get C prefix of a defined type (struct name and function prefix)"""
+        owner = self.type_owners.get(type_name)
+        if owner:
+            return f"{owner.lower()}_{type_name}"
+        return type_name
+    
+    def _get_method_prefix(self, obj: ObjectDef, method: MethodDef) -> str:
+        """Get C prefix for per-method generated functions"""
+        method_name = self._get_method_name(method)
+        obj_prefix = obj.name.lower()
+        if method_name.startswith(obj_prefix + "_"):
+            return method_name
+        return f"{obj_prefix}_{method_name}"
+    
+    def _get_method_enum(self, obj: ObjectDef, method: MethodDef) -> str:
+        """Get the item of a method in the enum of the object methods"""
+        prefix = self._get_method_prefix(obj, method)
+        return f"{obj.name.upper().replace('-', '_')}_METHOD_{prefix[len(obj.name) + 1:].upper()}"
+    
+    def _get_params_type(self, obj: ObjectDef, method: MethodDef):
+        """Get (struct type, function prefix) of method parameters, or (None, None)"""
+        if not method.parameters:
+            return None, None
+        param = method.parameters[0]
+        if param.name:
+            prefix = self._get_method_prefix(obj, method)
+            return f"{prefix}_params", prefix
+        prefix = self._get_type_prefix(param.type_name)
+        return prefix, prefix
+    
+    def _check_result_type(self, obj: ObjectDef, method: MethodDef):
+        """Validate that a method result refers to a defined type"""
+        if method.result_type not in self.type_defs:
+            raise ValueError(
+                f"Unknown result type '{method.result_type}' for method "
+                f"'{method.name}' in object '{obj.name}'"
+            )
+    
+    def _has_annotation(self, annotations: List[Annotation], name: str) -> bool:
+        """Check whether an annotation is present"""
+        return any(ann.name == name for ann in annotations)
+    
+    def _get_annotation_value(self, annotations: List[Annotation], name: str):
+        """Get annotation value, or None if absent or given without value"""
+        for ann in annotations:
+            if ann.name == name:
+                return ann.value
+        return None
+    
+    def _get_positive_annotation(self, obj: ObjectDef, annotations: List[Annotation], name: str, default: int) -> int:
+        """Get a positive integer annotation value, or default if absent"""
+        value = self._get_annotation_value(annotations, name)
+        if value is None:
+            return default
+        if not isinstance(value, int) or value <= 0:
+            raise ValueError(f"@{name} in object '{obj.name}' must be a positive integer")
+        return value
+    
+    def _get_max_size(self, obj: ObjectDef, method: MethodDef) -> Optional[int]:
+        """Get the payload size limit of a method (@max_size on the method or its object), or None"""
+        for annotations in (method.annotations, obj.annotations):
+            if self._has_annotation(annotations, "max_size"):
+                max_size = self._get_positive_annotation(obj, annotations, "max_size", 0)
+                if not max_size:
+                    raise ValueError(f"@max_size in object '{obj.name}' needs a size in bytes")
+                return max_size
+        return None
+    
+    def _get_cache_notify(self, obj: ObjectDef, method: MethodDef) -> str:
+        """Get the notification that invalidates a @cacheable method"""
+        if not method.result_type:
+            raise ValueError(
+                f"@cacheable method '{method.name}' in object '{obj.name}' needs a result type"
+            )
+        notify = self._get_annotation_value(method.annotations, "cacheable")
+        if notify is None:
+            return "changed"
+        if not isinstance(notify, str) or not notify:
+            raise ValueError(
+                f"@cacheable notification of method '{method.name}' in object '{obj.name}' must be a string"
+            )
+        return notify
+    
+    def _get_field_type(self, field) -> str:
+        """Get the generated type of a field or parameter, BULK_TYPE for @bulk ones and ENUM_TYPE for enums"""
+        if not self._has_annotation(field.annotations, "bulk"):
+            return ENUM_TYPE if field.type_name in self.enum_defs else field.type_name
+        if field.type_name not in ("array", "unspec"):
+            raise ValueError(f"@bulk field '{field.name}' must be an array or unspec, not {field.type_name}")
+        return BULK_TYPE
+    
+    def _field_type_to_dict(self, field) -> Dict:
+        """Get the generated type, C member type and blobmsg type of a field or parameter"""
+        type_name = self._get_field_type(field)
+        enum = self._enum_to_dict(field.type_name) if type_name == ENUM_TYPE else None
+        return {
+            'type_name': type_name,
+            'c_type': enum['c_type'] if enum else TypeFactory.get_struct_field_type(type_name),
+            'blob_type': enum['blob_type'] if enum else TypeFactory.get_blob_type(type_name),
+            'enum': enum,
+        }
+    
+    def _check_enum(self, enum_def: EnumDef):
+        """Validate an enum declaration"""
+        if TypeFactory.get_type_info(enum_def.name) or enum_def.name in self.type_defs:
+            raise ValueError(f"Enum '{enum_def.name}' has the name of a type")
+        c_names = [value.upper() for value in enum_def.values]
+        duplicates = [value for i, value in enumerate(enum_def.values) if value.upper() in c_names[:i]]
+        if duplicates:
+            raise ValueError(f"Enum '{enum_def.name}' declares {', '.join(duplicates)} twice")
+        if self._has_annotation(enum_def.annotations, "wire"):
+            if self._get_annotation_value(enum_def.annotations, "wire") not in ENUM_WIRES:
+                raise ValueError(f"@wire of enum '{enum_def.name}' must be one of: {', '.join(ENUM_WIRES)}")
+    
+    def _enum_to_dict(self, enum_name: str) -> Dict:
+        """Convert enum declaration to dictionary for template"""
+        enum_def = self.enum_defs[enum_name]
+        owner = self.enum_owners[enum_name]
+        prefix = f"{owner.lower()}_{enum_name}" if owner else enum_name
+        wire_int = self._get_annotation_value(enum_def.annotations, "wire") == "int"
+        
+        # Names are looked up with one hash and one strcmp, slots hold the value + 1
+        basis, size = self._perfect_hash(enum_def.values)
+        slots = [0] * size
+        for index, value in enumerate(enum_def.values):
+            slots[self._fnv1a(value, basis) & (size - 1)] = index + 1
+        
+        return {
+            'name': enum_name,
+            'prefix': prefix,
+            'c_type': f"enum {prefix}",
+            'members': [{'name': value, 'enum_item': f"{prefix.upper()}_{value.upper()}"} for value in enum_def.values],
+            'max': f"__{prefix.upper()}_MAX",
+            'wire_int': wire_int,
+            'blob_type': "BLOBMSG_TYPE_INT32" if wire_int else "BLOBMSG_TYPE_STRING",
+            'names': f"{prefix}_names",
+            'slots': f"{prefix}_slots",
+            'slot_type': "uint8_t" if len(enum_def.values) < 0xff else "uint16_t",
+            'slot_values': slots,
+            'hash_basis': f"0x{basis:08x}u",
+            'hash_mask': size - 1,
+            'name_func': f"{prefix}_name",
+            'parse_func': f"{prefix}_parse",
+            'desc': f"{prefix}_enum_desc",
+        }
+    
+    def _perfect_hash(self, names: List[str]):
+        """Find an FNV-1a basis and a power of two table size giving each name its own slot"""
+        size = 1
+        while size < 2 * len(names):
+            size <<= 1
+        while True:
+            for seed in range(1024):
+                basis = 2166136261 ^ seed
+                if len({self._fnv1a(name, basis) & (size - 1) for name in names}) == len(names):
+                    return basis, size
+            size <<= 1
+    
+    def _get_method_bulk(self, method: MethodDef):
+        """Check whether the (params, result) of a method carry a @bulk field"""
+        def has_bulk(fields):
+            return any(self._has_annotation(f.annotations, "bulk") for f in fields)
+        
+        params = False
+        if method.parameters:
+            param = method.parameters[0]
+            if param.name:
+                params = has_bulk(method.parameters)
+            else:
+                type_def = self.type_defs.get(param.type_name)
+                params = bool(type_def) and has_bulk(type_def.fields)
+        type_def = self.type_defs.get(method.result_type) if method.result_type else None
+        return params, bool(type_def) and has_bulk(type_def.fields)
+    
+    def _check_bulk_method(self, obj: ObjectDef, method: MethodDef):
+        """Refuse @bulk fields in methods whose request or reply is not sent by libubus right away"""
+        if not any(self._get_method_bulk(method)):
+            return
+        # Worker jobs, cached replies and queued requests would outlive the fd
+        for name in ("blocking", "cache", "cacheable", "inflight_queue"):
+            if self._has_annotation(method.annotations, name):
+                raise ValueError(
+                    f"@{name} method '{method.name}' in object '{obj.name}' cannot have @bulk fields"
+                )
+    
+    def _get_stream(self, obj: ObjectDef, method: MethodDef) -> Optional[Dict]:
+        """Get the chunked reply of a @stream method, or None"""
+        if not self._has_annotation(method.annotations, "stream"):
+            return None
+        if not method.result_type:
+            raise ValueError(f"@stream method '{method.name}' in object '{obj.name}' needs a result type")
+        # Cached and worker replies are a single message sent on the caller's behalf
+        for name in ("blocking", "cache", "cacheable"):
+            if self._has_annotation(method.annotations, name):
+                raise ValueError(f"@stream method '{method.name}' in object '{obj.name}' cannot be @{name}")
+        if self._get_method_bulk(method)[1]:
+            raise ValueError(f"@stream method '{method.name}' in object '{obj.name}' cannot return @bulk fields")
+        self._check_result_type(obj, method)
+        prefix = self._get_method_prefix(obj, method)
+        item_struct_type = self._get_type_prefix(method.result_type)
+        
+        return {
+            'stream_func': f"{prefix}_stream_reply",
+            'next_type': f"{prefix}_next_fn",
+            'item_struct_type': item_struct_type,
+            'serialize_func': f"{item_struct_type}_serialize",
+            'chunk_size': self._get_positive_annotation(obj, method.annotations, "stream", 16384),
+            'chunk_macro': f"{prefix.upper()}_CHUNK_SIZE",
+        }
+    
+    def _is_deferred_method(self, method: MethodDef) -> bool:
+        """Check whether a method completes its request outside the ubus handler"""
+        return (self._has_annotation(method.annotations, "async")
+                or self._has_annotation(method.annotations, "blocking"))
+    
+    def _is_lazy_method(self, method: MethodDef) -> bool:
+        """Check whether a method decodes its parameters through a lazy view"""
+        if self._has_annotation(method.annotations, "lazy"):
+            return True
+        param = method.parameters[0]
+        if not param.name:
+            type_def = self.type_defs.get(param.type_name)
+            return bool(type_def) and self._has_annotation(type_def.annotations, "lazy")
+        return False
+    
     def _get_method_name(self, method: MethodDef) -> str:
         """Get actual method name (might be overridden by @name annotation)"""
         method_name = method.name
@@ -531,9 +1594,11 @@ class CodeGenerator:
         return method_name
     
     def _get_handler_name(self, obj: ObjectDef, method: MethodDef) -> str:
-        """Get handler function name"""
+        """Get handler function name, the thunk calling the shared custom handler of direct methods"""
         if method.custom_handler:
-            return method.custom_handler
+            if self._is_deferred_method(method):
+                return method.custom_handler
+            return f"{self._get_method_prefix(obj, method)}_thunk"
         
         method_name = self._get_method_name(method)
         obj_prefix = f"{obj.name.lower()}_"
@@ -542,10 +1607,11 @@ class CodeGenerator:
         else:
             return f"{obj.name.lower()}_{method_name}_handler"
     
-    def _generate_method_def(self, obj: ObjectDef, method: MethodDef) -> str:
+    def _generate_method_def(self, obj: ObjectDef, method: MethodDef, handler_name: Optional[str] = None) -> str:
         """Generate method definition string"""
         method_name = self._get_method_name(method)
-        handler_name = self._get_handler_name(obj, method)
+        if handler_name is None:
+            handler_name = self._get_handler_name(obj, method)
         
         # Determine policy name
         policy_name = None
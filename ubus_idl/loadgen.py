@@ -0,0 +1,240 @@
+"""Drive a ubus object with synthesized requests built from its IDL"""
+
+import argparse
+import asyncio
+import random
+import string
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import blobmsg
+from .schema import FieldSpec, MethodSpec, ObjectSpec, load_schema, validate, wire_types
+from .stats import Recorder
+from .transport import (
+    DEFAULT_SOCKET, UBUS_STATUS_CONNECTION_FAILED, UBUS_STATUS_OK, UBUS_STATUS_TIMEOUT,
+    UbusConnection, UbusError,
+)
+
+_INT_RANGES = {
+    "int8": (-2**7, 2**7 - 1),
+    "int16": (-2**15, 2**15 - 1),
+    "int32": (-2**31, 2**31 - 1),
+    "int64": (-2**63, 2**63 - 1),
+}
+
+
+class PayloadOptions:
+    """Knobs of the synthesized payloads"""
+
+    def __init__(self, fill_ratio: float = 0.5, string_len: int = 16,
+                 array_size: int = 4, rng: Optional[random.Random] = None):
+        self.fill_ratio = fill_ratio  # Probability that an optional field is present
+        self.string_len = string_len
+        self.array_size = array_size
+        self.rng = rng or random.Random()
+
+
+def _value_factory(spec: FieldSpec, opts: PayloadOptions) -> Callable[[], Any]:
+    """Compile one field into a function returning a random valid value"""
+    rng = opts.rng
+    if spec.bulk:
+        # The data of @bulk fields needs an fd, send them empty
+        return lambda: 0
+    if spec.fields is not None:
+        return compile_fields(spec.fields, opts)
+    if spec.values is not None:
+        if spec.wire_int:
+            count = len(spec.values)
+            return lambda: rng.randrange(count)
+        values = spec.values
+        return lambda: rng.choice(values)
+    type_name = spec.type_name
+    if type_name in _INT_RANGES:
+        low, high = _INT_RANGES[type_name]
+        return lambda: rng.randint(low, high)
+    if type_name == "bool":
+        return lambda: rng.random() < 0.5
+    if type_name == "double":
+        return lambda: rng.uniform(-1e6, 1e6)
+    if type_name == "string":
+        letters = string.ascii_letters + string.digits
+        length = opts.string_len
+        return lambda: "".join(rng.choice(letters) for _ in range(length))
+    if type_name == "array":
+        size = opts.array_size
+        return lambda: [rng.randint(0, 2**31 - 1) for _ in range(size)]
+    return lambda: rng.randint(0, 2**31 - 1)
+
+
+def compile_fields(fields: List[FieldSpec], opts: PayloadOptions) -> Callable[[], Dict[str, Any]]:
+    """Compile a table of fields into a function returning a random valid table"""
+    rng = opts.rng
+    makers = [(spec.name, spec.optional, _value_factory(spec, opts)) for spec in fields]
+
+    def make() -> Dict[str, Any]:
+        table = {}
+        for name, optional, maker in makers:
+            if optional and rng.random() >= opts.fill_ratio:
+                continue
+            table[name] = maker()
+        return table
+    return make
+
+
+def payload_pool(method: MethodSpec, opts: PayloadOptions, size: int) -> List[bytes]:
+    """Pre-encode size random payloads for a method, so sending costs no encoding"""
+    make = compile_fields(method.params, opts)
+    types = wire_types(method.params)
+    return [blobmsg.encode_table(make(), types) for _ in range(size)]
+
+
+async def run_load(obj: ObjectSpec, methods: List[MethodSpec], pools: Dict[str, List[bytes]],
+                   socket_path: str, qps: float, concurrency: int, duration: float,
+                   count: int, timeout: float, rng: random.Random) -> Tuple[Recorder, float]:
+    """Send requests at a fixed rate (qps > 0) or closed loop with concurrency workers"""
+    conn = await UbusConnection.connect(socket_path)
+    try:
+        obj_id = await conn.lookup_id(obj.path, timeout)
+        recorder = Recorder()
+        for method in methods:
+            recorder.get(method.name)
+        sent = 0
+        start = time.perf_counter()
+
+        def next_request():
+            nonlocal sent
+            if count and sent >= count:
+                return None
+            if duration and time.perf_counter() - start >= duration:
+                return None
+            sent += 1
+            method = rng.choice(methods)
+            pool = pools[method.name]
+            return method, pool[sent % len(pool)]
+
+        async def call(method: MethodSpec, payload: bytes):
+            invalid = False
+            begin = time.perf_counter()
+            try:
+                reply = await conn.invoke(obj_id, method.name, payload, timeout)
+                status = UBUS_STATUS_OK
+            except UbusError as e:
+                reply, status = None, e.status
+            except asyncio.TimeoutError:
+                reply, status = None, UBUS_STATUS_TIMEOUT
+            except ConnectionError:
+                reply, status = None, UBUS_STATUS_CONNECTION_FAILED
+            latency_us = (time.perf_counter() - begin) * 1e6
+            if status == UBUS_STATUS_OK and method.result is not None:
+                # A malformed reply counts as invalid instead of aborting the run
+                try:
+                    invalid = reply is None or bool(validate(method.result, blobmsg.decode_typed_table(reply)))
+                except blobmsg.BlobError:
+                    invalid = True
+            recorder.record(method.name, latency_us, status, invalid)
+
+        if qps > 0:
+            # Open loop: requests are sent on schedule, whatever the latency, up to
+            # concurrency in flight so a stalled server cannot exhaust memory
+            slots = asyncio.Semaphore(concurrency)
+            tasks = []
+
+            async def limited(method, payload):
+                try:
+                    await call(method, payload)
+                finally:
+                    slots.release()
+
+            interval = 1.0 / qps
+            while True:
+                request = next_request()
+                if request is None:
+                    break
+                delay = start + (sent - 1) * interval - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await slots.acquire()
+                tasks.append(asyncio.ensure_future(limited(*request)))
+            if tasks:
+                await asyncio.gather(*tasks)
+        else:
+            async def worker():
+                while True:
+                    request = next_request()
+                    if request is None:
+                        return
+                    await call(*request)
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return recorder, time.perf_counter() - start
+    finally:
+        await conn.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="ubus-idl loadgen",
+        description="Call the methods of a ubus object with random valid params built from its IDL"
+    )
+    parser.add_argument("idl", help="Input .uidl file describing the object")
+    parser.add_argument("--object", help="Object to call (default: the only object of the IDL)")
+    parser.add_argument("-m", "--method", action="append", default=[],
+                        help="Method to call, may be repeated (default: every method)")
+    parser.add_argument("-s", "--socket", default=DEFAULT_SOCKET, help=f"ubusd socket (default: {DEFAULT_SOCKET})")
+    parser.add_argument("--qps", type=float, default=0,
+                        help="Send at a fixed rate, in requests per second (default: closed loop)")
+    parser.add_argument("-c", "--concurrency", type=int, default=8,
+                        help="Closed loop workers, or maximum requests in flight with --qps (default: 8)")
+    parser.add_argument("-d", "--duration", type=float, default=10.0,
+                        help="Run time in seconds, 0 for no limit (default: 10)")
+    parser.add_argument("-n", "--count", type=int, default=0, help="Stop after this many requests (default: no limit)")
+    parser.add_argument("-t", "--timeout", type=float, default=5.0, help="Per-request timeout in seconds (default: 5)")
+    parser.add_argument("--fill-ratio", type=float, default=0.5,
+                        help="Probability that an optional field is set (default: 0.5)")
+    parser.add_argument("--string-len", type=int, default=16, help="Length of generated strings (default: 16)")
+    parser.add_argument("--array-size", type=int, default=4, help="Number of elements of generated arrays (default: 4)")
+    parser.add_argument("--pool", type=int, default=256,
+                        help="Distinct payloads pre-encoded per method (default: 256)")
+    parser.add_argument("--seed", type=int, help="Random seed, for repeatable payloads")
+    args = parser.parse_args(argv)
+
+    if args.concurrency <= 0 or args.pool <= 0 or args.qps < 0:
+        parser.error("--concurrency and --pool must be positive, --qps must not be negative")
+    if not 0.0 <= args.fill_ratio <= 1.0:
+        parser.error("--fill-ratio must be between 0 and 1")
+    if not args.duration and not args.count:
+        parser.error("set --duration or --count")
+
+    try:
+        obj = load_schema(args.idl).get_object(args.object)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    names = args.method or list(obj.methods)
+    unknown = [name for name in names if name not in obj.methods]
+    if unknown:
+        print(f"Error: unknown method(s) in '{obj.path}': {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+    methods = [obj.methods[name] for name in names]
+
+    rng = random.Random(args.seed)
+    opts = PayloadOptions(args.fill_ratio, args.string_len, args.array_size, rng)
+    pools = {method.name: payload_pool(method, opts, args.pool) for method in methods}
+
+    try:
+        recorder, elapsed = asyncio.run(run_load(
+            obj, methods, pools, args.socket, args.qps, args.concurrency,
+            args.duration, args.count, args.timeout, rng))
+    except (OSError, UbusError, asyncio.TimeoutError) as e:
+        print(f"Error: cannot reach '{obj.path}' on {args.socket}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    mode = f"{args.qps:g} qps" if args.qps > 0 else f"closed loop, {args.concurrency} workers"
+    print(f"Load on '{obj.path}' ({mode})")
+    print(recorder.format_report(elapsed, histogram=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,21 @@ import argparse
 import sys
 from pathlib import Path
 from .parser import Parser
-from .codegen import CodeGenerator
+from .codegen import CODECS, CodeGenerator
+
+# Subcommands implemented by other modules, as "ubus-idl <name> ..."
+SUBCOMMANDS = {
+    "replay": "ubus_idl.replay",
+    "loadgen": "ubus_idl.loadgen",
+}
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        import importlib
+        module = importlib.import_module(SUBCOMMANDS[sys.argv[1]])
+        return module.main(sys.argv[2:])
+    
     parser = argparse.ArgumentParser(
         description="Ubus IDL compiler - Generate ubus C code from .uidl files"
     )
@@ -22,6 +33,23 @@ def main():
         default=".",
         help="Output directory for generated files (default: current directory)"
     )
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="Also generate typed client stubs for every object (same as @client)"
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Instrument every object with call metrics and a stats method (same as @metrics)"
+    )
+    parser.add_argument(
+        "--codec",
+        choices=CODECS,
+        default="unrolled",
+        help="Serializers: one function body per type, or compact descriptors run by a "
+             "shared interpreter (same as @codec(\"table\"), default: unrolled)"
+    )
     
     args = parser.parse_args()
     
@@ -46,7 +74,7 @@ def main():
     
     # Generate code
     try:
-        generator = CodeGenerator(document)
+        generator = CodeGenerator(document, client=args.client, metrics=args.metrics, codec=args.codec)
         generated_files = generator.generate()
     except Exception as e:
         print(f"Error generating code: {e}", file=sys.stderr)
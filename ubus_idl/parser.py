@@ -3,28 +3,38 @@
 from lark import Lark, Transformer, Token
 from typing import List, Union
 from .ast import (
-    Annotation, FieldDef, TypeDef, Parameter, MethodDef, ObjectDef, Document
+    Annotation, FieldDef, TypeDef, EnumDef, Parameter, MethodDef, EventDef, ObjectDef, Document
 )
 
 
 # Lark grammar definition
 GRAMMAR = r"""
-start: (type_def | object)*
+start: (type_def | enum_def | object)*
 
-object: "object" CNAME "{" (type_def | method_def)* "}"
+object: annotation* "object" CNAME "{" (type_def | enum_def | method_def | event_def)* "}"
 
-type_def: CNAME ":" "{" field_def* "}"
+type_def: annotation* CNAME ":" "{" field_def* "}"
 
-field_def: CNAME OPTIONAL? ":" type_name
+// "enum" is matched as a name like "event", a name and "{" follow it
+enum_def: annotation* CNAME CNAME "{" CNAME ("," CNAME)* ","? "}"
+
+field_def: annotation* CNAME OPTIONAL? ":" type_name
 OPTIONAL: "?"
 
 method_def: annotation* method_decl
 
-method_decl: CNAME "(" (param_list | type_ref)? ")" (":" CNAME)?
+method_decl: CNAME "(" (param_list | type_ref)? ")" result_type? handler_ref?
+
+// "event" is matched as a name so that methods and types can still be named event
+event_def: annotation* CNAME CNAME "(" (param_list | type_ref)? ")"
+
+result_type: "->" CNAME
+
+handler_ref: ":" CNAME
 
 param_list: param ("," param)*
 
-param: CNAME OPTIONAL? ":" type_name
+param: annotation* CNAME OPTIONAL? ":" type_name
 
 type_ref: CNAME
 
@@ -39,7 +49,7 @@ DOUBLE: "double"
 ARRAY: "array"
 UNSPEC: "unspec"
 
-annotation: "@" CNAME "(" annotation_value ")"
+annotation: "@" CNAME ("(" annotation_value ")")?
 
 annotation_value: STRING | HEX_NUMBER | NUMBER
 
@@ -54,42 +64,82 @@ NUMBER: /-?[0-9]+/
 """
 
 
+class _TypeRef(str):
+    """Type name used as method parameter"""
+
+
+class _ResultType(str):
+    """Type name of method result"""
+
+
+class _HandlerRef(str):
+    """Custom handler name"""
+
+
+def _check_keyword(token, keyword: str):
+    """Check a contextual keyword, parsed as a CNAME to keep it usable as a name"""
+    if str(token) != keyword:
+        raise ValueError(f"Expected '{keyword}' before a name, got '{token}'")
+
+
 class UbusIDLTransformer(Transformer):
     """Transform Lark parse tree to AST"""
     
     def start(self, items):
-        """start: (type_def | object)*"""
+        """start: (type_def | enum_def | object)*"""
         objects = []
         global_types = []
+        enums = []
         for item in items:
             if isinstance(item, ObjectDef):
                 objects.append(item)
             elif isinstance(item, TypeDef):
                 global_types.append(item)
-        return Document(objects=objects, global_types=global_types)
+            elif isinstance(item, EnumDef):
+                enums.append(item)
+        return Document(objects=objects, global_types=global_types, enums=enums)
     
     def object(self, items):
-        """object: "object" CNAME "{" ... "}" """
+        """object: annotation* "object" CNAME "{" ... "}" """
+        annotations = [item for item in items if isinstance(item, Annotation)]
+        items = items[len(annotations):]
         name = str(items[0])
         types = []
         methods = []
+        events = []
+        enums = []
         
         for item in items[1:]:
             if isinstance(item, TypeDef):
                 types.append(item)
             elif isinstance(item, MethodDef):
                 methods.append(item)
+            elif isinstance(item, EventDef):
+                events.append(item)
+            elif isinstance(item, EnumDef):
+                enums.append(item)
         
-        return ObjectDef(name=name, types=types, methods=methods)
+        return ObjectDef(name=name, types=types, methods=methods, annotations=annotations, events=events, enums=enums)
     
     def type_def(self, items):
-        """type_def: CNAME ":" "{" field_def* "}" """
+        """type_def: annotation* CNAME ":" "{" field_def* "}" """
+        annotations = [item for item in items if isinstance(item, Annotation)]
+        items = items[len(annotations):]
         name = str(items[0])
         fields = [item for item in items[1:] if isinstance(item, FieldDef)]
-        return TypeDef(name=name, fields=fields)
+        return TypeDef(name=name, fields=fields, annotations=annotations)
+    
+    def enum_def(self, items):
+        """enum_def: annotation* "enum" CNAME "{" CNAME ("," CNAME)* ","? "}" """
+        annotations = [item for item in items if isinstance(item, Annotation)]
+        items = items[len(annotations):]
+        _check_keyword(items[0], "enum")
+        return EnumDef(name=str(items[1]), values=[str(item) for item in items[2:]], annotations=annotations)
     
     def field_def(self, items):
-        """field_def: CNAME OPTIONAL? ":" type_name"""
+        """field_def: annotation* CNAME OPTIONAL? ":" type_name"""
+        annotations = [item for item in items if isinstance(item, Annotation)]
+        items = items[len(annotations):]
         field_name = str(items[0])
         # items structure (after transformer processes OPTIONAL):
         # If OPTIONAL is present: [CNAME, "?", type_name] -> items[1] is "?", items[2] is type_name
@@ -118,7 +168,7 @@ class UbusIDLTransformer(Transformer):
         else:
             type_name = ""
         
-        return FieldDef(name=field_name, type_name=type_name, optional=optional)
+        return FieldDef(name=field_name, type_name=type_name, optional=optional, annotations=annotations)
     
     def OPTIONAL(self, token):
         """OPTIONAL: "?" """
@@ -140,56 +190,55 @@ class UbusIDLTransformer(Transformer):
         return method_decl
     
     def method_decl(self, items):
-        """method_decl: CNAME "(" ... ")" (":" CNAME)?"""
+        """method_decl: CNAME "(" ... ")" ("->" CNAME)? (":" CNAME)?"""
         method_name = str(items[0])
         parameters = []
+        result_type = None
         custom_handler = None
         
-        # Process parameters and custom handler
-        # items[0] is method name
-        # items[1] might be parameter (list, str, or None)
-        # items[2] might be custom handler (if present)
-        
-        if len(items) == 1:
-            # Only method name, no parameters, no custom handler
-            pass
-        elif len(items) == 2:
-            # Might be parameter or custom handler
-            item = items[1]
-            if isinstance(item, str):
-                # Might be type_ref or custom handler
-                # If syntax is correct, should be type_ref (parameter)
-                parameters = [Parameter(name=None, type_name=item)]
-            elif isinstance(item, list):
-                # param_list
+        # items[0] is method name, the rest are tagged by their rule:
+        # param_list (list), type_ref, result_type and handler_ref
+        for item in items[1:]:
+            if isinstance(item, list):
                 parameters = item
-            # If None, means empty parameter list
-        elif len(items) == 3:
-            # method_name, param_item, handler_name
-            param_item = items[1]
-            custom_handler = str(items[2])
-            
-            if param_item is not None:
-                if isinstance(param_item, list):
-                    # param_list
-                    parameters = param_item
-                elif isinstance(param_item, str):
-                    # type_ref (using defined type)
-                    parameters = [Parameter(name=None, type_name=param_item)]
+            elif isinstance(item, _TypeRef):
+                # type_ref (using defined type)
+                parameters = [Parameter(name=None, type_name=str(item))]
+            elif isinstance(item, _ResultType):
+                result_type = str(item)
+            elif isinstance(item, _HandlerRef):
+                custom_handler = str(item)
         
         return MethodDef(
             name=method_name,
             parameters=parameters,
             annotations=[],
-            custom_handler=custom_handler
+            custom_handler=custom_handler,
+            result_type=result_type
         )
     
+    def event_def(self, items):
+        """event_def: annotation* "event" CNAME "(" (param_list | type_ref)? ")" """
+        annotations = [item for item in items if isinstance(item, Annotation)]
+        items = items[len(annotations):]
+        _check_keyword(items[0], "event")
+        name = str(items[1])
+        parameters = []
+        for item in items[2:]:
+            if isinstance(item, list):
+                parameters = item
+            elif isinstance(item, _TypeRef):
+                parameters = [Parameter(name=None, type_name=str(item))]
+        return EventDef(name=name, parameters=parameters, annotations=annotations)
+    
     def param_list(self, items):
         """param_list: param ("," param)*"""
         return list(items)
     
     def param(self, items):
-        """param: CNAME OPTIONAL? ":" type_name"""
+        """param: annotation* CNAME OPTIONAL? ":" type_name"""
+        annotations = [item for item in items if isinstance(item, Annotation)]
+        items = items[len(annotations):]
         param_name = str(items[0])
         # Check if OPTIONAL is present
         optional = False
@@ -220,11 +269,19 @@ class UbusIDLTransformer(Transformer):
             # Fallback: if type_name transformer returned empty, check the parse tree
             # This shouldn't happen, but handle it gracefully
             type_name = ""
-        return Parameter(name=param_name, type_name=type_name, optional=optional)
+        return Parameter(name=param_name, type_name=type_name, optional=optional, annotations=annotations)
     
     def type_ref(self, items):
         """type_ref: CNAME"""
-        return str(items[0])
+        return _TypeRef(items[0])
+    
+    def result_type(self, items):
+        """result_type: "->" CNAME"""
+        return _ResultType(items[0])
+    
+    def handler_ref(self, items):
+        """handler_ref: ":" CNAME"""
+        return _HandlerRef(items[0])
     
     def type_name(self, items):
         """type_name: INT32 | INT64 | STRING | ..."""
@@ -264,8 +321,11 @@ class UbusIDLTransformer(Transformer):
         return "unspec"
     
     def annotation(self, items):
-        """annotation: "@" CNAME "(" annotation_value ")" """
+        """annotation: "@" CNAME ("(" annotation_value ")")?"""
         name = str(items[0])
+        if len(items) < 2:
+            # Flag annotation without value, e.g., @lazy
+            return Annotation(name=name, value=None)
         value = items[1]
         
         # Process value
@@ -0,0 +1,219 @@
+"""Replay captured requests against a running ubus object"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import blobmsg
+from .schema import ObjectSpec, load_schema, validate, wire_types
+from .stats import Recorder
+from .transport import (
+    DEFAULT_SOCKET, UBUS_STATUS_CONNECTION_FAILED, UBUS_STATUS_OK, UBUS_STATUS_TIMEOUT,
+    UbusConnection, UbusError,
+)
+
+MODES = ("original", "accelerated", "max")
+
+
+@dataclass
+class TraceEntry:
+    """One captured request"""
+    method: str
+    params: Dict[str, Any]
+    timestamp_us: int = 0
+    status: Optional[int] = None
+
+
+def _entry_from_dict(item: Dict[str, Any]) -> Optional[TraceEntry]:
+    """Convert a trace_dump entry, or a plain {method, params} record"""
+    if "method" not in item:
+        return None
+    if "params" not in item:
+        # trace_dump sends truncated payloads as hex, they cannot be replayed
+        if "payload" in item:
+            return None
+        params = {}
+    else:
+        params = item["params"] or {}
+    return TraceEntry(
+        method=item["method"],
+        params=params,
+        timestamp_us=int(item.get("timestamp_us", 0)),
+        status=item.get("status"),
+    )
+
+
+def _expand(record: Any) -> List[Dict[str, Any]]:
+    """Flatten a trace_dump reply, a list of entries or a single entry"""
+    if isinstance(record, list):
+        items = []
+        for item in record:
+            items.extend(_expand(item))
+        return items
+    if isinstance(record, dict) and isinstance(record.get("entries"), list):
+        return record["entries"]
+    if isinstance(record, dict):
+        return [record]
+    return []
+
+
+def _parse_json(text: str) -> List[Any]:
+    """Parse concatenated JSON values, as printed by `ubus call ... trace_dump`"""
+    decoder = json.JSONDecoder()
+    records = []
+    pos = 0
+    while True:
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos >= len(text):
+            break
+        record, pos = decoder.raw_decode(text, pos)
+        records.append(record)
+    return records
+
+
+def _parse_blobs(data: bytes) -> List[Any]:
+    """Parse concatenated blob buffers, each holding one blobmsg table"""
+    records = []
+    while data:
+        payload, data = blobmsg.split_attr(data)
+        records.append(blobmsg.decode_table(payload))
+    return records
+
+
+def load_trace(path: str) -> Tuple[List[TraceEntry], int]:
+    """Load a trace file, returning (entries in time order, skipped entries)"""
+    with open(path, "rb") as f:
+        data = f.read()
+    stripped = data.lstrip()
+    if stripped[:1] in (b"{", b"["):
+        records = _parse_json(data.decode("utf-8"))
+    else:
+        records = _parse_blobs(data)
+
+    entries = []
+    skipped = 0
+    for record in records:
+        for item in _expand(record):
+            entry = _entry_from_dict(item)
+            if entry is None:
+                skipped += 1
+            else:
+                entries.append(entry)
+    entries.sort(key=lambda e: e.timestamp_us)
+    return entries, skipped
+
+
+async def replay(obj: ObjectSpec, entries: List[TraceEntry], socket_path: str,
+                 mode: str, speed: float, concurrency: int, timeout: float) -> Tuple[Recorder, float]:
+    """Send entries to the object and record latency and reply checks per method"""
+    conn = await UbusConnection.connect(socket_path)
+    try:
+        obj_id = await conn.lookup_id(obj.path, timeout)
+        recorder = Recorder()
+        slots = asyncio.Semaphore(concurrency)
+        payloads = [blobmsg.encode_table(e.params, wire_types(obj.methods[e.method].params))
+                    for e in entries]
+
+        async def call(entry: TraceEntry, payload: bytes):
+            method = obj.methods[entry.method]
+            invalid = False
+            start = time.perf_counter()
+            try:
+                try:
+                    reply = await conn.invoke(obj_id, method.name, payload, timeout)
+                    status = UBUS_STATUS_OK
+                except UbusError as e:
+                    reply, status = None, e.status
+                except asyncio.TimeoutError:
+                    reply, status = None, UBUS_STATUS_TIMEOUT
+                except ConnectionError:
+                    reply, status = None, UBUS_STATUS_CONNECTION_FAILED
+                latency_us = (time.perf_counter() - start) * 1e6
+                if status == UBUS_STATUS_OK and method.result is not None:
+                    if reply is None:
+                        invalid = True
+                    else:
+                        # A malformed reply counts as invalid instead of aborting the replay
+                        try:
+                            invalid = bool(validate(method.result, blobmsg.decode_typed_table(reply)))
+                        except blobmsg.BlobError:
+                            invalid = True
+                mismatch = entry.status is not None and entry.status != status
+                recorder.record(method.name, latency_us, status, invalid, mismatch)
+            finally:
+                slots.release()
+
+        tasks = []
+        base_us = entries[0].timestamp_us if entries else 0
+        start = time.perf_counter()
+        for entry, payload in zip(entries, payloads):
+            if mode != "max":
+                due = (entry.timestamp_us - base_us) / 1e6 / speed
+                delay = due - (time.perf_counter() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await slots.acquire()
+            tasks.append(asyncio.ensure_future(call(entry, payload)))
+        if tasks:
+            await asyncio.gather(*tasks)
+        return recorder, time.perf_counter() - start
+    finally:
+        await conn.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="ubus-idl replay",
+        description="Replay captured requests (trace_dump JSON or blobmsg dumps) against a ubus object"
+    )
+    parser.add_argument("idl", help="Input .uidl file describing the object")
+    parser.add_argument("trace", help="Captured requests: trace_dump JSON output, JSON entries or blobmsg dumps")
+    parser.add_argument("--object", help="Object to call (default: the only object of the IDL)")
+    parser.add_argument("-s", "--socket", default=DEFAULT_SOCKET, help=f"ubusd socket (default: {DEFAULT_SOCKET})")
+    parser.add_argument("--mode", choices=MODES, default="original",
+                        help="original: captured timing, accelerated: timing divided by --speed, "
+                             "max: as fast as --concurrency allows (default: original)")
+    parser.add_argument("--speed", type=float, default=10.0, help="Speed-up factor for --mode accelerated (default: 10)")
+    parser.add_argument("-c", "--concurrency", type=int, default=64, help="Maximum requests in flight (default: 64)")
+    parser.add_argument("-t", "--timeout", type=float, default=5.0, help="Per-request timeout in seconds (default: 5)")
+    parser.add_argument("--histogram", action="store_true", help="Also print a latency histogram per method")
+    args = parser.parse_args(argv)
+
+    if args.speed <= 0 or args.concurrency <= 0:
+        parser.error("--speed and --concurrency must be positive")
+
+    try:
+        obj = load_schema(args.idl).get_object(args.object)
+        entries, skipped = load_trace(args.trace)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    unknown = [e for e in entries if e.method not in obj.methods]
+    entries = [e for e in entries if e.method in obj.methods]
+    skipped += len(unknown)
+    if not entries:
+        print("Error: no replayable entries in trace", file=sys.stderr)
+        sys.exit(1)
+
+    speed = 1.0 if args.mode == "original" else args.speed
+    try:
+        recorder, elapsed = asyncio.run(replay(
+            obj, entries, args.socket, args.mode, speed, args.concurrency, args.timeout))
+    except (OSError, UbusError, asyncio.TimeoutError) as e:
+        print(f"Error: cannot reach '{obj.path}' on {args.socket}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Replayed {len(entries)} requests to '{obj.path}' ({args.mode}), skipped {skipped}")
+    print(recorder.format_report(elapsed, args.histogram))
+    if any(s.invalid_replies for s in recorder.methods.values()):
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Runtime view of parsed IDL objects, used by the replay and loadgen tools"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ast import Annotation, Document, EnumDef, MethodDef, ObjectDef, TypeDef
+from .blobmsg import (
+    IDL_BLOBMSG_TYPES, BLOBMSG_TYPE_INT32, BLOBMSG_TYPE_INT64, BLOBMSG_TYPE_STRING, BLOBMSG_TYPE_TABLE,
+)
+from .parser import Parser
+
+
+@dataclass
+class FieldSpec:
+    """Field of a method params or reply table"""
+    name: str
+    type_name: str
+    optional: bool = False
+    fields: Optional[List["FieldSpec"]] = None  # Custom type fields, None for builtin types
+    bulk: bool = False  # @bulk field: only its length is on the wire, the data travels as an fd
+    values: Optional[List[str]] = None  # Value names of enum fields, None for other types
+    wire_int: bool = False  # Enum sent as the index of its value (@wire("int")) instead of the name
+
+    @property
+    def blob_type(self) -> int:
+        """blobmsg type used on the wire"""
+        if self.bulk:
+            return BLOBMSG_TYPE_INT64
+        if self.values is not None:
+            return BLOBMSG_TYPE_INT32 if self.wire_int else BLOBMSG_TYPE_STRING
+        return IDL_BLOBMSG_TYPES.get(self.type_name, BLOBMSG_TYPE_TABLE)
+
+
+@dataclass
+class MethodSpec:
+    """Method as seen by ubusd: its registered name, params and reply fields"""
+    name: str
+    params: List[FieldSpec] = field(default_factory=list)
+    result: Optional[List[FieldSpec]] = None  # None when the method declares no result type
+
+
+@dataclass
+class ObjectSpec:
+    """Object registered on ubus and its methods, keyed by ubus method name"""
+    name: str
+    path: str
+    methods: Dict[str, MethodSpec] = field(default_factory=dict)
+
+
+class Schema:
+    """Resolves objects, methods and custom types of a parsed document"""
+
+    def __init__(self, document: Document):
+        self.document = document
+        self.type_defs: Dict[str, TypeDef] = {}
+        for type_def in document.global_types:
+            self.type_defs[type_def.name] = type_def
+        for obj in document.objects:
+            for type_def in obj.types:
+                self.type_defs[type_def.name] = type_def
+        self.enum_defs: Dict[str, EnumDef] = {}
+        for enum_def in document.enums + [e for obj in document.objects for e in obj.enums]:
+            self.enum_defs[enum_def.name] = enum_def
+        self.objects: Dict[str, ObjectSpec] = {}
+        for obj in document.objects:
+            spec = self._object_spec(obj)
+            self.objects[spec.path] = spec
+
+    def get_object(self, name: Optional[str] = None) -> ObjectSpec:
+        """Get an object by ubus path, or the only object of the document"""
+        if name is None:
+            if len(self.objects) != 1:
+                raise ValueError(
+                    f"IDL defines {len(self.objects)} objects, select one with --object"
+                )
+            return next(iter(self.objects.values()))
+        spec = self.objects.get(name) or self.objects.get(name.lower())
+        if spec is None:
+            raise ValueError(f"Unknown object '{name}'")
+        return spec
+
+    def _object_spec(self, obj: ObjectDef) -> ObjectSpec:
+        spec = ObjectSpec(name=obj.name, path=obj.name.lower())
+        for method in obj.methods:
+            method_spec = self._method_spec(method)
+            spec.methods[method_spec.name] = method_spec
+        return spec
+
+    def _method_spec(self, method: MethodDef) -> MethodSpec:
+        name = method.name
+        for ann in method.annotations:
+            if ann.name == "name":
+                name = ann.value
+                break
+
+        params = []
+        if method.parameters:
+            first = method.parameters[0]
+            if first.name:
+                params = [self._field_spec(p.name, p.type_name, p.optional, annotations=p.annotations)
+                          for p in method.parameters]
+            else:
+                params = self._type_fields(first.type_name)
+
+        result = None
+        if method.result_type:
+            result = self._type_fields(method.result_type)
+            # @stream replies are chunks holding an array of result tables
+            if any(ann.name == "stream" for ann in method.annotations):
+                result = [FieldSpec(name="items", type_name="array")]
+        return MethodSpec(name=name, params=params, result=result)
+
+    def _type_fields(self, type_name: str, seen: tuple = ()) -> List[FieldSpec]:
+        type_def = self.type_defs.get(type_name)
+        if type_def is None:
+            raise ValueError(f"Unknown type '{type_name}'")
+        if type_name in seen:
+            raise ValueError(f"Type '{type_name}' refers to itself")
+        return [self._field_spec(f.name, f.type_name, f.optional, seen + (type_name,), f.annotations)
+                for f in type_def.fields]
+
+    def _field_spec(self, name: str, type_name: str, optional: bool, seen: tuple = (),
+                    annotations: Optional[List[Annotation]] = None) -> FieldSpec:
+        nested = None
+        enum_def = self.enum_defs.get(type_name)
+        if type_name not in IDL_BLOBMSG_TYPES and not enum_def:
+            nested = self._type_fields(type_name, seen)
+        bulk = any(ann.name == "bulk" for ann in annotations or [])
+        spec = FieldSpec(name=name, type_name=type_name, optional=optional, fields=nested, bulk=bulk)
+        if enum_def:
+            spec.values = list(enum_def.values)
+            spec.wire_int = any(ann.name == "wire" and ann.value == "int" for ann in enum_def.annotations)
+        return spec
+
+
+def load_schema(path: str) -> Schema:
+    """Parse a .uidl file into a Schema"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return Schema(Parser().parse(f.read()))
+
+
+def wire_types(fields: List[FieldSpec]) -> Dict[str, Any]:
+    """Map field names to blobmsg types (nested dicts for tables), for blobmsg.encode_table"""
+    types = {}
+    for spec in fields:
+        types[spec.name] = wire_types(spec.fields) if spec.fields is not None else spec.blob_type
+    return types
+
+
+def validate(fields: List[FieldSpec], values: Dict[str, Tuple[int, Any]], prefix: str = "") -> List[str]:
+    """Check a table decoded by blobmsg.decode_typed_table against field specs
+
+    Returns a list of problems: missing required fields, wire types that
+    differ from the IDL and unknown enum values, like the generated code would
+    reject them.
+    """
+    errors = []
+    for spec in fields:
+        path = prefix + spec.name
+        if spec.name not in values:
+            if not spec.optional:
+                errors.append(f"{path}: missing required field")
+            continue
+        blob_type, value = values[spec.name]
+        if spec.type_name == "unspec" and not spec.bulk:
+            continue
+        if blob_type != spec.blob_type:
+            errors.append(f"{path}: expected {spec.type_name}, got blobmsg type {blob_type}")
+        elif spec.fields is not None:
+            errors.extend(validate(spec.fields, value, path + "."))
+        elif spec.values is not None:
+            known = 0 <= value < len(spec.values) if spec.wire_int else value in spec.values
+            if not known:
+                errors.append(f"{path}: {value!r} is not a value of enum {spec.type_name}")
+    return errors
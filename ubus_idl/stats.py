@@ -0,0 +1,118 @@
+"""Latency and error accounting shared by the replay and loadgen tools"""
+
+import math
+from collections import Counter, OrderedDict
+from typing import Dict, List
+
+from .transport import status_name
+
+# Same bucket bounds as the generated @metrics histogram, in microseconds
+HISTOGRAM_BOUNDS_US = [10, 100, 1000, 10000, 100000, 1000000]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class MethodStats:
+    """Latencies and outcomes of the calls to one method"""
+
+    def __init__(self):
+        self.latencies_us: List[float] = []
+        self.errors = 0
+        self.invalid_replies = 0
+        self.mismatches = 0
+        self.statuses: Counter = Counter()
+
+    @property
+    def calls(self) -> int:
+        return len(self.latencies_us)
+
+    def histogram(self) -> List[int]:
+        """Count per HISTOGRAM_BOUNDS_US bucket, plus one overflow bucket"""
+        buckets = [0] * (len(HISTOGRAM_BOUNDS_US) + 1)
+        for value in self.latencies_us:
+            for i, bound in enumerate(HISTOGRAM_BOUNDS_US):
+                if value <= bound:
+                    buckets[i] += 1
+                    break
+            else:
+                buckets[-1] += 1
+        return buckets
+
+
+class Recorder:
+    """Per-method statistics, in the order methods were first seen"""
+
+    def __init__(self):
+        self.methods: Dict[str, MethodStats] = OrderedDict()
+
+    def get(self, method: str) -> MethodStats:
+        if method not in self.methods:
+            self.methods[method] = MethodStats()
+        return self.methods[method]
+
+    def record(self, method: str, latency_us: float, status: int,
+               invalid: bool = False, mismatch: bool = False):
+        """Record one finished call"""
+        stats = self.get(method)
+        stats.latencies_us.append(latency_us)
+        stats.statuses[status] += 1
+        if status != 0:
+            stats.errors += 1
+        if invalid:
+            stats.invalid_replies += 1
+        if mismatch:
+            stats.mismatches += 1
+
+    def total_calls(self) -> int:
+        return sum(s.calls for s in self.methods.values())
+
+    def format_report(self, elapsed: float, histogram: bool = False) -> str:
+        """Render a per-method table with throughput and latency percentiles"""
+        lines = []
+        header = (f"{'method':<20} {'calls':>8} {'errors':>7} {'invalid':>8} {'mismatch':>8} "
+                  f"{'p50(us)':>10} {'p95(us)':>10} {'p99(us)':>10} {'max(us)':>10}")
+        lines.append(header)
+        lines.append("-" * len(header))
+        all_latencies = []
+        for name, stats in self.methods.items():
+            values = sorted(stats.latencies_us)
+            all_latencies.extend(values)
+            lines.append(
+                f"{name:<20} {stats.calls:>8} {stats.errors:>7} {stats.invalid_replies:>8} "
+                f"{stats.mismatches:>8} {percentile(values, 50):>10.0f} {percentile(values, 95):>10.0f} "
+                f"{percentile(values, 99):>10.0f} {(values[-1] if values else 0):>10.0f}"
+            )
+        all_latencies.sort()
+        total = len(all_latencies)
+        lines.append("-" * len(header))
+        lines.append(
+            f"{'total':<20} {total:>8} {sum(s.errors for s in self.methods.values()):>7} "
+            f"{sum(s.invalid_replies for s in self.methods.values()):>8} "
+            f"{sum(s.mismatches for s in self.methods.values()):>8} "
+            f"{percentile(all_latencies, 50):>10.0f} {percentile(all_latencies, 95):>10.0f} "
+            f"{percentile(all_latencies, 99):>10.0f} {(all_latencies[-1] if all_latencies else 0):>10.0f}"
+        )
+        rate = total / elapsed if elapsed > 0 else 0.0
+        lines.append(f"\n{total} calls in {elapsed:.3f}s, {rate:.1f} calls/s")
+
+        errors = Counter()
+        for stats in self.methods.values():
+            errors.update({k: v for k, v in stats.statuses.items() if k != 0})
+        if errors:
+            lines.append("statuses: " + ", ".join(
+                f"{status_name(k)}={v}" for k, v in sorted(errors.items())))
+
+        if histogram:
+            labels = [f"<={b}us" for b in HISTOGRAM_BOUNDS_US] + [f">{HISTOGRAM_BOUNDS_US[-1]}us"]
+            lines.append("\nlatency histogram:")
+            for name, stats in self.methods.items():
+                buckets = stats.histogram()
+                lines.append(f"  {name}: " + " ".join(
+                    f"{label}:{count}" for label, count in zip(labels, buckets)))
+        return "\n".join(lines)
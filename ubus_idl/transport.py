@@ -0,0 +1,170 @@
+"""Minimal asyncio ubus client speaking the ubusd socket protocol"""
+
+import asyncio
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from . import blobmsg
+
+DEFAULT_SOCKET = "/var/run/ubus/ubus.sock"
+
+# ubus_msg_type
+UBUS_MSG_HELLO = 0
+UBUS_MSG_STATUS = 1
+UBUS_MSG_DATA = 2
+UBUS_MSG_PING = 3
+UBUS_MSG_LOOKUP = 4
+UBUS_MSG_INVOKE = 5
+
+# ubus_msg_attr
+UBUS_ATTR_STATUS = 1
+UBUS_ATTR_OBJPATH = 2
+UBUS_ATTR_OBJID = 3
+UBUS_ATTR_METHOD = 4
+UBUS_ATTR_DATA = 7
+
+# ubus_msg_status
+UBUS_STATUS_OK = 0
+UBUS_STATUS_NOT_FOUND = 4
+UBUS_STATUS_TIMEOUT = 7
+UBUS_STATUS_CONNECTION_FAILED = 10
+
+STATUS_NAMES = [
+    "OK", "INVALID_COMMAND", "INVALID_ARGUMENT", "METHOD_NOT_FOUND",
+    "NOT_FOUND", "NO_DATA", "PERMISSION_DENIED", "TIMEOUT",
+    "NOT_SUPPORTED", "UNKNOWN_ERROR", "CONNECTION_FAILED", "NO_MEMORY",
+    "PARSE_ERROR", "SYSTEM_ERROR",
+]
+
+_MSGHDR = struct.Struct(">BBHI")
+
+
+class UbusError(Exception):
+    """Request answered with a non-zero ubus status"""
+
+    def __init__(self, status: int, message: str = ""):
+        self.status = status
+        super().__init__(message or status_name(status))
+
+
+def status_name(status: int) -> str:
+    """Get the UBUS_STATUS_* name of a status code"""
+    if 0 <= status < len(STATUS_NAMES):
+        return STATUS_NAMES[status]
+    return str(status)
+
+
+class _Request:
+    def __init__(self):
+        self.future = asyncio.get_event_loop().create_future()
+        self.data: List[Dict[int, bytes]] = []
+
+
+class UbusConnection:
+    """One connection to ubusd, with any number of requests in flight"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.peer_id = None
+        self.seq = 0
+        self.requests: Dict[int, _Request] = {}
+        self.reader_task = None
+
+    @classmethod
+    async def connect(cls, path: str = DEFAULT_SOCKET) -> "UbusConnection":
+        """Connect to ubusd and wait for its hello"""
+        reader, writer = await asyncio.open_unix_connection(path)
+        conn = cls(reader, writer)
+        msg_type, _, peer, _ = await conn._read_msg()
+        if msg_type != UBUS_MSG_HELLO:
+            writer.close()
+            raise ConnectionError(f"unexpected message type {msg_type} instead of hello")
+        conn.peer_id = peer
+        conn.reader_task = asyncio.ensure_future(conn._read_loop())
+        return conn
+
+    async def close(self):
+        """Close the connection and fail pending requests"""
+        if self.reader_task:
+            self.reader_task.cancel()
+        self.writer.close()
+        self._fail_all(UbusError(UBUS_STATUS_CONNECTION_FAILED))
+
+    async def lookup_id(self, path: str, timeout: float = 5.0) -> int:
+        """Resolve an object path to its id"""
+        attrs = blobmsg.encode_attr(UBUS_ATTR_OBJPATH, path.encode("utf-8") + b"\0")
+        data = await self._request(UBUS_MSG_LOOKUP, 0, attrs, timeout)
+        for reply in data:
+            if UBUS_ATTR_OBJID in reply:
+                return struct.unpack(">I", reply[UBUS_ATTR_OBJID][:4])[0]
+        raise UbusError(UBUS_STATUS_NOT_FOUND, f"object '{path}' not found")
+
+    async def invoke(self, obj_id: int, method: str, payload: bytes,
+                     timeout: float = 5.0) -> Optional[bytes]:
+        """Call a method, payload is an encoded blobmsg table (without blob header)
+
+        Returns the last reply table as raw blobmsg attributes, or None when the
+        method sent no reply.
+        Raises UbusError for a non-zero status and asyncio.TimeoutError on timeout.
+        """
+        attrs = (blobmsg.encode_attr(UBUS_ATTR_OBJID, struct.pack(">I", obj_id))
+                 + blobmsg.encode_attr(UBUS_ATTR_METHOD, method.encode("utf-8") + b"\0")
+                 + blobmsg.encode_attr(UBUS_ATTR_DATA, payload))
+        data = await self._request(UBUS_MSG_INVOKE, obj_id, attrs, timeout)
+        reply = None
+        for msg in data:
+            if UBUS_ATTR_DATA in msg:
+                reply = msg[UBUS_ATTR_DATA]
+        return reply
+
+    async def _request(self, msg_type: int, peer: int, attrs: bytes,
+                       timeout: float) -> List[Dict[int, bytes]]:
+        self.seq = (self.seq + 1) & 0xffff
+        seq = self.seq
+        req = _Request()
+        self.requests[seq] = req
+        self.writer.write(_MSGHDR.pack(0, msg_type, seq, peer) + blobmsg.encode_attr(0, attrs))
+        try:
+            await asyncio.wait_for(asyncio.shield(req.future), timeout)
+        finally:
+            self.requests.pop(seq, None)
+        return req.data
+
+    async def _read_msg(self) -> Tuple[int, int, int, Dict[int, bytes]]:
+        hdr = await self.reader.readexactly(_MSGHDR.size + 4)
+        _, msg_type, seq, peer = _MSGHDR.unpack_from(hdr)
+        id_len, = struct.unpack_from(">I", hdr, _MSGHDR.size)
+        raw_len = id_len & blobmsg.BLOB_ATTR_LEN_MASK
+        if raw_len < 4:
+            raise ConnectionError(f"invalid message length {raw_len}")
+        body = await self.reader.readexactly(raw_len - 4)
+        attrs = {attr_id: payload for attr_id, _, payload in blobmsg.iter_attrs(body)}
+        return msg_type, seq, peer, attrs
+
+    async def _read_loop(self):
+        try:
+            while True:
+                msg_type, seq, _, attrs = await self._read_msg()
+                req = self.requests.get(seq)
+                if req is None or req.future.done():
+                    continue
+                if msg_type == UBUS_MSG_DATA:
+                    req.data.append(attrs)
+                elif msg_type == UBUS_MSG_STATUS:
+                    status = UBUS_STATUS_OK
+                    if UBUS_ATTR_STATUS in attrs:
+                        status = struct.unpack(">i", attrs[UBUS_ATTR_STATUS][:4])[0]
+                    if status == UBUS_STATUS_OK:
+                        req.future.set_result(None)
+                    else:
+                        req.future.set_exception(UbusError(status))
+        except asyncio.CancelledError:
+            raise
+        except (asyncio.IncompleteReadError, ConnectionError, blobmsg.BlobError) as e:
+            self._fail_all(ConnectionError(f"ubusd connection lost: {e}"))
+
+    def _fail_all(self, exc: Exception):
+        for req in self.requests.values():
+            if not req.future.done():
+                req.future.set_exception(exc)